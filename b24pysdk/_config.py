@@ -4,9 +4,16 @@ SDK runtime configuration.
 This module provides a thread-local configuration object used to control
 the behavior of the Bitrix SDK. Configuration options include:
 
-- retry strategy
+- retry strategy and retry policy
 - request timeouts
+- HTTP connection pooling
+- asynchronous HTTP transport
+- JSON codec
+- client-side rate limiting
+- OAuth token refresh
+- response caching of metadata methods
 - logging
+- runtime argument type checking
 - sensitive data masking
 - timezone handling
 - API version detection
@@ -17,18 +24,38 @@ threads to use different SDK settings without interfering with each other.
 
 import threading
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone, tzinfo
 
-from .constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_INITIAL_RETRY_DELAY, DEFAULT_MAX_RETRIES, DEFAULT_READ_TIMEOUT, DEFAULT_RETRY_DELAY_INCREMENT
+from .constants import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_HTTP_POOL_CONNECTIONS,
+    DEFAULT_HTTP_POOL_MAXSIZE,
+    DEFAULT_HTTP_SESSION_IDLE_TIMEOUT,
+    DEFAULT_INITIAL_RETRY_DELAY,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_OAUTH_TOKEN_REFRESH_MARGIN,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRY_DELAY_INCREMENT,
+    DEFAULT_RUNTIME_TYPE_CHECKS,
+)
 from .constants.version import API_V3_METHODS
 from .log import AbstractLogger, NullLogger
-from .utils.types import DefaultTimeout, Number, Timeout
+from .protocols.async_http_transport_protocol import AsyncHTTPTransportProtocol
+from .protocols.json_codec_protocol import JSONCodecProtocol
+from .protocols.oauth_token_storage_protocol import OAuthTokenStorageProtocol
+from .protocols.rate_limiter_protocol import RateLimiterProtocol
+from .protocols.response_cache_protocol import ResponseCacheProtocol
+from .protocols.retry_strategy_protocol import RetryStrategyProtocol
+from .utils.types import DefaultTimeout, Number, RuntimeTypeChecksLiteral, Timeout
 
 __all__ = [
     "Config",
 ]
 
 _TIMEOUT_TUPLE_LENGTH: typing.Final[int] = 2
+_WORKER_POOL_SIZE: typing.Final[int] = 32
+_RUNTIME_TYPE_CHECKS_MODES: typing.Final[typing.Tuple[RuntimeTypeChecksLiteral, ...]] = typing.get_args(RuntimeTypeChecksLiteral)
 
 
 class _LocalConfig:
@@ -42,36 +69,72 @@ class _LocalConfig:
 
     __slots__ = (
         "api_v3_methods",
+        "async_transport",
         "default_connect_timeout",
         "default_initial_retry_delay",
         "default_max_retries",
         "default_read_timeout",
         "default_retry_delay_increment",
+        "http_pool_connections",
+        "http_pool_maxsize",
+        "http_session_idle_timeout",
+        "json_codec",
         "logger",
+        "oauth_token_refresh_margin",
+        "oauth_token_storage",
+        "rate_limiter",
+        "response_cache",
+        "retry_strategy",
+        "runtime_type_checks",
         "secure_log",
         "tz",
+        "worker_pool",
     )
 
     api_v3_methods: typing.Tuple[typing.Text, ...]
+    async_transport: typing.Optional[AsyncHTTPTransportProtocol]
     default_connect_timeout: typing.Optional[Number]
     default_read_timeout: Number
     default_initial_retry_delay: Number
     default_max_retries: int
     default_retry_delay_increment: Number
+    http_pool_connections: int
+    http_pool_maxsize: int
+    http_session_idle_timeout: Number
+    json_codec: typing.Optional[JSONCodecProtocol]
     logger: AbstractLogger
+    oauth_token_refresh_margin: Number
+    oauth_token_storage: typing.Optional[OAuthTokenStorageProtocol]
+    rate_limiter: typing.Optional[RateLimiterProtocol]
+    response_cache: typing.Optional[ResponseCacheProtocol]
+    retry_strategy: typing.Optional[RetryStrategyProtocol]
+    runtime_type_checks: RuntimeTypeChecksLiteral
     secure_log: bool
     tz: tzinfo
+    worker_pool: typing.Optional[ThreadPoolExecutor]
 
     def __init__(self):
         self.api_v3_methods = API_V3_METHODS
+        self.async_transport = None
         self.default_connect_timeout = DEFAULT_CONNECT_TIMEOUT
         self.default_read_timeout = DEFAULT_READ_TIMEOUT
         self.default_initial_retry_delay = DEFAULT_INITIAL_RETRY_DELAY
         self.default_max_retries = DEFAULT_MAX_RETRIES
         self.default_retry_delay_increment = DEFAULT_RETRY_DELAY_INCREMENT
+        self.http_pool_connections = DEFAULT_HTTP_POOL_CONNECTIONS
+        self.http_pool_maxsize = DEFAULT_HTTP_POOL_MAXSIZE
+        self.http_session_idle_timeout = DEFAULT_HTTP_SESSION_IDLE_TIMEOUT
+        self.json_codec = None
         self.logger = NullLogger()
+        self.oauth_token_refresh_margin = DEFAULT_OAUTH_TOKEN_REFRESH_MARGIN
+        self.oauth_token_storage = None
+        self.rate_limiter = None
+        self.response_cache = None
+        self.retry_strategy = None
+        self.runtime_type_checks = DEFAULT_RUNTIME_TYPE_CHECKS
         self.secure_log = True
         self.tz = self.__get_default_tz()
+        self.worker_pool = None
 
     def __get_default_tz(self) -> tzinfo:
         """
@@ -120,6 +183,7 @@ class Config:
     _config: _LocalConfig
 
     _local_thread: threading.local = threading.local()
+    _worker_pool_lock: threading.Lock = threading.Lock()
 
     def __init__(self):
         local_thread = type(self)._local_thread
@@ -129,18 +193,29 @@ class Config:
 
         self._config = local_thread.config
 
-    def configure(  # noqa: C901
+    def configure(  # noqa: C901, PLR0912
             self,
             *,
             api_v3_methods: typing.Optional[typing.Iterable[typing.Text]] = None,
+            async_transport: typing.Optional[AsyncHTTPTransportProtocol] = None,
             default_initial_retry_delay: typing.Optional[Number] = None,
             default_max_retries: typing.Optional[int] = None,
             default_retry_delay_increment: typing.Optional[Number] = None,
             default_connect_timeout: typing.Optional[Number] = None,
             default_read_timeout: typing.Optional[Number] = None,
             default_timeout: Timeout = None,
+            http_pool_connections: typing.Optional[int] = None,
+            http_pool_maxsize: typing.Optional[int] = None,
+            http_session_idle_timeout: typing.Optional[Number] = None,
+            json_codec: typing.Optional[JSONCodecProtocol] = None,
             logger: typing.Optional[AbstractLogger] = None,
             log_level: typing.Optional[int] = None,
+            oauth_token_refresh_margin: typing.Optional[Number] = None,
+            oauth_token_storage: typing.Optional[OAuthTokenStorageProtocol] = None,
+            rate_limiter: typing.Optional[RateLimiterProtocol] = None,
+            response_cache: typing.Optional[ResponseCacheProtocol] = None,
+            retry_strategy: typing.Optional[RetryStrategyProtocol] = None,
+            runtime_type_checks: typing.Optional[RuntimeTypeChecksLiteral] = None,
             secure_log: typing.Optional[bool] = None,
             tz: typing.Optional[tzinfo] = None,
     ):
@@ -155,6 +230,11 @@ class Config:
         api_v3_methods : Iterable[str], optional
             List of API method names that should be treated as Bitrix API v3 methods.
 
+        async_transport : AsyncHTTPTransportProtocol, optional
+            Transport used by asynchronous requesters. When not configured,
+            the first async call creates a transport for an installed backend
+            (httpx or aiohttp).
+
         default_initial_retry_delay : Number, optional
             Initial delay (in seconds) before the first retry attempt.
 
@@ -174,12 +254,57 @@ class Config:
             Default timeout value for API calls. Can be a single number or
             a tuple of ``(connect_timeout, read_timeout)``.
 
+        http_pool_connections : int, optional
+            Number of per-host connection pools cached by each pooled HTTP session.
+
+        http_pool_maxsize : int, optional
+            Maximum number of keep-alive connections kept open to one host.
+
+        http_session_idle_timeout : Number, optional
+            Seconds after which an unused pooled HTTP session is closed.
+
+        json_codec : JSONCodecProtocol, optional
+            Codec encoding request bodies and decoding responses. When not
+            configured, the first request creates a codec for the fastest
+            installed library (orjson or msgspec) and falls back to the
+            standard ``json`` module.
+
         logger : AbstractLogger, optional
             Custom logger instance used by the SDK.
 
         log_level : int, optional
             Logging level to apply to the current logger.
 
+        oauth_token_refresh_margin : Number, optional
+            Seconds before the expiration of an OAuth access token when it is
+            refreshed ahead of the next API call instead of waiting for an
+            ``EXPIRED_TOKEN`` error.
+
+        oauth_token_storage : OAuthTokenStorageProtocol, optional
+            Storage sharing renewed OAuth credentials between processes, so
+            that only one process refreshes the token of a portal and the
+            others reuse its result. Without a storage, refreshes are only
+            coordinated between threads sharing one token object.
+
+        rate_limiter : RateLimiterProtocol, optional
+            Client-side rate limiter consulted by Bitrix API requesters before
+            every request. Rate limiting is disabled until a limiter is set.
+
+        response_cache : ResponseCacheProtocol, optional
+            Cache answering repeated single-method calls of rarely changing
+            metadata methods (field descriptions, status and category lists)
+            without a request. Caching is disabled until a cache is set.
+
+        retry_strategy : RetryStrategyProtocol, optional
+            Policy deciding which failed request attempts are repeated and how
+            long to wait between them. By default only HTTP 503 responses are
+            retried with linearly growing delays.
+
+        runtime_type_checks : {"off", "sampled", "on"}, optional
+            Runtime argument type checking of SDK methods: disabled, applied
+            to one call out of a hundred per method, or applied to every call
+            (default).
+
         secure_log : bool, optional
             Whether SDK logs should hide credentials and other sensitive values.
 
@@ -190,6 +315,9 @@ class Config:
         if api_v3_methods is not None:
             self.api_v3_methods = api_v3_methods
 
+        if async_transport is not None:
+            self.async_transport = async_transport
+
         if default_initial_retry_delay is not None:
             self.default_initial_retry_delay = default_initial_retry_delay
 
@@ -208,12 +336,42 @@ class Config:
         if default_timeout is not None:
             self.default_timeout = default_timeout
 
+        if http_pool_connections is not None:
+            self.http_pool_connections = http_pool_connections
+
+        if http_pool_maxsize is not None:
+            self.http_pool_maxsize = http_pool_maxsize
+
+        if http_session_idle_timeout is not None:
+            self.http_session_idle_timeout = http_session_idle_timeout
+
+        if json_codec is not None:
+            self.json_codec = json_codec
+
         if logger is not None:
             self.logger = logger
 
         if log_level is not None:
             self.log_level = log_level
 
+        if oauth_token_refresh_margin is not None:
+            self.oauth_token_refresh_margin = oauth_token_refresh_margin
+
+        if oauth_token_storage is not None:
+            self.oauth_token_storage = oauth_token_storage
+
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+
+        if response_cache is not None:
+            self.response_cache = response_cache
+
+        if retry_strategy is not None:
+            self.retry_strategy = retry_strategy
+
+        if runtime_type_checks is not None:
+            self.runtime_type_checks = runtime_type_checks
+
         if secure_log is not None:
             self.secure_log = secure_log
 
@@ -365,6 +523,138 @@ class Config:
                 "Timeout must be a positive number or a tuple of (connect_timeout, read_timeout)",
             )
 
+    @property
+    def http_pool_connections(self) -> int:
+        """Number of per-host connection pools cached by each pooled HTTP session"""
+        return self._config.http_pool_connections
+
+    @http_pool_connections.setter
+    def http_pool_connections(self, value: int):
+        """Set number of per-host connection pools"""
+        if not (isinstance(value, int) and value >= 1):
+            raise ValueError("Http_pool_connections must be a positive integer (>= 1)")
+        self._config.http_pool_connections = value
+
+    @property
+    def http_pool_maxsize(self) -> int:
+        """Maximum number of keep-alive connections kept open to one host"""
+        return self._config.http_pool_maxsize
+
+    @http_pool_maxsize.setter
+    def http_pool_maxsize(self, value: int):
+        """Set maximum number of connections per host"""
+        if not (isinstance(value, int) and value >= 1):
+            raise ValueError("Http_pool_maxsize must be a positive integer (>= 1)")
+        self._config.http_pool_maxsize = value
+
+    @property
+    def http_session_idle_timeout(self) -> Number:
+        """Seconds after which an unused pooled HTTP session is closed"""
+        return self._config.http_session_idle_timeout
+
+    @http_session_idle_timeout.setter
+    def http_session_idle_timeout(self, value: Number):
+        """Set idle timeout of pooled HTTP sessions"""
+        if not (isinstance(value, (int, float)) and value > 0):
+            raise ValueError("Http_session_idle_timeout must be a positive number")
+        self._config.http_session_idle_timeout = value
+
+    @property
+    def async_transport(self) -> typing.Optional[AsyncHTTPTransportProtocol]:
+        """HTTP transport used by asynchronous requesters, or ``None`` until the first async call"""
+        return self._config.async_transport
+
+    @async_transport.setter
+    def async_transport(self, value: typing.Optional[AsyncHTTPTransportProtocol]):
+        """Set HTTP transport used by asynchronous requesters"""
+        if not (value is None or isinstance(value, AsyncHTTPTransportProtocol)):
+            raise TypeError("Async_transport must implement AsyncHTTPTransportProtocol")
+        self._config.async_transport = value
+
+    @property
+    def json_codec(self) -> typing.Optional[JSONCodecProtocol]:
+        """JSON codec used by requesters, or ``None`` until the first request"""
+        return self._config.json_codec
+
+    @json_codec.setter
+    def json_codec(self, value: typing.Optional[JSONCodecProtocol]):
+        """Set JSON codec used by requesters"""
+        if not (value is None or isinstance(value, JSONCodecProtocol)):
+            raise TypeError("Json_codec must implement JSONCodecProtocol")
+        self._config.json_codec = value
+
+    @property
+    def oauth_token_refresh_margin(self) -> Number:
+        """Seconds before expiration when an OAuth access token is refreshed ahead of the next call"""
+        return self._config.oauth_token_refresh_margin
+
+    @oauth_token_refresh_margin.setter
+    def oauth_token_refresh_margin(self, value: Number):
+        """Set OAuth access token refresh margin"""
+        if not (isinstance(value, (int, float)) and value >= 0):
+            raise ValueError("Oauth_token_refresh_margin must be a non-negative number")
+        self._config.oauth_token_refresh_margin = value
+
+    @property
+    def oauth_token_storage(self) -> typing.Optional[OAuthTokenStorageProtocol]:
+        """Storage sharing renewed OAuth credentials between processes, or ``None`` when refreshes are coordinated in-process only"""
+        return self._config.oauth_token_storage
+
+    @oauth_token_storage.setter
+    def oauth_token_storage(self, value: typing.Optional[OAuthTokenStorageProtocol]):
+        """Set storage sharing renewed OAuth credentials between processes"""
+        if not (value is None or isinstance(value, OAuthTokenStorageProtocol)):
+            raise TypeError("Oauth_token_storage must implement OAuthTokenStorageProtocol")
+        self._config.oauth_token_storage = value
+
+    @property
+    def rate_limiter(self) -> typing.Optional[RateLimiterProtocol]:
+        """Client-side rate limiter used by Bitrix API requesters, or ``None`` when rate limiting is disabled"""
+        return self._config.rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: typing.Optional[RateLimiterProtocol]):
+        """Set client-side rate limiter used by Bitrix API requesters"""
+        if not (value is None or isinstance(value, RateLimiterProtocol)):
+            raise TypeError("Rate_limiter must implement RateLimiterProtocol")
+        self._config.rate_limiter = value
+
+    @property
+    def response_cache(self) -> typing.Optional[ResponseCacheProtocol]:
+        """Response cache of metadata methods, or ``None`` when caching is disabled"""
+        return self._config.response_cache
+
+    @response_cache.setter
+    def response_cache(self, value: typing.Optional[ResponseCacheProtocol]):
+        """Set response cache of metadata methods"""
+        if not (value is None or isinstance(value, ResponseCacheProtocol)):
+            raise TypeError("Response_cache must implement ResponseCacheProtocol")
+        self._config.response_cache = value
+
+    @property
+    def retry_strategy(self) -> typing.Optional[RetryStrategyProtocol]:
+        """Retry policy used by requesters, or ``None`` for linear retries of HTTP 503 responses"""
+        return self._config.retry_strategy
+
+    @retry_strategy.setter
+    def retry_strategy(self, value: typing.Optional[RetryStrategyProtocol]):
+        """Set retry policy used by requesters"""
+        if not (value is None or isinstance(value, RetryStrategyProtocol)):
+            raise TypeError("Retry_strategy must implement RetryStrategyProtocol")
+        self._config.retry_strategy = value
+
+    @property
+    def runtime_type_checks(self) -> RuntimeTypeChecksLiteral:
+        """Runtime argument type checking mode of SDK methods: ``off``, ``sampled`` or ``on``"""
+        return self._config.runtime_type_checks
+
+    @runtime_type_checks.setter
+    def runtime_type_checks(self, value: RuntimeTypeChecksLiteral):
+        """Set runtime argument type checking mode of SDK methods"""
+        if value not in _RUNTIME_TYPE_CHECKS_MODES:
+            raise ValueError(f"Runtime_type_checks must be one of {', '.join(map(repr, _RUNTIME_TYPE_CHECKS_MODES))}")
+        self._config.runtime_type_checks = value
+
     @property
     def logger(self) -> AbstractLogger:
         """Current SDK logger instance."""
@@ -471,6 +761,47 @@ class Config:
 
         self._config.api_v3_methods = api_v3_methods
 
+    def bind_to_current_thread(self):
+        """
+        Make the current thread use this configuration.
+
+        Used as an initializer of SDK worker threads, so that requests sent
+        from a thread pool use the settings of the thread that started them
+        instead of fresh defaults.
+        """
+        type(self)._local_thread.config = self._config
+
+    def _bind_worker_thread(self):
+        """Bind a thread of the shared worker pool to this configuration and mark it as a pool worker."""
+        self.bind_to_current_thread()
+        type(self)._local_thread.is_pool_worker = True
+
+    @property
+    def worker_pool(self) -> typing.Optional[ThreadPoolExecutor]:
+        """
+        Long-lived thread pool shared by concurrent SDK calls made with this configuration.
+
+        The pool is created on first access and kept for the lifetime of the
+        configuration, so its threads and their pooled HTTP sessions are reused
+        across calls. Inside a worker of the pool ``None`` is returned, so that
+        nested concurrent calls use their own executor instead of waiting for
+        a busy pool.
+        """
+
+        if getattr(type(self)._local_thread, "is_pool_worker", False):
+            return None
+
+        if self._config.worker_pool is None:
+            with type(self)._worker_pool_lock:
+                if self._config.worker_pool is None:
+                    self._config.worker_pool = ThreadPoolExecutor(
+                        max_workers=_WORKER_POOL_SIZE,
+                        thread_name_prefix="b24pysdk",
+                        initializer=self._bind_worker_thread,
+                    )
+
+        return self._config.worker_pool
+
     def is_api_v3_method(self, api_method: typing.Text) -> bool:
         """
         Check whether the specified API method belongs to Bitrix REST API v3.
@@ -0,0 +1,7 @@
+from .bulk_write_record import BulkWriteRecord
+from .bulk_writer import BulkWriter
+
+__all__ = [
+    "BulkWriteRecord",
+    "BulkWriter",
+]
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Optional, Text
+
+from ...utils.dataclasses import frozen_dataclass_kwargs
+from ...utils.types import JSONDict
+
+__all__ = [
+    "BulkWriteRecord",
+]
+
+
+@dataclass(**frozen_dataclass_kwargs())
+class BulkWriteRecord:
+    """
+    Outcome of writing one row with :class:`BulkWriter`.
+
+    Attributes:
+        index: Position of the row in the input feed, starting with 0.
+        fields: Field values of the row.
+        bitrix_id: Identifier of the created entity, if the row was written.
+        error: Error payload of the last attempt, with ``error`` and
+            ``error_description`` keys, if the row was not written.
+        attempts: Number of attempts made to write the row.
+    """
+
+    index: int
+    fields: JSONDict
+    bitrix_id: Optional[int] = None
+    error: Optional[JSONDict] = None
+    attempts: int = 1
+
+    @property
+    def is_success(self) -> bool:
+        """Whether the row was written."""
+        return self.error is None
+
+    @property
+    def error_code(self) -> Optional[Text]:
+        """Bitrix24 error code of the last attempt, if the row was not written."""
+        return None if self.error is None else self.error.get("error")
@@ -0,0 +1,403 @@
+import socket
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import AbstractSet, Callable, Deque, Dict, Final, Generator, Iterable, Iterator, List, Optional, Text, Tuple, Type, Union
+
+import requests
+
+from ..._config import Config
+from ..._constants import MAX_BATCH_SIZE
+from ...errors import BitrixAPIError, BitrixRequestError, BitrixResponseError, BitrixResponseJSONDecodeError
+from ...protocols import BitrixTokenFullProtocol
+from ...schemas.api import BatchResponseData
+from ...utils.types import JSONDict, Number, Timeout
+from .bulk_write_record import BulkWriteRecord
+
+__all__ = [
+    "BulkWriter",
+]
+
+_Row = Tuple[int, JSONDict, int]
+"""Index of a row in the input feed, its fields and the number of attempts already made."""
+
+
+class BulkWriter:
+    """
+    Pipeline writing a large feed of rows with classic batch requests.
+
+    Every row is written by its own batch command, e.g. ``crm.item.add``, so
+    an error of one row does not affect the others. Rows are read lazily and
+    grouped into batch chunks of at most 50 commands; up to
+    ``max_concurrency`` chunks are sent at the same time. Requests go through
+    the token, so they share its token refresh handling, the configured retry
+    strategy and the client-side rate limiter.
+
+    :meth:`write` yields one :class:`BulkWriteRecord` per row with the created
+    ID or the error. Rows rejected without being executed (request or
+    operating time limits, overload, connections refused before sending) are
+    retried up to ``max_retries`` times; other rows are reported as failed.
+    Rows of a batch request that may have been executed (timeouts, dropped
+    connections, unreadable responses, ``INTERNAL_SERVER_ERROR``) are not
+    sent again unless ``retry_ambiguous`` is enabled, because that could
+    create duplicates; they are reported with the ``BATCH_OUTCOME_UNKNOWN``
+    error. Records are yielded as chunks complete, so their order may differ
+    from the input order; ``BulkWriteRecord.index`` refers to the position in
+    the feed.
+
+    Only the chunks in flight and the rows waiting for a retry are kept in
+    memory, so feeds of any length can be written from a generator.
+
+    Usage:
+
+        writer = client.crm.item.bulk(entity_type_id=2, max_concurrency=4)
+
+        for record in writer.write(rows):
+            if not record.is_success:
+                log_failed_row(record.index, record.error)
+    """
+
+    _MAX_BATCH_SIZE: Final[int] = MAX_BATCH_SIZE
+    _NOT_EXECUTED_ERROR: Final[Text] = "BATCH_COMMAND_NOT_EXECUTED"
+    _UNKNOWN_OUTCOME_ERROR: Final[Text] = "BATCH_OUTCOME_UNKNOWN"
+    _COMMAND_KEY_PREFIX: Final[Text] = "row_"
+    _DEFAULT_RETRY_ERROR_CODES: Final[AbstractSet[Text]] = frozenset({
+        "OPERATION_TIME_LIMIT",
+        "OVERLOAD_LIMIT",
+        "QUERY_LIMIT_EXCEEDED",
+    })
+    _AMBIGUOUS_ERROR_CODES: Final[AbstractSet[Text]] = frozenset({
+        "INTERNAL_SERVER_ERROR",
+    })
+    _NOT_SENT_ERRORS: Final[Tuple[Type[BaseException], ...]] = (
+        requests.ConnectTimeout,
+        ConnectionRefusedError,
+        socket.gaierror,
+    )
+
+    __slots__ = (
+        "_api_method",
+        "_bitrix_token",
+        "_chunk_size",
+        "_config",
+        "_make_params",
+        "_max_concurrency",
+        "_max_retries",
+        "_retry_ambiguous",
+        "_retry_delay",
+        "_retry_error_codes",
+        "_timeout",
+    )
+
+    _api_method: Text
+    _bitrix_token: BitrixTokenFullProtocol
+    _chunk_size: int
+    _config: Config
+    _make_params: Callable[[JSONDict], JSONDict]
+    _max_concurrency: int
+    _max_retries: int
+    _retry_ambiguous: bool
+    _retry_delay: Number
+    _retry_error_codes: AbstractSet[Text]
+    _timeout: Timeout
+
+    def __init__(
+            self,
+            bitrix_token: BitrixTokenFullProtocol,
+            api_method: Text,
+            *,
+            make_params: Optional[Callable[[JSONDict], JSONDict]] = None,
+            chunk_size: int = MAX_BATCH_SIZE,
+            max_concurrency: int = 1,
+            max_retries: int = 2,
+            retry_delay: Optional[Number] = None,
+            retry_error_codes: Optional[Iterable[Text]] = None,
+            retry_ambiguous: bool = False,
+            timeout: Timeout = None,
+    ):
+        """
+        Initialize the bulk writer.
+
+        Args:
+            bitrix_token: Token executing the batch requests.
+            api_method: Method writing one row, e.g. ``crm.deal.add``.
+            make_params: Function building method parameters from the fields
+                of a row. By default rows are sent as ``{"fields": fields}``.
+            chunk_size: Number of rows sent in one batch request, at most 50.
+            max_concurrency: Maximum number of batch requests sent at the
+                same time.
+            max_retries: Number of times a row failed with a transient error
+                is written again.
+            retry_delay: Seconds to wait before a chunk with retried rows is
+                sent, multiplied by the number of attempts already made.
+                Defaults to the initial retry delay of the SDK configuration.
+            retry_error_codes: Bitrix24 error codes treated as transient.
+            retry_ambiguous: Whether rows are also written again when it is
+                unknown if they were written: after timeouts, dropped
+                connections, unreadable responses and
+                ``INTERNAL_SERVER_ERROR``. Only enable it for methods that
+                are safe to repeat, since it may create duplicates.
+            timeout: Timeout of every batch request.
+
+        Raises:
+            ValueError: If a size, concurrency or retry limit is invalid.
+        """
+
+        if not (isinstance(chunk_size, int) and 1 <= chunk_size <= self._MAX_BATCH_SIZE):
+            raise ValueError(f"Chunk_size must be an integer between 1 and {self._MAX_BATCH_SIZE}")
+
+        if not (isinstance(max_concurrency, int) and max_concurrency >= 1):
+            raise ValueError("Max_concurrency must be a positive integer (>= 1)")
+
+        if not (isinstance(max_retries, int) and max_retries >= 0):
+            raise ValueError("Max_retries must be a non-negative integer (>= 0)")
+
+        self._config = Config()
+        self._api_method = api_method
+        self._bitrix_token = bitrix_token
+        self._chunk_size = chunk_size
+        self._make_params = make_params or self._make_default_params
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._retry_delay = self._config.default_initial_retry_delay if retry_delay is None else retry_delay
+        self._retry_ambiguous = retry_ambiguous
+
+        if retry_error_codes is not None:
+            self._retry_error_codes = frozenset(retry_error_codes)
+        elif retry_ambiguous:
+            self._retry_error_codes = self._DEFAULT_RETRY_ERROR_CODES | self._AMBIGUOUS_ERROR_CODES
+        else:
+            self._retry_error_codes = self._DEFAULT_RETRY_ERROR_CODES
+        self._timeout = timeout
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}("
+            f"api_method={self._api_method!r}, "
+            f"chunk_size={self._chunk_size}, "
+            f"max_concurrency={self._max_concurrency}, "
+            f"max_retries={self._max_retries})"
+        )
+
+    @property
+    def api_method(self) -> Text:
+        """Method writing one row."""
+        return self._api_method
+
+    @staticmethod
+    def _make_default_params(fields: JSONDict) -> JSONDict:
+        """Build ``{"fields": fields}`` method parameters."""
+        return {"fields": fields}
+
+    @staticmethod
+    def _force_dict(collection: Union[Dict[Text, JSONDict], List[JSONDict]]) -> Dict[Text, JSONDict]:
+        """Return batch results keyed by command key; Bitrix24 sends an empty list instead of an empty object."""
+        return collection if isinstance(collection, dict) else {}
+
+    def _get_command_key(self, index: int) -> Text:
+        """
+        Return the batch command key of a row.
+
+        Keys are not numeric, because Bitrix24 would otherwise return results
+        of commands with consecutive keys as a list.
+        """
+        return f"{self._COMMAND_KEY_PREFIX}{index}"
+
+    @staticmethod
+    def _get_bitrix_id(result: object) -> Optional[int]:
+        """
+        Extract the created entity ID from a command result.
+
+        ``crm.*.add`` methods return the ID itself, ``crm.item.add`` and
+        ``crm.item.import`` return ``{"item": {"id": ...}}``.
+        """
+
+        if isinstance(result, dict):
+            result = result["item"] if isinstance(result.get("item"), dict) else result
+            result = result.get("id", result.get("ID"))
+
+        try:
+            return int(result)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _get_error_payload(error: Exception) -> JSONDict:
+        """Return an error payload describing a failed batch request."""
+
+        if isinstance(error, BitrixAPIError) and isinstance(error.json_response.get("error"), str):
+            return {
+                "error": error.json_response["error"],
+                "error_description": error.json_response.get("error_description", str(error)),
+            }
+
+        return {
+            "error": type(error).__name__,
+            "error_description": str(error),
+        }
+
+    def _is_retryable(self, error: JSONDict) -> bool:
+        """Return whether a row failed with ``error`` may be written again."""
+        return error.get("error") in self._retry_error_codes or error.get("error") == self._NOT_EXECUTED_ERROR
+
+    @classmethod
+    def _is_not_sent(cls, error: BaseException) -> bool:
+        """Return whether a request error happened before the request could reach Bitrix24."""
+
+        pending: List[BaseException] = [error]
+        seen = set()
+
+        while pending:
+            current = pending.pop()
+
+            if id(current) in seen:
+                continue
+
+            seen.add(id(current))
+
+            if isinstance(current, cls._NOT_SENT_ERRORS):
+                return True
+
+            causes = (current.__cause__, current.__context__, getattr(current, "reason", None), *current.args)
+            pending.extend(cause for cause in causes if isinstance(cause, BaseException))
+
+        return False
+
+    def _is_ambiguous_request_error(self, error: Exception, error_payload: JSONDict) -> bool:
+        """Return whether a failed batch request may have been executed by Bitrix24."""
+        return isinstance(error, (BitrixRequestError, BitrixResponseJSONDecodeError)) or error_payload.get("error") in self._AMBIGUOUS_ERROR_CODES
+
+    def _is_retryable_request_error(self, error: Exception, error_payload: JSONDict) -> bool:
+        """Return whether a failed batch request may be sent again."""
+
+        if self._is_ambiguous_request_error(error, error_payload):
+            return self._retry_ambiguous or (isinstance(error, BitrixRequestError) and self._is_not_sent(error))
+
+        return self._is_retryable(error_payload)
+
+    def _get_unknown_outcome_payload(self, error: Exception) -> JSONDict:
+        """Return the error payload of rows that may have been written by a failed batch request."""
+        return {
+            "error": self._UNKNOWN_OUTCOME_ERROR,
+            "error_description": f"Rows may have been written; the batch request failed with {type(error).__name__}: {error}",
+        }
+
+    def _write_chunk(self, rows: List[_Row]) -> BatchResponseData:
+        """Send one batch request writing ``rows``, after the retry delay of previously failed rows."""
+
+        attempts = max(row_attempts for _, _, row_attempts in rows)
+
+        if attempts:
+            time.sleep(self._retry_delay * attempts)
+
+        return self._bitrix_token.call_batch(
+            {self._get_command_key(index): (self._api_method, self._make_params(fields)) for index, fields, _ in rows},
+            timeout=self._timeout,
+        )
+
+    def _take_chunk(self, rows_iterator: Iterator[Tuple[int, JSONDict]], retry_rows: Deque[_Row]) -> List[_Row]:
+        """Take rows waiting for a retry first, then fill the chunk from the input feed."""
+
+        chunk = [retry_rows.popleft() for _ in range(min(len(retry_rows), self._chunk_size))]
+        chunk.extend((index, fields, 0) for index, fields in islice(rows_iterator, self._chunk_size - len(chunk)))
+
+        return chunk
+
+    def _finish_chunk(self, future: "Future[BatchResponseData]", rows: List[_Row], retry_rows: Deque[_Row]) -> Iterator[BulkWriteRecord]:
+        """
+        Turn the outcome of a chunk into records, queueing rows for a retry.
+
+        Rows of a batch request that may have been executed are not retried
+        unless ``retry_ambiguous`` is enabled; they get the
+        ``BATCH_OUTCOME_UNKNOWN`` error.
+
+        Raises:
+            BitrixResponseError: If the batch request failed with a
+                non-transient error, which would fail every other chunk too.
+        """
+
+        try:
+            batch_response = future.result()
+
+        except (BitrixRequestError, BitrixResponseError) as error:
+            error_payload = self._get_error_payload(error)
+            is_retryable_chunk = self._is_retryable_request_error(error, error_payload)
+
+            if not is_retryable_chunk:
+                if not self._is_ambiguous_request_error(error, error_payload):
+                    raise
+
+                error_payload = self._get_unknown_outcome_payload(error)
+
+            results: Dict[Text, JSONDict] = {}
+            errors = dict.fromkeys((self._get_command_key(index) for index, _, _ in rows), error_payload)
+
+        else:
+            batch_result = batch_response["result"]
+            results = self._force_dict(batch_result["result"])
+            errors = self._force_dict(batch_result["result_error"])
+            is_retryable_chunk = False
+
+        for index, fields, previous_attempts in rows:
+            key = self._get_command_key(index)
+            attempts = previous_attempts + 1
+            error = errors.get(key)
+
+            if error is None and key in results:
+                yield BulkWriteRecord(index=index, fields=fields, bitrix_id=self._get_bitrix_id(results[key]), attempts=attempts)
+                continue
+
+            if error is None:
+                error = {"error": self._NOT_EXECUTED_ERROR, "error_description": "Batch command was not executed"}
+
+            if attempts <= self._max_retries and (is_retryable_chunk or self._is_retryable(error)):
+                retry_rows.append((index, fields, attempts))
+            else:
+                yield BulkWriteRecord(index=index, fields=fields, error=error, attempts=attempts)
+
+    def write(self, rows: Iterable[JSONDict]) -> Generator[BulkWriteRecord, None, None]:
+        """
+        Write a feed of rows.
+
+        The feed is consumed lazily while the returned generator is iterated.
+        Closing the generator stops the pipeline; chunks that are already
+        being sent are not waited for.
+
+        Args:
+            rows: Field values of the rows to write.
+
+        Yields:
+            One record per row, in the order chunks complete.
+
+        Raises:
+            BitrixResponseError: If a batch request failed with a
+                non-transient error, such as missing permissions. Requests
+                that may have been executed are reported per row instead.
+        """
+
+        rows_iterator = enumerate(rows)
+        retry_rows: Deque[_Row] = deque()
+        pending_futures: Dict["Future[BatchResponseData]", List[_Row]] = {}
+        executor = ThreadPoolExecutor(max_workers=self._max_concurrency, initializer=self._config.bind_to_current_thread)
+
+        try:
+            while True:
+                while len(pending_futures) < self._max_concurrency:
+                    chunk = self._take_chunk(rows_iterator, retry_rows)
+
+                    if not chunk:
+                        break
+
+                    pending_futures[executor.submit(self._write_chunk, chunk)] = chunk
+
+                if not pending_futures:
+                    return
+
+                done_futures, _ = wait(pending_futures, return_when=FIRST_COMPLETED)
+
+                for future in done_futures:
+                    yield from self._finish_chunk(future, pending_futures.pop(future), retry_rows)
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
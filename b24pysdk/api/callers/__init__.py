@@ -1,15 +1,25 @@
-from .call import call
-from .call_batch import call_batch
-from .call_batches import call_batches
-from .call_list import call_list
+from .call import acall, call
+from .call_batch import acall_batch, call_batch
+from .call_batches import acall_batches, call_batches
+from .call_download import call_download, call_method_download
+from .call_list import acall_list, call_list
 from .call_list_fast import call_list_fast
-from .call_method import call_method
+from .call_method import acall_method, call_method
+from .call_upload import call_upload
 
 __all__ = [
+    "acall",
+    "acall_batch",
+    "acall_batches",
+    "acall_list",
+    "acall_method",
     "call",
     "call_batch",
     "call_batches",
+    "call_download",
     "call_list",
     "call_list_fast",
     "call_method",
+    "call_method_download",
+    "call_upload",
 ]
@@ -1,10 +1,12 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, List, Optional, Text, Tuple
 
 from ..._config import Config
 from ...schemas.api import TimeResponseData
+from ...utils.types import JSONDict
 
 __all__ = [
+    "build_query_params",
     "get_empty_time",
 ]
 
@@ -26,3 +28,34 @@ def get_empty_time(date_time: Optional[datetime] = None) -> TimeResponseData:
         "date_start": iso_date_time,
         "date_finish": iso_date_time,
     }
+
+
+def build_query_params(params: JSONDict) -> List[Tuple[Text, Text]]:
+    """
+    Flatten method parameters into query string pairs in the nested ``key[sub_key]`` form parsed by PHP.
+
+    Args:
+        params: Method parameters, possibly containing nested dictionaries and lists.
+
+    Returns:
+        ``(name, value)`` pairs ready to be passed as ``requests`` query parameters.
+    """
+
+    query_params: List[Tuple[Text, Text]] = []
+
+    def add(name: Text, value: Any):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                add(f"{name}[{key}]", item)
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                add(f"{name}[{index}]", item)
+        elif isinstance(value, bool):
+            query_params.append((name, "Y" if value else "N"))
+        elif value is not None:
+            query_params.append((name, str(value)))
+
+    for key, value in params.items():
+        add(key, value)
+
+    return query_params
@@ -4,6 +4,7 @@ from ...utils.types import JSONDict, Number, Timeout
 from ..requesters import BitrixAPIRequester
 
 __all__ = [
+    "acall",
     "call",
 ]
 
@@ -52,3 +53,44 @@ def call(
         initial_retry_delay=initial_retry_delay,
         retry_delay_increment=retry_delay_increment,
     ).call()
+
+
+async def acall(
+        url: Text,
+        *,
+        params: Optional[JSONDict] = None,
+        timeout: Timeout = None,
+        max_retries: Optional[int] = None,
+        initial_retry_delay: Optional[Number] = None,
+        retry_delay_increment: Optional[Number] = None,
+) -> JSONDict:
+    """
+    Asynchronously perform one HTTP request to a concrete Bitrix REST URL.
+
+    Asynchronous counterpart of ``call``. The request is sent through the
+    async HTTP transport configured in ``Config``; file uploads are not
+    supported.
+
+    Args:
+        url: Absolute Bitrix REST endpoint URL.
+        params: Request parameters sent in the request body.
+        timeout: Request timeout in seconds.
+        max_retries: Maximum retry attempts for transport-level failures.
+        initial_retry_delay: Delay before the first retry, in seconds.
+        retry_delay_increment: Increment added to retry delay after each retry.
+
+    Returns:
+        Parsed JSON response returned by the Bitrix API server.
+
+    Raises:
+        BitrixRequestError: If the HTTP connection cannot be established.
+        BitrixRequestTimeout: If the request times out.
+    """
+    return await BitrixAPIRequester(
+        url=url,
+        params=params,
+        timeout=timeout,
+        max_retries=max_retries,
+        initial_retry_delay=initial_retry_delay,
+        retry_delay_increment=retry_delay_increment,
+    ).acall()
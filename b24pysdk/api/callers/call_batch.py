@@ -2,14 +2,15 @@ from typing import Dict, Final, Mapping, Optional, Sequence, Text, Union, overlo
 
 from ..._constants import MAX_BATCH_SIZE
 from ...constants.version import B24APIVersion
-from ...protocols import BitrixTokenProtocol
+from ...protocols import AsyncBitrixTokenProtocol, BitrixTokenProtocol
 from ...schemas.api import BatchResponseData
 from ...utils.encoding import encode_params
 from ...utils.types import B24APIVersionLiteral, B24Requests, B24RequestTuple, JSONDict, Key, Timeout, cast
 from ._base_caller import BaseCaller
-from .call_method import call_method
+from .call_method import acall_method, call_method
 
 __all__ = [
+    "acall_batch",
     "call_batch",
 ]
 
@@ -154,21 +155,56 @@ class _BatchCaller(BaseCaller):
                 **self._kwargs,
             )
 
+    async def _afetch_response(self) -> JSONDict:
+        """Asynchronous counterpart of ``_fetch_response``."""
+        if self._bitrix_token:
+            return await self._bitrix_token.acall_method(
+                api_method=self._api_method,
+                params=self._dynamic_params,
+                **self._kwargs,
+            )
+        else:
+            return await acall_method(
+                domain=self._domain,
+                auth_token=self._auth_token,
+                is_webhook=self._is_webhook,
+                api_method=self._api_method,
+                params=self._dynamic_params,
+                **self._kwargs,
+            )
+
+    def _log_start(self):
+        """Log batch options before the request."""
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start call_batch",
+                context={
+                    "ignore_size_limit": self._ignore_size_limit,
+                },
+            )
+
     def call(self) -> BatchResponseData:
         """Execute the configured batch request and return the parsed response."""
 
-        self._config.logger.debug(
-            "start call_batch",
-            context={
-                "ignore_size_limit": self._ignore_size_limit,
-            },
-        )
+        self._log_start()
 
         try:
             return cast(BatchResponseData, self._fetch_response())
         finally:
             self._config.logger.debug("finish call_batch")
 
+    async def acall(self) -> BatchResponseData:
+        """Asynchronously execute the configured batch request and return the parsed response."""
+
+        self._log_start()
+
+        try:
+            return cast(BatchResponseData, await self._afetch_response())
+        finally:
+            self._config.logger.debug("finish call_batch")
+
 
 @overload
 def call_batch(
@@ -254,3 +290,39 @@ def call_batch(
         bitrix_token=bitrix_token,
         **kwargs,
     ).call()
+
+
+async def acall_batch(
+        *,
+        domain: Text,
+        auth_token: Text,
+        is_webhook: bool,
+        methods: B24Requests,
+        halt: bool = False,
+        ignore_size_limit: bool = False,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        bitrix_token: Optional[AsyncBitrixTokenProtocol] = None,
+        **kwargs,
+) -> BatchResponseData:
+    """
+    Asynchronously execute multiple Bitrix REST methods in one classic ``batch`` request.
+
+    Asynchronous counterpart of ``call_batch``; see it for argument details.
+
+    Returns:
+        Parsed Bitrix batch response with command results, command errors, and
+        timing metadata.
+    """
+    return await _BatchCaller(
+        domain=domain,
+        auth_token=auth_token,
+        is_webhook=is_webhook,
+        methods=methods,
+        halt=halt,
+        ignore_size_limit=ignore_size_limit,
+        timeout=timeout,
+        prefer_version=prefer_version,
+        bitrix_token=bitrix_token,
+        **kwargs,
+    ).acall()
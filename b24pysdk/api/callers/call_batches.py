@@ -1,15 +1,19 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from typing import Dict, Final, List, Literal, Mapping, Optional, Sequence, Text, Tuple, Union, overload
 
 from ..._constants import MAX_BATCH_SIZE
 from ...constants.version import B24APIVersion
-from ...protocols import BitrixTokenProtocol
+from ...protocols import AsyncBitrixTokenProtocol, BitrixTokenProtocol
 from ...schemas.api import BatchResponseData, BatchResultData, TimeResponseData
 from ...utils.type_vars import BAResultT
 from ...utils.types import B24APIVersionLiteral, B24Requests, B24RequestTuple, Key, Timeout
 from ._base_caller import BaseCaller
-from .call_batch import call_batch
+from .call_batch import acall_batch, call_batch
 
 __all__ = [
+    "acall_batches",
     "call_batches",
 ]
 
@@ -36,10 +40,11 @@ class _BatchesCaller(BaseCaller):
     _BATCH_RESULT_FIELDS: Final[Tuple[_BatchResultFieldLiteral, ...]] = ("result", "result_error", "result_total", "result_next", "result_time")
     _MAX_BATCH_SIZE: Final[int] = MAX_BATCH_SIZE
 
-    __slots__ = ("_halt", "_methods")
+    __slots__ = ("_halt", "_max_concurrency", "_methods")
 
     _methods: B24Requests
     _halt: bool
+    _max_concurrency: Optional[int]
 
     def __init__(
             self,
@@ -49,6 +54,7 @@ class _BatchesCaller(BaseCaller):
             is_webhook: bool,
             methods: B24Requests,
             halt: bool = False,
+            max_concurrency: Optional[int] = None,
             prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
             bitrix_token: Optional[BitrixTokenProtocol] = None,
             **kwargs,
@@ -63,6 +69,8 @@ class _BatchesCaller(BaseCaller):
             methods: Mapping or sequence of ``(api_method, params)`` tuples.
             halt: Stop processing further chunks when a batch response contains
                 command errors.
+            max_concurrency: Maximum number of chunks executed at the same
+                time. ``None`` or ``1`` executes chunks sequentially.
             prefer_version: Preferred API version for resolving the ``batch``
                 calls.
             bitrix_token: Optional token wrapper used to execute nested calls
@@ -80,6 +88,19 @@ class _BatchesCaller(BaseCaller):
         )
         self._methods = methods
         self._halt = halt
+        self._max_concurrency = self._validate_max_concurrency(max_concurrency)
+
+    @staticmethod
+    def _validate_max_concurrency(max_concurrency: Optional[int]) -> Optional[int]:
+        """Validate that ``max_concurrency`` is ``None`` or a positive integer."""
+        if max_concurrency is not None and not (isinstance(max_concurrency, int) and max_concurrency >= 1):
+            raise ValueError("Max_concurrency must be a positive integer (>= 1)")
+        return max_concurrency
+
+    @property
+    def _is_concurrent(self) -> bool:
+        """Whether chunks are executed concurrently."""
+        return self._max_concurrency is not None and self._max_concurrency > 1
 
     def _fetch_batch_response(self, methods: B24Requests) -> BatchResponseData:
         """Execute one classic batch chunk using the current auth context."""
@@ -93,6 +114,18 @@ class _BatchesCaller(BaseCaller):
             **self._kwargs,
         )
 
+    async def _afetch_batch_response(self, methods: B24Requests) -> BatchResponseData:
+        """Asynchronously execute one classic batch chunk using the current auth context."""
+        return await acall_batch(
+            domain=self._domain,
+            auth_token=self._auth_token,
+            is_webhook=self._is_webhook,
+            methods=methods,
+            halt=self._halt,
+            bitrix_token=self._bitrix_token,
+            **self._kwargs,
+        )
+
     def _get_flat_methods(self) -> List[Tuple[Key, B24RequestTuple]]:
         """
         Return methods as ``(result_key, request_tuple)`` pairs.
@@ -123,6 +156,137 @@ class _BatchesCaller(BaseCaller):
                 for index, element in enumerate(collection)
             }
 
+    def _get_method_chunks(self) -> List[Dict[Key, B24RequestTuple]]:
+        """Split configured methods into ``MAX_BATCH_SIZE`` chunks keyed by result key."""
+
+        flat_methods: List[Tuple[Key, B24RequestTuple]] = self._get_flat_methods()
+
+        return [
+            dict(flat_methods[index:index + self._MAX_BATCH_SIZE])
+            for index in range(0, len(flat_methods), self._MAX_BATCH_SIZE)
+        ]
+
+    def _should_halt(self, batch_response: BatchResponseData) -> bool:
+        """Whether no further chunks should be scheduled after ``batch_response``."""
+        return self._halt and bool(batch_response["result"]["result_error"])
+
+    def _fetch_chunks_sequentially(self, methods_chunks: List[Dict[Key, B24RequestTuple]]) -> List[BatchResponseData]:
+        """Execute chunks one after another, stopping after the first failed chunk when ``halt`` is set."""
+
+        batch_responses: List[BatchResponseData] = []
+
+        for methods_chunk in methods_chunks:
+            batch_response = self._fetch_batch_response(methods=methods_chunk)
+            batch_responses.append(batch_response)
+
+            if self._should_halt(batch_response):
+                break
+
+        return batch_responses
+
+    def _fetch_chunks_concurrently(self, methods_chunks: List[Dict[Key, B24RequestTuple]]) -> List[BatchResponseData]:
+        """
+        Execute chunks in a bounded thread pool.
+
+        Chunks are scheduled in order, at most ``max_concurrency`` at a time.
+        When ``halt`` is set, no further chunks are scheduled after a chunk
+        returns command errors, but chunks already in flight are completed.
+        Chunks run on the long-lived worker pool of the SDK configuration, so
+        worker threads and their HTTP sessions are reused across calls. A call
+        made from inside that pool gets its own executor. Worker threads use
+        the SDK configuration of the calling thread.
+
+        Returns:
+            Responses of all executed chunks in chunk order.
+        """
+
+        max_workers = min(self._max_concurrency, len(methods_chunks))
+        batch_responses: Dict[int, BatchResponseData] = {}
+        pending_futures: Dict[Future, int] = {}
+        next_index = 0
+        halted = False
+
+        worker_pool = self._config.worker_pool
+
+        if worker_pool is not None:
+            executor_context = nullcontext(worker_pool)
+        else:
+            executor_context = ThreadPoolExecutor(max_workers=max_workers, initializer=self._config.bind_to_current_thread)
+
+        with executor_context as executor:
+
+            while True:
+                while not halted and next_index < len(methods_chunks) and len(pending_futures) < max_workers:
+                    future = executor.submit(self._fetch_batch_response, methods=methods_chunks[next_index])
+                    pending_futures[future] = next_index
+                    next_index += 1
+
+                if not pending_futures:
+                    break
+
+                done_futures, _ = wait(pending_futures, return_when=FIRST_COMPLETED)
+
+                for future in done_futures:
+                    index = pending_futures.pop(future)
+                    batch_responses[index] = future.result()
+                    halted = halted or self._should_halt(batch_responses[index])
+
+        return [batch_responses[index] for index in sorted(batch_responses)]
+
+    async def _afetch_chunks_sequentially(self, methods_chunks: List[Dict[Key, B24RequestTuple]]) -> List[BatchResponseData]:
+        """Asynchronous counterpart of ``_fetch_chunks_sequentially``."""
+
+        batch_responses: List[BatchResponseData] = []
+
+        for methods_chunk in methods_chunks:
+            batch_response = await self._afetch_batch_response(methods=methods_chunk)
+            batch_responses.append(batch_response)
+
+            if self._should_halt(batch_response):
+                break
+
+        return batch_responses
+
+    async def _afetch_chunks_concurrently(self, methods_chunks: List[Dict[Key, B24RequestTuple]]) -> List[BatchResponseData]:
+        """
+        Execute chunks as concurrent tasks of the running event loop.
+
+        Scheduling and ``halt`` handling match ``_fetch_chunks_concurrently``.
+        If a chunk fails, the remaining in-flight tasks are cancelled.
+
+        Returns:
+            Responses of all executed chunks in chunk order.
+        """
+
+        max_tasks = min(self._max_concurrency, len(methods_chunks))
+        batch_responses: Dict[int, BatchResponseData] = {}
+        pending_tasks: Dict[asyncio.Task, int] = {}
+        next_index = 0
+        halted = False
+
+        try:
+            while True:
+                while not halted and next_index < len(methods_chunks) and len(pending_tasks) < max_tasks:
+                    task = asyncio.ensure_future(self._afetch_batch_response(methods=methods_chunks[next_index]))
+                    pending_tasks[task] = next_index
+                    next_index += 1
+
+                if not pending_tasks:
+                    break
+
+                done_tasks, _ = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done_tasks:
+                    index = pending_tasks.pop(task)
+                    batch_responses[index] = task.result()
+                    halted = halted or self._should_halt(batch_responses[index])
+
+        finally:
+            for task in pending_tasks:
+                task.cancel()
+
+        return [batch_responses[index] for index in sorted(batch_responses)]
+
     def _combine_responses(self, responses: List[BatchResponseData]) -> BatchResponseData:
         """
         Merge several classic batch responses into a single batch-like response.
@@ -187,28 +351,48 @@ class _BatchesCaller(BaseCaller):
 
         If the collection fits into one classic batch request, the method
         delegates directly to ``call_batch``. Larger collections are split into
-        ``MAX_BATCH_SIZE`` chunks and their responses are merged.
+        ``MAX_BATCH_SIZE`` chunks, executed sequentially or concurrently
+        according to ``max_concurrency``, and their responses are merged in
+        chunk order.
         """
 
         self._config.logger.debug("start call_batches")
 
         try:
-            total_methods = len(self._methods)
-
-            if total_methods <= self._MAX_BATCH_SIZE:
+            if len(self._methods) <= self._MAX_BATCH_SIZE:
                 return self._fetch_batch_response(methods=self._methods)
 
-            flat_methods: List[Tuple[Key, B24RequestTuple]] = self._get_flat_methods()
+            methods_chunks = self._get_method_chunks()
 
-            batch_responses: List[BatchResponseData] = []
+            if self._is_concurrent:
+                batch_responses = self._fetch_chunks_concurrently(methods_chunks)
+            else:
+                batch_responses = self._fetch_chunks_sequentially(methods_chunks)
 
-            for index in range(0, total_methods, self._MAX_BATCH_SIZE):
-                methods_chunk = dict(flat_methods[index:index + self._MAX_BATCH_SIZE])
-                batch_response = self._fetch_batch_response(methods=methods_chunk)
-                batch_responses.append(batch_response)
+            return self._combine_responses(batch_responses)
+        finally:
+            self._config.logger.debug("finish call_batches")
 
-                if self._halt and batch_response["result"]["result_error"]:
-                    break
+    async def acall(self) -> BatchResponseData:
+        """
+        Asynchronously execute all configured methods in batch-size chunks.
+
+        Chunks are awaited one after another, or as up to ``max_concurrency``
+        concurrent tasks, with the same ``halt`` semantics as in ``call``.
+        """
+
+        self._config.logger.debug("start call_batches")
+
+        try:
+            if len(self._methods) <= self._MAX_BATCH_SIZE:
+                return await self._afetch_batch_response(methods=self._methods)
+
+            methods_chunks = self._get_method_chunks()
+
+            if self._is_concurrent:
+                batch_responses = await self._afetch_chunks_concurrently(methods_chunks)
+            else:
+                batch_responses = await self._afetch_chunks_sequentially(methods_chunks)
 
             return self._combine_responses(batch_responses)
         finally:
@@ -223,6 +407,7 @@ def call_batches(
         is_webhook: bool,
         methods: Mapping[Key, B24RequestTuple],
         halt: bool = False,
+        max_concurrency: Optional[int] = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
         timeout: Timeout = None,
         bitrix_token: Optional[BitrixTokenProtocol] = None,
@@ -238,6 +423,7 @@ def call_batches(
         is_webhook: bool,
         methods: Sequence[B24RequestTuple],
         halt: bool = False,
+        max_concurrency: Optional[int] = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
         timeout: Timeout = None,
         bitrix_token: Optional[BitrixTokenProtocol] = None,
@@ -252,6 +438,7 @@ def call_batches(
         is_webhook: bool,
         methods: B24Requests,
         halt: bool = False,
+        max_concurrency: Optional[int] = None,
         timeout: Timeout = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
         bitrix_token: Optional[BitrixTokenProtocol] = None,
@@ -262,7 +449,8 @@ def call_batches(
 
     Unlike ``call_batch``, this helper accepts collections larger than one
     classic batch request. It splits them into ``MAX_BATCH_SIZE`` chunks,
-    executes the chunks sequentially, and returns a merged batch-like response.
+    executes the chunks sequentially or, with ``max_concurrency``, in a
+    bounded thread pool, and returns a merged batch-like response.
 
     Args:
         domain: Bitrix24 portal domain.
@@ -271,6 +459,8 @@ def call_batches(
         methods: Mapping or sequence of ``(api_method, params)`` tuples. Mapping
             keys are used as result keys returned by Bitrix.
         halt: Stop processing further chunks when a command error appears.
+        max_concurrency: Maximum number of chunks executed at the same time.
+            ``None`` or ``1`` executes chunks sequentially.
         timeout: Request timeout in seconds.
         prefer_version: Preferred API version to resolve the ``batch`` method.
         bitrix_token: Optional token wrapper used by nested execution.
@@ -286,8 +476,45 @@ def call_batches(
         is_webhook=is_webhook,
         methods=methods,
         halt=halt,
+        max_concurrency=max_concurrency,
         timeout=timeout,
         prefer_version=prefer_version,
         bitrix_token=bitrix_token,
         **kwargs,
     ).call()
+
+
+async def acall_batches(
+        *,
+        domain: Text,
+        auth_token: Text,
+        is_webhook: bool,
+        methods: B24Requests,
+        halt: bool = False,
+        max_concurrency: Optional[int] = None,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        bitrix_token: Optional[AsyncBitrixTokenProtocol] = None,
+        **kwargs,
+) -> BatchResponseData:
+    """
+    Asynchronously execute any number of Bitrix REST methods through classic batch requests.
+
+    Asynchronous counterpart of ``call_batches``; see it for argument details.
+
+    Returns:
+        Parsed merged batch response with command results, errors, pagination
+        metadata returned by Bitrix, and aggregated timing.
+    """
+    return await _BatchesCaller(
+        domain=domain,
+        auth_token=auth_token,
+        is_webhook=is_webhook,
+        methods=methods,
+        halt=halt,
+        max_concurrency=max_concurrency,
+        timeout=timeout,
+        prefer_version=prefer_version,
+        bitrix_token=bitrix_token,
+        **kwargs,
+    ).acall()
@@ -0,0 +1,174 @@
+import contextlib
+import os
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Text, Tuple, Union
+
+from ...constants.version import B24APIVersion
+from ...protocols import BitrixTokenProtocol
+from ...utils.types import B24APIVersionLiteral, JSONDict, Number, ProgressCallback, Timeout
+from ..requesters import BitrixDownloadRequester
+from ._utils import build_query_params
+from .call_method import _MethodCaller
+
+__all__ = [
+    "call_download",
+    "call_method_download",
+]
+
+
+class _MethodDownloadCaller(_MethodCaller):
+    """Caller downloading file content returned by a Bitrix REST method."""
+
+    __slots__ = ()
+
+    @property
+    def _url(self) -> Text:
+        """
+        Build the method URL without the ``.json`` format suffix.
+
+        Methods such as ``catalog.product.download`` respond with raw file
+        content instead of a JSON document.
+        """
+        return f"{self._base_url}/{self._dynamic_auth_token}{self._api_method}"
+
+    def call(self) -> int:
+        """Download the method response into the destination passed in the caller options."""
+
+        self._log_start()
+
+        size = call_download(
+            url=self._url,
+            query=build_query_params(self._dynamic_params),
+            **self._kwargs,
+        )
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish call_method_download",
+                context={
+                    "method": self._api_method,
+                    "size": size,
+                },
+            )
+
+        return size
+
+
+def call_download(
+        url: Text,
+        *,
+        destination: Union[Text, "os.PathLike[Text]", BinaryIO],
+        query: Optional[List[Tuple[Text, Text]]] = None,
+        resume: bool = False,
+        chunk_size: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        timeout: Timeout = None,
+        max_retries: Optional[int] = None,
+        initial_retry_delay: Optional[Number] = None,
+        retry_delay_increment: Optional[Number] = None,
+) -> int:
+    """
+    Download file content from a Bitrix URL into a file.
+
+    Suitable for ``DOWNLOAD_URL`` values returned by ``disk`` methods and
+    other prepared download links. The body is written chunk by chunk through
+    the pooled session of the portal, and interrupted transfers are resumed
+    with HTTP ``Range`` requests.
+
+    Args:
+        url: Absolute download URL.
+        destination: Path of the file to write or a binary file object opened
+            for writing. A file object is written from its current position
+            and left open.
+        query: Query string parameters appended to ``url``.
+        resume: Whether to continue a previous download: content already
+            present in the destination file, or before the current position
+            of a file object, is kept and only the rest is requested.
+        chunk_size: Size of chunks written to the destination, in bytes.
+        progress_callback: Optional callable receiving the number of bytes
+            downloaded and the total size, ``None`` when unknown.
+        timeout: Request timeout in seconds.
+        max_retries: Maximum retry attempts for failures that received no content.
+        initial_retry_delay: Delay before the first retry, in seconds.
+        retry_delay_increment: Increment added to retry delay after each retry.
+
+    Returns:
+        Size of the downloaded content in bytes.
+
+    Raises:
+        BitrixAPIError: If Bitrix responds with an error.
+        BitrixRequestError: If the HTTP connection cannot be established.
+        BitrixRequestTimeout: If the request times out.
+    """
+
+    with contextlib.ExitStack() as exit_stack:
+        if isinstance(destination, (str, os.PathLike)):
+            destination = exit_stack.enter_context(Path(destination).open("ab" if resume else "wb"))
+
+        return BitrixDownloadRequester(
+            url,
+            file=destination,
+            query=query,
+            offset=destination.tell() if resume else 0,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            timeout=timeout,
+            max_retries=max_retries,
+            initial_retry_delay=initial_retry_delay,
+            retry_delay_increment=retry_delay_increment,
+        ).download()
+
+
+def call_method_download(
+        *,
+        domain: Text,
+        auth_token: Text,
+        is_webhook: bool,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        destination: Union[Text, "os.PathLike[Text]", BinaryIO],
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        bitrix_token: Optional[BitrixTokenProtocol] = None,
+        **kwargs,
+) -> int:
+    """
+    Download file content returned by a Bitrix REST API method.
+
+    Intended for methods that respond with a file instead of JSON, such as
+    ``catalog.product.download``. The method is requested with ``GET`` and its
+    parameters are sent in the query string; webhook calls put the webhook
+    token into the URL path, OAuth calls send the access token as the ``auth``
+    parameter. Errors reported by Bitrix are raised as for ``call_method``.
+
+    Args:
+        domain: Bitrix24 portal domain.
+        auth_token: OAuth access token or webhook token.
+        is_webhook: Whether ``auth_token`` is a webhook token.
+        api_method: Bitrix REST method name, for example ``catalog.product.download``.
+        params: Method parameters sent to Bitrix.
+        destination: Path of the file to write or a binary file object opened
+            for writing.
+        timeout: Request timeout in seconds.
+        prefer_version: Preferred API version, accepted for symmetry with
+            ``call_method``; download methods are served by the V2 endpoint.
+        bitrix_token: Optional high-level token wrapper used by nested calls.
+        **kwargs: Extra download options, see ``call_download``.
+
+    Returns:
+        Size of the downloaded content in bytes.
+    """
+    return _MethodDownloadCaller(
+        domain=domain,
+        auth_token=auth_token,
+        is_webhook=is_webhook,
+        api_method=api_method,
+        params=params,
+        destination=destination,
+        timeout=timeout,
+        prefer_version=prefer_version,
+        bitrix_token=bitrix_token,
+        **kwargs,
+    ).call()
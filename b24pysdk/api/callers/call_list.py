@@ -1,16 +1,17 @@
-from typing import Final, Iterable, List, Mapping, Optional, Text, Tuple, Union
+from typing import Final, Iterable, Iterator, List, Literal, Mapping, Optional, Text, Tuple, Union, overload
 
 from ..._constants import MAX_BATCH_SIZE
 from ...constants.version import B24APIVersion
-from ...protocols import BitrixTokenProtocol
-from ...schemas.api import BatchResponseData, BatchResultData, ListResponseData, ResponseData, TimeResponseData
-from ...utils.types import B24APIVersionLiteral, B24RequestTuple, JSONDict, JSONList, Timeout, cast
+from ...protocols import AsyncBitrixTokenProtocol, BitrixTokenProtocol
+from ...schemas.api import BatchResponseData, BatchResultData, ListFastResponseData, ListResponseData, ResponseData, TimeResponseData
+from ...utils.types import B24APIVersionLiteral, B24RequestTuple, JSONDict, JSONGenerator, JSONList, Timeout, cast
 from ._base_caller import BaseCaller
 from ._utils import get_empty_time
-from .call_batches import call_batches
-from .call_method import call_method
+from .call_batches import acall_batches, call_batches
+from .call_method import acall_method, call_method
 
 __all__ = [
+    "acall_list",
     "call_list",
 ]
 
@@ -23,16 +24,22 @@ class _ListCaller(BaseCaller):
     requests to load remaining pages by ``start`` offsets. It also has a
     shortcut for requests that filter only by a list of IDs: in that case the ID
     list is split into chunks and fetched through batch calls.
+
+    In streaming mode items are yielded by a generator while batches arrive,
+    so only one group of batches is held in memory at a time.
     """
 
     _ALLOWED_PARAMS_FOR_OPTIMIZATION_BY_ID: Final[Tuple[Text, ...]] = ("filter", "select")
     _FILTER_ID_KEYS: Final[Tuple[Text, ...]] = ("id", "@id")
     _HALT: Final[bool] = True
+    _MAX_BATCH_SIZE: Final[int] = MAX_BATCH_SIZE
     _STEP: Final[int] = MAX_BATCH_SIZE
 
-    __slots__ = ("_limit", "_time")
+    __slots__ = ("_limit", "_max_concurrency", "_stream", "_time")
 
     _limit: Optional[int]
+    _max_concurrency: Optional[int]
+    _stream: bool
     _time: TimeResponseData
 
     def __init__(
@@ -44,6 +51,8 @@ class _ListCaller(BaseCaller):
             api_method: Text,
             params: Optional[JSONDict] = None,
             limit: Optional[int] = None,
+            max_concurrency: Optional[int] = None,
+            stream: bool = False,
             prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
             bitrix_token: Optional[BitrixTokenProtocol] = None,
             **kwargs,
@@ -60,6 +69,10 @@ class _ListCaller(BaseCaller):
                 ``select``.
             limit: Maximum number of items to return, or ``None`` for all
                 available items reported by Bitrix.
+            max_concurrency: Maximum number of batch chunks loaded at the
+                same time, see ``call_batches``.
+            stream: Whether ``call`` returns a lazy generator of items instead
+                of a fully loaded list.
             prefer_version: Preferred API version. V3 list methods are rejected
                 because this caller relies on classic ``start`` pagination.
             bitrix_token: Optional token wrapper used for retry/refresh logic.
@@ -78,6 +91,8 @@ class _ListCaller(BaseCaller):
         if self._api_version == B24APIVersion.V3:
             raise TypeError("Bitrix API v3 methods are not supported by call_list yet.")
         self._limit = limit
+        self._max_concurrency = max_concurrency
+        self._stream = stream
 
     def _check_filter_by_id_only(self) -> Tuple[Text, Text, List[int]]:
         """
@@ -212,6 +227,40 @@ class _ListCaller(BaseCaller):
             is_webhook=self._is_webhook,
             methods=methods,
             halt=self._HALT,
+            max_concurrency=self._max_concurrency,
+            bitrix_token=self._bitrix_token,
+            **self._kwargs,
+        )
+
+    async def _afetch_first_response(self) -> ResponseData:
+        """Asynchronous counterpart of ``_fetch_first_response``."""
+        if self._bitrix_token:
+            response = await self._bitrix_token.acall_method(
+                api_method=self._api_method,
+                params=self._params,
+                **self._kwargs,
+            )
+        else:
+            response = await acall_method(
+                domain=self._domain,
+                auth_token=self._auth_token,
+                is_webhook=self._is_webhook,
+                api_method=self._api_method,
+                params=self._params,
+                **self._kwargs,
+            )
+
+        return cast(ResponseData, response)
+
+    async def _afetch_batches_response(self, methods: List[B24RequestTuple]) -> BatchResponseData:
+        """Asynchronous counterpart of ``_fetch_batches_response``."""
+        return await acall_batches(
+            domain=self._domain,
+            auth_token=self._auth_token,
+            is_webhook=self._is_webhook,
+            methods=methods,
+            halt=self._HALT,
+            max_concurrency=self._max_concurrency,
             bitrix_token=self._bitrix_token,
             **self._kwargs,
         )
@@ -277,21 +326,189 @@ class _ListCaller(BaseCaller):
         if operating is not None:
             self._time["operating"] = self._time.get("operating", 0) + operating
 
-    def call(self) -> ListResponseData:
+    def _get_filter_id_methods(self) -> List[B24RequestTuple]:
+        """Return batch commands for the ID-filter optimization, or an empty list when it does not apply."""
+
+        filter_key, filter_id_key, filter_ids = self._check_filter_by_id_only()
+
+        if not filter_ids:
+            return []
+
+        return self._generate_filter_id_methods_for_batch(
+            filter_key=filter_key,
+            filter_id_key=filter_id_key,
+            filter_ids=filter_ids,
+        )
+
+    def _make_filter_id_response(self, batch_response: BatchResponseData) -> ListResponseData:
+        """Build the list response of the ID-filter optimization."""
+
+        result = self._unwrap_batch_result(batch_response["result"])
+
+        if self._limit is not None:
+            del result[self._limit:]
+
+        return {
+            "result": result,
+            "time": batch_response["time"],
+        }
+
+    def _process_first_response(self, response: ResponseData) -> Tuple[JSONList, int, List[B24RequestTuple]]:
+        """
+        Extract items from the first page and plan the remaining page requests.
+
+        Stores first-page timing in ``_time``.
+
+        Returns:
+            First-page items, the total number of items to return, and batch
+            commands loading the remaining pages (empty when nothing is left).
+        """
+
+        result = self._unwrap_result(response["result"])
+        self._time = response["time"]
+
+        next_step = response.get("next")
+        total = response.get("total")
+
+        if total is None:
+            total = len(result)
+
+            message = (
+                f"Bitrix API method {self._api_method!r} did not return a 'total' field. "
+                "The method is likely not a list-type method and you should use call_method instead of call_list."
+            )
+
+            self._config.logger.warning(message)
+
+        if self._limit is not None:
+            total = min(total, self._limit)
+
+        methods: List[B24RequestTuple] = []
+
+        if next_step and (self._limit is None or self._limit > self._STEP):
+            methods = self._generate_methods_for_batch(
+                next_step=next_step,
+                total=total,
+            )
+
+        return result, total, methods
+
+    def _log_start(self):
+        """Log list options before loading."""
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start call_list",
+                context={
+                    "limit": self._limit,
+                    "stream": self._stream,
+                },
+            )
+
+    def _iter_batches_responses(self, methods: List[B24RequestTuple]) -> Iterator[BatchResponseData]:
+        """
+        Lazily execute batch commands group by group.
+
+        Every group holds as many commands as ``call_batches`` executes at the
+        same time, so loading the next group starts only when the previous one
+        has been consumed.
+        """
+
+        group_size = self._MAX_BATCH_SIZE * (self._max_concurrency or 1)
+
+        for start in range(0, len(methods), group_size):
+            yield self._fetch_batches_response(methods=methods[start:start + group_size])
+
+    def _generate_items(self, items: JSONList, total: Optional[int], methods: List[B24RequestTuple]) -> JSONGenerator:
+        """
+        Yield already loaded items, then items of the remaining batches as they arrive.
+
+        Timing metadata of every loaded group is merged into ``_time``. Loading
+        stops once ``total`` items were yielded, or after a group that
+        contains command errors, as halted batches do in non-streaming mode.
+
+        Args:
+            items: Items that are already loaded.
+            total: Maximum number of items to yield, or ``None`` for all items.
+            methods: Batch commands loading the remaining items.
+        """
+
+        try:
+            remaining = total
+            batches_responses = self._iter_batches_responses(methods)
+
+            while True:
+                if remaining is not None:
+                    del items[remaining:]
+                    remaining -= len(items)
+
+                yield from items
+
+                if remaining == 0:
+                    return
+
+                batch_response = next(batches_responses, None)
+
+                if batch_response is None:
+                    return
+
+                items = self._unwrap_batch_result(batch_response["result"])
+                self._add_time(batch_response["time"])
+
+                if batch_response["result"].get("result_error"):
+                    batches_responses = iter(())
+
+        finally:
+            self._config.logger.debug("finish call_list stream")
+
+    def _call_stream(self) -> ListFastResponseData:
+        """
+        Fetch the first page and return a lazy generator of all requested items.
+
+        The first page is loaded immediately, so request errors and the total
+        number of items are known before iteration starts. Remaining pages are
+        loaded while the generator is consumed.
+        """
+
+        if self._limit is not None and self._limit <= 0:
+            self._time = get_empty_time()
+            return {
+                "result": self._generate_items([], 0, []),
+                "time": self._time,
+            }
+
+        filter_id_methods = self._get_filter_id_methods()
+
+        if filter_id_methods:
+            self._time = get_empty_time()
+            return {
+                "result": self._generate_items([], self._limit, filter_id_methods),
+                "time": self._time,
+            }
+
+        result, total, methods = self._process_first_response(self._fetch_first_response())
+
+        return {
+            "result": self._generate_items(result, total, methods),
+            "time": self._time,
+        }
+
+    def call(self) -> Union[ListResponseData, ListFastResponseData]:
         """
         Fetch list items with classic Bitrix pagination and return a normalized response.
 
         Returns ``{"result": [...], "time": ...}`` regardless of the original
         wrapper key used by the Bitrix method. When possible, remaining pages
-        are fetched through batch requests for fewer HTTP round trips.
+        are fetched through batch requests for fewer HTTP round trips. In
+        streaming mode ``result`` is a one-time generator and ``time`` is
+        updated while it is consumed.
         """
 
-        self._config.logger.debug(
-            "start call_list",
-            context={
-                "limit": self._limit,
-            },
-        )
+        self._log_start()
+
+        if self._stream:
+            return self._call_stream()
 
         try:
             if self._limit is not None and self._limit <= 0:
@@ -300,55 +517,57 @@ class _ListCaller(BaseCaller):
                     "time": get_empty_time(),
                 }
 
-            filter_key, filter_id_key, filter_ids = self._check_filter_by_id_only()
+            filter_id_methods = self._get_filter_id_methods()
 
-            if filter_ids:
-                batch_response = self._fetch_batches_response(
-                    methods=self._generate_filter_id_methods_for_batch(
-                        filter_key=filter_key,
-                        filter_id_key=filter_id_key,
-                        filter_ids=filter_ids,
-                    ),
-                )
+            if filter_id_methods:
+                return self._make_filter_id_response(self._fetch_batches_response(methods=filter_id_methods))
 
-                result = self._unwrap_batch_result(batch_response["result"])
+            result, total, methods = self._process_first_response(self._fetch_first_response())
 
-                if self._limit is not None:
-                    del result[self._limit:]
+            if methods:
+                batch_response = self._fetch_batches_response(methods=methods)
+                result.extend(self._unwrap_batch_result(batch_response["result"]))
+                self._add_time(batch_response["time"])
 
-                return {
-                    "result": result,
-                    "time": batch_response["time"],
-                }
+            del result[total:]
 
-            response = self._fetch_first_response()
+            return {
+                "result": result,
+                "time": self._time,
+            }
 
-            result = self._unwrap_result(response["result"])
-            self._time = response["time"]
+        finally:
+            self._config.logger.debug("finish call_list")
 
-            next_step = response.get("next")
-            total = response.get("total")
+    async def acall(self) -> ListResponseData:
+        """
+        Asynchronous counterpart of ``call``.
 
-            if total is None:
-                total = len(result)
+        Raises:
+            TypeError: If streaming mode is requested.
+        """
 
-                message = (
-                    f"Bitrix API method {self._api_method!r} did not return a 'total' field. "
-                    "The method is likely not a list-type method and you should use call_method instead of call_list."
-                )
+        if self._stream:
+            raise TypeError("Streaming list requests cannot be executed asynchronously, use stream=False instead.")
 
-                self._config.logger.warning(message)
+        self._log_start()
 
-            if self._limit is not None:
-                total = min(total, self._limit)
+        try:
+            if self._limit is not None and self._limit <= 0:
+                return {
+                    "result": [],
+                    "time": get_empty_time(),
+                }
+
+            filter_id_methods = self._get_filter_id_methods()
 
-            if next_step and (self._limit is None or self._limit > self._STEP):
-                batch_response = self._fetch_batches_response(
-                    methods=self._generate_methods_for_batch(
-                        next_step=next_step,
-                        total=total,
-                    ),
-                )
+            if filter_id_methods:
+                return self._make_filter_id_response(await self._afetch_batches_response(methods=filter_id_methods))
+
+            result, total, methods = self._process_first_response(await self._afetch_first_response())
+
+            if methods:
+                batch_response = await self._afetch_batches_response(methods=methods)
                 result.extend(self._unwrap_batch_result(batch_response["result"]))
                 self._add_time(batch_response["time"])
 
@@ -363,6 +582,7 @@ class _ListCaller(BaseCaller):
             self._config.logger.debug("finish call_list")
 
 
+@overload
 def call_list(
         *,
         domain: Text,
@@ -371,11 +591,48 @@ def call_list(
         api_method: Text,
         params: Optional[JSONDict] = None,
         limit: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        stream: Literal[False] = False,
         timeout: Timeout = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
         bitrix_token: Optional[BitrixTokenProtocol] = None,
         **kwargs,
-) -> ListResponseData:
+) -> ListResponseData: ...
+
+
+@overload
+def call_list(
+        *,
+        domain: Text,
+        auth_token: Text,
+        is_webhook: bool,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        limit: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        stream: Literal[True],
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        bitrix_token: Optional[BitrixTokenProtocol] = None,
+        **kwargs,
+) -> ListFastResponseData: ...
+
+
+def call_list(
+        *,
+        domain: Text,
+        auth_token: Text,
+        is_webhook: bool,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        limit: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        stream: bool = False,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        bitrix_token: Optional[BitrixTokenProtocol] = None,
+        **kwargs,
+) -> Union[ListResponseData, ListFastResponseData]:
     """
     Retrieve items from a classic Bitrix list method using batch pagination.
 
@@ -391,13 +648,21 @@ def call_list(
         api_method: List-like REST method name, for example ``crm.deal.list``.
         params: Method parameters sent to Bitrix.
         limit: Maximum number of items to retrieve.
+        max_concurrency: Maximum number of batch chunks loaded at the same
+            time. ``None`` loads pages sequentially.
+        stream: When ``True``, only the first page is loaded immediately and
+            ``result`` is a one-time generator that loads the remaining pages
+            batch by batch while it is consumed, so memory use stays
+            proportional to one group of batches. ``time`` is accumulated
+            during iteration.
         timeout: Request timeout in seconds.
         prefer_version: Preferred API version to resolve the method against.
         bitrix_token: Optional token wrapper used by nested execution.
         **kwargs: Extra requester options, such as retry configuration.
 
     Returns:
-        Dictionary with flattened ``result`` list and aggregated ``time`` data.
+        Dictionary with flattened ``result`` list (or generator in streaming
+        mode) and aggregated ``time`` data.
     """
     return _ListCaller(
         domain=domain,
@@ -406,8 +671,47 @@ def call_list(
         api_method=api_method,
         params=params,
         limit=limit,
+        max_concurrency=max_concurrency,
+        stream=stream,
         timeout=timeout,
         prefer_version=prefer_version,
         bitrix_token=bitrix_token,
         **kwargs,
     ).call()
+
+
+async def acall_list(
+        *,
+        domain: Text,
+        auth_token: Text,
+        is_webhook: bool,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        limit: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        bitrix_token: Optional[AsyncBitrixTokenProtocol] = None,
+        **kwargs,
+) -> ListResponseData:
+    """
+    Asynchronously retrieve items from a classic Bitrix list method using batch pagination.
+
+    Asynchronous counterpart of ``call_list``; see it for argument details.
+
+    Returns:
+        Dictionary with flattened ``result`` list and aggregated ``time`` data.
+    """
+    return await _ListCaller(
+        domain=domain,
+        auth_token=auth_token,
+        is_webhook=is_webhook,
+        api_method=api_method,
+        params=params,
+        limit=limit,
+        max_concurrency=max_concurrency,
+        timeout=timeout,
+        prefer_version=prefer_version,
+        bitrix_token=bitrix_token,
+        **kwargs,
+    ).acall()
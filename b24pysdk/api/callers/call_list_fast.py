@@ -1,5 +1,9 @@
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
-from typing import Callable, Dict, Final, Iterable, Literal, Optional, Text, Tuple, Union
+from typing import Callable, Dict, Final, Iterable, List, Literal, Optional, Set, Text, Tuple, Union
 
 from ..._constants import MAX_BATCH_SIZE
 from ...constants.version import B24APIVersion
@@ -24,12 +28,18 @@ class _ListFastCaller(BaseCaller):
     by an ID-like field, disables total calculation with ``start=-1``, and uses
     batch requests whose filters depend on the last ID returned by the previous
     page. This is useful for large V1/V2 datasets where total counting is slow.
+
+    In partitioned mode the ID space between the smallest and the largest ID
+    is split into several ranges, and every range is walked by its own
+    sequential caller in a worker thread.
     """
 
     _DEFAULT_ID_FIELD: Final[Text] = "ID"
     _DEFAULT_ORDER_PATTERN: Final[Callable[[Text, Text], JSONDict]] = staticmethod(lambda id_field, sorting: {"order": {id_field: sorting}})
     _HALT: Final[bool] = True
     _MAX_BATCH_SIZE: Final[int] = MAX_BATCH_SIZE
+    _PARTITION_QUEUE_SIZE: Final[int] = MAX_BATCH_SIZE
+    _PARTITION_QUEUE_TIMEOUT: Final[float] = 0.1
     _START: Final[int] = -1
 
     _REQUEST_ID_FIELDS: Final[Dict[Text, Text]] = {
@@ -52,6 +62,8 @@ class _ListFastCaller(BaseCaller):
         "_limit",
         "_now_datetime",
         "_order_pattern",
+        "_ordered",
+        "_partitions",
         "_request_id_field",
         "_response_id_field",
         "_results",
@@ -61,6 +73,8 @@ class _ListFastCaller(BaseCaller):
 
     _descending: bool
     _limit: Optional[int]
+    _partitions: Optional[int]
+    _ordered: bool
     _now_datetime: datetime
     _time: TimeResponseData
     _counter: int
@@ -81,6 +95,8 @@ class _ListFastCaller(BaseCaller):
             params: Optional[JSONDict] = None,
             descending: bool = False,
             limit: Optional[int] = None,
+            partitions: Optional[int] = None,
+            ordered: bool = True,
             prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
             bitrix_token: Optional[BitrixTokenProtocol] = None,
             **kwargs,
@@ -97,6 +113,11 @@ class _ListFastCaller(BaseCaller):
                 ordering, filter, and ``start=-1`` parameters.
             descending: Retrieve items by descending ID-like field when ``True``.
             limit: Maximum number of yielded items, or ``None`` for all items.
+            partitions: Number of ID ranges walked concurrently. ``None`` or
+                ``1`` walks the whole ID space sequentially.
+            ordered: Whether items of a partitioned walk are yielded in ID
+                order. Otherwise items are yielded as soon as any range
+                returns them.
             prefer_version: Preferred API version. V3 methods are rejected
                 because this caller uses classic filtering and batch syntax.
             bitrix_token: Optional token wrapper used for retry/refresh logic.
@@ -116,6 +137,8 @@ class _ListFastCaller(BaseCaller):
             raise TypeError("Bitrix API v3 methods are not supported by call_list_fast yet.")
         self._descending = descending
         self._limit = limit
+        self._partitions = self._validate_partitions(partitions)
+        self._ordered = ordered
         self._now_datetime = self._config.get_local_datetime()
         self._time = get_empty_time(self._now_datetime)
         self._counter = 0
@@ -126,6 +149,13 @@ class _ListFastCaller(BaseCaller):
         self._order_pattern = self._get_order_pattern()
         self._results = None
 
+    @staticmethod
+    def _validate_partitions(partitions: Optional[int]) -> Optional[int]:
+        """Validate that ``partitions`` is ``None`` or a positive integer."""
+        if partitions is not None and not (isinstance(partitions, int) and partitions >= 1):
+            raise ValueError("Partitions must be a positive integer (>= 1)")
+        return partitions
+
     def _get_initial_request_id_field(self) -> Optional[Text]:
         """
         Resolve the request-side ID field configured for the current method.
@@ -443,15 +473,18 @@ class _ListFastCaller(BaseCaller):
             self._last_id = new_last_id
             return True
 
-        self._config.logger.info(
-            "stop call_list_fast because Bitrix returned the same ID sequence",
-            context={
-                "api_method": self._api_method,
-                "filter_key": self._filter_key,
-                "last_id": self._last_id,
-                "new_last_id": new_last_id,
-            },
-        )
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.INFO):
+            logger.info(
+                "stop call_list_fast because Bitrix returned the same ID sequence",
+                context={
+                    "api_method": self._api_method,
+                    "filter_key": self._filter_key,
+                    "last_id": self._last_id,
+                    "new_last_id": new_last_id,
+                },
+            )
 
         return False
 
@@ -510,6 +543,272 @@ class _ListFastCaller(BaseCaller):
         finally:
             self._config.logger.debug("finish call_list_fast")
 
+    def _fetch_boundary_response(self, sorting: Literal["ASC", "DESC"]) -> ResponseData:
+        """Fetch the first page ordered by ID in ``sorting`` direction to find the smallest or largest ID."""
+
+        params = self._deep_merge(
+            self._params,
+            self._order_pattern(self._dynamic_request_id_field, sorting),
+            {"start": self._START},
+        )
+
+        if self._bitrix_token:
+            response = self._bitrix_token.call_method(
+                api_method=self._api_method,
+                params=params,
+                **self._kwargs,
+            )
+        else:
+            response = call_method(
+                domain=self._domain,
+                auth_token=self._auth_token,
+                is_webhook=self._is_webhook,
+                api_method=self._api_method,
+                params=params,
+                **self._kwargs,
+            )
+
+        return cast(ResponseData, response)
+
+    def _fetch_boundary_id(self, sorting: Literal["ASC", "DESC"]) -> Optional[int]:
+        """Return the first ID in ``sorting`` direction, or ``None`` when the list is empty."""
+
+        response = self._fetch_boundary_response(sorting)
+        self._add_time(response["time"])
+
+        _, unwrapped_result_values = self._unwrap_result(response["result"])
+
+        if not unwrapped_result_values:
+            return None
+
+        self._response_id_field = self._extract_response_id_field(unwrapped_result_values[0])
+
+        return int(unwrapped_result_values[0][self._response_id_field])
+
+    def _get_partition_ranges(self) -> List[Tuple[int, int]]:
+        """
+        Discover the ID space and split it into ``[lower, upper)`` ranges.
+
+        The number of ranges never exceeds the number of full pages in the ID
+        space. Ranges are returned in the traversal order, so concatenating
+        their items keeps the requested sort direction. Items created after
+        the discovery with IDs above the largest ID are not included.
+        """
+
+        min_id = self._fetch_boundary_id("ASC")
+
+        if min_id is None:
+            return []
+
+        max_id = self._fetch_boundary_id("DESC")
+
+        if max_id is None:
+            return []
+
+        span = max_id - min_id + 1
+        partitions = max(1, min(self._partitions, -(-span // self._MAX_BATCH_SIZE)))
+
+        boundaries = [min_id + span * index // partitions for index in range(partitions + 1)]
+        partition_ranges = list(zip(boundaries[:-1], boundaries[1:]))
+
+        if self._descending:
+            partition_ranges.reverse()
+
+        return partition_ranges
+
+    def _make_partition_caller(self, lower_id: int, upper_id: int) -> "_ListFastCaller":
+        """
+        Create a sequential caller limited to IDs in ``[lower_id, upper_id)``.
+
+        In descending mode the moving ``<ID`` window of the partition caller
+        replaces the upper bound after the first page, which only narrows the
+        range further.
+        """
+
+        request_id_field = self._dynamic_request_id_field
+
+        return _ListFastCaller(
+            domain=self._domain,
+            auth_token=self._auth_token,
+            is_webhook=self._is_webhook,
+            api_method=self._api_method,
+            params=self._deep_merge(self._params, {
+                "filter": {
+                    f">={request_id_field}": lower_id,
+                    f"<{request_id_field}": upper_id,
+                },
+            }),
+            descending=self._descending,
+            limit=self._limit,
+            bitrix_token=self._bitrix_token,
+            **self._kwargs,
+        )
+
+    def _put_partition_message(self, partition_queue: queue.Queue, message: Tuple, stop_event: threading.Event) -> bool:
+        """Put ``message`` into ``partition_queue`` unless the consumer stopped. Returns ``False`` when stopped."""
+
+        while not stop_event.is_set():
+            with suppress(queue.Full):
+                partition_queue.put(message, timeout=self._PARTITION_QUEUE_TIMEOUT)
+                return True
+
+        return False
+
+    def _walk_partition(
+            self,
+            index: int,
+            partition_caller: "_ListFastCaller",
+            partition_queue: queue.Queue,
+            stop_event: threading.Event,
+    ):
+        """
+        Walk one ID range in a worker thread and hand its items to the consumer page by page.
+
+        Every message is an ``(index, payload)`` pair where payload is a list of
+        items, a raised exception, or ``None`` once the range is exhausted.
+        """
+
+        page: JSONList = []
+
+        try:
+            for item in partition_caller._generate_result():
+                page.append(item)
+
+                if len(page) >= self._MAX_BATCH_SIZE:
+                    if not self._put_partition_message(partition_queue, (index, page), stop_event):
+                        return
+                    page = []
+
+        except Exception as error:  # noqa: BLE001 - re-raised by the consuming thread
+            self._put_partition_message(partition_queue, (index, error), stop_event)
+            return
+
+        if page and not self._put_partition_message(partition_queue, (index, page), stop_event):
+            return
+
+        self._put_partition_message(partition_queue, (index, None), stop_event)
+
+    def _get_partition_message(self, partition_queue: queue.Queue, pending: Set[int], workers: List[Future]) -> Tuple:
+        """
+        Take the next message from ``partition_queue``, checking between waits that walkers are alive.
+
+        Raises:
+            RuntimeError: If a walker of a ``pending`` range has finished without
+                sending its last message.
+        """
+
+        while True:
+            with suppress(queue.Empty):
+                return partition_queue.get(timeout=self._PARTITION_QUEUE_TIMEOUT)
+
+            # Messages are queued before a walker returns, so an empty queue with
+            # a finished walker of a pending range means the walker died.
+            finished = [workers[index] for index in pending if workers[index].done()]
+
+            if finished and partition_queue.empty():
+                error = finished[0].exception()
+
+                if error is not None:
+                    raise error
+
+                raise RuntimeError("Partition walker stopped before its ID range was exhausted")
+
+    def _generate_partition_items(
+            self,
+            partition_queue: queue.Queue,
+            partition_callers: List["_ListFastCaller"],
+            indexes: Iterable[int],
+            workers: List[Future],
+    ) -> JSONGenerator:
+        """Yield items from ``partition_queue`` until the ranges of ``indexes`` are exhausted."""
+
+        pending = set(indexes)
+
+        while pending:
+            index, payload = self._get_partition_message(partition_queue, pending, workers)
+
+            if payload is None:
+                self._add_time(partition_callers[index]._time)
+                pending.discard(index)
+            elif isinstance(payload, Exception):
+                raise payload
+            else:
+                yield from payload
+
+    def _generate_partitioned_result(self) -> JSONGenerator:
+        """
+        Yield items of all ID ranges walked concurrently.
+
+        Ordered mode reads ranges one after another from per-range queues while
+        later ranges are prefetched; unordered mode reads one shared queue.
+        Queues are bounded, so a slow consumer pauses the walkers. Walkers are
+        stopped when the generator is closed or ``limit`` is reached.
+        """
+
+        stop_event = threading.Event()
+        executor: Optional[ThreadPoolExecutor] = None
+
+        try:
+            if self._limit is not None and self._limit <= 0:
+                return
+
+            partition_ranges = self._get_partition_ranges()
+
+            if not partition_ranges:
+                return
+
+            logger = self._config.logger
+
+            if logger.is_enabled_for(logger.DEBUG):
+                logger.debug(
+                    "partition call_list_fast",
+                    context={
+                        "api_method": self._api_method,
+                        "partition_ranges": partition_ranges,
+                    },
+                )
+
+            partition_callers = [
+                self._make_partition_caller(lower_id, upper_id)
+                for lower_id, upper_id in partition_ranges
+            ]
+
+            if self._ordered:
+                partition_queues = [queue.Queue(self._PARTITION_QUEUE_SIZE) for _ in partition_callers]
+            else:
+                partition_queues = [queue.Queue(self._PARTITION_QUEUE_SIZE)] * len(partition_callers)
+
+            executor = ThreadPoolExecutor(max_workers=len(partition_callers), initializer=self._config.bind_to_current_thread)
+
+            workers = [
+                executor.submit(self._walk_partition, index, partition_caller, partition_queues[index], stop_event)
+                for index, partition_caller in enumerate(partition_callers)
+            ]
+
+            if self._ordered:
+                items = (
+                    item
+                    for index, partition_queue in enumerate(partition_queues)
+                    for item in self._generate_partition_items(partition_queue, partition_callers, (index,), workers)
+                )
+            else:
+                items = self._generate_partition_items(partition_queues[0], partition_callers, range(len(partition_callers)), workers)
+
+            for item in items:
+                yield item
+                self._counter += 1
+
+                if self._limit is not None and self._counter >= self._limit:
+                    return
+
+        finally:
+            stop_event.set()
+
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            self._config.logger.debug("finish call_list_fast")
+
     def call(self) -> ListFastResponseData:
         """
         Return a lazy result generator and accumulated timing metadata.
@@ -520,15 +819,25 @@ class _ListFastCaller(BaseCaller):
         consumed.
         """
 
-        self._config.logger.debug(
-            "start call_list_fast",
-            context={
-                "descending": self._descending,
-            },
-        )
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start call_list_fast",
+                context={
+                    "descending": self._descending,
+                    "partitions": self._partitions,
+                    "ordered": self._ordered,
+                },
+            )
+
+        if self._partitions is not None and self._partitions > 1:
+            result = self._generate_partitioned_result()
+        else:
+            result = self._generate_result()
 
         return {
-            "result": self._generate_result(),
+            "result": result,
             "time": self._time,
         }
 
@@ -542,6 +851,8 @@ def call_list_fast(
         params: Optional[JSONDict] = None,
         descending: bool = False,
         limit: Optional[int] = None,
+        partitions: Optional[int] = None,
+        ordered: bool = True,
         timeout: Timeout = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
         bitrix_token: Optional[BitrixTokenProtocol] = None,
@@ -564,6 +875,12 @@ def call_list_fast(
         params: Base method parameters sent to Bitrix.
         descending: Retrieve items in descending ID order when ``True``.
         limit: Maximum number of items to retrieve.
+        partitions: Number of ID ranges walked concurrently. When greater than
+            ``1``, the smallest and largest IDs are fetched first, the ID space
+            is split into up to ``partitions`` ranges, and every range is walked
+            in its own worker thread. ``None`` walks all items sequentially.
+        ordered: Whether a partitioned walk yields items in ID order. Unordered
+            mode yields items as soon as any range returns them.
         timeout: Request timeout in seconds.
         prefer_version: Preferred API version to resolve the method against.
         bitrix_token: Optional token wrapper used by nested execution.
@@ -583,6 +900,8 @@ def call_list_fast(
         params=params,
         descending=descending,
         limit=limit,
+        partitions=partitions,
+        ordered=ordered,
         timeout=timeout,
         prefer_version=prefer_version,
         bitrix_token=bitrix_token,
@@ -2,12 +2,14 @@ from typing import Final, Optional, Text, Union
 
 from ..._constants import MASKED_VALUE
 from ...constants.version import B24APIVersion
-from ...protocols import BitrixTokenProtocol
+from ...protocols import AsyncBitrixTokenProtocol, BitrixTokenProtocol
 from ...utils.types import B24APIVersionLiteral, JSONDict, Timeout
 from ._base_caller import BaseCaller
-from .call import call
+from ._utils import get_empty_time
+from .call import acall, call
 
 __all__ = [
+    "acall_method",
     "call_method",
 ]
 
@@ -98,19 +100,82 @@ class _MethodCaller(BaseCaller):
 
         return self._params | {"auth": self._MASKED_AUTH}
 
+    def _log_start(self):
+        """Log request context before the method call."""
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start call_method",
+                context={
+                    "domain": self._domain,
+                    "is_webhook": self._is_webhook,
+                    "method": self._api_method,
+                    "api_version": self._api_version,
+                    "params": self._get_params_for_log(),
+                },
+            )
+
+    def _log_finish(self, json_response: JSONDict):
+        """Log the parsed response after the method call."""
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish call_method",
+                context={
+                    "json_response": json_response,
+                },
+            )
+
+    def _get_cached_response(self) -> Optional[JSONDict]:
+        """
+        Return a response stored by the configured response cache.
+
+        The cached response gets synthetic zero-duration timing metadata,
+        because no request is sent. Requests with files are never cached.
+        """
+
+        response_cache = self._config.response_cache
+
+        if response_cache is None or self._kwargs.get("files"):
+            return None
+
+        json_response = response_cache.get(self._domain, self._api_method, self._params, api_version=self._api_version)
+
+        if json_response is None:
+            return None
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "cached call_method",
+                context={
+                    "domain": self._domain,
+                    "method": self._api_method,
+                },
+            )
+
+        return json_response | {"time": get_empty_time()}
+
+    def _cache_response(self, json_response: JSONDict):
+        """Offer a successful response to the configured response cache."""
+
+        response_cache = self._config.response_cache
+
+        if response_cache is not None and not self._kwargs.get("files"):
+            response_cache.set(self._domain, self._api_method, self._params, json_response, api_version=self._api_version)
+
     def call(self) -> JSONDict:
         """Execute the configured method request and log request/response context."""
 
-        self._config.logger.debug(
-            "start call_method",
-            context={
-                "domain": self._domain,
-                "is_webhook": self._is_webhook,
-                "method": self._api_method,
-                "api_version": self._api_version,
-                "params": self._get_params_for_log(),
-            },
-        )
+        json_response = self._get_cached_response()
+
+        if json_response is not None:
+            return json_response
+
+        self._log_start()
 
         json_response = call(
             url=self._url,
@@ -118,13 +183,30 @@ class _MethodCaller(BaseCaller):
             **self._kwargs,
         )
 
-        self._config.logger.debug(
-            "finish call_method",
-            context={
-                "json_response": json_response,
-            },
+        self._log_finish(json_response)
+        self._cache_response(json_response)
+
+        return json_response
+
+    async def acall(self) -> JSONDict:
+        """Asynchronously execute the configured method request and log request/response context."""
+
+        json_response = self._get_cached_response()
+
+        if json_response is not None:
+            return json_response
+
+        self._log_start()
+
+        json_response = await acall(
+            url=self._url,
+            params=self._dynamic_params,
+            **self._kwargs,
         )
 
+        self._log_finish(json_response)
+        self._cache_response(json_response)
+
         return json_response
 
 
@@ -174,3 +256,48 @@ def call_method(
         bitrix_token=bitrix_token,
         **kwargs,
     ).call()
+
+
+async def acall_method(
+        *,
+        domain: Text,
+        auth_token: Text,
+        is_webhook: bool,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        bitrix_token: Optional[AsyncBitrixTokenProtocol] = None,
+        **kwargs,
+) -> JSONDict:
+    """
+    Asynchronously call one Bitrix REST API method.
+
+    Asynchronous counterpart of ``call_method`` with the same URL and
+    authentication rules.
+
+    Args:
+        domain: Bitrix24 portal domain.
+        auth_token: OAuth access token or webhook token.
+        is_webhook: Whether ``auth_token`` is a webhook token.
+        api_method: Bitrix REST method name, for example ``crm.deal.add``.
+        params: Method parameters sent to Bitrix.
+        timeout: Request timeout in seconds.
+        prefer_version: Preferred API version to resolve the method against.
+        bitrix_token: Optional high-level token wrapper used by nested calls.
+        **kwargs: Extra requester options, such as retry configuration.
+
+    Returns:
+        Parsed Bitrix response containing method result and timing metadata.
+    """
+    return await _MethodCaller(
+        domain=domain,
+        auth_token=auth_token,
+        is_webhook=is_webhook,
+        api_method=api_method,
+        params=params,
+        timeout=timeout,
+        prefer_version=prefer_version,
+        bitrix_token=bitrix_token,
+        **kwargs,
+    ).acall()
@@ -0,0 +1,82 @@
+import contextlib
+import os
+from pathlib import Path
+from typing import BinaryIO, Optional, Text, Union
+
+from ...utils.types import JSONDict, Number, ProgressCallback, Timeout
+from ..requesters import BitrixAPIUploadRequester
+from ..requesters._utils import MultipartFileStream
+
+__all__ = [
+    "call_upload",
+]
+
+
+def call_upload(
+        url: Text,
+        *,
+        file: Union[Text, "os.PathLike[Text]", BinaryIO],
+        field: Text = "file",
+        filename: Optional[Text] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        timeout: Timeout = None,
+        max_retries: Optional[int] = None,
+        initial_retry_delay: Optional[Number] = None,
+        retry_delay_increment: Optional[Number] = None,
+) -> JSONDict:
+    """
+    Upload a file to a Bitrix upload URL as a streamed multipart form.
+
+    Upload URLs are returned by Bitrix methods such as ``disk.folder.uploadfile``
+    when they are called without file content. The file is read block by block
+    while it is sent, so memory usage does not depend on the file size.
+
+    Args:
+        url: Upload URL returned by Bitrix.
+        file: Path to the file or a binary file object opened for reading. A
+            file object is read from its current position and left open.
+        field: Name of the form field expected by the upload URL.
+        filename: File name sent to Bitrix. Defaults to the base name of the
+            file path.
+        progress_callback: Optional callable receiving the number of bytes
+            sent and the file size after every block.
+        timeout: Request timeout in seconds.
+        max_retries: Maximum retry attempts for transport-level failures.
+            Uploads of non-seekable file objects are never retried.
+        initial_retry_delay: Delay before the first retry, in seconds.
+        retry_delay_increment: Increment added to retry delay after each retry.
+
+    Returns:
+        Parsed JSON response returned by the Bitrix API server.
+
+    Raises:
+        BitrixRequestError: If the HTTP connection cannot be established.
+        BitrixRequestTimeout: If the request times out.
+        ValueError: If no file name is given and none can be derived from
+            the file, or the file size cannot be determined.
+    """
+
+    with contextlib.ExitStack() as exit_stack:
+        if isinstance(file, (str, os.PathLike)):
+            file = exit_stack.enter_context(Path(file).open("rb"))
+
+        if filename is None:
+            name = getattr(file, "name", None)
+            filename = Path(name).name if isinstance(name, str) else ""
+
+            if not filename:
+                raise ValueError("filename must be provided for file objects without a name")
+
+        return BitrixAPIUploadRequester(
+            url,
+            stream=MultipartFileStream(
+                file,
+                field=field,
+                filename=filename,
+                progress_callback=progress_callback,
+            ),
+            timeout=timeout,
+            max_retries=max_retries,
+            initial_retry_delay=initial_retry_delay,
+            retry_delay_increment=retry_delay_increment,
+        ).call()
@@ -0,0 +1,16 @@
+from .api_call_hooks import APICallHooks, APICallObserver, APICallScope, api_call_hooks
+from .api_call_outcome import APICallOutcome
+from .api_call_record import APICallRecord
+from .opentelemetry_observer import OpenTelemetryAPICallObserver
+from .prometheus_observer import PrometheusAPICallObserver
+
+__all__ = [
+    "APICallHooks",
+    "APICallObserver",
+    "APICallOutcome",
+    "APICallRecord",
+    "APICallScope",
+    "OpenTelemetryAPICallObserver",
+    "PrometheusAPICallObserver",
+    "api_call_hooks",
+]
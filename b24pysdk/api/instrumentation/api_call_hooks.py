@@ -0,0 +1,178 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from ..._config import Config
+from .api_call_record import APICallRecord
+
+__all__ = [
+    "APICallHooks",
+    "APICallObserver",
+    "APICallScope",
+    "api_call_hooks",
+]
+
+APICallObserver = Callable[[APICallRecord], Any]
+"""Callable receiving the record of every finished API call."""
+
+
+class APICallScope:
+    """
+    Records of API calls sent while a typed response is being produced.
+
+    The records are held back until the response has been converted, so the
+    conversion time can be added to them before they reach the observers.
+    """
+
+    __slots__ = ("convert_time", "records")
+
+    convert_time: Optional[float]
+    records: List[APICallRecord]
+
+    def __init__(self):
+        self.convert_time = None
+        self.records = []
+
+    def __repr__(self):
+        return f"{type(self).__name__}(records={len(self.records)}, convert_time={self.convert_time})"
+
+
+_current_scope: ContextVar[Optional[APICallScope]] = ContextVar("b24pysdk_api_call_scope", default=None)
+
+
+class APICallHooks:
+    """
+    Process-wide registry of observers of Bitrix24 REST API calls.
+
+    Every REST call sent by requesters, including batch and list calls,
+    produces one :class:`APICallRecord` with its timings, payload sizes,
+    retries, server-reported time and outcome. Finished records are passed to
+    the connected observers in the thread or coroutine that sent the call;
+    errors raised by observers are logged and do not affect the call.
+
+    While no observer is connected, requesters skip creating records and the
+    only per-call cost is the ``enabled`` check.
+    """
+
+    __slots__ = ("_lock", "_observers")
+
+    _lock: threading.Lock
+    _observers: Tuple[APICallObserver, ...]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._observers = ()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(observers={len(self._observers)})"
+
+    @property
+    def enabled(self) -> bool:
+        """Whether at least one observer is connected."""
+        return bool(self._observers)
+
+    @property
+    def observers(self) -> Tuple[APICallObserver, ...]:
+        """Connected observers, in the order they are called."""
+        return self._observers
+
+    def connect(self, observer: APICallObserver) -> APICallObserver:
+        """
+        Connect an observer of API call records.
+
+        Can be used as a decorator. Connecting an observer twice has no effect.
+
+        Args:
+            observer: Callable receiving every finished ``APICallRecord``.
+
+        Returns:
+            The connected observer.
+
+        Raises:
+            TypeError: If ``observer`` is not callable.
+        """
+
+        if not callable(observer):
+            raise TypeError("Observer must be callable")
+
+        with self._lock:
+            if observer not in self._observers:
+                self._observers = (*self._observers, observer)
+
+        return observer
+
+    def disconnect(self, observer: APICallObserver):
+        """Disconnect an observer; unknown observers are ignored."""
+        with self._lock:
+            self._observers = tuple(connected for connected in self._observers if connected != observer)
+
+    def clear(self):
+        """Disconnect all observers."""
+        with self._lock:
+            self._observers = ()
+
+    @contextmanager
+    def collect(self) -> Iterator[APICallScope]:
+        """
+        Hold back records of calls sent inside the block until it exits.
+
+        The SDK uses it around typed responses: the conversion time stored in
+        the yielded scope is added to the last held record, then all records
+        are submitted. Nested blocks pass their records to the enclosing one.
+
+        Yields:
+            Scope collecting the records of the block.
+        """
+
+        scope = APICallScope()
+        token = _current_scope.set(scope)
+
+        try:
+            yield scope
+        finally:
+            _current_scope.reset(token)
+
+            if scope.records and scope.convert_time is not None:
+                scope.records[-1].convert_time = scope.convert_time
+
+            for record in scope.records:
+                self.submit(record)
+
+    def submit(self, record: APICallRecord):
+        """
+        Pass a finished record to the observers.
+
+        Inside a ``collect`` block the record is held back by the block.
+
+        Args:
+            record: Finished API call record.
+        """
+
+        scope = _current_scope.get()
+
+        if scope is not None:
+            scope.records.append(record)
+            return
+
+        for observer in self._observers:
+            self._notify(observer, record)
+
+    @staticmethod
+    def _notify(observer: APICallObserver, record: APICallRecord):
+        """Call an observer, logging instead of raising its errors."""
+
+        try:
+            observer(record)
+        except Exception as error:  # noqa: BLE001 - observer failures must not fail API calls
+            Config().logger.warning(
+                "API call observer failed",
+                context={
+                    "observer": repr(observer),
+                    "error": repr(error),
+                },
+            )
+
+
+api_call_hooks: APICallHooks = APICallHooks()
+"""Registry of API call observers shared by all threads of the process."""
@@ -0,0 +1,14 @@
+from ...utils import enum as _enum
+
+__all__ = [
+    "APICallOutcome",
+]
+
+
+class APICallOutcome(_enum.StrEnum):
+    """Result of an instrumented Bitrix24 REST API call."""
+    SUCCESS = "success"
+    API_ERROR = "api_error"
+    TIMEOUT = "timeout"
+    REQUEST_ERROR = "request_error"
+    ERROR = "error"
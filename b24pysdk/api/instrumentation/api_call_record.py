@@ -0,0 +1,181 @@
+import time
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, Optional, Text
+from urllib.parse import urlsplit
+
+import requests
+from requests.utils import super_len
+
+from ...constants.version import B24APIVersion
+from ...errors import BitrixRequestError, BitrixRequestTimeout, BitrixResponseError
+from ...utils.dataclasses import frozen_dataclass_kwargs
+from ...utils.types import JSONDict
+from .api_call_outcome import APICallOutcome
+
+__all__ = [
+    "APICallRecord",
+]
+
+
+@dataclass(**frozen_dataclass_kwargs(eq=False, frozen=False))
+class APICallRecord:
+    """
+    Measurements of one Bitrix24 REST API call, including all its retried attempts.
+
+    Records are filled in by the SDK while the call is sent and passed to
+    the observers connected to ``api_call_hooks`` once it has finished.
+    Durations are in seconds.
+
+    Attributes:
+        portal: Portal domain the call was sent to.
+        method: REST method name, ``batch`` for batch calls.
+        api_version: REST API version of the endpoint.
+        started_at: Unix time the call started at.
+        duration: Total duration of the call, including retries.
+        attempts: Number of HTTP requests sent.
+        status_code: HTTP status of the last response received.
+        bytes_out: Size of request bodies sent over all attempts.
+        bytes_in: Size of response bodies received over all attempts.
+        rate_limit_wait: Time spent waiting for the configured rate limiter.
+        http_time: Time spent in HTTP requests that received a response,
+            from sending the request to reading the body. It includes
+            connecting and TLS handshakes of new pooled connections, which
+            the HTTP client does not time separately.
+        time_to_headers: Part of ``http_time`` spent before response headers
+            were received, when the HTTP client reports it (synchronous
+            calls only).
+        decode_time: Time spent decoding and validating the last response.
+        convert_time: Time spent converting the response into a typed
+            response object, for calls made through request objects.
+            Requests sending several HTTP calls attribute it to the last one.
+        retry_sleep: Time spent sleeping between retried attempts.
+        server_duration: ``time.duration`` reported by Bitrix24.
+        server_processing: ``time.processing`` reported by Bitrix24.
+        server_operating: ``time.operating`` reported by Bitrix24, the time
+            counted against the method execution limit.
+        outcome: Result of the call.
+        error: Exception raised by the call, if any.
+    """
+
+    _V3_PATH_PREFIX: ClassVar[Text] = "/rest/api/"
+    _V2_METHOD_SUFFIX: ClassVar[Text] = ".json"
+
+    portal: Text
+    method: Text
+    api_version: B24APIVersion = B24APIVersion.V2
+    started_at: float = field(default_factory=time.time)
+    duration: float = 0.0
+    attempts: int = 0
+    status_code: Optional[int] = None
+    bytes_out: int = 0
+    bytes_in: int = 0
+    rate_limit_wait: float = 0.0
+    http_time: float = 0.0
+    time_to_headers: Optional[float] = None
+    decode_time: Optional[float] = None
+    convert_time: Optional[float] = None
+    retry_sleep: float = 0.0
+    server_duration: Optional[float] = None
+    server_processing: Optional[float] = None
+    server_operating: Optional[float] = None
+    outcome: APICallOutcome = APICallOutcome.SUCCESS
+    error: Optional[BaseException] = None
+    _started: float = field(default_factory=time.perf_counter, init=False, repr=False)
+
+    @classmethod
+    def from_url(cls, url: Text) -> "APICallRecord":
+        """
+        Start a record of a call sent to a Bitrix24 REST endpoint.
+
+        Args:
+            url: REST endpoint URL, with or without webhook credentials.
+
+        Returns:
+            Record with the portal, method and API version taken from ``url``.
+        """
+
+        split_url = urlsplit(url)
+        method = split_url.path.rsplit("/", 1)[-1]
+
+        if split_url.path.startswith(cls._V3_PATH_PREFIX):
+            return cls(portal=split_url.netloc, method=method, api_version=B24APIVersion.V3)
+
+        return cls(portal=split_url.netloc, method=method.removesuffix(cls._V2_METHOD_SUFFIX))
+
+    @property
+    def retries(self) -> int:
+        """Number of attempts repeated after the first one."""
+        return max(self.attempts - 1, 0)
+
+    @property
+    def phase_timings(self) -> Dict[Text, float]:
+        """Client-side phase durations that were measured, by phase name."""
+
+        phases = {
+            "rate_limit_wait": self.rate_limit_wait,
+            "http": self.http_time,
+            "time_to_headers": self.time_to_headers,
+            "decode": self.decode_time,
+            "convert": self.convert_time,
+            "retry_sleep": self.retry_sleep,
+        }
+
+        return {phase: value for phase, value in phases.items() if value is not None}
+
+    def add_attempt(self, response: requests.Response, http_time: float, *, bytes_out: Optional[int] = None):
+        """
+        Account an HTTP request that received a response.
+
+        Args:
+            response: Received HTTP response.
+            http_time: Duration of the request.
+            bytes_out: Size of the sent body; taken from the prepared request
+                of ``response`` when omitted.
+        """
+
+        if bytes_out is None:
+            bytes_out = super_len(response.request.body) if response.request is not None and response.request.body is not None else 0
+
+        self.bytes_out += bytes_out
+        self.bytes_in += len(response.content or b"")
+        self.http_time += http_time
+        self.status_code = response.status_code
+
+        if response.elapsed:
+            self.time_to_headers = (self.time_to_headers or 0.0) + response.elapsed.total_seconds()
+
+    def set_server_time(self, json_response: JSONDict):
+        """Copy timings reported by Bitrix24 in the ``time`` field of a response."""
+
+        server_time = json_response.get("time")
+
+        if not isinstance(server_time, dict):
+            return
+
+        self.server_duration = server_time.get("duration")
+        self.server_processing = server_time.get("processing")
+        self.server_operating = server_time.get("operating")
+
+    def finish(self, error: Optional[BaseException] = None):
+        """
+        Complete the record when the call has returned or raised.
+
+        Args:
+            error: Exception raised by the call.
+        """
+
+        self.duration = time.perf_counter() - self._started
+
+        if error is None:
+            return
+
+        self.error = error
+
+        if isinstance(error, BitrixResponseError):
+            self.outcome = APICallOutcome.API_ERROR
+        elif isinstance(error, BitrixRequestTimeout):
+            self.outcome = APICallOutcome.TIMEOUT
+        elif isinstance(error, BitrixRequestError):
+            self.outcome = APICallOutcome.REQUEST_ERROR
+        else:
+            self.outcome = APICallOutcome.ERROR
@@ -0,0 +1,102 @@
+from importlib import import_module
+from typing import Any, Dict, Final, Optional, Text, Union
+
+from ...version import SDK_NAME, SDK_VERSION
+from .api_call_record import APICallRecord
+
+__all__ = [
+    "OpenTelemetryAPICallObserver",
+]
+
+_NANOSECONDS: Final[int] = 1_000_000_000
+
+_AttributeValue = Union[Text, int, float]
+
+
+class OpenTelemetryAPICallObserver:
+    """
+    Observer recording API calls as OpenTelemetry client spans.
+
+    Records reach observers after the call has finished, so spans are
+    created with the start and end time of the call. They are children of the
+    span that was current when the call was sent. Phase timings, payload
+    sizes, retries and server-reported times become span attributes; failed
+    calls get an error status and an exception event.
+    """
+
+    _ATTRIBUTE_PREFIX: Final[Text] = "b24pysdk."
+
+    __slots__ = ("_span_kind", "_status", "_status_code", "_tracer")
+
+    _tracer: Any
+    _span_kind: Any
+    _status: Any
+    _status_code: Any
+
+    def __init__(self, tracer: Optional[Any] = None):
+        """
+        Initialize the observer.
+
+        Args:
+            tracer: OpenTelemetry tracer creating the spans; the tracer of the
+                SDK from the global tracer provider when omitted.
+
+        Raises:
+            ImportError: If ``opentelemetry-api`` is not installed.
+        """
+
+        try:
+            trace = import_module("opentelemetry.trace")
+        except ImportError as error:
+            raise ImportError("OpenTelemetry spans require optional dependency opentelemetry-api. Install b24pysdk[opentelemetry].") from error
+
+        self._tracer = tracer or trace.get_tracer(SDK_NAME, SDK_VERSION)
+        self._span_kind = trace.SpanKind.CLIENT
+        self._status = trace.Status
+        self._status_code = trace.StatusCode
+
+    def __repr__(self):
+        return f"{type(self).__name__}(tracer={self._tracer!r})"
+
+    def _get_attributes(self, record: APICallRecord) -> Dict[Text, _AttributeValue]:
+        """Return span attributes of ``record``, without unknown values."""
+
+        prefix = self._ATTRIBUTE_PREFIX
+
+        attributes = {
+            "server.address": record.portal,
+            "rpc.method": record.method,
+            "http.response.status_code": record.status_code,
+            f"{prefix}api_version": record.api_version.value,
+            f"{prefix}outcome": record.outcome.value,
+            f"{prefix}attempts": record.attempts,
+            f"{prefix}retries": record.retries,
+            f"{prefix}bytes_out": record.bytes_out,
+            f"{prefix}bytes_in": record.bytes_in,
+            f"{prefix}server.duration": record.server_duration,
+            f"{prefix}server.processing": record.server_processing,
+            f"{prefix}server.operating": record.server_operating,
+        }
+
+        for phase, value in record.phase_timings.items():
+            attributes[f"{prefix}phase.{phase}"] = value
+
+        return {name: value for name, value in attributes.items() if value is not None}
+
+    def __call__(self, record: APICallRecord):
+        """Record a finished call as a span."""
+
+        start_time = int(record.started_at * _NANOSECONDS)
+
+        span = self._tracer.start_span(
+            record.method,
+            kind=self._span_kind,
+            attributes=self._get_attributes(record),
+            start_time=start_time,
+        )
+
+        if record.error is not None:
+            span.record_exception(record.error)
+            span.set_status(self._status(self._status_code.ERROR, type(record.error).__name__))
+
+        span.end(end_time=start_time + int(record.duration * _NANOSECONDS))
@@ -0,0 +1,187 @@
+from importlib import import_module
+from typing import Any, Dict, Optional, Sequence, Text, Tuple
+
+from .api_call_record import APICallRecord
+
+__all__ = [
+    "PrometheusAPICallObserver",
+]
+
+
+class PrometheusAPICallObserver:
+    """
+    Observer exporting API call records to Prometheus-style metrics.
+
+    Metrics are objects with the ``prometheus_client`` interface:
+    ``metric.labels(**labels)`` returns a child with ``inc(amount)`` for
+    counters and ``observe(value)`` for histograms. Every metric is labelled
+    with ``method``, ``api_version`` and ``outcome`` (and ``portal`` when
+    ``include_portal`` is set); phase and byte metrics get a ``phase`` and a
+    ``direction`` (``in`` or ``out``) label on top. Metrics left out are not
+    updated.
+
+    ``create`` builds the metrics with ``prometheus_client``::
+
+        api_call_hooks.connect(PrometheusAPICallObserver.create())
+    """
+
+    __slots__ = (
+        "_calls",
+        "_duration",
+        "_include_portal",
+        "_operating",
+        "_payload_bytes",
+        "_phase_duration",
+        "_retries",
+        "_server_processing",
+    )
+
+    _calls: Any
+    _duration: Optional[Any]
+    _phase_duration: Optional[Any]
+    _payload_bytes: Optional[Any]
+    _retries: Optional[Any]
+    _server_processing: Optional[Any]
+    _operating: Optional[Any]
+    _include_portal: bool
+
+    def __init__(
+            self,
+            *,
+            calls: Any,
+            duration: Optional[Any] = None,
+            phase_duration: Optional[Any] = None,
+            payload_bytes: Optional[Any] = None,
+            retries: Optional[Any] = None,
+            server_processing: Optional[Any] = None,
+            operating: Optional[Any] = None,
+            include_portal: bool = False,
+    ):
+        """
+        Initialize the observer with existing metrics.
+
+        Args:
+            calls: Counter of finished calls.
+            duration: Histogram of total call durations, in seconds.
+            phase_duration: Histogram of client-side phase durations, in
+                seconds, labelled with ``phase``.
+            payload_bytes: Counter of request and response body bytes,
+                labelled with ``direction``.
+            retries: Counter of retried attempts.
+            server_processing: Histogram of ``time.processing`` reported by
+                Bitrix24, in seconds.
+            operating: Counter of ``time.operating`` seconds reported by
+                Bitrix24, which count against method execution limits.
+            include_portal: Whether metrics are labelled with the portal
+                domain. Leave it off for applications serving many portals.
+        """
+        self._calls = calls
+        self._duration = duration
+        self._phase_duration = phase_duration
+        self._payload_bytes = payload_bytes
+        self._retries = retries
+        self._server_processing = server_processing
+        self._operating = operating
+        self._include_portal = include_portal
+
+    def __repr__(self):
+        return f"{type(self).__name__}(include_portal={self._include_portal})"
+
+    @staticmethod
+    def get_label_names(include_portal: bool = False) -> Tuple[Text, ...]:
+        """Return the labels every metric of the observer must declare."""
+        return ("portal", "method", "api_version", "outcome") if include_portal else ("method", "api_version", "outcome")
+
+    @classmethod
+    def create(
+            cls,
+            *,
+            namespace: Text = "b24pysdk",
+            registry: Optional[Any] = None,
+            buckets: Optional[Sequence[float]] = None,
+            include_portal: bool = False,
+    ) -> "PrometheusAPICallObserver":
+        """
+        Create the observer together with its ``prometheus_client`` metrics.
+
+        Args:
+            namespace: Prefix of metric names.
+            registry: Collector registry of the metrics, the default registry
+                of ``prometheus_client`` when omitted.
+            buckets: Buckets of duration histograms.
+            include_portal: Whether metrics are labelled with the portal domain.
+
+        Returns:
+            Observer updating the created metrics.
+
+        Raises:
+            ImportError: If ``prometheus_client`` is not installed.
+        """
+
+        try:
+            prometheus_client = import_module("prometheus_client")
+        except ImportError as error:
+            raise ImportError("Prometheus metrics require optional dependency prometheus-client. Install b24pysdk[prometheus].") from error
+
+        counter, histogram = prometheus_client.Counter, prometheus_client.Histogram
+        label_names = cls.get_label_names(include_portal)
+        metric_kwargs: Dict[Text, Any] = {"namespace": namespace}
+        histogram_kwargs: Dict[Text, Any] = {}
+
+        if registry is not None:
+            metric_kwargs["registry"] = registry
+
+        if buckets is not None:
+            histogram_kwargs["buckets"] = buckets
+
+        return cls(
+            calls=counter("api_calls", "Bitrix24 REST API calls.", label_names, **metric_kwargs),
+            duration=histogram("api_call_duration_seconds", "Duration of Bitrix24 REST API calls, including retries.", label_names, **metric_kwargs, **histogram_kwargs),
+            phase_duration=histogram("api_call_phase_duration_seconds", "Duration of phases of Bitrix24 REST API calls.", (*label_names, "phase"), **metric_kwargs, **histogram_kwargs),
+            payload_bytes=counter("api_call_payload_bytes", "Body bytes of Bitrix24 REST API requests and responses.", (*label_names, "direction"), **metric_kwargs),
+            retries=counter("api_call_retries", "Retried attempts of Bitrix24 REST API calls.", label_names, **metric_kwargs),
+            server_processing=histogram("api_call_server_processing_seconds", "Processing time of Bitrix24 REST API calls reported by the server.", label_names, **metric_kwargs, **histogram_kwargs),
+            operating=counter("api_call_operating_seconds", "Operating time of Bitrix24 REST API calls counted against method limits.", label_names, **metric_kwargs),
+            include_portal=include_portal,
+        )
+
+    def _get_labels(self, record: APICallRecord) -> Dict[Text, Text]:
+        """Return the labels of the metrics of ``record``."""
+
+        labels = {
+            "method": record.method,
+            "api_version": str(record.api_version.value),
+            "outcome": str(record.outcome.value),
+        }
+
+        if self._include_portal:
+            labels["portal"] = record.portal
+
+        return labels
+
+    def __call__(self, record: APICallRecord):
+        """Update the metrics with a finished call."""
+
+        labels = self._get_labels(record)
+
+        self._calls.labels(**labels).inc()
+
+        if self._duration is not None:
+            self._duration.labels(**labels).observe(record.duration)
+
+        if self._phase_duration is not None:
+            for phase, value in record.phase_timings.items():
+                self._phase_duration.labels(**labels, phase=phase).observe(value)
+
+        if self._payload_bytes is not None:
+            self._payload_bytes.labels(**labels, direction="out").inc(record.bytes_out)
+            self._payload_bytes.labels(**labels, direction="in").inc(record.bytes_in)
+
+        if self._retries is not None and record.retries:
+            self._retries.labels(**labels).inc(record.retries)
+
+        if self._server_processing is not None and record.server_processing is not None:
+            self._server_processing.labels(**labels).observe(record.server_processing)
+
+        if self._operating is not None and record.server_operating:
+            self._operating.labels(**labels).inc(record.server_operating)
@@ -0,0 +1,15 @@
+from .checkpoint_store import BaseOfflineCheckpointStore, MemoryOfflineCheckpointStore, SQLiteOfflineCheckpointStore
+from .offline_checkpoint import OfflineCheckpoint
+from .offline_consumer_stats import OfflineConsumerStats
+from .offline_event import OfflineEvent
+from .offline_event_consumer import OfflineEventConsumer
+
+__all__ = [
+    "BaseOfflineCheckpointStore",
+    "MemoryOfflineCheckpointStore",
+    "OfflineCheckpoint",
+    "OfflineConsumerStats",
+    "OfflineEvent",
+    "OfflineEventConsumer",
+    "SQLiteOfflineCheckpointStore",
+]
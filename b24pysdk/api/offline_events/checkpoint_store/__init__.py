@@ -0,0 +1,9 @@
+from ._base_store import BaseOfflineCheckpointStore
+from .memory_store import MemoryOfflineCheckpointStore
+from .sqlite_store import SQLiteOfflineCheckpointStore
+
+__all__ = [
+    "BaseOfflineCheckpointStore",
+    "MemoryOfflineCheckpointStore",
+    "SQLiteOfflineCheckpointStore",
+]
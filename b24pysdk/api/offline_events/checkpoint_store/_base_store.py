@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Text
+
+from ..offline_checkpoint import OfflineCheckpoint
+
+__all__ = [
+    "BaseOfflineCheckpointStore",
+]
+
+
+class BaseOfflineCheckpointStore(ABC):
+    """
+    Base class for stores of offline event consumer checkpoints.
+
+    A store keeps the delivery state of every consumer, keyed by a consumer
+    key, and outlives the consumer, so a restarted consumer continues with
+    its process identifier and acknowledges events handled before the stop.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def load(self, key: Text) -> Optional[OfflineCheckpoint]:
+        """
+        Return the checkpoint of a consumer.
+
+        Args:
+            key: Consumer key.
+
+        Returns:
+            Stored checkpoint, or ``None`` when nothing is stored.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, key: Text, checkpoint: OfflineCheckpoint):
+        """
+        Store the checkpoint of a consumer, replacing the previous one.
+
+        Args:
+            key: Consumer key.
+            checkpoint: Checkpoint to store.
+        """
+        raise NotImplementedError
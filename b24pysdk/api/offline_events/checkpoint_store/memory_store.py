@@ -0,0 +1,41 @@
+import threading
+from typing import Dict, Optional, Text
+
+from ..offline_checkpoint import OfflineCheckpoint
+from ._base_store import BaseOfflineCheckpointStore
+
+__all__ = [
+    "MemoryOfflineCheckpointStore",
+]
+
+
+class MemoryOfflineCheckpointStore(BaseOfflineCheckpointStore):
+    """
+    Checkpoint store kept in the memory of the current process.
+
+    Checkpoints are lost when the process exits, so events handled but not
+    acknowledged before a crash are delivered again. It suits tests and
+    handlers that are idempotent anyway.
+    """
+
+    __slots__ = ("_checkpoints", "_lock")
+
+    _checkpoints: Dict[Text, OfflineCheckpoint]
+    _lock: threading.Lock
+
+    def __init__(self):
+        self._checkpoints = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def load(self, key: Text) -> Optional[OfflineCheckpoint]:
+        """Return the checkpoint of a consumer."""
+        with self._lock:
+            return self._checkpoints.get(key)
+
+    def save(self, key: Text, checkpoint: OfflineCheckpoint):
+        """Store the checkpoint of a consumer."""
+        with self._lock:
+            self._checkpoints[key] = checkpoint
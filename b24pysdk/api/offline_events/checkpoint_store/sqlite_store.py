@@ -0,0 +1,104 @@
+import json
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from pathlib import Path
+from typing import Final, Optional, Text, Union
+
+from ....utils.types import Number
+from ..offline_checkpoint import OfflineCheckpoint
+from ._base_store import BaseOfflineCheckpointStore
+
+__all__ = [
+    "SQLiteOfflineCheckpointStore",
+]
+
+
+class SQLiteOfflineCheckpointStore(BaseOfflineCheckpointStore):
+    """
+    Checkpoint store kept in an SQLite file.
+
+    Checkpoints survive restarts, so events handled before a crash are
+    acknowledged instead of being handled again. Every operation opens a
+    short-lived connection, so the store may be used from any thread.
+    """
+
+    _DEFAULT_FILE_NAME: Final[Text] = "b24pysdk-offline-events.sqlite3"
+    _CONNECT_TIMEOUT: Final[Number] = 30
+
+    _CREATE_TABLE_SQL: Final[Text] = (
+        "CREATE TABLE IF NOT EXISTS offline_checkpoints ("
+        "key TEXT PRIMARY KEY, "
+        "process_id TEXT, "
+        "processed_ids TEXT NOT NULL, "
+        "failed_message_ids TEXT NOT NULL)"
+    )
+
+    __slots__ = ("_path",)
+
+    _path: Path
+
+    def __init__(self, path: Optional[Union[Text, os.PathLike]] = None):
+        """
+        Initialize the SQLite store.
+
+        Args:
+            path: Database file. Defaults to ``b24pysdk-offline-events.sqlite3``
+                in the system temporary directory.
+        """
+
+        if path is None:
+            path = Path(tempfile.gettempdir()) / self._DEFAULT_FILE_NAME
+
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(self._CREATE_TABLE_SQL)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(path={str(self._path)!r})"
+
+    @property
+    def path(self) -> Path:
+        """Database file that contains the checkpoints."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database file."""
+        return sqlite3.connect(self._path, timeout=self._CONNECT_TIMEOUT)
+
+    def load(self, key: Text) -> Optional[OfflineCheckpoint]:
+        """Return the checkpoint of a consumer."""
+
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT process_id, processed_ids, failed_message_ids FROM offline_checkpoints WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        process_id, processed_ids, failed_message_ids = row
+
+        return OfflineCheckpoint(
+            process_id=process_id,
+            processed_ids=tuple(json.loads(processed_ids)),
+            failed_message_ids=tuple(json.loads(failed_message_ids)),
+        )
+
+    def save(self, key: Text, checkpoint: OfflineCheckpoint):
+        """Store the checkpoint of a consumer."""
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO offline_checkpoints "
+                "(key, process_id, processed_ids, failed_message_ids) VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    checkpoint.process_id,
+                    json.dumps(checkpoint.processed_ids),
+                    json.dumps(checkpoint.failed_message_ids),
+                ),
+            )
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Optional, Text, Tuple
+
+from ...utils.dataclasses import frozen_dataclass_kwargs
+
+__all__ = [
+    "OfflineCheckpoint",
+]
+
+
+@dataclass(**frozen_dataclass_kwargs())
+class OfflineCheckpoint:
+    """
+    Delivery state of an :class:`OfflineEventConsumer`.
+
+    Events taken from the queue are marked with ``process_id`` until they are
+    cleared, so a restarted consumer that reuses the process identifier gets
+    the events it had not finished again. Events already handled but not yet
+    acknowledged are listed in the checkpoint and acknowledged on restart
+    without being handled a second time.
+
+    Attributes:
+        process_id: Process identifier assigned by ``event.offline.get``.
+        processed_ids: Queue record IDs of handled events waiting for
+            ``event.offline.clear``.
+        failed_message_ids: Message IDs of failed events waiting for
+            ``event.offline.error``.
+    """
+
+    process_id: Optional[Text] = None
+    processed_ids: Tuple[int, ...] = ()
+    failed_message_ids: Tuple[Text, ...] = ()
+
+    @property
+    def has_pending_acks(self) -> bool:
+        """Whether some handled events are not acknowledged yet."""
+        return bool(self.processed_ids or self.failed_message_ids)
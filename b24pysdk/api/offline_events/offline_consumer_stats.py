@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from ...utils.dataclasses import frozen_dataclass_kwargs
+from ...utils.types import Number
+
+__all__ = [
+    "OfflineConsumerStats",
+]
+
+
+@dataclass(**frozen_dataclass_kwargs())
+class OfflineConsumerStats:
+    """
+    Counters of an :class:`OfflineEventConsumer`.
+
+    Attributes:
+        polls: Number of ``event.offline.get`` requests sent.
+        received: Number of events received.
+        processed: Number of events handled successfully and cleared.
+        failed: Number of events whose handler raised an error.
+        limit: Batch size requested by the next poll.
+        elapsed: Seconds passed since the first poll.
+        lag: Age of the oldest event of the last non-empty batch, in seconds,
+            if Bitrix24 reported event timestamps.
+    """
+
+    polls: int = 0
+    received: int = 0
+    processed: int = 0
+    failed: int = 0
+    limit: int = 0
+    elapsed: Number = 0
+    lag: Optional[Number] = None
+
+    @property
+    def throughput(self) -> float:
+        """Events handled per second, successfully or not, since the first poll."""
+        return (self.processed + self.failed) / self.elapsed if self.elapsed > 0 else 0.0
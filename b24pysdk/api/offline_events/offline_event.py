@@ -0,0 +1,55 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Text
+
+from ...utils.converters import datetime_from_bitrix
+from ...utils.dataclasses import frozen_dataclass_kwargs
+from ...utils.types import JSONDict
+
+__all__ = [
+    "OfflineEvent",
+]
+
+
+@dataclass(**frozen_dataclass_kwargs())
+class OfflineEvent:
+    """
+    Event taken from the offline event queue with ``event.offline.get``.
+
+    Attributes:
+        bitrix_id: Identifier of the queue record.
+        message_id: Identifier of the event message, used to report failures
+            with ``event.offline.error``.
+        event_name: Name of the event, e.g. ``ONCRMDEALADD``.
+        event_data: Event payload.
+        event_additional: Additional event data, e.g. the user who caused it.
+        timestamp: Time the event was queued, if reported by Bitrix24.
+    """
+
+    bitrix_id: int
+    message_id: Text
+    event_name: Text
+    event_data: JSONDict = field(default_factory=dict)
+    event_additional: JSONDict = field(default_factory=dict)
+    timestamp: Optional[datetime] = None
+
+    @classmethod
+    def from_dict(cls, event: JSONDict) -> "OfflineEvent":
+        """
+        Build an event from a record of the ``event.offline.get`` result.
+
+        Args:
+            event: Queue record with ``ID``, ``MESSAGE_ID``, ``EVENT_NAME``,
+                ``EVENT_DATA``, ``EVENT_ADDITIONAL`` and ``TIMESTAMP_X`` keys.
+
+        Returns:
+            Parsed offline event.
+        """
+        return cls(
+            bitrix_id=int(event["ID"]),
+            message_id=str(event.get("MESSAGE_ID") or ""),
+            event_name=event.get("EVENT_NAME") or "",
+            event_data=event.get("EVENT_DATA") or {},
+            event_additional=event.get("EVENT_ADDITIONAL") or {},
+            timestamp=datetime_from_bitrix(event.get("TIMESTAMP_X")),
+        )
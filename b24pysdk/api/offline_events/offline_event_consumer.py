@@ -0,0 +1,575 @@
+import asyncio
+import contextlib
+import dataclasses
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, ContextManager, Final, List, Optional, Text, Tuple, Union
+
+from ..._config import Config
+from ...errors import BitrixRequestError
+from ...protocols import BitrixTokenFullProtocol
+from ...utils.types import JSONDict, Number, Timeout
+from .checkpoint_store import BaseOfflineCheckpointStore, MemoryOfflineCheckpointStore
+from .offline_checkpoint import OfflineCheckpoint
+from .offline_consumer_stats import OfflineConsumerStats
+from .offline_event import OfflineEvent
+
+__all__ = [
+    "OfflineEventConsumer",
+]
+
+OfflineEventHandler = Callable[[OfflineEvent], Union[Any, Awaitable[Any]]]
+"""Callable handling one offline event; raising an error marks the event as failed."""
+
+
+class OfflineEventConsumer:
+    """
+    Worker draining the offline event queue of a portal.
+
+    Every poll takes a batch of events with ``event.offline.get`` without
+    removing them from the queue: Bitrix24 marks them with the process
+    identifier of the consumer instead. The events are passed to ``handler``,
+    up to ``max_concurrency`` at the same time, and then acknowledged in one
+    go: handled events are removed with ``event.offline.clear``, events whose
+    handler raised an error are reported with ``event.offline.error``.
+
+    Delivery is at least once. The process identifier and the events waiting
+    for acknowledgement are kept in ``checkpoint_store``; a consumer restarted
+    with the same store and key acknowledges events handled before the stop
+    and gets the events it had not handled again.
+
+    The batch size grows up to ``max_limit`` while full batches are returned
+    and shrinks back to ``limit`` when the backlog is drained. When the queue
+    is empty, polls are delayed by ``idle_delay``, doubled up to
+    ``max_idle_delay`` while the queue stays empty.
+
+    Usage:
+
+        consumer = client.event.offline.consumer(handle_event, max_concurrency=4)
+        consumer.run()
+    """
+
+    DEFAULT_LIMIT: Final[int] = 50
+    """Default number of events requested by one poll."""
+
+    MAX_LIMIT: Final[int] = 1000
+    """Largest number of events Bitrix24 returns by one ``event.offline.get`` request."""
+
+    _GET_METHOD: Final[Text] = "event.offline.get"
+    _CLEAR_METHOD: Final[Text] = "event.offline.clear"
+    _ERROR_METHOD: Final[Text] = "event.offline.error"
+    _STOP_CHECK_INTERVAL: Final[float] = 0.1
+
+    __slots__ = (
+        "_auth_connector",
+        "_bitrix_token",
+        "_checkpoint",
+        "_checkpoint_key",
+        "_checkpoint_store",
+        "_config",
+        "_filter",
+        "_handler",
+        "_idle_delay",
+        "_initial_limit",
+        "_limit",
+        "_max_concurrency",
+        "_max_idle_delay",
+        "_max_limit",
+        "_started_at",
+        "_stats",
+        "_stop_event",
+        "_timeout",
+    )
+
+    _auth_connector: Optional[Text]
+    _bitrix_token: BitrixTokenFullProtocol
+    _checkpoint: Optional[OfflineCheckpoint]
+    _checkpoint_key: Text
+    _checkpoint_store: BaseOfflineCheckpointStore
+    _config: Config
+    _filter: Optional[JSONDict]
+    _handler: OfflineEventHandler
+    _idle_delay: Number
+    _initial_limit: int
+    _limit: int
+    _max_concurrency: int
+    _max_idle_delay: Number
+    _max_limit: int
+    _started_at: Optional[float]
+    _stats: OfflineConsumerStats
+    _stop_event: threading.Event
+    _timeout: Timeout
+
+    def __init__(
+            self,
+            bitrix_token: BitrixTokenFullProtocol,
+            handler: OfflineEventHandler,
+            *,
+            checkpoint_store: Optional[BaseOfflineCheckpointStore] = None,
+            checkpoint_key: Optional[Text] = None,
+            filter: Optional[JSONDict] = None,
+            auth_connector: Optional[Text] = None,
+            limit: int = DEFAULT_LIMIT,
+            max_limit: int = MAX_LIMIT,
+            max_concurrency: int = 1,
+            idle_delay: Number = 1,
+            max_idle_delay: Number = 30,
+            timeout: Timeout = None,
+    ):
+        """
+        Initialize the consumer.
+
+        Args:
+            bitrix_token: Token of the application executing the requests.
+            handler: Callable receiving every event. ``arun`` awaits the
+                value it returns when it is awaitable; ``run`` and ``poll``
+                require a synchronous handler.
+            checkpoint_store: Store of the delivery state. Defaults to a
+                store kept in memory.
+            checkpoint_key: Key of the consumer in ``checkpoint_store``.
+                Defaults to the portal domain of the token.
+            filter: Filter of ``event.offline.get``, e.g. ``{"EVENT_NAME": "ONCRMDEALADD"}``.
+            auth_connector: Connector key whose events are skipped, see ``event.offline.get``.
+            limit: Number of events requested by a poll when there is no backlog.
+            max_limit: Largest number of events requested by a poll.
+            max_concurrency: Maximum number of events handled at the same time.
+            idle_delay: Seconds to wait before polling an empty queue again.
+            max_idle_delay: Largest delay between polls of an empty queue.
+            timeout: Timeout of every request.
+
+        Raises:
+            ValueError: If a batch size, concurrency or delay is invalid.
+        """
+
+        if not (isinstance(max_limit, int) and 1 <= max_limit <= self.MAX_LIMIT):
+            raise ValueError(f"Max_limit must be an integer between 1 and {self.MAX_LIMIT}")
+
+        if not (isinstance(limit, int) and 1 <= limit <= max_limit):
+            raise ValueError("Limit must be an integer between 1 and max_limit")
+
+        if not (isinstance(max_concurrency, int) and max_concurrency >= 1):
+            raise ValueError("Max_concurrency must be a positive integer (>= 1)")
+
+        if not (0 <= idle_delay <= max_idle_delay):
+            raise ValueError("Idle_delay must be non-negative and not greater than max_idle_delay")
+
+        self._config = Config()
+        self._bitrix_token = bitrix_token
+        self._handler = handler
+        self._checkpoint_store = MemoryOfflineCheckpointStore() if checkpoint_store is None else checkpoint_store
+        self._checkpoint_key = getattr(bitrix_token, "domain", "") if checkpoint_key is None else checkpoint_key
+        self._checkpoint = None
+        self._filter = filter
+        self._auth_connector = auth_connector
+        self._initial_limit = limit
+        self._limit = limit
+        self._max_limit = max_limit
+        self._max_concurrency = max_concurrency
+        self._idle_delay = idle_delay
+        self._max_idle_delay = max_idle_delay
+        self._timeout = timeout
+        self._started_at = None
+        self._stats = OfflineConsumerStats(limit=limit)
+        self._stop_event = threading.Event()
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}("
+            f"checkpoint_key={self._checkpoint_key!r}, "
+            f"limit={self._limit}, "
+            f"max_limit={self._max_limit}, "
+            f"max_concurrency={self._max_concurrency})"
+        )
+
+    @property
+    def stats(self) -> OfflineConsumerStats:
+        """Snapshot of the throughput and lag counters."""
+        return dataclasses.replace(self._stats, elapsed=0 if self._started_at is None else time.monotonic() - self._started_at)
+
+    @property
+    def process_id(self) -> Optional[Text]:
+        """Process identifier marking the events taken by the consumer, once assigned by Bitrix24."""
+        return self._load_checkpoint().process_id
+
+    def stop(self):
+        """Ask a running consumer to return after the current poll. Safe to call from any thread."""
+        self._stop_event.set()
+
+    def _load_checkpoint(self) -> OfflineCheckpoint:
+        """Return the checkpoint, loading it from the store on first use."""
+
+        if self._checkpoint is None:
+            self._checkpoint = self._checkpoint_store.load(self._checkpoint_key) or OfflineCheckpoint()
+
+        return self._checkpoint
+
+    def _save_checkpoint(self, **changes):
+        """Apply ``changes`` to the checkpoint and store it."""
+        self._checkpoint = dataclasses.replace(self._load_checkpoint(), **changes)
+        self._checkpoint_store.save(self._checkpoint_key, self._checkpoint)
+
+    def _get_params(self) -> JSONDict:
+        """Build ``event.offline.get`` parameters taking events without removing them."""
+
+        params: JSONDict = {
+            "limit": self._limit,
+            "clear": 0,
+        }
+
+        process_id = self._load_checkpoint().process_id
+
+        if process_id is not None:
+            params["process_id"] = process_id
+
+        if self._filter is not None:
+            params["filter"] = self._filter
+
+        if self._auth_connector is not None:
+            params["auth_connector"] = self._auth_connector
+
+        return params
+
+    @staticmethod
+    def _get_lag(events: List[OfflineEvent]) -> Optional[float]:
+        """Return the age of the oldest event in seconds, if events have timestamps."""
+
+        timestamps = [event.timestamp for event in events if event.timestamp is not None]
+
+        if not timestamps:
+            return None
+
+        oldest = min(timestamps)
+        now = datetime.now(tz=timezone.utc if oldest.tzinfo is not None else None)
+
+        return max((now - oldest).total_seconds(), 0.0)
+
+    def _get_next_limit(self, received: int) -> int:
+        """Grow the batch size while the backlog fills batches, shrink it back when the backlog is drained."""
+
+        if received >= self._limit:
+            return min(self._limit * 2, self._max_limit)
+
+        if received < self._limit // 2:
+            return max(self._limit // 2, self._initial_limit)
+
+        return self._limit
+
+    def _take_events(self, json_response: JSONDict) -> List[OfflineEvent]:
+        """Parse a poll response, remember the process identifier and update the counters."""
+
+        result = json_response.get("result") or {}
+        events = [OfflineEvent.from_dict(event) for event in result.get("events") or []]
+        process_id = result.get("process_id")
+
+        if process_id and process_id != self._load_checkpoint().process_id:
+            self._save_checkpoint(process_id=process_id)
+
+        self._limit = self._get_next_limit(len(events))
+        self._stats = dataclasses.replace(
+            self._stats,
+            polls=self._stats.polls + 1,
+            received=self._stats.received + len(events),
+            limit=self._limit,
+            lag=self._get_lag(events) if events else self._stats.lag,
+        )
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish offline event poll",
+                context={
+                    "process_id": self._load_checkpoint().process_id,
+                    "events": len(events),
+                    "limit": self._limit,
+                },
+            )
+
+        return events
+
+    def _record_results(self, events: List[OfflineEvent], errors: List[Optional[BaseException]]):
+        """Store the outcome of handled events in the checkpoint before they are acknowledged."""
+
+        processed_ids: List[int] = []
+        failed_message_ids: List[Text] = []
+
+        for event, error in zip(events, errors):
+            if error is None:
+                processed_ids.append(event.bitrix_id)
+                continue
+
+            failed_message_ids.append(event.message_id)
+
+            self._config.logger.warning(
+                "Offline event handler failed",
+                context={
+                    "event_id": event.bitrix_id,
+                    "event_name": event.event_name,
+                    "error": repr(error),
+                },
+            )
+
+        checkpoint = self._load_checkpoint()
+
+        self._save_checkpoint(
+            processed_ids=checkpoint.processed_ids + tuple(processed_ids),
+            failed_message_ids=checkpoint.failed_message_ids + tuple(failed_message_ids),
+        )
+
+    def _get_ack_calls(self) -> List[Tuple[Text, JSONDict]]:
+        """Return the requests acknowledging events listed in the checkpoint."""
+
+        checkpoint = self._load_checkpoint()
+        ack_calls: List[Tuple[Text, JSONDict]] = []
+
+        if checkpoint.processed_ids:
+            ack_calls.append((self._CLEAR_METHOD, {"process_id": checkpoint.process_id, "id": list(checkpoint.processed_ids)}))
+
+        if checkpoint.failed_message_ids:
+            ack_calls.append((self._ERROR_METHOD, {"process_id": checkpoint.process_id, "message_id": list(checkpoint.failed_message_ids)}))
+
+        return ack_calls
+
+    def _finish_ack(self):
+        """Count acknowledged events and remove them from the checkpoint."""
+
+        checkpoint = self._load_checkpoint()
+
+        if not checkpoint.has_pending_acks:
+            return
+
+        self._stats = dataclasses.replace(
+            self._stats,
+            processed=self._stats.processed + len(checkpoint.processed_ids),
+            failed=self._stats.failed + len(checkpoint.failed_message_ids),
+        )
+        self._save_checkpoint(processed_ids=(), failed_message_ids=())
+
+    def _mark_started(self):
+        """Start the elapsed time counter on the first poll."""
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+
+    def _check_sync_handler(self):
+        """Reject coroutine function handlers, whose coroutines the synchronous consumer cannot await."""
+        if inspect.iscoroutinefunction(self._handler):
+            raise TypeError("Handler is a coroutine function; use arun or apoll to consume events with it")
+
+    def _handle(self, event: OfflineEvent) -> Optional[BaseException]:
+        """
+        Run the handler for one event and return its error, if any.
+
+        An awaitable returned by the handler cannot be awaited here, so the
+        event is reported as failed instead of being acknowledged unhandled.
+        """
+
+        try:
+            result = self._handler(event)
+        except Exception as error:  # noqa: BLE001 - the event is reported with event.offline.error
+            return error
+
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+
+            return TypeError("Handler returned an awaitable; use arun or apoll to consume events with it")
+
+        return None
+
+    def _acknowledge(self):
+        """Send the acknowledgements listed in the checkpoint."""
+
+        for api_method, params in self._get_ack_calls():
+            self._bitrix_token.call_method(api_method, params, timeout=self._timeout)
+
+        self._finish_ack()
+
+    def _make_executor(self) -> ContextManager[Optional[ThreadPoolExecutor]]:
+        """Return the handler pool, or no pool when events are handled one by one."""
+
+        if self._max_concurrency == 1:
+            return contextlib.nullcontext()
+
+        return ThreadPoolExecutor(max_workers=self._max_concurrency, initializer=self._config.bind_to_current_thread)
+
+    def _poll(self, executor: Optional[ThreadPoolExecutor]) -> int:
+        """Take one batch of events, handle it and acknowledge it."""
+
+        self._mark_started()
+        self._acknowledge()
+
+        events = self._take_events(self._bitrix_token.call_method(self._GET_METHOD, self._get_params(), timeout=self._timeout))
+
+        if events:
+            errors = list(executor.map(self._handle, events)) if executor is not None else [self._handle(event) for event in events]
+            self._record_results(events, errors)
+            self._acknowledge()
+
+        return len(events)
+
+    def poll(self) -> int:
+        """
+        Take one batch of events, handle it and acknowledge it.
+
+        Returns:
+            Number of events received.
+
+        Raises:
+            BitrixAPIError: If a request is rejected by Bitrix24.
+            BitrixRequestError: If a request fails.
+            TypeError: If the handler is a coroutine function.
+        """
+
+        self._check_sync_handler()
+
+        with self._make_executor() as executor:
+            return self._poll(executor)
+
+    def run(self, *, stop_when_idle: bool = False) -> OfflineConsumerStats:
+        """
+        Poll the queue until :meth:`stop` is called.
+
+        Polls that fail with a connection error are repeated after the idle
+        delay; the error is logged. Other errors are raised, and the
+        checkpoint lets a new consumer continue where this one stopped.
+
+        Args:
+            stop_when_idle: Whether to return as soon as the queue is empty,
+                which drains the backlog once.
+
+        Returns:
+            Counters at the moment the consumer stopped.
+
+        Raises:
+            BitrixAPIError: If a request is rejected by Bitrix24.
+            TypeError: If the handler is a coroutine function.
+        """
+
+        self._check_sync_handler()
+        self._stop_event.clear()
+        idle_delay = self._idle_delay
+
+        with self._make_executor() as executor:
+            while not self._stop_event.is_set():
+                try:
+                    received = self._poll(executor)
+
+                except BitrixRequestError as error:
+                    self._config.logger.warning("Offline event poll failed", context={"error": repr(error)})
+
+                else:
+                    if received:
+                        idle_delay = self._idle_delay
+                        continue
+
+                    if stop_when_idle:
+                        break
+
+                self._stop_event.wait(idle_delay)
+                idle_delay = min(idle_delay * 2, self._max_idle_delay)
+
+        return self.stats
+
+    async def _ahandle(self, event: OfflineEvent, semaphore: asyncio.Semaphore) -> Optional[BaseException]:
+        """Run the handler for one event, awaiting its result, and return its error, if any."""
+
+        async with semaphore:
+            try:
+                result = self._handler(event)
+
+                if inspect.isawaitable(result):
+                    await result
+
+            except Exception as error:  # noqa: BLE001 - the event is reported with event.offline.error
+                return error
+
+        return None
+
+    async def _aacknowledge(self):
+        """Send the acknowledgements listed in the checkpoint asynchronously."""
+
+        for api_method, params in self._get_ack_calls():
+            await self._bitrix_token.acall_method(api_method, params, timeout=self._timeout)
+
+        self._finish_ack()
+
+    async def apoll(self) -> int:
+        """
+        Asynchronously take one batch of events, handle it and acknowledge it.
+
+        Returns:
+            Number of events received.
+
+        Raises:
+            BitrixAPIError: If a request is rejected by Bitrix24.
+            BitrixRequestError: If a request fails.
+        """
+
+        self._mark_started()
+        await self._aacknowledge()
+
+        events = self._take_events(await self._bitrix_token.acall_method(self._GET_METHOD, self._get_params(), timeout=self._timeout))
+
+        if events:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            errors = await asyncio.gather(*(self._ahandle(event, semaphore) for event in events))
+            self._record_results(events, list(errors))
+            await self._aacknowledge()
+
+        return len(events)
+
+    async def _await_stop(self, delay: Number):
+        """Sleep for ``delay`` seconds, returning early once :meth:`stop` is called."""
+
+        deadline = time.monotonic() + delay
+
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                break
+
+            await asyncio.sleep(min(remaining, self._STOP_CHECK_INTERVAL))
+
+    async def arun(self, *, stop_when_idle: bool = False) -> OfflineConsumerStats:
+        """
+        Asynchronously poll the queue until :meth:`stop` is called.
+
+        Behaves like :meth:`run`, but handles events as asyncio tasks, so
+        ``handler`` should be a coroutine function.
+
+        Args:
+            stop_when_idle: Whether to return as soon as the queue is empty.
+
+        Returns:
+            Counters at the moment the consumer stopped.
+
+        Raises:
+            BitrixAPIError: If a request is rejected by Bitrix24.
+        """
+
+        self._stop_event.clear()
+        idle_delay = self._idle_delay
+
+        while not self._stop_event.is_set():
+            try:
+                received = await self.apoll()
+
+            except BitrixRequestError as error:
+                self._config.logger.warning("Offline event poll failed", context={"error": repr(error)})
+
+            else:
+                if received:
+                    idle_delay = self._idle_delay
+                    continue
+
+                if stop_when_idle:
+                    break
+
+            await self._await_stop(idle_delay)
+            idle_delay = min(idle_delay * 2, self._max_idle_delay)
+
+        return self.stats
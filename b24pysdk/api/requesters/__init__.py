@@ -1,7 +1,25 @@
 from .bitrix_api_requester import BitrixAPIRequester
+from .bitrix_api_upload_requester import BitrixAPIUploadRequester
+from .bitrix_download_requester import BitrixDownloadRequester
 from .bitrix_oauth_requester import BitrixOAuthRequester
+from .http_session_pool import HTTPSessionPool
+from .json_codecs import BaseJSONCodec, StdlibJSONCodec
+from .rate_limiting import FileRateLimiterBackend, MemoryRateLimiterBackend, RateLimiter
+from .retry_strategies import BaseRetryStrategy, ExponentialBackoffRetryStrategy, LinearRetryStrategy, RetryBudget
 
 __all__ = [
+    "BaseJSONCodec",
+    "BaseRetryStrategy",
     "BitrixAPIRequester",
+    "BitrixAPIUploadRequester",
+    "BitrixDownloadRequester",
     "BitrixOAuthRequester",
+    "ExponentialBackoffRetryStrategy",
+    "FileRateLimiterBackend",
+    "HTTPSessionPool",
+    "LinearRetryStrategy",
+    "MemoryRateLimiterBackend",
+    "RateLimiter",
+    "RetryBudget",
+    "StdlibJSONCodec",
 ]
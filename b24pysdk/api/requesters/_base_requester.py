@@ -1,7 +1,7 @@
+import asyncio
 import os
 import time
 from abc import ABC, abstractmethod
-from http import HTTPStatus
 from typing import Dict, Final, Optional, Text, Tuple
 
 import requests
@@ -13,9 +13,15 @@ except ImportError:
 
 from ..._config import Config
 from ..._constants import DEFAULT_REQUEST_ID_HEADER_NAME, MASKED_VALUE, SDK_USER_AGENT, TEXT_PYTHON_VERSION
+from ...protocols import AsyncHTTPTransportProtocol, JSONCodecProtocol, RetryStrategyProtocol
 from ...utils.types import DefaultTimeout, JSONDict, Number, Timeout
 from ...version import SDK_VERSION
+from ..instrumentation import APICallRecord
 from ._utils import parse_response
+from .http_session_pool import HTTPSessionPool
+from .json_codecs import get_json_codec
+from .retry_strategies import LinearRetryStrategy
+from .transports import get_default_async_transport
 
 __all__ = [
     "BaseRequester",
@@ -27,7 +33,11 @@ class BaseRequester(ABC):
     Base class for Bitrix24 HTTP requesters.
 
     Provides shared configuration, default SDK headers, request ID generation,
-    response parsing, and retry handling for concrete requester implementations.
+    pooled keep-alive HTTP sessions, JSON encoding and response parsing, and
+    retry handling for concrete requester implementations. Retries follow the
+    retry strategy of the SDK configuration (linear retries of HTTP 503
+    responses by default). Asynchronous requests share the same retry policy
+    and are sent through the configured async HTTP transport.
     """
 
     _DEFAULT_REQUEST_ID_HEADER_NAME: Final[Text] = DEFAULT_REQUEST_ID_HEADER_NAME
@@ -35,6 +45,7 @@ class BaseRequester(ABC):
     _SDK_USER_AGENT: Final[Text] = SDK_USER_AGENT
     _TEXT_PYTHON_VERSION: Final[Text] = TEXT_PYTHON_VERSION
     _MASKED_VALUE: Final[Text] = MASKED_VALUE
+    _DEFAULT_RETRY_STRATEGY: Final[RetryStrategyProtocol] = LinearRetryStrategy()
 
     _KEY_NAME_VARIANTS: Final[Tuple[Text, ...]] = (
         "REQUEST_ID",
@@ -43,18 +54,18 @@ class BaseRequester(ABC):
     )
 
     __slots__ = (
+        "_call_record",
         "_config",
         "_initial_retry_delay",
         "_max_retries",
-        "_retries_remaining",
         "_retry_delay_increment",
         "_timeout",
     )
 
+    _call_record: Optional[APICallRecord]
     _config: Config
     _initial_retry_delay: Number
     _max_retries: int
-    _retries_remaining: int
     _retry_delay_increment: Number
     _timeout: DefaultTimeout
 
@@ -79,10 +90,10 @@ class BaseRequester(ABC):
             retry_delay_increment: Additional delay added after each used retry.
                 Falsy values fall back to the global SDK default increment.
         """
+        self._call_record = None
         self._config = Config()
         self._timeout = timeout or self._config.default_timeout
         self._max_retries = max_retries or self._config.default_max_retries
-        self._retries_remaining = self._max_retries
         self._initial_retry_delay = initial_retry_delay or self._config.default_initial_retry_delay
         self._retry_delay_increment = retry_delay_increment or self._config.default_retry_delay_increment
 
@@ -109,86 +120,224 @@ class BaseRequester(ABC):
             self._DEFAULT_REQUEST_ID_HEADER_NAME: self.get_request_id(),
         }
 
+    @staticmethod
+    def _get_session(url: Text) -> requests.Session:
+        """
+        Return the pooled keep-alive session for the origin of ``url``.
+
+        Args:
+            url: Absolute URL of the upcoming request.
+
+        Returns:
+            Session shared by all requesters of the current thread that send
+            requests to the same portal domain or OAuth server.
+        """
+        return HTTPSessionPool().get_session(url)
+
+    def _get_async_transport(self) -> AsyncHTTPTransportProtocol:
+        """
+        Return the async HTTP transport of the current thread configuration.
+
+        When no transport is configured, a transport for the first installed
+        backend is created and stored in the configuration, so all async
+        requesters of the thread share one connection pool.
+        """
+
+        async_transport = self._config.async_transport
+
+        if async_transport is None:
+            async_transport = get_default_async_transport()
+            self._config.async_transport = async_transport
+
+        return async_transport
+
+    @property
+    def _json_codec(self) -> JSONCodecProtocol:
+        """Return the JSON codec of the current thread configuration."""
+        return get_json_codec()
+
     @abstractmethod
     def _request(self, *args, **kwargs) -> requests.Response:
         """Execute a single HTTP request without retry/error wrapping."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def _arequest(self, *args, **kwargs) -> requests.Response:
+        """Asynchronously execute a single HTTP request without retry/error wrapping."""
+        raise NotImplementedError
+
     @classmethod
     def _parse_response(cls, response: requests.Response) -> JSONDict:
         """
         Parse and validate a Bitrix24 HTTP response.
 
+        The body is decoded by the JSON codec of the current thread
+        configuration.
+
         Args:
             response: Raw HTTP response returned by ``requests``.
 
         Returns:
             Parsed JSON-compatible response dictionary.
         """
-        return parse_response(response)
+        return parse_response(response, json_codec=get_json_codec())
 
     @property
-    def _used_retries(self) -> int:
-        """Amount of retries already used."""
-        return self._max_retries - self._retries_remaining
+    def _retry_strategy(self) -> RetryStrategyProtocol:
+        """Return the configured retry strategy, or the default linear strategy."""
+        return self._config.retry_strategy or self._DEFAULT_RETRY_STRATEGY
 
-    @property
-    def _retry_timeout(self) -> float:
+    def _get_retry_url(self, *args, **kwargs) -> Optional[Text]:  # noqa: ARG002
+        """Return the URL of the request sent with ``args`` and ``kwargs``, if known."""
+        return kwargs.get("url")
+
+    def _get_retry_delay(
+            self,
+            url: Optional[Text],
+            attempt: int,
+            *,
+            response: Optional[requests.Response] = None,
+            error: Optional[Exception] = None,
+    ) -> Optional[Number]:
         """
-        Calculate delay before the next retry.
+        Ask the retry strategy whether a request attempt should be repeated.
+
+        Args:
+            url: Absolute URL of the request, when known.
+            attempt: Number of attempts made so far, starting with 1.
+            response: HTTP response of the last attempt, if one was received.
+            error: Transport error raised by the last attempt.
 
         Returns:
-            Number of seconds to sleep before the next request attempt.
+            Number of seconds to sleep before the next attempt, or ``None``
+            when the response should be returned or the error re-raised.
         """
-        return self._initial_retry_delay + self._used_retries * self._retry_delay_increment
+
+        retry_delay = self._retry_strategy.get_retry_delay(
+            url=url,
+            attempt=attempt,
+            max_retries=self._max_retries,
+            initial_retry_delay=self._initial_retry_delay,
+            retry_delay_increment=self._retry_delay_increment,
+            response=response,
+            error=error,
+        )
+
+        if retry_delay is None:
+            return None
+
+        self._config.logger.warning(
+            "Request attempt failed, retrying",
+            context={
+                "URL": self._get_url_for_log(url) if url else None,
+                "status_code": response.status_code if response is not None else None,
+                "error": repr(error) if error is not None else None,
+                "attempt": attempt,
+                "max_retries": self._max_retries,
+            },
+        )
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.INFO):
+            logger.info(
+                "Sleep before retry",
+                context={
+                    "sleep_time": retry_delay,
+                },
+            )
+
+        return retry_delay
 
     def _request_with_retries(self, *args, **kwargs) -> requests.Response:
         """
-        Execute request with retry handling for temporary service unavailability.
+        Execute request with retry handling.
 
-        Retries are performed only for HTTP 503 responses. Other responses are
-        returned immediately and parsed by higher-level code.
+        After every attempt the retry strategy decides whether the received
+        response or the raised transport error should be retried. Other
+        responses are returned immediately and parsed by higher-level code.
+        Attempts and retry sleeps are added to the record of an instrumented
+        call.
 
         Returns:
             HTTP response from the last request attempt.
 
         Raises:
-            RuntimeError: If all retry attempts are exhausted without receiving
-                a response that should be returned to the caller.
-        """
-
-        self._retries_remaining = self._max_retries
-
-        while self._retries_remaining > 0:
-
-            self._retries_remaining -= 1
-            response = self._request(*args, **kwargs)
-
-            if self._retries_remaining and response.status_code == HTTPStatus.SERVICE_UNAVAILABLE:
-                self._config.logger.warning(
-                    "Service unavailable!",
-                    context={
-                        "URL": self._get_url_for_log(response.url),
-                        "retry_count": self._used_retries,
-                        "max_retries": self._max_retries,
-                        "retries_remaining": self._retries_remaining,
-                    },
-                )
-                self._config.logger.info(
-                    "Sleep before retry",
-                    context={
-                        "sleep_time": self._retry_timeout,
-                    },
-                )
-                time.sleep(self._retry_timeout)
-                continue
-
-            return response
-
-        raise RuntimeError(
-            f"Request failed after {self._max_retries} attempts. "
-            "No valid response was received from the server.",
-        )
+            requests.RequestException: If the last attempt failed with a
+                transport error that is not retried.
+        """
+
+        url = self._get_retry_url(*args, **kwargs)
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if self._call_record is not None:
+                self._call_record.attempts = attempt
+
+            try:
+                response = self._request(*args, **kwargs)
+
+            except requests.RequestException as error:
+                retry_delay = self._get_retry_delay(url, attempt, error=error)
+
+                if retry_delay is None:
+                    raise
+
+            else:
+                retry_delay = self._get_retry_delay(url, attempt, response=response)
+
+                if retry_delay is None:
+                    return response
+
+            if self._call_record is not None:
+                self._call_record.retry_sleep += retry_delay
+
+            time.sleep(retry_delay)
+
+    async def _arequest_with_retries(self, *args, **kwargs) -> requests.Response:
+        """
+        Asynchronous counterpart of ``_request_with_retries``.
+
+        Waits between attempts with ``asyncio.sleep`` so the event loop is not
+        blocked.
+
+        Returns:
+            HTTP response from the last request attempt.
+
+        Raises:
+            requests.RequestException: If the last attempt failed with a
+                transport error that is not retried.
+        """
+
+        url = self._get_retry_url(*args, **kwargs)
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if self._call_record is not None:
+                self._call_record.attempts = attempt
+
+            try:
+                response = await self._arequest(*args, **kwargs)
+
+            except requests.RequestException as error:
+                retry_delay = self._get_retry_delay(url, attempt, error=error)
+
+                if retry_delay is None:
+                    raise
+
+            else:
+                retry_delay = self._get_retry_delay(url, attempt, response=response)
+
+                if retry_delay is None:
+                    return response
+
+            if self._call_record is not None:
+                self._call_record.retry_sleep += retry_delay
+
+            await asyncio.sleep(retry_delay)
 
     def _find_exists(self) -> Optional[Text]:
         """Find an existing request ID in environment variables."""
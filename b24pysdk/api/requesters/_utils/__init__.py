@@ -1,5 +1,7 @@
+from .multipart_file_stream import MultipartFileStream
 from .parse_response import parse_response
 
 __all__ = [
+    "MultipartFileStream",
     "parse_response",
 ]
@@ -0,0 +1,219 @@
+"""
+Streaming ``multipart/form-data`` request body with a single file field.
+
+``requests`` builds multipart bodies passed through ``files=`` in memory as a
+whole. ``MultipartFileStream`` produces the same body lazily from an open
+binary file, so uploads of large files use a constant amount of memory.
+"""
+
+import io
+import os
+import uuid
+from typing import BinaryIO, Final, Iterator, List, Optional, Text
+
+from ....utils.types import ProgressCallback
+
+__all__ = [
+    "MultipartFileStream",
+]
+
+
+class MultipartFileStream:
+    """
+    File-like ``multipart/form-data`` body containing one file field.
+
+    The body consists of the part header, the file content read from the
+    current position of the file, and the closing boundary. It exposes
+    ``read`` and ``__len__``, so ``requests`` sends it with a
+    ``Content-Length`` header and reads it block by block.
+    """
+
+    CHUNK_SIZE: Final[int] = 1 << 16
+    """Size of blocks yielded by iteration, in bytes."""
+
+    __slots__ = (
+        "_boundary",
+        "_file",
+        "_file_size",
+        "_head",
+        "_position",
+        "_progress_callback",
+        "_start",
+        "_tail",
+    )
+
+    _boundary: Text
+    _file: BinaryIO
+    _file_size: int
+    _head: bytes
+    _position: int
+    _progress_callback: Optional[ProgressCallback]
+    _start: Optional[int]
+    _tail: bytes
+
+    def __init__(
+            self,
+            file: BinaryIO,
+            *,
+            field: Text,
+            filename: Text,
+            content_type: Text = "application/octet-stream",
+            progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """
+        Initialize a multipart body.
+
+        Args:
+            file: Binary file opened for reading. The content is read from its
+                current position to the end.
+            field: Name of the form field holding the file.
+            filename: File name sent in the part header.
+            content_type: Content type of the file part.
+            progress_callback: Optional callable receiving the number of file
+                bytes sent and the file size after every block.
+
+        Raises:
+            ValueError: If the size of the file cannot be determined.
+        """
+
+        self._file = file
+        self._start = file.tell() if file.seekable() else None
+        self._file_size = self._get_file_size(file, self._start)
+        self._boundary = uuid.uuid4().hex
+        self._head = (
+            f"--{self._boundary}\r\n"
+            f'Content-Disposition: form-data; name="{self._quote(field)}"; filename="{self._quote(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n"
+            f"\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self._boundary}--\r\n".encode()
+        self._position = 0
+        self._progress_callback = progress_callback
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(file={self._file!r}, file_size={self._file_size})"
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.CHUNK_SIZE)
+
+            if not chunk:
+                return
+
+            yield chunk
+
+    def __len__(self) -> int:
+        return len(self._head) + self._file_size + len(self._tail)
+
+    @staticmethod
+    def _get_file_size(file: BinaryIO, start: Optional[int]) -> int:
+        """
+        Determine the number of bytes left in the file.
+
+        Args:
+            file: Binary file opened for reading.
+            start: Current position of a seekable file, ``None`` otherwise.
+
+        Returns:
+            Number of bytes between the current position and the end of file.
+
+        Raises:
+            ValueError: If the file is neither seekable nor backed by a
+                regular file descriptor.
+        """
+
+        if start is not None:
+            end = file.seek(0, io.SEEK_END)
+            file.seek(start)
+            return end - start
+
+        try:
+            return os.fstat(file.fileno()).st_size
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            raise ValueError("file must be seekable or have a known size to be uploaded") from None
+
+    @staticmethod
+    def _quote(value: Text) -> Text:
+        """Escape characters that would break a quoted multipart header parameter."""
+        return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+    @property
+    def content_type(self) -> Text:
+        """Value of the ``Content-Type`` header for the body."""
+        return f"multipart/form-data; boundary={self._boundary}"
+
+    @property
+    def file_size(self) -> int:
+        """Size of the uploaded file content, in bytes."""
+        return self._file_size
+
+    @property
+    def rewindable(self) -> bool:
+        """Whether the body can be sent again, i.e. the file is seekable."""
+        return self._start is not None
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """
+        Read the next part of the body.
+
+        Args:
+            size: Maximum number of bytes to read. Negative values and
+                ``None`` read the rest of the body.
+
+        Returns:
+            Body bytes, empty once the body is exhausted.
+
+        Raises:
+            ValueError: If the file ends before its declared size.
+        """
+
+        head_size = len(self._head)
+        file_end = head_size + self._file_size
+        remaining = len(self) - self._position
+
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+
+        chunks: List[bytes] = []
+
+        while size > 0:
+            position = self._position
+
+            if position < head_size:
+                chunk = self._head[position:position + size]
+
+            elif position < file_end:
+                chunk = self._file.read(min(size, file_end - position))
+
+                if not chunk:
+                    raise ValueError("file ended before its declared size was read")
+
+                if self._progress_callback is not None:
+                    self._progress_callback(position + len(chunk) - head_size, self._file_size)
+
+            else:
+                chunk = self._tail[position - file_end:position - file_end + size]
+
+            chunks.append(chunk)
+            self._position += len(chunk)
+            size -= len(chunk)
+
+        return b"".join(chunks)
+
+    def rewind(self):
+        """
+        Prepare the body to be sent again from the beginning.
+
+        Raises:
+            io.UnsupportedOperation: If part of a non-seekable file was
+                already read.
+        """
+
+        if self._position == 0:
+            return
+
+        if self._start is None:
+            raise io.UnsupportedOperation("multipart body of a non-seekable file cannot be sent again")
+
+        self._file.seek(self._start)
+        self._position = 0
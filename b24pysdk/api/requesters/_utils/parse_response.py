@@ -8,14 +8,15 @@ Both legacy Bitrix REST API error formats and the newer Bitrix REST API v3
 error format are supported.
 """
 
-from typing import Dict, NoReturn, Text, Type
+from typing import Any, Dict, NoReturn, Optional, Text, Type
 
 import requests
-from requests.exceptions import HTTPError, JSONDecodeError
+from requests.exceptions import HTTPError
 
 from .... import errors
 from ....errors import oauth as errors_oauth
 from ....errors import v3 as errors_v3
+from ....protocols import JSONCodecProtocol
 from ....utils.types import JSONDict
 
 __all__ = [
@@ -131,7 +132,31 @@ SDK exception class.
 """
 
 
-def _raise_http_error(response: requests.Response) -> NoReturn:
+def _decode_json(response: requests.Response, json_codec: Optional[JSONCodecProtocol]) -> Any:
+    """
+    Decode the response body as JSON.
+
+    Parameters
+    ----------
+    response : requests.Response
+        HTTP response returned by the API.
+
+    json_codec : JSONCodecProtocol, optional
+        Codec decoding the raw body; ``requests`` decodes it when omitted.
+
+    Raises
+    ------
+    ValueError
+        Raised when the response body is not a valid JSON document.
+    """
+
+    if json_codec is None:
+        return response.json()
+
+    return json_codec.decode(response.content)
+
+
+def _raise_http_error(response: requests.Response, json_response: JSONDict) -> NoReturn:
     """
     Raise a `requests.HTTPError` based on the API error payload.
 
@@ -143,9 +168,12 @@ def _raise_http_error(response: requests.Response) -> NoReturn:
     ----------
     response : requests.Response
         HTTP response returned by the API.
+
+    json_response : JSONDict
+        Decoded response body.
     """
 
-    error_payload = response.json()["error"]
+    error_payload = json_response["error"]
     error = error_payload.get("code") if isinstance(error_payload, dict) else error_payload
 
     raise HTTPError(
@@ -154,7 +182,7 @@ def _raise_http_error(response: requests.Response) -> NoReturn:
     )
 
 
-def parse_response(response: requests.Response) -> JSONDict:
+def parse_response(response: requests.Response, json_codec: Optional[JSONCodecProtocol] = None) -> JSONDict:
     """
     Parse a Bitrix API HTTP response.
 
@@ -179,6 +207,10 @@ def parse_response(response: requests.Response) -> JSONDict:
     response : requests.Response
         HTTP response returned by the Bitrix API.
 
+    json_codec : JSONCodecProtocol, optional
+        Codec decoding the raw response body. When omitted, the body is
+        decoded by ``requests``.
+
     Returns
     -------
     JSONDict
@@ -196,8 +228,8 @@ def parse_response(response: requests.Response) -> JSONDict:
     """
 
     try:
-        json_response = response.json()
-    except JSONDecodeError as error:
+        json_response = _decode_json(response, json_codec)
+    except ValueError as error:
         exception_class = (
                 _EXCEPTIONS_BY_JSON_DECODE_RESPONSE_STATUS_CODE.get(response.status_code)
                 or errors.BitrixResponseJSONDecodeError
@@ -208,7 +240,7 @@ def parse_response(response: requests.Response) -> JSONDict:
         response.raise_for_status()
 
         if "error" in json_response:
-            _raise_http_error(response)
+            _raise_http_error(response, json_response)
 
     except HTTPError as error:
         error_payload = json_response.get("error")
@@ -1,10 +1,14 @@
+import asyncio
 import re
-from typing import IO, Dict, Final, Optional, Text, Tuple
+import time
+from contextlib import contextmanager
+from typing import IO, Dict, Final, Iterator, Optional, Text, Tuple
 
 import requests
 
-from ...errors import BitrixRequestError, BitrixRequestTimeout
+from ...errors import BitrixAPIError, BitrixRequestError, BitrixRequestTimeout
 from ...utils.types import JSONDict, Number, Timeout
+from ..instrumentation import APICallRecord, api_call_hooks
 from ._base_requester import BaseRequester
 
 __all__ = [
@@ -17,7 +21,12 @@ class BitrixAPIRequester(BaseRequester):
     Requester for Bitrix24 REST API calls.
 
     Sends JSON POST requests to prepared Bitrix24 REST URLs and converts
-    transport-level failures into SDK request exceptions.
+    transport-level failures into SDK request exceptions. Requests can be
+    sent either synchronously through pooled ``requests`` sessions or
+    asynchronously through the configured async HTTP transport. When a rate
+    limiter is configured, every request attempt waits for its slot first.
+    While observers are connected to ``api_call_hooks``, every call is
+    measured and reported to them as an ``APICallRecord``.
     """
 
     _ALLOW_REDIRECTS: Final[bool] = False
@@ -47,7 +56,7 @@ class BitrixAPIRequester(BaseRequester):
         Args:
             url: Prepared Bitrix24 REST API endpoint URL.
             params: JSON-compatible request body parameters.
-            files: Optional files passed to ``requests.post``.
+            files: Optional files attached to the multipart POST request.
             timeout: Request timeout.
             max_retries: Maximum number of request attempts.
             initial_retry_delay: Delay before the first retry.
@@ -68,6 +77,10 @@ class BitrixAPIRequester(BaseRequester):
         """Return default SDK headers extended with JSON content type."""
         return self._get_default_headers() | self._HEADERS
 
+    def _get_retry_url(self, *args, **kwargs) -> Text:  # noqa: ARG002
+        """Return the REST endpoint URL of the requester."""
+        return self._url
+
     def _get_url_for_log(self, url: Text) -> Text:
         """Return Bitrix24 REST URL prepared for logging."""
 
@@ -80,39 +93,160 @@ class BitrixAPIRequester(BaseRequester):
             count=1,
         )
 
+    def _get_rate_limit_delay(self) -> float:
+        """
+        Reserve a slot in the configured rate limiter.
+
+        Returns:
+            Number of seconds to wait before sending the request, ``0`` when
+            rate limiting is disabled.
+        """
+
+        rate_limiter = self._config.rate_limiter
+
+        if rate_limiter is None:
+            return 0
+
+        delay = rate_limiter.reserve(self._url, self._params)
+
+        if delay > 0:
+            if self._call_record is not None:
+                self._call_record.rate_limit_wait += delay
+
+            logger = self._config.logger
+
+            if logger.is_enabled_for(logger.INFO):
+                logger.info(
+                    "Sleep before request to respect rate limit",
+                    context={
+                        "URL": self._get_url_for_log(self._url),
+                        "sleep_time": delay,
+                    },
+                )
+
+        return delay
+
     def _request(self) -> requests.Response:
         """
         Execute one raw Bitrix24 REST API POST request.
 
+        The request is sent through the pooled keep-alive session of the
+        portal domain. JSON bodies are serialized by the configured JSON codec;
+        requests with files are sent as multipart forms by ``requests``.
+
         Returns:
             Raw HTTP response returned by ``requests``.
         """
 
-        self._config.logger.debug(
-            "start bitrix_api_request",
-            context={
-                "method": "POST",
-                "URL": self._get_url_for_log(self._url),
-                "timeout": self._timeout,
-            },
-        )
+        delay = self._get_rate_limit_delay()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start bitrix_api_request",
+                context={
+                    "method": "POST",
+                    "URL": self._get_url_for_log(self._url),
+                    "timeout": self._timeout,
+                },
+            )
+
+        if self._files or self._params is None:
+            body = dict(json=self._params, files=self._files)
+        else:
+            body = dict(data=self._json_codec.encode(self._params))
 
-        response = requests.post(
+        started = time.perf_counter()
+
+        response = self._get_session(self._url).post(
             url=self._url,
-            json=self._params,
             headers=self._headers,
-            files=self._files,
             timeout=self._timeout,
             allow_redirects=self._ALLOW_REDIRECTS,
+            **body,
         )
 
-        self._config.logger.debug(
-            "finish bitrix_api_request",
-            context={
-                "response": str(response),
-            },
+        if self._call_record is not None:
+            self._call_record.add_attempt(response, time.perf_counter() - started)
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish bitrix_api_request",
+                context={
+                    "response": str(response),
+                },
+            )
+
+        return response
+
+    async def _arequest(self) -> requests.Response:
+        """
+        Asynchronously execute one raw Bitrix24 REST API POST request.
+
+        The request is sent through the async HTTP transport of the current
+        SDK configuration. JSON bodies are serialized by the configured JSON
+        codec, as in synchronous requests.
+
+        Returns:
+            Raw HTTP response converted to ``requests.Response``.
+
+        Raises:
+            TypeError: If files are attached to the request, because async
+                transports send JSON bodies only.
+        """
+
+        if self._files:
+            raise TypeError("File uploads are not supported by asynchronous Bitrix API requests!")
+
+        delay = self._get_rate_limit_delay()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start async bitrix_api_request",
+                context={
+                    "method": "POST",
+                    "URL": self._get_url_for_log(self._url),
+                    "timeout": self._timeout,
+                },
+            )
+
+        body = None if self._params is None else self._json_codec.encode(self._params)
+
+        started = time.perf_counter()
+
+        response = await self._get_async_transport().request(
+            "POST",
+            self._url,
+            data=body,
+            headers=self._headers,
+            timeout=self._timeout,
+            allow_redirects=self._ALLOW_REDIRECTS,
         )
 
+        if self._call_record is not None:
+            self._call_record.add_attempt(
+                response,
+                time.perf_counter() - started,
+                bytes_out=0 if body is None else len(body),
+            )
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish async bitrix_api_request",
+                context={
+                    "response": str(response),
+                },
+            )
+
         return response
 
     def _post(self) -> requests.Response:
@@ -137,6 +271,90 @@ class BitrixAPIRequester(BaseRequester):
         except requests.RequestException as error:
             raise BitrixRequestError(original_error=error) from error
 
+    async def _apost(self) -> requests.Response:
+        """
+        Asynchronously send a POST request to the Bitrix24 REST endpoint.
+
+        Returns:
+            Raw HTTP response returned by the server.
+
+        Raises:
+            BitrixRequestTimeout: If the request times out.
+            BitrixRequestError: If the transport fails before receiving a
+                valid HTTP response.
+        """
+
+        try:
+            return await self._arequest_with_retries()
+
+        except requests.Timeout as error:
+            raise BitrixRequestTimeout(timeout=self._timeout, original_error=error) from error
+
+        except requests.RequestException as error:
+            raise BitrixRequestError(original_error=error) from error
+
+    def _parse_and_record_response(self, response: requests.Response) -> JSONDict:
+        """
+        Parse the Bitrix24 response and report it to the configured rate limiter.
+
+        Args:
+            response: Raw HTTP response returned by the server.
+
+        Returns:
+            Parsed JSON-compatible response dictionary.
+        """
+
+        rate_limiter = self._config.rate_limiter
+
+        if rate_limiter is None:
+            return self._parse_response(response)
+
+        try:
+            json_response = self._parse_response(response)
+        except BitrixAPIError as error:
+            rate_limiter.record_error(self._url, self._params, error)
+            raise
+
+        rate_limiter.record_response(self._url, self._params, json_response)
+
+        return json_response
+
+    @contextmanager
+    def _record_call(self) -> Iterator[APICallRecord]:
+        """
+        Measure the call and submit its record to ``api_call_hooks`` when it finishes.
+
+        Yields:
+            Record filled in by the request attempts of the call.
+        """
+
+        record = self._call_record = APICallRecord.from_url(self._url)
+
+        try:
+            yield record
+        except BaseException as error:
+            record.finish(error)
+            raise
+        else:
+            record.finish()
+        finally:
+            self._call_record = None
+            api_call_hooks.submit(record)
+
+    def _parse_recorded_response(self, response: requests.Response, record: APICallRecord) -> JSONDict:
+        """Parse the response of an instrumented call, recording decode and server timings."""
+
+        started = time.perf_counter()
+
+        try:
+            json_response = self._parse_and_record_response(response)
+        finally:
+            record.decode_time = time.perf_counter() - started
+
+        record.set_server_time(json_response)
+
+        return json_response
+
     def call(self) -> JSONDict:
         """
         Execute the request and parse the Bitrix24 response.
@@ -144,4 +362,23 @@ class BitrixAPIRequester(BaseRequester):
         Returns:
             Parsed JSON-compatible response dictionary.
         """
-        return self._parse_response(self._post())
+
+        if not api_call_hooks.enabled:
+            return self._parse_and_record_response(self._post())
+
+        with self._record_call() as record:
+            return self._parse_recorded_response(self._post(), record)
+
+    async def acall(self) -> JSONDict:
+        """
+        Asynchronously execute the request and parse the Bitrix24 response.
+
+        Returns:
+            Parsed JSON-compatible response dictionary.
+        """
+
+        if not api_call_hooks.enabled:
+            return self._parse_and_record_response(await self._apost())
+
+        with self._record_call() as record:
+            return self._parse_recorded_response(await self._apost(), record)
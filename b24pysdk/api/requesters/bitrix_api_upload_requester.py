@@ -0,0 +1,133 @@
+import time
+from typing import Dict, Optional, Text
+
+import requests
+
+from ...utils.types import Number, Timeout
+from ._utils import MultipartFileStream
+from .bitrix_api_requester import BitrixAPIRequester
+
+__all__ = [
+    "BitrixAPIUploadRequester",
+]
+
+
+class BitrixAPIUploadRequester(BitrixAPIRequester):
+    """
+    Requester for uploading a file to a Bitrix24 upload URL.
+
+    Sends a streamed ``multipart/form-data`` body, so the file is never loaded
+    into memory as a whole. Retries, rate limiting, and response parsing are
+    the same as for regular REST API calls. A body of a non-seekable file can
+    be sent only once, so such uploads are not retried.
+    """
+
+    __slots__ = ("_stream",)
+
+    _stream: MultipartFileStream
+
+    def __init__(
+            self,
+            url: Text,
+            *,
+            stream: MultipartFileStream,
+            timeout: Timeout = None,
+            max_retries: Optional[int] = None,
+            initial_retry_delay: Optional[Number] = None,
+            retry_delay_increment: Optional[Number] = None,
+    ):
+        """
+        Initialize an upload requester.
+
+        Args:
+            url: Upload URL returned by Bitrix24.
+            stream: Multipart body with the uploaded file.
+            timeout: Request timeout.
+            max_retries: Maximum number of request attempts.
+            initial_retry_delay: Delay before the first retry.
+            retry_delay_increment: Additional delay added after each used retry.
+        """
+        super().__init__(
+            url,
+            timeout=timeout,
+            max_retries=max_retries if stream.rewindable else 1,
+            initial_retry_delay=initial_retry_delay,
+            retry_delay_increment=retry_delay_increment,
+        )
+        self._stream = stream
+
+    @property
+    def _headers(self) -> Dict:
+        """Return default SDK headers extended with multipart content type."""
+        return self._get_default_headers() | {"Content-Type": self._stream.content_type}
+
+    def _get_url_for_log(self, url: Text) -> Text:
+        """Return upload URL prepared for logging, without its credential-bearing query."""
+
+        if not self._config.secure_log or "?" not in url:
+            return url
+
+        return f"{url.split('?', 1)[0]}?{self._MASKED_VALUE}"
+
+    def _request(self) -> requests.Response:
+        """
+        Execute one upload attempt.
+
+        The multipart body is rewound before sending, so retried attempts
+        upload the file from the beginning.
+
+        Returns:
+            Raw HTTP response returned by ``requests``.
+        """
+
+        delay = self._get_rate_limit_delay()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start bitrix_api_upload_request",
+                context={
+                    "method": "POST",
+                    "URL": self._get_url_for_log(self._url),
+                    "timeout": self._timeout,
+                    "file_size": self._stream.file_size,
+                },
+            )
+
+        self._stream.rewind()
+
+        started = time.perf_counter()
+
+        response = self._get_session(self._url).post(
+            url=self._url,
+            data=self._stream,
+            headers=self._headers,
+            timeout=self._timeout,
+            allow_redirects=self._ALLOW_REDIRECTS,
+        )
+
+        if self._call_record is not None:
+            self._call_record.add_attempt(response, time.perf_counter() - started, bytes_out=len(self._stream))
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish bitrix_api_upload_request",
+                context={
+                    "response": str(response),
+                },
+            )
+
+        return response
+
+    async def _arequest(self) -> requests.Response:
+        """
+        Reject asynchronous execution.
+
+        Raises:
+            TypeError: Always, because async transports send JSON bodies only.
+        """
+        raise TypeError("File uploads are not supported by asynchronous Bitrix API requests!")
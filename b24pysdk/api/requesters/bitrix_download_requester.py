@@ -0,0 +1,331 @@
+import io
+import re
+import time
+from http import HTTPStatus
+from typing import BinaryIO, Dict, Final, List, Optional, Text, Tuple
+
+import requests
+
+from ...errors import BitrixRequestError, BitrixRequestTimeout
+from ...utils.types import Number, ProgressCallback, Timeout
+from ._base_requester import BaseRequester
+
+__all__ = [
+    "BitrixDownloadRequester",
+]
+
+
+class BitrixDownloadRequester(BaseRequester):
+    """
+    Requester for downloading file content from Bitrix24.
+
+    Sends a GET request through the pooled session of the portal domain and
+    writes the response body to a binary file chunk by chunk, so the content
+    is never held in memory as a whole.
+
+    When the transfer is interrupted after part of the body was received, the
+    download is resumed with an HTTP ``Range`` request for the missing bytes.
+    Such resumes always make progress and are not limited by ``max_retries``.
+    Failed attempts that received nothing are retried by the configured retry
+    strategy, like other SDK requests. If the server ignores ``Range`` and
+    sends the whole body again, the destination is rewound and rewritten.
+    """
+
+    DEFAULT_CHUNK_SIZE: Final[int] = 1 << 16
+    """Default size of chunks written to the destination, in bytes."""
+
+    _ALLOW_REDIRECTS: Final[bool] = True
+    _CONTENT_RANGE_TOTAL_RE: Final[re.Pattern] = re.compile(r"bytes \*/(?P<total>\d+)")
+    _REST_WEBHOOK_URL_RE: Final[re.Pattern] = re.compile(r"(?P<prefix>/rest/(?:api/)?)[^/?#]+/[^/?#]+/")
+    _QUERY_RE: Final[re.Pattern] = re.compile(r"\?.*$")
+
+    __slots__ = ("_chunk_size", "_file", "_file_start", "_progress_callback", "_query", "_size", "_url")
+
+    _chunk_size: int
+    _file: BinaryIO
+    _file_start: Optional[int]
+    _progress_callback: Optional[ProgressCallback]
+    _query: Optional[List[Tuple[Text, Text]]]
+    _size: int
+    _url: Text
+
+    def __init__(
+            self,
+            url: Text,
+            *,
+            file: BinaryIO,
+            query: Optional[List[Tuple[Text, Text]]] = None,
+            offset: int = 0,
+            chunk_size: Optional[int] = None,
+            progress_callback: Optional[ProgressCallback] = None,
+            timeout: Timeout = None,
+            max_retries: Optional[int] = None,
+            initial_retry_delay: Optional[Number] = None,
+            retry_delay_increment: Optional[Number] = None,
+    ):
+        """
+        Initialize a download requester.
+
+        Args:
+            url: Absolute URL of the file content.
+            file: Binary file opened for writing. Content is written from its
+                current position.
+            query: Query string parameters appended to ``url``.
+            offset: Number of bytes of the content already present in
+                ``file`` before its current position. The download continues
+                from this offset.
+            chunk_size: Size of chunks written to the file, in bytes.
+            progress_callback: Optional callable receiving the number of bytes
+                downloaded and the total size, ``None`` when unknown.
+            timeout: Request timeout.
+            max_retries: Maximum number of request attempts.
+            initial_retry_delay: Delay before the first retry.
+            retry_delay_increment: Additional delay added after each used retry.
+
+        Raises:
+            ValueError: If ``offset`` or ``chunk_size`` is invalid.
+        """
+
+        if not (isinstance(offset, int) and offset >= 0):
+            raise ValueError("offset must be a non-negative integer")
+
+        if chunk_size is not None and not (isinstance(chunk_size, int) and chunk_size > 0):
+            raise ValueError("chunk_size must be a positive integer")
+
+        super().__init__(
+            timeout=timeout,
+            max_retries=max_retries,
+            initial_retry_delay=initial_retry_delay,
+            retry_delay_increment=retry_delay_increment,
+        )
+        self._url = url
+        self._file = file
+        self._file_start = file.tell() - offset if file.seekable() else None
+        self._query = query
+        self._size = offset
+        self._chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        self._progress_callback = progress_callback
+
+    @property
+    def _headers(self) -> Dict:
+        """Return default SDK headers for raw content with a resume range when needed."""
+
+        headers = self._get_default_headers() | {
+            "Accept": "*/*",
+            "Accept-Encoding": "identity",
+        }
+
+        if self._size > 0:
+            headers["Range"] = f"bytes={self._size}-"
+
+        return headers
+
+    def _get_retry_url(self, *args, **kwargs) -> Text:  # noqa: ARG002
+        """Return the download URL of the requester."""
+        return self._url
+
+    def _get_url_for_log(self, url: Text) -> Text:
+        """Return download URL prepared for logging, without webhook credentials and query string."""
+
+        if not self._config.secure_log:
+            return url
+
+        url = self._REST_WEBHOOK_URL_RE.sub(rf"\g<prefix>{self._MASKED_VALUE}/{self._MASKED_VALUE}/", url, count=1)
+
+        return self._QUERY_RE.sub(f"?{self._MASKED_VALUE}", url, count=1)
+
+    def _get_rate_limit_delay(self) -> float:
+        """Reserve a slot in the configured rate limiter and return the delay before the request."""
+
+        rate_limiter = self._config.rate_limiter
+
+        if rate_limiter is None:
+            return 0
+
+        return rate_limiter.reserve(self._url, None)
+
+    def _is_complete(self, response: requests.Response) -> bool:
+        """Return whether a ``416`` response confirms that all content is already downloaded."""
+
+        match = self._CONTENT_RANGE_TOTAL_RE.fullmatch(response.headers.get("Content-Range", ""))
+
+        return self._size > 0 and match is not None and int(match["total"]) == self._size
+
+    def _rewind(self):
+        """
+        Discard downloaded content before the server sends the whole body again.
+
+        Raises:
+            io.UnsupportedOperation: If the destination is not seekable.
+        """
+
+        if self._file_start is None:
+            raise io.UnsupportedOperation("server does not support ranges and the download cannot be restarted")
+
+        self._file.seek(self._file_start)
+        self._file.truncate()
+        self._size = 0
+
+    def _write_body(self, response: requests.Response):
+        """Write the response body to the destination chunk by chunk."""
+
+        content_length = response.headers.get("Content-Length")
+        total = self._size + int(content_length) if content_length and content_length.isdigit() else None
+
+        for chunk in response.iter_content(chunk_size=self._chunk_size):
+            self._file.write(chunk)
+            self._size += len(chunk)
+
+            if self._progress_callback is not None:
+                self._progress_callback(self._size, total)
+
+    def _request(self) -> requests.Response:
+        """
+        Execute one download attempt.
+
+        Content of ``200`` and ``206`` responses is written to the
+        destination; bodies of other responses are loaded for error parsing.
+
+        Returns:
+            Raw HTTP response returned by ``requests``.
+        """
+
+        delay = self._get_rate_limit_delay()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start bitrix_download_request",
+                context={
+                    "method": "GET",
+                    "URL": self._get_url_for_log(self._url),
+                    "timeout": self._timeout,
+                    "offset": self._size,
+                },
+            )
+
+        response = self._get_session(self._url).get(
+            url=self._url,
+            params=self._query,
+            headers=self._headers,
+            timeout=self._timeout,
+            allow_redirects=self._ALLOW_REDIRECTS,
+            stream=True,
+        )
+
+        with response:
+            if response.status_code == HTTPStatus.OK and self._size > 0:
+                self._rewind()
+
+            if response.status_code in (HTTPStatus.OK, HTTPStatus.PARTIAL_CONTENT):
+                self._write_body(response)
+            elif not (response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE and self._is_complete(response)):
+                _ = response.content
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish bitrix_download_request",
+                context={
+                    "response": str(response),
+                    "size": self._size,
+                },
+            )
+
+        return response
+
+    async def _arequest(self) -> requests.Response:
+        """
+        Reject asynchronous downloads.
+
+        Raises:
+            TypeError: Always, because downloads stream the body to a file
+                through the synchronous session pool.
+        """
+        raise TypeError("Asynchronous downloads are not supported by Bitrix download requests!")
+
+    def _request_with_retries(self) -> requests.Response:
+        """
+        Execute download attempts until the content is received.
+
+        Interrupted transfers that received new bytes are resumed at once.
+        Other failures and error responses are passed to the retry strategy.
+
+        Returns:
+            HTTP response of the last attempt.
+
+        Raises:
+            requests.RequestException: If the last attempt failed with a
+                transport error that is not retried.
+        """
+
+        attempt = 0
+
+        while True:
+            attempt += 1
+            size = self._size
+
+            try:
+                response = self._request()
+
+            except requests.RequestException as error:
+                if self._size > size:
+                    self._config.logger.warning(
+                        "Download interrupted, resuming",
+                        context={
+                            "URL": self._get_url_for_log(self._url),
+                            "error": repr(error),
+                            "size": self._size,
+                        },
+                    )
+                    attempt = 0
+                    continue
+
+                retry_delay = self._get_retry_delay(self._url, attempt, error=error)
+
+                if retry_delay is None:
+                    raise
+
+            else:
+                if response.status_code < HTTPStatus.BAD_REQUEST:
+                    return response
+
+                retry_delay = self._get_retry_delay(self._url, attempt, response=response)
+
+                if retry_delay is None:
+                    return response
+
+            time.sleep(retry_delay)
+
+    def download(self) -> int:
+        """
+        Download the content into the destination file.
+
+        Returns:
+            Size of the downloaded content in bytes, including ``offset``.
+
+        Raises:
+            BitrixAPIError: If Bitrix24 responds with an error.
+            BitrixRequestTimeout: If the request times out.
+            BitrixRequestError: If ``requests`` fails before receiving a valid
+                HTTP response.
+            io.UnsupportedOperation: If a resumed download has to restart
+                from the beginning and the destination is not seekable.
+        """
+
+        try:
+            response = self._request_with_retries()
+
+        except requests.Timeout as error:
+            raise BitrixRequestTimeout(timeout=self._timeout, original_error=error) from error
+
+        except requests.RequestException as error:
+            raise BitrixRequestError(original_error=error) from error
+
+        if response.status_code >= HTTPStatus.BAD_REQUEST and not self._is_complete(response):
+            self._parse_response(response)
+
+        return self._size
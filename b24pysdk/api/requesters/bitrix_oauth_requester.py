@@ -19,7 +19,8 @@ class BitrixOAuthRequester(BaseRequester):
     Requester for Bitrix24 OAuth endpoints.
 
     Handles authorization-code exchange, token refresh, and ``app.info`` calls
-    through the Bitrix24 OAuth host.
+    through the Bitrix24 OAuth host. Every call has an asynchronous ``a``-prefixed
+    counterpart sent through the configured async HTTP transport.
     """
 
     _HEADERS: Final[Dict] = {"Content-Type": "application/x-www-form-urlencoded"}
@@ -75,6 +76,9 @@ class BitrixOAuthRequester(BaseRequester):
         """
         Execute one raw OAuth GET request.
 
+        The request is sent through the pooled keep-alive session of the OAuth
+        server.
+
         Args:
             url: OAuth endpoint URL.
             params: Query parameters sent to the endpoint.
@@ -83,29 +87,75 @@ class BitrixOAuthRequester(BaseRequester):
             Raw HTTP response returned by ``requests``.
         """
 
-        self._config.logger.debug(
-            "start bitrix_oauth_request",
-            context={
-                "method": "GET",
-                "URL": url,
-                "timeout": self._timeout,
-            },
-        )
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start bitrix_oauth_request",
+                context={
+                    "method": "GET",
+                    "URL": url,
+                    "timeout": self._timeout,
+                },
+            )
 
-        response = requests.get(
+        response = self._get_session(url).get(
             url=url,
             params=params,
             headers=self._headers,
             timeout=self._timeout,
         )
 
-        self._config.logger.debug(
-            "finish bitrix_oauth_request",
-            context={
-                "response": str(response),
-            },
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish bitrix_oauth_request",
+                context={
+                    "response": str(response),
+                },
+            )
+
+        return response
+
+    async def _arequest(self, url: Text, params: JSONDict) -> requests.Response:
+        """
+        Asynchronously execute one raw OAuth GET request.
+
+        Args:
+            url: OAuth endpoint URL.
+            params: Query parameters sent to the endpoint.
+
+        Returns:
+            Raw HTTP response converted to ``requests.Response``.
+        """
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start async bitrix_oauth_request",
+                context={
+                    "method": "GET",
+                    "URL": url,
+                    "timeout": self._timeout,
+                },
+            )
+
+        response = await self._get_async_transport().request(
+            "GET",
+            url,
+            params=params,
+            headers=self._headers,
+            timeout=self._timeout,
         )
 
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish async bitrix_oauth_request",
+                context={
+                    "response": str(response),
+                },
+            )
+
         return response
 
     def _get(self, url: Text, params: JSONDict) -> requests.Response:
@@ -134,6 +184,32 @@ class BitrixOAuthRequester(BaseRequester):
         except requests.RequestException as error:
             raise BitrixOAuthRequestError(original_error=error) from error
 
+    async def _aget(self, url: Text, params: JSONDict) -> requests.Response:
+        """
+        Asynchronously send an OAuth GET request with SDK error wrapping.
+
+        Args:
+            url: OAuth endpoint URL.
+            params: Query parameters sent to the endpoint.
+
+        Returns:
+            Raw HTTP response returned by the server.
+
+        Raises:
+            BitrixOAuthRequestTimeout: If the request times out.
+            BitrixOAuthRequestError: If the transport fails before receiving a
+                valid HTTP response.
+        """
+
+        try:
+            return await self._arequest_with_retries(url=url, params=params)
+
+        except requests.Timeout as error:
+            raise BitrixOAuthRequestTimeout(timeout=self._timeout, original_error=error) from error
+
+        except requests.RequestException as error:
+            raise BitrixOAuthRequestError(original_error=error) from error
+
     @classmethod
     def _parse_response(cls, response: requests.Response) -> JSONDict:
         """
@@ -200,6 +276,105 @@ class BitrixOAuthRequester(BaseRequester):
 
         return data
 
+    def _start_get_oauth_token(self, code: Text) -> JSONDict:
+        """Log the start of an authorization-code exchange and return its query parameters."""
+
+        params: JSONDict = {
+            "grant_type": "authorization_code",
+            "client_id": self._bitrix_oauth.client_id,
+            "client_secret": self._bitrix_oauth.client_secret,
+            "code": code,
+        }
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start get_oauth_token",
+                context={
+                    "grant_type": "authorization_code",
+                    **self._get_oauth_for_log(),
+                    "code": self._get_value_for_log(code),
+                },
+            )
+
+        return params
+
+    def _start_refresh_oauth_token(self, refresh_token: Text) -> JSONDict:
+        """Log the start of a token refresh and return its query parameters."""
+
+        params: JSONDict = {
+            "grant_type": "refresh_token",
+            "client_id": self._bitrix_oauth.client_id,
+            "client_secret": self._bitrix_oauth.client_secret,
+            "refresh_token": refresh_token,
+        }
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start refresh_oauth_token",
+                context={
+                    "grant_type": "refresh_token",
+                    **self._get_oauth_for_log(),
+                    "refresh_token": self._get_value_for_log(refresh_token),
+                },
+            )
+
+        return params
+
+    def _finish_oauth_token(self, message: Text, json_response: JSONDict) -> JSONDict:
+        """Log a finished token request with sensitive response values masked."""
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                message,
+                context={
+                    "json_response": self._get_data_for_log(json_response),
+                },
+            )
+
+        return json_response
+
+    def _start_get_app_info(self, auth_token: Text) -> JSONDict:
+        """Log the start of an ``app.info`` request and return its query parameters."""
+
+        params: JSONDict = {
+            "auth": auth_token,
+        }
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "start get_app_info",
+                context={
+                    **self._get_oauth_for_log(),
+                    "auth": self._get_value_for_log(auth_token),
+                },
+            )
+
+        return params
+
+    def _finish_get_app_info(self, json_response: JSONDict) -> BitrixAppInfoResponseData:
+        """Log a finished ``app.info`` request."""
+
+        logger = self._config.logger
+
+        if logger.is_enabled_for(logger.DEBUG):
+            logger.debug(
+                "finish get_app_info",
+                context={
+                    "result": json_response.get("result"),
+                    "time": json_response.get("time"),
+                },
+            )
+
+        return cast(BitrixAppInfoResponseData, json_response)
+
     def get_oauth_token(self, code: Text) -> JSONDict:
         """
         Exchange an authorization code for OAuth tokens.
@@ -210,33 +385,23 @@ class BitrixOAuthRequester(BaseRequester):
         Returns:
             Parsed OAuth token response.
         """
-
-        params: JSONDict = {
-            "grant_type": "authorization_code",
-            "client_id": self._bitrix_oauth.client_id,
-            "client_secret": self._bitrix_oauth.client_secret,
-            "code": code,
-        }
-
-        self._config.logger.debug(
-            "start get_oauth_token",
-            context={
-                "grant_type": "authorization_code",
-                **self._get_oauth_for_log(),
-                "code": self._get_value_for_log(code),
-            },
-        )
-
+        params = self._start_get_oauth_token(code)
         json_response = self._parse_response(self._get(url=self._OAUTH_TOKEN_URL, params=params))
+        return self._finish_oauth_token("finish get_oauth_token", json_response)
 
-        self._config.logger.debug(
-            "finish get_oauth_token",
-            context={
-                "json_response": self._get_data_for_log(json_response),
-            },
-        )
+    async def aget_oauth_token(self, code: Text) -> JSONDict:
+        """
+        Asynchronously exchange an authorization code for OAuth tokens.
 
-        return json_response
+        Args:
+            code: Authorization code received from Bitrix24.
+
+        Returns:
+            Parsed OAuth token response.
+        """
+        params = self._start_get_oauth_token(code)
+        json_response = self._parse_response(await self._aget(url=self._OAUTH_TOKEN_URL, params=params))
+        return self._finish_oauth_token("finish get_oauth_token", json_response)
 
     def refresh_oauth_token(self, refresh_token: Text) -> JSONDict:
         """
@@ -248,33 +413,23 @@ class BitrixOAuthRequester(BaseRequester):
         Returns:
             Parsed OAuth token response with renewed token data.
         """
-
-        params: JSONDict = {
-            "grant_type": "refresh_token",
-            "client_id": self._bitrix_oauth.client_id,
-            "client_secret": self._bitrix_oauth.client_secret,
-            "refresh_token": refresh_token,
-        }
-
-        self._config.logger.debug(
-            "start refresh_oauth_token",
-            context={
-                "grant_type": "refresh_token",
-                **self._get_oauth_for_log(),
-                "refresh_token": self._get_value_for_log(refresh_token),
-            },
-        )
-
+        params = self._start_refresh_oauth_token(refresh_token)
         json_response = self._parse_response(self._get(url=self._OAUTH_TOKEN_URL, params=params))
+        return self._finish_oauth_token("finish refresh_oauth_token", json_response)
 
-        self._config.logger.debug(
-            "finish refresh_oauth_token",
-            context={
-                "json_response": self._get_data_for_log(json_response),
-            },
-        )
+    async def arefresh_oauth_token(self, refresh_token: Text) -> JSONDict:
+        """
+        Asynchronously refresh OAuth tokens using a refresh token.
 
-        return json_response
+        Args:
+            refresh_token: Refresh token issued by Bitrix24.
+
+        Returns:
+            Parsed OAuth token response with renewed token data.
+        """
+        params = self._start_refresh_oauth_token(refresh_token)
+        json_response = self._parse_response(await self._aget(url=self._OAUTH_TOKEN_URL, params=params))
+        return self._finish_oauth_token("finish refresh_oauth_token", json_response)
 
     def get_app_info(self, auth_token: Text) -> BitrixAppInfoResponseData:
         """
@@ -286,27 +441,18 @@ class BitrixOAuthRequester(BaseRequester):
         Returns:
             Parsed ``app.info`` response.
         """
+        params = self._start_get_app_info(auth_token)
+        return self._finish_get_app_info(self._parse_response(self._get(url=self._APP_INFO_URL, params=params)))
 
-        params: JSONDict = {
-            "auth": auth_token,
-        }
-
-        self._config.logger.debug(
-            "start get_app_info",
-            context={
-                **self._get_oauth_for_log(),
-                "auth": self._get_value_for_log(auth_token),
-            },
-        )
-
-        json_response = self._parse_response(self._get(url=self._APP_INFO_URL, params=params))
+    async def aget_app_info(self, auth_token: Text) -> BitrixAppInfoResponseData:
+        """
+        Asynchronously retrieve Bitrix24 application installation information.
 
-        self._config.logger.debug(
-            "finish get_app_info",
-            context={
-                "result": json_response.get("result"),
-                "time": json_response.get("time"),
-            },
-        )
+        Args:
+            auth_token: OAuth access token used for the ``app.info`` request.
 
-        return cast(BitrixAppInfoResponseData, json_response)
+        Returns:
+            Parsed ``app.info`` response.
+        """
+        params = self._start_get_app_info(auth_token)
+        return self._finish_get_app_info(self._parse_response(await self._aget(url=self._APP_INFO_URL, params=params)))
@@ -0,0 +1,207 @@
+import threading
+import time
+from typing import Dict, Final, Optional, Text, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..._config import Config
+
+__all__ = [
+    "HTTPSessionPool",
+]
+
+
+class _PooledSession:
+    """Pooled ``requests.Session`` together with its adapter sizing and last use time."""
+
+    __slots__ = ("last_used_at", "pool_sizes", "session")
+
+    session: requests.Session
+    pool_sizes: Tuple[int, int]
+    last_used_at: float
+
+    def __init__(self, session: requests.Session, pool_sizes: Tuple[int, int]):
+        self.session = session
+        self.pool_sizes = pool_sizes
+        self.last_used_at = time.monotonic()
+
+
+class HTTPSessionPool:
+    """
+    Thread-local pool of keep-alive HTTP sessions.
+
+    Keeps one ``requests.Session`` per origin (scheme and host, i.e. per portal
+    domain or OAuth server) and per thread, so consecutive requests to the same
+    portal reuse already established TCP/TLS connections. Session adapters are
+    sized from :class:`~b24pysdk.Config` (``http_pool_connections`` and
+    ``http_pool_maxsize``), and sessions that have not been used for
+    ``http_session_idle_timeout`` seconds are closed.
+
+    Like ``Config``, each thread owns its own sessions, because
+    ``requests.Session`` is not guaranteed to be thread-safe.
+    """
+
+    _MOUNT_PREFIXES: Final[Tuple[Text, ...]] = ("https://", "http://")
+
+    __slots__ = ("_config", "_local")
+
+    _config: Config
+    _local: threading.local
+
+    _local_thread: threading.local = threading.local()
+
+    def __init__(self):
+        local_thread = type(self)._local_thread
+
+        if not hasattr(local_thread, "sessions"):
+            local_thread.sessions = {}
+            local_thread.last_eviction_at = time.monotonic()
+
+        self._config = Config()
+        self._local = local_thread
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, url: Text) -> bool:
+        return self._get_origin(url) in self._sessions
+
+    @property
+    def _sessions(self) -> Dict[Text, _PooledSession]:
+        """Pooled sessions of the current thread keyed by origin."""
+        return self._local.sessions
+
+    @property
+    def _pool_sizes(self) -> Tuple[int, int]:
+        """Return currently configured ``(pool_connections, pool_maxsize)`` pair."""
+        return self._config.http_pool_connections, self._config.http_pool_maxsize
+
+    @staticmethod
+    def _get_origin(url: Text) -> Text:
+        """Return lower-cased ``scheme://host[:port]`` part of ``url`` used as pool key."""
+        split_url = urlsplit(url)
+        return f"{split_url.scheme}://{split_url.netloc}".lower()
+
+    def _make_session(self, pool_sizes: Tuple[int, int]) -> requests.Session:
+        """
+        Create a session with HTTP adapters sized according to SDK configuration.
+
+        Adapter-level retries are disabled because retry handling is done by
+        the SDK requesters.
+        """
+
+        pool_connections, pool_maxsize = pool_sizes
+
+        session = requests.Session()
+
+        for prefix in self._MOUNT_PREFIXES:
+            session.mount(prefix, HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=0,
+            ))
+
+        return session
+
+    def _evict_idle_sessions(self, now: float):
+        """
+        Close sessions that were not used for longer than the configured idle timeout.
+
+        The sweep runs at most once per idle timeout interval to keep
+        ``get_session`` cheap when many portals are served from one thread.
+        """
+
+        idle_timeout = self._config.http_session_idle_timeout
+
+        if now - self._local.last_eviction_at < idle_timeout:
+            return
+
+        self._local.last_eviction_at = now
+
+        for origin, pooled_session in list(self._sessions.items()):
+            if now - pooled_session.last_used_at >= idle_timeout:
+                self._close_session(origin)
+
+    def _close_session(self, origin: Text):
+        """Remove the session of ``origin`` from the pool and close its connections."""
+
+        pooled_session = self._sessions.pop(origin, None)
+
+        if pooled_session is not None:
+            pooled_session.session.close()
+
+            logger = self._config.logger
+
+            if logger.is_enabled_for(logger.DEBUG):
+                logger.debug(
+                    "closed pooled http session",
+                    context={
+                        "origin": origin,
+                    },
+                )
+
+    def get_session(self, url: Text) -> requests.Session:
+        """
+        Return the pooled session for the origin of ``url``, creating it when needed.
+
+        A cached session is replaced when it has been idle for longer than
+        ``http_session_idle_timeout`` or when the configured pool sizes changed
+        since it was created.
+
+        Args:
+            url: Absolute URL of the upcoming request.
+
+        Returns:
+            Keep-alive session bound to the current thread and the URL origin.
+        """
+
+        now = time.monotonic()
+        origin = self._get_origin(url)
+        pool_sizes = self._pool_sizes
+
+        self._evict_idle_sessions(now)
+
+        pooled_session = self._sessions.get(origin)
+
+        if pooled_session is not None and (
+                pooled_session.pool_sizes != pool_sizes
+                or now - pooled_session.last_used_at >= self._config.http_session_idle_timeout
+        ):
+            self._close_session(origin)
+            pooled_session = None
+
+        if pooled_session is None:
+            pooled_session = _PooledSession(self._make_session(pool_sizes), pool_sizes)
+            self._sessions[origin] = pooled_session
+
+            logger = self._config.logger
+
+            if logger.is_enabled_for(logger.DEBUG):
+                logger.debug(
+                    "opened pooled http session",
+                    context={
+                        "origin": origin,
+                        "pool_connections": pool_sizes[0],
+                        "pool_maxsize": pool_sizes[1],
+                    },
+                )
+
+        pooled_session.last_used_at = now
+
+        return pooled_session.session
+
+    def close(self, url: Optional[Text] = None):
+        """
+        Close pooled sessions of the current thread.
+
+        Args:
+            url: When provided, close only the session of this URL origin.
+                Otherwise, close all sessions owned by the current thread.
+        """
+        if url is None:
+            for origin in list(self._sessions):
+                self._close_session(origin)
+        else:
+            self._close_session(self._get_origin(url))
@@ -0,0 +1,83 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Final, Text, Tuple
+
+from ...._config import Config
+from ....protocols import JSONCodecProtocol
+from ._base_json_codec import BaseJSONCodec
+from .stdlib_json_codec import StdlibJSONCodec
+
+if TYPE_CHECKING:
+    from .msgspec_json_codec import MsgspecJSONCodec
+    from .orjson_json_codec import OrjsonJSONCodec
+
+__all__ = [
+    "BaseJSONCodec",
+    "MsgspecJSONCodec",
+    "OrjsonJSONCodec",
+    "StdlibJSONCodec",
+    "get_default_json_codec",
+    "get_json_codec",
+]
+
+_CODEC_MODULES: Final[Dict[Text, Text]] = {
+    "MsgspecJSONCodec": ".msgspec_json_codec",
+    "OrjsonJSONCodec": ".orjson_json_codec",
+}
+
+_DEFAULT_CODEC_PRIORITY: Final[Tuple[Text, ...]] = (
+    "OrjsonJSONCodec",
+    "MsgspecJSONCodec",
+)
+
+
+def __getattr__(name: Text) -> Any:
+    try:
+        module_path = _CODEC_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = import_module(module_path, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+
+    return value
+
+
+def get_default_json_codec() -> BaseJSONCodec:
+    """
+    Create a JSON codec for the fastest installed JSON library.
+
+    ``orjson`` is preferred over ``msgspec``; the standard ``json`` module is
+    used when neither is installed.
+
+    Returns:
+        New JSON codec.
+    """
+
+    for name in _DEFAULT_CODEC_PRIORITY:
+        try:
+            codec_class = __getattr__(name)
+        except ImportError:
+            continue
+
+        return codec_class()
+
+    return StdlibJSONCodec()
+
+
+def get_json_codec() -> JSONCodecProtocol:
+    """
+    Return the JSON codec of the current thread configuration.
+
+    When no codec is configured, the default codec is created and stored in
+    the configuration, so it is resolved only once per thread.
+    """
+
+    config = Config()
+    json_codec = config.json_codec
+
+    if json_codec is None:
+        json_codec = get_default_json_codec()
+        config.json_codec = json_codec
+
+    return json_codec
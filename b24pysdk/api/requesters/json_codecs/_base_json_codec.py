@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+__all__ = [
+    "BaseJSONCodec",
+]
+
+
+class BaseJSONCodec(ABC):
+    """
+    Base class for JSON codecs of SDK requesters.
+
+    Codecs encode request bodies to UTF-8 bytes and decode response bodies
+    directly from bytes. Decoding errors of the underlying library are raised
+    as ``ValueError`` so the SDK can report them uniformly.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """
+        Serialize a JSON-compatible object.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            UTF-8 encoded JSON document.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, content: bytes) -> Any:
+        """
+        Deserialize a JSON document.
+
+        Args:
+            content: Raw JSON document.
+
+        Returns:
+            Decoded Python object.
+
+        Raises:
+            ValueError: If ``content`` is not a valid JSON document.
+        """
+        raise NotImplementedError
@@ -0,0 +1,36 @@
+from typing import Any
+
+from ._base_json_codec import BaseJSONCodec
+
+try:
+    import msgspec
+except ImportError as error:
+    raise ImportError("msgspec JSON codec requires optional dependency msgspec. Install b24pysdk[msgspec].") from error
+
+__all__ = [
+    "MsgspecJSONCodec",
+]
+
+
+class MsgspecJSONCodec(BaseJSONCodec):
+    """JSON codec backed by ``msgspec.json`` with reusable encoder and decoder instances."""
+
+    __slots__ = ("_decoder", "_encoder")
+
+    _decoder: msgspec.json.Decoder
+    _encoder: msgspec.json.Encoder
+
+    def __init__(self):
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def encode(self, obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON."""
+        return self._encoder.encode(obj)
+
+    def decode(self, content: bytes) -> Any:
+        """Deserialize a UTF-8 encoded JSON document."""
+        try:
+            return self._decoder.decode(content)
+        except msgspec.DecodeError as error:
+            raise ValueError(str(error)) from error
@@ -0,0 +1,33 @@
+from typing import Any, Final
+
+from ._base_json_codec import BaseJSONCodec
+
+try:
+    import orjson
+except ImportError as error:
+    raise ImportError("orjson JSON codec requires optional dependency orjson. Install b24pysdk[orjson].") from error
+
+__all__ = [
+    "OrjsonJSONCodec",
+]
+
+
+class OrjsonJSONCodec(BaseJSONCodec):
+    """
+    JSON codec backed by ``orjson``.
+
+    Dictionary keys that are not strings, such as integer keys of batch
+    commands, are serialized as strings.
+    """
+
+    _OPTIONS: Final[int] = orjson.OPT_NON_STR_KEYS
+
+    __slots__ = ()
+
+    def encode(self, obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON."""
+        return orjson.dumps(obj, option=self._OPTIONS)
+
+    def decode(self, content: bytes) -> Any:
+        """Deserialize a UTF-8 encoded JSON document."""
+        return orjson.loads(content)
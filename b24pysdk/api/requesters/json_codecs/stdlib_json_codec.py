@@ -0,0 +1,24 @@
+import json
+from typing import Any, Final, Tuple
+
+from ._base_json_codec import BaseJSONCodec
+
+__all__ = [
+    "StdlibJSONCodec",
+]
+
+
+class StdlibJSONCodec(BaseJSONCodec):
+    """JSON codec backed by the standard ``json`` module, used when no faster library is installed."""
+
+    _SEPARATORS: Final[Tuple[str, str]] = (",", ":")
+
+    __slots__ = ()
+
+    def encode(self, obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON, rejecting ``NaN`` and infinities like ``requests`` does."""
+        return json.dumps(obj, ensure_ascii=False, separators=self._SEPARATORS, allow_nan=False).encode()
+
+    def decode(self, content: bytes) -> Any:
+        """Deserialize a UTF-8, UTF-16 or UTF-32 encoded JSON document."""
+        return json.loads(content)
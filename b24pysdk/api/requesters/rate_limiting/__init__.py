@@ -0,0 +1,11 @@
+from ._base_backend import BaseRateLimiterBackend
+from .file_backend import FileRateLimiterBackend
+from .memory_backend import MemoryRateLimiterBackend
+from .rate_limiter import RateLimiter
+
+__all__ = [
+    "BaseRateLimiterBackend",
+    "FileRateLimiterBackend",
+    "MemoryRateLimiterBackend",
+    "RateLimiter",
+]
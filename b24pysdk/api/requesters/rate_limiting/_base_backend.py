@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Text, TypeVar
+
+from ....utils.types import JSONDict
+
+__all__ = [
+    "BaseRateLimiterBackend",
+]
+
+_T = TypeVar("_T")
+
+
+class BaseRateLimiterBackend(ABC):
+    """
+    Base class for rate limiter state storages.
+
+    A backend keeps one JSON-compatible state dictionary per portal and
+    guarantees that concurrent updates of the same portal state are applied
+    one after another. The scope of that guarantee (threads of one process or
+    several processes) depends on the concrete backend.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def update(self, key: Text, updater: Callable[[JSONDict], _T]) -> _T:
+        """
+        Atomically read, modify and store the state of one portal.
+
+        Args:
+            key: Portal key.
+            updater: Function that modifies the state dictionary in place.
+                An empty dictionary is passed when no state is stored yet.
+
+        Returns:
+            Value returned by ``updater``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self):
+        """Remove stored state of all portals."""
+        raise NotImplementedError
@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Callable, Final, Optional, Text, TypeVar, Union
+
+from ....utils.file_lock import locked_file
+from ....utils.types import JSONDict
+from ._base_backend import BaseRateLimiterBackend
+
+__all__ = [
+    "FileRateLimiterBackend",
+]
+
+_T = TypeVar("_T")
+
+
+class FileRateLimiterBackend(BaseRateLimiterBackend):
+    """
+    Rate limiter backend shared by several processes through files.
+
+    Every portal state is stored as JSON in its own file inside ``directory``.
+    Updates hold an exclusive OS-level lock on that file, so worker processes
+    of one host (for example, web server or task queue workers) share the
+    request budget of a portal.
+    """
+
+    _DEFAULT_DIRECTORY_NAME: Final[Text] = "b24pysdk-rate-limits"
+    _FILE_SUFFIX: Final[Text] = ".json"
+
+    __slots__ = ("_directory",)
+
+    _directory: Path
+
+    def __init__(self, directory: Optional[Union[Text, os.PathLike]] = None):
+        """
+        Initialize the file backend.
+
+        Args:
+            directory: Directory for state files. Defaults to a
+                ``b24pysdk-rate-limits`` directory in the system temporary
+                directory. All processes that share limits must use the same
+                directory.
+        """
+
+        if directory is None:
+            directory = Path(tempfile.gettempdir()) / self._DEFAULT_DIRECTORY_NAME
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> Path:
+        """Directory that contains portal state files."""
+        return self._directory
+
+    def _get_path(self, key: Text) -> Path:
+        """Return state file path of a portal key."""
+        return self._directory / f"{hashlib.sha256(key.encode()).hexdigest()}{self._FILE_SUFFIX}"
+
+    @staticmethod
+    def _read_state(file: IO) -> JSONDict:
+        """Read the state stored in a locked file, treating empty or broken content as no state."""
+
+        file.seek(0)
+        content = file.read()
+
+        if not content:
+            return {}
+
+        try:
+            state = json.loads(content)
+        except ValueError:
+            return {}
+
+        return state if isinstance(state, dict) else {}
+
+    @staticmethod
+    def _write_state(file: IO, state: JSONDict):
+        """Replace the content of a locked file with ``state``."""
+        file.seek(0)
+        file.truncate()
+        json.dump(state, file, separators=(",", ":"))
+        file.flush()
+
+    def update(self, key: Text, updater: Callable[[JSONDict], _T]) -> _T:
+        """
+        Atomically update the state file of one portal.
+
+        Args:
+            key: Portal key.
+            updater: Function that modifies the state dictionary in place.
+
+        Returns:
+            Value returned by ``updater``.
+        """
+
+        with self._get_path(key).open("a+", encoding="utf-8") as file, locked_file(file):
+            state = self._read_state(file)
+            result = updater(state)
+            self._write_state(file, state)
+
+        return result
+
+    def clear(self):
+        """Remove state files of all portals."""
+        for path in self._directory.glob(f"*{self._FILE_SUFFIX}"):
+            path.unlink(missing_ok=True)
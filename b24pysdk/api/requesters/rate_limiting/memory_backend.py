@@ -0,0 +1,51 @@
+import threading
+from typing import Callable, ClassVar, Dict, Text, TypeVar
+
+from ....utils.types import JSONDict
+from ._base_backend import BaseRateLimiterBackend
+
+__all__ = [
+    "MemoryRateLimiterBackend",
+]
+
+_T = TypeVar("_T")
+
+
+class MemoryRateLimiterBackend(BaseRateLimiterBackend):
+    """
+    In-process rate limiter backend.
+
+    Portal states are stored on the class, so every backend instance of the
+    process, and therefore every thread, shares the same request budget of a
+    portal. Updates are serialized with a lock.
+    """
+
+    __slots__ = ()
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _states: ClassVar[Dict[Text, JSONDict]] = {}
+
+    def update(self, key: Text, updater: Callable[[JSONDict], _T]) -> _T:
+        """
+        Atomically update the in-memory state of one portal.
+
+        Args:
+            key: Portal key.
+            updater: Function that modifies the state dictionary in place.
+
+        Returns:
+            Value returned by ``updater``.
+        """
+
+        cls = type(self)
+
+        with cls._lock:
+            return updater(cls._states.setdefault(key, {}))
+
+    def clear(self):
+        """Remove stored state of all portals."""
+
+        cls = type(self)
+
+        with cls._lock:
+            cls._states.clear()
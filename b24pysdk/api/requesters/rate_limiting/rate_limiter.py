@@ -0,0 +1,332 @@
+import time
+from typing import Dict, Final, Iterable, List, Optional, Text, Tuple
+from urllib.parse import urlsplit
+
+from ...._config import Config
+from ....constants import (
+    DEFAULT_OPERATING_TIME_LIMIT,
+    DEFAULT_OPERATING_TIME_WINDOW,
+    DEFAULT_RATE_LIMIT_BUCKET_SIZE,
+    DEFAULT_RATE_LIMIT_DRAIN_RATE,
+)
+from ....errors import BitrixAPIOperationTimeLimit, BitrixAPIOverloadLimit, BitrixAPIQueryLimitExceeded
+from ....schemas.api import TimeResponseData
+from ....utils.types import JSONDict, Number
+from ._base_backend import BaseRateLimiterBackend
+from .memory_backend import MemoryRateLimiterBackend
+
+__all__ = [
+    "RateLimiter",
+]
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter aware of Bitrix24 REST limits.
+
+    Bitrix24 limits every portal with a leaky bucket: a burst of
+    ``bucket_size`` requests is accepted, after which requests are drained at
+    ``drain_rate`` requests per second. Besides, each REST method may consume
+    only ``operating_limit`` seconds of execution time within an operating
+    window; the consumed time is reported in ``time.operating`` and
+    ``time.operating_reset_at`` of every response.
+
+    The limiter mirrors both limits on the client side. Before every request
+    it reserves a slot in the bucket of the portal and returns how long the
+    requester has to wait, so that requests are delayed instead of rejected
+    with ``QUERY_LIMIT_EXCEEDED`` or ``OPERATION_TIME_LIMIT``. Portals are
+    identified by their domain, so webhook and OAuth calls to one portal share
+    the same budget.
+
+    State is kept in a backend: :class:`MemoryRateLimiterBackend` (default)
+    shares limits between all threads of the process,
+    :class:`FileRateLimiterBackend` shares them between processes.
+
+    Enable the limiter with ``Config().configure(rate_limiter=RateLimiter())``.
+    """
+
+    _BATCH_API_METHOD: Final[Text] = "batch"
+    _JSON_SUFFIX: Final[Text] = ".json"
+
+    __slots__ = ("_backend", "_bucket_size", "_drain_rate", "_operating_limit", "_operating_window")
+
+    _backend: BaseRateLimiterBackend
+    _bucket_size: int
+    _drain_rate: Number
+    _operating_limit: Number
+    _operating_window: Number
+
+    def __init__(
+            self,
+            *,
+            backend: Optional[BaseRateLimiterBackend] = None,
+            bucket_size: int = DEFAULT_RATE_LIMIT_BUCKET_SIZE,
+            drain_rate: Number = DEFAULT_RATE_LIMIT_DRAIN_RATE,
+            operating_limit: Number = DEFAULT_OPERATING_TIME_LIMIT,
+            operating_window: Number = DEFAULT_OPERATING_TIME_WINDOW,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            backend: State storage. Defaults to :class:`MemoryRateLimiterBackend`.
+            bucket_size: Number of requests accepted in a burst.
+            drain_rate: Number of requests per second drained from the bucket.
+            operating_limit: Seconds of execution time one method may consume
+                within an operating window.
+            operating_window: Length of the operating window in seconds. Used
+                only when Bitrix24 blocked a method without reporting the
+                window reset time before.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+
+        if not (isinstance(bucket_size, int) and bucket_size >= 1):
+            raise ValueError("Bucket_size must be a positive integer (>= 1)")
+
+        for name, value in (("Drain_rate", drain_rate), ("Operating_limit", operating_limit), ("Operating_window", operating_window)):
+            if not (isinstance(value, (int, float)) and value > 0):
+                raise ValueError(f"{name} must be a positive number")
+
+        self._backend = backend or MemoryRateLimiterBackend()
+        self._bucket_size = bucket_size
+        self._drain_rate = drain_rate
+        self._operating_limit = operating_limit
+        self._operating_window = operating_window
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}("
+            f"backend={self._backend!r}, "
+            f"bucket_size={self._bucket_size}, "
+            f"drain_rate={self._drain_rate}, "
+            f"operating_limit={self._operating_limit}, "
+            f"operating_window={self._operating_window})"
+        )
+
+    @property
+    def backend(self) -> BaseRateLimiterBackend:
+        """State storage of the limiter."""
+        return self._backend
+
+    @staticmethod
+    def _get_portal_key(url: Text) -> Text:
+        """Return the lower-cased portal domain of a REST URL."""
+        return urlsplit(url).netloc.lower()
+
+    @classmethod
+    def _get_api_method(cls, url: Text) -> Text:
+        """
+        Extract the REST method name from a REST URL.
+
+        Both ``/rest/[auth/]method.json`` and ``/rest/api/[auth/]method``
+        URLs end with the method name.
+        """
+
+        return urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1].lower().removesuffix(cls._JSON_SUFFIX)
+
+    @staticmethod
+    def _get_command_api_method(command: Text) -> Text:
+        """Return the method name of a classic batch command encoded as ``method?query``."""
+        return command.split("?", 1)[0].lower()
+
+    @classmethod
+    def _get_batch_commands(cls, params: Optional[JSONDict]) -> Dict[Text, Text]:
+        """Return batch commands keyed by the string form of their keys."""
+
+        cmd = (params or {}).get("cmd")
+
+        if not isinstance(cmd, dict):
+            return {}
+
+        return {str(key): command for key, command in cmd.items() if isinstance(command, str)}
+
+    def _get_api_methods(self, url: Text, params: Optional[JSONDict]) -> List[Text]:
+        """Return all methods executed by a request, including classic batch commands."""
+
+        api_method = self._get_api_method(url)
+        api_methods = [api_method]
+
+        if api_method == self._BATCH_API_METHOD:
+            api_methods.extend(self._get_command_api_method(command) for command in self._get_batch_commands(params).values())
+
+        return api_methods
+
+    def _get_bucket_level(self, state: JSONDict, now: float) -> float:
+        """Return the bucket level drained up to ``now``."""
+        elapsed = max(0.0, now - state.get("updated_at", now))
+        return max(0.0, state.get("level", 0.0) - elapsed * self._drain_rate)
+
+    def _reserve(self, state: JSONDict, api_methods: Iterable[Text], now: float) -> float:
+        """Reserve one bucket slot in ``state`` and return the required delay."""
+
+        level = self._get_bucket_level(state, now) + 1
+        delay = max(0.0, (level - self._bucket_size) / self._drain_rate)
+
+        state["level"] = level
+        state["updated_at"] = now
+
+        methods_state: Dict[Text, JSONDict] = state.setdefault("methods", {})
+
+        for api_method, method_state in list(methods_state.items()):
+            if method_state["reset_at"] <= now:
+                del methods_state[api_method]
+
+        for api_method in api_methods:
+            method_state = methods_state.get(api_method)
+
+            if method_state is not None and method_state["operating"] + method_state["cost"] >= self._operating_limit:
+                delay = max(delay, method_state["reset_at"] - now)
+
+        return delay
+
+    def reserve(self, url: Text, params: Optional[JSONDict] = None) -> float:
+        """
+        Reserve a slot for one upcoming request.
+
+        The slot is taken immediately, so concurrent callers queue behind each
+        other instead of sending requests at the same moment.
+
+        Args:
+            url: Absolute Bitrix REST endpoint URL.
+            params: Request body parameters.
+
+        Returns:
+            Number of seconds the caller must wait before sending the request.
+        """
+
+        api_methods = self._get_api_methods(url, params)
+        now = time.time()
+
+        return self._backend.update(
+            self._get_portal_key(url),
+            lambda state: self._reserve(state, api_methods, now),
+        )
+
+    @staticmethod
+    def _get_operating_updates(api_method: Text, time_data: Optional[TimeResponseData]) -> List[Tuple[Text, TimeResponseData]]:
+        """Return ``(method, time data)`` pairs carrying operating time information."""
+
+        if isinstance(time_data, dict) and "operating" in time_data and "operating_reset_at" in time_data:
+            return [(api_method, time_data)]
+
+        return []
+
+    def _get_batch_operating_updates(self, params: Optional[JSONDict], json_response: JSONDict) -> List[Tuple[Text, TimeResponseData]]:
+        """Return operating time information of the commands of a classic batch response."""
+
+        result = json_response.get("result")
+        result_time = result.get("result_time") if isinstance(result, dict) else None
+        commands = self._get_batch_commands(params)
+
+        if isinstance(result_time, dict):
+            command_times = result_time.items()
+        elif isinstance(result_time, list):
+            command_times = zip(commands, result_time)
+        else:
+            return []
+
+        updates = []
+
+        for key, time_data in command_times:
+            command = commands.get(str(key))
+
+            if command is not None:
+                updates.extend(self._get_operating_updates(self._get_command_api_method(command), time_data))
+
+        return updates
+
+    @staticmethod
+    def _record_operating(state: JSONDict, updates: Iterable[Tuple[Text, TimeResponseData]]):
+        """Store the latest operating time of every method in ``state``."""
+
+        methods_state: Dict[Text, JSONDict] = state.setdefault("methods", {})
+
+        for api_method, time_data in updates:
+            method_state = methods_state.get(api_method)
+            reset_at = float(time_data["operating_reset_at"])
+
+            if method_state is None or method_state["reset_at"] != reset_at or method_state["operating"] <= time_data["operating"]:
+                methods_state[api_method] = {
+                    "operating": float(time_data["operating"]),
+                    "reset_at": reset_at,
+                    "cost": float(time_data.get("processing") or 0),
+                }
+
+    def record_response(self, url: Text, params: Optional[JSONDict], json_response: JSONDict):
+        """
+        Record operating time reported in a parsed response.
+
+        Operating time of the called method is taken from ``time``; for
+        classic batch requests operating time of every command is taken from
+        ``result.result_time`` as well.
+
+        Args:
+            url: Absolute Bitrix REST endpoint URL.
+            params: Request body parameters.
+            json_response: Parsed Bitrix response.
+        """
+
+        api_method = self._get_api_method(url)
+        updates = self._get_operating_updates(api_method, json_response.get("time"))
+
+        if api_method == self._BATCH_API_METHOD:
+            updates.extend(self._get_batch_operating_updates(params, json_response))
+
+        if updates:
+            self._backend.update(self._get_portal_key(url), lambda state: self._record_operating(state, updates))
+
+    def _record_query_limit(self, state: JSONDict, now: float):
+        """Mark the bucket of a portal as full after the portal rejected a request."""
+        state["level"] = max(self._get_bucket_level(state, now), float(self._bucket_size))
+        state["updated_at"] = now
+
+    def _record_operation_time_limit(self, state: JSONDict, api_methods: Iterable[Text], now: float):
+        """Mark methods as exhausted until their operating window resets."""
+
+        methods_state: Dict[Text, JSONDict] = state.setdefault("methods", {})
+
+        for api_method in api_methods:
+            method_state = methods_state.get(api_method)
+            reset_at = method_state["reset_at"] if method_state is not None and method_state["reset_at"] > now else now + self._operating_window
+
+            methods_state[api_method] = {
+                "operating": float(self._operating_limit),
+                "reset_at": reset_at,
+                "cost": 0.0,
+            }
+
+    def record_error(self, url: Text, params: Optional[JSONDict], error: Exception):
+        """
+        Adjust the portal state after a rate limit error.
+
+        ``QUERY_LIMIT_EXCEEDED`` and ``OVERLOAD_LIMIT`` fill the request bucket
+        of the portal, ``OPERATION_TIME_LIMIT`` blocks the called methods until
+        their operating window resets. Other errors are ignored.
+
+        Args:
+            url: Absolute Bitrix REST endpoint URL.
+            params: Request body parameters.
+            error: Exception raised while parsing the response.
+        """
+
+        now = time.time()
+
+        if isinstance(error, (BitrixAPIQueryLimitExceeded, BitrixAPIOverloadLimit)):
+            self._backend.update(self._get_portal_key(url), lambda state: self._record_query_limit(state, now))
+
+        elif isinstance(error, BitrixAPIOperationTimeLimit):
+            api_methods = self._get_api_methods(url, params)
+            self._backend.update(self._get_portal_key(url), lambda state: self._record_operation_time_limit(state, api_methods, now))
+
+        else:
+            return
+
+        Config().logger.warning(
+            "Bitrix rate limit reached",
+            context={
+                "portal": self._get_portal_key(url),
+                "error": error.ERROR,
+            },
+        )
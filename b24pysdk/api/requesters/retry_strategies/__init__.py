@@ -0,0 +1,11 @@
+from ._base_retry_strategy import BaseRetryStrategy
+from .exponential_backoff_retry_strategy import ExponentialBackoffRetryStrategy
+from .linear_retry_strategy import LinearRetryStrategy
+from .retry_budget import RetryBudget
+
+__all__ = [
+    "BaseRetryStrategy",
+    "ExponentialBackoffRetryStrategy",
+    "LinearRetryStrategy",
+    "RetryBudget",
+]
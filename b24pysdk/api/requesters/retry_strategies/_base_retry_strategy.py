@@ -0,0 +1,103 @@
+from abc import ABC, abstractmethod
+from typing import Final, Optional, Text
+
+import requests
+
+from ....utils.types import JSONDict, Number
+from ..json_codecs import get_json_codec
+
+__all__ = [
+    "BaseRetryStrategy",
+]
+
+
+class BaseRetryStrategy(ABC):
+    """
+    Base class for retry policies of SDK requesters.
+
+    Subclasses implement ``get_retry_delay``; helpers for reading the Bitrix24
+    error code and timing data of an error response are shared here.
+    """
+
+    _MIN_ERROR_STATUS_CODE: Final[int] = 400
+
+    __slots__ = ()
+
+    @classmethod
+    def _get_json(cls, response: requests.Response) -> Optional[JSONDict]:
+        """
+        Return the decoded JSON body of an error response.
+
+        Bodies of successful responses are left to the response parser, so
+        they are decoded only once. Error bodies are decoded by the JSON codec
+        of the current thread configuration.
+
+        Returns:
+            Decoded body, or ``None`` for successful responses and bodies
+            that are not JSON objects.
+        """
+
+        if response.status_code < cls._MIN_ERROR_STATUS_CODE:
+            return None
+
+        try:
+            json_response = get_json_codec().decode(response.content)
+        except ValueError:
+            return None
+
+        return json_response if isinstance(json_response, dict) else None
+
+    @classmethod
+    def _get_error_code(cls, response: requests.Response) -> Optional[Text]:
+        """
+        Return the Bitrix24 error code of an error response.
+
+        Both the legacy ``{"error": "CODE"}`` and the REST v3
+        ``{"error": {"code": "CODE"}}`` formats are supported.
+        """
+
+        json_response = cls._get_json(response)
+
+        if json_response is None:
+            return None
+
+        error = json_response.get("error")
+
+        if isinstance(error, dict):
+            error = error.get("code")
+
+        return error if isinstance(error, str) else None
+
+    @abstractmethod
+    def get_retry_delay(
+            self,
+            *,
+            url: Optional[Text],
+            attempt: int,
+            max_retries: int,
+            initial_retry_delay: Number,
+            retry_delay_increment: Number,
+            response: Optional[requests.Response] = None,
+            error: Optional[Exception] = None,
+    ) -> Optional[Number]:
+        """
+        Decide whether a request attempt should be repeated.
+
+        Args:
+            url: Absolute URL of the request, when known.
+            attempt: Number of attempts made so far, starting with 1.
+            max_retries: Maximum number of request attempts configured for the
+                requester.
+            initial_retry_delay: Delay before the first retry configured for
+                the requester.
+            retry_delay_increment: Additional delay added after each used retry
+                configured for the requester.
+            response: HTTP response of the last attempt, if one was received.
+            error: Transport error raised by the last attempt, if no response
+                was received.
+
+        Returns:
+            Number of seconds to wait before the next attempt, or ``None`` when
+            the response should be returned or the error re-raised.
+        """
+        raise NotImplementedError
@@ -0,0 +1,231 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import AbstractSet, Final, Iterable, Optional, Text
+
+import requests
+
+from ...._constants import MISSING
+from ....constants import DEFAULT_RETRY_MAX_DELAY
+from ....utils.types import Number
+from ._base_retry_strategy import BaseRetryStrategy
+from .retry_budget import RetryBudget
+
+__all__ = [
+    "ExponentialBackoffRetryStrategy",
+]
+
+
+class ExponentialBackoffRetryStrategy(BaseRetryStrategy):
+    """
+    Adaptive retry policy with exponential backoff and full jitter.
+
+    Retries responses with a retryable HTTP status (429, 502, 503, 504 by
+    default) or an error status with a retryable Bitrix24 error code
+    (``QUERY_LIMIT_EXCEEDED``, ``OVERLOAD_LIMIT`` and ``OPERATION_TIME_LIMIT``
+    by default), as well as connection errors. Bodies of successful
+    responses are not inspected. Read timeouts are retried only when enabled, because the
+    server may have already executed a non-idempotent method.
+
+    The delay before retry ``n`` is drawn uniformly from
+    ``[0, min(max_delay, base_delay * 2 ** (n - 1))]``, so workers that failed
+    at the same moment do not retry at the same moment. When the server tells
+    when to come back, through the ``Retry-After`` header or
+    ``time.operating_reset_at``, the strategy waits at least until then; if
+    that is later than ``max_delay``, the error is returned to the caller
+    instead. Retries are additionally limited by a per-portal
+    :class:`RetryBudget`.
+    """
+
+    _DEFAULT_RETRY_STATUS_CODES: Final[AbstractSet[int]] = frozenset({429, 502, 503, 504})
+    _DEFAULT_RETRY_ERROR_CODES: Final[AbstractSet[Text]] = frozenset({"QUERY_LIMIT_EXCEEDED", "OVERLOAD_LIMIT", "OPERATION_TIME_LIMIT"})
+
+    __slots__ = (
+        "_base_delay",
+        "_jitter",
+        "_max_delay",
+        "_retry_budget",
+        "_retry_error_codes",
+        "_retry_on_timeout",
+        "_retry_status_codes",
+    )
+
+    _base_delay: Optional[Number]
+    _jitter: bool
+    _max_delay: Number
+    _retry_budget: Optional[RetryBudget]
+    _retry_error_codes: AbstractSet[Text]
+    _retry_on_timeout: bool
+    _retry_status_codes: AbstractSet[int]
+
+    def __init__(
+            self,
+            *,
+            base_delay: Optional[Number] = None,
+            max_delay: Number = DEFAULT_RETRY_MAX_DELAY,
+            jitter: bool = True,
+            retry_budget: Optional[RetryBudget] = MISSING,
+            retry_status_codes: Optional[Iterable[int]] = None,
+            retry_error_codes: Optional[Iterable[Text]] = None,
+            retry_on_timeout: bool = False,
+    ):
+        """
+        Initialize the strategy.
+
+        Args:
+            base_delay: Delay cap of the first retry. Defaults to the
+                ``initial_retry_delay`` of the requester.
+            max_delay: Longest delay before one retry.
+            jitter: Whether delays are randomized with full jitter.
+            retry_budget: Per-portal retry budget. A new :class:`RetryBudget`
+                is created by default; pass ``None`` to disable the budget.
+            retry_status_codes: HTTP status codes that are retried.
+            retry_error_codes: Bitrix24 error codes (as mapped in
+                ``parse_response``) of error responses that are retried
+                regardless of the status.
+            retry_on_timeout: Whether read timeouts are retried.
+
+        Raises:
+            ValueError: If a delay is not positive.
+        """
+
+        if not (base_delay is None or (isinstance(base_delay, (int, float)) and base_delay > 0)):
+            raise ValueError("Base_delay must be a positive number")
+
+        if not (isinstance(max_delay, (int, float)) and max_delay > 0):
+            raise ValueError("Max_delay must be a positive number")
+
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self._retry_budget = RetryBudget() if retry_budget is MISSING else retry_budget
+        self._retry_status_codes = self._DEFAULT_RETRY_STATUS_CODES if retry_status_codes is None else frozenset(retry_status_codes)
+        self._retry_error_codes = self._DEFAULT_RETRY_ERROR_CODES if retry_error_codes is None else frozenset(retry_error_codes)
+        self._retry_on_timeout = retry_on_timeout
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}("
+            f"base_delay={self._base_delay}, "
+            f"max_delay={self._max_delay}, "
+            f"jitter={self._jitter}, "
+            f"retry_budget={self._retry_budget!r}, "
+            f"retry_on_timeout={self._retry_on_timeout})"
+        )
+
+    @property
+    def retry_budget(self) -> Optional[RetryBudget]:
+        """Per-portal retry budget, or ``None`` when retries are not budgeted."""
+        return self._retry_budget
+
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """Return whether a transport error may be retried."""
+
+        if isinstance(error, requests.ConnectionError):
+            return True
+
+        return self._retry_on_timeout and isinstance(error, requests.Timeout)
+
+    def _is_retryable_response(self, response: requests.Response) -> bool:
+        """Return whether the HTTP status or the Bitrix24 error code of a response may be retried."""
+        return response.status_code in self._retry_status_codes or self._get_error_code(response) in self._retry_error_codes
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> Optional[float]:
+        """Return seconds requested by the ``Retry-After`` header, given either as seconds or as an HTTP date."""
+
+        retry_after = response.headers.get("Retry-After")
+
+        if not retry_after:
+            return None
+
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _get_operating_reset_delay(self, response: requests.Response) -> Optional[float]:
+        """Return seconds until ``time.operating_reset_at`` of an ``OPERATION_TIME_LIMIT`` response."""
+
+        json_response = self._get_json(response)
+        time_data = json_response.get("time") if json_response is not None else None
+
+        if not (isinstance(time_data, dict) and self._get_error_code(response) == "OPERATION_TIME_LIMIT"):
+            return None
+
+        operating_reset_at = time_data.get("operating_reset_at")
+
+        if not isinstance(operating_reset_at, (int, float)):
+            return None
+
+        return max(0.0, operating_reset_at - time.time())
+
+    def _get_backoff_delay(self, attempt: int, base_delay: Number) -> float:
+        """Return the exponential delay of the retry following ``attempt``, with jitter applied."""
+
+        delay = min(float(self._max_delay), base_delay * 2 ** (attempt - 1))
+
+        if self._jitter:
+            delay = random.uniform(0, delay)  # noqa: S311
+
+        return delay
+
+    def get_retry_delay(
+            self,
+            *,
+            url: Optional[Text],
+            attempt: int,
+            max_retries: int,
+            initial_retry_delay: Number,
+            retry_delay_increment: Number,  # noqa: ARG002
+            response: Optional[requests.Response] = None,
+            error: Optional[Exception] = None,
+    ) -> Optional[Number]:
+        """
+        Return a backoff delay for a retryable attempt while attempts and budget remain.
+
+        Args:
+            url: Absolute URL of the request, when known.
+            attempt: Number of attempts made so far, starting with 1.
+            max_retries: Maximum number of request attempts.
+            initial_retry_delay: Default first retry delay cap, used when no
+                ``base_delay`` was configured.
+            retry_delay_increment: Not used by this strategy.
+            response: HTTP response of the last attempt, if one was received.
+            error: Transport error raised by the last attempt.
+
+        Returns:
+            Number of seconds to wait before the next attempt, or ``None``.
+        """
+
+        if attempt >= max_retries:
+            return None
+
+        delay = self._get_backoff_delay(attempt, self._base_delay or initial_retry_delay)
+
+        if response is not None:
+            if not self._is_retryable_response(response):
+                return None
+
+            hints = [hint for hint in (self._get_retry_after(response), self._get_operating_reset_delay(response)) if hint is not None]
+
+            if hints:
+                hint = max(hints)
+
+                if hint > self._max_delay:
+                    return None
+
+                delay = max(delay, hint)
+
+        elif error is None or not self._is_retryable_error(error):
+            return None
+
+        if self._retry_budget is not None and not self._retry_budget.try_acquire(url):
+            return None
+
+        return delay
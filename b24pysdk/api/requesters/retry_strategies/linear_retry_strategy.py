@@ -0,0 +1,56 @@
+from http import HTTPStatus
+from typing import Optional, Text
+
+import requests
+
+from ....utils.types import Number
+from ._base_retry_strategy import BaseRetryStrategy
+
+__all__ = [
+    "LinearRetryStrategy",
+]
+
+
+class LinearRetryStrategy(BaseRetryStrategy):
+    """
+    Default SDK retry policy.
+
+    Retries only HTTP 503 responses. The delay grows linearly: it starts at
+    ``initial_retry_delay + retry_delay_increment`` and grows by
+    ``retry_delay_increment`` with every used retry. Transport errors are not
+    retried.
+    """
+
+    __slots__ = ()
+
+    def get_retry_delay(
+            self,
+            *,
+            url: Optional[Text],  # noqa: ARG002
+            attempt: int,
+            max_retries: int,
+            initial_retry_delay: Number,
+            retry_delay_increment: Number,
+            response: Optional[requests.Response] = None,
+            error: Optional[Exception] = None,  # noqa: ARG002
+    ) -> Optional[Number]:
+        """
+        Return a linear delay for HTTP 503 responses while attempts remain.
+
+        Args:
+            url: Absolute URL of the request, when known.
+            attempt: Number of attempts made so far, starting with 1.
+            max_retries: Maximum number of request attempts.
+            initial_retry_delay: Delay before the first retry.
+            retry_delay_increment: Additional delay added after each used retry.
+            response: HTTP response of the last attempt, if one was received.
+            error: Transport error raised by the last attempt.
+
+        Returns:
+            Number of seconds to wait before the next attempt, or ``None``.
+        """
+
+        if response is None or response.status_code != HTTPStatus.SERVICE_UNAVAILABLE or attempt >= max_retries:
+            return None
+
+        return initial_retry_delay + attempt * retry_delay_increment
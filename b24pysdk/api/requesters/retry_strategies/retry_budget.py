@@ -0,0 +1,97 @@
+import threading
+import time
+from typing import Dict, Optional, Text, Tuple
+from urllib.parse import urlsplit
+
+from ....constants import DEFAULT_RETRY_BUDGET, DEFAULT_RETRY_BUDGET_REFILL_RATE
+from ....utils.types import Number
+
+__all__ = [
+    "RetryBudget",
+]
+
+
+class RetryBudget:
+    """
+    Per-portal budget of retries.
+
+    Every portal domain gets a bucket of ``max_retries`` retries that refills
+    at ``refill_rate`` retries per second. When a portal is failing for all
+    callers at once, the budget stops retries after a short burst, so
+    workers do not keep overloading the portal with synchronized retries.
+
+    The budget is thread-safe; pass the same instance (or the same retry
+    strategy) to all threads that should share it.
+    """
+
+    __slots__ = ("_buckets", "_lock", "_max_retries", "_refill_rate")
+
+    _buckets: Dict[Text, Tuple[float, float]]
+    _lock: threading.Lock
+    _max_retries: int
+    _refill_rate: Number
+
+    def __init__(
+            self,
+            max_retries: int = DEFAULT_RETRY_BUDGET,
+            refill_rate: Number = DEFAULT_RETRY_BUDGET_REFILL_RATE,
+    ):
+        """
+        Initialize the retry budget.
+
+        Args:
+            max_retries: Number of retries one portal may use in a burst.
+            refill_rate: Number of retries per second returned to the budget.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+
+        if not (isinstance(max_retries, int) and max_retries >= 1):
+            raise ValueError("Max_retries must be a positive integer (>= 1)")
+
+        if not (isinstance(refill_rate, (int, float)) and refill_rate > 0):
+            raise ValueError("Refill_rate must be a positive number")
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._max_retries = max_retries
+        self._refill_rate = refill_rate
+
+    def __repr__(self):
+        return f"{type(self).__name__}(max_retries={self._max_retries}, refill_rate={self._refill_rate})"
+
+    @staticmethod
+    def _get_portal_key(url: Optional[Text]) -> Text:
+        """Return the lower-cased domain of ``url``, or an empty key when the URL is unknown."""
+        return urlsplit(url).netloc.lower() if url else ""
+
+    def try_acquire(self, url: Optional[Text]) -> bool:
+        """
+        Take one retry from the budget of the portal of ``url``.
+
+        Args:
+            url: Absolute URL of the request that is about to be retried.
+
+        Returns:
+            ``True`` if the retry is allowed, ``False`` if the budget is spent.
+        """
+
+        key = self._get_portal_key(url)
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(self._max_retries), now))
+            tokens = min(float(self._max_retries), tokens + (now - updated_at) * self._refill_rate)
+
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return False
+
+            self._buckets[key] = (tokens - 1, now)
+            return True
+
+    def reset(self):
+        """Restore the full budget of all portals."""
+        with self._lock:
+            self._buckets.clear()
@@ -0,0 +1,62 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Final, Text, Tuple
+
+from ._base_async_transport import BaseAsyncHTTPTransport
+
+if TYPE_CHECKING:
+    from .aiohttp_async_transport import AIOHTTPAsyncTransport
+    from .httpx_async_transport import HTTPXAsyncTransport
+
+__all__ = [
+    "AIOHTTPAsyncTransport",
+    "BaseAsyncHTTPTransport",
+    "HTTPXAsyncTransport",
+    "get_default_async_transport",
+]
+
+_TRANSPORT_MODULES: Final[Dict[Text, Text]] = {
+    "AIOHTTPAsyncTransport": ".aiohttp_async_transport",
+    "HTTPXAsyncTransport": ".httpx_async_transport",
+}
+
+_DEFAULT_TRANSPORT_PRIORITY: Final[Tuple[Text, ...]] = (
+    "HTTPXAsyncTransport",
+    "AIOHTTPAsyncTransport",
+)
+
+
+def __getattr__(name: Text) -> Any:
+    try:
+        module_path = _TRANSPORT_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = import_module(module_path, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+
+    return value
+
+
+def get_default_async_transport() -> BaseAsyncHTTPTransport:
+    """
+    Create an async transport for the first installed HTTP backend.
+
+    ``httpx`` is preferred over ``aiohttp``.
+
+    Returns:
+        New transport sized from the current SDK configuration.
+
+    Raises:
+        ImportError: If neither ``httpx`` nor ``aiohttp`` is installed.
+    """
+
+    for name in _DEFAULT_TRANSPORT_PRIORITY:
+        try:
+            transport_class = __getattr__(name)
+        except ImportError:
+            continue
+
+        return transport_class()
+
+    raise ImportError("Async requests require optional dependency httpx or aiohttp. Install b24pysdk[httpx] or b24pysdk[aiohttp].")
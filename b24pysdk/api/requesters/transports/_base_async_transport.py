@@ -0,0 +1,277 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Generic, Mapping, Optional, Text, Tuple, TypeVar
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ...._config import Config
+from ....utils.types import JSONDict, Number, Timeout
+
+__all__ = [
+    "BaseAsyncHTTPTransport",
+]
+
+_ClientT = TypeVar("_ClientT")
+
+
+class BaseAsyncHTTPTransport(ABC, Generic[_ClientT]):
+    """
+    Base class for asynchronous HTTP transports.
+
+    Owns one pooled client of the underlying HTTP library and sizes its
+    connection pool from :class:`~b24pysdk.Config` the same way
+    ``HTTPSessionPool`` sizes synchronous sessions: ``http_pool_connections``
+    hosts with at most ``http_pool_maxsize`` keep-alive connections each,
+    dropped after ``http_session_idle_timeout`` seconds of inactivity.
+
+    Pooled clients are bound to the event loop they were created in, so the
+    client is closed and recreated transparently when the transport is used
+    from another running loop. Connections of a loop that has already been
+    closed can only be released by the garbage collector, so call
+    :meth:`aclose` before the loop ends to shut them down cleanly.
+    """
+
+    __slots__ = ("_client", "_keepalive_expiry", "_loop", "_pool_connections", "_pool_maxsize")
+
+    _client: Optional[_ClientT]
+    _keepalive_expiry: Number
+    _loop: Optional[asyncio.AbstractEventLoop]
+    _pool_connections: int
+    _pool_maxsize: int
+
+    def __init__(
+            self,
+            *,
+            pool_connections: Optional[int] = None,
+            pool_maxsize: Optional[int] = None,
+            keepalive_expiry: Optional[Number] = None,
+    ):
+        """
+        Initialize transport pool sizing.
+
+        Args:
+            pool_connections: Number of hosts kept in the connection pool.
+                Falls back to ``Config().http_pool_connections``.
+            pool_maxsize: Maximum number of connections to one host. Falls
+                back to ``Config().http_pool_maxsize``.
+            keepalive_expiry: Seconds after which an idle keep-alive connection
+                is closed. Falls back to ``Config().http_session_idle_timeout``.
+        """
+        config = Config()
+        self._pool_connections = pool_connections or config.http_pool_connections
+        self._pool_maxsize = pool_maxsize or config.http_pool_maxsize
+        self._keepalive_expiry = keepalive_expiry or config.http_session_idle_timeout
+        self._client = None
+        self._loop = None
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"pool_connections={self._pool_connections}, "
+            f"pool_maxsize={self._pool_maxsize}, "
+            f"keepalive_expiry={self._keepalive_expiry})"
+        )
+
+    @property
+    def _max_connections(self) -> int:
+        """Total number of connections the pooled client may open."""
+        return self._pool_connections * self._pool_maxsize
+
+    @staticmethod
+    def _split_timeout(timeout: Timeout) -> Tuple[Optional[Number], Optional[Number]]:
+        """
+        Split a ``requests``-style timeout into ``(connect_timeout, read_timeout)``.
+
+        Args:
+            timeout: Single number applied to both phases, or a
+                ``(connect_timeout, read_timeout)`` tuple.
+
+        Returns:
+            Connect and read timeouts in seconds.
+        """
+        if isinstance(timeout, tuple):
+            return timeout
+        else:
+            return timeout, timeout
+
+    @staticmethod
+    def _make_response(
+            *,
+            status_code: int,
+            content: bytes,
+            headers: Mapping[Text, Text],
+            url: Text,
+            reason: Optional[Text] = None,
+    ) -> requests.Response:
+        """
+        Build a fully read ``requests.Response`` from transport response data.
+
+        The SDK parses responses and raises errors from ``requests.Response``
+        objects, so async transports convert their native responses to it.
+        """
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+        response.headers = CaseInsensitiveDict(headers)
+        response.url = url
+        response.reason = reason
+        response.encoding = get_encoding_from_headers(response.headers)
+
+        return response
+
+    async def _get_client(self) -> _ClientT:
+        """
+        Return the pooled client of the running event loop, creating it when needed.
+
+        A client created in another event loop is closed before it is replaced.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        if self._client is not None and self._loop is not loop:
+            client, client_loop = self._client, self._loop
+            self._client = None
+            self._loop = None
+
+            await self._close_stale_client(client, client_loop)
+
+        if self._client is None:
+            self._client = self._make_client()
+            self._loop = loop
+
+            logger = Config().logger
+
+            if logger.is_enabled_for(logger.DEBUG):
+                logger.debug(
+                    "opened async http transport pool",
+                    context={
+                        "transport": repr(self),
+                    },
+                )
+
+        return self._client
+
+    async def _close_stale_client(self, client: _ClientT, loop: Optional[asyncio.AbstractEventLoop]):
+        """
+        Close a client created in another event loop.
+
+        The client is closed in its own loop while that loop is running in
+        another thread, and in the running loop otherwise. Connections bound to
+        an already closed loop cannot always be shut down cleanly, so failures
+        are logged instead of failing the request that replaces the client.
+        """
+
+        try:
+            if loop is not None and loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._close_client(client), loop))
+            else:
+                await self._close_client(client)
+
+        except Exception as error:  # noqa: BLE001 - a stale pool must not fail the current request
+            Config().logger.warning(
+                "failed to close stale async http transport pool",
+                context={
+                    "transport": repr(self),
+                    "error": repr(error),
+                },
+            )
+
+    @abstractmethod
+    def _make_client(self) -> _ClientT:
+        """Create a pooled client of the underlying HTTP library."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _send(
+            self,
+            client: _ClientT,
+            method: Text,
+            url: Text,
+            *,
+            params: Optional[JSONDict],
+            json: Optional[JSONDict],
+            data: Optional[bytes],
+            headers: Optional[JSONDict],
+            timeout: Timeout,
+            allow_redirects: bool,
+    ) -> requests.Response:
+        """Send one request with ``client`` and return the converted response."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _close_client(self, client: _ClientT):
+        """Close connections owned by ``client``."""
+        raise NotImplementedError
+
+    async def request(
+            self,
+            method: Text,
+            url: Text,
+            *,
+            params: Optional[JSONDict] = None,
+            json: Optional[JSONDict] = None,
+            data: Optional[bytes] = None,
+            headers: Optional[JSONDict] = None,
+            timeout: Timeout = None,
+            allow_redirects: bool = True,
+    ) -> requests.Response:
+        """
+        Send one HTTP request through the pooled client.
+
+        Args:
+            method: HTTP method name.
+            url: Absolute request URL.
+            params: Optional query string parameters.
+            json: Optional JSON request body, serialized by the HTTP library.
+            data: Optional raw request body, sent as is.
+            headers: Optional request headers.
+            timeout: Timeout with ``requests`` semantics.
+            allow_redirects: Whether redirects should be followed.
+
+        Returns:
+            Fully read HTTP response.
+
+        Raises:
+            requests.Timeout: If the request times out.
+            requests.ConnectionError: If the request fails before a valid
+                HTTP response is received.
+        """
+        return await self._send(
+            await self._get_client(),
+            method,
+            url,
+            params=params,
+            json=json,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+        )
+
+    async def aclose(self):
+        """Close pooled connections of the transport."""
+
+        client: Any = self._client
+        loop = self._loop
+
+        self._client = None
+        self._loop = None
+
+        if client is not None:
+            if loop is asyncio.get_running_loop():
+                await self._close_client(client)
+            else:
+                await self._close_stale_client(client, loop)
+
+            logger = Config().logger
+
+            if logger.is_enabled_for(logger.DEBUG):
+                logger.debug(
+                    "closed async http transport pool",
+                    context={
+                        "transport": repr(self),
+                    },
+                )
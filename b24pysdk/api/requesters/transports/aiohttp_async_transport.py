@@ -0,0 +1,80 @@
+import asyncio
+from typing import Optional, Text
+
+import requests
+
+from ....utils.types import JSONDict, Timeout
+from ._base_async_transport import BaseAsyncHTTPTransport
+
+try:
+    import aiohttp
+except ImportError as error:
+    raise ImportError("AIOHTTP async transport requires optional dependency aiohttp. Install b24pysdk[aiohttp].") from error
+
+__all__ = [
+    "AIOHTTPAsyncTransport",
+]
+
+
+class AIOHTTPAsyncTransport(BaseAsyncHTTPTransport[aiohttp.ClientSession]):
+    """Asynchronous HTTP transport backed by a pooled ``aiohttp.ClientSession``."""
+
+    __slots__ = ()
+
+    def _make_client(self) -> aiohttp.ClientSession:
+        """Create an ``aiohttp.ClientSession`` with SDK connector limits."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self._max_connections,
+                limit_per_host=self._pool_maxsize,
+                keepalive_timeout=self._keepalive_expiry,
+            ),
+        )
+
+    async def _send(
+            self,
+            client: aiohttp.ClientSession,
+            method: Text,
+            url: Text,
+            *,
+            params: Optional[JSONDict],
+            json: Optional[JSONDict],
+            data: Optional[bytes],
+            headers: Optional[JSONDict],
+            timeout: Timeout,
+            allow_redirects: bool,
+    ) -> requests.Response:
+        """Send one request with ``aiohttp`` and map its errors to ``requests`` errors."""
+
+        connect_timeout, read_timeout = self._split_timeout(timeout)
+
+        try:
+            async with client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                data=data,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout),
+                allow_redirects=allow_redirects,
+            ) as response:
+                content = await response.read()
+
+        except asyncio.TimeoutError as error:
+            raise requests.Timeout(str(error)) from error
+
+        except aiohttp.ClientError as error:
+            raise requests.ConnectionError(str(error)) from error
+
+        return self._make_response(
+            status_code=response.status,
+            content=content,
+            headers=response.headers,
+            url=str(response.url),
+            reason=response.reason,
+        )
+
+    async def _close_client(self, client: aiohttp.ClientSession):
+        """Close the ``aiohttp`` session and its connector."""
+        await client.close()
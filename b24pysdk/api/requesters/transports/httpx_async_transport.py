@@ -0,0 +1,84 @@
+from typing import Optional, Text
+
+import requests
+
+from ....utils.types import JSONDict, Timeout
+from ._base_async_transport import BaseAsyncHTTPTransport
+
+try:
+    import httpx
+except ImportError as error:
+    raise ImportError("HTTPX async transport requires optional dependency httpx. Install b24pysdk[httpx].") from error
+
+__all__ = [
+    "HTTPXAsyncTransport",
+]
+
+
+class HTTPXAsyncTransport(BaseAsyncHTTPTransport[httpx.AsyncClient]):
+    """Asynchronous HTTP transport backed by a pooled ``httpx.AsyncClient``."""
+
+    __slots__ = ()
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """
+        Create an ``httpx.AsyncClient`` with SDK pool limits.
+
+        Requests waiting for a free pooled connection are queued without a
+        pool timeout, so many concurrent calls are throttled by the pool size
+        instead of failing.
+        """
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections,
+                keepalive_expiry=self._keepalive_expiry,
+            ),
+        )
+
+    async def _send(
+            self,
+            client: httpx.AsyncClient,
+            method: Text,
+            url: Text,
+            *,
+            params: Optional[JSONDict],
+            json: Optional[JSONDict],
+            data: Optional[bytes],
+            headers: Optional[JSONDict],
+            timeout: Timeout,
+            allow_redirects: bool,
+    ) -> requests.Response:
+        """Send one request with ``httpx`` and map its errors to ``requests`` errors."""
+
+        connect_timeout, read_timeout = self._split_timeout(timeout)
+
+        try:
+            response = await client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                content=data,
+                headers=headers,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout, pool=None),
+                follow_redirects=allow_redirects,
+            )
+
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(str(error)) from error
+
+        except httpx.HTTPError as error:
+            raise requests.ConnectionError(str(error)) from error
+
+        return self._make_response(
+            status_code=response.status_code,
+            content=response.content,
+            headers=response.headers,
+            url=str(response.url),
+            reason=response.reason_phrase,
+        )
+
+    async def _close_client(self, client: httpx.AsyncClient):
+        """Close the ``httpx`` client and its pooled connections."""
+        await client.aclose()
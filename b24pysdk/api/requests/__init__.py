@@ -1,12 +1,22 @@
 from .abstract_bitrix_api_request import AbstractBitrixAPIRequest
 from .bitrix_api_base_request import BitrixAPIBaseRequest
 from .bitrix_api_batch_request import BitrixAPIBatchesRequest, BitrixAPIBatchRequest
-from .bitrix_api_list_request import BitrixAPIBaseListRequest, BitrixAPIListFastRequest, BitrixAPIListRequest
+from .bitrix_api_download_request import BitrixAPIDownloadRequest
+from .bitrix_api_list_request import (
+    BitrixAPIBaseListRequest,
+    BitrixAPIListCompactRequest,
+    BitrixAPIListFastRequest,
+    BitrixAPIListRequest,
+    BitrixAPIListStreamRequest,
+)
 from .bitrix_api_raw_request import BitrixAPIRawRequest
 from .bitrix_api_request import BitrixAPIRequest
+from .bitrix_api_request_coalescer import BitrixAPIRequestCoalescer
+from .bitrix_api_upload_request import BitrixAPIUploadRequest
 from .bitrix_api_value_request import (
     BitrixAPIBaseValueRequest,
     BitrixAPIValueRequest,
+    BitrixAPIValuesListCompactRequest,
     BitrixAPIValuesListFastRequest,
     BitrixAPIValuesListRequest,
     BitrixAPIValuesRequest,
@@ -19,11 +29,17 @@ __all__ = [
     "BitrixAPIBaseValueRequest",
     "BitrixAPIBatchRequest",
     "BitrixAPIBatchesRequest",
+    "BitrixAPIDownloadRequest",
+    "BitrixAPIListCompactRequest",
     "BitrixAPIListFastRequest",
     "BitrixAPIListRequest",
+    "BitrixAPIListStreamRequest",
     "BitrixAPIRawRequest",
     "BitrixAPIRequest",
+    "BitrixAPIRequestCoalescer",
+    "BitrixAPIUploadRequest",
     "BitrixAPIValueRequest",
+    "BitrixAPIValuesListCompactRequest",
     "BitrixAPIValuesListFastRequest",
     "BitrixAPIValuesListRequest",
     "BitrixAPIValuesRequest",
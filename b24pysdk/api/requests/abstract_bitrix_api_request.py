@@ -1,9 +1,12 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Optional, Text
+from typing import Any, ClassVar, Generic, Optional, Text
 
 from ...protocols import BitrixTokenFullProtocol
 from ...utils.type_vars import ResponseT
 from ...utils.types import B24RequestTuple, JSONDict
+from ..instrumentation import APICallScope, api_call_hooks
+from .bitrix_api_request_coalescer import BitrixAPIRequestCoalescer
 
 __all__ = [
     "AbstractBitrixAPIRequest",
@@ -16,16 +19,27 @@ class AbstractBitrixAPIRequest(ABC, Generic[ResponseT]):
 
     Stores request parameters, executes the API call through a Bitrix token,
     converts the raw JSON response into a typed response object, and caches the
-    converted response after the first access.
+    converted response after the first access. ``acall`` executes the same
+    request asynchronously.
+
+    Requests of classes with ``_COALESCIBLE`` enabled that are created inside
+    a ``BitrixAPIRequestCoalescer`` block of their token are executed together
+    with other pending requests in shared batch calls.
+
+    While observers are connected to ``api_call_hooks``, the time spent
+    converting the response is added to the record of the call.
     """
 
-    __slots__ = ("_api_method", "_bitrix_token", "_kwargs", "_params", "_response")
+    _COALESCIBLE: ClassVar[bool] = False
+
+    __slots__ = ("_api_method", "_bitrix_token", "_coalescer", "_kwargs", "_params", "_response")
 
     _bitrix_token: BitrixTokenFullProtocol
     _api_method: Text
     _params: Optional[JSONDict]
     _kwargs: JSONDict
     _response: Optional[ResponseT]
+    _coalescer: Optional[BitrixAPIRequestCoalescer]
 
     def __init__(
             self,
@@ -49,6 +63,7 @@ class AbstractBitrixAPIRequest(ABC, Generic[ResponseT]):
         self._params = params
         self._kwargs = kwargs
         self._response = None
+        self._coalescer = BitrixAPIRequestCoalescer.register(self) if self._COALESCIBLE else None
 
     def __str__(self):
         return f"<{self.__class__.__name__} {self._api_method}({self._param_string})>"
@@ -96,19 +111,49 @@ class AbstractBitrixAPIRequest(ABC, Generic[ResponseT]):
             return self._get_and_set_response()
         return self._response
 
+    def _discard_coalescer(self):
+        """Execute the request on its own instead of waiting for a coalesced batch call."""
+
+        coalescer, self._coalescer = self._coalescer, None
+
+        if coalescer is not None:
+            coalescer.discard(self)
+
     def _call(self) -> Any:
         """
         Execute the raw Bitrix24 API call.
 
+        A request registered with a coalescer is fulfilled once from the
+        coalesced batch call; later calls are sent on their own.
+
         Returns:
             Raw JSON response returned by the token.
         """
+
+        coalescer, self._coalescer = self._coalescer, None
+
+        if coalescer is not None:
+            return coalescer.fulfill(self)
+
         return self._bitrix_token.call_method(
             api_method=self._api_method,
             params=self._params,
             **self._kwargs,
         )
 
+    async def _acall(self) -> Any:
+        """
+        Asynchronously execute the raw Bitrix24 API call.
+
+        Returns:
+            Raw JSON response returned by the token.
+        """
+        return await self._bitrix_token.acall_method(
+            api_method=self._api_method,
+            params=self._params,
+            **self._kwargs,
+        )
+
     @abstractmethod
     def _convert_response(self, json_response: Any) -> ResponseT:
         """
@@ -122,6 +167,15 @@ class AbstractBitrixAPIRequest(ABC, Generic[ResponseT]):
         """
         raise NotImplementedError
 
+    def _convert_recorded_response(self, json_response: Any, scope: APICallScope) -> ResponseT:
+        """Convert the response of an instrumented call, recording the conversion time."""
+
+        started = time.perf_counter()
+        response = self._convert_response(json_response)
+        scope.convert_time = time.perf_counter() - started
+
+        return response
+
     def _get_and_set_response(self) -> ResponseT:
         """
         Execute the request, convert response, and cache it.
@@ -129,7 +183,14 @@ class AbstractBitrixAPIRequest(ABC, Generic[ResponseT]):
         Returns:
             Converted response object.
         """
-        self._response = self._convert_response(self._call())
+
+        if not api_call_hooks.enabled:
+            self._response = self._convert_response(self._call())
+            return self._response
+
+        with api_call_hooks.collect() as scope:
+            self._response = self._convert_recorded_response(self._call(), scope)
+
         return self._response
 
     def call(self) -> ResponseT:
@@ -143,3 +204,25 @@ class AbstractBitrixAPIRequest(ABC, Generic[ResponseT]):
             Converted response object.
         """
         return self._get_and_set_response()
+
+    async def acall(self) -> ResponseT:
+        """
+        Asynchronously execute the request.
+
+        Like ``call``, always performs a new API call and replaces the cached
+        response, so ``response`` and its derived properties can be read
+        afterwards without blocking.
+
+        Returns:
+            Converted response object.
+        """
+        self._discard_coalescer()
+
+        if not api_call_hooks.enabled:
+            self._response = self._convert_response(await self._acall())
+            return self._response
+
+        with api_call_hooks.collect() as scope:
+            self._response = self._convert_recorded_response(await self._acall(), scope)
+
+        return self._response
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Final, Generic, Mapping, Sequence, Text, overload
+from typing import TYPE_CHECKING, Final, Generic, Mapping, Optional, Sequence, Text, overload
 
 from ...protocols import BitrixTokenFullProtocol
 from ...schemas.api import BatchResponseData
@@ -27,10 +27,11 @@ class BitrixAPIBatchesRequest(BitrixAPIBaseRequest[BitrixAPIBatchResponse, B24AP
 
     _API_METHOD: Final[Text] = "batch"
 
-    __slots__ = ("_bitrix_api_requests", "_halt")
+    __slots__ = ("_bitrix_api_requests", "_halt", "_max_concurrency")
 
     _bitrix_api_requests: BABatchRequestsT
     _halt: bool
+    _max_concurrency: Optional[int]
 
     def __init__(
             self,
@@ -38,6 +39,7 @@ class BitrixAPIBatchesRequest(BitrixAPIBaseRequest[BitrixAPIBatchResponse, B24AP
             bitrix_token: BitrixTokenFullProtocol,
             bitrix_api_requests: BABatchRequestsT,
             halt: bool = False,
+            max_concurrency: Optional[int] = None,
             **kwargs,
     ):
         """
@@ -47,6 +49,8 @@ class BitrixAPIBatchesRequest(BitrixAPIBaseRequest[BitrixAPIBatchResponse, B24AP
             bitrix_token: Token-like object used to execute Bitrix24 API calls.
             bitrix_api_requests: Mapping or sequence of request objects to execute.
             halt: Whether to stop batch execution after the first failed command.
+            max_concurrency: Maximum number of batch requests executed at the
+                same time. ``None`` executes them sequentially.
             **kwargs: Extra options forwarded to the token call.
         """
         super().__init__(
@@ -56,6 +60,7 @@ class BitrixAPIBatchesRequest(BitrixAPIBaseRequest[BitrixAPIBatchResponse, B24AP
         )
         self._bitrix_api_requests = bitrix_api_requests
         self._halt = halt
+        self._max_concurrency = max_concurrency
 
     def __str__(self):
         return f"<{self.__class__.__name__} {self._api_method}({self._bitrix_api_requests_string})>"
@@ -65,7 +70,8 @@ class BitrixAPIBatchesRequest(BitrixAPIBaseRequest[BitrixAPIBatchResponse, B24AP
             f"{self.__class__.__name__}("
             f"bitrix_token={self._bitrix_token}, "
             f"bitrix_api_requests={self._bitrix_api_requests_string}, "
-            f"halt={self._halt})"
+            f"halt={self._halt}, "
+            f"max_concurrency={self._max_concurrency})"
         )
 
     @property
@@ -154,6 +160,21 @@ class BitrixAPIBatchesRequest(BitrixAPIBaseRequest[BitrixAPIBatchResponse, B24AP
         return self._bitrix_token.call_batches(
             methods=self._methods,
             halt=self._halt,
+            max_concurrency=self._max_concurrency,
+            **self._kwargs,
+        )
+
+    async def _acall(self) -> BatchResponseData:
+        """
+        Asynchronously execute wrapped requests using the multi-batch caller.
+
+        Returns:
+            Raw JSON response returned by ``acall_batches``.
+        """
+        return await self._bitrix_token.acall_batches(
+            methods=self._methods,
+            halt=self._halt,
+            max_concurrency=self._max_concurrency,
             **self._kwargs,
         )
 
@@ -222,3 +243,17 @@ class BitrixAPIBatchRequest(BitrixAPIBatchesRequest[BABatchRequestsT], Generic[B
             ignore_size_limit=self._ignore_size_limit,
             **self._kwargs,
         )
+
+    async def _acall(self) -> BatchResponseData:
+        """
+        Asynchronously execute wrapped requests using the single-batch caller.
+
+        Returns:
+            Raw JSON response returned by ``acall_batch``.
+        """
+        return await self._bitrix_token.acall_batch(
+            methods=self._methods,
+            halt=self._halt,
+            ignore_size_limit=self._ignore_size_limit,
+            **self._kwargs,
+        )
@@ -0,0 +1,208 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, BinaryIO, Final, List, Optional, Sequence, Text, Tuple, Union
+
+from ..._config import Config
+from ...schemas.api import ResponseData
+from ...utils.types import JSONDict, ProgressCallback
+from ..callers import call_download
+from ..callers._utils import get_empty_time
+from ..responses import BitrixAPIResponse
+from .bitrix_api_base_request import BitrixAPIBaseRequest
+
+if TYPE_CHECKING:
+    import os
+
+    from .bitrix_api_request import BitrixAPIRequest
+
+__all__ = [
+    "BitrixAPIDownloadRequest",
+]
+
+
+class BitrixAPIDownloadRequest(BitrixAPIBaseRequest[BitrixAPIResponse[int], int]):
+    """
+    Lazy request object for downloading a file into a path or a writable file.
+
+    API methods that respond with file content, named ``*.download`` (for
+    example ``catalog.product.download``), are requested directly through
+    ``call_method_download`` of the token. Other methods, for example
+    ``disk.file.get``, are called first, and the file is then fetched from
+    ``DOWNLOAD_URL`` of their result through ``call_download``. Both paths
+    stream the content in chunks and resume interrupted transfers.
+
+    The response result is the size of the downloaded content in bytes.
+    """
+
+    DEFAULT_MAX_CONCURRENCY: Final[int] = 4
+    """Default number of downloads executed at the same time by ``call_concurrently``."""
+
+    _DOWNLOAD_METHOD_SUFFIX: Final[Text] = ".download"
+    _DOWNLOAD_URL_KEY: Final[Text] = "DOWNLOAD_URL"
+    _REQUESTER_OPTIONS: Final[Tuple[Text, ...]] = ("timeout", "max_retries", "initial_retry_delay", "retry_delay_increment")
+
+    __slots__ = ("_chunk_size", "_destination", "_progress_callback", "_resume")
+
+    _destination: Union[Text, "os.PathLike[Text]", BinaryIO]
+    _resume: bool
+    _chunk_size: Optional[int]
+    _progress_callback: Optional[ProgressCallback]
+
+    def __init__(
+            self,
+            *,
+            bitrix_api_request: "BitrixAPIRequest",
+            destination: Union[Text, "os.PathLike[Text]", BinaryIO],
+            resume: bool = False,
+            chunk_size: Optional[int] = None,
+            progress_callback: Optional[ProgressCallback] = None,
+            **kwargs,
+    ):
+        """
+        Initialize a download request from a base API request.
+
+        Args:
+            bitrix_api_request: Source API request returning file content or a
+                ``DOWNLOAD_URL``.
+            destination: Path of the file to write or a binary file object
+                opened for writing.
+            resume: Whether to keep content already present in the destination
+                and download only the rest.
+            chunk_size: Size of chunks written to the destination, in bytes.
+            progress_callback: Optional callable receiving the number of bytes
+                downloaded and the total size, ``None`` when unknown.
+            **kwargs: Extra options overriding or extending source request options.
+        """
+        super().__init__(
+            bitrix_token=bitrix_api_request._bitrix_token,
+            api_method=bitrix_api_request._api_method,
+            params=bitrix_api_request._params,
+            **bitrix_api_request._kwargs | kwargs,
+        )
+        self._destination = destination
+        self._resume = resume
+        self._chunk_size = chunk_size
+        self._progress_callback = progress_callback
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"bitrix_token={self._bitrix_token}, "
+            f"api_method='{self._api_method}', "
+            f"params={self._params}, "
+            f"destination={self._destination!r})"
+        )
+
+    @property
+    def _download_options(self) -> JSONDict:
+        """Return options of the download transfer."""
+        return dict(
+            destination=self._destination,
+            resume=self._resume,
+            chunk_size=self._chunk_size,
+            progress_callback=self._progress_callback,
+        )
+
+    def _convert_response(self, json_response: ResponseData) -> BitrixAPIResponse[int]:
+        """
+        Convert raw JSON response into ``BitrixAPIResponse``.
+
+        Args:
+            json_response: Response data with the downloaded size as result.
+
+        Returns:
+            Parsed Bitrix API response.
+        """
+        return BitrixAPIResponse.from_dict(json_response)
+
+    def _call(self) -> ResponseData:
+        """
+        Download the file content.
+
+        Returns:
+            Response data with the size of the downloaded content as result.
+            Timing metadata is taken from the call returning ``DOWNLOAD_URL``,
+            and is empty for direct method downloads.
+
+        Raises:
+            ValueError: If the API method result has no ``DOWNLOAD_URL``.
+        """
+
+        if self._api_method.endswith(self._DOWNLOAD_METHOD_SUFFIX):
+            return {
+                "result": self._bitrix_token.call_method_download(
+                    api_method=self._api_method,
+                    params=self._params,
+                    **self._kwargs | self._download_options,
+                ),
+                "time": get_empty_time(),
+            }
+
+        json_response = self._bitrix_token.call_method(
+            api_method=self._api_method,
+            params=self._params,
+            **self._kwargs,
+        )
+
+        result = json_response.get("result")
+
+        if not (isinstance(result, dict) and result.get(self._DOWNLOAD_URL_KEY)):
+            raise ValueError(f"{self._api_method} did not return {self._DOWNLOAD_URL_KEY}")
+
+        return {
+            "result": call_download(
+                result[self._DOWNLOAD_URL_KEY],
+                **self._download_options,
+                **{key: self._kwargs[key] for key in self._REQUESTER_OPTIONS if key in self._kwargs},
+            ),
+            "time": json_response["time"],
+        }
+
+    async def _acall(self) -> ResponseData:
+        """
+        Reject asynchronous execution.
+
+        Raises:
+            TypeError: Always, because async transports load whole bodies into memory.
+        """
+        raise TypeError("Download requests cannot be executed asynchronously, use call() instead.")
+
+    @classmethod
+    def call_concurrently(
+            cls,
+            download_requests: Sequence["BitrixAPIDownloadRequest"],
+            *,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[BitrixAPIResponse[int]]:
+        """
+        Execute several download requests in a bounded pool of worker threads.
+
+        Worker threads use the SDK configuration of the calling thread. When
+        a download fails, downloads that have not started yet are cancelled
+        and the error is raised after downloads in progress are finished.
+
+        Args:
+            download_requests: Download requests to execute.
+            max_concurrency: Maximum number of downloads executed at the same time.
+
+        Returns:
+            Responses of the requests, in the order of ``download_requests``.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is not a positive integer.
+        """
+
+        if not (isinstance(max_concurrency, int) and max_concurrency >= 1):
+            raise ValueError("Max_concurrency must be a positive integer (>= 1)")
+
+        if not download_requests:
+            return []
+
+        max_workers = min(max_concurrency, len(download_requests))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, initializer=Config().bind_to_current_thread)
+
+        try:
+            futures = [executor.submit(download_request.call) for download_request in download_requests]
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(cancel_futures=True)
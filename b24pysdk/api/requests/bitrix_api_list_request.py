@@ -1,10 +1,11 @@
 from abc import ABC
 from typing import TYPE_CHECKING, Generic, Optional
 
-from ...schemas.api import ListFastResponseData, ListResponseData
+from ...schemas.api import ListCompactResponseData, ListFastResponseData, ListResponseData
+from ...utils.compact_rows import CompactRows
 from ...utils.type_vars import BAListResponseT, BAListResultT
 from ...utils.types import JSONGenerator, JSONList
-from ..responses import BitrixAPIListFastResponse, BitrixAPIListResponse
+from ..responses import BitrixAPIListCompactResponse, BitrixAPIListFastResponse, BitrixAPIListResponse
 from .bitrix_api_base_request import BitrixAPIBaseRequest
 
 if TYPE_CHECKING:
@@ -12,8 +13,10 @@ if TYPE_CHECKING:
 
 __all__ = [
     "BitrixAPIBaseListRequest",
+    "BitrixAPIListCompactRequest",
     "BitrixAPIListFastRequest",
     "BitrixAPIListRequest",
+    "BitrixAPIListStreamRequest",
 ]
 
 
@@ -99,6 +102,144 @@ class BitrixAPIListRequest(BitrixAPIBaseListRequest[BitrixAPIListResponse, JSONL
             **self._kwargs,
         )
 
+    async def _acall(self) -> ListResponseData:
+        """
+        Asynchronously execute the request using standard list pagination.
+
+        Returns:
+            Raw JSON response returned by ``acall_list``.
+        """
+        return await self._bitrix_token.acall_list(
+            api_method=self._api_method,
+            params=self._params,
+            limit=self._limit,
+            **self._kwargs,
+        )
+
+
+class BitrixAPIListCompactRequest(BitrixAPIBaseListRequest[BitrixAPIListCompactResponse, CompactRows]):
+    """
+    Lazy request object for loading a paginated Bitrix24 list compactly.
+
+    Executes the wrapped API method through ``call_list`` in streaming mode and
+    packs items into ``CompactRows`` batch by batch, so only one page of raw
+    dictionaries is held in memory while the list is loaded. The response is
+    converted into ``BitrixAPIListCompactResponse``.
+    """
+
+    __slots__ = ()
+
+    def _convert_response(self, json_response: ListCompactResponseData) -> BitrixAPIListCompactResponse:
+        """
+        Convert raw JSON response into ``BitrixAPIListCompactResponse``.
+
+        Args:
+            json_response: Raw JSON response with the result packed into
+                ``CompactRows``.
+
+        Returns:
+            Parsed list response with compact result items.
+        """
+        return BitrixAPIListCompactResponse.from_dict(json_response)
+
+    def _call(self) -> ListCompactResponseData:
+        """
+        Execute the request using streaming list pagination.
+
+        Returns:
+            Raw JSON response returned by ``call_list`` with ``stream=True``,
+            with the result packed into ``CompactRows``.
+        """
+
+        json_response = self._bitrix_token.call_list(
+            api_method=self._api_method,
+            params=self._params,
+            limit=self._limit,
+            stream=True,
+            **self._kwargs,
+        )
+
+        return {
+            "result": CompactRows(json_response["result"]),
+            "time": json_response["time"],
+        }
+
+    async def _acall(self) -> ListCompactResponseData:
+        """
+        Asynchronously execute the request using standard list pagination.
+
+        Asynchronous list loading is not streamed, so the result is packed
+        after all pages are loaded.
+
+        Returns:
+            Raw JSON response returned by ``acall_list``, with the result
+            packed into ``CompactRows``.
+        """
+
+        json_response = await self._bitrix_token.acall_list(
+            api_method=self._api_method,
+            params=self._params,
+            limit=self._limit,
+            **self._kwargs,
+        )
+
+        return {
+            "result": CompactRows(json_response["result"]),
+            "time": json_response["time"],
+        }
+
+
+class BitrixAPIListStreamRequest(BitrixAPIBaseListRequest[BitrixAPIListFastResponse, JSONGenerator]):
+    """
+    Lazy request object for streaming a paginated Bitrix24 list.
+
+    Executes the wrapped API method through ``call_list`` in streaming mode and
+    converts the response into ``BitrixAPIListFastResponse``. The first page is
+    loaded eagerly, the remaining pages are fetched batch by batch while the
+    one-time result generator is consumed.
+    """
+
+    __slots__ = ()
+
+    def _convert_response(self, json_response: ListFastResponseData) -> BitrixAPIListFastResponse:
+        """
+        Convert raw JSON response into ``BitrixAPIListFastResponse``.
+
+        Args:
+            json_response: Raw JSON response returned by Bitrix24.
+
+        Returns:
+            Parsed list response with lazy result generator.
+        """
+        return BitrixAPIListFastResponse.from_dict(json_response)
+
+    def _call(self) -> ListFastResponseData:
+        """
+        Execute the request using streaming list pagination.
+
+        Returns:
+            Raw JSON response returned by ``call_list`` with ``stream=True``.
+        """
+        return self._bitrix_token.call_list(
+            api_method=self._api_method,
+            params=self._params,
+            limit=self._limit,
+            stream=True,
+            **self._kwargs,
+        )
+
+    async def _acall(self) -> ListFastResponseData:
+        """
+        Reject asynchronous execution.
+
+        Streaming list responses hold a lazy generator that issues further
+        requests during iteration, which cannot be awaited.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("Streaming list requests cannot be executed asynchronously, use as_list() without stream instead.")
+
 
 class BitrixAPIListFastRequest(BitrixAPIBaseListRequest[BitrixAPIListFastResponse, JSONGenerator]):
     """
@@ -110,9 +251,11 @@ class BitrixAPIListFastRequest(BitrixAPIBaseListRequest[BitrixAPIListFastRespons
     iteration.
     """
 
-    __slots__ = ("_descending",)
+    __slots__ = ("_descending", "_ordered", "_partitions")
 
     _descending: bool
+    _partitions: Optional[int]
+    _ordered: bool
 
     def __init__(
             self,
@@ -120,6 +263,8 @@ class BitrixAPIListFastRequest(BitrixAPIBaseListRequest[BitrixAPIListFastRespons
             bitrix_api_request: "BitrixAPIRequest",
             descending: bool = False,
             limit: Optional[int] = None,
+            partitions: Optional[int] = None,
+            ordered: bool = True,
             **kwargs,
     ):
         """
@@ -129,6 +274,8 @@ class BitrixAPIListFastRequest(BitrixAPIBaseListRequest[BitrixAPIListFastRespons
             bitrix_api_request: Source API request to convert into a fast list request.
             descending: Whether to retrieve items in descending ID order.
             limit: Optional maximum number of items to retrieve.
+            partitions: Optional number of ID ranges retrieved concurrently.
+            ordered: Whether partitioned retrieval keeps the ID order.
             **kwargs: Extra options overriding or extending source request options.
         """
         super().__init__(
@@ -137,6 +284,8 @@ class BitrixAPIListFastRequest(BitrixAPIBaseListRequest[BitrixAPIListFastRespons
             **bitrix_api_request._kwargs | kwargs,
         )
         self._descending = descending
+        self._partitions = partitions
+        self._ordered = ordered
 
     def __repr__(self):
         return (
@@ -145,7 +294,9 @@ class BitrixAPIListFastRequest(BitrixAPIBaseListRequest[BitrixAPIListFastRespons
             f"api_method='{self._api_method}', "
             f"params={self._params}, "
             f"descending={self._descending}, "
-            f"limit={self._limit})"
+            f"limit={self._limit}, "
+            f"partitions={self._partitions}, "
+            f"ordered={self._ordered})"
         )
 
     def _convert_response(self, json_response: ListFastResponseData) -> BitrixAPIListFastResponse:
@@ -164,13 +315,33 @@ class BitrixAPIListFastRequest(BitrixAPIBaseListRequest[BitrixAPIListFastRespons
         """
         Execute the request using fast ID-window pagination.
 
+        Partition options are forwarded only when partitioning is requested.
+
         Returns:
             Raw JSON response returned by ``call_list_fast``.
         """
+        partition_options = {}
+
+        if self._partitions is not None:
+            partition_options.update(partitions=self._partitions, ordered=self._ordered)
+
         return self._bitrix_token.call_list_fast(
             api_method=self._api_method,
             params=self._params,
             descending=self._descending,
             limit=self._limit,
+            **partition_options,
             **self._kwargs,
         )
+
+    async def _acall(self) -> ListFastResponseData:
+        """
+        Reject asynchronous execution.
+
+        Fast list responses hold a lazy generator that issues further requests
+        during iteration, which cannot be awaited.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("Fast list requests cannot be executed asynchronously, use as_list() instead of as_list_fast().")
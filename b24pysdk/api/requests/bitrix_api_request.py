@@ -1,10 +1,21 @@
-from typing import Generic, Optional
+from typing import TYPE_CHECKING, BinaryIO, ClassVar, Generic, Literal, Optional, Text, Union, overload
 
 from ...schemas.api import ResponseData
 from ...utils.type_vars import BAResultT
+from ...utils.types import ProgressCallback
 from ..responses import BitrixAPIResponse
 from .bitrix_api_base_request import BitrixAPIBaseRequest
-from .bitrix_api_list_request import BitrixAPIListFastRequest, BitrixAPIListRequest
+from .bitrix_api_download_request import BitrixAPIDownloadRequest
+from .bitrix_api_list_request import (
+    BitrixAPIListCompactRequest,
+    BitrixAPIListFastRequest,
+    BitrixAPIListRequest,
+    BitrixAPIListStreamRequest,
+)
+from .bitrix_api_upload_request import BitrixAPIUploadRequest
+
+if TYPE_CHECKING:
+    import os
 
 __all__ = [
     "BitrixAPIRequest",
@@ -16,9 +27,12 @@ class BitrixAPIRequest(BitrixAPIBaseRequest[BitrixAPIResponse[BAResultT], BAResu
     Lazy request object for a standard Bitrix24 API method call.
 
     Converts the raw JSON response into ``BitrixAPIResponse`` and provides
-    helpers for treating the same request as a paginated list request.
+    helpers for treating the same request as a paginated list request, a
+    file download, or the first step of a streamed file upload.
     """
 
+    _COALESCIBLE: ClassVar[bool] = True
+
     __slots__ = ()
 
     def _convert_response(self, json_response: ResponseData) -> BitrixAPIResponse[BAResultT]:
@@ -33,21 +47,70 @@ class BitrixAPIRequest(BitrixAPIBaseRequest[BitrixAPIResponse[BAResultT], BAResu
         """
         return BitrixAPIResponse.from_dict(json_response)
 
+    @overload
+    def as_list(
+            self,
+            limit: Optional[int] = None,
+            stream: Literal[False] = False,
+            compact: Literal[False] = False,
+    ) -> BitrixAPIListRequest: ...
+
+    @overload
+    def as_list(
+            self,
+            limit: Optional[int] = None,
+            *,
+            stream: Literal[True],
+            compact: Literal[False] = False,
+    ) -> BitrixAPIListStreamRequest: ...
+
+    @overload
+    def as_list(
+            self,
+            limit: Optional[int] = None,
+            stream: Literal[False] = False,
+            *,
+            compact: Literal[True],
+    ) -> BitrixAPIListCompactRequest: ...
+
     def as_list(
             self,
             limit: Optional[int] = None,
-    ) -> BitrixAPIListRequest:
+            stream: bool = False,
+            compact: bool = False,
+    ) -> Union[BitrixAPIListRequest, BitrixAPIListStreamRequest, BitrixAPIListCompactRequest]:
         """
         Create a paginated list request from this API request.
 
         Args:
             limit: Optional maximum number of items to load.
+            stream: Whether to yield list items batch by batch through a lazy
+                one-time generator instead of loading the whole list into memory.
+            compact: Whether to pack the loaded items into ``CompactRows``
+                instead of keeping a list of dictionaries. Intended for very
+                large lists that have to stay in memory as a whole.
 
         Returns:
             List request using the same API method, parameters, token, and
             requester options.
+
+        Raises:
+            ValueError: If both ``stream`` and ``compact`` are requested.
         """
-        return BitrixAPIListRequest(
+
+        if stream and compact:
+            raise ValueError("stream and compact list loading cannot be combined")
+
+        self._discard_coalescer()
+
+        if stream:
+            list_request_class = BitrixAPIListStreamRequest
+        elif compact:
+            list_request_class = BitrixAPIListCompactRequest
+        else:
+            list_request_class = BitrixAPIListRequest
+
+        return list_request_class(
             bitrix_api_request=self,
             limit=limit,
             **self._kwargs,
@@ -57,6 +120,8 @@ class BitrixAPIRequest(BitrixAPIBaseRequest[BitrixAPIResponse[BAResultT], BAResu
             self,
             descending: bool = False,
             limit: Optional[int] = None,
+            partitions: Optional[int] = None,
+            ordered: bool = True,
     ) -> BitrixAPIListFastRequest:
         """
         Create a fast paginated list request from this API request.
@@ -64,14 +129,98 @@ class BitrixAPIRequest(BitrixAPIBaseRequest[BitrixAPIResponse[BAResultT], BAResu
         Args:
             descending: Whether to retrieve items in descending ID order.
             limit: Optional maximum number of items to retrieve.
+            partitions: Optional number of ID ranges retrieved concurrently.
+                Useful for very large lists, see ``call_list_fast``.
+            ordered: Whether partitioned retrieval yields items in ID order.
 
         Returns:
             Fast list request using ID-window pagination with the same API
             method, parameters, token, and requester options.
         """
+        self._discard_coalescer()
+
         return BitrixAPIListFastRequest(
             bitrix_api_request=self,
             descending=descending,
             limit=limit,
+            partitions=partitions,
+            ordered=ordered,
+            **self._kwargs,
+        )
+
+    def as_upload(
+            self,
+            file: Union[Text, "os.PathLike[Text]", BinaryIO],
+            *,
+            filename: Optional[Text] = None,
+            progress_callback: Optional[ProgressCallback] = None,
+    ) -> BitrixAPIUploadRequest:
+        """
+        Create a streamed upload request from this API request.
+
+        Intended for upload methods such as ``disk.folder.uploadfile`` called
+        without file content: Bitrix24 then returns an upload URL, and the
+        file is streamed to it in blocks instead of being sent base64-encoded
+        in the request body.
+
+        Args:
+            file: Path to the file or a binary file object opened for reading.
+            filename: File name sent to Bitrix24. Defaults to ``data["NAME"]``
+                of this request, then to the base name of the file.
+            progress_callback: Optional callable receiving the number of bytes
+                sent and the file size after every block.
+
+        Returns:
+            Upload request using the same API method, parameters, token, and
+            requester options.
+        """
+        self._discard_coalescer()
+
+        return BitrixAPIUploadRequest(
+            bitrix_api_request=self,
+            file=file,
+            filename=filename,
+            progress_callback=progress_callback,
+            **self._kwargs,
+        )
+
+    def as_download(
+            self,
+            destination: Union[Text, "os.PathLike[Text]", BinaryIO],
+            *,
+            resume: bool = False,
+            chunk_size: Optional[int] = None,
+            progress_callback: Optional[ProgressCallback] = None,
+    ) -> BitrixAPIDownloadRequest:
+        """
+        Create a streamed download request from this API request.
+
+        Intended for methods responding with file content, such as
+        ``catalog.product.download``, and for methods returning a file with
+        ``DOWNLOAD_URL``, such as ``disk.file.get``. The content is written to
+        ``destination`` in chunks, and interrupted transfers are resumed with
+        HTTP ``Range`` requests.
+
+        Args:
+            destination: Path of the file to write or a binary file object
+                opened for writing.
+            resume: Whether to keep content already present in the destination
+                and download only the rest.
+            chunk_size: Size of chunks written to the destination, in bytes.
+            progress_callback: Optional callable receiving the number of bytes
+                downloaded and the total size, ``None`` when unknown.
+
+        Returns:
+            Download request using the same API method, parameters, token, and
+            requester options. Its result is the size of the content in bytes.
+        """
+        self._discard_coalescer()
+
+        return BitrixAPIDownloadRequest(
+            bitrix_api_request=self,
+            destination=destination,
+            resume=resume,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
             **self._kwargs,
         )
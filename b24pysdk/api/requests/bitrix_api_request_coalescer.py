@@ -0,0 +1,328 @@
+import json
+import threading
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Dict, Final, FrozenSet, List, Optional, Text, Tuple, Union
+
+from ..._config import Config
+from ...errors import BitrixAPIBatchCommandError, BitrixAPIError
+from ...protocols import BitrixTokenFullProtocol
+from ...schemas.api import BatchResponseData, ResponseData
+from ...utils.types import B24RequestTuple, JSONDict
+from ..callers._utils import get_empty_time
+
+if TYPE_CHECKING:
+    from .abstract_bitrix_api_request import AbstractBitrixAPIRequest
+
+__all__ = [
+    "BitrixAPIRequestCoalescer",
+]
+
+_CommandKey = Tuple[Text, Text, Text]
+"""API method, serialized parameters and serialized requester options of one command."""
+
+_Outcome = Union[ResponseData, BitrixAPIBatchCommandError, BitrixAPIError]
+
+_active_coalescers: ContextVar[Tuple["BitrixAPIRequestCoalescer", ...]] = ContextVar("_active_coalescers", default=())
+"""Coalescers of the ``with`` blocks entered in the current context, innermost last."""
+
+
+class BitrixAPIRequestCoalescer:
+    """
+    Collector dispatching lazy API requests as shared ``batch`` calls.
+
+    Inside a ``with`` block of a coalescer, lazy requests created for its
+    token are registered instead of being executed one by one. The first
+    access to the response of any registered request dispatches all pending
+    requests at once through ``call_batches`` and every request is
+    fulfilled from its own ``result`` key. Requests with identical API
+    method, parameters and requester options are sent once.
+
+    Only read-only methods, whose name ends with ``get``, ``list`` or
+    ``fields``, are coalesced, so writes are never merged or sent unless
+    their own response is read. Requests keep their coalescer after the block
+    exits, so they may be read later. Requests uploading files, list requests
+    and batch requests are never coalesced.
+
+    Example:
+        >>> with client.coalesce():
+        ...     deals = [client.crm.deal.get(bitrix_id=bitrix_id) for bitrix_id in (1, 2, 3)]
+        >>> titles = [deal.result["TITLE"] for deal in deals]
+    """
+
+    _COMMAND_KEY_PREFIX: Final[Text] = "cmd_"
+    _READ_ONLY_METHOD_ACTIONS: Final[FrozenSet[Text]] = frozenset({"get", "list", "fields"})
+
+    __slots__ = (
+        "_bitrix_token",
+        "_commands",
+        "_config",
+        "_context_tokens",
+        "_lock",
+        "_max_concurrency",
+        "_outcomes",
+        "_waiting",
+    )
+
+    _bitrix_token: BitrixTokenFullProtocol
+    _commands: Dict[_CommandKey, Tuple[B24RequestTuple, JSONDict]]
+    _config: Config
+    _context_tokens: List[Token]
+    _lock: threading.Lock
+    _max_concurrency: Optional[int]
+    _outcomes: Dict[_CommandKey, _Outcome]
+    _waiting: Dict[_CommandKey, int]
+
+    def __init__(
+            self,
+            *,
+            bitrix_token: BitrixTokenFullProtocol,
+            max_concurrency: Optional[int] = None,
+    ):
+        """
+        Initialize a request coalescer.
+
+        Args:
+            bitrix_token: Token whose requests are coalesced.
+            max_concurrency: Maximum number of batch requests executed at the
+                same time when more than ``MAX_BATCH_SIZE`` distinct requests
+                are pending. ``None`` executes them sequentially.
+        """
+        self._bitrix_token = bitrix_token
+        self._max_concurrency = max_concurrency
+        self._config = Config()
+        self._context_tokens = []
+        self._lock = threading.Lock()
+        self._commands = {}
+        self._outcomes = {}
+        self._waiting = {}
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"bitrix_token={self._bitrix_token}, "
+            f"max_concurrency={self._max_concurrency})"
+        )
+
+    def __enter__(self) -> "BitrixAPIRequestCoalescer":  # noqa: PYI034
+        self._context_tokens.append(_active_coalescers.set((*_active_coalescers.get(), self)))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_coalescers.reset(self._context_tokens.pop())
+
+    @classmethod
+    def register(cls, bitrix_api_request: "AbstractBitrixAPIRequest") -> Optional["BitrixAPIRequestCoalescer"]:
+        """
+        Register a request with the innermost active coalescer of its token.
+
+        Args:
+            bitrix_api_request: Newly created lazy request.
+
+        Returns:
+            Coalescer that will fulfill the request, or ``None`` when the
+            request is executed on its own.
+        """
+
+        for coalescer in reversed(_active_coalescers.get()):
+            if coalescer._bitrix_token is bitrix_api_request._bitrix_token:
+                return coalescer._add(bitrix_api_request)
+
+        return None
+
+    @classmethod
+    def _is_read_only(cls, api_method: Text) -> bool:
+        """Whether ``api_method`` only reads data, so identical calls may be merged and sent early."""
+        return api_method.rsplit(".", 1)[-1].lower() in cls._READ_ONLY_METHOD_ACTIONS
+
+    @classmethod
+    def _get_command_key(cls, bitrix_api_request: "AbstractBitrixAPIRequest") -> Optional[_CommandKey]:
+        """
+        Return the key identifying identical requests.
+
+        Returns:
+            Command key, or ``None`` when the request is not read-only, cannot
+            be sent inside a batch or its parameters cannot be serialized
+            deterministically.
+        """
+
+        if not cls._is_read_only(bitrix_api_request._api_method) or bitrix_api_request._kwargs.get("files"):
+            return None
+
+        try:
+            params = json.dumps(bitrix_api_request._params, sort_keys=True, default=str)
+        except TypeError:
+            return None
+
+        kwargs = repr(sorted(bitrix_api_request._kwargs.items()))
+
+        return bitrix_api_request._api_method, params, kwargs
+
+    def _add(self, bitrix_api_request: "AbstractBitrixAPIRequest") -> Optional["BitrixAPIRequestCoalescer"]:
+        """Add a request to the pending commands unless it cannot be coalesced."""
+
+        command_key = self._get_command_key(bitrix_api_request)
+
+        if command_key is None:
+            return None
+
+        with self._lock:
+            self._waiting[command_key] = self._waiting.get(command_key, 0) + 1
+            self._commands.setdefault(command_key, (bitrix_api_request._as_tuple, bitrix_api_request._kwargs))
+
+        return self
+
+    def discard(self, bitrix_api_request: "AbstractBitrixAPIRequest"):
+        """
+        Stop waiting for the response of a registered request.
+
+        Used when a request is executed on its own, so a command nobody
+        waits for is not sent with the next batch.
+
+        Args:
+            bitrix_api_request: Request registered with this coalescer.
+        """
+        with self._lock:
+            self._release(self._get_command_key(bitrix_api_request))
+
+    def _release(self, command_key: _CommandKey) -> Optional[_Outcome]:
+        """Decrease the number of requests waiting for a command and forget it when none is left."""
+
+        waiting = self._waiting.get(command_key, 0) - 1
+
+        if waiting > 0:
+            self._waiting[command_key] = waiting
+            return self._outcomes.get(command_key)
+
+        self._waiting.pop(command_key, None)
+        self._commands.pop(command_key, None)
+
+        return self._outcomes.pop(command_key, None)
+
+    def fulfill(self, bitrix_api_request: "AbstractBitrixAPIRequest") -> ResponseData:
+        """
+        Return the raw response of a registered request.
+
+        Dispatches all pending requests when the response of the request has
+        not been received yet.
+
+        Args:
+            bitrix_api_request: Request registered with this coalescer.
+
+        Returns:
+            Raw JSON response of the request built from its batch command.
+
+        Raises:
+            BitrixAPIBatchCommandError: If the batch command of the request failed.
+            BitrixAPIError: If the request was the only pending one and failed.
+        """
+
+        command_key = self._get_command_key(bitrix_api_request)
+
+        with self._lock:
+            try:
+                if command_key not in self._outcomes:
+                    self._dispatch()
+            finally:
+                outcome = self._release(command_key)
+
+        if outcome is None:
+            return self._bitrix_token.call_method(
+                api_method=bitrix_api_request._api_method,
+                params=bitrix_api_request._params,
+                **bitrix_api_request._kwargs,
+            )
+
+        if isinstance(outcome, (BitrixAPIBatchCommandError, BitrixAPIError)):
+            raise outcome
+
+        return outcome
+
+    def _dispatch(self):
+        """Send all pending commands, grouped by requester options, and store their outcomes."""
+
+        groups: Dict[Text, Dict[_CommandKey, Tuple[B24RequestTuple, JSONDict]]] = {}
+
+        for command_key, command in self._commands.items():
+            if command_key not in self._outcomes:
+                groups.setdefault(command_key[-1], {})[command_key] = command
+
+        for commands in groups.values():
+            logger = self._config.logger
+
+            if logger.is_enabled_for(logger.DEBUG):
+                logger.debug(
+                    "start coalesced call",
+                    context={
+                        "commands": len(commands),
+                    },
+                )
+
+            try:
+                self._outcomes.update(self._execute(commands))
+            finally:
+                self._config.logger.debug("finish coalesced call")
+
+    def _execute(self, commands: Dict[_CommandKey, Tuple[B24RequestTuple, JSONDict]]) -> Dict[_CommandKey, _Outcome]:
+        """
+        Execute commands sharing the same requester options.
+
+        A single command is sent as a plain method call, so its API error is
+        raised unchanged. Several commands are sent through ``call_batches``,
+        split into batches of at most ``MAX_BATCH_SIZE`` commands.
+
+        Returns:
+            Outcomes of commands keyed by command key. Commands missing from
+            the batch response are left out and executed on their own later.
+        """
+
+        (command_key, ((api_method, params), kwargs)), *other_commands = commands.items()
+
+        if not other_commands:
+            try:
+                return {command_key: self._bitrix_token.call_method(api_method=api_method, params=params, **kwargs)}
+            except BitrixAPIError as error:
+                return {command_key: error}
+
+        batch_keys = {f"{self._COMMAND_KEY_PREFIX}{index}": command_key for index, command_key in enumerate(commands)}
+
+        json_response: BatchResponseData = self._bitrix_token.call_batches(
+            methods={batch_key: commands[command_key][0] for batch_key, command_key in batch_keys.items()},
+            halt=False,
+            max_concurrency=self._max_concurrency,
+            **kwargs,
+        )
+
+        batch_result = json_response["result"]
+
+        results = self._force_dict(batch_result["result"])
+        result_errors = self._force_dict(batch_result["result_error"])
+        result_times = self._force_dict(batch_result["result_time"])
+        result_totals = self._force_dict(batch_result["result_total"])
+        result_nexts = self._force_dict(batch_result["result_next"])
+
+        outcomes: Dict[_CommandKey, _Outcome] = {}
+
+        for batch_key, command_key in batch_keys.items():
+            if batch_key in result_errors:
+                outcomes[command_key] = BitrixAPIBatchCommandError(result_errors[batch_key])
+
+            elif batch_key in results:
+                response_data: ResponseData = {
+                    "result": results[batch_key],
+                    "time": result_times.get(batch_key) or get_empty_time(),
+                }
+
+                if batch_key in result_totals:
+                    response_data["total"] = result_totals[batch_key]
+
+                if batch_key in result_nexts:
+                    response_data["next"] = result_nexts[batch_key]
+
+                outcomes[command_key] = response_data
+
+        return outcomes
+
+    @staticmethod
+    def _force_dict(collection: Union[JSONDict, List]) -> JSONDict:
+        """Return batch results keyed by command key; Bitrix24 sends an empty list instead of an empty object."""
+        return collection if isinstance(collection, dict) else {}
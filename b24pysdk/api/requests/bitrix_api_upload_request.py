@@ -0,0 +1,140 @@
+from typing import TYPE_CHECKING, BinaryIO, Final, Optional, Text, Tuple, Union
+
+from ...schemas.api import ResponseData
+from ...utils.types import JSONDict, ProgressCallback
+from ..callers import call_upload
+from ..responses import BitrixAPIResponse
+from .bitrix_api_base_request import BitrixAPIBaseRequest
+
+if TYPE_CHECKING:
+    import os
+
+    from .bitrix_api_request import BitrixAPIRequest
+
+__all__ = [
+    "BitrixAPIUploadRequest",
+]
+
+
+class BitrixAPIUploadRequest(BitrixAPIBaseRequest[BitrixAPIResponse[JSONDict], JSONDict]):
+    """
+    Lazy request object for uploading a file in two steps.
+
+    The wrapped API method, for example ``disk.folder.uploadfile``, is called
+    without file content first, and Bitrix24 responds with an upload URL and
+    the name of the form field. The file is then streamed to that URL as a
+    multipart form by ``call_upload``. The first call goes through the token,
+    so token refresh and domain redirects are handled as for any other call.
+    """
+
+    _REQUESTER_OPTIONS: Final[Tuple[Text, ...]] = ("timeout", "max_retries", "initial_retry_delay", "retry_delay_increment")
+
+    __slots__ = ("_file", "_filename", "_progress_callback")
+
+    _file: Union[Text, "os.PathLike[Text]", BinaryIO]
+    _filename: Optional[Text]
+    _progress_callback: Optional[ProgressCallback]
+
+    def __init__(
+            self,
+            *,
+            bitrix_api_request: "BitrixAPIRequest",
+            file: Union[Text, "os.PathLike[Text]", BinaryIO],
+            filename: Optional[Text] = None,
+            progress_callback: Optional[ProgressCallback] = None,
+            **kwargs,
+    ):
+        """
+        Initialize an upload request from a base API request.
+
+        Args:
+            bitrix_api_request: Source API request created without file content.
+            file: Path to the file or a binary file object opened for reading.
+            filename: File name sent to Bitrix24. Defaults to ``data["NAME"]``
+                of the source request, then to the base name of the file.
+            progress_callback: Optional callable receiving the number of bytes
+                sent and the file size after every block.
+            **kwargs: Extra options overriding or extending source request options.
+        """
+        super().__init__(
+            bitrix_token=bitrix_api_request._bitrix_token,
+            api_method=bitrix_api_request._api_method,
+            params=bitrix_api_request._params,
+            **bitrix_api_request._kwargs | kwargs,
+        )
+        self._file = file
+        self._filename = filename
+        self._progress_callback = progress_callback
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"bitrix_token={self._bitrix_token}, "
+            f"api_method='{self._api_method}', "
+            f"params={self._params}, "
+            f"file={self._file!r})"
+        )
+
+    @property
+    def _default_filename(self) -> Optional[Text]:
+        """Return the file name set in ``data["NAME"]`` of the request parameters, if any."""
+
+        data = (self._params or {}).get("data")
+
+        if isinstance(data, dict) and isinstance(data.get("NAME"), str):
+            return data["NAME"]
+
+        return None
+
+    def _convert_response(self, json_response: ResponseData) -> BitrixAPIResponse[JSONDict]:
+        """
+        Convert raw JSON response into ``BitrixAPIResponse``.
+
+        Args:
+            json_response: Raw JSON response returned by the upload URL.
+
+        Returns:
+            Parsed Bitrix API response describing the uploaded file.
+        """
+        return BitrixAPIResponse.from_dict(json_response)
+
+    def _call(self) -> ResponseData:
+        """
+        Request an upload URL and stream the file to it.
+
+        Returns:
+            Raw JSON response returned by the upload URL.
+
+        Raises:
+            ValueError: If Bitrix24 does not return an upload URL, for example
+                because the source request already contains file content.
+        """
+
+        json_response = self._bitrix_token.call_method(
+            api_method=self._api_method,
+            params=self._params,
+            **self._kwargs,
+        )
+
+        result = json_response.get("result")
+
+        if not isinstance(result, dict) or "uploadUrl" not in result:
+            raise ValueError(f"{self._api_method} did not return an upload URL, the request must be created without file content")
+
+        return call_upload(
+            result["uploadUrl"],
+            file=self._file,
+            field=result.get("field") or "file",
+            filename=self._filename or self._default_filename,
+            progress_callback=self._progress_callback,
+            **{key: self._kwargs[key] for key in self._REQUESTER_OPTIONS if key in self._kwargs},
+        )
+
+    async def _acall(self) -> ResponseData:
+        """
+        Reject asynchronous execution.
+
+        Raises:
+            TypeError: Always, because async transports send JSON bodies only.
+        """
+        raise TypeError("Upload requests cannot be executed asynchronously, use call() instead.")
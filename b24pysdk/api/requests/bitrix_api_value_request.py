@@ -1,12 +1,14 @@
 from abc import ABC
-from typing import Callable, Generator, Generic, List, Optional, Text, Union
+from typing import Callable, ClassVar, Generator, Generic, List, Literal, Optional, Text, Union, overload
 
 from ...protocols import BitrixTokenFullProtocol
-from ...schemas.api import ListFastResponseData, ListResponseData, ResponseData
+from ...schemas.api import ListCompactResponseData, ListFastResponseData, ListResponseData, ResponseData
+from ...utils.compact_rows import CompactRows
 from ...utils.type_vars import BAResultT, BAValueResponseT, BAValueT
 from ...utils.types import JSONDict, JSONGenerator, JSONList
 from ..responses import (
     BitrixAPIValueResponse,
+    BitrixAPIValuesListCompactResponse,
     BitrixAPIValuesListFastResponse,
     BitrixAPIValuesListResponse,
     BitrixAPIValuesResponse,
@@ -16,6 +18,7 @@ from .bitrix_api_base_request import BitrixAPIBaseRequest
 __all__ = [
     "BitrixAPIBaseValueRequest",
     "BitrixAPIValueRequest",
+    "BitrixAPIValuesListCompactRequest",
     "BitrixAPIValuesListFastRequest",
     "BitrixAPIValuesListRequest",
     "BitrixAPIValuesRequest",
@@ -72,6 +75,8 @@ class BitrixAPIValueRequest(BitrixAPIBaseValueRequest[BitrixAPIValueResponse[BAR
     Python-friendly values without lifecycle behavior.
     """
 
+    _COALESCIBLE: ClassVar[bool] = True
+
     __slots__ = ()
 
     @property
@@ -105,6 +110,8 @@ class BitrixAPIValuesRequest(BitrixAPIBaseValueRequest[BitrixAPIValuesResponse[B
     collections without lifecycle behavior.
     """
 
+    _COALESCIBLE: ClassVar[bool] = True
+
     __slots__ = ()
 
     @property
@@ -116,10 +123,26 @@ class BitrixAPIValuesRequest(BitrixAPIBaseValueRequest[BitrixAPIValuesResponse[B
         """
         return self.response.values
 
+    @overload
+    def as_list(
+            self,
+            limit: Optional[int] = None,
+            compact: Literal[False] = False,
+    ) -> "BitrixAPIValuesListRequest[BAValueT]": ...
+
+    @overload
+    def as_list(
+            self,
+            limit: Optional[int] = None,
+            *,
+            compact: Literal[True],
+    ) -> "BitrixAPIValuesListCompactRequest[BAValueT]": ...
+
     def as_list(
             self,
             limit: Optional[int] = None,
-    ) -> "BitrixAPIValuesListRequest[BAValueT]":
+            compact: bool = False,
+    ) -> Union["BitrixAPIValuesListRequest[BAValueT]", "BitrixAPIValuesListCompactRequest[BAValueT]"]:
         """
         Create a paginated list request from this values request.
 
@@ -128,12 +151,18 @@ class BitrixAPIValuesRequest(BitrixAPIBaseValueRequest[BitrixAPIValuesResponse[B
 
         Args:
             limit: Optional maximum number of items to load.
+            compact: Whether to pack the loaded items into ``CompactRows``
+                instead of keeping a list of dictionaries.
 
         Returns:
             Adapted list request using the same API method, parameters, token,
             requester options, and result adapter.
         """
-        return BitrixAPIValuesListRequest(
+        self._discard_coalescer()
+
+        list_request_class = BitrixAPIValuesListCompactRequest if compact else BitrixAPIValuesListRequest
+
+        return list_request_class(
             bitrix_api_values_request=self,
             limit=limit,
             **self._kwargs,
@@ -159,6 +188,8 @@ class BitrixAPIValuesRequest(BitrixAPIBaseValueRequest[BitrixAPIValuesResponse[B
             API method, parameters, token, requester options, and result
             adapter.
         """
+        self._discard_coalescer()
+
         return BitrixAPIValuesListFastRequest(
             bitrix_api_values_request=self,
             descending=descending,
@@ -261,6 +292,134 @@ class BitrixAPIValuesListRequest(BitrixAPIBaseValueRequest[BitrixAPIValuesListRe
             **self._kwargs,
         )
 
+    async def _acall(self) -> ListResponseData:
+        """
+        Asynchronously execute the request using standard list pagination.
+
+        Returns:
+            Raw JSON response returned by ``acall_list``.
+        """
+        return await self._bitrix_token.acall_list(
+            api_method=self._api_method,
+            params=self._params,
+            limit=self._limit,
+            **self._kwargs,
+        )
+
+
+class BitrixAPIValuesListCompactRequest(BitrixAPIBaseValueRequest[BitrixAPIValuesListCompactResponse[BAValueT], CompactRows, List[BAValueT]], Generic[BAValueT]):
+    """
+    Lazy compact list request that exposes adapted ``values``.
+
+    This duplicates the compact list-request lifecycle for values requests to
+    keep the existing ``BitrixAPIRequest.as_list(compact=True)`` behavior
+    unchanged.
+    """
+
+    __slots__ = ("_limit",)
+
+    _limit: Optional[int]
+
+    def __init__(
+            self,
+            *,
+            bitrix_api_values_request: BitrixAPIValuesRequest[BAResultT, BAValueT],
+            limit: Optional[int] = None,
+            **kwargs: JSONDict,
+    ):
+        """
+        Initialize an adapted compact list request from a values request.
+
+        Args:
+            bitrix_api_values_request: Source values request to convert into a
+                compact list request.
+            limit: Optional maximum number of items to retrieve.
+            **kwargs: Extra options overriding or extending source request
+                options.
+        """
+        super().__init__(
+            bitrix_token=bitrix_api_values_request._bitrix_token,
+            api_method=bitrix_api_values_request._api_method,
+            params=bitrix_api_values_request._params,
+            result_adapter=bitrix_api_values_request._result_adapter,
+            **bitrix_api_values_request._kwargs | kwargs,
+        )
+        self._limit = limit
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"bitrix_token={self._bitrix_token}, "
+            f"api_method='{self._api_method}', "
+            f"params={self._params}, "
+            f"limit={self._limit})"
+        )
+
+    @property
+    def values(self) -> List[BAValueT]:
+        """
+        Return adapted Python values from the compact list response.
+
+        Accessing this property may execute the request lazily on first access.
+        """
+        return self.response.values
+
+    def _convert_response(self, json_response: ListCompactResponseData) -> BitrixAPIValuesListCompactResponse[BAValueT]:
+        """
+        Convert raw JSON response into ``BitrixAPIValuesListCompactResponse``.
+
+        Args:
+            json_response: Raw JSON response with the result packed into
+                ``CompactRows``.
+
+        Returns:
+            Parsed compact list response with adapted ``values`` access.
+        """
+        return BitrixAPIValuesListCompactResponse.from_dict(json_response, result_adapter=self._result_adapter)
+
+    def _call(self) -> ListCompactResponseData:
+        """
+        Execute the request using streaming list pagination.
+
+        Returns:
+            Raw JSON response returned by ``call_list`` with ``stream=True``,
+            with the result packed into ``CompactRows``.
+        """
+
+        json_response = self._bitrix_token.call_list(
+            api_method=self._api_method,
+            params=self._params,
+            limit=self._limit,
+            stream=True,
+            **self._kwargs,
+        )
+
+        return {
+            "result": CompactRows(json_response["result"]),
+            "time": json_response["time"],
+        }
+
+    async def _acall(self) -> ListCompactResponseData:
+        """
+        Asynchronously execute the request using standard list pagination.
+
+        Returns:
+            Raw JSON response returned by ``acall_list``, with the result
+            packed into ``CompactRows``.
+        """
+
+        json_response = await self._bitrix_token.acall_list(
+            api_method=self._api_method,
+            params=self._params,
+            limit=self._limit,
+            **self._kwargs,
+        )
+
+        return {
+            "result": CompactRows(json_response["result"]),
+            "time": json_response["time"],
+        }
+
 
 class BitrixAPIValuesListFastRequest(BitrixAPIBaseValueRequest[BitrixAPIValuesListFastResponse[BAValueT], JSONGenerator, Generator[BAValueT, None, None]], Generic[BAValueT]):
     """
@@ -349,3 +508,15 @@ class BitrixAPIValuesListFastRequest(BitrixAPIBaseValueRequest[BitrixAPIValuesLi
             limit=self._limit,
             **self._kwargs,
         )
+
+    async def _acall(self) -> ListFastResponseData:
+        """
+        Reject asynchronous execution.
+
+        Fast list responses hold a lazy generator that issues further requests
+        during iteration, which cannot be awaited.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("Fast list requests cannot be executed asynchronously, use as_list() instead of as_list_fast().")
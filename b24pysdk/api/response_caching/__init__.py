@@ -0,0 +1,13 @@
+from ._base_backend import BaseResponseCacheBackend
+from .memory_backend import MemoryResponseCacheBackend
+from .response_cache import ResponseCache
+from .shared_dict_backend import SharedDictResponseCacheBackend
+from .sqlite_backend import SQLiteResponseCacheBackend
+
+__all__ = [
+    "BaseResponseCacheBackend",
+    "MemoryResponseCacheBackend",
+    "ResponseCache",
+    "SQLiteResponseCacheBackend",
+    "SharedDictResponseCacheBackend",
+]
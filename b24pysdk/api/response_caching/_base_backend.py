@@ -0,0 +1,71 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Text
+
+from ...utils.types import Number
+
+__all__ = [
+    "BaseResponseCacheBackend",
+]
+
+
+class BaseResponseCacheBackend(ABC):
+    """
+    Base class for response cache storages.
+
+    A backend stores encoded responses under a ``(domain, api_method, key)``
+    triple, where ``key`` identifies the canonical method parameters. Entries
+    expire after their time to live; backends may additionally bound their
+    size and evict the least recently used entries.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get(self, domain: Text, api_method: Text, key: Text) -> Optional[bytes]:
+        """
+        Return a fresh stored entry.
+
+        Args:
+            domain: Lower-cased portal domain.
+            api_method: Lower-cased REST method name.
+            key: Digest of the canonical method parameters.
+
+        Returns:
+            Stored value, or ``None`` if the entry is missing or expired.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, domain: Text, api_method: Text, key: Text, value: bytes, ttl: Number):
+        """
+        Store an entry.
+
+        Args:
+            domain: Lower-cased portal domain.
+            api_method: Lower-cased REST method name.
+            key: Digest of the canonical method parameters.
+            value: Encoded response.
+            ttl: Seconds the entry stays fresh.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, domain: Optional[Text] = None, api_method: Optional[Text] = None):
+        """
+        Remove entries of a portal, of a method, or of a method of one portal.
+
+        Args:
+            domain: Lower-cased portal domain; entries of all portals when omitted.
+            api_method: Lower-cased REST method name; entries of all methods when omitted.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self):
+        """Remove all entries."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _matches(domain: Text, api_method: Text, invalidated_domain: Optional[Text], invalidated_api_method: Optional[Text]) -> bool:
+        """Return whether an entry is selected by ``invalidate`` arguments."""
+        return (invalidated_domain is None or domain == invalidated_domain) and (invalidated_api_method is None or api_method == invalidated_api_method)
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Text, Tuple
+
+from ...constants import DEFAULT_RESPONSE_CACHE_MAX_SIZE
+from ...utils.types import Number
+from ._base_backend import BaseResponseCacheBackend
+
+__all__ = [
+    "MemoryResponseCacheBackend",
+]
+
+_EntryKey = Tuple[Text, Text, Text]
+
+
+class MemoryResponseCacheBackend(BaseResponseCacheBackend):
+    """
+    In-process LRU response cache backend.
+
+    Entries are kept by the backend instance, so all threads that share one
+    instance share its entries. When ``max_size`` entries are stored, the
+    least recently used entry is evicted.
+    """
+
+    __slots__ = ("_entries", "_lock", "_max_size")
+
+    _entries: "OrderedDict[_EntryKey, Tuple[float, bytes]]"
+    _lock: threading.Lock
+    _max_size: int
+
+    def __init__(self, max_size: int = DEFAULT_RESPONSE_CACHE_MAX_SIZE):
+        """
+        Initialize the in-memory backend.
+
+        Args:
+            max_size: Maximum number of stored entries.
+
+        Raises:
+            ValueError: If ``max_size`` is not a positive integer.
+        """
+
+        if not (isinstance(max_size, int) and max_size >= 1):
+            raise ValueError("Max_size must be a positive integer (>= 1)")
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+
+    def __repr__(self):
+        return f"{type(self).__name__}(max_size={self._max_size})"
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, domain: Text, api_method: Text, key: Text) -> Optional[bytes]:
+        """Return a fresh entry and mark it as recently used."""
+
+        entry_key = (domain, api_method, key)
+
+        with self._lock:
+            entry = self._entries.get(entry_key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= time.time():
+                del self._entries[entry_key]
+                return None
+
+            self._entries.move_to_end(entry_key)
+
+            return value
+
+    def set(self, domain: Text, api_method: Text, key: Text, value: bytes, ttl: Number):
+        """Store an entry, evicting the least recently used entries above ``max_size``."""
+
+        entry_key = (domain, api_method, key)
+
+        with self._lock:
+            self._entries[entry_key] = (time.time() + ttl, value)
+            self._entries.move_to_end(entry_key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, domain: Optional[Text] = None, api_method: Optional[Text] = None):
+        """Remove entries selected by ``domain`` and ``api_method``."""
+
+        with self._lock:
+            for entry_key in [entry_key for entry_key in self._entries if self._matches(*entry_key[:2], domain, api_method)]:
+                del self._entries[entry_key]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
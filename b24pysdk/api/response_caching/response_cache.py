@@ -0,0 +1,226 @@
+import hashlib
+import json
+from fnmatch import fnmatchcase
+from typing import Dict, Final, Mapping, Optional, Text, Tuple
+
+from ...constants import DEFAULT_RESPONSE_CACHE_TTL
+from ...constants.version import B24APIVersion
+from ...utils.types import JSONDict, Number
+from ..requesters.json_codecs import get_json_codec
+from ._base_backend import BaseResponseCacheBackend
+from .memory_backend import MemoryResponseCacheBackend
+
+__all__ = [
+    "ResponseCache",
+]
+
+
+class ResponseCache:
+    """
+    Cache of responses of rarely changing Bitrix24 metadata methods.
+
+    Field descriptions, status and category lists or user field lists are
+    requested by many handlers but change seldom. The cache keeps successful
+    responses of such methods keyed by portal, method and canonical
+    parameters, so repeated single-method calls are answered without a
+    request. A cached response carries synthetic zero-duration ``time`` data.
+
+    Only methods matching one of the ``ttls`` patterns are cached. Patterns
+    use shell-style wildcards and are matched case-insensitively, e.g.
+    ``{"crm.*.fields": 600, "crm.status.list": 60}``. By default field
+    descriptions, user field lists, status and category lists are cached for
+    ``DEFAULT_RESPONSE_CACHE_TTL`` seconds.
+
+    Entries are kept in a backend: :class:`MemoryResponseCacheBackend`
+    (default) for the threads sharing the cache instance,
+    :class:`SharedDictResponseCacheBackend` for a mapping shared between
+    processes, :class:`SQLiteResponseCacheBackend` for processes of one host.
+
+    Enable the cache with ``Config().configure(response_cache=ResponseCache())``.
+    """
+
+    _DEFAULT_API_METHOD_PATTERNS: Final[Tuple[Text, ...]] = (
+        "*.fields",
+        "*.getfieldsbyfilter",
+        "*.userfield.list",
+        "crm.category.list",
+        "crm.status.entity.items",
+        "crm.status.entity.types",
+        "crm.status.list",
+    )
+
+    __slots__ = ("_backend", "_ttls", "_ttls_by_api_method")
+
+    _backend: BaseResponseCacheBackend
+    _ttls: Dict[Text, Number]
+    _ttls_by_api_method: Dict[Text, Optional[Number]]
+
+    def __init__(
+            self,
+            *,
+            backend: Optional[BaseResponseCacheBackend] = None,
+            ttls: Optional[Mapping[Text, Number]] = None,
+            default_ttl: Number = DEFAULT_RESPONSE_CACHE_TTL,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            backend: Entry storage. Defaults to :class:`MemoryResponseCacheBackend`.
+            ttls: Seconds responses stay fresh, keyed by method name patterns.
+                Replaces the default set of cached methods.
+            default_ttl: Seconds responses of the default set of cached
+                methods stay fresh. Ignored when ``ttls`` is passed.
+
+        Raises:
+            ValueError: If a time to live is not positive.
+        """
+
+        if ttls is None:
+            ttls = dict.fromkeys(self._DEFAULT_API_METHOD_PATTERNS, default_ttl)
+
+        for pattern, ttl in ttls.items():
+            if not (isinstance(ttl, (int, float)) and ttl > 0):
+                raise ValueError(f"Ttl of {pattern!r} must be a positive number")
+
+        self._backend = backend or MemoryResponseCacheBackend()
+        self._ttls = {pattern.lower(): ttl for pattern, ttl in ttls.items()}
+        self._ttls_by_api_method = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}(backend={self._backend!r}, ttls={self._ttls!r})"
+
+    @property
+    def backend(self) -> BaseResponseCacheBackend:
+        """Entry storage of the cache."""
+        return self._backend
+
+    def get_ttl(self, api_method: Text) -> Optional[Number]:
+        """
+        Return the time to live of a method.
+
+        Args:
+            api_method: REST method name.
+
+        Returns:
+            Seconds responses of the method stay fresh, or ``None`` if the
+            method is not cached. An exact pattern wins over wildcards;
+            among wildcards the first matching one is used.
+        """
+
+        api_method = api_method.lower()
+
+        try:
+            return self._ttls_by_api_method[api_method]
+        except KeyError:
+            pass
+
+        ttl = self._ttls.get(api_method)
+
+        if ttl is None:
+            ttl = next((ttl for pattern, ttl in self._ttls.items() if fnmatchcase(api_method, pattern)), None)
+
+        self._ttls_by_api_method[api_method] = ttl
+
+        return ttl
+
+    @staticmethod
+    def _get_params_key(params: JSONDict, api_version: B24APIVersion) -> Optional[Text]:
+        """Return the digest of canonical parameters, or ``None`` if they cannot be serialized canonically."""
+
+        try:
+            canonical_params = json.dumps([int(api_version), params], sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            return None
+
+        return hashlib.sha256(canonical_params.encode()).hexdigest()
+
+    def get(
+            self,
+            domain: Text,
+            api_method: Text,
+            params: JSONDict,
+            *,
+            api_version: B24APIVersion = B24APIVersion.V2,
+    ) -> Optional[JSONDict]:
+        """
+        Return a stored response.
+
+        Args:
+            domain: Bitrix24 portal domain.
+            api_method: REST method name.
+            params: Method parameters without authentication data.
+            api_version: REST API version the method is called with.
+
+        Returns:
+            Stored parsed response, or ``None`` if the method is not cached or
+            no fresh response is stored.
+        """
+
+        if self.get_ttl(api_method) is None:
+            return None
+
+        key = self._get_params_key(params, api_version)
+
+        if key is None:
+            return None
+
+        value = self._backend.get(domain.lower(), api_method.lower(), key)
+
+        if value is None:
+            return None
+
+        return get_json_codec().decode(value)
+
+    def set(
+            self,
+            domain: Text,
+            api_method: Text,
+            params: JSONDict,
+            json_response: JSONDict,
+            *,
+            api_version: B24APIVersion = B24APIVersion.V2,
+    ):
+        """
+        Store a successful response of a cached method.
+
+        Args:
+            domain: Bitrix24 portal domain.
+            api_method: REST method name.
+            params: Method parameters without authentication data.
+            json_response: Parsed Bitrix response.
+            api_version: REST API version the method was called with.
+        """
+
+        ttl = self.get_ttl(api_method)
+
+        if ttl is None:
+            return
+
+        key = self._get_params_key(params, api_version)
+
+        if key is None:
+            return
+
+        self._backend.set(domain.lower(), api_method.lower(), key, get_json_codec().encode(json_response), ttl)
+
+    def invalidate(self, domain: Optional[Text] = None, api_method: Optional[Text] = None):
+        """
+        Remove stored responses.
+
+        Call it after changing metadata, e.g. after adding a user field or a
+        status, so the next call fetches the current data.
+
+        Args:
+            domain: Portal whose responses are removed; all portals when omitted.
+            api_method: Method whose responses are removed; all methods when omitted.
+        """
+
+        self._backend.invalidate(
+            domain=domain.lower() if domain is not None else None,
+            api_method=api_method.lower() if api_method is not None else None,
+        )
+
+    def clear(self):
+        """Remove all stored responses."""
+        self._backend.clear()
@@ -0,0 +1,117 @@
+import threading
+import time
+from contextlib import AbstractContextManager
+from typing import Final, MutableMapping, Optional, Text, Tuple
+
+from ...constants import DEFAULT_RESPONSE_CACHE_MAX_SIZE
+from ...utils.types import Number
+from ._base_backend import BaseResponseCacheBackend
+
+__all__ = [
+    "SharedDictResponseCacheBackend",
+]
+
+
+class SharedDictResponseCacheBackend(BaseResponseCacheBackend):
+    """
+    Response cache backend storing entries in a caller-provided mapping.
+
+    The mapping may be shared between processes, for example a
+    ``multiprocessing.Manager().dict()`` used together with a manager lock.
+    Entries are stored under string keys as ``(expires_at, value)`` tuples.
+    The mapping must keep insertion order; entries read from the cache are
+    re-inserted, so the first key is always the least recently used one.
+    """
+
+    _SEPARATOR: Final[Text] = "\x1f"
+
+    __slots__ = ("_lock", "_mapping", "_max_size")
+
+    _lock: AbstractContextManager
+    _mapping: MutableMapping[Text, Tuple[float, bytes]]
+    _max_size: int
+
+    def __init__(
+            self,
+            mapping: MutableMapping[Text, Tuple[float, bytes]],
+            *,
+            lock: Optional[AbstractContextManager] = None,
+            max_size: int = DEFAULT_RESPONSE_CACHE_MAX_SIZE,
+    ):
+        """
+        Initialize the shared dict backend.
+
+        Args:
+            mapping: Mapping that stores the entries.
+            lock: Lock serializing access to ``mapping``. Processes sharing
+                the mapping must share the lock as well. Defaults to a lock
+                of the current process.
+            max_size: Maximum number of stored entries.
+
+        Raises:
+            ValueError: If ``max_size`` is not a positive integer.
+        """
+
+        if not (isinstance(max_size, int) and max_size >= 1):
+            raise ValueError("Max_size must be a positive integer (>= 1)")
+
+        self._lock = lock or threading.Lock()
+        self._mapping = mapping
+        self._max_size = max_size
+
+    def __repr__(self):
+        return f"{type(self).__name__}(max_size={self._max_size})"
+
+    def _get_entry_key(self, domain: Text, api_method: Text, key: Text) -> Text:
+        """Join the parts of an entry key into one mapping key."""
+        return self._SEPARATOR.join((domain, api_method, key))
+
+    def get(self, domain: Text, api_method: Text, key: Text) -> Optional[bytes]:
+        """Return a fresh entry and mark it as recently used."""
+
+        entry_key = self._get_entry_key(domain, api_method, key)
+
+        with self._lock:
+            entry = self._mapping.pop(entry_key, None)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= time.time():
+                return None
+
+            self._mapping[entry_key] = entry
+
+            return value
+
+    def set(self, domain: Text, api_method: Text, key: Text, value: bytes, ttl: Number):
+        """Store an entry, evicting the least recently used entries above ``max_size``."""
+
+        entry_key = self._get_entry_key(domain, api_method, key)
+
+        with self._lock:
+            self._mapping.pop(entry_key, None)
+            self._mapping[entry_key] = (time.time() + ttl, value)
+
+            overflow = len(self._mapping) - self._max_size
+
+            if overflow > 0:
+                for evicted_key in list(self._mapping.keys())[:overflow]:
+                    self._mapping.pop(evicted_key, None)
+
+    def invalidate(self, domain: Optional[Text] = None, api_method: Optional[Text] = None):
+        """Remove entries selected by ``domain`` and ``api_method``."""
+
+        with self._lock:
+            for entry_key in list(self._mapping.keys()):
+                entry_domain, entry_api_method, _ = entry_key.split(self._SEPARATOR, 2)
+
+                if self._matches(entry_domain, entry_api_method, domain, api_method):
+                    self._mapping.pop(entry_key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._mapping.clear()
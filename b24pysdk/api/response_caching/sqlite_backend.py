@@ -0,0 +1,162 @@
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Final, Iterator, List, Optional, Text, Union
+
+from ...constants import DEFAULT_RESPONSE_CACHE_MAX_SIZE
+from ...utils.types import Number
+from ._base_backend import BaseResponseCacheBackend
+
+__all__ = [
+    "SQLiteResponseCacheBackend",
+]
+
+
+class SQLiteResponseCacheBackend(BaseResponseCacheBackend):
+    """
+    Response cache backend shared by several processes through an SQLite file.
+
+    Every operation opens a short-lived connection, so one backend instance may
+    be used from any thread and worker processes of one host share entries by
+    using the same database file. When ``max_size`` entries are stored, the
+    least recently used entries are evicted.
+    """
+
+    _DEFAULT_FILE_NAME: Final[Text] = "b24pysdk-response-cache.sqlite3"
+    _CONNECT_TIMEOUT: Final[Number] = 30
+
+    _CREATE_TABLE_SQL: Final[Text] = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        "domain TEXT NOT NULL, "
+        "api_method TEXT NOT NULL, "
+        "key TEXT NOT NULL, "
+        "value BLOB NOT NULL, "
+        "expires_at REAL NOT NULL, "
+        "accessed INTEGER NOT NULL, "
+        "PRIMARY KEY (domain, api_method, key))"
+    )
+    _NEXT_ACCESSED_SQL: Final[Text] = "(SELECT COALESCE(MAX(accessed), 0) + 1 FROM entries)"
+    """Access sequence number, ordering entries by their last use even within one clock tick."""
+    _CREATE_INDEX_SQL: Final[Text] = "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+
+    __slots__ = ("_max_size", "_path")
+
+    _max_size: int
+    _path: Path
+
+    def __init__(
+            self,
+            path: Optional[Union[Text, os.PathLike]] = None,
+            *,
+            max_size: int = DEFAULT_RESPONSE_CACHE_MAX_SIZE,
+    ):
+        """
+        Initialize the SQLite backend.
+
+        Args:
+            path: Database file. Defaults to ``b24pysdk-response-cache.sqlite3``
+                in the system temporary directory. All processes that share
+                entries must use the same file.
+            max_size: Maximum number of stored entries.
+
+        Raises:
+            ValueError: If ``max_size`` is not a positive integer.
+        """
+
+        if not (isinstance(max_size, int) and max_size >= 1):
+            raise ValueError("Max_size must be a positive integer (>= 1)")
+
+        if path is None:
+            path = Path(tempfile.gettempdir()) / self._DEFAULT_FILE_NAME
+
+        self._max_size = max_size
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute(self._CREATE_TABLE_SQL)
+            connection.execute(self._CREATE_INDEX_SQL)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(path={str(self._path)!r}, max_size={self._max_size})"
+
+    @property
+    def path(self) -> Path:
+        """Database file that contains the entries."""
+        return self._path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit its transaction on success and close it afterwards."""
+        with closing(sqlite3.connect(self._path, timeout=self._CONNECT_TIMEOUT)) as connection, connection:
+            yield connection
+
+    def get(self, domain: Text, api_method: Text, key: Text) -> Optional[bytes]:
+        """Return a fresh entry and mark it as recently used."""
+
+        now = time.time()
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value, expires_at FROM entries WHERE domain = ? AND api_method = ? AND key = ?",
+                (domain, api_method, key),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires_at = row
+
+            if expires_at <= now:
+                connection.execute("DELETE FROM entries WHERE domain = ? AND api_method = ? AND key = ?", (domain, api_method, key))
+                return None
+
+            connection.execute(
+                f"UPDATE entries SET accessed = {self._NEXT_ACCESSED_SQL} WHERE domain = ? AND api_method = ? AND key = ?",  # noqa: S608
+                (domain, api_method, key),
+            )
+
+        return bytes(value)
+
+    def set(self, domain: Text, api_method: Text, key: Text, value: bytes, ttl: Number):
+        """Store an entry, removing expired entries and evicting the least recently used ones above ``max_size``."""
+
+        now = time.time()
+
+        with self._connect() as connection:
+            connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            connection.execute(
+                f"INSERT OR REPLACE INTO entries (domain, api_method, key, value, expires_at, accessed) VALUES (?, ?, ?, ?, ?, {self._NEXT_ACCESSED_SQL})",  # noqa: S608
+                (domain, api_method, key, value, now + ttl),
+            )
+            connection.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self._max_size,),
+            )
+
+    def invalidate(self, domain: Optional[Text] = None, api_method: Optional[Text] = None):
+        """Remove entries selected by ``domain`` and ``api_method``."""
+
+        conditions: List[Text] = []
+        parameters: List[Text] = []
+
+        if domain is not None:
+            conditions.append("domain = ?")
+            parameters.append(domain)
+
+        if api_method is not None:
+            conditions.append("api_method = ?")
+            parameters.append(api_method)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM entries{where}", parameters)  # noqa: S608
+
+    def clear(self):
+        """Remove all entries."""
+        self.invalidate()
+
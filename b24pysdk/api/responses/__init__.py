@@ -1,11 +1,17 @@
 from .abstract_bitrix_response import AbstractBitrixResponse
 from .bitrix_api_batch_response import B24APIBatchResult, BitrixAPIBatchResponse
-from .bitrix_api_list_response import AbstractBitrixAPIListResponse, BitrixAPIListFastResponse, BitrixAPIListResponse
+from .bitrix_api_list_response import (
+    AbstractBitrixAPIListResponse,
+    BitrixAPIListCompactResponse,
+    BitrixAPIListFastResponse,
+    BitrixAPIListResponse,
+)
 from .bitrix_api_response import BitrixAPIResponse
 from .bitrix_api_value_response import (
     AbstractBitrixAPIValueResponse,
     BitrixAPIBaseValueResponse,
     BitrixAPIValueResponse,
+    BitrixAPIValuesListCompactResponse,
     BitrixAPIValuesListFastResponse,
     BitrixAPIValuesListResponse,
     BitrixAPIValuesResponse,
@@ -22,10 +28,12 @@ __all__ = [
     "B24AppInfoResult",
     "BitrixAPIBaseValueResponse",
     "BitrixAPIBatchResponse",
+    "BitrixAPIListCompactResponse",
     "BitrixAPIListFastResponse",
     "BitrixAPIListResponse",
     "BitrixAPIResponse",
     "BitrixAPIValueResponse",
+    "BitrixAPIValuesListCompactResponse",
     "BitrixAPIValuesListFastResponse",
     "BitrixAPIValuesListResponse",
     "BitrixAPIValuesResponse",
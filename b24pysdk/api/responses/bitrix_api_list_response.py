@@ -2,7 +2,8 @@ from abc import ABC
 from dataclasses import InitVar, dataclass, field
 from typing import TYPE_CHECKING, Generic
 
-from ...schemas.api import ListFastResponseData, ListResponseData, TimeResponseData
+from ...schemas.api import ListCompactResponseData, ListFastResponseData, ListResponseData, TimeResponseData
+from ...utils.compact_rows import CompactRows
 from ...utils.dataclasses import frozen_dataclass_kwargs
 from ...utils.type_vars import BAListResultT
 from ...utils.types import JSONGenerator, JSONList
@@ -13,6 +14,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "AbstractBitrixAPIListResponse",
+    "BitrixAPIListCompactResponse",
     "BitrixAPIListFastResponse",
     "BitrixAPIListResponse",
 ]
@@ -72,6 +74,56 @@ class BitrixAPIListResponse(AbstractBitrixAPIListResponse[JSONList]):
         }
 
 
+@dataclass(**frozen_dataclass_kwargs(repr=False, eq=False))
+class BitrixAPIListCompactResponse(AbstractBitrixAPIListResponse[CompactRows]):
+    """
+    Compact Bitrix24 list response.
+
+    Stores a fully loaded list result packed into ``CompactRows``: field names
+    are kept once for the whole list and items are kept as value tuples, which
+    makes very large exports take several times less memory than a list of
+    dictionaries.
+    """
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"result=<compact rows: {len(self.result)}>, "
+            f"time={self.time})"
+        )
+
+    @classmethod
+    def from_dict(cls, json_response: ListCompactResponseData, /) -> "BitrixAPIListCompactResponse":
+        """
+        Create a BitrixAPIListCompactResponse instance from raw JSON response.
+
+        Args:
+            json_response: Raw JSON response with the result packed into
+                ``CompactRows``.
+
+        Returns:
+            Parsed list response with compact result items.
+        """
+        return cls(
+            result=json_response["result"],
+            time=cls._convert_time(json_response["time"]),
+        )
+
+    def to_dict(self) -> ListResponseData:
+        """
+        Convert list response to a dictionary.
+
+        The compact result is unpacked into a list of dictionaries.
+
+        Returns:
+            Dictionary representation of the list response.
+        """
+        return {
+            "result": self.result.to_list(),
+            "time": self.time.to_dict(),
+        }
+
+
 @dataclass(**frozen_dataclass_kwargs(repr=False, eq=False))
 class BitrixAPIListFastResponse(AbstractBitrixAPIListResponse[JSONGenerator]):
     """
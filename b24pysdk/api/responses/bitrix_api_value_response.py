@@ -2,18 +2,20 @@ from abc import ABC
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable, Generator, Generic, List, NoReturn, Type, Union
 
-from ...schemas.api import ListFastResponseData, ListResponseData, ResponseData
+from ...schemas.api import ListCompactResponseData, ListFastResponseData, ListResponseData, ResponseData
+from ...utils.compact_rows import CompactRows
 from ...utils.dataclasses import frozen_dataclass_kwargs
 from ...utils.type_vars import BAResultT, BAValueResponseT, BAValueT
 from ...utils.types import JSONGenerator, JSONList
 from .abstract_bitrix_response import AbstractBitrixResponse
-from .bitrix_api_list_response import BitrixAPIListFastResponse, BitrixAPIListResponse
+from .bitrix_api_list_response import BitrixAPIListCompactResponse, BitrixAPIListFastResponse, BitrixAPIListResponse
 from .bitrix_api_response import BitrixAPIResponse
 
 __all__ = [
     "AbstractBitrixAPIValueResponse",
     "BitrixAPIBaseValueResponse",
     "BitrixAPIValueResponse",
+    "BitrixAPIValuesListCompactResponse",
     "BitrixAPIValuesListFastResponse",
     "BitrixAPIValuesListResponse",
     "BitrixAPIValuesResponse",
@@ -178,6 +180,53 @@ class BitrixAPIValuesListResponse(BitrixAPIListResponse, AbstractBitrixAPIValueR
         }
 
 
+@dataclass(**frozen_dataclass_kwargs(repr=False, eq=False))
+class BitrixAPIValuesListCompactResponse(BitrixAPIListCompactResponse, AbstractBitrixAPIValueResponse[CompactRows, List[BAValueT]], Generic[BAValueT]):
+    """
+    Compact Bitrix24 list response with adapted values collection.
+
+    ``result`` keeps the fully loaded list packed into ``CompactRows``.
+    ``values`` is adapted from the compact rows using ``result_adapter``.
+    """
+
+    _result_adapter: Callable[[CompactRows], List[BAValueT]]
+
+    @property
+    def values(self) -> List[BAValueT]:
+        """
+        Return adapted Python-friendly values.
+
+        The conversion is performed on each property access.
+        """
+        return self._result_adapter(self.result)
+
+    @classmethod
+    def from_dict(
+            cls,
+            json_response: ListCompactResponseData,
+            /,
+            *,
+            result_adapter: Callable[[CompactRows], List[BAValueT]] = _missing_result_adapter,
+    ) -> "BitrixAPIValuesListCompactResponse[BAValueT]":
+        """
+        Create an adapted compact list response from raw JSON response.
+
+        Args:
+            json_response: Raw JSON response with the result packed into
+                ``CompactRows``.
+            result_adapter: Callable converting compact ``result`` to adapted
+                values.
+
+        Returns:
+            Parsed compact list response with adapted ``values`` access.
+        """
+        return cls(
+            result=json_response["result"],
+            time=cls._convert_time(json_response["time"]),
+            _result_adapter=result_adapter,
+        )
+
+
 @dataclass(**frozen_dataclass_kwargs(repr=False, eq=False))
 class BitrixAPIValuesListFastResponse(BitrixAPIListFastResponse, AbstractBitrixAPIValueResponse[JSONGenerator, Generator[BAValueT, None, None]], Generic[BAValueT]):
     """
@@ -12,17 +12,16 @@ Each client exposes Bitrix API scopes as attributes (e.g. ``crm``, ``user``,
 ``task``) which provide access to the corresponding API methods.
 """
 
-import inspect
 from abc import ABC
 from functools import cached_property
 from typing import TYPE_CHECKING, ClassVar, List, Literal, Mapping, Optional, Sequence, Text, Union, overload
 
 from . import scopes
 from ._constants import MISSING
-from .api.requests import BitrixAPIBatchesRequest, BitrixAPIBatchRequest
+from .api.requests import BitrixAPIBatchesRequest, BitrixAPIBatchRequest, BitrixAPIRequestCoalescer
 from .constants.version import B24APIVersion
 from .protocols import BitrixTokenFullProtocol
-from .scopes._base_context import BaseContext
+from .scopes._base_context import BaseContext, get_child_context_names
 from .utils.types import B24APIVersionLiteral, JSONDict, Key, Number, Timeout
 
 if TYPE_CHECKING:
@@ -45,6 +44,7 @@ class BaseClient(ABC):
 
     - lazy scope access
     - lazy batch request creation
+    - coalescing of lazy requests into shared batch calls
     - API method discovery
     - forwarding request configuration to API request objects
 
@@ -354,6 +354,7 @@ class BaseClient(ABC):
             bitrix_api_requests: Mapping[Key, "BitrixAPIRequest"],
             *,
             halt: bool = False,
+            max_concurrency: Optional[int] = None,
             timeout: Timeout = None,
             **kwargs,
     ) -> BitrixAPIBatchesRequest[Mapping[Key, "BitrixAPIRequest"]]: ...
@@ -364,6 +365,7 @@ class BaseClient(ABC):
             bitrix_api_requests: Sequence["BitrixAPIRequest"],
             *,
             halt: bool = False,
+            max_concurrency: Optional[int] = None,
             timeout: Timeout = None,
             **kwargs,
     ) -> BitrixAPIBatchesRequest[Sequence["BitrixAPIRequest"]]: ...
@@ -373,6 +375,7 @@ class BaseClient(ABC):
             bitrix_api_requests: Union[Mapping[Key, "BitrixAPIRequest"], Sequence["BitrixAPIRequest"]],
             *,
             halt: bool = False,
+            max_concurrency: Optional[int] = None,
             timeout: Timeout = None,
             **kwargs,
     ) -> BitrixAPIBatchesRequest:
@@ -386,6 +389,8 @@ class BaseClient(ABC):
             bitrix_api_requests: Mapping or sequence of ``BitrixAPIRequest``
                 objects to execute.
             halt: Whether to stop batch execution after the first failed command.
+            max_concurrency: Maximum number of batch requests executed at the
+                same time. ``None`` executes them sequentially.
             timeout: Request timeout for batch calls.
             **kwargs: Extra options overriding client-level request options.
 
@@ -402,9 +407,38 @@ class BaseClient(ABC):
             bitrix_token=self._bitrix_token,
             bitrix_api_requests=bitrix_api_requests,
             halt=halt,
+            max_concurrency=max_concurrency,
             **kwargs,
         )
 
+    def coalesce(self, *, max_concurrency: Optional[int] = None) -> BitrixAPIRequestCoalescer:
+        """
+        Create a context manager coalescing lazy requests into batch calls.
+
+        Lazy requests created through this client inside the ``with`` block
+        are not sent one by one. The first access to ``response``, ``result``
+        or ``time`` of any of them dispatches all pending requests in shared
+        ``batch`` calls, sending identical requests once. Create all requests
+        before reading the first response to benefit from coalescing.
+
+        Args:
+            max_concurrency: Maximum number of batch requests executed at the
+                same time when more requests are pending than fit one batch.
+                ``None`` executes them sequentially.
+
+        Returns:
+            Request coalescer bound to the client token.
+
+        Example:
+            >>> with client.coalesce():
+            ...     deals = [client.crm.deal.get(bitrix_id=bitrix_id) for bitrix_id in deal_ids]
+            >>> titles = [deal.result["TITLE"] for deal in deals]
+        """
+        return BitrixAPIRequestCoalescer(
+            bitrix_token=self._bitrix_token,
+            max_concurrency=max_concurrency,
+        )
+
     def __get_context_by_path(self, path: Text) -> "BaseContext":
         """
         Resolve a context object by dot-separated path.
@@ -446,6 +480,10 @@ class BaseClient(ABC):
         """
         Recursively collect supported API method names from a context.
 
+        Method names are taken from the precomputed ``_api_methods`` table of
+        each context, and child contexts are found by static inspection of
+        their classes.
+
         Args:
             context: Client or context object to inspect.
 
@@ -455,19 +493,19 @@ class BaseClient(ABC):
 
         api_methods: List[Text] = []
 
-        for attr_name, value in inspect.getmembers(context):
-            if attr_name == "__call__":
-                api_methods.append(str(context))
+        if isinstance(context, BaseContext):
+            api_methods.extend(
+                api_method
+                for api_wrapper_name, api_method in context._api_methods.items()
+                if api_wrapper_name == "__call__" or not api_wrapper_name.startswith("_")
+            )
 
-            elif attr_name.startswith("_"):
-                continue
+        for attr_name in get_child_context_names(type(context)):
+            value = getattr(context, attr_name)
 
-            elif isinstance(value, BaseContext):
+            if isinstance(value, BaseContext):
                 api_methods.extend(self.__collect_api_methods(value))
 
-            elif not isinstance(context, self.__class__):
-                api_methods.append(f"{context}.{BaseContext._snake_to_camel(attr_name)}")
-
         return api_methods
 
     def get_supported_api_methods(self, context: Optional[Union["BaseContext", Text]] = None) -> List[Text]:
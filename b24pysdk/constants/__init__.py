@@ -6,10 +6,24 @@ from ..utils import types as _types
 
 __all__ = [
     "DEFAULT_CONNECT_TIMEOUT",
+    "DEFAULT_HTTP_POOL_CONNECTIONS",
+    "DEFAULT_HTTP_POOL_MAXSIZE",
+    "DEFAULT_HTTP_SESSION_IDLE_TIMEOUT",
     "DEFAULT_INITIAL_RETRY_DELAY",
     "DEFAULT_MAX_RETRIES",
+    "DEFAULT_OAUTH_TOKEN_REFRESH_MARGIN",
+    "DEFAULT_OPERATING_TIME_LIMIT",
+    "DEFAULT_OPERATING_TIME_WINDOW",
+    "DEFAULT_RATE_LIMIT_BUCKET_SIZE",
+    "DEFAULT_RATE_LIMIT_DRAIN_RATE",
     "DEFAULT_READ_TIMEOUT",
+    "DEFAULT_RESPONSE_CACHE_MAX_SIZE",
+    "DEFAULT_RESPONSE_CACHE_TTL",
+    "DEFAULT_RETRY_BUDGET",
+    "DEFAULT_RETRY_BUDGET_REFILL_RATE",
     "DEFAULT_RETRY_DELAY_INCREMENT",
+    "DEFAULT_RETRY_MAX_DELAY",
+    "DEFAULT_RUNTIME_TYPE_CHECKS",
     "B24AppStatus",
     "B24BoolLit",
     "Protocol",
@@ -24,12 +38,54 @@ DEFAULT_MAX_RETRIES: typing.Final[int] = 3
 DEFAULT_RETRY_DELAY_INCREMENT: typing.Final[_types.Number] = 1
 """"""
 
+DEFAULT_RETRY_MAX_DELAY: typing.Final[_types.Number] = 60
+"""Longest delay in seconds an adaptive retry strategy waits before one retry."""
+
+DEFAULT_RETRY_BUDGET: typing.Final[int] = 20
+"""Number of retries one portal may use in a burst under an adaptive retry strategy."""
+
+DEFAULT_RETRY_BUDGET_REFILL_RATE: typing.Final[_types.Number] = 1
+"""Number of retries per second returned to the retry budget of a portal."""
+
 DEFAULT_CONNECT_TIMEOUT: typing.Final[_types.Number] = 3.05
 """https://requests.readthedocs.io/en/latest/user/advanced/#timeouts"""
 
 DEFAULT_READ_TIMEOUT: typing.Final[_types.Number] = 10
 """"""
 
+DEFAULT_HTTP_POOL_CONNECTIONS: typing.Final[int] = 10
+"""Number of per-host connection pools cached by one pooled HTTP session."""
+
+DEFAULT_HTTP_POOL_MAXSIZE: typing.Final[int] = 10
+"""Maximum number of keep-alive connections kept open to one host."""
+
+DEFAULT_HTTP_SESSION_IDLE_TIMEOUT: typing.Final[_types.Number] = 300
+"""Seconds after which an unused pooled HTTP session is closed."""
+
+DEFAULT_RATE_LIMIT_BUCKET_SIZE: typing.Final[int] = 50
+"""Number of requests a portal accepts in a burst before the request limit applies."""
+
+DEFAULT_RATE_LIMIT_DRAIN_RATE: typing.Final[_types.Number] = 2
+"""Number of requests per second drained from the request bucket of a portal."""
+
+DEFAULT_OPERATING_TIME_LIMIT: typing.Final[_types.Number] = 480
+"""Seconds of execution time one REST method may consume within an operating window."""
+
+DEFAULT_OPERATING_TIME_WINDOW: typing.Final[_types.Number] = 600
+"""Length of the operating time window in seconds."""
+
+DEFAULT_RESPONSE_CACHE_TTL: typing.Final[_types.Number] = 300
+"""Seconds a cached response of a metadata method stays fresh."""
+
+DEFAULT_RESPONSE_CACHE_MAX_SIZE: typing.Final[int] = 1024
+"""Number of responses a response cache backend keeps before evicting the least recently used one."""
+
+DEFAULT_OAUTH_TOKEN_REFRESH_MARGIN: typing.Final[_types.Number] = 60
+"""Seconds before the expiration of an OAuth access token when it is refreshed ahead of the next call."""
+
+DEFAULT_RUNTIME_TYPE_CHECKS: typing.Final[_types.RuntimeTypeChecksLiteral] = "on"
+"""Runtime argument type checking mode of SDK methods."""
+
 
 class B24AppStatus(_enum.StrEnum):
     """"""
@@ -48,3 +48,24 @@ class AppInfoCacheMethods:
             self._set_app_info_cache(bitrix_token.get_app_info().result)
 
         return self._app_info
+
+    async def aget_app_info(self, bitrix_app: "AbstractBitrixApp") -> "B24AppInfoResult":
+        """
+        Asynchronously resolve and cache Bitrix24 ``app.info``.
+
+        Asynchronous counterpart of ``get_app_info``; the request is sent
+        through the configured async transport, so it does not block the
+        event loop.
+
+        Args:
+            bitrix_app: SDK application object with client credentials.
+
+        Returns:
+            Cached or freshly loaded Bitrix24 application installation info.
+        """
+
+        if not hasattr(self, "_app_info"):
+            bitrix_token = self._make_bitrix_token(bitrix_app)
+            self._set_app_info_cache((await bitrix_token.aget_app_info()).result)
+
+        return self._app_info
@@ -78,6 +78,45 @@ class AbstractBitrixApp:
         """
         return BitrixAppInfoResponse.from_dict(BitrixOAuthRequester(self, **kwargs).get_app_info(auth_token))
 
+    async def aget_oauth_token(self, code: Text, **kwargs) -> RenewedOAuth:
+        """
+        Asynchronously exchange authorization code for an OAuth token.
+
+        Args:
+            code: Authorization code received from Bitrix24.
+            **kwargs: Additional parameters passed to the requester.
+
+        Returns:
+            RenewedOAuth object containing access and refresh tokens.
+        """
+        return RenewedOAuth.from_dict(await BitrixOAuthRequester(self, **kwargs).aget_oauth_token(code))
+
+    async def arefresh_oauth_token(self, refresh_token: Text, **kwargs) -> RenewedOAuth:
+        """
+        Asynchronously refresh an existing OAuth token.
+
+        Args:
+            refresh_token: Refresh token issued by Bitrix24.
+            **kwargs: Additional parameters passed to the requester.
+
+        Returns:
+            RenewedOAuth object with updated token data.
+        """
+        return RenewedOAuth.from_dict(await BitrixOAuthRequester(self, **kwargs).arefresh_oauth_token(refresh_token))
+
+    async def aget_app_info(self, auth_token: Text, **kwargs) -> BitrixAppInfoResponse:
+        """
+        Asynchronously retrieve application installation information.
+
+        Args:
+            auth_token: Access token used for authentication.
+            **kwargs: Additional parameters passed to the requester.
+
+        Returns:
+            BitrixAppInfoResponse containing application metadata.
+        """
+        return BitrixAppInfoResponse.from_dict(await BitrixOAuthRequester(self, **kwargs).aget_app_info(auth_token))
+
 
 class AbstractBitrixAppLocal(AbstractBitrixApp):
     """
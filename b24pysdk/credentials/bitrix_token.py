@@ -1,13 +1,28 @@
-from datetime import datetime
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
 from functools import wraps
-from typing import TYPE_CHECKING, Callable, Final, Literal, Mapping, Optional, Sequence, Text, Union, overload
+from typing import TYPE_CHECKING, Awaitable, BinaryIO, Callable, Final, List, Literal, Mapping, Optional, Sequence, Text, Tuple, Union, overload
 
 from .._config import Config
 from .._constants import MISSING
-from ..api.callers import call_batch, call_batches, call_list, call_list_fast, call_method
+from ..api.callers import (
+    acall_batch,
+    acall_batches,
+    acall_list,
+    acall_method,
+    call_batch,
+    call_batches,
+    call_list,
+    call_list_fast,
+    call_method,
+    call_method_download,
+)
 from ..client import Client
 from ..constants.version import B24APIVersion
-from ..errors import BitrixAPIExpiredToken, BitrixResponse302JSONDecodeError
+from ..errors import BitrixAPIExpiredToken, BitrixResponse302JSONDecodeError, BitrixSDKException
 from ..events import OAuthTokenRenewedEvent, PortalDomainChangedEvent
 from ..schemas.api import BatchResponseData, ListFastResponseData, ListResponseData
 from ..utils.functional import classproperty
@@ -21,6 +36,8 @@ except ImportError:
     _BitrixSignalInstance = MISSING
 
 if TYPE_CHECKING:
+    import os
+
     from ..api.responses import BitrixAppInfoResponse
     from ..client import BaseClient, ClientV1, ClientV2, ClientV3
     from .auth import OAuth, RenewedOAuth
@@ -37,22 +54,43 @@ __all__ = [
     "BitrixWebhook",
 ]
 
+_refresh_futures_lock: Final[threading.Lock] = threading.Lock()
+"""Guards ``_refresh_future`` of all tokens; held only while a refresh is started or finished."""
+
 
 def _bitrix_app_required(func: Callable[..., ResponseT]) -> Callable[..., ResponseT]:
     """Require a token to be bound to a Bitrix app before calling an OAuth-only method."""
 
+    def check_bitrix_app(self: "AbstractBitrixToken"):
+        """Validate that ``self.bitrix_app`` is available."""
+        if self.bitrix_app is MISSING or self.bitrix_app is None:
+            raise AttributeError(f"'bitrix_app' is not implemented for {self}")
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(self: "AbstractBitrixToken", *args, **kwargs):
+            """Validate that ``self.bitrix_app`` is available, then await the wrapped method."""
+            check_bitrix_app(self)
+            return await func(self, *args, **kwargs)
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(self: "AbstractBitrixToken", *args, **kwargs):
         """Validate that ``self.bitrix_app`` is available, then call the wrapped method."""
-        if self.bitrix_app is MISSING or self.bitrix_app is None:
-            raise AttributeError(f"'bitrix_app' is not implemented for {self}")
+        check_bitrix_app(self)
         return func(self, *args, **kwargs)
 
     return wrapper
 
 
 class AbstractBitrixToken:
-    """Base token wrapper with retry logic, token refresh, and client helpers."""
+    """
+    Base token wrapper with retry logic, token refresh, and client helpers.
+
+    Every API call method has an asynchronous ``a``-prefixed counterpart with
+    the same expired-token and portal-domain recovery.
+    """
 
     _AUTO_CHANGED_DOMAIN: bool = True
     """Automatically switch token domain on 302 redirect to another portal domain."""
@@ -78,6 +116,9 @@ class AbstractBitrixToken:
     bitrix_app: Optional["AbstractBitrixApp"] = MISSING
     """Bitrix application object used for OAuth flows."""
 
+    _refresh_future: Optional[Future] = None
+    """OAuth token refresh in flight, awaited by other callers that found the same access token expired."""
+
     if _BitrixSignalInstance is not MISSING:
         oauth_token_renewed_signal: _BitrixSignalInstance = _BitrixSignalInstance.create_signal(OAuthTokenRenewedEvent)
         """Signal emitted after successful OAuth token refresh."""
@@ -119,6 +160,23 @@ class AbstractBitrixToken:
         """Return whether the OAuth access token is expired, or ``None`` if expiration is unknown."""
         return self.expires and self.expires <= self._config.get_local_datetime()
 
+    @property
+    def is_expiring(self) -> Optional[bool]:
+        """
+        Return whether the OAuth access token expires within the configured
+        refresh margin, or ``None`` if expiration is unknown.
+        """
+        return self.expires and self._is_expiring(self.expires)
+
+    def _is_expiring(self, expires: datetime) -> bool:
+        """Return whether ``expires`` falls within the configured refresh margin."""
+        return expires - timedelta(seconds=self._config.oauth_token_refresh_margin) <= self._config.get_local_datetime()
+
+    @property
+    def _oauth_token_storage_key(self) -> Text:
+        """Return the key of this token in the configured OAuth token storage."""
+        return f"{self.bitrix_app.client_id}:{self.domain}"
+
     @property
     def oauth_token(self) -> OAuthToken:
         """Return current OAuth credentials as an ``OAuthToken`` value object."""
@@ -252,16 +310,54 @@ class AbstractBitrixToken:
         """
         return self._execute_with_retries(lambda: self.bitrix_app.get_app_info(self.auth_token, **kwargs))
 
-    def refresh_and_set_oauth_token(self, **kwargs):
+    @_bitrix_app_required
+    async def aget_oauth_token(self, code: Text, **kwargs) -> "RenewedOAuth":
         """
-        Refresh OAuth credentials, store them on this token, and emit a renewal signal.
+        Asynchronously exchange an authorization code for OAuth tokens.
 
-        Use this when the token object should continue making API calls after
-        expiration. Subscribers of ``oauth_token_renewed_signal`` can persist the
-        renewed access and refresh tokens in application storage.
+        Asynchronous counterpart of ``get_oauth_token``.
+
+        Args:
+            code: Authorization code received from Bitrix OAuth redirect.
+            **kwargs: Extra request options forwarded to the app OAuth client.
+
+        Returns:
+            OAuth response wrapper with the renewed token and raw response data.
+        """
+        return await self.bitrix_app.aget_oauth_token(code=code, **kwargs)
+
+    @_bitrix_app_required
+    async def arefresh_oauth_token(self, **kwargs) -> "RenewedOAuth":
+        """
+        Asynchronously refresh OAuth tokens without storing them on this token.
+
+        Asynchronous counterpart of ``refresh_oauth_token``.
+
+        Args:
+            **kwargs: Extra request options forwarded to the app OAuth client.
+
+        Returns:
+            OAuth response wrapper with the refreshed token and raw response data.
+        """
+        return await self.bitrix_app.arefresh_oauth_token(refresh_token=self.refresh_token, **kwargs)
+
+    @_bitrix_app_required
+    async def aget_app_info(self, **kwargs) -> "BitrixAppInfoResponse":
+        """
+        Asynchronously send an ``app.info`` request to the Bitrix24 authorization server.
+
+        Asynchronous counterpart of ``get_app_info`` with the same retry layer.
+
+        Args:
+            **kwargs: Extra request options forwarded to the app-info request.
+
+        Returns:
+            Parsed ``app.info`` response for the bound application.
         """
+        return await self._aexecute_with_retries(lambda: self.bitrix_app.aget_app_info(self.auth_token, **kwargs))
 
-        renewed_oauth = self.refresh_oauth_token(**kwargs)
+    def _set_renewed_oauth_token(self, renewed_oauth: "RenewedOAuth"):
+        """Store renewed OAuth credentials and emit a renewal signal."""
 
         self.oauth_token = renewed_oauth.oauth_token
 
@@ -270,19 +366,193 @@ class AbstractBitrixToken:
                 renewed_oauth_token=renewed_oauth,
             ))
 
-    def __expired_token_handler(self) -> bool:
+    def refresh_and_set_oauth_token(self, **kwargs):
         """
-        Try to recover from an expired access token.
+        Refresh OAuth credentials, store them on this token, and emit a renewal signal.
+
+        Use this when the token object should continue making API calls after
+        expiration. Subscribers of ``oauth_token_renewed_signal`` can persist the
+        renewed access and refresh tokens in application storage.
+        """
+        self._set_renewed_oauth_token(self.refresh_oauth_token(**kwargs))
+
+    async def arefresh_and_set_oauth_token(self, **kwargs):
+        """Asynchronous counterpart of ``refresh_and_set_oauth_token``."""
+        self._set_renewed_oauth_token(await self.arefresh_oauth_token(**kwargs))
+
+    def _start_refresh(self, expired_access_token: Text) -> Tuple[Optional[Future], bool]:
+        """
+        Join the refresh of OAuth credentials in flight or start a new one.
+
+        Args:
+            expired_access_token: Access token the caller found expired.
+
+        Returns:
+            ``(None, False)`` when the access token has already been replaced,
+            ``(future, False)`` when another caller is refreshing it, and
+            ``(future, True)`` when the caller must refresh it and resolve
+            ``future`` with ``_finish_refresh``.
+        """
+
+        with _refresh_futures_lock:
+            if self.auth_token != expired_access_token:
+                return None, False
+
+            if self._refresh_future is not None:
+                return self._refresh_future, False
+
+            self._refresh_future = Future()
+
+            return self._refresh_future, True
+
+    def _finish_refresh(self, future: Future, error: Optional[BaseException] = None):
+        """Let waiting callers continue after the refresh started by ``_start_refresh``."""
+
+        with _refresh_futures_lock:
+            self._refresh_future = None
+
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
+    def _update_shared_oauth_token(self, expired_access_token: Text) -> Optional["RenewedOAuth"]:
+        """
+        Refresh OAuth credentials through the configured OAuth token storage.
+
+        Credentials already renewed by another process are reused; otherwise
+        the freshest known refresh token is exchanged and the result is stored
+        for the other processes.
+
+        Returns:
+            Renewed OAuth response when this process refreshed the token,
+            otherwise ``None``.
+        """
+
+        renewed_oauths: List["RenewedOAuth"] = []
+
+        def updater(stored_oauth_token: Optional[OAuthToken]) -> OAuthToken:
+            oauth_token = self.oauth_token
+
+            if stored_oauth_token is not None and stored_oauth_token.expires and (
+                    not oauth_token.expires or stored_oauth_token.expires >= oauth_token.expires
+            ):
+                if stored_oauth_token.access_token != expired_access_token and not self._is_expiring(stored_oauth_token.expires):
+                    return stored_oauth_token
+
+                oauth_token = stored_oauth_token
+
+            renewed_oauth = self.bitrix_app.refresh_oauth_token(refresh_token=oauth_token.refresh_token)
+            renewed_oauths.append(renewed_oauth)
+
+            return renewed_oauth.oauth_token
+
+        self.oauth_token = self._config.oauth_token_storage.update(self._oauth_token_storage_key, updater)
+
+        return renewed_oauths[0] if renewed_oauths else None
+
+    def _refresh_oauth_token_once(self, expired_access_token: Text):
+        """
+        Refresh and store OAuth credentials unless another caller already did it.
+
+        Threads sharing this token send one refresh request: the first caller
+        refreshes the token, the others wait for its outcome. With a configured
+        ``oauth_token_storage``, processes sharing the storage reuse credentials
+        renewed by any of them.
+
+        Args:
+            expired_access_token: Access token the caller found expired.
+        """
+
+        future, is_owner = self._start_refresh(expired_access_token)
+
+        if future is None:
+            return
+
+        if not is_owner:
+            future.result()
+            return
+
+        try:
+            if self._config.oauth_token_storage is None:
+                self.refresh_and_set_oauth_token()
+            else:
+                renewed_oauth = self._update_shared_oauth_token(expired_access_token)
+
+                if renewed_oauth is not None:
+                    self._set_renewed_oauth_token(renewed_oauth)
+
+        except BaseException as error:
+            self._finish_refresh(future, error)
+            raise
+
+        self._finish_refresh(future)
+
+    async def _arefresh_oauth_token_once(self, expired_access_token: Text):
+        """
+        Asynchronous counterpart of ``_refresh_oauth_token_once``.
+
+        The OAuth token storage is used from a worker thread, so waiting for
+        the lock of another process does not block the event loop.
+        """
+
+        future, is_owner = self._start_refresh(expired_access_token)
+
+        if future is None:
+            return
+
+        if not is_owner:
+            await asyncio.wrap_future(future)
+            return
+
+        try:
+            if self._config.oauth_token_storage is None:
+                await self.arefresh_and_set_oauth_token()
+            else:
+                config = self._config
+
+                def update_shared_oauth_token() -> Optional["RenewedOAuth"]:
+                    config.bind_to_current_thread()
+                    return self._update_shared_oauth_token(expired_access_token)
+
+                renewed_oauth = await asyncio.get_running_loop().run_in_executor(None, update_shared_oauth_token)
+
+                if renewed_oauth is not None:
+                    self._set_renewed_oauth_token(renewed_oauth)
+
+        except BaseException as error:
+            self._finish_refresh(future, error)
+            raise
+
+        self._finish_refresh(future)
+
+    def __can_refresh_expired_token(self) -> bool:
+        """
+        Check whether an expired access token can be refreshed.
 
         Returns:
-            ``True`` when a refresh was performed and the original API call can
-            be retried. ``False`` when refresh is disabled or impossible, for
-            example for webhooks or one-off OAuth tokens.
+            ``True`` when refresh is enabled and possible. ``False`` when
+            refresh is disabled or impossible, for example for webhooks or
+            one-off OAuth tokens.
         """
 
+        logger = self._config.logger
+
         if not self._AUTO_REFRESH_EXPIRED_TOKEN:
-            self._config.logger.info(
-                "Token expired: auto-refresh is disabled",
+            if logger.is_enabled_for(logger.INFO):
+                logger.info(
+                    "Token expired: auto-refresh is disabled",
+                    context=dict(
+                        bitrix_token=str(self),
+                        bitrix_app=str(self.bitrix_app),
+                    ),
+                )
+
+            return False
+
+        if self.is_webhook:
+            logger.warning(
+                "Token expired: cannot refresh token for webhook",
                 context=dict(
                     bitrix_token=str(self),
                     bitrix_app=str(self.bitrix_app),
@@ -290,9 +560,9 @@ class AbstractBitrixToken:
             )
             return False
 
-        if self.is_webhook:
-            self._config.logger.warning(
-                "Token expired: cannot refresh token for webhook",
+        if self.is_one_off:
+            logger.warning(
+                "Token expired: cannot refresh one-off token",
                 context=dict(
                     bitrix_token=str(self),
                     bitrix_app=str(self.bitrix_app),
@@ -300,27 +570,91 @@ class AbstractBitrixToken:
             )
             return False
 
-        if self.is_one_off:
-            self._config.logger.warning(
-                "Token expired: cannot refresh one-off token",
+        if logger.is_enabled_for(logger.INFO):
+            logger.info(
+                "Token expired: refreshing token",
                 context=dict(
                     bitrix_token=str(self),
                     bitrix_app=str(self.bitrix_app),
                 ),
             )
+
+        return True
+
+    def __expired_token_handler(self, expired_access_token: Text) -> bool:
+        """
+        Try to recover from an expired access token.
+
+        Args:
+            expired_access_token: Access token the caller found expired.
+
+        Returns:
+            ``True`` when the token was refreshed, by this or a concurrent
+            caller, and the original API call can be retried. ``False`` when
+            refresh is disabled or impossible, for example for webhooks or
+            one-off OAuth tokens.
+        """
+
+        if not self.__can_refresh_expired_token():
             return False
 
-        self._config.logger.info(
-            "Token expired: refreshing token",
+        self._refresh_oauth_token_once(expired_access_token)
+
+        return True
+
+    async def __aexpired_token_handler(self, expired_access_token: Text) -> bool:
+        """Asynchronous counterpart of ``__expired_token_handler``."""
+
+        if not self.__can_refresh_expired_token():
+            return False
+
+        await self._arefresh_oauth_token_once(expired_access_token)
+
+        return True
+
+    def __should_refresh_proactively(self) -> bool:
+        """Whether a refreshable access token is about to expire and should be refreshed before the next call."""
+        return self._AUTO_REFRESH_EXPIRED_TOKEN and not self.is_webhook and not self.is_one_off and bool(self.is_expiring)
+
+    def __log_proactive_refresh_error(self, error: BitrixSDKException):
+        """Log a failed proactive refresh; the call proceeds with the still valid access token."""
+        self._config.logger.warning(
+            "Token is about to expire: proactive refresh failed",
             context=dict(
                 bitrix_token=str(self),
-                bitrix_app=str(self.bitrix_app),
+                error=error,
             ),
         )
 
-        self.refresh_and_set_oauth_token()
+    def __refresh_before_call(self):
+        """Refresh an expired access token, or one about to expire, before an API call."""
 
-        return True
+        if self.is_webhook:
+            return
+
+        if self.has_expired:
+            self.__expired_token_handler(self.auth_token)
+
+        elif self.__should_refresh_proactively():
+            try:
+                self._refresh_oauth_token_once(self.auth_token)
+            except BitrixSDKException as error:
+                self.__log_proactive_refresh_error(error)
+
+    async def __arefresh_before_call(self):
+        """Asynchronous counterpart of ``__refresh_before_call``."""
+
+        if self.is_webhook:
+            return
+
+        if self.has_expired:
+            await self.__aexpired_token_handler(self.auth_token)
+
+        elif self.__should_refresh_proactively():
+            try:
+                await self._arefresh_oauth_token_once(self.auth_token)
+            except BitrixSDKException as error:
+                self.__log_proactive_refresh_error(error)
 
     def _check_and_change_domain(self, new_domain: Text) -> bool:
         """
@@ -347,28 +681,21 @@ class AbstractBitrixToken:
 
         return True
 
-    def _execute_with_retries(self, func: Callable[[], ResponseT]) -> ResponseT:
+    def __domain_redirect_handler(self, error: BitrixResponse302JSONDecodeError) -> bool:
         """
-        Execute ``func`` with SDK-level recovery for expired tokens and domain redirects.
+        Try to recover from a redirect to another portal domain.
 
-        Before the first call, an expired OAuth token is refreshed when possible.
-        If Bitrix responds with a redirect encoded as
-        ``BitrixResponse302JSONDecodeError``, the token domain is updated and
-        the call is retried once. If Bitrix reports an expired token, the token
-        is refreshed and the call is retried once when refresh is possible.
+        Returns:
+            ``True`` when the token domain changed and the original API call
+            can be retried. ``False`` when the error should be re-raised.
         """
 
-        try:
-            if not self.is_webhook and self.has_expired:
-                self.__expired_token_handler()
-
-            return func()
-
-        except BitrixResponse302JSONDecodeError as error:
-            old_domain = self.domain
+        old_domain = self.domain
+        logger = self._config.logger
 
-            if not self._AUTO_CHANGED_DOMAIN:
-                self._config.logger.info(
+        if not self._AUTO_CHANGED_DOMAIN:
+            if logger.is_enabled_for(logger.INFO):
+                logger.info(
                     "Caught BitrixResponse302JSONDecodeError, but auto-domain-change is disabled",
                     context=dict(
                         bitrix_token=str(self),
@@ -376,10 +703,12 @@ class AbstractBitrixToken:
                         new_domain=error.new_domain,
                     ),
                 )
-                raise
 
-            if self._check_and_change_domain(error.new_domain):
-                self._config.logger.info(
+            return False
+
+        if self._check_and_change_domain(error.new_domain):
+            if logger.is_enabled_for(logger.INFO):
+                logger.info(
                     "Domain changed, retrying request",
                     context=dict(
                         bitrix_token=str(self),
@@ -387,27 +716,86 @@ class AbstractBitrixToken:
                         new_domain=error.new_domain,
                     ),
                 )
+
+            return True
+        else:
+            logger.warning(
+                "Caught BitrixResponse302JSONDecodeError, but domain did not change!",
+                context=dict(
+                    bitrix_token=str(self),
+                    old_domain=old_domain,
+                    new_domain=error.new_domain,
+                ),
+            )
+            return False
+
+    def _execute_with_retries(self, func: Callable[[], ResponseT]) -> ResponseT:
+        """
+        Execute ``func`` with SDK-level recovery for expired tokens and domain redirects.
+
+        Before the first call, an expired OAuth token, or one expiring within
+        ``Config().oauth_token_refresh_margin``, is refreshed when possible.
+        If Bitrix responds with a redirect encoded as
+        ``BitrixResponse302JSONDecodeError``, the token domain is updated and
+        the call is retried once. If Bitrix reports an expired token, the token
+        is refreshed and the call is retried once when refresh is possible.
+        Concurrent callers of one token share a single refresh request.
+        """
+
+        access_token = self.auth_token
+
+        try:
+            self.__refresh_before_call()
+
+            access_token = self.auth_token
+
+            return func()
+
+        except BitrixResponse302JSONDecodeError as error:
+            if self.__domain_redirect_handler(error):
                 return func()
-            else:
-                self._config.logger.warning(
-                    "Caught BitrixResponse302JSONDecodeError, but domain did not change!",
-                    context=dict(
-                        bitrix_token=str(self),
-                        old_domain=old_domain,
-                        new_domain=error.new_domain,
-                    ),
-                )
-                raise
+            raise
 
         except BitrixAPIExpiredToken:
-            if self.__expired_token_handler():
+            if self.__expired_token_handler(access_token):
                 return func()
             raise
 
+    async def _aexecute_with_retries(self, func: Callable[[], Awaitable[ResponseT]]) -> ResponseT:
+        """
+        Asynchronous counterpart of ``_execute_with_retries``.
+
+        ``func`` must return a new awaitable on every call, because the API
+        call is awaited again after a token refresh or a domain change.
+        """
+
+        access_token = self.auth_token
+
+        try:
+            await self.__arefresh_before_call()
+
+            access_token = self.auth_token
+
+            return await func()
+
+        except BitrixResponse302JSONDecodeError as error:
+            if self.__domain_redirect_handler(error):
+                return await func()
+            raise
+
+        except BitrixAPIExpiredToken:
+            if await self.__aexpired_token_handler(access_token):
+                return await func()
+            raise
+
     def _call_with_retries(self, call_func: Callable[..., ResponseT], parameters: JSONDict) -> ResponseT:
         """Call a low-level API function with token auth data and retry handling."""
         return self._execute_with_retries(lambda: call_func(**self._auth_data, **parameters))
 
+    async def _acall_with_retries(self, call_func: Callable[..., Awaitable[ResponseT]], parameters: JSONDict) -> ResponseT:
+        """Await a low-level async API function with token auth data and retry handling."""
+        return await self._aexecute_with_retries(lambda: call_func(**self._auth_data, **parameters))
+
     def call_method(
             self,
             api_method: Text,
@@ -500,6 +888,7 @@ class AbstractBitrixToken:
             self,
             methods: Mapping[Key, B24RequestTuple],
             halt: bool = False,
+            max_concurrency: Optional[int] = None,
             timeout: Timeout = None,
             prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
             **kwargs,
@@ -510,6 +899,7 @@ class AbstractBitrixToken:
             self,
             methods: Sequence[B24RequestTuple],
             halt: bool = False,
+            max_concurrency: Optional[int] = None,
             timeout: Timeout = None,
             prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
             **kwargs,
@@ -519,6 +909,7 @@ class AbstractBitrixToken:
             self,
             methods: B24Requests,
             halt: bool = False,
+            max_concurrency: Optional[int] = None,
             timeout: Timeout = None,
             prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
             **kwargs,
@@ -529,6 +920,8 @@ class AbstractBitrixToken:
         Args:
             methods: Batch methods collection.
             halt: Stop on first error if True.
+            max_concurrency: Maximum number of batch requests executed at the
+                same time. ``None`` executes them sequentially.
             timeout: Request timeout in seconds.
             prefer_version: Preferred API version to resolve the batch method against.
 
@@ -540,12 +933,14 @@ class AbstractBitrixToken:
             parameters=dict(
                 methods=methods,
                 halt=halt,
+                max_concurrency=max_concurrency,
                 timeout=timeout,
                 prefer_version=prefer_version,
                 **kwargs,
             ),
         )
 
+    @overload
     def call_list(
             self,
             api_method: Text,
@@ -553,8 +948,33 @@ class AbstractBitrixToken:
             limit: Optional[int] = None,
             timeout: Timeout = None,
             prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+            stream: Literal[False] = False,
             **kwargs,
-    ) -> ListResponseData:
+    ) -> ListResponseData: ...
+
+    @overload
+    def call_list(
+            self,
+            api_method: Text,
+            params: Optional[JSONDict] = None,
+            limit: Optional[int] = None,
+            timeout: Timeout = None,
+            prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+            *,
+            stream: Literal[True],
+            **kwargs,
+    ) -> ListFastResponseData: ...
+
+    def call_list(
+            self,
+            api_method: Text,
+            params: Optional[JSONDict] = None,
+            limit: Optional[int] = None,
+            timeout: Timeout = None,
+            prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+            stream: bool = False,
+            **kwargs,
+    ) -> Union[ListResponseData, ListFastResponseData]:
         """
         Call list-like API methods with pagination and retries.
 
@@ -562,6 +982,8 @@ class AbstractBitrixToken:
             api_method: API method name, e.g. crm.deal.list.
             params: API method parameters.
             limit: Maximum number of items to return.
+            stream: Return a one-time generator that loads items batch by batch
+                instead of a fully loaded list.
             timeout: Request timeout in seconds.
             prefer_version: Preferred API version to resolve the method against.
 
@@ -574,6 +996,7 @@ class AbstractBitrixToken:
                 api_method=api_method,
                 params=params,
                 limit=limit,
+                stream=stream,
                 timeout=timeout,
                 prefer_version=prefer_version,
                 **kwargs,
@@ -588,6 +1011,8 @@ class AbstractBitrixToken:
             limit: Optional[int] = None,
             timeout: Timeout = None,
             prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+            partitions: Optional[int] = None,
+            ordered: bool = True,
             **kwargs,
     ) -> ListFastResponseData:
         """
@@ -600,6 +1025,8 @@ class AbstractBitrixToken:
             limit: Maximum number of items to return.
             timeout: Request timeout in seconds.
             prefer_version: Preferred API version to resolve the method against.
+            partitions: Number of ID ranges loaded concurrently, see ``call_list_fast``.
+            ordered: Whether partitioned loading yields items in ID order.
 
         Returns:
             API response payload.
@@ -613,6 +1040,175 @@ class AbstractBitrixToken:
                 limit=limit,
                 timeout=timeout,
                 prefer_version=prefer_version,
+                partitions=partitions,
+                ordered=ordered,
+                **kwargs,
+            ),
+        )
+
+    def call_method_download(
+            self,
+            api_method: Text,
+            params: Optional[JSONDict] = None,
+            *,
+            destination: Union[Text, "os.PathLike[Text]", BinaryIO],
+            timeout: Timeout = None,
+            **kwargs,
+    ) -> int:
+        """
+        Download file content returned by an API method with automatic retries and token refresh.
+
+        Args:
+            api_method: API method responding with a file, e.g. catalog.product.download.
+            params: API method parameters.
+            destination: Path of the file to write or a binary file object opened for writing.
+            timeout: Request timeout in seconds.
+            **kwargs: Extra download options, see ``call_download``.
+
+        Returns:
+            Size of the downloaded content in bytes.
+        """
+        return self._call_with_retries(
+            call_func=call_method_download,
+            parameters=dict(
+                api_method=api_method,
+                params=params,
+                destination=destination,
+                timeout=timeout,
+                **kwargs,
+            ),
+        )
+
+    async def acall_method(
+            self,
+            api_method: Text,
+            params: Optional[JSONDict] = None,
+            timeout: Timeout = None,
+            prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+            **kwargs,
+    ) -> JSONDict:
+        """
+        Asynchronously call a single Bitrix REST API method with automatic retries and token refresh.
+
+        Args:
+            api_method: API method name, e.g. crm.deal.add.
+            params: API method parameters.
+            timeout: Request timeout in seconds.
+            prefer_version: Preferred API version to resolve the method against.
+
+        Returns:
+            API response payload.
+        """
+        return await self._acall_with_retries(
+            call_func=acall_method,
+            parameters=dict(
+                api_method=api_method,
+                params=params,
+                timeout=timeout,
+                prefer_version=prefer_version,
+                **kwargs,
+            ),
+        )
+
+    async def acall_batch(
+            self,
+            methods: B24Requests,
+            halt: bool = False,
+            ignore_size_limit: bool = False,
+            timeout: Timeout = None,
+            prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+            **kwargs,
+    ) -> BatchResponseData:
+        """
+        Asynchronously call multiple API methods in a single batch request with retries.
+
+        Args:
+            methods: Batch methods collection.
+            halt: Stop on first error if True.
+            ignore_size_limit: Truncate instead of raising when batch size exceeds limit.
+            timeout: Request timeout in seconds.
+            prefer_version: Preferred API version to resolve the batch method against.
+
+        Returns:
+            Batch response payload.
+        """
+        return await self._acall_with_retries(
+            call_func=acall_batch,
+            parameters=dict(
+                methods=methods,
+                halt=halt,
+                ignore_size_limit=ignore_size_limit,
+                timeout=timeout,
+                prefer_version=prefer_version,
+                **kwargs,
+            ),
+        )
+
+    async def acall_batches(
+            self,
+            methods: B24Requests,
+            halt: bool = False,
+            max_concurrency: Optional[int] = None,
+            timeout: Timeout = None,
+            prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+            **kwargs,
+    ) -> BatchResponseData:
+        """
+        Asynchronously call any number of API methods through batch requests with retries.
+
+        Args:
+            methods: Batch methods collection.
+            halt: Stop on first error if True.
+            max_concurrency: Maximum number of batch requests executed at the
+                same time. ``None`` executes them sequentially.
+            timeout: Request timeout in seconds.
+            prefer_version: Preferred API version to resolve the batch method against.
+
+        Returns:
+            Batch response payload.
+        """
+        return await self._acall_with_retries(
+            call_func=acall_batches,
+            parameters=dict(
+                methods=methods,
+                halt=halt,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+                prefer_version=prefer_version,
+                **kwargs,
+            ),
+        )
+
+    async def acall_list(
+            self,
+            api_method: Text,
+            params: Optional[JSONDict] = None,
+            limit: Optional[int] = None,
+            timeout: Timeout = None,
+            prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+            **kwargs,
+    ) -> ListResponseData:
+        """
+        Asynchronously call list-like API methods with pagination and retries.
+
+        Args:
+            api_method: API method name, e.g. crm.deal.list.
+            params: API method parameters.
+            limit: Maximum number of items to return.
+            timeout: Request timeout in seconds.
+            prefer_version: Preferred API version to resolve the method against.
+
+        Returns:
+            API response payload.
+        """
+        return await self._acall_with_retries(
+            call_func=acall_list,
+            parameters=dict(
+                api_method=api_method,
+                params=params,
+                limit=limit,
+                timeout=timeout,
+                prefer_version=prefer_version,
                 **kwargs,
             ),
         )
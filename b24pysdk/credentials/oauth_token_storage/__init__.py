@@ -0,0 +1,13 @@
+from ._base_storage import BaseOAuthTokenStorage
+from .file_storage import FileOAuthTokenStorage
+from .memory_storage import MemoryOAuthTokenStorage
+from .redis_storage import RedisOAuthTokenStorage
+from .sqlite_storage import SQLiteOAuthTokenStorage
+
+__all__ = [
+    "BaseOAuthTokenStorage",
+    "FileOAuthTokenStorage",
+    "MemoryOAuthTokenStorage",
+    "RedisOAuthTokenStorage",
+    "SQLiteOAuthTokenStorage",
+]
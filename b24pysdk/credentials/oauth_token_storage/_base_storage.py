@@ -0,0 +1,78 @@
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Optional, Text, Union
+
+from ..._config import Config
+from ..oauth_token import OAuthToken
+
+__all__ = [
+    "BaseOAuthTokenStorage",
+]
+
+
+class BaseOAuthTokenStorage(ABC):
+    """
+    Base class for storages sharing renewed OAuth credentials.
+
+    A storage keeps the latest OAuth credentials of every application and
+    portal and guarantees that concurrent updates of the same key are applied
+    one after another. The scope of that guarantee (threads of one process or
+    several processes) depends on the concrete storage.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def update(self, key: Text, updater: Callable[[Optional[OAuthToken]], OAuthToken]) -> OAuthToken:
+        """
+        Atomically read, replace and store the OAuth credentials of one portal.
+
+        Args:
+            key: Application and portal key.
+            updater: Function receiving the stored credentials, or ``None``
+                when nothing is stored, and returning the credentials to store.
+
+        Returns:
+            Credentials returned by ``updater``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self):
+        """Remove stored credentials of all portals."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _dump(oauth_token: OAuthToken) -> Text:
+        """Serialize OAuth credentials into a JSON string."""
+        return json.dumps(
+            {
+                "access_token": oauth_token.access_token,
+                "refresh_token": oauth_token.refresh_token,
+                "expires": oauth_token.expires and oauth_token.expires.timestamp(),
+                "expires_in": oauth_token.expires_in,
+            },
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def _load(content: Optional[Union[bytes, Text]]) -> Optional[OAuthToken]:
+        """Deserialize OAuth credentials, treating missing or broken content as no credentials."""
+
+        if not content:
+            return None
+
+        try:
+            payload = json.loads(content)
+            expires = payload["expires"]
+
+            return OAuthToken(
+                access_token=payload["access_token"],
+                refresh_token=payload["refresh_token"],
+                expires=None if expires is None else datetime.fromtimestamp(expires, tz=Config().tz),
+                expires_in=payload["expires_in"],
+            )
+
+        except (KeyError, TypeError, ValueError):
+            return None
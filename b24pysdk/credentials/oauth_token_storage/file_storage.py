@@ -0,0 +1,109 @@
+import getpass
+import hashlib
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Callable, Final, Optional, Text, Union
+
+from ...utils.file_lock import locked_file
+from ..oauth_token import OAuthToken
+from ._base_storage import BaseOAuthTokenStorage
+
+__all__ = [
+    "FileOAuthTokenStorage",
+]
+
+
+class FileOAuthTokenStorage(BaseOAuthTokenStorage):
+    """
+    OAuth token storage shared by several processes through files.
+
+    The credentials of every portal are stored as JSON in their own file
+    inside ``directory``. Updates hold an exclusive OS-level lock on that
+    file, so worker processes of one host refresh the token of a portal once.
+    """
+
+    _DEFAULT_DIRECTORY_NAME: Final[Text] = "b24pysdk-oauth-tokens"
+    _DIRECTORY_MODE: Final[int] = 0o700
+    _FILE_MODE: Final[int] = 0o600
+    _FILE_SUFFIX: Final[Text] = ".json"
+
+    __slots__ = ("_directory",)
+
+    _directory: Path
+
+    def __init__(self, directory: Optional[Union[Text, os.PathLike]] = None):
+        """
+        Initialize the file storage.
+
+        Args:
+            directory: Directory for credential files. Defaults to a
+                ``b24pysdk-oauth-tokens-<user>`` directory of the current user
+                in the system temporary directory. All processes that share
+                credentials must use the same directory. The files contain
+                access and refresh tokens, so the directory must not be
+                readable by other users; files are created with mode 0o600.
+
+        Raises:
+            PermissionError: If the default directory is not owned by the
+                current user or is accessible by other users.
+        """
+
+        if directory is None:
+            self._directory = self._get_default_directory()
+        else:
+            self._directory = Path(directory)
+            self._directory.mkdir(mode=self._DIRECTORY_MODE, parents=True, exist_ok=True)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(directory={str(self._directory)!r})"
+
+    @property
+    def directory(self) -> Path:
+        """Directory that contains credential files."""
+        return self._directory
+
+    @classmethod
+    def _get_default_directory(cls) -> Path:
+        """Create the per-user default directory, making sure no other user controls it."""
+
+        user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+        directory = Path(tempfile.gettempdir()) / f"{cls._DEFAULT_DIRECTORY_NAME}-{user}"
+        directory.mkdir(mode=cls._DIRECTORY_MODE, exist_ok=True)
+
+        if hasattr(os, "getuid"):
+            directory_stat = directory.lstat()
+
+            if not stat.S_ISDIR(directory_stat.st_mode) or directory_stat.st_uid != os.getuid():
+                raise PermissionError(f"Token directory {str(directory)!r} must be a directory owned by the current user")
+
+            if stat.S_IMODE(directory_stat.st_mode) & ~cls._DIRECTORY_MODE:
+                raise PermissionError(f"Token directory {str(directory)!r} must not be accessible by other users")
+
+        return directory
+
+    def _get_path(self, key: Text) -> Path:
+        """Return credential file path of a key."""
+        return self._directory / f"{hashlib.sha256(key.encode()).hexdigest()}{self._FILE_SUFFIX}"
+
+    def update(self, key: Text, updater: Callable[[Optional[OAuthToken]], OAuthToken]) -> OAuthToken:
+        """Update credentials of one key while holding the lock of its file."""
+
+        file_descriptor = os.open(self._get_path(key), os.O_RDWR | os.O_CREAT, self._FILE_MODE)
+
+        with os.fdopen(file_descriptor, "r+", encoding="utf-8") as file, locked_file(file):
+            file.seek(0)
+            oauth_token = updater(self._load(file.read()))
+
+            file.seek(0)
+            file.truncate()
+            file.write(self._dump(oauth_token))
+            file.flush()
+
+        return oauth_token
+
+    def clear(self):
+        """Remove credential files of all portals."""
+        for path in self._directory.glob(f"*{self._FILE_SUFFIX}"):
+            path.unlink(missing_ok=True)
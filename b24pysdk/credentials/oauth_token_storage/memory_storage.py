@@ -0,0 +1,53 @@
+import threading
+from typing import Callable, Dict, Optional, Text
+
+from ..oauth_token import OAuthToken
+from ._base_storage import BaseOAuthTokenStorage
+
+__all__ = [
+    "MemoryOAuthTokenStorage",
+]
+
+
+class MemoryOAuthTokenStorage(BaseOAuthTokenStorage):
+    """
+    OAuth token storage kept in the memory of the current process.
+
+    Shares renewed credentials between token objects of the same portal
+    created by different threads or requests of one process, for example
+    per-request tokens of a web application. It is also a stand-in for a
+    Redis storage in tests and single-process deployments.
+    """
+
+    __slots__ = ("_key_locks", "_lock", "_oauth_tokens")
+
+    _key_locks: Dict[Text, threading.Lock]
+    _lock: threading.Lock
+    _oauth_tokens: Dict[Text, OAuthToken]
+
+    def __init__(self):
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._oauth_tokens = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def _get_key_lock(self, key: Text) -> threading.Lock:
+        """Return the lock serializing updates of one key."""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def update(self, key: Text, updater: Callable[[Optional[OAuthToken]], OAuthToken]) -> OAuthToken:
+        """Update credentials of one key while holding its lock."""
+
+        with self._get_key_lock(key):
+            oauth_token = updater(self._oauth_tokens.get(key))
+            self._oauth_tokens[key] = oauth_token
+
+        return oauth_token
+
+    def clear(self):
+        """Remove stored credentials of all portals."""
+        with self._lock:
+            self._oauth_tokens.clear()
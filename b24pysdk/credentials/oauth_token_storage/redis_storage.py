@@ -0,0 +1,119 @@
+import time
+import uuid
+from typing import Callable, Final, Optional, Text
+
+from ...protocols import RedisClientProtocol
+from ...utils.types import Number
+from ..oauth_token import OAuthToken
+from ._base_storage import BaseOAuthTokenStorage
+
+__all__ = [
+    "RedisOAuthTokenStorage",
+]
+
+
+class RedisOAuthTokenStorage(BaseOAuthTokenStorage):
+    """
+    OAuth token storage shared by processes of several hosts through Redis.
+
+    Updates of one key are serialized by a lock key acquired with
+    ``SET NX PX``. The lock expires after ``lock_timeout`` seconds, so a
+    crashed process cannot block the refresh of a portal forever.
+    """
+
+    _DEFAULT_PREFIX: Final[Text] = "b24pysdk:oauth_token:"
+    _LOCK_SUFFIX: Final[Text] = ":lock"
+    _DEFAULT_LOCK_TIMEOUT: Final[Number] = 30
+    _DEFAULT_POLL_INTERVAL: Final[Number] = 0.05
+
+    __slots__ = ("_client", "_lock_timeout", "_poll_interval", "_prefix")
+
+    _client: RedisClientProtocol
+    _lock_timeout: Number
+    _poll_interval: Number
+    _prefix: Text
+
+    def __init__(
+            self,
+            client: RedisClientProtocol,
+            *,
+            prefix: Text = _DEFAULT_PREFIX,
+            lock_timeout: Number = _DEFAULT_LOCK_TIMEOUT,
+            poll_interval: Number = _DEFAULT_POLL_INTERVAL,
+    ):
+        """
+        Initialize the Redis storage.
+
+        Args:
+            client: Redis client, for example ``redis.Redis``.
+            prefix: Prefix of keys created by the storage.
+            lock_timeout: Seconds after which the lock of a key expires. Must
+                exceed the duration of one token refresh request.
+            poll_interval: Seconds between attempts to acquire a held lock.
+
+        Raises:
+            TypeError: If ``client`` does not implement ``RedisClientProtocol``.
+            ValueError: If ``lock_timeout`` or ``poll_interval`` is not positive.
+        """
+
+        if not isinstance(client, RedisClientProtocol):
+            raise TypeError("Client must implement RedisClientProtocol")
+
+        if not (isinstance(lock_timeout, (int, float)) and lock_timeout > 0):
+            raise ValueError("Lock_timeout must be a positive number")
+
+        if not (isinstance(poll_interval, (int, float)) and poll_interval > 0):
+            raise ValueError("Poll_interval must be a positive number")
+
+        self._client = client
+        self._prefix = prefix
+        self._lock_timeout = lock_timeout
+        self._poll_interval = poll_interval
+
+    def __repr__(self):
+        return f"{type(self).__name__}(prefix={self._prefix!r}, lock_timeout={self._lock_timeout})"
+
+    def _acquire_lock(self, lock_key: Text) -> Text:
+        """Block until the lock key is acquired and return the owner value stored in it."""
+
+        owner = uuid.uuid4().hex
+
+        while not self._client.set(lock_key, owner, nx=True, px=int(self._lock_timeout * 1000)):
+            time.sleep(self._poll_interval)
+
+        return owner
+
+    def _release_lock(self, lock_key: Text, owner: Text):
+        """Remove the lock key unless it expired and was acquired by another process."""
+
+        value = self._client.get(lock_key)
+
+        if isinstance(value, bytes):
+            value = value.decode()
+
+        if value == owner:
+            self._client.delete(lock_key)
+
+    def update(self, key: Text, updater: Callable[[Optional[OAuthToken]], OAuthToken]) -> OAuthToken:
+        """Update credentials of one key while holding its lock key."""
+
+        storage_key = f"{self._prefix}{key}"
+        lock_key = f"{storage_key}{self._LOCK_SUFFIX}"
+
+        owner = self._acquire_lock(lock_key)
+
+        try:
+            oauth_token = updater(self._load(self._client.get(storage_key)))
+            self._client.set(storage_key, self._dump(oauth_token))
+        finally:
+            self._release_lock(lock_key, owner)
+
+        return oauth_token
+
+    def clear(self):
+        """Remove stored credentials of all portals."""
+
+        keys = list(self._client.scan_iter(match=f"{self._prefix}*"))
+
+        if keys:
+            self._client.delete(*keys)
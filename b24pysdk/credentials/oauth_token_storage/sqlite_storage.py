@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from pathlib import Path
+from typing import Callable, Final, Optional, Text, Union
+
+from ...utils.types import Number
+from ..oauth_token import OAuthToken
+from ._base_storage import BaseOAuthTokenStorage
+
+__all__ = [
+    "SQLiteOAuthTokenStorage",
+]
+
+
+class SQLiteOAuthTokenStorage(BaseOAuthTokenStorage):
+    """
+    OAuth token storage shared by several processes through an SQLite file.
+
+    Every update runs in its own ``BEGIN IMMEDIATE`` transaction, which holds
+    the write lock of the database while the credentials are read, refreshed
+    and stored, so worker processes of one host refresh the token of a portal
+    once.
+    """
+
+    _DEFAULT_FILE_NAME: Final[Text] = "b24pysdk-oauth-tokens.sqlite3"
+    _CONNECT_TIMEOUT: Final[Number] = 30
+
+    _CREATE_TABLE_SQL: Final[Text] = (
+        "CREATE TABLE IF NOT EXISTS oauth_tokens ("
+        "key TEXT PRIMARY KEY, "
+        "value TEXT NOT NULL)"
+    )
+
+    __slots__ = ("_path",)
+
+    _path: Path
+
+    def __init__(self, path: Optional[Union[Text, os.PathLike]] = None):
+        """
+        Initialize the SQLite storage.
+
+        Args:
+            path: Database file. Defaults to ``b24pysdk-oauth-tokens.sqlite3``
+                in the system temporary directory. All processes that share
+                credentials must use the same file. The file contains access
+                and refresh tokens, so it must not be readable by other users.
+        """
+
+        if path is None:
+            path = Path(tempfile.gettempdir()) / self._DEFAULT_FILE_NAME
+
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(self._connect()) as connection:
+            connection.execute(self._CREATE_TABLE_SQL)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(path={str(self._path)!r})"
+
+    @property
+    def path(self) -> Path:
+        """Database file that contains the credentials."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection managing transactions explicitly."""
+        return sqlite3.connect(self._path, timeout=self._CONNECT_TIMEOUT, isolation_level=None)
+
+    def update(self, key: Text, updater: Callable[[Optional[OAuthToken]], OAuthToken]) -> OAuthToken:
+        """Update credentials of one key inside a write transaction."""
+
+        with closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                row = connection.execute("SELECT value FROM oauth_tokens WHERE key = ?", (key,)).fetchone()
+                oauth_token = updater(self._load(row and row[0]))
+                connection.execute("INSERT OR REPLACE INTO oauth_tokens (key, value) VALUES (?, ?)", (key, self._dump(oauth_token)))
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+            connection.execute("COMMIT")
+
+        return oauth_token
+
+    def clear(self):
+        """Remove stored credentials of all portals."""
+        with closing(self._connect()) as connection:
+            connection.execute("DELETE FROM oauth_tokens")
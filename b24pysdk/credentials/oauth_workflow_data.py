@@ -97,6 +97,18 @@ class OAuthWorkflowData:
         """
         return self.auth.get_app_info(bitrix_app)
 
+    async def aget_app_info(self, bitrix_app: "AbstractBitrixApp") -> "B24AppInfoResult":
+        """
+        Asynchronously resolve Bitrix24 ``app.info`` through the workflow auth payload.
+
+        Args:
+            bitrix_app: SDK application object used to call ``app.info``.
+
+        Returns:
+            Bitrix24 application installation information.
+        """
+        return await self.auth.aget_app_info(bitrix_app)
+
     def validate_against_app_info(self, app_info: "B24AppInfoResult") -> bool:
         """
         Validate workflow auth data against Bitrix24 ``app.info`` result.
@@ -0,0 +1,13 @@
+from ._base_store import BasePortalCredentialsStore
+from .memory_store import MemoryPortalCredentialsStore
+from .portal_credentials import PortalCredentials
+from .portal_registry import PortalRegistry
+from .sqlite_store import SQLitePortalCredentialsStore
+
+__all__ = [
+    "BasePortalCredentialsStore",
+    "MemoryPortalCredentialsStore",
+    "PortalCredentials",
+    "PortalRegistry",
+    "SQLitePortalCredentialsStore",
+]
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Text
+
+from .portal_credentials import PortalCredentials
+
+__all__ = [
+    "BasePortalCredentialsStore",
+]
+
+
+class BasePortalCredentialsStore(ABC):
+    """
+    Base class for stores of portal credentials used by ``PortalRegistry``.
+
+    A store keeps the credentials of every portal the application is
+    installed on, keyed by ``member_id``, and outlives the registry, so
+    portals evicted from the registry or served by another process are
+    restored with their latest tokens.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get(self, member_id: Text) -> Optional[PortalCredentials]:
+        """
+        Return credentials of a portal.
+
+        Args:
+            member_id: Unique portal identifier.
+
+        Returns:
+            Stored credentials, or ``None`` when the portal is unknown.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_domain(self, domain: Text) -> Optional[PortalCredentials]:
+        """
+        Return credentials of the portal with the given domain.
+
+        Args:
+            domain: Portal domain.
+
+        Returns:
+            Stored credentials, or ``None`` when the domain is unknown.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, portal_credentials: PortalCredentials):
+        """
+        Store credentials of a portal, replacing the previous ones.
+
+        Args:
+            portal_credentials: Credentials to store.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, member_id: Text):
+        """
+        Remove credentials of a portal, for example after the application was uninstalled.
+
+        Args:
+            member_id: Unique portal identifier.
+        """
+        raise NotImplementedError
@@ -0,0 +1,55 @@
+import threading
+from typing import Dict, Optional, Text
+
+from ._base_store import BasePortalCredentialsStore
+from .portal_credentials import PortalCredentials
+
+__all__ = [
+    "MemoryPortalCredentialsStore",
+]
+
+
+class MemoryPortalCredentialsStore(BasePortalCredentialsStore):
+    """
+    Portal credentials store kept in the memory of the current process.
+
+    Credentials are lost when the process exits, so it suits tests and
+    applications that register every portal on start-up.
+    """
+
+    __slots__ = ("_lock", "_portal_credentials")
+
+    _lock: threading.Lock
+    _portal_credentials: Dict[Text, PortalCredentials]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._portal_credentials = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def get(self, member_id: Text) -> Optional[PortalCredentials]:
+        """Return credentials of a portal."""
+        with self._lock:
+            return self._portal_credentials.get(member_id)
+
+    def get_by_domain(self, domain: Text) -> Optional[PortalCredentials]:
+        """Return credentials of the portal with the given domain."""
+
+        with self._lock:
+            for portal_credentials in self._portal_credentials.values():
+                if portal_credentials.domain == domain:
+                    return portal_credentials
+
+        return None
+
+    def save(self, portal_credentials: PortalCredentials):
+        """Store credentials of a portal."""
+        with self._lock:
+            self._portal_credentials[portal_credentials.member_id] = portal_credentials
+
+    def delete(self, member_id: Text):
+        """Remove credentials of a portal."""
+        with self._lock:
+            self._portal_credentials.pop(member_id, None)
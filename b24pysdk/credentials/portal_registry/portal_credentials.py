@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Text
+
+from ...utils.dataclasses import frozen_dataclass_kwargs
+from ..oauth_token import OAuthToken
+
+if TYPE_CHECKING:
+    from ..auth import OAuth
+
+__all__ = [
+    "PortalCredentials",
+]
+
+
+@dataclass(**frozen_dataclass_kwargs(eq=False))
+class PortalCredentials:
+    """
+    OAuth credentials of one application installation on a Bitrix24 portal.
+
+    Attributes:
+        member_id: Unique portal identifier issued by Bitrix24.
+        domain: Current portal domain.
+        oauth_token: Latest known OAuth credentials of the installation.
+    """
+
+    member_id: Text
+    domain: Text
+    oauth_token: OAuthToken
+
+    @classmethod
+    def from_oauth(cls, oauth: "OAuth", /) -> "PortalCredentials":
+        """
+        Create portal credentials from a parsed OAuth payload.
+
+        Args:
+            oauth: OAuth payload of an installation, event or placement.
+
+        Returns:
+            PortalCredentials instance.
+        """
+        return cls(
+            member_id=oauth.member_id,
+            domain=oauth.portal_domain,
+            oauth_token=oauth.oauth_token,
+        )
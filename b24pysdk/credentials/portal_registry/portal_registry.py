@@ -0,0 +1,427 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Final, Optional, Text
+
+from ...constants.version import B24APIVersion
+from ...events import OAuthTokenRenewedEvent, PortalDomainChangedEvent
+from ...utils.types import Number
+from ..bitrix_token import BitrixToken
+from ._base_store import BasePortalCredentialsStore
+from .memory_store import MemoryPortalCredentialsStore
+from .portal_credentials import PortalCredentials
+
+try:
+    from ...signals import BitrixSignalInstance  # noqa: F401
+except ImportError as error:
+    raise ImportError("Portal registry requires optional dependency psygnal. Install b24pysdk[signals].") from error
+
+if TYPE_CHECKING:
+    from ...api.responses import B24AppInfoResult
+    from ...client import BaseClient
+    from ..bitrix_app import AbstractBitrixApp
+
+__all__ = [
+    "PortalRegistry",
+]
+
+
+class _Portal:
+    """Long-lived token of one portal together with its clients and cached ``app.info``."""
+
+    __slots__ = (
+        "__weakref__",
+        "app_info",
+        "app_info_expires_at",
+        "bitrix_token",
+        "clients",
+        "last_used_at",
+        "lock",
+        "member_id",
+        "registry",
+    )
+
+    app_info: Optional["B24AppInfoResult"]
+    app_info_expires_at: float
+    bitrix_token: BitrixToken
+    clients: Dict[B24APIVersion, "BaseClient"]
+    last_used_at: float
+    lock: threading.Lock
+    member_id: Text
+    registry: "PortalRegistry"
+
+    def __init__(self, registry: "PortalRegistry", bitrix_token: BitrixToken, member_id: Text):
+        self.registry = registry
+        self.bitrix_token = bitrix_token
+        self.member_id = member_id
+        self.clients = {}
+        self.app_info = None
+        self.app_info_expires_at = 0.0
+        self.last_used_at = time.monotonic()
+        self.lock = threading.Lock()
+
+        bitrix_token.oauth_token_renewed_signal.connect(self.on_oauth_token_renewed)
+        bitrix_token.portal_domain_changed_signal.connect(self.on_portal_domain_changed)
+
+    def close(self):
+        """Stop propagating token events of an evicted portal."""
+        self.bitrix_token.oauth_token_renewed_signal.disconnect(self.on_oauth_token_renewed)
+        self.bitrix_token.portal_domain_changed_signal.disconnect(self.on_portal_domain_changed)
+
+    def on_oauth_token_renewed(self, _event: OAuthTokenRenewedEvent):
+        """Save renewed credentials to the store of the registry."""
+        self.registry._save(self)
+
+    def on_portal_domain_changed(self, event: PortalDomainChangedEvent):
+        """Save the new portal domain to the store of the registry."""
+        self.registry._change_domain(self, event.old_domain, event.new_domain)
+
+
+class PortalRegistry:
+    """
+    Registry of long-lived tokens and clients of the portals an application is installed on.
+
+    Serves many portals from one process: each portal gets one token and one
+    client per API version, created from the credentials store on first use
+    and reused by later requests instead of being rebuilt every time.
+    Renewed OAuth tokens (``OAuthTokenRenewedEvent``) and portal domain
+    changes (``PortalDomainChangedEvent``) of registered tokens are saved
+    to the store automatically.
+
+    Least recently used portals are evicted when more than ``max_portals``
+    are held or when a portal was not used for ``idle_timeout`` seconds; an
+    evicted portal is restored from the store on its next use.
+
+    Keep-alive HTTP sessions and the configured ``RateLimiter`` already keep
+    their state per portal domain, so every registered portal has its own
+    connection pool and request bucket.
+
+    Requires the optional dependency psygnal (``pip install b24pysdk[signals]``).
+
+    Example:
+        >>> registry = PortalRegistry(bitrix_app, store=SQLitePortalCredentialsStore("portals.sqlite3"))
+        >>> registry.register(PortalCredentials.from_oauth(oauth))
+        >>> client = registry.get_client(member_id=oauth.member_id)
+    """
+
+    _DEFAULT_MAX_PORTALS: Final[int] = 1000
+    _DEFAULT_APP_INFO_TTL: Final[Number] = 300
+
+    __slots__ = (
+        "_app_info_ttl",
+        "_bitrix_app",
+        "_domains",
+        "_idle_timeout",
+        "_lock",
+        "_max_portals",
+        "_portals",
+        "_store",
+    )
+
+    _app_info_ttl: Number
+    _bitrix_app: "AbstractBitrixApp"
+    _domains: Dict[Text, Text]
+    _idle_timeout: Optional[Number]
+    _lock: threading.RLock
+    _max_portals: int
+    _portals: "OrderedDict[Text, _Portal]"
+    _store: BasePortalCredentialsStore
+
+    def __init__(
+            self,
+            bitrix_app: "AbstractBitrixApp",
+            *,
+            store: Optional[BasePortalCredentialsStore] = None,
+            max_portals: int = _DEFAULT_MAX_PORTALS,
+            idle_timeout: Optional[Number] = None,
+            app_info_ttl: Number = _DEFAULT_APP_INFO_TTL,
+    ):
+        """
+        Initialize a portal registry.
+
+        Args:
+            bitrix_app: Application whose installations are served.
+            store: Store of portal credentials. Defaults to a new
+                ``MemoryPortalCredentialsStore``.
+            max_portals: Number of portals kept before the least recently
+                used one is evicted.
+            idle_timeout: Seconds after which an unused portal is evicted.
+                ``None`` keeps portals until ``max_portals`` is exceeded.
+            app_info_ttl: Seconds a cached ``app.info`` result stays fresh.
+
+        Raises:
+            TypeError: If ``store`` is not a ``BasePortalCredentialsStore``.
+            ValueError: If ``max_portals``, ``idle_timeout`` or
+                ``app_info_ttl`` is not positive.
+        """
+
+        if store is None:
+            store = MemoryPortalCredentialsStore()
+
+        elif not isinstance(store, BasePortalCredentialsStore):
+            raise TypeError("Store must be an instance of BasePortalCredentialsStore")
+
+        if not (isinstance(max_portals, int) and max_portals >= 1):
+            raise ValueError("Max_portals must be a positive integer (>= 1)")
+
+        if idle_timeout is not None and not (isinstance(idle_timeout, (int, float)) and idle_timeout > 0):
+            raise ValueError("Idle_timeout must be a positive number")
+
+        if not (isinstance(app_info_ttl, (int, float)) and app_info_ttl > 0):
+            raise ValueError("App_info_ttl must be a positive number")
+
+        self._bitrix_app = bitrix_app
+        self._store = store
+        self._max_portals = max_portals
+        self._idle_timeout = idle_timeout
+        self._app_info_ttl = app_info_ttl
+        self._lock = threading.RLock()
+        self._portals = OrderedDict()
+        self._domains = {}
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}("
+            f"bitrix_app={self._bitrix_app}, "
+            f"store={self._store!r}, "
+            f"max_portals={self._max_portals}, "
+            f"idle_timeout={self._idle_timeout}, "
+            f"app_info_ttl={self._app_info_ttl})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._portals)
+
+    def __contains__(self, member_id: Text) -> bool:
+        return member_id in self._portals
+
+    @property
+    def store(self) -> BasePortalCredentialsStore:
+        """Store of portal credentials."""
+        return self._store
+
+    def register(self, portal_credentials: PortalCredentials) -> BitrixToken:
+        """
+        Save credentials of a portal, for example after installation or from an event payload.
+
+        A portal already held by the registry takes over the new credentials.
+
+        Args:
+            portal_credentials: Credentials of the portal.
+
+        Returns:
+            Long-lived token of the portal.
+        """
+
+        with self._lock:
+            self._store.save(portal_credentials)
+
+            portal = self._portals.get(portal_credentials.member_id)
+
+            if portal is not None:
+                bitrix_token = portal.bitrix_token
+                bitrix_token.oauth_token = portal_credentials.oauth_token
+
+                if bitrix_token.domain != portal_credentials.domain:
+                    self._domains.pop(bitrix_token.domain, None)
+                    bitrix_token.domain = portal_credentials.domain
+                    self._domains[bitrix_token.domain] = portal.member_id
+
+        return self.get_token(member_id=portal_credentials.member_id)
+
+    def unregister(self, member_id: Text):
+        """
+        Evict a portal and remove its credentials from the store, for example after uninstallation.
+
+        Args:
+            member_id: Unique portal identifier.
+        """
+        with self._lock:
+            self.evict(member_id)
+            self._store.delete(member_id)
+
+    def evict(self, member_id: Text):
+        """
+        Release the token and clients of a portal; the store keeps its credentials.
+
+        Args:
+            member_id: Unique portal identifier.
+        """
+
+        with self._lock:
+            portal = self._portals.pop(member_id, None)
+
+            if portal is not None:
+                self._domains.pop(portal.bitrix_token.domain, None)
+                portal.close()
+
+    def clear(self):
+        """Evict all portals."""
+        with self._lock:
+            for member_id in list(self._portals):
+                self.evict(member_id)
+
+    def get_token(self, member_id: Optional[Text] = None, *, domain: Optional[Text] = None) -> BitrixToken:
+        """
+        Return the long-lived token of a portal.
+
+        Args:
+            member_id: Unique portal identifier.
+            domain: Portal domain, used when ``member_id`` is not known.
+
+        Returns:
+            Token of the portal.
+
+        Raises:
+            KeyError: If the store has no credentials of the portal.
+        """
+        return self._get_portal(member_id, domain).bitrix_token
+
+    def get_client(
+            self,
+            member_id: Optional[Text] = None,
+            *,
+            domain: Optional[Text] = None,
+            prefer_version: B24APIVersion = B24APIVersion.V2,
+    ) -> "BaseClient":
+        """
+        Return the long-lived client of a portal.
+
+        Args:
+            member_id: Unique portal identifier.
+            domain: Portal domain, used when ``member_id`` is not known.
+            prefer_version: Preferred API version of the client.
+
+        Returns:
+            Client bound to the token of the portal.
+
+        Raises:
+            KeyError: If the store has no credentials of the portal.
+        """
+
+        portal = self._get_portal(member_id, domain)
+        prefer_version = B24APIVersion(prefer_version)
+
+        with portal.lock:
+            client = portal.clients.get(prefer_version)
+
+            if client is None:
+                client = portal.clients[prefer_version] = portal.bitrix_token.get_client(prefer_version=prefer_version)
+
+        return client
+
+    def get_app_info(self, member_id: Optional[Text] = None, *, domain: Optional[Text] = None) -> "B24AppInfoResult":
+        """
+        Return the ``app.info`` result of a portal, cached for ``app_info_ttl`` seconds.
+
+        Concurrent callers of one portal wait for a single ``app.info`` request.
+
+        Args:
+            member_id: Unique portal identifier.
+            domain: Portal domain, used when ``member_id`` is not known.
+
+        Returns:
+            Application installation info of the portal.
+
+        Raises:
+            KeyError: If the store has no credentials of the portal.
+        """
+
+        portal = self._get_portal(member_id, domain)
+
+        with portal.lock:
+            if portal.app_info is None or portal.app_info_expires_at <= time.monotonic():
+                portal.app_info = portal.bitrix_token.get_app_info().result
+                portal.app_info_expires_at = time.monotonic() + self._app_info_ttl
+
+            return portal.app_info
+
+    def _get_portal(self, member_id: Optional[Text], domain: Optional[Text]) -> _Portal:
+        """Return a held portal, restoring it from the store when needed."""
+
+        if (member_id is None) == (domain is None):
+            raise ValueError("Exactly one of member_id and domain must be provided")
+
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_idle(now)
+
+            if member_id is None:
+                member_id = self._domains.get(domain)
+
+            portal = None if member_id is None else self._portals.get(member_id)
+
+            if portal is None:
+                portal = self._restore(member_id, domain)
+            else:
+                self._portals.move_to_end(member_id)
+
+            portal.last_used_at = now
+
+            return portal
+
+    def _restore(self, member_id: Optional[Text], domain: Optional[Text]) -> _Portal:
+        """Create the token of a portal from the store and evict portals over the limit."""
+
+        if member_id is not None:
+            portal_credentials = self._store.get(member_id)
+        else:
+            portal_credentials = self._store.get_by_domain(domain)
+
+        if portal_credentials is None:
+            raise KeyError(f"Portal {member_id or domain} is not registered")
+
+        oauth_token = portal_credentials.oauth_token
+
+        bitrix_token = BitrixToken(
+            domain=portal_credentials.domain,
+            auth_token=oauth_token.access_token,
+            refresh_token=oauth_token.refresh_token,
+            expires=oauth_token.expires,
+            expires_in=oauth_token.expires_in,
+            bitrix_app=self._bitrix_app,
+        )
+
+        portal = self._portals[portal_credentials.member_id] = _Portal(self, bitrix_token, portal_credentials.member_id)
+        self._domains[portal_credentials.domain] = portal_credentials.member_id
+
+        while len(self._portals) > self._max_portals:
+            self.evict(next(iter(self._portals)))
+
+        return portal
+
+    def _evict_idle(self, now: float):
+        """Evict portals not used for ``idle_timeout`` seconds, least recently used first."""
+
+        if self._idle_timeout is None:
+            return
+
+        for member_id, portal in list(self._portals.items()):
+            if now - portal.last_used_at < self._idle_timeout:
+                break
+
+            self.evict(member_id)
+
+    def _save(self, portal: _Portal):
+        """Save the current credentials of a portal token to the store."""
+
+        bitrix_token = portal.bitrix_token
+
+        self._store.save(PortalCredentials(
+            member_id=portal.member_id,
+            domain=bitrix_token.domain,
+            oauth_token=bitrix_token.oauth_token,
+        ))
+
+    def _change_domain(self, portal: _Portal, old_domain: Text, new_domain: Text):
+        """Move a portal to its new domain and save it to the store."""
+
+        with self._lock:
+            if self._domains.get(old_domain) == portal.member_id:
+                del self._domains[old_domain]
+
+            if self._portals.get(portal.member_id) is portal:
+                self._domains[new_domain] = portal.member_id
+
+        self._save(portal)
@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Final, Optional, Text, Tuple, Union
+
+from ..._config import Config
+from ...utils.types import Number
+from ..oauth_token import OAuthToken
+from ._base_store import BasePortalCredentialsStore
+from .portal_credentials import PortalCredentials
+
+__all__ = [
+    "SQLitePortalCredentialsStore",
+]
+
+
+class SQLitePortalCredentialsStore(BasePortalCredentialsStore):
+    """
+    Portal credentials store kept in an SQLite file.
+
+    Credentials survive restarts and are shared by worker processes of one
+    host. Every operation opens a short-lived connection, so the store may be
+    used from any thread.
+    """
+
+    _DEFAULT_FILE_NAME: Final[Text] = "b24pysdk-portals.sqlite3"
+    _CONNECT_TIMEOUT: Final[Number] = 30
+
+    _CREATE_TABLE_SQL: Final[Text] = (
+        "CREATE TABLE IF NOT EXISTS portal_credentials ("
+        "member_id TEXT PRIMARY KEY, "
+        "domain TEXT NOT NULL, "
+        "access_token TEXT NOT NULL, "
+        "refresh_token TEXT, "
+        "expires REAL, "
+        "expires_in INTEGER)"
+    )
+    _CREATE_INDEX_SQL: Final[Text] = "CREATE INDEX IF NOT EXISTS portal_credentials_domain ON portal_credentials (domain)"
+    _SELECT_SQL: Final[Text] = "SELECT member_id, domain, access_token, refresh_token, expires, expires_in FROM portal_credentials"
+
+    __slots__ = ("_path",)
+
+    _path: Path
+
+    def __init__(self, path: Optional[Union[Text, os.PathLike]] = None):
+        """
+        Initialize the SQLite store.
+
+        Args:
+            path: Database file. Defaults to ``b24pysdk-portals.sqlite3`` in
+                the system temporary directory. The file contains access and
+                refresh tokens, so it must not be readable by other users.
+        """
+
+        if path is None:
+            path = Path(tempfile.gettempdir()) / self._DEFAULT_FILE_NAME
+
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(self._CREATE_TABLE_SQL)
+            connection.execute(self._CREATE_INDEX_SQL)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(path={str(self._path)!r})"
+
+    @property
+    def path(self) -> Path:
+        """Database file that contains the credentials."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database file."""
+        return sqlite3.connect(self._path, timeout=self._CONNECT_TIMEOUT)
+
+    @staticmethod
+    def _from_row(row: Optional[Tuple]) -> Optional[PortalCredentials]:
+        """Build portal credentials from a selected row."""
+
+        if row is None:
+            return None
+
+        member_id, domain, access_token, refresh_token, expires, expires_in = row
+
+        return PortalCredentials(
+            member_id=member_id,
+            domain=domain,
+            oauth_token=OAuthToken(
+                access_token=access_token,
+                refresh_token=refresh_token,
+                expires=None if expires is None else datetime.fromtimestamp(expires, tz=Config().tz),
+                expires_in=expires_in,
+            ),
+        )
+
+    def get(self, member_id: Text) -> Optional[PortalCredentials]:
+        """Return credentials of a portal."""
+        with closing(self._connect()) as connection:
+            return self._from_row(connection.execute(f"{self._SELECT_SQL} WHERE member_id = ?", (member_id,)).fetchone())
+
+    def get_by_domain(self, domain: Text) -> Optional[PortalCredentials]:
+        """Return credentials of the portal with the given domain."""
+        with closing(self._connect()) as connection:
+            return self._from_row(connection.execute(f"{self._SELECT_SQL} WHERE domain = ?", (domain,)).fetchone())
+
+    def save(self, portal_credentials: PortalCredentials):
+        """Store credentials of a portal."""
+
+        oauth_token = portal_credentials.oauth_token
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO portal_credentials "
+                "(member_id, domain, access_token, refresh_token, expires, expires_in) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    portal_credentials.member_id,
+                    portal_credentials.domain,
+                    oauth_token.access_token,
+                    oauth_token.refresh_token,
+                    oauth_token.expires and oauth_token.expires.timestamp(),
+                    oauth_token.expires_in,
+                ),
+            )
+
+    def delete(self, member_id: Text):
+        """Remove credentials of a portal."""
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM portal_credentials WHERE member_id = ?", (member_id,))
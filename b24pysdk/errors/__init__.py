@@ -44,6 +44,7 @@ __all__ = [
     "BitrixAPIApplicationNotFound",
     "BitrixAPIAuthorizationError",
     "BitrixAPIBadRequest",
+    "BitrixAPIBatchCommandError",
     "BitrixAPIError",
     "BitrixAPIErrorOAuth",
     "BitrixAPIErrorUnexpectedAnswer",
@@ -157,6 +158,41 @@ class BitrixRequestTimeout(BitrixRequestError):
         self.timeout = timeout
 
 
+class BitrixAPIBatchCommandError(BitrixSDKException):
+    """
+    Raised when one command of a ``batch`` request failed.
+
+    Bitrix24 reports errors of batch commands inside the successful batch
+    response, so no HTTP response of the failed command is available.
+
+    Parameters
+    ----------
+    json_response : Dict
+        Error payload of the command taken from ``result_error``.
+
+    Attributes
+    ----------
+    json_response : Dict
+        Raw error payload of the command.
+    """
+
+    __slots__ = ("json_response",)
+
+    json_response: _error_schemas.ErrorData
+
+    def __init__(self, json_response: _error_schemas.ErrorData):
+        error = json_response.get("error")
+
+        if isinstance(error, dict):
+            message = error.get("message", f"{self.__class__.__name__}: {error}")
+        else:
+            message = json_response.get("error_description") or f"{self.__class__.__name__}: {error}"
+
+        super().__init__(message, json_response)
+
+        self.json_response = json_response
+
+
 class BitrixResponseError(BitrixSDKException, HTTPResponse):
     """
     Base class for errors raised when an HTTP response is received
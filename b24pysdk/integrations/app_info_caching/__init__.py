@@ -0,0 +1,12 @@
+from ._base_backend import BaseAppInfoCacheBackend
+from .app_info_cache import AppInfoCache, app_info_cache
+from .memory_backend import MemoryAppInfoCacheBackend
+from .redis_backend import RedisAppInfoCacheBackend
+
+__all__ = [
+    "AppInfoCache",
+    "BaseAppInfoCacheBackend",
+    "MemoryAppInfoCacheBackend",
+    "RedisAppInfoCacheBackend",
+    "app_info_cache",
+]
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, Text
+
+from ...utils.types import Number
+
+if TYPE_CHECKING:
+    from ...api.responses import B24AppInfoResult
+
+__all__ = [
+    "BaseAppInfoCacheBackend",
+]
+
+
+class BaseAppInfoCacheBackend(ABC):
+    """
+    Base class for storages of ``app.info`` results used by integrations.
+
+    A backend stores results under keys built by ``AppInfoCache.make_key``.
+    Entries expire after their time to live; backends may additionally bound
+    their size and evict the least recently used entries.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get(self, key: Text) -> Optional["B24AppInfoResult"]:
+        """
+        Return a fresh stored result.
+
+        Args:
+            key: Cache key of the installation.
+
+        Returns:
+            Stored result, or ``None`` if the entry is missing or expired.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: Text, app_info: "B24AppInfoResult", ttl: Number):
+        """
+        Store a result.
+
+        Args:
+            key: Cache key of the installation.
+            app_info: Result to store.
+            ttl: Seconds the entry stays fresh.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self):
+        """Remove all entries."""
+        raise NotImplementedError
@@ -0,0 +1,327 @@
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Final, Optional, Text, Tuple
+
+from ...utils.types import Number
+from ._base_backend import BaseAppInfoCacheBackend
+from .memory_backend import MemoryAppInfoCacheBackend
+
+if TYPE_CHECKING:
+    from ...api.responses import B24AppInfoResult
+    from ...credentials import OAuthEventData, OAuthPlacementData, OAuthWorkflowData
+
+__all__ = [
+    "AppInfoCache",
+    "app_info_cache",
+]
+
+
+class AppInfoCache:
+    """
+    Process-wide TTL cache of ``app.info`` results used by integrations.
+
+    Callbacks of one installation are validated against the same ``app.info``
+    result, so the result loaded for the first callback is reused for the
+    following ones and they skip the request to the authorization server.
+    Entries are keyed by portal domain, ``member_id``, a hash of the
+    installation secret (the ``application_token`` of events and robots, or
+    the access token of placements) and the calling user; raw secrets are not
+    kept. Only successfully loaded results are cached, and callers still
+    validate every payload against them.
+
+    Concurrent loads of one key are coalesced: while ``app.info`` of a key is
+    being requested, other threads and coroutines asking for the same key wait
+    for that request instead of sending their own, so a burst of identical
+    callbacks results in a single request.
+
+    Entries are kept in a backend: :class:`MemoryAppInfoCacheBackend`
+    (default) for the threads of one process, :class:`RedisAppInfoCacheBackend`
+    for processes of several hosts. Replace the backend of the shared cache
+    with ``app_info_cache.configure(backend=...)``.
+    """
+
+    DEFAULT_TTL: Final[Number] = 300
+    """Default number of seconds a cached ``app.info`` result stays fresh."""
+
+    __slots__ = ("_backend", "_in_flight", "_lock", "_ttl")
+
+    _backend: BaseAppInfoCacheBackend
+    _in_flight: Dict[Text, "Future[B24AppInfoResult]"]
+    _lock: threading.Lock
+    _ttl: Number
+
+    def __init__(
+            self,
+            *,
+            backend: Optional[BaseAppInfoCacheBackend] = None,
+            ttl: Number = DEFAULT_TTL,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage of cached results, ``MemoryAppInfoCacheBackend``
+                by default.
+            ttl: Seconds a cached ``app.info`` result stays fresh.
+
+        Raises:
+            TypeError: If ``backend`` is not a ``BaseAppInfoCacheBackend``.
+            ValueError: If ``ttl`` is not positive.
+        """
+
+        self._backend = MemoryAppInfoCacheBackend()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._ttl = self.DEFAULT_TTL
+
+        self.configure(backend=backend, ttl=ttl)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(backend={self._backend!r}, ttl={self._ttl})"
+
+    @property
+    def backend(self) -> BaseAppInfoCacheBackend:
+        """Storage of cached results."""
+        return self._backend
+
+    @property
+    def ttl(self) -> Number:
+        """Seconds a cached ``app.info`` result stays fresh."""
+        return self._ttl
+
+    def configure(
+            self,
+            *,
+            backend: Optional[BaseAppInfoCacheBackend] = None,
+            ttl: Optional[Number] = None,
+    ):
+        """
+        Update cache settings.
+
+        Only parameters explicitly provided are updated. Entries of the
+        previous backend are not moved to the new one.
+
+        Args:
+            backend: Storage of cached results.
+            ttl: Seconds a cached ``app.info`` result stays fresh.
+
+        Raises:
+            TypeError: If ``backend`` is not a ``BaseAppInfoCacheBackend``.
+            ValueError: If ``ttl`` is not positive.
+        """
+
+        if backend is not None and not isinstance(backend, BaseAppInfoCacheBackend):
+            raise TypeError("Backend must be an instance of BaseAppInfoCacheBackend")
+
+        if ttl is not None and not (isinstance(ttl, (int, float)) and ttl > 0):
+            raise ValueError("Ttl must be a positive number")
+
+        if backend is not None:
+            self._backend = backend
+
+        if ttl is not None:
+            self._ttl = ttl
+
+    @staticmethod
+    def make_key(
+            domain: Text,
+            member_id: Text,
+            secret: Text,
+            user_id: Optional[int] = None,
+    ) -> Text:
+        """
+        Build the cache key of an installation.
+
+        Args:
+            domain: Portal domain.
+            member_id: Unique portal identifier.
+            secret: ``application_token`` of the installation, or the access
+                token when the callback carries no application token.
+            user_id: Identifier of the user the callback was sent for.
+                ``app.info`` describes the user of the token, so results of
+                different users are cached separately.
+
+        Returns:
+            Cache key containing a SHA-256 hash instead of the secret.
+        """
+        return f"{domain.lower()}:{member_id}:{hashlib.sha256(secret.encode()).hexdigest()}:{user_id or ''}"
+
+    @classmethod
+    def make_event_key(cls, oauth_event_data: "OAuthEventData") -> Text:
+        """Build the cache key of an event callback sent with user OAuth data."""
+        auth = oauth_event_data.auth
+        return cls.make_key(auth.domain, auth.member_id, auth.application_token, auth.user_id)
+
+    @classmethod
+    def make_placement_key(cls, oauth_placement_data: "OAuthPlacementData") -> Text:
+        """Build the cache key of a placement request, which carries no application token."""
+        return cls.make_key(oauth_placement_data.domain, oauth_placement_data.member_id, oauth_placement_data.oauth_token.access_token)
+
+    @classmethod
+    def make_workflow_key(cls, oauth_workflow_data: "OAuthWorkflowData") -> Text:
+        """Build the cache key of a workflow robot or activity callback."""
+        auth = oauth_workflow_data.auth
+        return cls.make_key(auth.domain, auth.member_id, auth.application_token, auth.user_id)
+
+    def get(self, key: Text) -> Optional["B24AppInfoResult"]:
+        """
+        Return a fresh cached ``app.info`` result.
+
+        Args:
+            key: Cache key built by ``make_key``.
+
+        Returns:
+            Cached result, or ``None`` when it is missing or expired.
+        """
+        return self._backend.get(key)
+
+    def set(self, key: Text, app_info: "B24AppInfoResult"):
+        """
+        Cache an ``app.info`` result for ``ttl`` seconds.
+
+        Args:
+            key: Cache key built by ``make_key``.
+            app_info: Result to cache.
+        """
+        self._backend.set(key, app_info, self._ttl)
+
+    def clear(self):
+        """Remove all cached results."""
+        self._backend.clear()
+
+    def _start_load(self, key: Text) -> Tuple["Future[B24AppInfoResult]", bool]:
+        """
+        Return the future of the load of ``key`` and whether the caller owns it.
+
+        The owner must load the result and pass it to ``_finish_load``.
+        """
+
+        with self._lock:
+            future = self._in_flight.get(key)
+
+            if future is not None:
+                return future, False
+
+            future = self._in_flight[key] = Future()
+
+            return future, True
+
+    def _finish_load(
+            self,
+            key: Text,
+            future: "Future[B24AppInfoResult]",
+            app_info: Optional["B24AppInfoResult"],
+            error: Optional[BaseException] = None,
+    ):
+        """
+        Cache a loaded result and wake up callers waiting for it.
+
+        Errors are passed to the waiting callers. When the owner was
+        interrupted, for example by cancellation of its coroutine, the future
+        is cancelled and the waiting callers start a new load.
+        """
+
+        try:
+            if error is None:
+                self.set(key, app_info)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+            if error is None:
+                future.set_result(app_info)
+            elif isinstance(error, Exception):
+                future.set_exception(error)
+            else:
+                future.cancel()
+
+    def get_or_load(self, key: Text, load: Callable[[], "B24AppInfoResult"]) -> "B24AppInfoResult":
+        """
+        Return the cached ``app.info`` result, loading and caching it when missing.
+
+        When another caller is already loading the same key, waits for its
+        result instead of loading it again; errors of that load are raised
+        to all waiting callers.
+
+        Args:
+            key: Cache key built by ``make_key``.
+            load: Function requesting ``app.info``.
+
+        Returns:
+            Cached or freshly loaded result.
+        """
+
+        while True:
+            app_info = self.get(key)
+
+            if app_info is not None:
+                return app_info
+
+            future, is_owner = self._start_load(key)
+
+            if is_owner:
+                break
+
+            try:
+                return future.result()
+            except CancelledError:
+                if not future.cancelled():
+                    raise
+
+        try:
+            app_info = load()
+        except BaseException as error:
+            self._finish_load(key, future, None, error)
+            raise
+
+        self._finish_load(key, future, app_info)
+
+        return app_info
+
+    async def aget_or_load(self, key: Text, load: Callable[[], Awaitable["B24AppInfoResult"]]) -> "B24AppInfoResult":
+        """
+        Asynchronously return the cached ``app.info`` result, loading and caching it when missing.
+
+        Loads are coalesced with other coroutines and threads as in
+        ``get_or_load``; waiting does not block the event loop.
+
+        Args:
+            key: Cache key built by ``make_key``.
+            load: Coroutine function requesting ``app.info``.
+
+        Returns:
+            Cached or freshly loaded result.
+        """
+
+        while True:
+            app_info = self.get(key)
+
+            if app_info is not None:
+                return app_info
+
+            future, is_owner = self._start_load(key)
+
+            if is_owner:
+                break
+
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        try:
+            app_info = await load()
+        except BaseException as error:
+            self._finish_load(key, future, None, error)
+            raise
+
+        self._finish_load(key, future, app_info)
+
+        return app_info
+
+
+app_info_cache: AppInfoCache = AppInfoCache()
+"""Cache shared by the framework integrations of the process."""
@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Final, Optional, Text, Tuple
+
+from ...utils.types import Number
+from ._base_backend import BaseAppInfoCacheBackend
+
+if TYPE_CHECKING:
+    from ...api.responses import B24AppInfoResult
+
+__all__ = [
+    "MemoryAppInfoCacheBackend",
+]
+
+
+class MemoryAppInfoCacheBackend(BaseAppInfoCacheBackend):
+    """
+    In-process LRU storage of ``app.info`` results.
+
+    Entries are kept by the backend instance, so all threads that share one
+    instance share its entries. When ``max_size`` entries are stored, the
+    least recently used entry is evicted.
+    """
+
+    DEFAULT_MAX_SIZE: Final[int] = 10_000
+    """Default maximum number of stored results."""
+
+    __slots__ = ("_entries", "_lock", "_max_size")
+
+    _entries: "OrderedDict[Text, Tuple[float, B24AppInfoResult]]"
+    _lock: threading.Lock
+    _max_size: int
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize the in-memory backend.
+
+        Args:
+            max_size: Maximum number of stored results.
+
+        Raises:
+            ValueError: If ``max_size`` is not a positive integer.
+        """
+
+        if not (isinstance(max_size, int) and max_size >= 1):
+            raise ValueError("Max_size must be a positive integer (>= 1)")
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+
+    def __repr__(self):
+        return f"{type(self).__name__}(max_size={self._max_size})"
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Text) -> Optional["B24AppInfoResult"]:
+        """Return a fresh result and mark it as recently used."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, app_info = entry
+
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return app_info
+
+    def set(self, key: Text, app_info: "B24AppInfoResult", ttl: Number):
+        """Store a result, evicting the least recently used entries above ``max_size``."""
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, app_info)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
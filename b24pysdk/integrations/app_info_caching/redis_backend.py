@@ -0,0 +1,70 @@
+import json
+from typing import Final, Optional, Text
+
+from ...api.responses import B24AppInfoResult
+from ...protocols import RedisClientProtocol
+from ...utils.types import Number
+from ._base_backend import BaseAppInfoCacheBackend
+
+__all__ = [
+    "RedisAppInfoCacheBackend",
+]
+
+
+class RedisAppInfoCacheBackend(BaseAppInfoCacheBackend):
+    """
+    Storage of ``app.info`` results shared by processes of several hosts through Redis.
+
+    Results are stored as JSON documents in keys expiring after the cache time
+    to live, so Redis bounds the storage by itself.
+    """
+
+    _DEFAULT_PREFIX: Final[Text] = "b24pysdk:app_info:"
+
+    __slots__ = ("_client", "_prefix")
+
+    _client: RedisClientProtocol
+    _prefix: Text
+
+    def __init__(self, client: RedisClientProtocol, *, prefix: Text = _DEFAULT_PREFIX):
+        """
+        Initialize the Redis backend.
+
+        Args:
+            client: Redis client, for example ``redis.Redis``.
+            prefix: Prefix of keys created by the backend.
+
+        Raises:
+            TypeError: If ``client`` does not implement ``RedisClientProtocol``.
+        """
+
+        if not isinstance(client, RedisClientProtocol):
+            raise TypeError("Client must implement RedisClientProtocol")
+
+        self._client = client
+        self._prefix = prefix
+
+    def __repr__(self):
+        return f"{type(self).__name__}(prefix={self._prefix!r})"
+
+    def get(self, key: Text) -> Optional[B24AppInfoResult]:
+        """Return a stored result; expired keys are removed by Redis."""
+
+        value = self._client.get(f"{self._prefix}{key}")
+
+        if value is None:
+            return None
+
+        return B24AppInfoResult.from_dict(json.loads(value))
+
+    def set(self, key: Text, app_info: B24AppInfoResult, ttl: Number):
+        """Store a result in a key expiring after ``ttl`` seconds."""
+        self._client.set(f"{self._prefix}{key}", json.dumps(app_info.to_dict()), px=max(int(ttl * 1000), 1))
+
+    def clear(self):
+        """Remove results of all installations."""
+
+        keys = list(self._client.scan_iter(match=f"{self._prefix}*"))
+
+        if keys:
+            self._client.delete(*keys)
@@ -18,6 +18,7 @@ from django.http import JsonResponse
 from ...._config import Config
 from ....credentials import OAuthEventData
 from ....errors import BitrixAPIError, BitrixSDKException, BitrixValidationError
+from ...app_info_caching import app_info_cache
 from .collect_request_params import collect_request_params
 
 if TYPE_CHECKING:
@@ -67,7 +68,8 @@ def validate_event_request(
     -----
     This function always parses Bitrix24 event parameters. When
     ``bitrix_app`` is passed, it also resolves ``app.info`` and validates
-    event data against it.
+    event data against it. ``app.info`` results are shared between requests
+    through ``b24pysdk.integrations.app_info_caching.app_info_cache``.
 
     Typical event fields
     --------------------
@@ -91,7 +93,10 @@ def validate_event_request(
             )
 
         try:
-            app_info = oauth_event_data.get_app_info(bitrix_app)
+            app_info = app_info_cache.get_or_load(
+                app_info_cache.make_event_key(oauth_event_data),
+                lambda: oauth_event_data.get_app_info(bitrix_app),
+            )
         except BitrixAPIError as error:
             raise BitrixValidationError(error.message) from error
 
@@ -21,6 +21,7 @@ from django.http import JsonResponse
 from ...._config import Config
 from ....credentials import OAuthPlacementData
 from ....errors import BitrixAPIError, BitrixSDKException, BitrixValidationError
+from ...app_info_caching import app_info_cache
 from .collect_request_params import collect_request_params
 
 if TYPE_CHECKING:
@@ -70,7 +71,8 @@ def validate_placement_request(
     -----
     This function always parses Bitrix24 placement parameters. When
     ``bitrix_app`` is passed, it also resolves ``app.info`` and validates
-    placement data against it.
+    placement data against it. ``app.info`` results are shared between requests
+    through ``b24pysdk.integrations.app_info_caching.app_info_cache``.
 
     Typical placement fields
     ------------------------
@@ -94,7 +96,10 @@ def validate_placement_request(
     if bitrix_app is not None:
 
         try:
-            app_info = oauth_placement_data.get_app_info(bitrix_app)
+            app_info = app_info_cache.get_or_load(
+                app_info_cache.make_placement_key(oauth_placement_data),
+                lambda: oauth_placement_data.get_app_info(bitrix_app),
+            )
         except BitrixAPIError as error:
             raise BitrixValidationError(error.message) from error
 
@@ -18,6 +18,7 @@ from django.http import JsonResponse
 from ...._config import Config
 from ....credentials import OAuthWorkflowData
 from ....errors import BitrixAPIError, BitrixSDKException, BitrixValidationError
+from ...app_info_caching import app_info_cache
 from .collect_request_params import collect_request_params
 
 if TYPE_CHECKING:
@@ -67,7 +68,8 @@ def validate_workflow_request(
     -----
     This function always parses Bitrix24 workflow parameters. When
     ``bitrix_app`` is passed, it also resolves ``app.info`` and validates
-    workflow data against it.
+    workflow data against it. ``app.info`` results are shared between requests
+    through ``b24pysdk.integrations.app_info_caching.app_info_cache``.
 
     Typical workflow fields
     -----------------------
@@ -87,7 +89,10 @@ def validate_workflow_request(
 
     if bitrix_app is not None:
         try:
-            app_info = oauth_workflow_data.get_app_info(bitrix_app)
+            app_info = app_info_cache.get_or_load(
+                app_info_cache.make_workflow_key(oauth_workflow_data),
+                lambda: oauth_workflow_data.get_app_info(bitrix_app),
+            )
         except BitrixAPIError as error:
             raise BitrixValidationError(error.message) from error
 
@@ -6,12 +6,15 @@ from ...._config import Config
 from ....credentials import OAuthEventData
 from ....errors import BitrixAPIError, BitrixSDKException, BitrixValidationError
 from ....utils.types import JSONDict
+from ...app_info_caching import app_info_cache
 from .collect_request_params import collect_request_params
 
 if TYPE_CHECKING:
+    from ....api.responses import B24AppInfoResult
     from ....credentials import AbstractBitrixApp
 
 __all__ = [
+    "avalidate_event_params",
     "event_dependency",
     "get_event_dependency",
     "validate_event_params",
@@ -21,6 +24,32 @@ __all__ = [
 _EventDependency = Callable[..., Awaitable[OAuthEventData]]
 
 
+def _parse_event_params(params: JSONDict, bitrix_app: Optional["AbstractBitrixApp"]) -> OAuthEventData:
+    """Parse event payload and reject system events when it has to be validated."""
+
+    oauth_event_data = OAuthEventData.from_dict(params)
+
+    if bitrix_app is not None and oauth_event_data.is_system:
+        raise BitrixValidationError(
+            "System event cannot be validated via app.info",
+        )
+
+    return oauth_event_data
+
+
+def _check_app_info(
+    oauth_event_data: OAuthEventData,
+    app_info: "B24AppInfoResult",
+    bitrix_app: "AbstractBitrixApp",
+):
+    """Validate that the event belongs to ``bitrix_app``."""
+    if not (
+        oauth_event_data.validate_against_app_info(app_info)
+        and app_info.client_id == bitrix_app.client_id
+    ):
+        raise BitrixValidationError("Invalid event auth data")
+
+
 def validate_event_params(
     params: JSONDict,
     *,
@@ -35,29 +64,61 @@ def validate_event_params(
             calls Bitrix24 ``app.info`` with event OAuth data and validates
             that the callback belongs to this application. System events cannot
             be validated this way because they do not contain a user OAuth token.
+            ``app.info`` results are shared through ``app_info_cache``.
 
     Returns:
         Parsed event callback payload.
     """
 
-    oauth_event_data = OAuthEventData.from_dict(params)
+    oauth_event_data = _parse_event_params(params, bitrix_app)
 
     if bitrix_app is not None:
-        if oauth_event_data.is_system:
-            raise BitrixValidationError(
-                "System event cannot be validated via app.info",
+        try:
+            app_info = app_info_cache.get_or_load(
+                app_info_cache.make_event_key(oauth_event_data),
+                lambda: oauth_event_data.get_app_info(bitrix_app),
             )
+        except BitrixAPIError as error:
+            raise BitrixValidationError(error.message) from error
+
+        _check_app_info(oauth_event_data, app_info, bitrix_app)
+
+    return oauth_event_data
+
 
+async def avalidate_event_params(
+    params: JSONDict,
+    *,
+    bitrix_app: Optional["AbstractBitrixApp"] = None,
+) -> OAuthEventData:
+    """
+    Asynchronously parse and validate Bitrix24 event payload.
+
+    Asynchronous counterpart of ``validate_event_params``: ``app.info`` is
+    requested through the async transport, so a slow authorization server
+    does not block the event loop.
+
+    Args:
+        params: Request parameters collected by ``collect_request_params``.
+        bitrix_app: Optional SDK application object used for ``app.info``
+            validation.
+
+    Returns:
+        Parsed event callback payload.
+    """
+
+    oauth_event_data = _parse_event_params(params, bitrix_app)
+
+    if bitrix_app is not None:
         try:
-            app_info = oauth_event_data.get_app_info(bitrix_app)
+            app_info = await app_info_cache.aget_or_load(
+                app_info_cache.make_event_key(oauth_event_data),
+                lambda: oauth_event_data.aget_app_info(bitrix_app),
+            )
         except BitrixAPIError as error:
             raise BitrixValidationError(error.message) from error
 
-        if not (
-            oauth_event_data.validate_against_app_info(app_info)
-            and app_info.client_id == bitrix_app.client_id
-        ):
-            raise BitrixValidationError("Invalid event auth data")
+        _check_app_info(oauth_event_data, app_info, bitrix_app)
 
     return oauth_event_data
 
@@ -79,7 +140,7 @@ def get_event_dependency(
             params: Annotated[JSONDict, Depends(collect_request_params)],
     ) -> OAuthEventData:
         try:
-            return validate_event_params(
+            return await avalidate_event_params(
                 params,
                 bitrix_app=bitrix_app,
             )
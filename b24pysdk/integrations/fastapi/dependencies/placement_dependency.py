@@ -20,12 +20,15 @@ from ...._config import Config
 from ....credentials import OAuthPlacementData
 from ....errors import BitrixAPIError, BitrixSDKException, BitrixValidationError
 from ....utils.types import JSONDict
+from ...app_info_caching import app_info_cache
 from .collect_request_params import collect_request_params
 
 if TYPE_CHECKING:
+    from ....api.responses import B24AppInfoResult
     from ....credentials import AbstractBitrixApp
 
 __all__ = [
+    "avalidate_placement_params",
     "get_placement_dependency",
     "placement_dependency",
     "validate_placement_params",
@@ -35,6 +38,19 @@ __all__ = [
 _PlacementDependency = Callable[..., Awaitable[OAuthPlacementData]]
 
 
+def _check_app_info(
+    oauth_placement_data: OAuthPlacementData,
+    app_info: "B24AppInfoResult",
+    bitrix_app: "AbstractBitrixApp",
+):
+    """Validate that the placement payload belongs to ``bitrix_app``."""
+    if not (
+        oauth_placement_data.validate_against_app_info(app_info)
+        and app_info.client_id == bitrix_app.client_id
+    ):
+        raise BitrixValidationError("Invalid placement auth data")
+
+
 def validate_placement_params(
     params: JSONDict,
     *,
@@ -48,6 +64,7 @@ def validate_placement_params(
         bitrix_app: Optional SDK application object. When passed, the helper
             calls Bitrix24 ``app.info`` with the placement OAuth token and
             validates that the payload belongs to this application.
+            ``app.info`` results are shared through ``app_info_cache``.
 
     Returns:
         Parsed placement payload.
@@ -57,15 +74,51 @@ def validate_placement_params(
 
     if bitrix_app is not None:
         try:
-            app_info = oauth_placement_data.get_app_info(bitrix_app)
+            app_info = app_info_cache.get_or_load(
+                app_info_cache.make_placement_key(oauth_placement_data),
+                lambda: oauth_placement_data.get_app_info(bitrix_app),
+            )
+        except BitrixAPIError as error:
+            raise BitrixValidationError(error.message) from error
+
+        _check_app_info(oauth_placement_data, app_info, bitrix_app)
+
+    return oauth_placement_data
+
+
+async def avalidate_placement_params(
+    params: JSONDict,
+    *,
+    bitrix_app: Optional["AbstractBitrixApp"] = None,
+) -> OAuthPlacementData:
+    """
+    Asynchronously parse and validate Bitrix24 placement payload.
+
+    Asynchronous counterpart of ``validate_placement_params``: ``app.info`` is
+    requested through the async transport, so a slow authorization server
+    does not block the event loop.
+
+    Args:
+        params: Request parameters collected by ``collect_request_params``.
+        bitrix_app: Optional SDK application object used for ``app.info``
+            validation.
+
+    Returns:
+        Parsed placement payload.
+    """
+
+    oauth_placement_data = OAuthPlacementData.from_dict(params)
+
+    if bitrix_app is not None:
+        try:
+            app_info = await app_info_cache.aget_or_load(
+                app_info_cache.make_placement_key(oauth_placement_data),
+                lambda: oauth_placement_data.aget_app_info(bitrix_app),
+            )
         except BitrixAPIError as error:
             raise BitrixValidationError(error.message) from error
 
-        if not (
-            oauth_placement_data.validate_against_app_info(app_info)
-            and app_info.client_id == bitrix_app.client_id
-        ):
-            raise BitrixValidationError("Invalid placement auth data")
+        _check_app_info(oauth_placement_data, app_info, bitrix_app)
 
     return oauth_placement_data
 
@@ -87,7 +140,7 @@ def get_placement_dependency(
             params: Annotated[JSONDict, Depends(collect_request_params)],
     ) -> OAuthPlacementData:
         try:
-            return validate_placement_params(
+            return await avalidate_placement_params(
                 params,
                 bitrix_app=bitrix_app,
             )
@@ -6,12 +6,15 @@ from ...._config import Config
 from ....credentials import OAuthWorkflowData
 from ....errors import BitrixAPIError, BitrixSDKException, BitrixValidationError
 from ....utils.types import JSONDict
+from ...app_info_caching import app_info_cache
 from .collect_request_params import collect_request_params
 
 if TYPE_CHECKING:
+    from ....api.responses import B24AppInfoResult
     from ....credentials import AbstractBitrixApp
 
 __all__ = [
+    "avalidate_workflow_params",
     "get_workflow_dependency",
     "validate_workflow_params",
     "workflow_dependency",
@@ -21,6 +24,19 @@ __all__ = [
 _WorkflowDependency = Callable[..., Awaitable[OAuthWorkflowData]]
 
 
+def _check_app_info(
+    oauth_workflow_data: OAuthWorkflowData,
+    app_info: "B24AppInfoResult",
+    bitrix_app: "AbstractBitrixApp",
+):
+    """Validate that the workflow payload belongs to ``bitrix_app``."""
+    if not (
+        oauth_workflow_data.validate_against_app_info(app_info)
+        and app_info.client_id == bitrix_app.client_id
+    ):
+        raise BitrixValidationError("Invalid workflow auth data")
+
+
 def validate_workflow_params(
     params: JSONDict,
     *,
@@ -34,6 +50,7 @@ def validate_workflow_params(
         bitrix_app: Optional SDK application object. When passed, the helper
             calls Bitrix24 ``app.info`` with workflow OAuth data and validates
             that the robot callback belongs to this application.
+            ``app.info`` results are shared through ``app_info_cache``.
 
     Returns:
         Parsed workflow robot payload.
@@ -43,15 +60,51 @@ def validate_workflow_params(
 
     if bitrix_app is not None:
         try:
-            app_info = oauth_workflow_data.get_app_info(bitrix_app)
+            app_info = app_info_cache.get_or_load(
+                app_info_cache.make_workflow_key(oauth_workflow_data),
+                lambda: oauth_workflow_data.get_app_info(bitrix_app),
+            )
+        except BitrixAPIError as error:
+            raise BitrixValidationError(error.message) from error
+
+        _check_app_info(oauth_workflow_data, app_info, bitrix_app)
+
+    return oauth_workflow_data
+
+
+async def avalidate_workflow_params(
+    params: JSONDict,
+    *,
+    bitrix_app: Optional["AbstractBitrixApp"] = None,
+) -> OAuthWorkflowData:
+    """
+    Asynchronously parse and validate Bitrix24 workflow payload.
+
+    Asynchronous counterpart of ``validate_workflow_params``: ``app.info`` is
+    requested through the async transport, so a slow authorization server
+    does not block the event loop.
+
+    Args:
+        params: Request parameters collected by ``collect_request_params``.
+        bitrix_app: Optional SDK application object used for ``app.info``
+            validation.
+
+    Returns:
+        Parsed workflow payload.
+    """
+
+    oauth_workflow_data = OAuthWorkflowData.from_dict(params)
+
+    if bitrix_app is not None:
+        try:
+            app_info = await app_info_cache.aget_or_load(
+                app_info_cache.make_workflow_key(oauth_workflow_data),
+                lambda: oauth_workflow_data.aget_app_info(bitrix_app),
+            )
         except BitrixAPIError as error:
             raise BitrixValidationError(error.message) from error
 
-        if not (
-            oauth_workflow_data.validate_against_app_info(app_info)
-            and app_info.client_id == bitrix_app.client_id
-        ):
-            raise BitrixValidationError("Invalid workflow auth data")
+        _check_app_info(oauth_workflow_data, app_info, bitrix_app)
 
     return oauth_workflow_data
 
@@ -71,7 +124,7 @@ def get_workflow_dependency(
 
     async def _workflow_dependency(params: Annotated[JSONDict, Depends(collect_request_params)]) -> OAuthWorkflowData:
         try:
-            return validate_workflow_params(
+            return await avalidate_workflow_params(
                 params,
                 bitrix_app=bitrix_app,
             )
@@ -10,6 +10,7 @@ from ...._config import Config
 from ....credentials import OAuthEventData
 from ....errors import BitrixAPIError, BitrixSDKException, BitrixValidationError
 from ....utils.types import JSONDict
+from ...app_info_caching import app_info_cache
 from ..dependencies import get_request_params
 from ._utils import make_json_response
 from .collect_request_params import collect_request_params
@@ -40,6 +41,7 @@ def validate_event_params(
             calls Bitrix24 ``app.info`` with event OAuth data and validates
             that the callback belongs to this application. System events cannot
             be validated this way because they do not contain a user OAuth token.
+            ``app.info`` results are shared through ``app_info_cache``.
 
     Returns:
         Parsed event callback payload.
@@ -54,7 +56,10 @@ def validate_event_params(
             )
 
         try:
-            app_info = oauth_event_data.get_app_info(bitrix_app)
+            app_info = app_info_cache.get_or_load(
+                app_info_cache.make_event_key(oauth_event_data),
+                lambda: oauth_event_data.get_app_info(bitrix_app),
+            )
         except BitrixAPIError as error:
             raise BitrixValidationError(error.message) from error
 
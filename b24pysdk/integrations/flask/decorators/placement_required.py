@@ -15,6 +15,7 @@ from ...._config import Config
 from ....credentials import OAuthPlacementData
 from ....errors import BitrixAPIError, BitrixSDKException, BitrixValidationError
 from ....utils.types import JSONDict
+from ...app_info_caching import app_info_cache
 from ..dependencies import get_request_params
 from ._utils import make_json_response
 from .collect_request_params import collect_request_params
@@ -44,6 +45,7 @@ def validate_placement_params(
         bitrix_app: Optional SDK application object. When passed, the helper
             calls Bitrix24 ``app.info`` with the placement OAuth token and
             validates that the payload belongs to this application.
+            ``app.info`` results are shared through ``app_info_cache``.
 
     Returns:
         Parsed placement payload.
@@ -53,7 +55,10 @@ def validate_placement_params(
 
     if bitrix_app is not None:
         try:
-            app_info = oauth_placement_data.get_app_info(bitrix_app)
+            app_info = app_info_cache.get_or_load(
+                app_info_cache.make_placement_key(oauth_placement_data),
+                lambda: oauth_placement_data.get_app_info(bitrix_app),
+            )
         except BitrixAPIError as error:
             raise BitrixValidationError(error.message) from error
 
@@ -10,6 +10,7 @@ from ...._config import Config
 from ....credentials import OAuthWorkflowData
 from ....errors import BitrixAPIError, BitrixSDKException, BitrixValidationError
 from ....utils.types import JSONDict
+from ...app_info_caching import app_info_cache
 from ..dependencies import get_request_params
 from ._utils import make_json_response
 from .collect_request_params import collect_request_params
@@ -39,6 +40,7 @@ def validate_workflow_params(
         bitrix_app: Optional SDK application object. When passed, the helper
             calls Bitrix24 ``app.info`` with workflow OAuth data and validates
             that the robot callback belongs to this application.
+            ``app.info`` results are shared through ``app_info_cache``.
 
     Returns:
         Parsed workflow robot payload.
@@ -48,7 +50,10 @@ def validate_workflow_params(
 
     if bitrix_app is not None:
         try:
-            app_info = oauth_workflow_data.get_app_info(bitrix_app)
+            app_info = app_info_cache.get_or_load(
+                app_info_cache.make_workflow_key(oauth_workflow_data),
+                lambda: oauth_workflow_data.get_app_info(bitrix_app),
+            )
         except BitrixAPIError as error:
             raise BitrixValidationError(error.message) from error
 
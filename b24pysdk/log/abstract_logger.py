@@ -30,6 +30,16 @@ class AbstractLogger:
     def level(self) -> int:
         raise NotImplementedError
 
+    def is_enabled_for(self, level: int) -> bool:  # noqa: ARG002
+        """
+        Return whether records of ``level`` are processed by the logger.
+
+        The SDK checks it before building log contexts on hot paths, so the
+        arguments of disabled records are never computed. Loggers that do not
+        override it are treated as enabled for every level.
+        """
+        return True
+
     def debug(self, message: Text, context: Optional[Mapping[Text, Any]] = None):
         raise NotImplementedError
 
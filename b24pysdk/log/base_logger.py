@@ -81,6 +81,10 @@ class BaseLogger(AbstractLogger):
         """Current logger level."""
         return self._logger.level
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Return whether the underlying logger processes records of ``level``."""
+        return self._logger.isEnabledFor(level)
+
     def _log(
             self,
             level: int,
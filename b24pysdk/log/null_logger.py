@@ -1,4 +1,5 @@
 import logging
+from typing import Any, Mapping, Optional, Text
 
 from .base_logger import BaseLogger
 
@@ -8,8 +9,22 @@ class NullLogger(BaseLogger):
     Logger implementation that silently ignores all log records.
 
     Useful as a default logger when logging should be disabled without
-    adding conditional checks around logging calls.
+    adding conditional checks around logging calls. Records are dropped
+    before a ``logging.LogRecord`` is created, and ``is_enabled_for`` reports
+    every level as disabled, so guarded log calls cost a single method call.
     """
 
     _DEFAULT_HANDLER_TYPE = logging.NullHandler
     _DEFAULT_LEVEL = logging.DEBUG
+
+    def is_enabled_for(self, level: int) -> bool:  # noqa: ARG002
+        """Return ``False``: records of every level are discarded."""
+        return False
+
+    def _log(
+            self,
+            level: int,
+            message: Text,
+            context: Optional[Mapping[Text, Any]] = None,
+    ):
+        """Discard the record."""
@@ -1,8 +1,24 @@
+from .async_http_transport_protocol import AsyncHTTPTransportProtocol
 from .bitrix_oauth_protocol import BitrixOAuthProtocol
-from .bitrix_token_protocol import BitrixTokenFullProtocol, BitrixTokenProtocol
+from .bitrix_token_protocol import AsyncBitrixTokenFullProtocol, AsyncBitrixTokenProtocol, BitrixTokenFullProtocol, BitrixTokenProtocol
+from .json_codec_protocol import JSONCodecProtocol
+from .oauth_token_storage_protocol import OAuthTokenStorageProtocol
+from .rate_limiter_protocol import RateLimiterProtocol
+from .redis_client_protocol import RedisClientProtocol
+from .response_cache_protocol import ResponseCacheProtocol
+from .retry_strategy_protocol import RetryStrategyProtocol
 
 __all__ = [
+    "AsyncBitrixTokenFullProtocol",
+    "AsyncBitrixTokenProtocol",
+    "AsyncHTTPTransportProtocol",
     "BitrixOAuthProtocol",
     "BitrixTokenFullProtocol",
     "BitrixTokenProtocol",
+    "JSONCodecProtocol",
+    "OAuthTokenStorageProtocol",
+    "RateLimiterProtocol",
+    "RedisClientProtocol",
+    "ResponseCacheProtocol",
+    "RetryStrategyProtocol",
 ]
@@ -0,0 +1,57 @@
+from typing import TYPE_CHECKING, Optional, Protocol, Text, runtime_checkable
+
+from ..utils.types import JSONDict, Timeout
+
+if TYPE_CHECKING:
+    import requests
+
+
+@runtime_checkable
+class AsyncHTTPTransportProtocol(Protocol):
+    """
+    Protocol for asynchronous HTTP transports used by SDK requesters.
+
+    A transport owns a pool of keep-alive connections and sends one HTTP
+    request at a time on behalf of async requesters. Responses are returned
+    as ``requests.Response`` objects so that response parsing and SDK errors
+    are shared with the synchronous pipeline.
+    """
+
+    async def request(
+        self,
+        method: Text,
+        url: Text,
+        *,
+        params: Optional[JSONDict] = None,
+        json: Optional[JSONDict] = None,
+        data: Optional[bytes] = None,
+        headers: Optional[JSONDict] = None,
+        timeout: Timeout = None,
+        allow_redirects: bool = True,
+    ) -> "requests.Response":
+        """
+        Send one HTTP request.
+
+        Args:
+            method: HTTP method name.
+            url: Absolute request URL.
+            params: Optional query string parameters.
+            json: Optional JSON request body, serialized by the transport.
+            data: Optional raw request body, sent as is. Callers set its
+                ``Content-Type`` in ``headers``.
+            headers: Optional request headers.
+            timeout: Timeout with ``requests`` semantics: a number or a
+                ``(connect_timeout, read_timeout)`` tuple.
+            allow_redirects: Whether redirects should be followed.
+
+        Returns:
+            Fully read HTTP response.
+
+        Raises:
+            requests.Timeout: If the request times out.
+            requests.RequestException: If the request fails before a valid
+                HTTP response is received.
+        """
+
+    async def aclose(self):
+        """Close pooled connections owned by the transport."""
@@ -1,9 +1,12 @@
-from typing import Mapping, Optional, Protocol, Sequence, Text, Union, overload
+from typing import TYPE_CHECKING, BinaryIO, Literal, Mapping, Optional, Protocol, Sequence, Text, Union, overload
 
 from ..constants.version import B24APIVersion
 from ..schemas.api import BatchResponseData, ListFastResponseData, ListResponseData
 from ..utils.types import B24APIVersionLiteral, B24Requests, B24RequestTuple, JSONDict, Key, Timeout
 
+if TYPE_CHECKING:
+    import os
+
 
 class BitrixTokenProtocol(Protocol):
     """
@@ -88,6 +91,7 @@ class BitrixTokenFullProtocol(BitrixTokenProtocol, Protocol):
         self,
         methods: Mapping[Key, B24RequestTuple],
         halt: bool = False,
+        max_concurrency: Optional[int] = None,
         timeout: Timeout = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
     ) -> BatchResponseData: ...
@@ -97,6 +101,7 @@ class BitrixTokenFullProtocol(BitrixTokenProtocol, Protocol):
         self,
         methods: Sequence[B24RequestTuple],
         halt: bool = False,
+        max_concurrency: Optional[int] = None,
         timeout: Timeout = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
     ) -> BatchResponseData: ...
@@ -105,6 +110,7 @@ class BitrixTokenFullProtocol(BitrixTokenProtocol, Protocol):
         self,
         methods: B24Requests,
         halt: bool = False,
+        max_concurrency: Optional[int] = None,
         timeout: Timeout = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
     ) -> BatchResponseData:
@@ -114,6 +120,8 @@ class BitrixTokenFullProtocol(BitrixTokenProtocol, Protocol):
         Args:
             methods: Methods to execute as mapping or sequence of request tuples.
             halt: Whether to stop execution after the first failed command.
+            max_concurrency: Maximum number of batch requests executed at
+                the same time.
             timeout: Optional request timeout.
             prefer_version: Preferred Bitrix24 API version.
 
@@ -121,6 +129,7 @@ class BitrixTokenFullProtocol(BitrixTokenProtocol, Protocol):
             Combined batch responses as a JSON-compatible dictionary.
         """
 
+    @overload
     def call_list(
         self,
         api_method: Text,
@@ -128,7 +137,30 @@ class BitrixTokenFullProtocol(BitrixTokenProtocol, Protocol):
         limit: Optional[int] = None,
         timeout: Timeout = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
-    ) -> ListResponseData:
+        stream: Literal[False] = False,
+    ) -> ListResponseData: ...
+
+    @overload
+    def call_list(
+        self,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        limit: Optional[int] = None,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        *,
+        stream: Literal[True],
+    ) -> ListFastResponseData: ...
+
+    def call_list(
+        self,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        limit: Optional[int] = None,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        stream: bool = False,
+    ) -> Union[ListResponseData, ListFastResponseData]:
         """
         Load a paginated Bitrix24 REST API list.
 
@@ -136,6 +168,8 @@ class BitrixTokenFullProtocol(BitrixTokenProtocol, Protocol):
             api_method: Bitrix24 REST API list method name.
             params: Optional request parameters.
             limit: Optional maximum number of items to load.
+            stream: Whether to return a one-time generator loading items
+                batch by batch instead of a fully loaded list.
             timeout: Optional request timeout.
             prefer_version: Preferred Bitrix24 API version.
 
@@ -151,6 +185,8 @@ class BitrixTokenFullProtocol(BitrixTokenProtocol, Protocol):
         limit: Optional[int] = None,
         timeout: Timeout = None,
         prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+        partitions: Optional[int] = None,
+        ordered: bool = True,
     ) -> ListFastResponseData:
         """
         Load a Bitrix24 REST API list using optimized pagination.
@@ -162,6 +198,134 @@ class BitrixTokenFullProtocol(BitrixTokenProtocol, Protocol):
             limit: Optional maximum number of items to load.
             timeout: Optional request timeout.
             prefer_version: Preferred Bitrix24 API version.
+            partitions: Optional number of ID ranges loaded concurrently.
+            ordered: Whether partitioned loading keeps the ID order.
+
+        Returns:
+            Loaded list response as a JSON-compatible dictionary.
+        """
+
+    def call_method_download(
+        self,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        *,
+        destination: Union[Text, "os.PathLike[Text]", BinaryIO],
+        timeout: Timeout = None,
+    ) -> int:
+        """
+        Download file content returned by a Bitrix24 REST API method.
+
+        Args:
+            api_method: Bitrix24 REST API method responding with a file.
+            params: Optional request parameters.
+            destination: Path of the file to write or a binary file object.
+            timeout: Optional request timeout.
+
+        Returns:
+            Size of the downloaded content in bytes.
+        """
+
+
+class AsyncBitrixTokenProtocol(Protocol):
+    """
+    Protocol for Bitrix24 token-like clients supporting asynchronous calls.
+
+    Defines the minimal interface required to await a single Bitrix24 REST API
+    method call.
+    """
+
+    async def acall_method(
+        self,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+    ) -> JSONDict:
+        """
+        Asynchronously call a single Bitrix24 REST API method.
+
+        Args:
+            api_method: Bitrix24 REST API method name.
+            params: Optional request parameters.
+            timeout: Optional request timeout.
+            prefer_version: Preferred Bitrix24 API version.
+
+        Returns:
+            API response as a JSON-compatible dictionary.
+        """
+
+
+class AsyncBitrixTokenFullProtocol(AsyncBitrixTokenProtocol, Protocol):
+    """
+    Extended protocol for full-featured asynchronous Bitrix24 token clients.
+
+    Adds awaitable batch calls and list-loading helpers to the basic
+    single-method API.
+    """
+
+    async def acall_batch(
+        self,
+        methods: B24Requests,
+        halt: bool = False,
+        ignore_size_limit: bool = False,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+    ) -> BatchResponseData:
+        """
+        Asynchronously execute a Bitrix24 batch request.
+
+        Args:
+            methods: Batch methods as a mapping or sequence of request tuples.
+            halt: Whether to stop execution after the first failed command.
+            ignore_size_limit: Whether to skip SDK-side batch size validation.
+            timeout: Optional request timeout.
+            prefer_version: Preferred Bitrix24 API version.
+
+        Returns:
+            Batch API response as a JSON-compatible dictionary.
+        """
+
+    async def acall_batches(
+        self,
+        methods: B24Requests,
+        halt: bool = False,
+        max_concurrency: Optional[int] = None,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+    ) -> BatchResponseData:
+        """
+        Asynchronously execute multiple Bitrix24 batch requests.
+
+        Args:
+            methods: Methods to execute as mapping or sequence of request tuples.
+            halt: Whether to stop execution after the first failed command.
+            max_concurrency: Maximum number of batch requests executed at
+                the same time.
+            timeout: Optional request timeout.
+            prefer_version: Preferred Bitrix24 API version.
+
+        Returns:
+            Combined batch responses as a JSON-compatible dictionary.
+        """
+
+    async def acall_list(
+        self,
+        api_method: Text,
+        params: Optional[JSONDict] = None,
+        limit: Optional[int] = None,
+        timeout: Timeout = None,
+        prefer_version: Union[B24APIVersion, B24APIVersionLiteral] = B24APIVersion.V2,
+    ) -> ListResponseData:
+        """
+        Asynchronously load a paginated Bitrix24 REST API list.
+
+        Args:
+            api_method: Bitrix24 REST API list method name.
+            params: Optional request parameters.
+            limit: Optional maximum number of items to load.
+            timeout: Optional request timeout.
+            prefer_version: Preferred Bitrix24 API version.
 
         Returns:
             Loaded list response as a JSON-compatible dictionary.
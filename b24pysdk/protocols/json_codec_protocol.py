@@ -0,0 +1,40 @@
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class JSONCodecProtocol(Protocol):
+    """
+    Protocol for JSON codecs used by SDK requesters.
+
+    A codec serializes request bodies and deserializes response bodies
+    directly from and to bytes, so faster JSON libraries can replace the
+    standard ``json`` module.
+    """
+
+    def encode(self, obj: Any) -> bytes:
+        """
+        Serialize a JSON-compatible object.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            UTF-8 encoded JSON document.
+
+        Raises:
+            TypeError: If the object contains values that cannot be serialized.
+        """
+
+    def decode(self, content: bytes) -> Any:
+        """
+        Deserialize a JSON document.
+
+        Args:
+            content: Raw JSON document.
+
+        Returns:
+            Decoded Python object.
+
+        Raises:
+            ValueError: If ``content`` is not a valid JSON document.
+        """
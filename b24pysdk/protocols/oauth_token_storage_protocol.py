@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING, Callable, Optional, Protocol, Text, runtime_checkable
+
+if TYPE_CHECKING:
+    from ..credentials import OAuthToken
+
+
+@runtime_checkable
+class OAuthTokenStorageProtocol(Protocol):
+    """
+    Protocol for storages sharing renewed OAuth credentials between processes.
+
+    When an access token has to be refreshed, the token reads the credentials
+    stored for its application and portal, refreshes them only when nobody
+    else has done it yet, and stores the result. The storage guarantees that
+    these steps are not interleaved with the same steps of other threads or
+    processes, so only one refresh request per portal is sent.
+    """
+
+    def update(self, key: Text, updater: Callable[[Optional["OAuthToken"]], "OAuthToken"]) -> "OAuthToken":
+        """
+        Atomically read, replace and store the OAuth credentials of one portal.
+
+        Args:
+            key: Application and portal key.
+            updater: Function receiving the stored credentials, or ``None``
+                when nothing is stored, and returning the credentials to store.
+
+        Returns:
+            Credentials returned by ``updater``.
+        """
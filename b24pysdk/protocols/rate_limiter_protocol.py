@@ -0,0 +1,46 @@
+from typing import Optional, Protocol, Text, runtime_checkable
+
+from ..utils.types import JSONDict
+
+
+@runtime_checkable
+class RateLimiterProtocol(Protocol):
+    """
+    Protocol for client-side rate limiters used by Bitrix API requesters.
+
+    A rate limiter is asked for a delay before every request attempt and is
+    informed about every parsed response or API error, so it can follow the
+    request budget and the method operating time of each portal.
+    """
+
+    def reserve(self, url: Text, params: Optional[JSONDict] = None) -> float:
+        """
+        Reserve a slot for one upcoming request.
+
+        Args:
+            url: Absolute Bitrix REST endpoint URL.
+            params: Request body parameters.
+
+        Returns:
+            Number of seconds the caller must wait before sending the request.
+        """
+
+    def record_response(self, url: Text, params: Optional[JSONDict], json_response: JSONDict):
+        """
+        Record timing data of a successfully parsed response.
+
+        Args:
+            url: Absolute Bitrix REST endpoint URL.
+            params: Request body parameters.
+            json_response: Parsed Bitrix response.
+        """
+
+    def record_error(self, url: Text, params: Optional[JSONDict], error: Exception):
+        """
+        Record an API error returned for a request.
+
+        Args:
+            url: Absolute Bitrix REST endpoint URL.
+            params: Request body parameters.
+            error: Exception raised while parsing the response.
+        """
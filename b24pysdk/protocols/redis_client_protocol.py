@@ -0,0 +1,34 @@
+from typing import Any, Iterator, Optional, Protocol, Text, Union, runtime_checkable
+
+
+@runtime_checkable
+class RedisClientProtocol(Protocol):
+    """
+    Protocol for the subset of a Redis client used by SDK storages.
+
+    ``redis.Redis`` and compatible clients (for example, ``fakeredis`` or
+    Valkey clients) implement it.
+    """
+
+    def get(self, name: Text) -> Optional[Union[bytes, Text]]:
+        """Return the value stored under ``name``, or ``None`` if it is missing."""
+
+    def set(self, name: Text, value: Union[bytes, Text], *, nx: bool = False, px: Optional[int] = None) -> Any:
+        """
+        Store ``value`` under ``name``.
+
+        Args:
+            name: Key name.
+            value: Value to store.
+            nx: Store only when the key does not exist yet.
+            px: Expiration time of the key in milliseconds.
+
+        Returns:
+            Truthy value when the value was stored.
+        """
+
+    def delete(self, *names: Text) -> Any:
+        """Remove keys."""
+
+    def scan_iter(self, match: Optional[Text] = None) -> Iterator[Union[bytes, Text]]:
+        """Iterate over key names matching the glob-style pattern ``match``."""
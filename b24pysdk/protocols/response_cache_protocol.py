@@ -0,0 +1,67 @@
+from typing import Optional, Protocol, Text, runtime_checkable
+
+from ..constants.version import B24APIVersion
+from ..utils.types import JSONDict
+
+
+@runtime_checkable
+class ResponseCacheProtocol(Protocol):
+    """
+    Protocol for response caches consulted by single-method callers.
+
+    Before a REST method is called, the cache is asked for a stored response
+    of the same portal, method and parameters. Successful responses are
+    offered to the cache afterwards; the cache decides which methods it keeps
+    and for how long.
+    """
+
+    def get(
+            self,
+            domain: Text,
+            api_method: Text,
+            params: JSONDict,
+            *,
+            api_version: B24APIVersion = B24APIVersion.V2,
+    ) -> Optional[JSONDict]:
+        """
+        Return a stored response.
+
+        Args:
+            domain: Bitrix24 portal domain.
+            api_method: REST method name.
+            params: Method parameters without authentication data.
+            api_version: REST API version the method is called with.
+
+        Returns:
+            Stored parsed response, or ``None`` if the method is not cached or
+            no fresh response is stored.
+        """
+
+    def set(
+            self,
+            domain: Text,
+            api_method: Text,
+            params: JSONDict,
+            json_response: JSONDict,
+            *,
+            api_version: B24APIVersion = B24APIVersion.V2,
+    ):
+        """
+        Store a successful response.
+
+        Args:
+            domain: Bitrix24 portal domain.
+            api_method: REST method name.
+            params: Method parameters without authentication data.
+            json_response: Parsed Bitrix response.
+            api_version: REST API version the method was called with.
+        """
+
+    def invalidate(self, domain: Optional[Text] = None, api_method: Optional[Text] = None):
+        """
+        Remove stored responses.
+
+        Args:
+            domain: Portal whose responses are removed; all portals when omitted.
+            api_method: Method whose responses are removed; all methods when omitted.
+        """
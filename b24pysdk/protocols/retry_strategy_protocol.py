@@ -0,0 +1,50 @@
+from typing import TYPE_CHECKING, Optional, Protocol, Text, runtime_checkable
+
+from ..utils.types import Number
+
+if TYPE_CHECKING:
+    import requests
+
+
+@runtime_checkable
+class RetryStrategyProtocol(Protocol):
+    """
+    Protocol for retry policies used by SDK requesters.
+
+    After every request attempt the requester asks the strategy whether the
+    attempt should be repeated and how long to wait before the next one.
+    Strategies see both received HTTP responses and transport errors raised
+    before a response was received.
+    """
+
+    def get_retry_delay(
+            self,
+            *,
+            url: Optional[Text],
+            attempt: int,
+            max_retries: int,
+            initial_retry_delay: Number,
+            retry_delay_increment: Number,
+            response: Optional["requests.Response"] = None,
+            error: Optional[Exception] = None,
+    ) -> Optional[Number]:
+        """
+        Decide whether a request attempt should be repeated.
+
+        Args:
+            url: Absolute URL of the request, when known.
+            attempt: Number of attempts made so far, starting with 1.
+            max_retries: Maximum number of request attempts configured for the
+                requester.
+            initial_retry_delay: Delay before the first retry configured for
+                the requester.
+            retry_delay_increment: Additional delay added after each used retry
+                configured for the requester.
+            response: HTTP response of the last attempt, if one was received.
+            error: Transport error raised by the last attempt, if no response
+                was received.
+
+        Returns:
+            Number of seconds to wait before the next attempt, or ``None`` when
+            the response should be returned or the error re-raised.
+        """
@@ -2,6 +2,8 @@ from abc import ABC
 from dataclasses import dataclass
 from typing import ClassVar, Generator, Generic, List, Optional, Text, Type, Union, overload
 
+from ..utils.compact_rows import CompactRows
+from ..utils.converters import conversion_cache
 from ..utils.dataclasses import frozen_dataclass_kwargs
 from ..utils.type_vars import BSLT, BSDataT
 from ..utils.types import JSONDict
@@ -23,6 +25,7 @@ class BaseListableSchema(BaseSchema[BSDataT], ABC, Generic[BSDataT]):
 
     - wrapped result object, for example ``{"items": [...]}``;
     - raw list returned by regular list loading;
+    - ``CompactRows`` returned by compact list loading;
     - raw generator returned by fast list loading.
     """
 
@@ -32,6 +35,10 @@ class BaseListableSchema(BaseSchema[BSDataT], ABC, Generic[BSDataT]):
     @overload
     def from_bitrix_result(cls: Type[BSLT], bitrix_result: List[BSDataT], /) -> List[BSLT]: ...
 
+    @classmethod
+    @overload
+    def from_bitrix_result(cls: Type[BSLT], bitrix_result: CompactRows, /) -> List[BSLT]: ...
+
     @classmethod
     @overload
     def from_bitrix_result(cls: Type[BSLT], bitrix_result: Generator[BSDataT, None, None], /) -> Generator[BSLT, None, None]: ...
@@ -43,26 +50,31 @@ class BaseListableSchema(BaseSchema[BSDataT], ABC, Generic[BSDataT]):
     @classmethod
     def from_bitrix_result(
             cls: Type[BSLT],
-            bitrix_result: Union[List[BSDataT], Generator[BSDataT, None, None], JSONDict],
+            bitrix_result: Union[List[BSDataT], CompactRows, Generator[BSDataT, None, None], JSONDict],
             /,
     ) -> Union[List[BSLT], Generator[BSLT, None, None]]:
         """
         Adapt a Bitrix24 method result to Python-friendly schema values.
 
+        Materialized results are converted inside ``conversion_cache``, so
+        date values repeated across items are parsed once.
+
         Args:
             bitrix_result: Raw Bitrix24 ``result`` value. It can be a wrapped
-                object, a list, or a generator.
+                object, a list, compact rows, or a generator.
 
         Returns:
             List of schema instances for materialized results, or a generator
             of schema instances for fast list results.
         """
 
-        if isinstance(bitrix_result, list):
-            return [cls.from_bitrix(bitrix_data) for bitrix_data in bitrix_result]
+        if isinstance(bitrix_result, (list, CompactRows)):
+            with conversion_cache():
+                return [cls.from_bitrix(bitrix_data) for bitrix_data in bitrix_result]
 
         if isinstance(bitrix_result, dict):
-            return [cls.from_bitrix(bitrix_data) for bitrix_data in cls._unwrap_bitrix_result(bitrix_result)]
+            with conversion_cache():
+                return [cls.from_bitrix(bitrix_data) for bitrix_data in cls._unwrap_bitrix_result(bitrix_result)]
 
         return (cls.from_bitrix(bitrix_data) for bitrix_data in bitrix_result)
 
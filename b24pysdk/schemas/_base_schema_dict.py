@@ -1,6 +1,7 @@
 from abc import ABC
 from typing import Dict, Generic, Optional, Text, Type, Union
 
+from ..utils.converters import conversion_cache
 from ..utils.type_vars import BSDT, BST, BSDataT
 
 __all__ = [
@@ -35,14 +36,16 @@ class BaseSchemaDict(dict[Text, BST], ABC, Generic[BST, BSDataT]):
 
         Returns:
             Schema dictionary with adapted values indexed by the same keys.
+            Values are converted inside ``conversion_cache``.
         """
 
         bitrix_data = cls._unwrap_bitrix_data(bitrix_data)
 
-        return cls({
-            key: cls._ITEM_SCHEMA.from_bitrix(item_data)
-            for key, item_data in bitrix_data.items()
-        })
+        with conversion_cache():
+            return cls({
+                key: cls._ITEM_SCHEMA.from_bitrix(item_data)
+                for key, item_data in bitrix_data.items()
+            })
 
     @classmethod
     def _unwrap_bitrix_data(cls, bitrix_data: Union[Dict[Text, BSDataT], Dict[Text, Dict[Text, BSDataT]]], /) -> Dict[Text, BSDataT]:
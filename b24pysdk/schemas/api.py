@@ -1,5 +1,6 @@
 from typing import Annotated, Dict, List, Text, TypedDict, Union
 
+from ..utils.compact_rows import CompactRows
 from ..utils.types import B24APIResult, B24AppStatusLiteral, JSONDict, JSONGenerator, JSONList
 
 __all__ = [
@@ -8,6 +9,7 @@ __all__ = [
     "BatchResponseData",
     "BatchResultData",
     "BitrixAppInfoResponseData",
+    "ListCompactResponseData",
     "ListFastResponseData",
     "ListResponseData",
     "ResponseData",
@@ -44,6 +46,11 @@ class ListResponseData(TypedDict):
     time: TimeResponseData
 
 
+class ListCompactResponseData(TypedDict):
+    result: CompactRows
+    time: TimeResponseData
+
+
 class ListFastResponseData(TypedDict):
     result: JSONGenerator
     time: TimeResponseData
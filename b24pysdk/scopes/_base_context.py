@@ -1,9 +1,12 @@
+import inspect
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Callable, Optional, Text, Type, Union, overload
+from functools import cached_property, lru_cache
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Text, Tuple, Type, Union, overload
 
 from ..api.requests import BitrixAPIRequest
 from ..protocols import BitrixTokenFullProtocol
-from ..utils.functional import classproperty
+from ..utils.functional import classproperty, is_sdk_helper
 from ..utils.type_vars import BARequestT, BAResultT, BAValueT
 from ..utils.types import JSONDict, Timeout
 
@@ -12,9 +15,58 @@ if TYPE_CHECKING:
 
 __all__ = [
     "BaseContext",
+    "get_child_context_names",
+    "import_context",
 ]
 
 
+def import_context(package: Text, module_path: Text, name: Text) -> Any:
+    """
+    Import a context class on first use.
+
+    Child contexts are imported when their parent context is first asked
+    for them instead of when the parent module is imported, so using one
+    method of a scope does not load the modules of all its entities.
+
+    Args:
+        package: Package the module path is relative to, usually ``__package__``.
+        module_path: Relative module path, for example ``.deal``.
+        name: Name of the context class in the module.
+
+    Returns:
+        Context class.
+    """
+    return getattr(import_module(module_path, package), name)
+
+
+@lru_cache(maxsize=None)
+def get_child_context_names(owner: Type) -> Tuple[Text, ...]:
+    """
+    Return names of the attributes that may hold child contexts.
+
+    Child contexts of clients and contexts are exposed as public cached or
+    plain properties. The class is inspected statically once, so neither the
+    properties nor their modules are evaluated.
+
+    Args:
+        owner: Client or context class.
+
+    Returns:
+        Sorted attribute names.
+    """
+    attributes: Dict[Text, Any] = {}
+
+    for klass in owner.__mro__:
+        for name, attribute in vars(klass).items():
+            attributes.setdefault(name, attribute)
+
+    return tuple(sorted(
+        name
+        for name, attribute in attributes.items()
+        if not name.startswith("_") and isinstance(attribute, (cached_property, property))
+    ))
+
+
 class BaseContext(ABC):
     """
     Base class for SDK API contexts.
@@ -75,11 +127,14 @@ class BaseContext(ABC):
         """
         return getattr(self._context, "_kwargs")
 
-    @property
+    @cached_property
     def _path(self) -> Text:
         """
         Build dotted API context path.
 
+        The path is built once per context object, since the parent chain of
+        a context never changes.
+
         Returns:
             Full context path assembled from parent path and current context
             name, for example ``crm.deal``.
@@ -87,13 +142,68 @@ class BaseContext(ABC):
         base_path = getattr(self._context, "_path", None)
         return f"{base_path}.{self._name}" if base_path else self._name
 
+    @cached_property
+    def _api_methods(self) -> Dict[Text, Text]:
+        """
+        Map wrapper method names of the context to full API method names.
+
+        The table is built from ``_get_api_method_segments`` on first use,
+        so every later request resolves its API method with a dict lookup.
+
+        Returns:
+            Dictionary of full Bitrix24 REST API method names keyed by
+            wrapper method name, for example ``{"get": "crm.deal.get"}``.
+        """
+        path = self._path
+        return {
+            api_wrapper_name: f"{path}.{segment}" if segment else path
+            for api_wrapper_name, segment in self._get_api_method_segments().items()
+        }
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_api_method_segments(cls) -> Mapping[Text, Text]:
+        """
+        Map wrapper method names of the class to API method segments.
+
+        Computed once per context class. ``__call__`` maps to an empty
+        segment, since calling a context requests the context path itself.
+        Methods marked with ``sdk_helper`` are not REST method wrappers and
+        are left out.
+
+        Returns:
+            Dictionary of lowerCamelCase method segments keyed by wrapper
+            method name.
+        """
+
+        segments: Dict[Text, Text] = {}
+        defined_names = set()
+
+        for klass in cls.__mro__:
+            if klass in BaseContext.__mro__:
+                continue
+
+            for name, attribute in vars(klass).items():
+                if name in defined_names or (name.startswith("__") and name != "__call__"):
+                    continue
+
+                defined_names.add(name)
+
+                function = attribute.__func__ if isinstance(attribute, (staticmethod, classmethod)) else attribute
+
+                if inspect.isfunction(function) and not is_sdk_helper(function):
+                    segments[name] = "" if name == "__call__" else cls._snake_to_camel(name)
+
+        return segments
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def _snake_to_camel(snake_str: Text) -> Text:
         """
         Convert snake_case name to lowerCamelCase.
 
         Used to transform Python wrapper method names into Bitrix24 REST method
-        segments.
+        segments. Results are cached, as wrapper names repeat on every call.
 
         Args:
             snake_str: Python-style snake_case name.
@@ -108,14 +218,27 @@ class BaseContext(ABC):
         """
         Build Bitrix24 REST API method name for a wrapper method.
 
+        Wrapper methods of the context are resolved from ``_api_methods``;
+        names are only computed for wrappers defined elsewhere.
+
         Args:
             api_wrapper: Wrapper method used to infer the final method segment.
 
         Returns:
             Full Bitrix24 REST API method name.
         """
+
         api_wrapper_name = getattr(api_wrapper, "__name__", None)
-        return f"{self}.{self._snake_to_camel(api_wrapper_name)}" if api_wrapper_name else str(self)
+
+        if not api_wrapper_name:
+            return self._path
+
+        api_method = self._api_methods.get(api_wrapper_name)
+
+        if api_method is None:
+            api_method = f"{self._path}.{self._snake_to_camel(api_wrapper_name)}"
+
+        return api_method
 
     @overload
     def _make_bitrix_api_request(
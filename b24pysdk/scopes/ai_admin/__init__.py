@@ -1,8 +1,12 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .engine import Engine
-from .prompt import Prompt
+
+if TYPE_CHECKING:
+    from .engine import Engine
+    from .prompt import Prompt
 
 __all__ = [
     "AI",
@@ -13,11 +17,11 @@ class AI(BaseScope):
     """"""
 
     @cached_property
-    def engine(self) -> Engine:
+    def engine(self) -> "Engine":
         """"""
-        return Engine(self)
+        return import_context(__package__, ".engine", "Engine")(self)
 
     @cached_property
-    def prompt(self) -> Prompt:
+    def prompt(self) -> "Prompt":
         """"""
-        return Prompt(self)
+        return import_context(__package__, ".prompt", "Prompt")(self)
@@ -1,11 +1,15 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from ...api.requests import BitrixAPIValueRequest
 from ...schemas.app import AppInfo, AppInfoBase, AppInfoData
 from ...utils.functional import type_checker
 from ...utils.types import Timeout
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .option import Option
+
+if TYPE_CHECKING:
+    from .option import Option
 
 __all__ = [
     "App",
@@ -16,9 +20,9 @@ class App(BaseScope):
     """"""
 
     @cached_property
-    def option(self) -> Option:
+    def option(self) -> "Option":
         """"""
-        return Option(self)
+        return import_context(__package__, ".option", "Option")(self)
 
     @type_checker
     def info(
@@ -1,9 +1,13 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .connector import Connector
-from .dataset import Dataset
-from .source import Source
+
+if TYPE_CHECKING:
+    from .connector import Connector
+    from .dataset import Dataset
+    from .source import Source
 
 __all__ = [
     "Biconnector",
@@ -14,16 +18,16 @@ class Biconnector(BaseScope):
     """"""
 
     @cached_property
-    def connector(self) -> Connector:
+    def connector(self) -> "Connector":
         """"""
-        return Connector(self)
+        return import_context(__package__, ".connector", "Connector")(self)
 
     @cached_property
-    def dataset(self) -> Dataset:
+    def dataset(self) -> "Dataset":
         """"""
-        return Dataset(self)
+        return import_context(__package__, ".dataset", "Dataset")(self)
 
     @cached_property
-    def source(self) -> Source:
+    def source(self) -> "Source":
         """"""
-        return Source(self)
+        return import_context(__package__, ".source", "Source")(self)
@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from .._base_biconnector import BaseBiconnector
-from .fields import Fields
+
+if TYPE_CHECKING:
+    from .fields import Fields
 
 __all__ = [
     "Dataset",
@@ -19,9 +22,9 @@ class Dataset(BaseBiconnector):
     """
 
     @cached_property
-    def fields(self) -> Fields:
+    def fields(self) -> "Fields":
         """Dataset fields endpoints: biconnector.dataset.fields.*"""
-        return Fields(self)
+        return import_context(__package__, ".fields", "Fields")(self)
 
     @type_checker
     def add(
@@ -1,11 +1,15 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .activity import Activity
-from .event import Event
-from .robot import Robot
-from .task import Task
-from .workflow import Workflow
+
+if TYPE_CHECKING:
+    from .activity import Activity
+    from .event import Event
+    from .robot import Robot
+    from .task import Task
+    from .workflow import Workflow
 
 __all__ = [
     "Bizproc",
@@ -16,26 +20,26 @@ class Bizproc(BaseScope):
     """"""
 
     @cached_property
-    def activity(self) -> Activity:
+    def activity(self) -> "Activity":
         """"""
-        return Activity(self)
+        return import_context(__package__, ".activity", "Activity")(self)
 
     @cached_property
-    def event(self) -> Event:
+    def event(self) -> "Event":
         """"""
-        return Event(self)
+        return import_context(__package__, ".event", "Event")(self)
 
     @cached_property
-    def robot(self) -> Robot:
+    def robot(self) -> "Robot":
         """"""
-        return Robot(self)
+        return import_context(__package__, ".robot", "Robot")(self)
 
     @cached_property
-    def task(self) -> Task:
+    def task(self) -> "Task":
         """"""
-        return Task(self)
+        return import_context(__package__, ".task", "Task")(self)
 
     @cached_property
-    def workflow(self) -> Workflow:
+    def workflow(self) -> "Workflow":
         """"""
-        return Workflow(self)
+        return import_context(__package__, ".workflow", "Workflow")(self)
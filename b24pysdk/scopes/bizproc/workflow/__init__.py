@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Dict, Iterable, Optional, Sequence, Text
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import DocumentType, JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .template import Template
+
+if TYPE_CHECKING:
+    from .template import Template
 
 __all__ = [
     "Workflow",
@@ -16,9 +19,9 @@ class Workflow(BaseEntity):
     """"""
 
     @cached_property
-    def template(self) -> Template:
+    def template(self) -> "Template":
         """"""
-        return Template(self)
+        return import_context(__package__, ".template", "Template")(self)
 
     @type_checker
     def start(
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .v1 import V1
+
+if TYPE_CHECKING:
+    from .v1 import V1
 
 __all__ = [
     "Booking",
@@ -12,6 +16,6 @@ class Booking(BaseScope):
     """"""
 
     @cached_property
-    def v1(self) -> V1:
+    def v1(self) -> "V1":
         """"""
-        return V1(self)
+        return import_context(__package__, ".v1", "V1")(self)
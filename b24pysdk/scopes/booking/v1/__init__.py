@@ -1,11 +1,15 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .booking import Booking
-from .clienttype import Clienttype
-from .resource import Resource
-from .resource_type import ResourceType
-from .waitlist import Waitlist
+
+if TYPE_CHECKING:
+    from .booking import Booking
+    from .clienttype import Clienttype
+    from .resource import Resource
+    from .resource_type import ResourceType
+    from .waitlist import Waitlist
 
 __all__ = [
     "V1",
@@ -16,26 +20,26 @@ class V1(BaseEntity):
     """"""
 
     @cached_property
-    def booking(self) -> Booking:
+    def booking(self) -> "Booking":
         """"""
-        return Booking(self)
+        return import_context(__package__, ".booking", "Booking")(self)
 
     @cached_property
-    def clienttype(self) -> Clienttype:
+    def clienttype(self) -> "Clienttype":
         """"""
-        return Clienttype(self)
+        return import_context(__package__, ".clienttype", "Clienttype")(self)
 
     @cached_property
-    def resource(self) -> Resource:
+    def resource(self) -> "Resource":
         """"""
-        return Resource(self)
+        return import_context(__package__, ".resource", "Resource")(self)
 
     @cached_property
-    def resource_type(self) -> ResourceType:
+    def resource_type(self) -> "ResourceType":
         """"""
-        return ResourceType(self)
+        return import_context(__package__, ".resource_type", "ResourceType")(self)
 
     @cached_property
-    def waitlist(self) -> Waitlist:
+    def waitlist(self) -> "Waitlist":
         """"""
-        return Waitlist(self)
+        return import_context(__package__, ".waitlist", "Waitlist")(self)
@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import JSONDict, Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .client import Client
-from .external_data import ExternalData
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .external_data import ExternalData
 
 __all__ = [
     "Booking",
@@ -17,14 +20,14 @@ class Booking(BaseEntity):
     """"""
 
     @cached_property
-    def client(self) -> Client:
+    def client(self) -> "Client":
         """"""
-        return Client(self)
+        return import_context(__package__, ".client", "Client")(self)
 
     @cached_property
-    def external_data(self) -> ExternalData:
+    def external_data(self) -> "ExternalData":
         """"""
-        return ExternalData(self)
+        return import_context(__package__, ".external_data", "ExternalData")(self)
 
     @type_checker
     def add(
@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import JSONDict, Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .slots import Slots
+
+if TYPE_CHECKING:
+    from .slots import Slots
 
 __all__ = [
     "Resource",
@@ -16,9 +19,9 @@ class Resource(BaseEntity):
     """"""
 
     @cached_property
-    def slots(self) -> Slots:
+    def slots(self) -> "Slots":
         """"""
-        return Slots(self)
+        return import_context(__package__, ".slots", "Slots")(self)
 
     @type_checker
     def add(
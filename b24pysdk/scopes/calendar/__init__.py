@@ -1,13 +1,17 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .accessibility import Accessibility
-from .event import Event
-from .meeting import Meeting
-from .resource import Resource
-from .section import Section
-from .settings import Settings
-from .user import User
+
+if TYPE_CHECKING:
+    from .accessibility import Accessibility
+    from .event import Event
+    from .meeting import Meeting
+    from .resource import Resource
+    from .section import Section
+    from .settings import Settings
+    from .user import User
 
 __all__ = [
     "Calendar",
@@ -18,36 +22,36 @@ class Calendar(BaseScope):
     """"""
 
     @cached_property
-    def accessibility(self) -> Accessibility:
+    def accessibility(self) -> "Accessibility":
         """"""
-        return Accessibility(self)
+        return import_context(__package__, ".accessibility", "Accessibility")(self)
 
     @cached_property
-    def event(self) -> Event:
+    def event(self) -> "Event":
         """"""
-        return Event(self)
+        return import_context(__package__, ".event", "Event")(self)
 
     @cached_property
-    def meeting(self) -> Meeting:
+    def meeting(self) -> "Meeting":
         """"""
-        return Meeting(self)
+        return import_context(__package__, ".meeting", "Meeting")(self)
 
     @cached_property
-    def resource(self) -> Resource:
+    def resource(self) -> "Resource":
         """"""
-        return Resource(self)
+        return import_context(__package__, ".resource", "Resource")(self)
 
     @cached_property
-    def section(self) -> Section:
+    def section(self) -> "Section":
         """"""
-        return Section(self)
+        return import_context(__package__, ".section", "Section")(self)
 
     @cached_property
-    def settings(self) -> Settings:
+    def settings(self) -> "Settings":
         """"""
-        return Settings(self)
+        return import_context(__package__, ".settings", "Settings")(self)
 
     @cached_property
-    def user(self) -> User:
+    def user(self) -> "User":
         """"""
-        return User(self)
+        return import_context(__package__, ".user", "User")(self)
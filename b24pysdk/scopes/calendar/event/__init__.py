@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Dict, Iterable, Optional, Text
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .get import Get
+
+if TYPE_CHECKING:
+    from .get import Get
 
 __all__ = [
     "Event",
@@ -137,9 +140,9 @@ class Event(BaseEntity):
         )
 
     @cached_property
-    def get(self) -> Get:
+    def get(self) -> "Get":
         """"""
-        return Get(self)
+        return import_context(__package__, ".get", "Get")(self)
 
     @type_checker
     def get_by_id(
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .status import Status
+
+if TYPE_CHECKING:
+    from .status import Status
 
 __all__ = [
     "Meeting",
@@ -12,6 +16,6 @@ class Meeting(BaseEntity):
     """"""
 
     @cached_property
-    def status(self) -> Status:
+    def status(self) -> "Status":
         """"""
-        return Status(self)
+        return import_context(__package__, ".status", "Status")(self)
@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Text
+from typing import TYPE_CHECKING, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .booking import Booking
+
+if TYPE_CHECKING:
+    from .booking import Booking
 
 __all__ = [
     "Resource",
@@ -16,9 +19,9 @@ class Resource(BaseEntity):
     """"""
 
     @cached_property
-    def booking(self) -> Booking:
+    def booking(self) -> "Booking":
         """"""
-        return Booking(self)
+        return import_context(__package__, ".booking", "Booking")(self)
 
     @type_checker
     def add(
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .settings import Settings
+
+if TYPE_CHECKING:
+    from .settings import Settings
 
 __all__ = [
     "User",
@@ -12,6 +16,6 @@ class User(BaseEntity):
     """"""
 
     @cached_property
-    def settings(self) -> Settings:
+    def settings(self) -> "Settings":
         """"""
-        return Settings(self)
+        return import_context(__package__, ".settings", "Settings")(self)
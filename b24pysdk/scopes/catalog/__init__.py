@@ -1,29 +1,33 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
 from .catalog import Catalog as CatalogEntity
-from .document import Document
-from .documentcontractor import Documentcontractor
-from .enum import Enum
-from .extra import Extra
-from .measure import Measure
-from .price import Price
-from .price_type import PriceType
-from .price_type_group import PriceTypeGroup
-from .price_type_lang import PriceTypeLang
-from .product import Product
-from .product_image import ProductImage
-from .product_property import ProductProperty
-from .product_property_enum import ProductPropertyEnum
-from .product_property_feature import ProductPropertyFeature
-from .product_property_section import ProductPropertySection
-from .ratio import Ratio
-from .rounding_rule import RoundingRule
-from .section import Section
-from .store import Store
-from .storeproduct import Storeproduct
-from .userfield import Userfield
-from .vat import Vat
+
+if TYPE_CHECKING:
+    from .document import Document
+    from .documentcontractor import Documentcontractor
+    from .enum import Enum
+    from .extra import Extra
+    from .measure import Measure
+    from .price import Price
+    from .price_type import PriceType
+    from .price_type_group import PriceTypeGroup
+    from .price_type_lang import PriceTypeLang
+    from .product import Product
+    from .product_image import ProductImage
+    from .product_property import ProductProperty
+    from .product_property_enum import ProductPropertyEnum
+    from .product_property_feature import ProductPropertyFeature
+    from .product_property_section import ProductPropertySection
+    from .ratio import Ratio
+    from .rounding_rule import RoundingRule
+    from .section import Section
+    from .store import Store
+    from .storeproduct import Storeproduct
+    from .userfield import Userfield
+    from .vat import Vat
 
 __all__ = [
     "Catalog",
@@ -39,111 +43,111 @@ class Catalog(BaseScope):
         return CatalogEntity(self)
 
     @cached_property
-    def document(self) -> Document:
+    def document(self) -> "Document":
         """"""
-        return Document(self)
+        return import_context(__package__, ".document", "Document")(self)
 
     @cached_property
-    def documentcontractor(self) -> Documentcontractor:
+    def documentcontractor(self) -> "Documentcontractor":
         """"""
-        return Documentcontractor(self)
+        return import_context(__package__, ".documentcontractor", "Documentcontractor")(self)
 
     @cached_property
-    def enum(self) -> Enum:
+    def enum(self) -> "Enum":
         """"""
-        return Enum(self)
+        return import_context(__package__, ".enum", "Enum")(self)
 
     @cached_property
-    def extra(self) -> Extra:
+    def extra(self) -> "Extra":
         """"""
-        return Extra(self)
+        return import_context(__package__, ".extra", "Extra")(self)
 
     @cached_property
-    def measure(self) -> Measure:
+    def measure(self) -> "Measure":
         """"""
-        return Measure(self)
+        return import_context(__package__, ".measure", "Measure")(self)
 
     @cached_property
-    def price(self) -> Price:
+    def price(self) -> "Price":
         """"""
-        return Price(self)
+        return import_context(__package__, ".price", "Price")(self)
 
     @cached_property
-    def price_type(self) -> PriceType:
+    def price_type(self) -> "PriceType":
         """"""
-        return PriceType(self)
+        return import_context(__package__, ".price_type", "PriceType")(self)
 
     @cached_property
-    def price_type_group(self) -> PriceTypeGroup:
+    def price_type_group(self) -> "PriceTypeGroup":
         """"""
-        return PriceTypeGroup(self)
+        return import_context(__package__, ".price_type_group", "PriceTypeGroup")(self)
 
     @cached_property
-    def price_type_lang(self) -> PriceTypeLang:
+    def price_type_lang(self) -> "PriceTypeLang":
         """"""
-        return PriceTypeLang(self)
+        return import_context(__package__, ".price_type_lang", "PriceTypeLang")(self)
 
     @cached_property
-    def product(self) -> Product:
+    def product(self) -> "Product":
         """"""
-        return Product(self)
+        return import_context(__package__, ".product", "Product")(self)
 
     @cached_property
-    def product_property(self) -> ProductProperty:
+    def product_property(self) -> "ProductProperty":
         """"""
-        return ProductProperty(self)
+        return import_context(__package__, ".product_property", "ProductProperty")(self)
 
     @cached_property
-    def product_property_enum(self) -> ProductPropertyEnum:
+    def product_property_enum(self) -> "ProductPropertyEnum":
         """"""
-        return ProductPropertyEnum(self)
+        return import_context(__package__, ".product_property_enum", "ProductPropertyEnum")(self)
 
     @cached_property
-    def product_property_feature(self) -> ProductPropertyFeature:
+    def product_property_feature(self) -> "ProductPropertyFeature":
         """"""
-        return ProductPropertyFeature(self)
+        return import_context(__package__, ".product_property_feature", "ProductPropertyFeature")(self)
 
     @cached_property
-    def product_property_section(self) -> ProductPropertySection:
+    def product_property_section(self) -> "ProductPropertySection":
         """"""
-        return ProductPropertySection(self)
+        return import_context(__package__, ".product_property_section", "ProductPropertySection")(self)
 
     @cached_property
-    def product_image(self) -> ProductImage:
+    def product_image(self) -> "ProductImage":
         """"""
-        return ProductImage(self)
+        return import_context(__package__, ".product_image", "ProductImage")(self)
 
     @cached_property
-    def ratio(self) -> Ratio:
+    def ratio(self) -> "Ratio":
         """"""
-        return Ratio(self)
+        return import_context(__package__, ".ratio", "Ratio")(self)
 
     @cached_property
-    def rounding_rule(self) -> RoundingRule:
+    def rounding_rule(self) -> "RoundingRule":
         """"""
-        return RoundingRule(self)
+        return import_context(__package__, ".rounding_rule", "RoundingRule")(self)
 
     @cached_property
-    def section(self) -> Section:
+    def section(self) -> "Section":
         """"""
-        return Section(self)
+        return import_context(__package__, ".section", "Section")(self)
 
     @cached_property
-    def store(self) -> Store:
+    def store(self) -> "Store":
         """"""
-        return Store(self)
+        return import_context(__package__, ".store", "Store")(self)
 
     @cached_property
-    def storeproduct(self) -> Storeproduct:
+    def storeproduct(self) -> "Storeproduct":
         """"""
-        return Storeproduct(self)
+        return import_context(__package__, ".storeproduct", "Storeproduct")(self)
 
     @cached_property
-    def userfield(self) -> Userfield:
+    def userfield(self) -> "Userfield":
         """"""
-        return Userfield(self)
+        return import_context(__package__, ".userfield", "Userfield")(self)
 
     @cached_property
-    def vat(self) -> Vat:
+    def vat(self) -> "Vat":
         """"""
-        return Vat(self)
+        return import_context(__package__, ".vat", "Vat")(self)
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .element import Element
+
+if TYPE_CHECKING:
+    from .element import Element
 
 __all__ = [
     "Document",
@@ -12,6 +16,6 @@ class Document(BaseEntity):
     """"""
 
     @cached_property
-    def element(self) -> Element:
+    def element(self) -> "Element":
         """"""
-        return Element(self)
+        return import_context(__package__, ".element", "Element")(self)
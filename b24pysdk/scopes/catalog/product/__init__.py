@@ -1,13 +1,16 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .offer import Offer
-from .service import Service
-from .sku import Sku
+
+if TYPE_CHECKING:
+    from .offer import Offer
+    from .service import Service
+    from .sku import Sku
 
 __all__ = [
     "Product",
@@ -18,19 +21,19 @@ class Product(BaseEntity):
     """"""
 
     @cached_property
-    def offer(self) -> Offer:
+    def offer(self) -> "Offer":
         """"""
-        return Offer(self)
+        return import_context(__package__, ".offer", "Offer")(self)
 
     @cached_property
-    def service(self) -> Service:
+    def service(self) -> "Service":
         """"""
-        return Service(self)
+        return import_context(__package__, ".service", "Service")(self)
 
     @cached_property
-    def sku(self) -> Sku:
+    def sku(self) -> "Sku":
         """"""
-        return Sku(self)
+        return import_context(__package__, ".sku", "Sku")(self)
 
     @type_checker
     def add(
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .document import Document
+
+if TYPE_CHECKING:
+    from .document import Document
 
 __all__ = [
     "Userfield",
@@ -12,6 +16,6 @@ class Userfield(BaseEntity):
     """"""
 
     @cached_property
-    def document(self) -> Document:
+    def document(self) -> "Document":
         """"""
-        return Document(self)
+        return import_context(__package__, ".document", "Document")(self)
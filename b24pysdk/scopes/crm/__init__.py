@@ -1,34 +1,38 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .activity import Activity
-from .address import Address
-from .automatedsolution import Automatedsolution
-from .automation import Automation
-from .calllist import Calllist
-from .category import Category
-from .company import Company
-from .contact import Contact
-from .currency import Currency
-from .deal import Deal
-from .documentgenerator import Documentgenerator
-from .duplicate import Duplicate
-from .entity import Entity
-from .enum import Enum
-from .item import Item
-from .lead import Lead
-from .multifield import Multifield
-from .orderentity import Orderentity
-from .quote import Quote
-from .requisite import Requisite
-from .settings import Settings
-from .stagehistory import Stagehistory
-from .status import Status
-from .timeline import Timeline
-from .tracking import Tracking
-from .type import Type
-from .userfield import Userfield
-from .vat import Vat
+
+if TYPE_CHECKING:
+    from .activity import Activity
+    from .address import Address
+    from .automatedsolution import Automatedsolution
+    from .automation import Automation
+    from .calllist import Calllist
+    from .category import Category
+    from .company import Company
+    from .contact import Contact
+    from .currency import Currency
+    from .deal import Deal
+    from .documentgenerator import Documentgenerator
+    from .duplicate import Duplicate
+    from .entity import Entity
+    from .enum import Enum
+    from .item import Item
+    from .lead import Lead
+    from .multifield import Multifield
+    from .orderentity import Orderentity
+    from .quote import Quote
+    from .requisite import Requisite
+    from .settings import Settings
+    from .stagehistory import Stagehistory
+    from .status import Status
+    from .timeline import Timeline
+    from .tracking import Tracking
+    from .type import Type
+    from .userfield import Userfield
+    from .vat import Vat
 
 __all__ = [
     "CRM",
@@ -39,141 +43,141 @@ class CRM(BaseScope):
     """"""
 
     @cached_property
-    def activity(self) -> Activity:
+    def activity(self) -> "Activity":
         """"""
-        return Activity(self)
+        return import_context(__package__, ".activity", "Activity")(self)
 
     @cached_property
-    def address(self) -> Address:
+    def address(self) -> "Address":
         """"""
-        return Address(self)
+        return import_context(__package__, ".address", "Address")(self)
 
     @cached_property
-    def automatedsolution(self) -> Automatedsolution:
+    def automatedsolution(self) -> "Automatedsolution":
         """"""
-        return Automatedsolution(self)
+        return import_context(__package__, ".automatedsolution", "Automatedsolution")(self)
 
     @cached_property
-    def automation(self) -> Automation:
+    def automation(self) -> "Automation":
         """"""
-        return Automation(self)
+        return import_context(__package__, ".automation", "Automation")(self)
 
     @cached_property
-    def calllist(self) -> Calllist:
+    def calllist(self) -> "Calllist":
         """"""
-        return Calllist(self)
+        return import_context(__package__, ".calllist", "Calllist")(self)
 
     @cached_property
-    def category(self) -> Category:
+    def category(self) -> "Category":
         """"""
-        return Category(self)
+        return import_context(__package__, ".category", "Category")(self)
 
     @cached_property
-    def company(self) -> Company:
+    def company(self) -> "Company":
         """"""
-        return Company(self)
+        return import_context(__package__, ".company", "Company")(self)
 
     @cached_property
-    def contact(self) -> Contact:
+    def contact(self) -> "Contact":
         """"""
-        return Contact(self)
+        return import_context(__package__, ".contact", "Contact")(self)
 
     @cached_property
-    def currency(self) -> Currency:
+    def currency(self) -> "Currency":
         """"""
-        return Currency(self)
+        return import_context(__package__, ".currency", "Currency")(self)
 
     @cached_property
-    def deal(self) -> Deal:
+    def deal(self) -> "Deal":
         """"""
-        return Deal(self)
+        return import_context(__package__, ".deal", "Deal")(self)
 
     @cached_property
-    def documentgenerator(self) -> Documentgenerator:
+    def documentgenerator(self) -> "Documentgenerator":
         """"""
-        return Documentgenerator(self)
+        return import_context(__package__, ".documentgenerator", "Documentgenerator")(self)
 
     @cached_property
-    def duplicate(self) -> Duplicate:
+    def duplicate(self) -> "Duplicate":
         """"""
-        return Duplicate(self)
+        return import_context(__package__, ".duplicate", "Duplicate")(self)
 
     @cached_property
-    def entity(self) -> Entity:
+    def entity(self) -> "Entity":
         """"""
-        return Entity(self)
+        return import_context(__package__, ".entity", "Entity")(self)
 
     @cached_property
-    def enum(self) -> Enum:
+    def enum(self) -> "Enum":
         """"""
-        return Enum(self)
+        return import_context(__package__, ".enum", "Enum")(self)
 
     @cached_property
-    def item(self) -> Item:
+    def item(self) -> "Item":
         """"""
-        return Item(self)
+        return import_context(__package__, ".item", "Item")(self)
 
     @cached_property
-    def lead(self) -> Lead:
+    def lead(self) -> "Lead":
         """"""
-        return Lead(self)
+        return import_context(__package__, ".lead", "Lead")(self)
 
     @cached_property
-    def multifield(self) -> Multifield:
+    def multifield(self) -> "Multifield":
         """"""
-        return Multifield(self)
+        return import_context(__package__, ".multifield", "Multifield")(self)
 
     @cached_property
-    def orderentity(self) -> Orderentity:
+    def orderentity(self) -> "Orderentity":
         """"""
-        return Orderentity(self)
+        return import_context(__package__, ".orderentity", "Orderentity")(self)
 
     @cached_property
-    def quote(self) -> Quote:
+    def quote(self) -> "Quote":
         """"""
-        return Quote(self)
+        return import_context(__package__, ".quote", "Quote")(self)
 
     @cached_property
-    def requisite(self) -> Requisite:
+    def requisite(self) -> "Requisite":
         """"""
-        return Requisite(self)
+        return import_context(__package__, ".requisite", "Requisite")(self)
 
     @cached_property
-    def settings(self) -> Settings:
+    def settings(self) -> "Settings":
         """"""
-        return Settings(self)
+        return import_context(__package__, ".settings", "Settings")(self)
 
     @cached_property
-    def stagehistory(self) -> Stagehistory:
+    def stagehistory(self) -> "Stagehistory":
         """"""
-        return Stagehistory(self)
+        return import_context(__package__, ".stagehistory", "Stagehistory")(self)
 
     @cached_property
-    def status(self) -> Status:
+    def status(self) -> "Status":
         """"""
-        return Status(self)
+        return import_context(__package__, ".status", "Status")(self)
 
     @cached_property
-    def timeline(self) -> Timeline:
+    def timeline(self) -> "Timeline":
         """"""
-        return Timeline(self)
+        return import_context(__package__, ".timeline", "Timeline")(self)
 
     @cached_property
-    def tracking(self) -> Tracking:
+    def tracking(self) -> "Tracking":
         """"""
-        return Tracking(self)
+        return import_context(__package__, ".tracking", "Tracking")(self)
 
     @cached_property
-    def type(self) -> Type:
+    def type(self) -> "Type":
         """"""
-        return Type(self)
+        return import_context(__package__, ".type", "Type")(self)
 
     @cached_property
-    def userfield(self) -> Userfield:
+    def userfield(self) -> "Userfield":
         """"""
-        return Userfield(self)
+        return import_context(__package__, ".userfield", "Userfield")(self)
 
     @cached_property
-    def vat(self) -> Vat:
+    def vat(self) -> "Vat":
         """"""
-        return Vat(self)
+        return import_context(__package__, ".vat", "Vat")(self)
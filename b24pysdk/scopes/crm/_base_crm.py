@@ -1,6 +1,7 @@
 from abc import ABC
-from typing import Iterable, Optional, Text, Type
+from typing import Callable, Iterable, Optional, Text, Type
 
+from ...api.bulk import BulkWriter
 from ...api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ...schemas.crm.field import CRMFieldsDict
 from ...utils.type_vars import BSDT, BAResultT
@@ -136,3 +137,25 @@ class BaseCRM(BaseEntity, ABC):
             params=params,
             timeout=timeout,
         )
+
+    def _bulk(
+            self,
+            api_wrapper: Callable,
+            *,
+            params: Optional[JSONDict] = None,
+            max_concurrency: int = 1,
+            max_retries: int = 2,
+            timeout: Timeout = None,
+    ) -> BulkWriter:
+        """Create a bulk writer calling the method of ``api_wrapper`` once per row with ``{"fields": row} | params``."""
+
+        params = params or {}
+
+        return BulkWriter(
+            self._bitrix_token,
+            self._get_api_method(api_wrapper),
+            make_params=lambda fields: {"fields": fields} | params,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            timeout=timeout or self._kwargs.get("timeout"),
+        )
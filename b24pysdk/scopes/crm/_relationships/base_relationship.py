@@ -1,11 +1,15 @@
 from abc import abstractmethod
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from ....api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ....schemas.crm.field import CRMFieldsData, CRMFieldsDict
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .items import Items
+
+if TYPE_CHECKING:
+    from .items import Items
 
 
 class BaseRelationship(BaseCRM):
@@ -13,9 +17,9 @@ class BaseRelationship(BaseCRM):
     Contact-CRM entity bindings, where the CRM entity can be a Lead, Deal, or Company."""
 
     @cached_property
-    def items(self) -> Items:
+    def items(self) -> "Items":
         """"""
-        return Items(self)
+        return import_context(__package__, ".items", "Items")(self)
 
     @abstractmethod
     def fields(
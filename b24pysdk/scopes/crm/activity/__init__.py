@@ -1,18 +1,21 @@
 from functools import cached_property
-from typing import Iterable, Literal, Optional, Text, Union
+from typing import TYPE_CHECKING, Iterable, Literal, Optional, Text, Union
 
 from ....api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ....schemas.crm.field import CRMFieldsData, CRMFieldsDict
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .badge import Badge
-from .binding import Binding
-from .communication import Communication
-from .configurable import Configurable
-from .layout import Layout
-from .todo import Todo
-from .type import Type
+
+if TYPE_CHECKING:
+    from .badge import Badge
+    from .binding import Binding
+    from .communication import Communication
+    from .configurable import Configurable
+    from .layout import Layout
+    from .todo import Todo
+    from .type import Type
 
 __all__ = [
     "Activity",
@@ -26,39 +29,39 @@ class Activity(BaseCRM):
     """
 
     @cached_property
-    def badge(self) -> Badge:
+    def badge(self) -> "Badge":
         """"""
-        return Badge(self)
+        return import_context(__package__, ".badge", "Badge")(self)
 
     @cached_property
-    def binding(self) -> Binding:
+    def binding(self) -> "Binding":
         """"""
-        return Binding(self)
+        return import_context(__package__, ".binding", "Binding")(self)
 
     @cached_property
-    def communication(self) -> Communication:
+    def communication(self) -> "Communication":
         """"""
-        return Communication(self)
+        return import_context(__package__, ".communication", "Communication")(self)
 
     @cached_property
-    def configurable(self) -> Configurable:
+    def configurable(self) -> "Configurable":
         """"""
-        return Configurable(self)
+        return import_context(__package__, ".configurable", "Configurable")(self)
 
     @cached_property
-    def layout(self) -> Layout:
+    def layout(self) -> "Layout":
         """"""
-        return Layout(self)
+        return import_context(__package__, ".layout", "Layout")(self)
 
     @cached_property
-    def todo(self) -> Todo:
+    def todo(self) -> "Todo":
         """"""
-        return Todo(self)
+        return import_context(__package__, ".todo", "Todo")(self)
 
     @cached_property
-    def type(self) -> Type:
+    def type(self) -> "Type":
         """"""
-        return Type(self)
+        return import_context(__package__, ".type", "Type")(self)
 
     @type_checker
     def fields(
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ...._base_context import import_context
 from ..._base_crm import BaseCRM
-from .blocks import Blocks
+
+if TYPE_CHECKING:
+    from .blocks import Blocks
 
 __all__ = [
     "Layout",
@@ -12,6 +16,6 @@ class Layout(BaseCRM):
     """"""
 
     @cached_property
-    def blocks(self) -> Blocks:
+    def blocks(self) -> "Blocks":
         """"""
-        return Blocks(self)
+        return import_context(__package__, ".blocks", "Blocks")(self)
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .trigger import Trigger
+
+if TYPE_CHECKING:
+    from .trigger import Trigger
 
 __all__ = [
     "Automation",
@@ -12,6 +16,6 @@ class Automation(BaseCRM):
     """"""
 
     @cached_property
-    def trigger(self) -> Trigger:
+    def trigger(self) -> "Trigger":
         """"""
-        return Trigger(self)
+        return import_context(__package__, ".trigger", "Trigger")(self)
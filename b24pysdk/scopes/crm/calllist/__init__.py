@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Annotated, Iterable, Literal, Optional, Text
+from typing import TYPE_CHECKING, Annotated, Iterable, Literal, Optional, Text
 
 from ....api.requests import BitrixAPIRequest, BitrixAPIValuesRequest
 from ....schemas.crm.calllist import CalllistStatus, CalllistStatusesData
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .items import Items
+
+if TYPE_CHECKING:
+    from .items import Items
 
 __all__ = [
     "Calllist",
@@ -20,9 +23,9 @@ class Calllist(BaseCRM):
     """
 
     @cached_property
-    def items(self) -> Items:
+    def items(self) -> "Items":
         """"""
-        return Items(self)
+        return import_context(__package__, ".items", "Items")(self)
 
     @type_checker
     def add(
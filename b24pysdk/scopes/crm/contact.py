@@ -1,15 +1,19 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
+from ...api.bulk import BulkWriter
 from ...api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ...schemas.crm.field import CRMFieldsData, CRMFieldsDict
-from ...utils.functional import type_checker
+from ...utils.functional import sdk_helper, type_checker
 from ...utils.types import JSONDict, Timeout
-from ._relationships import Company
-from ._userfield import Userfield
-from .details import Details
+from .._base_context import import_context
 from .item.base_item import BaseItem
 
+if TYPE_CHECKING:
+    from ._relationships import Company
+    from ._userfield import Userfield
+    from .details import Details
+
 __all__ = [
     "Contact",
 ]
@@ -23,19 +27,19 @@ class Contact(BaseItem):
     """
 
     @cached_property
-    def company(self) -> Company:
+    def company(self) -> "Company":
         """"""
-        return Company(self)
+        return import_context(__package__, "._relationships", "Company")(self)
 
     @cached_property
-    def details(self) -> Details:
+    def details(self) -> "Details":
         """"""
-        return Details(self)
+        return import_context(__package__, ".details", "Details")(self)
 
     @cached_property
-    def userfield(self) -> Userfield:
+    def userfield(self) -> "Userfield":
         """"""
-        return Userfield(self)
+        return import_context(__package__, "._userfield", "Userfield")(self)
 
     @type_checker
     def fields(
@@ -101,6 +105,41 @@ class Contact(BaseItem):
             timeout=timeout,
         )
 
+    @sdk_helper
+    @type_checker
+    def bulk(
+            self,
+            *,
+            params: Optional[JSONDict] = None,
+            max_concurrency: int = 1,
+            max_retries: int = 2,
+            timeout: Timeout = None,
+    ) -> BulkWriter:
+        """Create a bulk writer adding contacts.
+
+        Rows passed to ``BulkWriter.write`` are added by crm.contact.add commands of batch requests, up to 50 rows per request
+        and up to max_concurrency requests at the same time. One record with the new ID or the error is yielded per row.
+
+        Args:
+            params: Additional parameters sent with every row, e.g. {"REGISTER_SONET_EVENT": "N"};
+
+            max_concurrency: Maximum number of batch requests sent at the same time;
+
+            max_retries: Number of times a row failed with a transient error is added again;
+
+            timeout: Timeout in seconds.
+
+        Returns:
+            Instance of BulkWriter
+        """
+        return self._bulk(
+            self.add,
+            params=params and {"params": params},
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            timeout=timeout,
+        )
+
     @type_checker
     def get(
             self,
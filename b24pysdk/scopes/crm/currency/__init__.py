@@ -1,13 +1,16 @@
 from functools import cached_property
-from typing import Optional, Text
+from typing import TYPE_CHECKING, Optional, Text
 
 from ....api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ....schemas.crm.field import CRMFieldsData, CRMFieldsDict
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .base import Base
-from .localizations import Localizations
+
+if TYPE_CHECKING:
+    from .base import Base
+    from .localizations import Localizations
 
 __all__ = [
     "Currency",
@@ -21,14 +24,14 @@ class Currency(BaseCRM):
     """
 
     @cached_property
-    def base(self) -> Base:
+    def base(self) -> "Base":
         """"""
-        return Base(self)
+        return import_context(__package__, ".base", "Base")(self)
 
     @cached_property
-    def localizations(self) -> Localizations:
+    def localizations(self) -> "Localizations":
         """"""
-        return Localizations(self)
+        return import_context(__package__, ".localizations", "Localizations")(self)
 
     @type_checker
     def fields(
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..item.details import Details as BaseDetails
-from .configuration import Configuration
+
+if TYPE_CHECKING:
+    from .configuration import Configuration
 
 __all__ = [
     "Details",
@@ -12,6 +16,6 @@ class Details(BaseDetails):
     """"""
 
     @cached_property
-    def configuration(self) -> Configuration:
+    def configuration(self) -> "Configuration":
         """"""
-        return Configuration(self)
+        return import_context(__package__, ".configuration", "Configuration")(self)
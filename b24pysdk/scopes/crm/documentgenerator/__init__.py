@@ -1,9 +1,13 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .document import Document
-from .numerator import Numerator
-from .template import Template
+
+if TYPE_CHECKING:
+    from .document import Document
+    from .numerator import Numerator
+    from .template import Template
 
 __all__ = [
     "Documentgenerator",
@@ -14,15 +18,15 @@ class Documentgenerator(BaseCRM):
     """"""
 
     @cached_property
-    def document(self) -> Document:
+    def document(self) -> "Document":
         """"""
-        return Document(self)
+        return import_context(__package__, ".document", "Document")(self)
 
     @cached_property
-    def numerator(self) -> Numerator:
+    def numerator(self) -> "Numerator":
         """"""
-        return Numerator(self)
+        return import_context(__package__, ".numerator", "Numerator")(self)
 
     @cached_property
-    def template(self) -> Template:
-        return Template(self)
+    def template(self) -> "Template":
+        return import_context(__package__, ".template", "Template")(self)
@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Annotated, Iterable, Literal, Optional, Text
+from typing import TYPE_CHECKING, Annotated, Iterable, Literal, Optional, Text
 
 from ....api.requests import BitrixAPIValueRequest
 from ....schemas.crm.duplicate import CRMDuplicateFindByComm, CRMDuplicateFindByCommData
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .volatile_type import VolatileType
+
+if TYPE_CHECKING:
+    from .volatile_type import VolatileType
 
 __all__ = [
     "Duplicate",
@@ -20,9 +23,9 @@ class Duplicate(BaseCRM):
     """
 
     @cached_property
-    def volatile_type(self) -> VolatileType:
+    def volatile_type(self) -> "VolatileType":
         """"""
-        return VolatileType(self)
+        return import_context(__package__, ".volatile_type", "VolatileType")(self)
 
     @type_checker
     def findbycomm(
@@ -1,4 +1,5 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from ....api.requests import BitrixAPIValueRequest, BitrixAPIValuesRequest
 from ....schemas.crm.enum import CRMEnumItem, CRMEnumItemsData, OrderOwnerType, OrderOwnerTypesData
@@ -6,7 +7,10 @@ from ....schemas.crm.field import CRMFieldsData, CRMFieldsDict
 from ....scopes.crm._base_crm import BaseCRM
 from ....utils.functional import type_checker
 from ....utils.types import Timeout
-from .settings import Settings
+from ..._base_context import import_context
+
+if TYPE_CHECKING:
+    from .settings import Settings
 
 __all__ = [
     "Enum",
@@ -20,9 +24,9 @@ class Enum(BaseCRM):
     """
 
     @cached_property
-    def settings(self) -> Settings:
+    def settings(self) -> "Settings":
         """"""
-        return Settings(self)
+        return import_context(__package__, ".settings", "Settings")(self)
 
     @type_checker
     def fields(
@@ -1,16 +1,20 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
+from ....api.bulk import BulkWriter
 from ....api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ....schemas.crm.field import CRMFieldsDict, CRMFieldsResultData
 from ....utils.converters import bool_to_bitrix
-from ....utils.functional import type_checker
+from ....utils.functional import sdk_helper, type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from .base_item import BaseItem
-from .delivery import Delivery
-from .details import Details
-from .payment import Payment
-from .productrow import Productrow
+
+if TYPE_CHECKING:
+    from .delivery import Delivery
+    from .details import Details
+    from .payment import Payment
+    from .productrow import Productrow
 
 __all__ = [
     "Item",
@@ -25,24 +29,24 @@ class Item(BaseItem):
     """
 
     @cached_property
-    def delivery(self) -> Delivery:
+    def delivery(self) -> "Delivery":
         """"""
-        return Delivery(self)
+        return import_context(__package__, ".delivery", "Delivery")(self)
 
     @cached_property
-    def details(self) -> Details:
+    def details(self) -> "Details":
         """"""
-        return Details(self)
+        return import_context(__package__, ".details", "Details")(self)
 
     @cached_property
-    def payment(self) -> Payment:
+    def payment(self) -> "Payment":
         """"""
-        return Payment(self)
+        return import_context(__package__, ".payment", "Payment")(self)
 
     @cached_property
-    def productrow(self) -> Productrow:
+    def productrow(self) -> "Productrow":
         """"""
-        return Productrow(self)
+        return import_context(__package__, ".productrow", "Productrow")(self)
 
     @type_checker
     def fields(
@@ -406,3 +410,53 @@ class Item(BaseItem):
             params=params,
             timeout=timeout,
         )
+
+    @sdk_helper
+    @type_checker
+    def bulk(
+            self,
+            entity_type_id: int,
+            *,
+            use_original_uf_names: Optional[bool] = None,
+            import_: bool = False,
+            max_concurrency: int = 1,
+            max_retries: int = 2,
+            timeout: Timeout = None,
+    ) -> BulkWriter:
+        """Create a bulk writer adding CRM items.
+
+        Rows passed to ``BulkWriter.write`` are written by crm.item.add commands (or crm.item.import commands with import_)
+        of batch requests, up to 50 rows per request and up to max_concurrency requests at the same time. Every row is a separate
+        command, so one record with the new ID or the error is yielded per row, and only rows failed with a transient error are retried.
+
+        Args:
+            entity_type_id: Identifier of the system or user-defined type whose items are written;
+
+            use_original_uf_names: This parameter controls the format of custom field names in the requests and responses;
+
+            import_: Whether rows are written with crm.item.import, which accepts system fields such as creation time and author;
+
+            max_concurrency: Maximum number of batch requests sent at the same time;
+
+            max_retries: Number of times a row failed with a transient error is written again;
+
+            timeout: Timeout in seconds.
+
+        Returns:
+            Instance of BulkWriter
+        """
+
+        params: JSONDict = {
+            "entityTypeId": entity_type_id,
+        }
+
+        if use_original_uf_names is not None:
+            params["useOriginalUfNames"] = bool_to_bitrix(use_original_uf_names, is_required=True)
+
+        return self._bulk(
+            self.import_ if import_ else self.add,
+            params=params,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            timeout=timeout,
+        )
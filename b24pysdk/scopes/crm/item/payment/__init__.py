@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import JSONDict, Timeout
+from ...._base_context import import_context
 from ..._base_crm import BaseCRM
-from .delivery import Delivery
-from .product import Product
+
+if TYPE_CHECKING:
+    from .delivery import Delivery
+    from .product import Product
 
 __all__ = [
     "Payment",
@@ -20,14 +23,14 @@ class Payment(BaseCRM):
     """
 
     @cached_property
-    def delivery(self) -> Delivery:
+    def delivery(self) -> "Delivery":
         """"""
-        return Delivery(self)
+        return import_context(__package__, ".delivery", "Delivery")(self)
 
     @cached_property
-    def product(self) -> Product:
+    def product(self) -> "Product":
         """"""
-        return Product(self)
+        return import_context(__package__, ".product", "Product")(self)
 
     @type_checker
     def add(
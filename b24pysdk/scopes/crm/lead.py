@@ -1,16 +1,20 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
+from ...api.bulk import BulkWriter
 from ...api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ...schemas.crm.field import CRMFieldsData, CRMFieldsDict
-from ...utils.functional import type_checker
+from ...utils.functional import sdk_helper, type_checker
 from ...utils.types import JSONDict, Timeout
-from ._productrows import Productrows
-from ._relationships import Contact
-from ._userfield import Userfield
-from .details import Details
+from .._base_context import import_context
 from .item.base_item import BaseItem
 
+if TYPE_CHECKING:
+    from ._productrows import Productrows
+    from ._relationships import Contact
+    from ._userfield import Userfield
+    from .details import Details
+
 __all__ = [
     "Lead",
 ]
@@ -24,24 +28,24 @@ class Lead(BaseItem):
     """
 
     @cached_property
-    def contact(self) -> Contact:
+    def contact(self) -> "Contact":
         """"""
-        return Contact(self)
+        return import_context(__package__, "._relationships", "Contact")(self)
 
     @cached_property
-    def details(self) -> Details:
+    def details(self) -> "Details":
         """"""
-        return Details(self)
+        return import_context(__package__, ".details", "Details")(self)
 
     @cached_property
-    def productrows(self) -> Productrows:
+    def productrows(self) -> "Productrows":
         """"""
-        return Productrows(self)
+        return import_context(__package__, "._productrows", "Productrows")(self)
 
     @cached_property
-    def userfield(self) -> Userfield:
+    def userfield(self) -> "Userfield":
         """"""
-        return Userfield(self)
+        return import_context(__package__, "._userfield", "Userfield")(self)
 
     @type_checker
     def fields(
@@ -105,6 +109,41 @@ class Lead(BaseItem):
             timeout=timeout,
         )
 
+    @sdk_helper
+    @type_checker
+    def bulk(
+            self,
+            *,
+            params: Optional[JSONDict] = None,
+            max_concurrency: int = 1,
+            max_retries: int = 2,
+            timeout: Timeout = None,
+    ) -> BulkWriter:
+        """Create a bulk writer adding leads.
+
+        Rows passed to ``BulkWriter.write`` are added by crm.lead.add commands of batch requests, up to 50 rows per request
+        and up to max_concurrency requests at the same time. One record with the new ID or the error is yielded per row.
+
+        Args:
+            params: Additional parameters sent with every row, e.g. {"REGISTER_SONET_EVENT": "N"};
+
+            max_concurrency: Maximum number of batch requests sent at the same time;
+
+            max_retries: Number of times a row failed with a transient error is added again;
+
+            timeout: Timeout in seconds.
+
+        Returns:
+            Instance of BulkWriter
+        """
+        return self._bulk(
+            self.add,
+            params=params and {"params": params},
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            timeout=timeout,
+        )
+
     @type_checker
     def get(
             self,
@@ -1,14 +1,17 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from ...api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ...schemas.crm.field import CRMFieldsData, CRMFieldsDict
 from ...utils.functional import type_checker
 from ...utils.types import JSONDict, Timeout
-from ._productrows import Productrows
-from ._userfield import Userfield
+from .._base_context import import_context
 from .item.base_item import BaseItem
 
+if TYPE_CHECKING:
+    from ._productrows import Productrows
+    from ._userfield import Userfield
+
 __all__ = [
     "Quote",
 ]
@@ -21,14 +24,14 @@ class Quote(BaseItem):
     """
 
     @cached_property
-    def productrows(self) -> Productrows:
+    def productrows(self) -> "Productrows":
         """"""
-        return Productrows(self)
+        return import_context(__package__, "._productrows", "Productrows")(self)
 
     @cached_property
-    def userfield(self) -> Userfield:
+    def userfield(self) -> "Userfield":
         """"""
-        return Userfield(self)
+        return import_context(__package__, "._userfield", "Userfield")(self)
 
     @type_checker
     def fields(
@@ -1,14 +1,17 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from ....api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ....schemas.crm.field import CRMFieldsData, CRMFieldsDict
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
-from .._userfield import Userfield
+from ..._base_context import import_context
 from ..item.base_item import BaseItem
-from ._details import Bankdetail, Preset
-from .link import Link
+
+if TYPE_CHECKING:
+    from .._userfield import Userfield
+    from ._details import Bankdetail, Preset
+    from .link import Link
 
 __all__ = [
     "Requisite",
@@ -24,24 +27,24 @@ class Requisite(BaseItem):
     """
 
     @cached_property
-    def bankdetail(self) -> Bankdetail:
+    def bankdetail(self) -> "Bankdetail":
         """"""
-        return Bankdetail(self)
+        return import_context(__package__, "._details", "Bankdetail")(self)
 
     @cached_property
-    def link(self) -> Link:
+    def link(self) -> "Link":
         """"""
-        return Link(self)
+        return import_context(__package__, ".link", "Link")(self)
 
     @cached_property
-    def preset(self) -> Preset:
+    def preset(self) -> "Preset":
         """"""
-        return Preset(self)
+        return import_context(__package__, "._details", "Preset")(self)
 
     @cached_property
-    def userfield(self) -> Userfield:
+    def userfield(self) -> "Userfield":
         """"""
-        return Userfield(self)
+        return import_context(__package__, ".._userfield", "Userfield")(self)
 
     @type_checker
     def fields(
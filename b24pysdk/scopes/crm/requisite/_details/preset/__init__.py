@@ -1,13 +1,16 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from ......api.requests import BitrixAPIRequest, BitrixAPIValueRequest, BitrixAPIValuesRequest
 from ......schemas.crm.field import CRMFieldsData, CRMFieldsDict
 from ......schemas.crm.requisite import RequisitePresetCountriesData, RequisitePresetCountry
 from ......utils.functional import type_checker
 from ......utils.types import JSONDict, Timeout
+from ....._base_context import import_context
 from ..base_detail import BaseDetail
-from .field import Field
+
+if TYPE_CHECKING:
+    from .field import Field
 
 __all__ = [
     "Preset",
@@ -21,9 +24,9 @@ class Preset(BaseDetail):
     """
 
     @cached_property
-    def field(self) -> Field:
+    def field(self) -> "Field":
         """"""
-        return Field(self)
+        return import_context(__package__, ".field", "Field")(self)
 
     @type_checker
     def fields(
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .mode import Mode
+
+if TYPE_CHECKING:
+    from .mode import Mode
 
 __all__ = [
     "Settings",
@@ -12,6 +16,6 @@ class Settings(BaseCRM):
     """"""
 
     @cached_property
-    def mode(self) -> Mode:
+    def mode(self) -> "Mode":
         """"""
-        return Mode(self)
+        return import_context(__package__, ".mode", "Mode")(self)
@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from ....api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ....schemas.crm.field import CRMFieldsData, CRMFieldsDict
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .entity import Entity
+
+if TYPE_CHECKING:
+    from .entity import Entity
 
 __all__ = [
     "Status",
@@ -20,9 +23,9 @@ class Status(BaseCRM):
     """
 
     @cached_property
-    def entity(self) -> Entity:
+    def entity(self) -> "Entity":
         """"""
-        return Entity(self)
+        return import_context(__package__, ".entity", "Entity")(self)
 
     @type_checker
     def fields(
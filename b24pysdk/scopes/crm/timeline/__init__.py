@@ -1,11 +1,15 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from ._images import Icon, Logo
-from .bindings import Bindings
-from .comment import Comment
-from .logmessage import Logmessage
-from .note import Note
+
+if TYPE_CHECKING:
+    from ._images import Icon, Logo
+    from .bindings import Bindings
+    from .comment import Comment
+    from .logmessage import Logmessage
+    from .note import Note
 
 __all__ = [
     "Timeline",
@@ -16,31 +20,31 @@ class Timeline(BaseCRM):
     """"""
 
     @cached_property
-    def bindings(self) -> Bindings:
+    def bindings(self) -> "Bindings":
         """"""
-        return Bindings(self)
+        return import_context(__package__, ".bindings", "Bindings")(self)
 
     @cached_property
-    def comment(self) -> Comment:
+    def comment(self) -> "Comment":
         """"""
-        return Comment(self)
+        return import_context(__package__, ".comment", "Comment")(self)
 
     @cached_property
-    def icon(self) -> Icon:
+    def icon(self) -> "Icon":
         """"""
-        return Icon(self)
+        return import_context(__package__, "._images", "Icon")(self)
 
     @cached_property
-    def logmessage(self) -> Logmessage:
+    def logmessage(self) -> "Logmessage":
         """"""
-        return Logmessage(self)
+        return import_context(__package__, ".logmessage", "Logmessage")(self)
 
     @cached_property
-    def logo(self) -> Logo:
+    def logo(self) -> "Logo":
         """"""
-        return Logo(self)
+        return import_context(__package__, "._images", "Logo")(self)
 
     @cached_property
-    def note(self) -> Note:
+    def note(self) -> "Note":
         """"""
-        return Note(self)
+        return import_context(__package__, ".note", "Note")(self)
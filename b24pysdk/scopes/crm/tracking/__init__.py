@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .trace import Trace
+
+if TYPE_CHECKING:
+    from .trace import Trace
 
 __all__ = [
     "Tracking",
@@ -12,6 +16,6 @@ class Tracking(BaseCRM):
     """"""
 
     @cached_property
-    def trace(self) -> Trace:
+    def trace(self) -> "Trace":
         """"""
-        return Trace(self)
+        return import_context(__package__, ".trace", "Trace")(self)
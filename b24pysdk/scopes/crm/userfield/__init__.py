@@ -1,13 +1,17 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from ....api.requests import BitrixAPIValueRequest, BitrixAPIValuesRequest
 from ....schemas.crm.field import CRMFieldsData, CRMFieldsDict
 from ....schemas.crm.userfield import CRMUserfieldType, CRMUserfieldTypesData
 from ....utils.functional import type_checker
 from ....utils.types import Timeout
+from ..._base_context import import_context
 from .._base_crm import BaseCRM
-from .enumeration import Enumeration
-from .settings import Settings
+
+if TYPE_CHECKING:
+    from .enumeration import Enumeration
+    from .settings import Settings
 
 __all__ = [
     "Userfield",
@@ -21,14 +25,14 @@ class Userfield(BaseCRM):
     """
 
     @cached_property
-    def enumeration(self) -> Enumeration:
+    def enumeration(self) -> "Enumeration":
         """"""
-        return Enumeration(self)
+        return import_context(__package__, ".enumeration", "Enumeration")(self)
 
     @cached_property
-    def settings(self) -> Settings:
+    def settings(self) -> "Settings":
         """"""
-        return Settings(self)
+        return import_context(__package__, ".settings", "Settings")(self)
 
     @type_checker
     def fields(
@@ -1,12 +1,16 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .attached_object import AttachedObject
-from .file import File
-from .folder import Folder
-from .rights import Rights
-from .storage import Storage
-from .version import Version
+
+if TYPE_CHECKING:
+    from .attached_object import AttachedObject
+    from .file import File
+    from .folder import Folder
+    from .rights import Rights
+    from .storage import Storage
+    from .version import Version
 
 __all__ = [
     "Disk",
@@ -17,31 +21,31 @@ class Disk(BaseScope):
     """"""
 
     @cached_property
-    def attached_object(self) -> AttachedObject:
+    def attached_object(self) -> "AttachedObject":
         """"""
-        return AttachedObject(self)
+        return import_context(__package__, ".attached_object", "AttachedObject")(self)
 
     @cached_property
-    def file(self) -> File:
+    def file(self) -> "File":
         """"""
-        return File(self)
+        return import_context(__package__, ".file", "File")(self)
 
     @cached_property
-    def folder(self) -> Folder:
+    def folder(self) -> "Folder":
         """"""
-        return Folder(self)
+        return import_context(__package__, ".folder", "Folder")(self)
 
     @cached_property
-    def rights(self) -> Rights:
+    def rights(self) -> "Rights":
         """"""
-        return Rights(self)
+        return import_context(__package__, ".rights", "Rights")(self)
 
     @cached_property
-    def storage(self) -> Storage:
+    def storage(self) -> "Storage":
         """"""
-        return Storage(self)
+        return import_context(__package__, ".storage", "Storage")(self)
 
     @cached_property
-    def version(self) -> Version:
+    def version(self) -> "Version":
         """"""
-        return Version(self)
+        return import_context(__package__, ".version", "Version")(self)
@@ -375,7 +375,7 @@ class File(BaseEntity):
     def uploadversion(
             self,
             bitrix_id: int,
-            file_content: Sequence[Text],
+            file_content: Optional[Sequence[Text]] = None,
             *,
             timeout: Timeout = None,
     ) -> BitrixAPIRequest:
@@ -387,7 +387,9 @@ class File(BaseEntity):
         Args:
             bitrix_id: The ID of the file to upload a new version for;
 
-            file_content: The content of the file to be uploaded;
+            file_content: The content of the file to be uploaded. If None,
+                Bitrix24 returns an upload URL instead, use as_upload() to stream
+                the file to it;
 
             timeout: Timeout for the request in seconds.
 
@@ -398,9 +400,11 @@ class File(BaseEntity):
 
         params = {
             "id": bitrix_id,
-            "fileContent": B24File(file_content).to_b24(),
         }
 
+        if file_content is not None:
+            params["fileContent"] = B24File(file_content).to_b24()
+
         return self._make_bitrix_api_request(
             api_wrapper=self.uploadversion,
             params=params,
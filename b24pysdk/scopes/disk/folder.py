@@ -387,7 +387,7 @@ class Folder(BaseEntity):
     def uploadfile(
             self,
             bitrix_id: int,
-            file_content: Sequence[Text],
+            file_content: Optional[Sequence[Text]],
             data: JSONDict,
             *,
             generate_unique_name: Optional[bool] = None,
@@ -403,7 +403,8 @@ class Folder(BaseEntity):
 
         Args:
             bitrix_id: The ID of the folder;
-            file_content: File content encoded in base64;
+            file_content: File content encoded in base64. If None, Bitrix24
+                returns an upload URL instead, use as_upload() to stream the file to it;
             data: Dictionary describing the file, requires NAME field;
             generate_unique_name: Whether to generate a unique name in case of conflicts;
             rights: Access rights for the file;
@@ -415,10 +416,12 @@ class Folder(BaseEntity):
 
         params = {
             "id": bitrix_id,
-            "fileContent": B24File(file_content).to_b24(),
             "data": data,
         }
 
+        if file_content is not None:
+            params["fileContent"] = B24File(file_content).to_b24()
+
         if generate_unique_name is not None:
             params["generateUniqueName"] = B24Bool(generate_unique_name).to_b24()
 
@@ -265,7 +265,7 @@ class Storage(BaseEntity):
     def uploadfile(
             self,
             bitrix_id: int,
-            file_content: Sequence[Text],
+            file_content: Optional[Sequence[Text]],
             data: JSONDict,
             *,
             generate_unique_name: Optional[bool] = None,
@@ -279,7 +279,8 @@ class Storage(BaseEntity):
 
         Args:
             bitrix_id: Identifier for the storage;
-            file_content: File content in bytes for the upload;
+            file_content: File content in bytes for the upload. If None, Bitrix24
+                returns an upload URL instead, use as_upload() to stream the file to it;
             data: Object format:
                 {
                     'NAME': 'File name'
@@ -294,10 +295,12 @@ class Storage(BaseEntity):
 
         params = {
             "id": bitrix_id,
-            "fileContent": B24File(file_content).to_b24(),
             "data": data,
         }
 
+        if file_content is not None:
+            params["fileContent"] = B24File(file_content).to_b24()
+
         if generate_unique_name is not None:
             params["generateUniqueName"] = B24Bool(generate_unique_name).to_b24()
 
@@ -1,11 +1,15 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .document import Document
-from .numerator import Numerator
-from .region import Region
-from .role import Role
-from .template import Template
+
+if TYPE_CHECKING:
+    from .document import Document
+    from .numerator import Numerator
+    from .region import Region
+    from .role import Role
+    from .template import Template
 
 __all__ = [
     "Documentgenerator",
@@ -16,26 +20,26 @@ class Documentgenerator(BaseScope):
     """"""
 
     @cached_property
-    def document(self) -> Document:
+    def document(self) -> "Document":
         """"""
-        return Document(self)
+        return import_context(__package__, ".document", "Document")(self)
 
     @cached_property
-    def numerator(self) -> Numerator:
+    def numerator(self) -> "Numerator":
         """"""
-        return Numerator(self)
+        return import_context(__package__, ".numerator", "Numerator")(self)
 
     @cached_property
-    def region(self) -> Region:
+    def region(self) -> "Region":
         """"""
-        return Region(self)
+        return import_context(__package__, ".region", "Region")(self)
 
     @cached_property
-    def role(self) -> Role:
+    def role(self) -> "Role":
         """"""
-        return Role(self)
+        return import_context(__package__, ".role", "Role")(self)
 
     @cached_property
-    def template(self) -> Template:
+    def template(self) -> "Template":
         """"""
-        return Template(self)
+        return import_context(__package__, ".template", "Template")(self)
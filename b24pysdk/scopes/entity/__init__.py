@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Optional, Text
+from typing import TYPE_CHECKING, Optional, Text
 
 from ...api.requests import BitrixAPIRequest
 from ...utils.functional import type_checker
 from ...utils.types import JSONDict, Timeout
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .item import Item
-from .section import Section
+
+if TYPE_CHECKING:
+    from .item import Item
+    from .section import Section
 
 __all__ = [
     "Entity",
@@ -17,14 +20,14 @@ class Entity(BaseScope):
     """"""
 
     @cached_property
-    def section(self) -> Section:
+    def section(self) -> "Section":
         """"""
-        return Section(self)
+        return import_context(__package__, ".section", "Section")(self)
 
     @cached_property
-    def item(self) -> Item:
+    def item(self) -> "Item":
         """"""
-        return Item(self)
+        return import_context(__package__, ".item", "Item")(self)
 
     @type_checker
     def add(
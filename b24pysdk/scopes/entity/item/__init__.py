@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Optional, Text, Union
+from typing import TYPE_CHECKING, Optional, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import B24BoolStrict, JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .property import Property
+
+if TYPE_CHECKING:
+    from .property import Property
 
 __all__ = [
     "Item",
@@ -16,9 +19,9 @@ class Item(BaseEntity):
     """"""
 
     @cached_property
-    def property(self) -> Property:
+    def property(self) -> "Property":
         """"""
-        return Property(self)
+        return import_context(__package__, ".property", "Property")(self)
 
     @type_checker
     def get(
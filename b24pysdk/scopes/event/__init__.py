@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Annotated, Literal, Optional, Text
+from typing import TYPE_CHECKING, Annotated, Literal, Optional, Text
 
 from ...api.requests import BitrixAPIRequest, BitrixAPIValueRequest
 from ...schemas.results import CountResultData
 from ...utils.functional import type_checker
 from ...utils.types import JSONDict, Timeout
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .offline import Offline
+
+if TYPE_CHECKING:
+    from .offline import Offline
 
 __all__ = [
     "Event",
@@ -17,9 +20,9 @@ class Event(BaseScope):
     """"""
 
     @cached_property
-    def offline(self) -> Offline:
+    def offline(self) -> "Offline":
         """"""
-        return Offline(self)
+        return import_context(__package__, ".offline", "Offline")(self)
 
     @type_checker
     def bind(
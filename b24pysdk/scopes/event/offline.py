@@ -1,8 +1,10 @@
 from typing import Iterable, Optional, Text
 
+from ...api.offline_events import BaseOfflineCheckpointStore, OfflineEventConsumer
+from ...api.offline_events.offline_event_consumer import OfflineEventHandler
 from ...api.requests import BitrixAPIRequest
-from ...utils.functional import type_checker
-from ...utils.types import JSONDict, Timeout
+from ...utils.functional import sdk_helper, type_checker
+from ...utils.types import JSONDict, Number, Timeout
 from .._base_entity import BaseEntity
 
 __all__ = [
@@ -57,6 +59,60 @@ class Offline(BaseEntity):
             timeout=timeout,
         )
 
+    @sdk_helper
+    def consumer(
+            self,
+            handler: OfflineEventHandler,
+            *,
+            checkpoint_store: Optional[BaseOfflineCheckpointStore] = None,
+            checkpoint_key: Optional[Text] = None,
+            filter: Optional[JSONDict] = None,
+            auth_connector: Optional[Text] = None,
+            limit: int = OfflineEventConsumer.DEFAULT_LIMIT,
+            max_concurrency: int = 1,
+            idle_delay: Number = 1,
+            timeout: Timeout = None,
+    ) -> OfflineEventConsumer:
+        """Create a consumer draining the offline event queue.
+
+        Events are taken by event.offline.get with a process identifier, passed to handler, up to max_concurrency at the same time,
+        and acknowledged by event.offline.clear, or by event.offline.error when handler raised an error. Delivery is at least once.
+
+        Args:
+            handler: Callable receiving every event;
+
+            checkpoint_store: Store keeping the process identifier and the events waiting for acknowledgement between restarts;
+
+            checkpoint_key: Key of the consumer in checkpoint_store, defaults to the portal domain;
+
+            filter: Filter of event.offline.get;
+
+            auth_connector: Connector key whose events are skipped;
+
+            limit: Number of events requested by a poll when there is no backlog;
+
+            max_concurrency: Maximum number of events handled at the same time;
+
+            idle_delay: Seconds to wait before polling an empty queue again;
+
+            timeout: Timeout in seconds.
+
+        Returns:
+            Instance of OfflineEventConsumer
+        """
+        return OfflineEventConsumer(
+            self._bitrix_token,
+            handler,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+            filter=filter,
+            auth_connector=auth_connector,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            idle_delay=idle_delay,
+            timeout=timeout or self._kwargs.get("timeout"),
+        )
+
     @type_checker
     def list(
             self,
@@ -1,17 +1,21 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .chat import Chat
-from .counters import Counters
-from .department import Department
-from .dialog import Dialog
-from .disk import Disk
-from .message import Message
-from .notify import Notify
-from .recent import Recent
-from .revision import Revision
-from .search import Search
-from .user import User
+
+if TYPE_CHECKING:
+    from .chat import Chat
+    from .counters import Counters
+    from .department import Department
+    from .dialog import Dialog
+    from .disk import Disk
+    from .message import Message
+    from .notify import Notify
+    from .recent import Recent
+    from .revision import Revision
+    from .search import Search
+    from .user import User
 
 __all__ = [
     "Im",
@@ -22,56 +26,56 @@ class Im(BaseScope):
     """"""
 
     @cached_property
-    def chat(self) -> Chat:
+    def chat(self) -> "Chat":
         """"""
-        return Chat(self)
+        return import_context(__package__, ".chat", "Chat")(self)
 
     @cached_property
-    def counters(self) -> Counters:
+    def counters(self) -> "Counters":
         """"""
-        return Counters(self)
+        return import_context(__package__, ".counters", "Counters")(self)
 
     @cached_property
-    def department(self) -> Department:
+    def department(self) -> "Department":
         """"""
-        return Department(self)
+        return import_context(__package__, ".department", "Department")(self)
 
     @cached_property
-    def dialog(self) -> Dialog:
+    def dialog(self) -> "Dialog":
         """"""
-        return Dialog(self)
+        return import_context(__package__, ".dialog", "Dialog")(self)
 
     @cached_property
-    def disk(self) -> Disk:
+    def disk(self) -> "Disk":
         """"""
-        return Disk(self)
+        return import_context(__package__, ".disk", "Disk")(self)
 
     @cached_property
-    def message(self) -> Message:
+    def message(self) -> "Message":
         """"""
-        return Message(self)
+        return import_context(__package__, ".message", "Message")(self)
 
     @cached_property
-    def revision(self) -> Revision:
+    def revision(self) -> "Revision":
         """"""
-        return Revision(self)
+        return import_context(__package__, ".revision", "Revision")(self)
 
     @cached_property
-    def notify(self) -> Notify:
+    def notify(self) -> "Notify":
         """"""
-        return Notify(self)
+        return import_context(__package__, ".notify", "Notify")(self)
 
     @cached_property
-    def recent(self) -> Recent:
+    def recent(self) -> "Recent":
         """"""
-        return Recent(self)
+        return import_context(__package__, ".recent", "Recent")(self)
 
     @cached_property
-    def search(self) -> Search:
+    def search(self) -> "Search":
         """"""
-        return Search(self)
+        return import_context(__package__, ".search", "Search")(self)
 
     @cached_property
-    def user(self) -> User:
+    def user(self) -> "User":
         """"""
-        return User(self)
+        return import_context(__package__, ".user", "User")(self)
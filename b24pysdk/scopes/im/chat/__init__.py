@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import B24BoolStrict, JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .user import User
+
+if TYPE_CHECKING:
+    from .user import User
 
 __all__ = [
     "Chat",
@@ -16,9 +19,9 @@ class Chat(BaseEntity):
     """"""
 
     @cached_property
-    def user(self) -> User:
+    def user(self) -> "User":
         """"""
-        return User(self)
+        return import_context(__package__, ".user", "User")(self)
 
     @type_checker
     def add(  # noqa: C901
@@ -1,13 +1,16 @@
 from functools import cached_property
-from typing import Iterable, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import B24BoolStrict, JSONList, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .colleagues import Colleagues
-from .employees import Employees
-from .managers import Managers
+
+if TYPE_CHECKING:
+    from .colleagues import Colleagues
+    from .employees import Employees
+    from .managers import Managers
 
 __all__ = [
     "Department",
@@ -18,19 +21,19 @@ class Department(BaseEntity):
     """"""
 
     @cached_property
-    def colleagues(self) -> Colleagues:
+    def colleagues(self) -> "Colleagues":
         """"""
-        return Colleagues(self)
+        return import_context(__package__, ".colleagues", "Colleagues")(self)
 
     @cached_property
-    def employees(self) -> Employees:
+    def employees(self) -> "Employees":
         """"""
-        return Employees(self)
+        return import_context(__package__, ".employees", "Employees")(self)
 
     @cached_property
-    def managers(self) -> Managers:
+    def managers(self) -> "Managers":
         """"""
-        return Managers(self)
+        return import_context(__package__, ".managers", "Managers")(self)
 
     @type_checker
     def get(
@@ -1,13 +1,16 @@
 from functools import cached_property
-from typing import Text, Union
+from typing import TYPE_CHECKING, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .messages import Messages
-from .read import Read
-from .users import Users
+
+if TYPE_CHECKING:
+    from .messages import Messages
+    from .read import Read
+    from .users import Users
 
 __all__ = [
     "Dialog",
@@ -18,19 +21,19 @@ class Dialog(BaseEntity):
     """"""
 
     @cached_property
-    def messages(self) -> Messages:
+    def messages(self) -> "Messages":
         """"""
-        return Messages(self)
+        return import_context(__package__, ".messages", "Messages")(self)
 
     @cached_property
-    def read(self) -> Read:
+    def read(self) -> "Read":
         """"""
-        return Read(self)
+        return import_context(__package__, ".read", "Read")(self)
 
     @cached_property
-    def users(self) -> Users:
+    def users(self) -> "Users":
         """"""
-        return Users(self)
+        return import_context(__package__, ".users", "Users")(self)
 
     @type_checker
     def get(
@@ -1,8 +1,12 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .file import File
-from .folder import Folder
+
+if TYPE_CHECKING:
+    from .file import File
+    from .folder import Folder
 
 __all__ = [
     "Disk",
@@ -13,11 +17,11 @@ class Disk(BaseEntity):
     """"""
 
     @cached_property
-    def file(self) -> File:
+    def file(self) -> "File":
         """"""
-        return File(self)
+        return import_context(__package__, ".file", "File")(self)
 
     @cached_property
-    def folder(self) -> Folder:
+    def folder(self) -> "Folder":
         """"""
-        return Folder(self)
+        return import_context(__package__, ".folder", "Folder")(self)
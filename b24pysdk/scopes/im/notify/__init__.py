@@ -1,15 +1,18 @@
 from functools import cached_property
-from typing import Annotated, Literal, Optional, Text, Union
+from typing import TYPE_CHECKING, Annotated, Literal, Optional, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import B24BoolStrict, JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .history import History
-from .personal import Personal
-from .read import Read
-from .schema import Schema
-from .system import System
+
+if TYPE_CHECKING:
+    from .history import History
+    from .personal import Personal
+    from .read import Read
+    from .schema import Schema
+    from .system import System
 
 __all__ = [
     "Notify",
@@ -20,29 +23,29 @@ class Notify(BaseEntity):
     """"""
 
     @cached_property
-    def personal(self) -> Personal:
+    def personal(self) -> "Personal":
         """"""
-        return Personal(self)
+        return import_context(__package__, ".personal", "Personal")(self)
 
     @cached_property
-    def history(self) -> History:
+    def history(self) -> "History":
         """"""
-        return History(self)
+        return import_context(__package__, ".history", "History")(self)
 
     @cached_property
-    def read(self) -> Read:
+    def read(self) -> "Read":
         """"""
-        return Read(self)
+        return import_context(__package__, ".read", "Read")(self)
 
     @cached_property
-    def schema(self) -> Schema:
+    def schema(self) -> "Schema":
         """"""
-        return Schema(self)
+        return import_context(__package__, ".schema", "Schema")(self)
 
     @cached_property
-    def system(self) -> System:
+    def system(self) -> "System":
         """"""
-        return System(self)
+        return import_context(__package__, ".system", "System")(self)
 
     @type_checker
     def __call__(
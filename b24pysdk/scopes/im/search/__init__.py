@@ -1,10 +1,14 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .chat import Chat
-from .department import Department
-from .last import Last
-from .user import User
+
+if TYPE_CHECKING:
+    from .chat import Chat
+    from .department import Department
+    from .last import Last
+    from .user import User
 
 __all__ = [
     "Search",
@@ -15,21 +19,21 @@ class Search(BaseEntity):
     """"""
 
     @cached_property
-    def chat(self) -> Chat:
+    def chat(self) -> "Chat":
         """"""
-        return Chat(self)
+        return import_context(__package__, ".chat", "Chat")(self)
 
     @cached_property
-    def department(self) -> Department:
+    def department(self) -> "Department":
         """"""
-        return Department(self)
+        return import_context(__package__, ".department", "Department")(self)
 
     @cached_property
-    def last(self) -> Last:
+    def last(self) -> "Last":
         """"""
-        return Last(self)
+        return import_context(__package__, ".last", "Last")(self)
 
     @cached_property
-    def user(self) -> User:
+    def user(self) -> "User":
         """"""
-        return User(self)
+        return import_context(__package__, ".user", "User")(self)
@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Optional, Text, Union
+from typing import TYPE_CHECKING, Optional, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import B24BoolStrict, JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .list import List
-from .status import Status
+
+if TYPE_CHECKING:
+    from .list import List
+    from .status import Status
 
 __all__ = [
     "User",
@@ -17,14 +20,14 @@ class User(BaseEntity):
     """"""
 
     @cached_property
-    def list(self) -> List:
+    def list(self) -> "List":
         """"""
-        return List(self)
+        return import_context(__package__, ".list", "List")(self)
 
     @cached_property
-    def status(self) -> Status:
+    def status(self) -> "Status":
         """"""
-        return Status(self)
+        return import_context(__package__, ".status", "Status")(self)
 
     @type_checker
     def get(
@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Text, Union
+from typing import TYPE_CHECKING, Text, Union
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .idle import Idle
+
+if TYPE_CHECKING:
+    from .idle import Idle
 
 __all__ = [
     "Status",
@@ -16,9 +19,9 @@ class Status(BaseEntity):
     """"""
 
     @cached_property
-    def idle(self) -> Idle:
+    def idle(self) -> "Idle":
         """"""
-        return Idle(self)
+        return import_context(__package__, ".idle", "Idle")(self)
 
     @type_checker
     def get(
@@ -1,15 +1,18 @@
 from functools import cached_property
-from typing import Annotated, Literal, Optional, Text, Union
+from typing import TYPE_CHECKING, Annotated, Literal, Optional, Text, Union
 
 from ...api.requests import BitrixAPIRequest
 from ...utils.functional import type_checker
 from ...utils.types import B24BoolStrict, JSONDict, Timeout
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .bot import Bot
-from .chat import Chat
-from .command import Command
-from .dialog import Dialog
-from .message import Message
+
+if TYPE_CHECKING:
+    from .bot import Bot
+    from .chat import Chat
+    from .command import Command
+    from .dialog import Dialog
+    from .message import Message
 
 __all__ = [
     "Imbot",
@@ -20,29 +23,29 @@ class Imbot(BaseScope):
     """"""
 
     @cached_property
-    def bot(self) -> Bot:
+    def bot(self) -> "Bot":
         """"""
-        return Bot(self)
+        return import_context(__package__, ".bot", "Bot")(self)
 
     @cached_property
-    def chat(self) -> Chat:
+    def chat(self) -> "Chat":
         """"""
-        return Chat(self)
+        return import_context(__package__, ".chat", "Chat")(self)
 
     @cached_property
-    def command(self) -> Command:
+    def command(self) -> "Command":
         """"""
-        return Command(self)
+        return import_context(__package__, ".command", "Command")(self)
 
     @cached_property
-    def dialog(self) -> Dialog:
+    def dialog(self) -> "Dialog":
         """"""
-        return Dialog(self)
+        return import_context(__package__, ".dialog", "Dialog")(self)
 
     @cached_property
-    def message(self) -> Message:
+    def message(self) -> "Message":
         """"""
-        return Message(self)
+        return import_context(__package__, ".message", "Message")(self)
 
     @type_checker
     def register(
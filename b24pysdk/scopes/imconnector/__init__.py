@@ -1,15 +1,18 @@
 from functools import cached_property
-from typing import Optional, Text, Union
+from typing import TYPE_CHECKING, Optional, Text, Union
 
 from ...api.requests import BitrixAPIRequest
 from ...utils.functional import type_checker
 from ...utils.types import B24BoolStrict, JSONDict, Timeout
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .chat import Chat
-from .connector import Connector
-from .delete import Delete
-from .send import Send
-from .update import Update
+
+if TYPE_CHECKING:
+    from .chat import Chat
+    from .connector import Connector
+    from .delete import Delete
+    from .send import Send
+    from .update import Update
 
 __all__ = [
     "Imconnector",
@@ -20,29 +23,29 @@ class Imconnector(BaseScope):
     """"""
 
     @cached_property
-    def chat(self) -> Chat:
+    def chat(self) -> "Chat":
         """"""
-        return Chat(self)
+        return import_context(__package__, ".chat", "Chat")(self)
 
     @cached_property
-    def connector(self) -> Connector:
+    def connector(self) -> "Connector":
         """"""
-        return Connector(self)
+        return import_context(__package__, ".connector", "Connector")(self)
 
     @cached_property
-    def delete(self) -> Delete:
+    def delete(self) -> "Delete":
         """"""
-        return Delete(self)
+        return import_context(__package__, ".delete", "Delete")(self)
 
     @cached_property
-    def send(self) -> Send:
+    def send(self) -> "Send":
         """"""
-        return Send(self)
+        return import_context(__package__, ".send", "Send")(self)
 
     @cached_property
-    def update(self) -> Update:
+    def update(self) -> "Update":
         """"""
-        return Update(self)
+        return import_context(__package__, ".update", "Update")(self)
 
     @type_checker
     def activate(
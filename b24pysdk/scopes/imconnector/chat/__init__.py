@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .name import Name
+
+if TYPE_CHECKING:
+    from .name import Name
 
 __all__ = [
     "Chat",
@@ -12,6 +16,6 @@ class Chat(BaseEntity):
     """"""
 
     @cached_property
-    def name(self) -> Name:
+    def name(self) -> "Name":
         """"""
-        return Name(self)
+        return import_context(__package__, ".name", "Name")(self)
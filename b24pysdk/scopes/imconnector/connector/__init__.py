@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .data import Data
+
+if TYPE_CHECKING:
+    from .data import Data
 
 __all__ = [
     "Connector",
@@ -12,6 +16,6 @@ class Connector(BaseEntity):
     """"""
 
     @cached_property
-    def data(self) -> Data:
+    def data(self) -> "Data":
         """"""
-        return Data(self)
+        return import_context(__package__, ".data", "Data")(self)
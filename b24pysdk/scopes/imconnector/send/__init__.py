@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Iterable, Text, Union
+from typing import TYPE_CHECKING, Iterable, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .status import Status
+
+if TYPE_CHECKING:
+    from .status import Status
 
 __all__ = [
     "Send",
@@ -16,9 +19,9 @@ class Send(BaseEntity):
     """"""
 
     @cached_property
-    def status(self) -> Status:
+    def status(self) -> "Status":
         """"""
-        return Status(self)
+        return import_context(__package__, ".status", "Status")(self)
 
     @type_checker
     def messages(
@@ -1,15 +1,19 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .bot import Bot
-from .config import Config
-from .crm import Crm
-from .dialog import Dialog
-from .message import Message
-from .network import Network
-from .operator import Operator
-from .revision import Revision
-from .session import Session
+
+if TYPE_CHECKING:
+    from .bot import Bot
+    from .config import Config
+    from .crm import Crm
+    from .dialog import Dialog
+    from .message import Message
+    from .network import Network
+    from .operator import Operator
+    from .revision import Revision
+    from .session import Session
 
 __all__ = [
     "Imopenlines",
@@ -20,46 +24,46 @@ class Imopenlines(BaseScope):
     """"""
 
     @cached_property
-    def bot(self) -> Bot:
+    def bot(self) -> "Bot":
         """"""
-        return Bot(self)
+        return import_context(__package__, ".bot", "Bot")(self)
 
     @cached_property
-    def config(self) -> Config:
+    def config(self) -> "Config":
         """"""
-        return Config(self)
+        return import_context(__package__, ".config", "Config")(self)
 
     @cached_property
-    def crm(self) -> Crm:
+    def crm(self) -> "Crm":
         """"""
-        return Crm(self)
+        return import_context(__package__, ".crm", "Crm")(self)
 
     @cached_property
-    def dialog(self) -> Dialog:
+    def dialog(self) -> "Dialog":
         """"""
-        return Dialog(self)
+        return import_context(__package__, ".dialog", "Dialog")(self)
 
     @cached_property
-    def message(self) -> Message:
+    def message(self) -> "Message":
         """"""
-        return Message(self)
+        return import_context(__package__, ".message", "Message")(self)
 
     @cached_property
-    def network(self) -> Network:
+    def network(self) -> "Network":
         """"""
-        return Network(self)
+        return import_context(__package__, ".network", "Network")(self)
 
     @cached_property
-    def operator(self) -> Operator:
+    def operator(self) -> "Operator":
         """"""
-        return Operator(self)
+        return import_context(__package__, ".operator", "Operator")(self)
 
     @cached_property
-    def revision(self) -> Revision:
+    def revision(self) -> "Revision":
         """"""
-        return Revision(self)
+        return import_context(__package__, ".revision", "Revision")(self)
 
     @cached_property
-    def session(self) -> Session:
+    def session(self) -> "Session":
         """"""
-        return Session(self)
+        return import_context(__package__, ".session", "Session")(self)
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .session import Session
+
+if TYPE_CHECKING:
+    from .session import Session
 
 __all__ = [
     "Bot",
@@ -12,6 +16,6 @@ class Bot(BaseEntity):
     """"""
 
     @cached_property
-    def session(self) -> Session:
+    def session(self) -> "Session":
         """"""
-        return Session(self)
+        return import_context(__package__, ".session", "Session")(self)
@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Optional, Text, Union
+from typing import TYPE_CHECKING, Optional, Text, Union
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import B24BoolStrict, Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .message import Message
+
+if TYPE_CHECKING:
+    from .message import Message
 
 __all__ = [
     "Session",
@@ -16,9 +19,9 @@ class Session(BaseEntity):
     """"""
 
     @cached_property
-    def message(self) -> Message:
+    def message(self) -> "Message":
         """"""
-        return Message(self)
+        return import_context(__package__, ".message", "Message")(self)
 
     @type_checker
     def finish(
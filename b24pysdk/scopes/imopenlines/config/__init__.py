@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Optional, Text, Union
+from typing import TYPE_CHECKING, Optional, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import B24BoolStrict, JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .list import List
-from .path import Path
+
+if TYPE_CHECKING:
+    from .list import List
+    from .path import Path
 
 __all__ = [
     "Config",
@@ -17,14 +20,14 @@ class Config(BaseEntity):
     """"""
 
     @cached_property
-    def list(self) -> List:
+    def list(self) -> "List":
         """"""
-        return List(self)
+        return import_context(__package__, ".list", "List")(self)
 
     @cached_property
-    def path(self) -> Path:
+    def path(self) -> "Path":
         """"""
-        return Path(self)
+        return import_context(__package__, ".path", "Path")(self)
 
     @type_checker
     def add(
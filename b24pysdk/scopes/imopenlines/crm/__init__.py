@@ -1,9 +1,13 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .chat import Chat
-from .lead import Lead
-from .message import Message
+
+if TYPE_CHECKING:
+    from .chat import Chat
+    from .lead import Lead
+    from .message import Message
 
 __all__ = [
     "Crm",
@@ -14,16 +18,16 @@ class Crm(BaseEntity):
     """"""
 
     @cached_property
-    def chat(self) -> Chat:
+    def chat(self) -> "Chat":
         """"""
-        return Chat(self)
+        return import_context(__package__, ".chat", "Chat")(self)
 
     @cached_property
-    def lead(self) -> Lead:
+    def lead(self) -> "Lead":
         """"""
-        return Lead(self)
+        return import_context(__package__, ".lead", "Lead")(self)
 
     @cached_property
-    def message(self) -> Message:
+    def message(self) -> "Message":
         """"""
-        return Message(self)
+        return import_context(__package__, ".message", "Message")(self)
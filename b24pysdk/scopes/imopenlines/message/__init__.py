@@ -1,8 +1,12 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .quick import Quick
-from .session import Session
+
+if TYPE_CHECKING:
+    from .quick import Quick
+    from .session import Session
 
 __all__ = [
     "Message",
@@ -13,11 +17,11 @@ class Message(BaseEntity):
     """"""
 
     @cached_property
-    def quick(self) -> Quick:
+    def quick(self) -> "Quick":
         """"""
-        return Quick(self)
+        return import_context(__package__, ".quick", "Quick")(self)
 
     @cached_property
-    def session(self) -> Session:
+    def session(self) -> "Session":
         """"""
-        return Session(self)
+        return import_context(__package__, ".session", "Session")(self)
@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Text
+from typing import TYPE_CHECKING, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .message import Message
+
+if TYPE_CHECKING:
+    from .message import Message
 
 __all__ = [
     "Network",
@@ -16,9 +19,9 @@ class Network(BaseEntity):
     """"""
 
     @cached_property
-    def message(self) -> Message:
+    def message(self) -> "Message":
         """"""
-        return Message(self)
+        return import_context(__package__, ".message", "Message")(self)
 
     @type_checker
     def join(
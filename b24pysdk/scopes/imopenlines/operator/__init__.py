@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Text, Union
+from typing import TYPE_CHECKING, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .another import Another
+
+if TYPE_CHECKING:
+    from .another import Another
 
 __all__ = [
     "Operator",
@@ -16,9 +19,9 @@ class Operator(BaseEntity):
     """"""
 
     @cached_property
-    def another(self) -> Another:
+    def another(self) -> "Another":
         """"""
-        return Another(self)
+        return import_context(__package__, ".another", "Another")(self)
 
     @type_checker
     def answer(
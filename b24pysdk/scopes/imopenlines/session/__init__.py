@@ -1,13 +1,16 @@
 from functools import cached_property
-from typing import Text, Union
+from typing import TYPE_CHECKING, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .head import Head
-from .history import History
-from .mode import Mode
+
+if TYPE_CHECKING:
+    from .head import Head
+    from .history import History
+    from .mode import Mode
 
 __all__ = [
     "Session",
@@ -18,19 +21,19 @@ class Session(BaseEntity):
     """"""
 
     @cached_property
-    def head(self) -> Head:
+    def head(self) -> "Head":
         """"""
-        return Head(self)
+        return import_context(__package__, ".head", "Head")(self)
 
     @cached_property
-    def history(self) -> History:
+    def history(self) -> "History":
         """"""
-        return History(self)
+        return import_context(__package__, ".history", "History")(self)
 
     @cached_property
-    def mode(self) -> Mode:
+    def mode(self) -> "Mode":
         """"""
-        return Mode(self)
+        return import_context(__package__, ".mode", "Mode")(self)
 
     @type_checker
     def intercept(
@@ -1,15 +1,19 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .block import Block
-from .demos import Demos
 from .landing import Landing as LandingEntity
-from .repo import Repo
-from .repowidget import RepoWidget
-from .role import Role
-from .site import Site
-from .syspage import SysPage
-from .template import Template
+
+if TYPE_CHECKING:
+    from .block import Block
+    from .demos import Demos
+    from .repo import Repo
+    from .repowidget import RepoWidget
+    from .role import Role
+    from .site import Site
+    from .syspage import SysPage
+    from .template import Template
 
 __all__ = [
     "Landing",
@@ -20,9 +24,9 @@ class Landing(BaseScope):
     """"""
 
     @cached_property
-    def block(self) -> Block:
+    def block(self) -> "Block":
         """"""
-        return Block(self)
+        return import_context(__package__, ".block", "Block")(self)
 
     @cached_property
     def landing(self) -> LandingEntity:
@@ -30,36 +34,36 @@ class Landing(BaseScope):
         return LandingEntity(self)
 
     @cached_property
-    def site(self) -> Site:
+    def site(self) -> "Site":
         """"""
-        return Site(self)
+        return import_context(__package__, ".site", "Site")(self)
 
     @cached_property
-    def role(self) -> Role:
+    def role(self) -> "Role":
         """"""
-        return Role(self)
+        return import_context(__package__, ".role", "Role")(self)
 
     @cached_property
-    def repo(self) -> Repo:
+    def repo(self) -> "Repo":
         """"""
-        return Repo(self)
+        return import_context(__package__, ".repo", "Repo")(self)
 
     @cached_property
-    def template(self) -> Template:
+    def template(self) -> "Template":
         """"""
-        return Template(self)
+        return import_context(__package__, ".template", "Template")(self)
 
     @cached_property
-    def syspage(self) -> SysPage:
+    def syspage(self) -> "SysPage":
         """"""
-        return SysPage(self)
+        return import_context(__package__, ".syspage", "SysPage")(self)
 
     @cached_property
-    def demos(self) -> Demos:
+    def demos(self) -> "Demos":
         """"""
-        return Demos(self)
+        return import_context(__package__, ".demos", "Demos")(self)
 
     @cached_property
-    def repowidget(self) -> RepoWidget:
+    def repowidget(self) -> "RepoWidget":
         """"""
-        return RepoWidget(self)
+        return import_context(__package__, ".repowidget", "RepoWidget")(self)
@@ -1,14 +1,17 @@
 from functools import cached_property
-from typing import Optional, Text
+from typing import TYPE_CHECKING, Optional, Text
 
 from ...api.requests import BitrixAPIRequest
 from ...utils.functional import type_checker
 from ...utils.types import JSONDict, Timeout
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .element import Element
-from .field import Field
-from .get import Get
-from .section import Section
+
+if TYPE_CHECKING:
+    from .element import Element
+    from .field import Field
+    from .get import Get
+    from .section import Section
 
 __all__ = [
     "Lists",
@@ -19,24 +22,24 @@ class Lists(BaseScope):
     """"""
 
     @cached_property
-    def element(self) -> Element:
+    def element(self) -> "Element":
         """"""
-        return Element(self)
+        return import_context(__package__, ".element", "Element")(self)
 
     @cached_property
-    def field(self) -> Field:
+    def field(self) -> "Field":
         """"""
-        return Field(self)
+        return import_context(__package__, ".field", "Field")(self)
 
     @cached_property
-    def get(self) -> Get:
+    def get(self) -> "Get":
         """"""
-        return Get(self)
+        return import_context(__package__, ".get", "Get")(self)
 
     @cached_property
-    def section(self) -> Section:
+    def section(self) -> "Section":
         """"""
-        return Section(self)
+        return import_context(__package__, ".section", "Section")(self)
 
     @type_checker
     def add(
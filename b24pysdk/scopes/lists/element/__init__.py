@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Optional, Text
+from typing import TYPE_CHECKING, Optional, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .get import Get
+
+if TYPE_CHECKING:
+    from .get import Get
 
 __all__ = [
     "Element",
@@ -16,9 +19,9 @@ class Element(BaseEntity):
     """"""
 
     @cached_property
-    def get(self) -> Get:
+    def get(self) -> "Get":
         """"""
-        return Get(self)
+        return import_context(__package__, ".get", "Get")(self)
 
 
     @type_checker
@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import JSONDict, Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .file import File
+
+if TYPE_CHECKING:
+    from .file import File
 
 __all__ = [
     "Get",
@@ -16,9 +19,9 @@ class Get(BaseEntity):
     """"""
 
     @cached_property
-    def file(self) -> File:
+    def file(self) -> "File":
         """"""
-        return File(self)
+        return import_context(__package__, ".file", "File")(self)
 
     @type_checker
     def __call__(
@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Optional, Text
+from typing import TYPE_CHECKING, Optional, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .type import Type
+
+if TYPE_CHECKING:
+    from .type import Type
 
 __all__ = [
     "Field",
@@ -16,9 +19,9 @@ class Field(BaseEntity):
     """"""
 
     @cached_property
-    def type(self) -> Type:
+    def type(self) -> "Type":
         """"""
-        return Type(self)
+        return import_context(__package__, ".type", "Type")(self)
 
     @type_checker
     def add(
@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Optional, Text
+from typing import TYPE_CHECKING, Optional, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .iblock import Iblock
+
+if TYPE_CHECKING:
+    from .iblock import Iblock
 
 __all__ = [
     "Get",
@@ -16,9 +19,9 @@ class Get(BaseEntity):
     """"""
 
     @cached_property
-    def iblock(self) -> Iblock:
+    def iblock(self) -> "Iblock":
         """"""
-        return Iblock(self)
+        return import_context(__package__, ".iblock", "Iblock")(self)
 
     @type_checker
     def __call__(
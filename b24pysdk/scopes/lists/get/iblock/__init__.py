@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .type import Type
+
+if TYPE_CHECKING:
+    from .type import Type
 
 __all__ = [
     "Iblock",
@@ -12,6 +16,6 @@ class Iblock(BaseEntity):
     """"""
 
     @cached_property
-    def type(self) -> Type:
+    def type(self) -> "Type":
         """"""
-        return Type(self)
+        return import_context(__package__, ".type", "Type")(self)
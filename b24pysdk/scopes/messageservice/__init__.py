@@ -1,8 +1,12 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .message import Message
-from .sender import Sender
+
+if TYPE_CHECKING:
+    from .message import Message
+    from .sender import Sender
 
 __all__ = [
     "Messageservice",
@@ -13,11 +17,11 @@ class Messageservice(BaseScope):
     """"""
 
     @cached_property
-    def message(self) -> Message:
+    def message(self) -> "Message":
         """"""
-        return Message(self)
+        return import_context(__package__, ".message", "Message")(self)
 
     @cached_property
-    def sender(self) -> Sender:
+    def sender(self) -> "Sender":
         """"""
-        return Sender(self)
+        return import_context(__package__, ".sender", "Sender")(self)
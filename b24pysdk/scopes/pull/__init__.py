@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .application import Application
+
+if TYPE_CHECKING:
+    from .application import Application
 
 __all__ = [
     "Pull",
@@ -12,6 +16,6 @@ class Pull(BaseScope):
     """"""
 
     @cached_property
-    def application(self) -> Application:
+    def application(self) -> "Application":
         """"""
-        return Application(self)
+        return import_context(__package__, ".application", "Application")(self)
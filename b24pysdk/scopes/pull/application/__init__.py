@@ -1,9 +1,13 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .config import Config
-from .event import Event
-from .push import Push
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .event import Event
+    from .push import Push
 
 __all__ = [
     "Application",
@@ -14,16 +18,16 @@ class Application(BaseEntity):
     """"""
 
     @cached_property
-    def config(self) -> Config:
+    def config(self) -> "Config":
         """"""
-        return Config(self)
+        return import_context(__package__, ".config", "Config")(self)
 
     @cached_property
-    def event(self) -> Event:
+    def event(self) -> "Event":
         """"""
-        return Event(self)
+        return import_context(__package__, ".event", "Event")(self)
 
     @cached_property
-    def push(self) -> Push:
+    def push(self) -> "Push":
         """"""
-        return Push(self)
+        return import_context(__package__, ".push", "Push")(self)
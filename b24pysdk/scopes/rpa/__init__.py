@@ -1,13 +1,17 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .comment import Comment
-from .fields import Fields
-from .item import Item
-from .stage import Stage
-from .task import Task
-from .timeline import Timeline
-from .type import Type
+
+if TYPE_CHECKING:
+    from .comment import Comment
+    from .fields import Fields
+    from .item import Item
+    from .stage import Stage
+    from .task import Task
+    from .timeline import Timeline
+    from .type import Type
 
 __all__ = [
     "Rpa",
@@ -18,36 +22,36 @@ class Rpa(BaseScope):
     """"""
 
     @cached_property
-    def comment(self) -> Comment:
+    def comment(self) -> "Comment":
         """"""
-        return Comment(self)
+        return import_context(__package__, ".comment", "Comment")(self)
 
     @cached_property
-    def fields(self) -> Fields:
+    def fields(self) -> "Fields":
         """"""
-        return Fields(self)
+        return import_context(__package__, ".fields", "Fields")(self)
 
     @cached_property
-    def item(self) -> Item:
+    def item(self) -> "Item":
         """"""
-        return Item(self)
+        return import_context(__package__, ".item", "Item")(self)
 
     @cached_property
-    def stage(self) -> Stage:
+    def stage(self) -> "Stage":
         """"""
-        return Stage(self)
+        return import_context(__package__, ".stage", "Stage")(self)
 
     @cached_property
-    def task(self) -> Task:
+    def task(self) -> "Task":
         """"""
-        return Task(self)
+        return import_context(__package__, ".task", "Task")(self)
 
     @cached_property
-    def timeline(self) -> Timeline:
+    def timeline(self) -> "Timeline":
         """"""
-        return Timeline(self)
+        return import_context(__package__, ".timeline", "Timeline")(self)
 
     @cached_property
-    def type(self) -> Type:
+    def type(self) -> "Type":
         """"""
-        return Type(self)
+        return import_context(__package__, ".type", "Type")(self)
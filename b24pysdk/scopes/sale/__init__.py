@@ -1,30 +1,34 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .basketitem import Basketitem
-from .basketproperties import Basketproperties
-from .businessvaluepersondomain import Businessvaluepersondomain
-from .cashbox import Cashbox
-from .delivery import Delivery
-from .order import Order
-from .payment import Payment
-from .paymentitembasket import Paymentitembasket
-from .paymentitemshipment import Paymentitemshipment
-from .paysystem import Paysystem
-from .persontype import Persontype
-from .property import Property
-from .propertygroup import Propertygroup
-from .propertyrelation import Propertyrelation
-from .propertyvalue import Propertyvalue
-from .propertyvariant import Propertyvariant
-from .shipment import Shipment
-from .shipmentitem import Shipmentitem
-from .shipmentproperty import Shipmentproperty
-from .shipmentpropertyvalue import Shipmentpropertyvalue
-from .status import Status
-from .statuslang import Statuslang
-from .tradebinding import Tradebinding
-from .tradeplatform import Tradeplatform
+
+if TYPE_CHECKING:
+    from .basketitem import Basketitem
+    from .basketproperties import Basketproperties
+    from .businessvaluepersondomain import Businessvaluepersondomain
+    from .cashbox import Cashbox
+    from .delivery import Delivery
+    from .order import Order
+    from .payment import Payment
+    from .paymentitembasket import Paymentitembasket
+    from .paymentitemshipment import Paymentitemshipment
+    from .paysystem import Paysystem
+    from .persontype import Persontype
+    from .property import Property
+    from .propertygroup import Propertygroup
+    from .propertyrelation import Propertyrelation
+    from .propertyvalue import Propertyvalue
+    from .propertyvariant import Propertyvariant
+    from .shipment import Shipment
+    from .shipmentitem import Shipmentitem
+    from .shipmentproperty import Shipmentproperty
+    from .shipmentpropertyvalue import Shipmentpropertyvalue
+    from .status import Status
+    from .statuslang import Statuslang
+    from .tradebinding import Tradebinding
+    from .tradeplatform import Tradeplatform
 
 __all__ = [
     "Sale",
@@ -34,120 +38,120 @@ __all__ = [
 class Sale(BaseScope):
 
     @cached_property
-    def basketitem(self) -> Basketitem:
+    def basketitem(self) -> "Basketitem":
         """"""
-        return Basketitem(self)
+        return import_context(__package__, ".basketitem", "Basketitem")(self)
 
     @cached_property
-    def basketproperties(self) -> Basketproperties:
+    def basketproperties(self) -> "Basketproperties":
         """"""
-        return Basketproperties(self)
+        return import_context(__package__, ".basketproperties", "Basketproperties")(self)
 
     @cached_property
-    def businessvaluepersondomain(self) -> Businessvaluepersondomain:
+    def businessvaluepersondomain(self) -> "Businessvaluepersondomain":
         """"""
-        return Businessvaluepersondomain(self)
+        return import_context(__package__, ".businessvaluepersondomain", "Businessvaluepersondomain")(self)
 
     @cached_property
-    def cashbox(self) -> Cashbox:
+    def cashbox(self) -> "Cashbox":
         """"""
-        return Cashbox(self)
+        return import_context(__package__, ".cashbox", "Cashbox")(self)
 
     @cached_property
-    def delivery(self) -> Delivery:
+    def delivery(self) -> "Delivery":
         """"""
-        return Delivery(self)
+        return import_context(__package__, ".delivery", "Delivery")(self)
 
     @cached_property
-    def order(self) -> Order:
+    def order(self) -> "Order":
         """"""
-        return Order(self)
+        return import_context(__package__, ".order", "Order")(self)
 
     @cached_property
-    def payment(self) -> Payment:
+    def payment(self) -> "Payment":
         """"""
-        return Payment(self)
+        return import_context(__package__, ".payment", "Payment")(self)
 
     @cached_property
-    def paymentitembasket(self) -> Paymentitembasket:
+    def paymentitembasket(self) -> "Paymentitembasket":
         """"""
-        return Paymentitembasket(self)
+        return import_context(__package__, ".paymentitembasket", "Paymentitembasket")(self)
 
     @cached_property
-    def paymentitemshipment(self) -> Paymentitemshipment:
+    def paymentitemshipment(self) -> "Paymentitemshipment":
         """"""
-        return Paymentitemshipment(self)
+        return import_context(__package__, ".paymentitemshipment", "Paymentitemshipment")(self)
 
     @cached_property
-    def paysystem(self) -> Paysystem:
-        return Paysystem(self)
+    def paysystem(self) -> "Paysystem":
+        return import_context(__package__, ".paysystem", "Paysystem")(self)
 
     @cached_property
-    def persontype(self) -> Persontype:
+    def persontype(self) -> "Persontype":
         """"""
-        return Persontype(self)
+        return import_context(__package__, ".persontype", "Persontype")(self)
 
     @cached_property
-    def property(self) -> Property:
+    def property(self) -> "Property":
         """"""
-        return Property(self)
+        return import_context(__package__, ".property", "Property")(self)
 
     @cached_property
-    def propertygroup(self) -> Propertygroup:
+    def propertygroup(self) -> "Propertygroup":
         """"""
-        return Propertygroup(self)
+        return import_context(__package__, ".propertygroup", "Propertygroup")(self)
 
     @cached_property
-    def propertyrelation(self) -> Propertyrelation:
+    def propertyrelation(self) -> "Propertyrelation":
         """"""
-        return Propertyrelation(self)
+        return import_context(__package__, ".propertyrelation", "Propertyrelation")(self)
 
     @cached_property
-    def propertyvalue(self) -> Propertyvalue:
+    def propertyvalue(self) -> "Propertyvalue":
         """"""
-        return Propertyvalue(self)
+        return import_context(__package__, ".propertyvalue", "Propertyvalue")(self)
 
     @cached_property
-    def propertyvariant(self) -> Propertyvariant:
+    def propertyvariant(self) -> "Propertyvariant":
         """"""
-        return Propertyvariant(self)
+        return import_context(__package__, ".propertyvariant", "Propertyvariant")(self)
 
     @cached_property
-    def shipment(self) -> Shipment:
+    def shipment(self) -> "Shipment":
         """"""
-        return Shipment(self)
+        return import_context(__package__, ".shipment", "Shipment")(self)
 
     @cached_property
-    def shipmentitem(self) -> Shipmentitem:
+    def shipmentitem(self) -> "Shipmentitem":
         """"""
-        return Shipmentitem(self)
+        return import_context(__package__, ".shipmentitem", "Shipmentitem")(self)
 
     @cached_property
-    def shipmentproperty(self) -> Shipmentproperty:
+    def shipmentproperty(self) -> "Shipmentproperty":
         """"""
-        return Shipmentproperty(self)
+        return import_context(__package__, ".shipmentproperty", "Shipmentproperty")(self)
 
     @cached_property
-    def shipmentpropertyvalue(self) -> Shipmentpropertyvalue:
+    def shipmentpropertyvalue(self) -> "Shipmentpropertyvalue":
         """"""
-        return Shipmentpropertyvalue(self)
+        return import_context(__package__, ".shipmentpropertyvalue", "Shipmentpropertyvalue")(self)
 
     @cached_property
-    def status(self) -> Status:
+    def status(self) -> "Status":
         """"""
-        return Status(self)
+        return import_context(__package__, ".status", "Status")(self)
 
     @cached_property
-    def statuslang(self) -> Statuslang:
+    def statuslang(self) -> "Statuslang":
         """"""
-        return Statuslang(self)
+        return import_context(__package__, ".statuslang", "Statuslang")(self)
 
     @cached_property
-    def tradebinding(self) -> Tradebinding:
+    def tradebinding(self) -> "Tradebinding":
         """"""
-        return Tradebinding(self)
+        return import_context(__package__, ".tradebinding", "Tradebinding")(self)
 
     @cached_property
-    def tradeplatform(self) -> Tradeplatform:
+    def tradeplatform(self) -> "Tradeplatform":
         """"""
-        return Tradeplatform(self)
+        return import_context(__package__, ".tradeplatform", "Tradeplatform")(self)
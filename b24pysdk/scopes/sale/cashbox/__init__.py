@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import B24BoolStrict, JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .check import Check
-from .handler import Handler
+
+if TYPE_CHECKING:
+    from .check import Check
+    from .handler import Handler
 
 __all__ = [
     "Cashbox",
@@ -17,14 +20,14 @@ class Cashbox(BaseEntity):
     """"""
 
     @cached_property
-    def check(self) -> Check:
+    def check(self) -> "Check":
         """"""
-        return Check(self)
+        return import_context(__package__, ".check", "Check")(self)
 
     @cached_property
-    def handler(self) -> Handler:
+    def handler(self) -> "Handler":
         """"""
-        return Handler(self)
+        return import_context(__package__, ".handler", "Handler")(self)
 
     @type_checker
     def add(
@@ -1,14 +1,17 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import B24BoolStrict, JSONDict, JSONList, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .config import Config
-from .extra import Extra
-from .handler import Handler
-from .request import Request
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .extra import Extra
+    from .handler import Handler
+    from .request import Request
 
 __all__ = [
     "Delivery",
@@ -19,24 +22,24 @@ class Delivery(BaseEntity):
     """"""
 
     @cached_property
-    def config(self) -> Config:
+    def config(self) -> "Config":
         """"""
-        return Config(self)
+        return import_context(__package__, ".config", "Config")(self)
 
     @cached_property
-    def extra(self) -> Extra:
+    def extra(self) -> "Extra":
         """"""
-        return Extra(self)
+        return import_context(__package__, ".extra", "Extra")(self)
 
     @cached_property
-    def handler(self) -> Handler:
+    def handler(self) -> "Handler":
         """"""
-        return Handler(self)
+        return import_context(__package__, ".handler", "Handler")(self)
 
     @cached_property
-    def request(self) -> Request:
+    def request(self) -> "Request":
         """"""
-        return Request(self)
+        return import_context(__package__, ".request", "Request")(self)
 
     @type_checker
     def add(
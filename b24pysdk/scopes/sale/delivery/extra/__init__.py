@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .service import Service
+
+if TYPE_CHECKING:
+    from .service import Service
 
 __all__ = [
     "Extra",
@@ -12,6 +16,6 @@ class Extra(BaseEntity):
     """"""
 
     @cached_property
-    def service(self) -> Service:
+    def service(self) -> "Service":
         """"""
-        return Service(self)
+        return import_context(__package__, ".service", "Service")(self)
@@ -1,13 +1,16 @@
 from functools import cached_property
-from typing import Annotated, Iterable, Literal, Optional, Text, Union
+from typing import TYPE_CHECKING, Annotated, Iterable, Literal, Optional, Text, Union
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import B24BoolStrict, JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .handler import Handler
-from .pay import Pay
-from .settings import Settings
+
+if TYPE_CHECKING:
+    from .handler import Handler
+    from .pay import Pay
+    from .settings import Settings
 
 __all__ = [
     "Paysystem",
@@ -17,19 +20,19 @@ __all__ = [
 class Paysystem(BaseEntity):
 
     @cached_property
-    def handler(self) -> Handler:
+    def handler(self) -> "Handler":
         """"""
-        return Handler(self)
+        return import_context(__package__, ".handler", "Handler")(self)
 
     @cached_property
-    def pay(self) -> Pay:
+    def pay(self) -> "Pay":
         """"""
-        return Pay(self)
+        return import_context(__package__, ".pay", "Pay")(self)
 
     @cached_property
-    def settings(self) -> Settings:
+    def settings(self) -> "Settings":
         """"""
-        return Settings(self)
+        return import_context(__package__, ".settings", "Settings")(self)
 
     @type_checker
     def list(
@@ -1,11 +1,15 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import JSONDict, Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .invoice import Invoice
-from .payment import Payment
+
+if TYPE_CHECKING:
+    from .invoice import Invoice
+    from .payment import Payment
 
 __all__ = [
     "Settings",
@@ -15,12 +19,12 @@ __all__ = [
 class Settings(BaseEntity):
 
     @cached_property
-    def invoice(self) -> Invoice:
-        return Invoice(self)
+    def invoice(self) -> "Invoice":
+        return import_context(__package__, ".invoice", "Invoice")(self)
 
     @cached_property
-    def payment(self) -> Payment:
-        return Payment(self)
+    def payment(self) -> "Payment":
+        return import_context(__package__, ".payment", "Payment")(self)
 
     @type_checker
     def get(
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .payment import Payment
+
+if TYPE_CHECKING:
+    from .payment import Payment
 
 __all__ = [
     "Salescenter",
@@ -12,6 +16,6 @@ class Salescenter(BaseScope):
     """"""
 
     @cached_property
-    def payment(self) -> Payment:
+    def payment(self) -> "Payment":
         """"""
-        return Payment(self)
+        return import_context(__package__, ".payment", "Payment")(self)
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .b2e import B2e
+
+if TYPE_CHECKING:
+    from .b2e import B2e
 
 __all__ = [
     "Sign",
@@ -12,6 +16,6 @@ class Sign(BaseScope):
     """"""
 
     @cached_property
-    def b2e(self) -> B2e:
+    def b2e(self) -> "B2e":
         """"""
-        return B2e(self)
+        return import_context(__package__, ".b2e", "B2e")(self)
@@ -1,10 +1,13 @@
 from functools import cached_property
-from typing import Text
+from typing import TYPE_CHECKING, Text
 
 from ....utils.functional import classproperty
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .mysafe import Mysafe
-from .personal import Personal
+
+if TYPE_CHECKING:
+    from .mysafe import Mysafe
+    from .personal import Personal
 
 __all__ = [
     "B2e",
@@ -19,11 +22,11 @@ class B2e(BaseEntity):
         return "b2e"
 
     @cached_property
-    def mysafe(self) -> Mysafe:
+    def mysafe(self) -> "Mysafe":
         """"""
-        return Mysafe(self)
+        return import_context(__package__, ".mysafe", "Mysafe")(self)
 
     @cached_property
-    def personal(self) -> Personal:
+    def personal(self) -> "Personal":
         """"""
-        return Personal(self)
+        return import_context(__package__, ".personal", "Personal")(self)
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .api import API
+
+if TYPE_CHECKING:
+    from .api import API
 
 __all__ = [
     "Socialnetwork",
@@ -12,6 +16,6 @@ class Socialnetwork(BaseScope):
     """"""
 
     @cached_property
-    def api(self) -> API:
+    def api(self) -> "API":
         """"""
-        return API(self)
+        return import_context(__package__, ".api", "API")(self)
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .workgroup import Workgroup
+
+if TYPE_CHECKING:
+    from .workgroup import Workgroup
 
 __all__ = [
     "API",
@@ -12,6 +16,6 @@ class API(BaseEntity):
     """"""
 
     @cached_property
-    def workgroup(self) -> Workgroup:
+    def workgroup(self) -> "Workgroup":
         """"""
-        return Workgroup(self)
+        return import_context(__package__, ".workgroup", "Workgroup")(self)
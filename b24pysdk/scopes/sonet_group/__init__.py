@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Iterable, Literal, Optional, Text, Union
+from typing import TYPE_CHECKING, Iterable, Literal, Optional, Text, Union
 
 from ...api.requests import BitrixAPIRequest
 from ...utils.functional import classproperty, type_checker
 from ...utils.types import B24BoolStrict, JSONDict, Timeout
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .feature import Feature
-from .user import User
+
+if TYPE_CHECKING:
+    from .feature import Feature
+    from .user import User
 
 __all__ = [
     "SonetGroup",
@@ -21,14 +24,14 @@ class SonetGroup(BaseScope):
         return "sonet_group"
 
     @cached_property
-    def feature(self) -> Feature:
+    def feature(self) -> "Feature":
         """"""
-        return Feature(self)
+        return import_context(__package__, ".feature", "Feature")(self)
 
     @cached_property
-    def user(self) -> User:
+    def user(self) -> "User":
         """"""
-        return User(self)
+        return import_context(__package__, ".user", "User")(self)
 
     @type_checker
     def create(  # noqa: C901, PLR0912
@@ -1,13 +1,17 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .checklistitem import Checklistitem
-from .commentitem import Commentitem
-from .dependence import Dependence
-from .elapseditem import Elapseditem
-from .item import Item
-from .planner import Planner
-from .stages import Stages
+
+if TYPE_CHECKING:
+    from .checklistitem import Checklistitem
+    from .commentitem import Commentitem
+    from .dependence import Dependence
+    from .elapseditem import Elapseditem
+    from .item import Item
+    from .planner import Planner
+    from .stages import Stages
 
 __all__ = [
     "Task",
@@ -18,36 +22,36 @@ class Task(BaseScope):
     """"""
 
     @cached_property
-    def checklistitem(self) -> Checklistitem:
+    def checklistitem(self) -> "Checklistitem":
         """"""
-        return Checklistitem(self)
+        return import_context(__package__, ".checklistitem", "Checklistitem")(self)
 
     @cached_property
-    def commentitem(self) -> Commentitem:
+    def commentitem(self) -> "Commentitem":
         """"""
-        return Commentitem(self)
+        return import_context(__package__, ".commentitem", "Commentitem")(self)
 
     @cached_property
-    def dependence(self) -> Dependence:
+    def dependence(self) -> "Dependence":
         """"""
-        return Dependence(self)
+        return import_context(__package__, ".dependence", "Dependence")(self)
 
     @cached_property
-    def elapseditem(self) -> Elapseditem:
+    def elapseditem(self) -> "Elapseditem":
         """"""
-        return Elapseditem(self)
+        return import_context(__package__, ".elapseditem", "Elapseditem")(self)
 
     @cached_property
-    def item(self) -> Item:
+    def item(self) -> "Item":
         """"""
-        return Item(self)
+        return import_context(__package__, ".item", "Item")(self)
 
     @cached_property
-    def planner(self) -> Planner:
+    def planner(self) -> "Planner":
         """"""
-        return Planner(self)
+        return import_context(__package__, ".planner", "Planner")(self)
 
     @cached_property
-    def stages(self) -> Stages:
+    def stages(self) -> "Stages":
         """"""
-        return Stages(self)
+        return import_context(__package__, ".stages", "Stages")(self)
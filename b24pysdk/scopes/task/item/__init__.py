@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .userfield import Userfield
+
+if TYPE_CHECKING:
+    from .userfield import Userfield
 
 __all__ = [
     "Item",
@@ -12,6 +16,6 @@ class Item(BaseEntity):
     """"""
 
     @cached_property
-    def userfield(self) -> Userfield:
+    def userfield(self) -> "Userfield":
         """"""
-        return Userfield(self)
+        return import_context(__package__, ".userfield", "Userfield")(self)
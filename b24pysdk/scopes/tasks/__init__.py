@@ -1,8 +1,12 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .flow import Flow
-from .task import Task
+
+if TYPE_CHECKING:
+    from .flow import Flow
+    from .task import Task
 
 __all__ = [
     "Tasks",
@@ -13,11 +17,11 @@ class Tasks(BaseScope):
     """"""
 
     @cached_property
-    def flow(self) -> Flow:
+    def flow(self) -> "Flow":
         """"""
-        return Flow(self)
+        return import_context(__package__, ".flow", "Flow")(self)
 
     @cached_property
-    def task(self) -> Task:
+    def task(self) -> "Task":
         """"""
-        return Task(self)
+        return import_context(__package__, ".task", "Task")(self)
@@ -1,15 +1,18 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from ....api.requests import BitrixAPIRequest
 from ....utils.functional import type_checker
 from ....utils.types import JSONDict, Timeout
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .counters import Counters
-from .favorite import Favorite
-from .files import Files
-from .history import History
-from .result import Result
+
+if TYPE_CHECKING:
+    from .counters import Counters
+    from .favorite import Favorite
+    from .files import Files
+    from .history import History
+    from .result import Result
 
 __all__ = [
     "Task",
@@ -20,29 +23,29 @@ class Task(BaseEntity):
     """"""
 
     @cached_property
-    def counters(self) -> Counters:
+    def counters(self) -> "Counters":
         """"""
-        return Counters(self)
+        return import_context(__package__, ".counters", "Counters")(self)
 
     @cached_property
-    def favorite(self) -> Favorite:
+    def favorite(self) -> "Favorite":
         """"""
-        return Favorite(self)
+        return import_context(__package__, ".favorite", "Favorite")(self)
 
     @cached_property
-    def files(self) -> Files:
+    def files(self) -> "Files":
         """"""
-        return Files(self)
+        return import_context(__package__, ".files", "Files")(self)
 
     @cached_property
-    def history(self) -> History:
+    def history(self) -> "History":
         """"""
-        return History(self)
+        return import_context(__package__, ".history", "History")(self)
 
     @cached_property
-    def result(self) -> Result:
+    def result(self) -> "Result":
         """"""
-        return Result(self)
+        return import_context(__package__, ".result", "Result")(self)
 
     @type_checker
     def add(
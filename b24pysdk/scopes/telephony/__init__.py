@@ -1,9 +1,13 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .call import Call
-from .external_call import ExternalCall
-from .external_line import ExternalLine
+
+if TYPE_CHECKING:
+    from .call import Call
+    from .external_call import ExternalCall
+    from .external_line import ExternalLine
 
 __all__ = [
     "Telephony",
@@ -14,16 +18,16 @@ class Telephony(BaseScope):
     """"""
 
     @cached_property
-    def call(self) -> Call:
+    def call(self) -> "Call":
         """"""
-        return Call(self)
+        return import_context(__package__, ".call", "Call")(self)
 
     @cached_property
-    def external_call(self) -> ExternalCall:
+    def external_call(self) -> "ExternalCall":
         """"""
-        return ExternalCall(self)
+        return import_context(__package__, ".external_call", "ExternalCall")(self)
 
     @cached_property
-    def external_line(self) -> ExternalLine:
+    def external_line(self) -> "ExternalLine":
         """"""
-        return ExternalLine(self)
+        return import_context(__package__, ".external_line", "ExternalLine")(self)
@@ -1,13 +1,16 @@
 from functools import cached_property
-from typing import Optional, Text
+from typing import TYPE_CHECKING, Optional, Text
 
 from ...api.requests import BitrixAPIRequest
 from ...utils.functional import type_checker
 from ...utils.types import JSONDict, Number, Timeout
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .networkrange import Networkrange
-from .schedule import Schedule
-from .timecontrol import Timecontrol
+
+if TYPE_CHECKING:
+    from .networkrange import Networkrange
+    from .schedule import Schedule
+    from .timecontrol import Timecontrol
 
 __all__ = [
     "Timeman",
@@ -18,19 +21,19 @@ class Timeman(BaseScope):
     """"""
 
     @cached_property
-    def networkrange(self) -> Networkrange:
+    def networkrange(self) -> "Networkrange":
         """"""
-        return Networkrange(self)
+        return import_context(__package__, ".networkrange", "Networkrange")(self)
 
     @cached_property
-    def schedule(self) -> Schedule:
+    def schedule(self) -> "Schedule":
         """"""
-        return Schedule(self)
+        return import_context(__package__, ".schedule", "Schedule")(self)
 
     @cached_property
-    def timecontrol(self) -> Timecontrol:
+    def timecontrol(self) -> "Timecontrol":
         """"""
-        return Timecontrol(self)
+        return import_context(__package__, ".timecontrol", "Timecontrol")(self)
 
     @type_checker
     def close(
@@ -1,9 +1,13 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .report import Report
-from .reports import Reports
-from .settings import Settings
+
+if TYPE_CHECKING:
+    from .report import Report
+    from .reports import Reports
+    from .settings import Settings
 
 __all__ = [
     "Timecontrol",
@@ -14,16 +18,16 @@ class Timecontrol(BaseEntity):
     """"""
 
     @cached_property
-    def report(self) -> Report:
+    def report(self) -> "Report":
         """"""
-        return Report(self)
+        return import_context(__package__, ".report", "Report")(self)
 
     @cached_property
-    def reports(self) -> Reports:
+    def reports(self) -> "Reports":
         """"""
-        return Reports(self)
+        return import_context(__package__, ".reports", "Reports")(self)
 
     @cached_property
-    def settings(self) -> Settings:
+    def settings(self) -> "Settings":
         """"""
-        return Settings(self)
+        return import_context(__package__, ".settings", "Settings")(self)
@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import JSONDict, Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .settings import Settings
-from .users import Users
+
+if TYPE_CHECKING:
+    from .settings import Settings
+    from .users import Users
 
 __all__ = [
     "Reports",
@@ -17,14 +20,14 @@ class Reports(BaseEntity):
     """"""
 
     @cached_property
-    def settings(self) -> Settings:
+    def settings(self) -> "Settings":
         """"""
-        return Settings(self)
+        return import_context(__package__, ".settings", "Settings")(self)
 
     @cached_property
-    def users(self) -> Users:
+    def users(self) -> "Users":
         """"""
-        return Users(self)
+        return import_context(__package__, ".users", "Users")(self)
 
     @type_checker
     def get(
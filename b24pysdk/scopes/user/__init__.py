@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Dict, Iterable, Optional, Text
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Text
 
 from ...api.requests import BitrixAPIRequest
 from ...utils.functional import type_checker
 from ...utils.types import JSONDict, Timeout
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .option import Option
-from .userfield import Userfield
+
+if TYPE_CHECKING:
+    from .option import Option
+    from .userfield import Userfield
 
 __all__ = [
     "User",
@@ -17,14 +20,14 @@ class User(BaseScope):
     """"""
 
     @cached_property
-    def option(self) -> Option:
+    def option(self) -> "Option":
         """"""
-        return Option(self)
+        return import_context(__package__, ".option", "Option")(self)
 
     @cached_property
-    def userfield(self) -> Userfield:
+    def userfield(self) -> "Userfield":
         """"""
-        return Userfield(self)
+        return import_context(__package__, ".userfield", "Userfield")(self)
 
     @type_checker
     def fields(
@@ -1,8 +1,12 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .agreement import Agreement
-from .consent import Consent
+
+if TYPE_CHECKING:
+    from .agreement import Agreement
+    from .consent import Consent
 
 __all__ = [
     "Userconsent",
@@ -13,11 +17,11 @@ class Userconsent(BaseScope):
     """"""
 
     @cached_property
-    def agreement(self) -> Agreement:
+    def agreement(self) -> "Agreement":
         """"""
-        return Agreement(self)
+        return import_context(__package__, ".agreement", "Agreement")(self)
 
     @cached_property
-    def consent(self) -> Consent:
+    def consent(self) -> "Consent":
         """"""
-        return Consent(self)
+        return import_context(__package__, ".consent", "Consent")(self)
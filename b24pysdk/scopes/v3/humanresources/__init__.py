@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_scope import BaseScope
-from .node import Node
+
+if TYPE_CHECKING:
+    from .node import Node
 
 __all__ = [
     "Humanresources",
@@ -12,6 +16,6 @@ class Humanresources(BaseScope):
     """"""
 
     @cached_property
-    def node(self) -> Node:
+    def node(self) -> "Node":
         """"""
-        return Node(self)
+        return import_context(__package__, ".node", "Node")(self)
@@ -1,12 +1,15 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import JSONDict, Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .field import Field
-from .member import Member
+
+if TYPE_CHECKING:
+    from .field import Field
+    from .member import Member
 
 __all__ = [
     "Node",
@@ -17,14 +20,14 @@ class Node(BaseEntity):
     """"""
 
     @cached_property
-    def field(self) -> Field:
+    def field(self) -> "Field":
         """"""
-        return Field(self)
+        return import_context(__package__, ".field", "Field")(self)
 
     @cached_property
-    def member(self) -> Member:
+    def member(self) -> "Member":
         """"""
-        return Member(self)
+        return import_context(__package__, ".member", "Member")(self)
 
     @type_checker
     def add(  # noqa: C901, PLR0912
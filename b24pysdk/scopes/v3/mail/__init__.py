@@ -1,9 +1,13 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_scope import BaseScope
-from .mailbox import Mailbox
-from .message import Message
-from .recipient import Recipient
+
+if TYPE_CHECKING:
+    from .mailbox import Mailbox
+    from .message import Message
+    from .recipient import Recipient
 
 __all__ = [
     "Mail",
@@ -14,16 +18,16 @@ class Mail(BaseScope):
     """"""
 
     @cached_property
-    def mailbox(self) -> Mailbox:
+    def mailbox(self) -> "Mailbox":
         """"""
-        return Mailbox(self)
+        return import_context(__package__, ".mailbox", "Mailbox")(self)
 
     @cached_property
-    def message(self) -> Message:
+    def message(self) -> "Message":
         """"""
-        return Message(self)
+        return import_context(__package__, ".message", "Message")(self)
 
     @cached_property
-    def recipient(self) -> Recipient:
+    def recipient(self) -> "Recipient":
         """"""
-        return Recipient(self)
+        return import_context(__package__, ".recipient", "Recipient")(self)
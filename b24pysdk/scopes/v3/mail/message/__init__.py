@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import JSONDict, Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .field import Field
+
+if TYPE_CHECKING:
+    from .field import Field
 
 __all__ = [
     "Message",
@@ -16,9 +19,9 @@ class Message(BaseEntity):
     """"""
 
     @cached_property
-    def field(self) -> Field:
+    def field(self) -> "Field":
         """"""
-        return Field(self)
+        return import_context(__package__, ".field", "Field")(self)
 
     @type_checker
     def createcalendarevent(
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_scope import BaseScope
-from .eventlog import Eventlog
+
+if TYPE_CHECKING:
+    from .eventlog import Eventlog
 
 __all__ = [
     "Main",
@@ -12,6 +16,6 @@ class Main(BaseScope):
     """"""
 
     @cached_property
-    def eventlog(self) -> Eventlog:
+    def eventlog(self) -> "Eventlog":
         """"""
-        return Eventlog(self)
+        return import_context(__package__, ".eventlog", "Eventlog")(self)
@@ -1,8 +1,12 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_scope import BaseScope
-from .documentation import Documentation
-from .scope import Scope
+
+if TYPE_CHECKING:
+    from .documentation import Documentation
+    from .scope import Scope
 
 __all__ = [
     "Rest",
@@ -13,11 +17,11 @@ class Rest(BaseScope):
     """"""
 
     @cached_property
-    def documentation(self) -> Documentation:
+    def documentation(self) -> "Documentation":
         """"""
-        return Documentation(self)
+        return import_context(__package__, ".documentation", "Documentation")(self)
 
     @cached_property
-    def scope(self) -> Scope:
+    def scope(self) -> "Scope":
         """"""
-        return Scope(self)
+        return import_context(__package__, ".scope", "Scope")(self)
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ..._base_context import import_context
 from ..._base_scope import BaseScope
-from .task import Task
+
+if TYPE_CHECKING:
+    from .task import Task
 
 __all__ = [
     "Tasks",
@@ -12,6 +16,6 @@ class Tasks(BaseScope):
     """"""
 
     @cached_property
-    def task(self) -> Task:
+    def task(self) -> "Task":
         """"""
-        return Task(self)
+        return import_context(__package__, ".task", "Task")(self)
@@ -1,15 +1,18 @@
 from functools import cached_property
-from typing import Iterable, Optional, Text
+from typing import TYPE_CHECKING, Iterable, Optional, Text
 
 from .....api.requests import BitrixAPIRequest
 from .....utils.functional import type_checker
 from .....utils.types import JSONDict, Timeout
+from ...._base_context import import_context
 from ...._base_entity import BaseEntity
-from .access import Access
-from .chat import Chat
-from .field import Field
-from .file import File
-from .result import Result
+
+if TYPE_CHECKING:
+    from .access import Access
+    from .chat import Chat
+    from .field import Field
+    from .file import File
+    from .result import Result
 
 __all__ = [
     "Task",
@@ -20,29 +23,29 @@ class Task(BaseEntity):
     """"""
 
     @cached_property
-    def chat(self) -> Chat:
+    def chat(self) -> "Chat":
         """"""
-        return Chat(self)
+        return import_context(__package__, ".chat", "Chat")(self)
 
     @cached_property
-    def file(self) -> File:
+    def file(self) -> "File":
         """"""
-        return File(self)
+        return import_context(__package__, ".file", "File")(self)
 
     @cached_property
-    def result(self) -> Result:
+    def result(self) -> "Result":
         """"""
-        return Result(self)
+        return import_context(__package__, ".result", "Result")(self)
 
     @cached_property
-    def access(self) -> Access:
+    def access(self) -> "Access":
         """"""
-        return Access(self)
+        return import_context(__package__, ".access", "Access")(self)
 
     @cached_property
-    def field(self) -> Field:
+    def field(self) -> "Field":
         """"""
-        return Field(self)
+        return import_context(__package__, ".field", "Field")(self)
 
     @type_checker
     def add(
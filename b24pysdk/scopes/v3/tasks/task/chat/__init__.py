@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from ....._base_context import import_context
 from ....._base_entity import BaseEntity
-from .message import Message
+
+if TYPE_CHECKING:
+    from .message import Message
 
 __all__ = [
     "Chat",
@@ -12,6 +16,6 @@ class Chat(BaseEntity):
     """"""
 
     @cached_property
-    def message(self) -> Message:
+    def message(self) -> "Message":
         """"""
-        return Message(self)
+        return import_context(__package__, ".message", "Message")(self)
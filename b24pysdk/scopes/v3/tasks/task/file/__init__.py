@@ -1,11 +1,14 @@
 from functools import cached_property
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
 from ......api.requests import BitrixAPIRequest
 from ......utils.functional import type_checker
 from ......utils.types import Timeout
+from ....._base_context import import_context
 from ....._base_entity import BaseEntity
-from .field import Field
+
+if TYPE_CHECKING:
+    from .field import Field
 
 __all__ = [
     "File",
@@ -16,9 +19,9 @@ class File(BaseEntity):
     """"""
 
     @cached_property
-    def field(self) -> Field:
+    def field(self) -> "Field":
         """"""
-        return Field(self)
+        return import_context(__package__, ".field", "Field")(self)
 
     @type_checker
     def attach(
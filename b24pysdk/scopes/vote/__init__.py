@@ -1,8 +1,12 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .attached_vote import AttachedVote
-from .integration import Integration
+
+if TYPE_CHECKING:
+    from .attached_vote import AttachedVote
+    from .integration import Integration
 
 __all__ = [
     "Vote",
@@ -13,11 +17,11 @@ class Vote(BaseScope):
     """"""
 
     @cached_property
-    def attached_vote(self) -> AttachedVote:
+    def attached_vote(self) -> "AttachedVote":
         """"""
-        return AttachedVote(self)
+        return import_context(__package__, ".attached_vote", "AttachedVote")(self)
 
     @cached_property
-    def integration(self) -> Integration:
+    def integration(self) -> "Integration":
         """"""
-        return Integration(self)
+        return import_context(__package__, ".integration", "Integration")(self)
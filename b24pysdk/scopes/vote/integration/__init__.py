@@ -1,8 +1,12 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from ....utils.functional import classproperty
+from ..._base_context import import_context
 from ..._base_entity import BaseEntity
-from .im import Im
+
+if TYPE_CHECKING:
+    from .im import Im
 
 __all__ = [
     "Integration",
@@ -17,6 +21,6 @@ class Integration(BaseEntity):
         return "Integration"
 
     @cached_property
-    def im(self) -> Im:
+    def im(self) -> "Im":
         """"""
-        return Im(self)
+        return import_context(__package__, ".im", "Im")(self)
@@ -1,7 +1,11 @@
 from functools import cached_property
+from typing import TYPE_CHECKING
 
+from .._base_context import import_context
 from .._base_scope import BaseScope
-from .statistic import Statistic
+
+if TYPE_CHECKING:
+    from .statistic import Statistic
 
 __all__ = [
     "Voximplant",
@@ -12,6 +16,6 @@ class Voximplant(BaseScope):
     """"""
 
     @cached_property
-    def statistic(self) -> Statistic:
+    def statistic(self) -> "Statistic":
         """"""
-        return Statistic(self)
+        return import_context(__package__, ".statistic", "Statistic")(self)
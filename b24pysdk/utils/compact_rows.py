@@ -0,0 +1,297 @@
+import csv
+import json
+import typing
+
+from .. import _constants
+
+if typing.TYPE_CHECKING:
+    from . import types as _types
+
+__all__ = [
+    "CompactRow",
+    "CompactRows",
+]
+
+
+class CompactRow(typing.Mapping[typing.Text, typing.Any]):
+    """
+    Read-only dictionary view of a single row stored in ``CompactRows``.
+
+    The view keeps references to the shared field index and to the row tuple,
+    so creating it does not copy the row.
+    """
+
+    __slots__ = ("_field_indexes", "_fields", "_row")
+
+    _field_indexes: typing.Dict[typing.Text, int]
+    _fields: typing.List[typing.Text]
+    _row: typing.Tuple
+
+    def __init__(self, fields: typing.List[typing.Text], field_indexes: typing.Dict[typing.Text, int], row: typing.Tuple):
+        """
+        Initialize a row view.
+
+        Args:
+            fields: Field names shared by all rows of the container.
+            field_indexes: Positions of the field names in row tuples.
+            row: Row values, ordered as ``fields``.
+        """
+        self._fields = fields
+        self._field_indexes = field_indexes
+        self._row = row
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __getitem__(self, key: typing.Text) -> typing.Any:
+        index = self._field_indexes[key]
+
+        if index < len(self._row):
+            value = self._row[index]
+
+            if value is not _constants.MISSING:
+                return value
+
+        raise KeyError(key)
+
+    def __iter__(self) -> typing.Iterator[typing.Text]:
+        return (field for field, value in zip(self._fields, self._row) if value is not _constants.MISSING)
+
+    def __len__(self) -> int:
+        return sum(value is not _constants.MISSING for value in self._row)
+
+    def to_dict(self) -> "_types.JSONDict":
+        """
+        Convert the row to a regular dictionary.
+
+        Returns:
+            Dictionary with the fields present in the row.
+        """
+        return {field: value for field, value in zip(self._fields, self._row) if value is not _constants.MISSING}
+
+
+class CompactRows(typing.Sequence[CompactRow]):
+    """
+    Memory-efficient container for large lists of Bitrix24 items.
+
+    Field names are stored once for the whole container and every item is
+    kept as a tuple of values ordered by these fields, instead of a separate
+    dictionary with its own copy of the keys. Items are exposed as read-only
+    ``CompactRow`` mappings, so code reading ``item["ID"]`` or
+    ``item.get("TITLE")`` works unchanged.
+
+    Repeated string values of low-cardinality fields, such as stages,
+    currencies or ``Y``/``N`` flags, are stored once per field. A field stops
+    being deduplicated once it has more than ``MAX_SHARED_VALUES`` distinct
+    values, so unique values like IDs or titles add no overhead.
+
+    Items with keys that differ from earlier items are supported: new keys
+    extend the field list, and keys absent from an item are skipped by its
+    row view.
+    """
+
+    MAX_SHARED_VALUES: typing.ClassVar[int] = 1024
+    """Maximum number of distinct string values deduplicated per field."""
+
+    __slots__ = ("_field_indexes", "_fields", "_rows", "_shared_values")
+
+    _field_indexes: typing.Dict[typing.Text, int]
+    _fields: typing.List[typing.Text]
+    _rows: typing.List[typing.Tuple]
+    _shared_values: typing.List[typing.Optional[typing.Dict[typing.Text, typing.Text]]]
+
+    def __init__(self, items: typing.Iterable[typing.Mapping[typing.Text, typing.Any]] = (), /):
+        """
+        Initialize the container.
+
+        Args:
+            items: Items to pack. A generator is consumed item by item, so
+                the source items do not have to be held in memory at once.
+        """
+        self._fields = []
+        self._field_indexes = {}
+        self._rows = []
+        self._shared_values = []
+        self.extend(items)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(<rows: {len(self._rows)}>, fields={self._fields})"
+
+    @typing.overload
+    def __getitem__(self, index: int) -> CompactRow: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> "CompactRows": ...
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[CompactRow, "CompactRows"]:
+        if isinstance(index, slice):
+            compact_rows = self.__class__()
+            compact_rows._fields = self._fields.copy()
+            compact_rows._field_indexes = self._field_indexes.copy()
+            compact_rows._shared_values = [{} for _ in self._fields]
+            compact_rows._rows = self._rows[index]
+            return compact_rows
+
+        return CompactRow(self._fields, self._field_indexes, self._rows[index])
+
+    def __iter__(self) -> typing.Iterator[CompactRow]:
+        fields, field_indexes = self._fields, self._field_indexes
+        return (CompactRow(fields, field_indexes, row) for row in self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def fields(self) -> typing.Tuple[typing.Text, ...]:
+        """Field names in the order they were first seen."""
+        return tuple(self._fields)
+
+    def append(self, item: typing.Mapping[typing.Text, typing.Any], /):
+        """
+        Pack an item and add it to the container.
+
+        Args:
+            item: Bitrix24 item, usually a dictionary decoded from JSON.
+        """
+
+        fields = self._fields
+
+        if len(item) == len(fields) and all(map(str.__eq__, item, fields)):
+            self._rows.append(self._pack(item.values()))
+            return
+
+        field_indexes = self._field_indexes
+
+        for key in item:
+            if key not in field_indexes:
+                field_indexes[key] = len(fields)
+                fields.append(key)
+                self._shared_values.append({})
+
+        row = [_constants.MISSING] * len(fields)
+
+        for key, value in item.items():
+            row[field_indexes[key]] = value
+
+        self._rows.append(self._pack(row))
+
+    def _pack(self, values: typing.Iterable[typing.Any]) -> typing.Tuple:
+        """
+        Build a row tuple, replacing repeated strings with shared instances.
+
+        Args:
+            values: Row values, ordered as the fields.
+
+        Returns:
+            Row tuple.
+        """
+
+        row = []
+        shared_values = self._shared_values
+
+        for index, value in enumerate(values):
+            field_shared_values = shared_values[index]
+
+            if field_shared_values is None or type(value) is not str:
+                row.append(value)
+                continue
+
+            row.append(field_shared_values.setdefault(value, value))
+
+            if len(field_shared_values) > self.MAX_SHARED_VALUES:
+                shared_values[index] = None
+
+        return tuple(row)
+
+    def extend(self, items: typing.Iterable[typing.Mapping[typing.Text, typing.Any]], /):
+        """
+        Pack items and add them to the container.
+
+        Args:
+            items: Bitrix24 items, usually dictionaries decoded from JSON.
+        """
+        for item in items:
+            self.append(item)
+
+    def to_list(self) -> "_types.JSONList":
+        """
+        Convert the container to a list of regular dictionaries.
+
+        Returns:
+            Items as dictionaries, in the same form Bitrix24 returned them.
+        """
+
+        fields = self._fields
+        missing = _constants.MISSING
+
+        return [{field: value for field, value in zip(fields, row) if value is not missing} for row in self._rows]
+
+    def to_columns(self, fields: typing.Optional[typing.Iterable[typing.Text]] = None) -> typing.Dict[typing.Text, typing.List[typing.Any]]:
+        """
+        Convert the container to per-field value lists.
+
+        The result can be passed directly to column-oriented consumers such
+        as ``pyarrow.Table.from_pydict`` or ``pandas.DataFrame``.
+
+        Args:
+            fields: Fields to export. Defaults to all fields.
+
+        Returns:
+            Dictionary of value lists keyed by field name. Values of fields
+            absent from an item are ``None``.
+        """
+
+        columns: typing.Dict[typing.Text, typing.List[typing.Any]] = {}
+        missing = _constants.MISSING
+
+        for field in self._fields if fields is None else fields:
+            index = self._field_indexes.get(field)
+
+            if index is None:
+                columns[field] = [None] * len(self._rows)
+            else:
+                columns[field] = [None if index >= len(row) or row[index] is missing else row[index] for row in self._rows]
+
+        return columns
+
+    def to_csv(
+            self,
+            file: typing.TextIO,
+            fields: typing.Optional[typing.Sequence[typing.Text]] = None,
+            **fmtparams: typing.Any,
+    ):
+        """
+        Write the container to a CSV file.
+
+        The first line contains the field names. Nested values, such as
+        multi-fields, are written as JSON.
+
+        Args:
+            file: Text file opened with ``newline=""``.
+            fields: Fields to export. Defaults to all fields.
+            **fmtparams: Formatting parameters passed to ``csv.writer``.
+        """
+
+        if fields is None:
+            fields = self._fields
+
+        indexes = [self._field_indexes.get(field, len(self._fields)) for field in fields]
+        missing = _constants.MISSING
+
+        writer = csv.writer(file, **fmtparams)
+        writer.writerow(fields)
+
+        for row in self._rows:
+            values = []
+
+            for index in indexes:
+                value = row[index] if index < len(row) else missing
+
+                if value is missing or value is None:
+                    values.append("")
+                elif isinstance(value, (dict, list)):
+                    values.append(json.dumps(value, ensure_ascii=False))
+                else:
+                    values.append(value)
+
+            writer.writerow(values)
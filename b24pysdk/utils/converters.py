@@ -1,3 +1,5 @@
+import contextlib
+import contextvars
 import datetime
 import typing
 import zoneinfo
@@ -7,18 +9,60 @@ from . import types as _types
 __all__ = [
     "bool_from_bitrix",
     "bool_to_bitrix",
+    "bools_from_bitrix",
+    "conversion_cache",
     "datetime_from_bitrix",
     "datetime_to_bitrix",
+    "datetimes_from_bitrix",
     "float_from_bitrix",
     "float_to_bitrix",
+    "floats_from_bitrix",
     "int_from_bitrix",
     "int_to_bitrix",
+    "ints_from_bitrix",
     "text_from_bitrix",
     "text_to_bitrix",
     "timezone_from_bitrix",
     "timezone_to_bitrix",
 ]
 
+_BITRIX_BOOLS: typing.Final[typing.Dict[typing.Any, bool]] = {"Y": True, "N": False, "1": True, "0": False, 1: True, 0: False}
+"""Bitrix24 boolean values that convert without validation."""
+
+_datetime_cache: contextvars.ContextVar[typing.Optional[typing.Dict[typing.Text, datetime.datetime]]] = contextvars.ContextVar(
+    "datetime_cache",
+    default=None,
+)
+"""Parsed datetime values shared by conversions inside ``conversion_cache``."""
+
+
+@contextlib.contextmanager
+def conversion_cache() -> typing.Iterator[None]:
+    """
+    Memoize parsed Bitrix24 values while a collection is converted.
+
+    Lists returned by Bitrix24 usually repeat the same date values in many
+    items. Inside this context ``datetime_from_bitrix`` parses every distinct
+    string once and returns the same immutable ``datetime`` object for its
+    repetitions. The cache is dropped when the outermost context exits.
+
+    Usage:
+
+        with conversion_cache():
+            items = [Schema.from_bitrix(item) for item in bitrix_items]
+    """
+
+    if _datetime_cache.get() is not None:
+        yield
+        return
+
+    token = _datetime_cache.set({})
+
+    try:
+        yield
+    finally:
+        _datetime_cache.reset(token)
+
 
 @typing.overload
 def bool_from_bitrix(value: typing.Union[bool, int, typing.Annotated[typing.Text, _types.B24BoolStrictLiteral]], /, *, is_required: typing.Literal[True]) -> bool: ...
@@ -124,7 +168,17 @@ def datetime_from_bitrix(value: typing.Optional[typing.Text], /, *, is_required:
         raise ValueError(f"Cannot convert empty Bitrix24 value to datetime: {value!r}")
 
     if isinstance(value, str):
-        return datetime.datetime.fromisoformat(value)
+        cache = _datetime_cache.get()
+
+        if cache is None:
+            return datetime.datetime.fromisoformat(value)
+
+        converted = cache.get(value)
+
+        if converted is None:
+            converted = cache[value] = datetime.datetime.fromisoformat(value)
+
+        return converted
 
     raise ValueError(f"Cannot convert Bitrix24 value to datetime: {value!r}")
 
@@ -461,3 +515,148 @@ def timezone_to_bitrix(value: typing.Optional[zoneinfo.ZoneInfo], /, *, is_requi
         return value.key
 
     raise ValueError(f"Cannot convert Python value to Bitrix24 timezone: {value!r}")
+
+
+def bools_from_bitrix(
+        values: typing.Iterable[typing.Optional[typing.Union[bool, int, typing.Text]]],
+        /,
+        *,
+        is_required: bool = False,
+) -> typing.List[typing.Optional[bool]]:
+    """
+    Convert a column of Bitrix24 boolean values to Python ``bool``.
+
+    Produces the same results as calling ``bool_from_bitrix`` for every value,
+    but resolves common values with a single lookup.
+
+    Args:
+        values: Bitrix24 boolean values.
+        is_required: Whether default and empty values should be treated as an
+            error.
+
+    Returns:
+        List of converted values in the input order.
+
+    Raises:
+        ValueError: If a value cannot be converted to ``bool``.
+    """
+
+    converted: typing.List[typing.Optional[bool]] = []
+
+    for value in values:
+        if type(value) is bool:
+            converted.append(value)
+            continue
+
+        try:
+            converted.append(_BITRIX_BOOLS[value])
+        except (KeyError, TypeError):
+            converted.append(bool_from_bitrix(value, is_required=is_required))
+
+    return converted
+
+
+def datetimes_from_bitrix(
+        values: typing.Iterable[typing.Optional[typing.Text]],
+        /,
+        *,
+        is_required: bool = False,
+) -> typing.List[typing.Optional[datetime.datetime]]:
+    """
+    Convert a column of Bitrix24 datetime values to Python ``datetime``.
+
+    Produces the same results as calling ``datetime_from_bitrix`` for every
+    value. Every distinct string is parsed once, and its repetitions share
+    the same ``datetime`` object.
+
+    Args:
+        values: Bitrix24 datetime values.
+        is_required: Whether empty values should be treated as an error.
+
+    Returns:
+        List of converted values in the input order.
+
+    Raises:
+        ValueError: If a value is required but empty, or cannot be converted
+            to ``datetime``.
+    """
+    with conversion_cache():
+        return [datetime_from_bitrix(value, is_required=is_required) for value in values]
+
+
+def floats_from_bitrix(
+        values: typing.Iterable[typing.Optional[typing.Union[int, float, typing.Text]]],
+        /,
+        *,
+        is_required: bool = False,
+) -> typing.List[typing.Optional[float]]:
+    """
+    Convert a column of Bitrix24 float values to Python ``float``.
+
+    Produces the same results as calling ``float_from_bitrix`` for every value,
+    but converts non-empty strings directly.
+
+    Args:
+        values: Bitrix24 float values.
+        is_required: Whether empty values should be treated as an error.
+
+    Returns:
+        List of converted values in the input order.
+
+    Raises:
+        ValueError: If a value is required but empty, or cannot be converted
+            to ``float``.
+    """
+
+    converted: typing.List[typing.Optional[float]] = []
+
+    for value in values:
+        if type(value) is str and value:
+            try:
+                converted.append(float(value))
+                continue
+            except ValueError:
+                pass
+
+        converted.append(float_from_bitrix(value, is_required=is_required))
+
+    return converted
+
+
+def ints_from_bitrix(
+        values: typing.Iterable[typing.Optional[typing.Union[int, typing.Text]]],
+        /,
+        *,
+        is_required: bool = False,
+) -> typing.List[typing.Optional[int]]:
+    """
+    Convert a column of Bitrix24 integer values to Python ``int``.
+
+    Produces the same results as calling ``int_from_bitrix`` for every value,
+    but converts non-empty strings directly.
+
+    Args:
+        values: Bitrix24 integer values.
+        is_required: Whether empty values should be treated as an error.
+
+    Returns:
+        List of converted values in the input order.
+
+    Raises:
+        ValueError: If a value is required but empty, or cannot be converted
+            to ``int``.
+    """
+
+    converted: typing.List[typing.Optional[int]] = []
+
+    for value in values:
+        if type(value) is str and value:
+            try:
+                converted.append(int(value))
+                continue
+            except ValueError:
+                pass
+
+        converted.append(int_from_bitrix(value, is_required=is_required))
+
+    return converted
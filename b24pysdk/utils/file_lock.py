@@ -0,0 +1,52 @@
+import typing
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+__all__ = [
+    "locked_file",
+]
+
+
+def _lock(file: typing.IO):
+    """Block until an exclusive OS-level lock on ``file`` is acquired."""
+
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    else:  # pragma: no cover - Windows
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock(file: typing.IO):
+    """Release the lock acquired by ``_lock``."""
+
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def locked_file(file: typing.IO) -> typing.Iterator[typing.IO]:
+    """
+    Hold an exclusive lock on an open file shared by several processes.
+
+    Args:
+        file: File opened for reading and writing.
+
+    Yields:
+        The locked file.
+    """
+
+    _lock(file)
+
+    try:
+        yield file
+    finally:
+        _unlock(file)
@@ -1,11 +1,18 @@
 import functools
+import types
 import typing
 
+from .._config import Config
+
 __all__ = [
     "classproperty",
+    "is_sdk_helper",
+    "sdk_helper",
     "type_checker",
 ]
 
+_SDK_HELPER_ATTRIBUTE: typing.Final[typing.Text] = "__b24pysdk_helper__"
+
 
 class classproperty:  # noqa: N801
     """
@@ -99,6 +106,11 @@ class classproperty:  # noqa: N801
 
 _FT = typing.TypeVar("_FT", bound=typing.Callable[..., typing.Any])
 
+_Validator = typing.Callable[[typing.Any], bool]
+_ParamCheck = typing.Callable[[typing.Any], None]
+
+_UNION_ORIGINS: typing.Final[typing.Tuple[typing.Any, ...]] = tuple({typing.Union, getattr(types, "UnionType", typing.Union)})
+
 
 class _TypeChecker(typing.Generic[_FT]):
     """
@@ -108,13 +120,21 @@ class _TypeChecker(typing.Generic[_FT]):
     before calling the wrapped function. Supports standard types, ``Any``,
     ``Literal``, ``Union`` and ``Annotated`` with type-based metadata
     constraints.
+
+    Annotations are resolved and compiled into per-parameter validators on
+    the first checked call, so later calls only run the compiled checks.
+    Checking is controlled by :attr:`b24pysdk.Config.runtime_type_checks`.
     """
 
-    _HandlerType = typing.Callable[[typing.Any, typing.Type, typing.Text], bool]
+    _SAMPLE_INTERVAL: typing.Final[int] = 100
+    """In ``sampled`` mode, one call out of this many is checked."""
 
-    __slots__ = ("_func",)
+    __slots__ = ("_calls", "_func", "_keyword_checks", "_positional_checks")
 
     _func: _FT
+    _calls: int
+    _keyword_checks: typing.Optional[typing.Dict[typing.Text, _ParamCheck]]
+    _positional_checks: typing.Optional[typing.Tuple[typing.Optional[_ParamCheck], ...]]
 
     def __init__(self, func: _FT):
         """
@@ -124,6 +144,9 @@ class _TypeChecker(typing.Generic[_FT]):
             func: Function whose arguments should be checked at runtime.
         """
         self._func = func
+        self._calls = 0
+        self._keyword_checks = None
+        self._positional_checks = None
 
     def __get__(
             self,
@@ -138,13 +161,13 @@ class _TypeChecker(typing.Generic[_FT]):
             owner: Owner class provided by the descriptor protocol.
 
         Returns:
-            This checker for class access, or a partially bound callable for
-            instance access.
+            This checker for class access, or a bound method for instance
+            access.
         """
         if instance is None:
             return self
         else:
-            return functools.partial(self.__call__, instance)
+            return types.MethodType(self, instance)
 
     def __call__(self, *args, **kwargs):
         """
@@ -161,133 +184,175 @@ class _TypeChecker(typing.Generic[_FT]):
             TypeError: If any checked argument does not match its annotation.
         """
 
-        for index, arg in enumerate(args):
-            param_name = self._func.__code__.co_varnames[index]  # type: ignore[attr-defined]
-            self._check_param(arg, param_name)
+        if self._should_check():
+            if self._keyword_checks is None:
+                self._compile()
 
-        for param_name, arg in kwargs.items():
-            self._check_param(arg, param_name)
+            for param_check, arg in zip(self._positional_checks, args):
+                if param_check is not None:
+                    param_check(arg)
+
+            for param_name, arg in kwargs.items():
+                param_check = self._keyword_checks.get(param_name)
+
+                if param_check is not None:
+                    param_check(arg)
 
         return self._func(*args, **kwargs)
 
-    @property
-    def _handlers(self) -> typing.Dict[typing.Any, _HandlerType]:
+    def _should_check(self) -> bool:
         """
-        Return special type handlers.
+        Decide whether arguments of the current call are checked.
 
         Returns:
-            Mapping of supported typing origins to validation handlers.
+            True in ``on`` mode, False in ``off`` mode, and True for every
+            ``_SAMPLE_INTERVAL``-th call, starting with the first one, in
+            ``sampled`` mode.
         """
-        return {
-            typing.Annotated: self._annotated_handler,
-            typing.Any: self._any_handler,
-            typing.Literal: self._literal_handler,
-            typing.Union: self._union_handler,
-        }
 
-    @property
-    def _type_hints(self) -> typing.Dict[typing.Text, typing.Any]:
+        runtime_type_checks = Config().runtime_type_checks
+
+        if runtime_type_checks == "on":
+            return True
+
+        if runtime_type_checks == "off":
+            return False
+
+        calls = self._calls
+        self._calls = calls + 1
+
+        return calls % self._SAMPLE_INTERVAL == 0
+
+    def _compile(self):
         """
-        Return resolved type hints for the wrapped function.
+        Resolve annotations of the wrapped function and compile argument checks.
 
-        Returns:
-            Function annotations resolved with ``include_extras=True`` so
-            ``Annotated`` metadata is preserved.
+        Annotations are resolved with ``include_extras=True`` so ``Annotated``
+        metadata is preserved. Positional checks follow the order of the
+        function parameters.
         """
-        return typing.get_type_hints(self._func, include_extras=True)
 
-    def _check_param(
+        type_hints = typing.get_type_hints(self._func, include_extras=True)
+        type_hints.pop("return", None)
+
+        keyword_checks = {
+            param_name: self._compile_param_check(expected_type, param_name)
+            for param_name, expected_type in type_hints.items()
+            if expected_type
+        }
+
+        code = self._func.__code__  # type: ignore[attr-defined]
+        positional_names = code.co_varnames[:code.co_argcount]
+
+        self._positional_checks = tuple(keyword_checks.get(param_name) for param_name in positional_names)
+        self._keyword_checks = keyword_checks
+
+    def _compile_param_check(
             self,
-            value: typing.Any,
+            expected_type: typing.Any,
             param_name: typing.Text,
-    ):
+    ) -> _ParamCheck:
         """
-        Validate a single argument against its annotation.
+        Compile the check of a single argument against its annotation.
 
         Args:
-            value: Runtime argument value.
+            expected_type: Annotation of the parameter.
             param_name: Function parameter name.
 
-        Raises:
-            TypeError: If the value does not match the annotated type.
+        Returns:
+            Callable raising ``TypeError`` if the value does not match the
+            annotated type.
         """
 
-        expected_type = self._type_hints.get(param_name)
+        is_valid = self._compile_validator(expected_type, param_name)
 
-        if expected_type and not self._is_valid_type(value, expected_type, param_name):
-            raise TypeError(
-                f"Argument {param_name!r} must be of type {expected_type!r}, not {type(value).__name__!r}",
-            )
+        def check_param(value: typing.Any):
+            if not is_valid(value):
+                raise TypeError(
+                    f"Argument {param_name!r} must be of type {expected_type!r}, not {type(value).__name__!r}",
+                )
+
+        return check_param
 
-    def _is_valid_type(
+    def _compile_validator(
             self,
-            value: typing.Any,
-            expected_type: typing.Type,
+            expected_type: typing.Any,
             param_name: typing.Text,
-    ) -> bool:
+    ) -> _Validator:
         """
-        Check whether a value matches the expected type.
+        Compile a predicate checking whether a value matches the expected type.
 
         Args:
-            value: Runtime argument value.
             expected_type: Annotation or runtime type to validate against.
             param_name: Function parameter name used in error messages.
 
         Returns:
-            True if the value satisfies the expected type.
+            Predicate returning True if a value satisfies the expected type.
         """
 
         origin_type = typing.get_origin(expected_type) or expected_type
-        handler = self._handlers.get(origin_type)
 
-        if handler:
-            return handler(value, expected_type, param_name)
-        else:
-            return isinstance(value, origin_type)
+        if origin_type is typing.Annotated:
+            return self._compile_annotated_validator(expected_type, param_name)
+
+        if origin_type is typing.Any:
+            return self._any_validator
 
-    # ------------------------------------- Handlers -------------------------------------
+        if origin_type is typing.Literal:
+            return self._compile_literal_validator(expected_type, param_name)
 
-    def _annotated_handler(
+        if origin_type in _UNION_ORIGINS:
+            return self._compile_union_validator(expected_type, param_name)
+
+        return lambda value: isinstance(value, origin_type)
+
+    # ------------------------------------- Validators -------------------------------------
+
+    def _compile_annotated_validator(
             self,
-            value: typing.Any,
-            expected_type: typing.Type,
+            expected_type: typing.Any,
             param_name: typing.Text,
-    ) -> bool:
+    ) -> _Validator:
         """
-        Validate ``Annotated`` values.
+        Compile validation of ``Annotated`` values.
 
         The base type is checked first. Any metadata item that is itself a type
-        or a typing construct is treated as an additional type constraint.
+        or a typing construct is treated as an additional type constraint; if
+        such constraints are present and none matches, the compiled predicate
+        raises ``TypeError``.
 
         Args:
-            value: Runtime argument value.
             expected_type: ``Annotated`` type annotation.
             param_name: Function parameter name used in error messages.
 
         Returns:
-            True if the value satisfies the base type and metadata constraints.
-
-        Raises:
-            TypeError: If metadata type constraints are present and none match.
+            Predicate returning True if a value satisfies the base type and
+            metadata constraints.
         """
 
         base_type, *metas = typing.get_args(expected_type)
 
-        if not self._is_valid_type(value, base_type, param_name):
-            return False
+        is_valid_base = self._compile_validator(base_type, param_name)
 
-        expected_types = [meta for meta in metas if isinstance(meta, type) or typing.get_origin(meta) is not None]
+        constraint_types = [meta for meta in metas if isinstance(meta, type) or typing.get_origin(meta) is not None]
+        constraint_validators = [self._compile_validator(constraint_type, param_name) for constraint_type in constraint_types]
 
-        if expected_types and not any(self._is_valid_type(value, expected_type, param_name) for expected_type in expected_types):
-            raise TypeError(
-                f"Argument {param_name!r} must match one of type constraints "
-                f"{', '.join(repr(expected_type) for expected_type in expected_types)}, but got {value!r}",
-            )
+        def is_valid(value: typing.Any) -> bool:
+            if not is_valid_base(value):
+                return False
 
-        return True
+            if constraint_validators and not any(is_valid_constraint(value) for is_valid_constraint in constraint_validators):
+                raise TypeError(
+                    f"Argument {param_name!r} must match one of type constraints "
+                    f"{', '.join(repr(constraint_type) for constraint_type in constraint_types)}, but got {value!r}",
+                )
+
+            return True
+
+        return is_valid
 
     @staticmethod
-    def _any_handler(*_) -> bool:
+    def _any_validator(_: typing.Any) -> bool:
         """
         Validate ``Any`` values.
 
@@ -297,55 +362,72 @@ class _TypeChecker(typing.Generic[_FT]):
         return True
 
     @staticmethod
-    def _literal_handler(
-            value: typing.Any,
-            expected_type: typing.Type,
+    def _compile_literal_validator(
+            expected_type: typing.Any,
             param_name: typing.Text,
-    ) -> bool:
+    ) -> _Validator:
         """
-        Validate ``Literal`` values.
+        Compile validation of ``Literal`` values.
+
+        Allowed values are kept in a set for hashable arguments; unhashable
+        arguments fall back to comparing against every allowed value. The
+        compiled predicate raises ``TypeError`` if the value is not allowed.
 
         Args:
-            value: Runtime argument value.
             expected_type: ``Literal`` type annotation.
             param_name: Function parameter name used in error messages.
 
         Returns:
-            True if the value is one of the allowed literal values.
-
-        Raises:
-            TypeError: If the value is not allowed by the literal annotation.
+            Predicate returning True if the value is one of the allowed values.
         """
 
         allowed_values = typing.get_args(expected_type)
+        allowed_values_set = frozenset(allowed_values)
 
-        if value in allowed_values:
-            return True
+        def is_valid(value: typing.Any) -> bool:
+            try:
+                is_allowed = value in allowed_values_set
+            except TypeError:
+                is_allowed = value in allowed_values
+
+            if is_allowed:
+                return True
+
+            raise TypeError(
+                f"Argument {param_name!r} must be one of {', '.join(repr(allowed_value) for allowed_value in allowed_values)}, "
+                f"but got {value!r}",
+            )
 
-        raise TypeError(
-            f"Argument {param_name!r} must be one of {', '.join(repr(allowed_value) for allowed_value in allowed_values)}, "
-            f"but got {value!r}",
-        )
+        return is_valid
 
-    def _union_handler(
+    def _compile_union_validator(
             self,
-            value: typing.Any,
-            expected_type: typing.Type,
+            expected_type: typing.Any,
             param_name: typing.Text,
-    ) -> bool:
+    ) -> _Validator:
         """
-        Validate ``Union`` values.
+        Compile validation of ``Union`` values.
+
+        Unions of plain classes, such as ``Optional[int]``, are checked with a
+        single ``isinstance`` call.
 
         Args:
-            value: Runtime argument value.
             expected_type: ``Union`` type annotation.
             param_name: Function parameter name used in error messages.
 
         Returns:
-            True if the value matches at least one type from the union.
+            Predicate returning True if the value matches at least one type
+            from the union.
         """
-        expected_types = typing.get_args(expected_type)
-        return any(self._is_valid_type(value, expected_type, param_name) for expected_type in expected_types)
+
+        member_types = typing.get_args(expected_type)
+
+        if all(isinstance(member_type, type) and typing.get_origin(member_type) is None for member_type in member_types):
+            return lambda value: isinstance(value, member_types)
+
+        member_validators = [self._compile_validator(member_type, param_name) for member_type in member_types]
+
+        return lambda value: any(is_valid_member(value) for is_valid_member in member_validators)
 
 
 def type_checker(func: _FT) -> _FT:
@@ -369,3 +451,26 @@ def type_checker(func: _FT) -> _FT:
         return checker(*args, **kwargs)
 
     return wrapper
+
+
+def sdk_helper(func: _FT) -> _FT:
+    """
+    Mark a scope method as an SDK helper instead of a REST method wrapper.
+
+    Helpers, such as factories of bulk writers or event consumers, are left
+    out of the API method table of their context, so they are not reported
+    by ``get_supported_api_methods``.
+
+    Args:
+        func: Scope method to mark.
+
+    Returns:
+        The same function.
+    """
+    setattr(func, _SDK_HELPER_ATTRIBUTE, True)
+    return func
+
+
+def is_sdk_helper(func: typing.Callable) -> bool:
+    """Return whether ``func`` was marked with ``sdk_helper``."""
+    return getattr(func, _SDK_HELPER_ATTRIBUTE, False)
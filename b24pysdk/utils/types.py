@@ -21,6 +21,8 @@ __all__ = [
     "JSONValue",
     "Key",
     "Number",
+    "ProgressCallback",
+    "RuntimeTypeChecksLiteral",
     "Timeout",
     "UserTypeIDLiteral",
     "cast",
@@ -57,6 +59,9 @@ Key = typing.Union[typing.Text, int]
 Number = typing.Union[float, int]
 """A numeric type that can be either an integer or a float."""
 
+ProgressCallback = typing.Callable[[int, typing.Optional[int]], None]
+"""Callback receiving the number of transferred bytes and the total size in bytes, ``None`` when the size is unknown."""
+
 DefaultTimeout = typing.Union[Number, typing.Tuple[Number, Number]]
 """Timeout duration, represented as a single number or a tuple for connect and read timeouts."""
 
@@ -91,6 +96,9 @@ B24BoolLiteral = typing.Literal["D", "N", "Y"]
 B24BoolStrictLiteral = typing.Literal["N", "Y"]
 """Literal type for strict B24 boolean values: "Y" for Yes and "N" for No."""
 
+RuntimeTypeChecksLiteral = typing.Literal["off", "sampled", "on"]
+"""Runtime argument type checking modes of SDK methods: disabled, applied to a sample of calls, or applied to every call."""
+
 B24RequestTuple = typing.Tuple[typing.Text, typing.Optional[JSONDict]]
 """Tuple containing a REST API method name and its optional parameters - (api_method, params)."""
 
@@ -0,0 +1,102 @@
+"""
+Micro-benchmark of the per-call cost of SDK logging when it is disabled.
+
+Runs ``call_method`` against a canned in-memory HTTP response, so only SDK
+overhead is measured, with:
+
+- ``unguarded``: a logger that reports every level as enabled and drops
+  records in a ``logging.NullHandler``, as the default ``NullLogger`` did
+  before ``is_enabled_for`` guards; all log contexts are built;
+- ``NullLogger``: the default logger;
+- ``StreamLogger(INFO)``: a stream logger with debug records disabled.
+
+Usage::
+
+    make bench-logging
+    python -m benchmarks.logging_overhead [--calls N] [--repeat N]
+"""
+
+import argparse
+import io
+import logging
+import timeit
+from typing import Callable, Dict, Text
+from unittest.mock import patch
+
+import requests
+
+from b24pysdk import Config
+from b24pysdk.api.callers import call_method
+from b24pysdk.api.requesters import BitrixAPIRequester
+from b24pysdk.log import AbstractLogger, BaseLogger, NullLogger, StreamLogger
+
+_BODY: bytes = (
+    b'{"result": {"ID": "1", "TITLE": "Deal", "STAGE_ID": "NEW"},'
+    b' "time": {"start": 1700000000.0, "finish": 1700000000.05, "duration": 0.05, "processing": 0.01,'
+    b' "date_start": "2023-11-14T22:13:20+00:00", "date_finish": "2023-11-14T22:13:20+00:00"}}'
+)
+
+
+class _UnguardedLogger(BaseLogger):
+    """Logger building every record, as the SDK default did before level guards."""
+
+    _DEFAULT_HANDLER_TYPE = logging.NullHandler
+    _DEFAULT_LEVEL = logging.DEBUG
+
+    def is_enabled_for(self, level: int) -> bool:  # noqa: ARG002
+        return True
+
+
+class _Session:
+    """Session returning the same successful response without network access."""
+
+    def post(self, **_kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = _BODY
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+
+def _call():
+    call_method(
+        domain="example.bitrix24.com",
+        auth_token="webhook_token",  # noqa: S106
+        is_webhook=True,
+        api_method="crm.deal.get",
+        params={"id": 1},
+    )
+
+
+def _measure(logger: AbstractLogger, calls: int, repeat: int) -> float:
+    """Return the best per-call duration in microseconds."""
+
+    Config().logger = logger
+    return min(timeit.repeat(_call, number=calls, repeat=repeat)) / calls * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    loggers: Dict[Text, Callable[[], AbstractLogger]] = {
+        "unguarded": _UnguardedLogger,
+        "NullLogger": NullLogger,
+        "StreamLogger(INFO)": lambda: StreamLogger(name="b24pysdk_benchmark", level=logging.INFO, handlers=[logging.StreamHandler(io.StringIO())]),
+    }
+
+    with patch.object(BitrixAPIRequester, "_get_session", return_value=_Session()):
+        results = {name: _measure(make_logger(), args.calls, args.repeat) for name, make_logger in loggers.items()}
+
+    baseline = results["unguarded"]
+
+    print(f"{'logger':<20} {'us/call':>10} {'saved':>10}")
+
+    for name, duration in results.items():
+        print(f"{name:<20} {duration:>10.2f} {baseline - duration:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
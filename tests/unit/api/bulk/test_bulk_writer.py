@@ -0,0 +1,208 @@
+import threading
+from typing import Dict, Iterator, List, Optional, Set, Text
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from b24pysdk import BitrixToken, Client
+from b24pysdk.api.bulk import BulkWriter
+from b24pysdk.errors import BitrixAPIError, BitrixRequestError, BitrixRequestTimeout
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.bulk_writer,
+]
+
+_ROWS: int = 230
+_CHUNK_SIZE: int = 50
+_MAX_CONCURRENCY: int = 4
+_FIRST_ID: int = 1000
+_TIMEOUT: int = 30
+
+
+def _make_rows(count: int = _ROWS) -> Iterator[Dict[Text, Text]]:
+    return ({"TITLE": f"Deal {index}"} for index in range(count))
+
+
+class _FakeToken:
+    """Fake token executing ``crm.deal.add`` batch commands."""
+
+    def __init__(self, errors: Optional[Dict[int, List[Text]]] = None, request_errors: Optional[List[Exception]] = None):
+        self.errors = errors or {}
+        self.request_errors = request_errors or []
+        self.batches: List[Dict] = []
+        self.thread_ids: Set[int] = set()
+        self.lock = threading.Lock()
+        self.timeouts: Set[Optional[int]] = set()
+
+    def call_batch(self, methods, timeout=None):
+        with self.lock:
+            self.batches.append(methods)
+            self.thread_ids.add(threading.get_ident())
+            self.timeouts.add(timeout)
+
+            if self.request_errors:
+                raise self.request_errors.pop(0)
+
+        result = {}
+        result_error = {}
+
+        for key, (_, params) in methods.items():
+            index = int(params["fields"]["TITLE"].split()[-1])
+            row_errors = self.errors.get(index)
+
+            if row_errors:
+                result_error[key] = {"error": row_errors.pop(0), "error_description": "failed"}
+            else:
+                result[key] = _FIRST_ID + index
+
+        return {
+            "result": {
+                "result": result,
+                "result_error": result_error or [],
+                "result_total": [],
+                "result_next": [],
+                "result_time": [],
+            },
+            "time": {},
+        }
+
+
+def _make_api_error(error_code: Text) -> BitrixAPIError:
+    return BitrixAPIError(json_response={"error": error_code, "error_description": "failed"}, response=Mock(text=""))
+
+
+def test_all_rows_are_written():
+    token = _FakeToken()
+
+    records = list(BulkWriter(token, "crm.deal.add", timeout=_TIMEOUT).write(_make_rows()))
+
+    assert sorted(record.index for record in records) == list(range(_ROWS))
+    assert all(record.is_success and record.bitrix_id == _FIRST_ID + record.index for record in records)
+    assert [len(batch) for batch in token.batches] == [_CHUNK_SIZE] * (_ROWS // _CHUNK_SIZE) + [_ROWS % _CHUNK_SIZE]
+    assert token.timeouts == {_TIMEOUT}
+    assert token.batches[0]["row_0"] == ("crm.deal.add", {"fields": {"TITLE": "Deal 0"}})
+
+
+def test_only_transient_row_errors_are_retried():
+    token = _FakeToken(errors={3: ["QUERY_LIMIT_EXCEEDED"], 7: ["ERROR_VALIDATION"], 11: ["OVERLOAD_LIMIT"] * 3})
+
+    records = {record.index: record for record in BulkWriter(token, "crm.deal.add", retry_delay=0).write(_make_rows())}
+
+    assert records[3].is_success
+    assert records[3].attempts == len(["QUERY_LIMIT_EXCEEDED", "success"])
+    assert records[7].error_code == "ERROR_VALIDATION"
+    assert records[7].attempts == 1
+    assert records[11].error_code == "OVERLOAD_LIMIT"
+    assert records[11].attempts == len(["first", "retry", "retry"])
+    assert len(records) == _ROWS
+    assert sum(len(batch) for batch in token.batches) == _ROWS + len(["row_3", "row_11", "row_11"])
+
+
+def _make_timeout() -> BitrixRequestTimeout:
+    return BitrixRequestTimeout(timeout=_TIMEOUT, original_error=requests.ReadTimeout("read timed out"))
+
+
+def test_request_refused_before_sending_is_retried():
+    original_error = requests.ConnectionError("refused")
+    original_error.__cause__ = ConnectionRefusedError()
+    token = _FakeToken(request_errors=[BitrixRequestError(original_error=original_error)])
+
+    records = list(BulkWriter(token, "crm.deal.add", retry_delay=0).write(_make_rows(_CHUNK_SIZE)))
+
+    assert all(record.is_success and record.attempts == len(["refused", "success"]) for record in records)
+
+
+@pytest.mark.parametrize("error", [
+    _make_timeout(),
+    BitrixRequestError(original_error=requests.ConnectionError("Connection aborted")),
+    _make_api_error("INTERNAL_SERVER_ERROR"),
+])
+def test_possibly_executed_request_is_not_resent_by_default(error):
+    token = _FakeToken(request_errors=[error])
+
+    records = list(BulkWriter(token, "crm.deal.add", retry_delay=0).write(_make_rows(_CHUNK_SIZE)))
+
+    assert len(token.batches) == 1
+    assert len(records) == _CHUNK_SIZE
+    assert all(record.attempts == 1 and not record.is_success for record in records)
+
+
+def test_timed_out_chunk_is_reported_as_unknown():
+    token = _FakeToken(request_errors=[_make_timeout()])
+
+    records = list(BulkWriter(token, "crm.deal.add", retry_delay=0).write(_make_rows(_CHUNK_SIZE)))
+
+    assert {record.error_code for record in records} == {"BATCH_OUTCOME_UNKNOWN"}
+
+
+def test_possibly_executed_request_is_resent_when_enabled():
+    token = _FakeToken(request_errors=[_make_timeout(), _make_api_error("INTERNAL_SERVER_ERROR")])
+
+    records = list(BulkWriter(token, "crm.deal.add", retry_delay=0, retry_ambiguous=True).write(_make_rows(_CHUNK_SIZE)))
+
+    assert all(record.is_success and record.attempts == len(["timeout", "error", "success"]) for record in records)
+
+
+def test_failed_request_after_retries_is_reported_per_row():
+    token = _FakeToken(request_errors=[_make_api_error("QUERY_LIMIT_EXCEEDED")] * 2)
+
+    records = list(BulkWriter(token, "crm.deal.add", max_retries=1, retry_delay=0).write(_make_rows(_CHUNK_SIZE)))
+
+    assert len(records) == _CHUNK_SIZE
+    assert {record.error_code for record in records} == {"QUERY_LIMIT_EXCEEDED"}
+
+
+def test_non_transient_request_error_is_raised():
+    token = _FakeToken(request_errors=[_make_api_error("ACCESS_DENIED")])
+
+    with pytest.raises(BitrixAPIError):
+        list(BulkWriter(token, "crm.deal.add").write(_make_rows()))
+
+
+def test_feed_is_consumed_lazily():
+    consumed: List[int] = []
+
+    def rows():
+        for index in range(_ROWS * _ROWS):
+            consumed.append(index)
+            yield {"TITLE": f"Deal {index}"}
+
+    records = BulkWriter(_FakeToken(), "crm.deal.add", max_concurrency=_MAX_CONCURRENCY).write(rows())
+    next(records)
+    records.close()
+
+    assert len(consumed) <= _CHUNK_SIZE * (_MAX_CONCURRENCY + 1)
+
+
+def test_chunks_are_sent_concurrently_from_worker_threads():
+    token = _FakeToken()
+
+    list(BulkWriter(token, "crm.deal.add", max_concurrency=_MAX_CONCURRENCY).write(_make_rows()))
+
+    assert threading.get_ident() not in token.thread_ids
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"chunk_size": 0}, "Chunk_size"),
+        ({"chunk_size": _CHUNK_SIZE + 1}, "Chunk_size"),
+        ({"max_concurrency": 0}, "Max_concurrency"),
+        ({"max_retries": -1}, "Max_retries"),
+    ],
+)
+def test_invalid_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        BulkWriter(_FakeToken(), "crm.deal.add", **kwargs)
+
+
+def test_crm_item_bulk():
+    client = Client(BitrixToken(domain="example.bitrix24.com", auth_token="1/webhook_key"))  # noqa: S106
+
+    writer = client.crm.item.bulk(2, use_original_uf_names=False, import_=True)
+
+    assert writer.api_method == "crm.item.import"
+    assert writer._make_params({"title": "Deal"}) == {"fields": {"title": "Deal"}, "entityTypeId": 2, "useOriginalUfNames": "N"}
+    assert client.crm.deal.bulk(params={"REGISTER_SONET_EVENT": "N"})._make_params({}) == {"fields": {}, "params": {"REGISTER_SONET_EVENT": "N"}}
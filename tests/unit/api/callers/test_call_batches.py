@@ -0,0 +1,169 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, List, Text
+from unittest.mock import patch
+
+import pytest
+
+from b24pysdk import Config
+from b24pysdk.api.callers import acall_batches, call_batches
+from b24pysdk.api.callers._utils import get_empty_time
+from b24pysdk.api.callers.call_batches import _BatchesCaller
+from b24pysdk.api.requesters.http_session_pool import HTTPSessionPool
+from b24pysdk.schemas.api import BatchResponseData
+from b24pysdk.utils.types import B24RequestTuple, Key
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.callers,
+    pytest.mark.call_batches,
+]
+
+_AUTH_DATA = dict(
+    domain="example.bitrix24.com",
+    auth_token="1/webhook_key",  # noqa: S106
+    is_webhook=True,
+)
+_TOTAL_METHODS: int = 230
+_MAX_CONCURRENCY: int = 4
+_MAX_RETRIES: int = 7
+_MAX_DELAY: float = 0.01
+
+_METHODS: Dict[Text, B24RequestTuple] = {
+    f"deal_{index}": ("crm.deal.get", {"ID": index})
+    for index in range(_TOTAL_METHODS)
+}
+
+
+def _make_batch_response(methods: Dict[Key, B24RequestTuple], with_error: bool = False) -> BatchResponseData:
+    result_error = {next(iter(methods)): {"error": "ERROR"}} if with_error else []
+    return {
+        "result": {
+            "result": {key: params["ID"] for key, (_, params) in methods.items()},
+            "result_error": result_error,
+            "result_total": [],
+            "result_next": [],
+            "result_time": [],
+        },
+        "time": get_empty_time(),
+    }
+
+
+def _fake_fetch(_self, methods):
+    time.sleep(random.uniform(0, _MAX_DELAY))  # noqa: S311
+    return _make_batch_response(methods)
+
+
+async def _afake_fetch(_self, methods):
+    await asyncio.sleep(random.uniform(0, _MAX_DELAY))  # noqa: S311
+    return _make_batch_response(methods)
+
+
+def test_concurrent_result_matches_sequential_order():
+    with patch.object(_BatchesCaller, "_fetch_batch_response", _fake_fetch):
+        sequential = call_batches(methods=_METHODS, **_AUTH_DATA)
+        concurrent = call_batches(methods=_METHODS, max_concurrency=_MAX_CONCURRENCY, **_AUTH_DATA)
+
+    assert list(concurrent["result"]["result"]) == list(_METHODS)
+    assert concurrent["result"]["result"] == sequential["result"]["result"]
+
+
+def test_concurrency_is_bounded():
+    active: List[int] = [0, 0]
+    lock = threading.Lock()
+
+    def fetch(_self, methods):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(_MAX_DELAY)
+        with lock:
+            active[0] -= 1
+        return _make_batch_response(methods)
+
+    with patch.object(_BatchesCaller, "_fetch_batch_response", fetch):
+        call_batches(methods=_METHODS, max_concurrency=2, **_AUTH_DATA)
+
+    assert active[1] == len({"first", "second"})
+
+
+def test_halt_stops_scheduling_further_chunks():
+    fetched_chunks: List[Dict[Key, B24RequestTuple]] = []
+
+    def fetch(_self, methods):
+        fetched_chunks.append(methods)
+        return _make_batch_response(methods, with_error=True)
+
+    with patch.object(_BatchesCaller, "_fetch_batch_response", fetch):
+        response = call_batches(methods=_METHODS, halt=True, max_concurrency=2, **_AUTH_DATA)
+
+    assert len(fetched_chunks) <= len({"first", "second"})
+    assert response["result"]["result_error"]
+
+
+def test_worker_threads_use_caller_config():
+    config = Config()
+    max_retries = config.default_max_retries
+    seen_max_retries: List[int] = []
+
+    def fetch(_self, methods):
+        seen_max_retries.append(Config().default_max_retries)
+        return _make_batch_response(methods)
+
+    config.default_max_retries = _MAX_RETRIES
+
+    try:
+        with patch.object(_BatchesCaller, "_fetch_batch_response", fetch):
+            call_batches(methods=_METHODS, max_concurrency=_MAX_CONCURRENCY, **_AUTH_DATA)
+    finally:
+        config.default_max_retries = max_retries
+
+    assert set(seen_max_retries) == {_MAX_RETRIES}
+
+
+def test_consecutive_calls_reuse_worker_sessions():
+    url = f"https://{_AUTH_DATA['domain']}/rest/batch.json"
+    sessions_by_call: List[set] = [set(), set()]
+    lock = threading.Lock()
+
+    def fetch(_self, methods):
+        session = HTTPSessionPool().get_session(url)
+        time.sleep(_MAX_DELAY)
+
+        with lock:
+            sessions_by_call[-1].add(session)
+
+        return _make_batch_response(methods)
+
+    def run_calls():
+        sessions_by_call.clear()
+
+        for _ in range(2):
+            sessions_by_call.append(set())
+            call_batches(methods=_METHODS, max_concurrency=_MAX_CONCURRENCY, **_AUTH_DATA)
+
+        Config().worker_pool.shutdown()
+
+    # A fresh thread gets its own configuration and therefore its own worker pool
+    thread = threading.Thread(target=run_calls)
+
+    with patch.object(_BatchesCaller, "_fetch_batch_response", fetch):
+        thread.start()
+        thread.join()
+
+    assert sessions_by_call[0] & sessions_by_call[1]
+
+
+def test_async_concurrent_result_keeps_order():
+    with patch.object(_BatchesCaller, "_afetch_batch_response", _afake_fetch):
+        response = asyncio.run(acall_batches(methods=_METHODS, max_concurrency=_MAX_CONCURRENCY, **_AUTH_DATA))
+
+    assert list(response["result"]["result"]) == list(_METHODS)
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1, 1.5])
+def test_invalid_max_concurrency(max_concurrency):
+    with pytest.raises(ValueError, match="Max_concurrency"):
+        call_batches(methods=_METHODS, max_concurrency=max_concurrency, **_AUTH_DATA)
@@ -0,0 +1,80 @@
+import io
+from unittest.mock import patch
+
+import pytest
+
+from b24pysdk.api.callers import call_download, call_method_download
+from b24pysdk.api.callers._utils import build_query_params
+from b24pysdk.api.requesters import BitrixDownloadRequester
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.callers,
+    pytest.mark.call_download,
+]
+
+_DOWNLOAD_URL = "https://example.bitrix24.com/disk/downloadFile/1/?auth=token"
+_CONTENT = b"content"
+
+
+def _patch_download():
+    requesters = []
+
+    def download(requester):
+        requesters.append(requester)
+        requester._file.write(_CONTENT)
+        return requester._size + len(_CONTENT)
+
+    return requesters, patch.object(BitrixDownloadRequester, "download", autospec=True, side_effect=download)
+
+
+def test_path_is_written_and_closed(tmp_path):
+    path = tmp_path / "report.pdf"
+    requesters, download_patch = _patch_download()
+
+    with download_patch:
+        size = call_download(_DOWNLOAD_URL, destination=path)
+
+    assert size == len(_CONTENT)
+    assert path.read_bytes() == _CONTENT
+    assert requesters[0]._file.closed
+
+
+def test_resume_continues_existing_file(tmp_path):
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"partial")
+    requesters, download_patch = _patch_download()
+
+    with download_patch:
+        call_download(_DOWNLOAD_URL, destination=path, resume=True)
+
+    assert requesters[0]._size == len(b"partial")
+    assert path.read_bytes() == b"partial" + _CONTENT
+
+
+def test_method_download_url_has_no_format_suffix():
+    requesters, download_patch = _patch_download()
+
+    with download_patch:
+        call_method_download(
+            domain="example.bitrix24.com",
+            auth_token="access_token",  # noqa: S106
+            is_webhook=False,
+            api_method="catalog.product.download",
+            params={"fields": {"productId": 1, "fileId": 2}},
+            destination=io.BytesIO(),
+        )
+
+    requester = requesters[0]
+    assert requester._url.endswith("/rest/catalog.product.download")
+    assert ("fields[productId]", "1") in requester._query
+    assert ("auth", "access_token") in requester._query
+
+
+def test_build_query_params_flattens_nested_values():
+    assert build_query_params({"fields": {"id": 1, "flag": True, "ids": [2, 3], "skip": None}}) == [
+        ("fields[id]", "1"),
+        ("fields[flag]", "Y"),
+        ("fields[ids][0]", "2"),
+        ("fields[ids][1]", "3"),
+    ]
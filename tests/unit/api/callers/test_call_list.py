@@ -0,0 +1,187 @@
+import asyncio
+from types import GeneratorType
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from b24pysdk.api.callers import acall_list, call_list
+from b24pysdk.api.callers._utils import get_empty_time
+from b24pysdk.api.callers.call_list import _ListCaller
+from b24pysdk.schemas.api import BatchResponseData, ResponseData
+from b24pysdk.utils.types import B24RequestTuple
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.callers,
+    pytest.mark.call_list,
+]
+
+_AUTH_DATA = dict(
+    domain="example.bitrix24.com",
+    auth_token="1/webhook_key",  # noqa: S106
+    is_webhook=True,
+    api_method="crm.deal.list",
+)
+_PAGE_SIZE: int = 50
+_TOTAL: int = 260
+_LIMIT: int = 120
+_DURATION: float = 0.5
+_FILTER_IDS: List[int] = list(range(1, 121))
+
+_ITEMS = [{"ID": index} for index in range(_TOTAL)]
+
+
+def _make_time() -> dict:
+    return get_empty_time() | {"duration": _DURATION, "processing": _DURATION}
+
+
+def _fake_first_response(_self) -> ResponseData:
+    return {
+        "result": _ITEMS[:_PAGE_SIZE],
+        "next": _PAGE_SIZE,
+        "total": _TOTAL,
+        "time": _make_time(),
+    }
+
+
+def _make_batch_response(methods: List[B24RequestTuple], with_error: bool = False) -> BatchResponseData:
+    result = {}
+
+    for index, (_, params) in enumerate(methods):
+        if "start" in params:
+            result[f"cmd_{index}"] = _ITEMS[params["start"]:params["start"] + _PAGE_SIZE]
+        else:
+            result[f"cmd_{index}"] = [{"ID": item_id} for item_id in params["filter"]["@ID"]]
+
+    return {
+        "result": {
+            "result": result,
+            "result_error": {"cmd_0": {"error": "ERROR"}} if with_error else [],
+            "result_total": [],
+            "result_next": [],
+            "result_time": [],
+        },
+        "time": _make_time(),
+    }
+
+
+async def _afake_first_response(_self) -> ResponseData:
+    return _fake_first_response(_self)
+
+
+async def _afake_batches_response(_self, methods: List[B24RequestTuple]) -> BatchResponseData:
+    return _make_batch_response(methods)
+
+
+@pytest.fixture
+def fetched_groups():
+    groups: List[List[B24RequestTuple]] = []
+
+    def fetch(_self, methods):
+        groups.append(methods)
+        return _make_batch_response(methods)
+
+    with patch.object(_ListCaller, "_fetch_first_response", _fake_first_response), \
+            patch.object(_ListCaller, "_fetch_batches_response", fetch):
+        yield groups
+
+
+def test_stream_is_lazy(fetched_groups):
+    response = call_list(stream=True, **_AUTH_DATA)
+
+    assert isinstance(response["result"], GeneratorType)
+    assert fetched_groups == []
+
+    first_page = [next(response["result"]) for _ in range(_PAGE_SIZE)]
+
+    assert first_page == _ITEMS[:_PAGE_SIZE]
+    assert fetched_groups == []
+
+    next(response["result"])
+
+    assert len(fetched_groups) == 1
+
+
+@pytest.mark.usefixtures("fetched_groups")
+def test_stream_matches_materialized_result():
+    materialized = call_list(**_AUTH_DATA)
+    streamed = call_list(stream=True, **_AUTH_DATA)
+
+    assert list(streamed["result"]) == materialized["result"] == _ITEMS
+
+
+def test_stream_loads_one_group_at_a_time(fetched_groups):
+    response = call_list(stream=True, max_concurrency=1, **_AUTH_DATA)
+
+    items = list(response["result"])
+
+    assert items == _ITEMS
+    assert len(fetched_groups) == 1
+
+    with patch.object(_ListCaller, "_MAX_BATCH_SIZE", 2):
+        fetched_groups.clear()
+        list(call_list(stream=True, max_concurrency=1, **_AUTH_DATA)["result"])
+
+    assert [len(group) for group in fetched_groups] == [2, 2, 1]
+
+
+@pytest.mark.usefixtures("fetched_groups")
+def test_stream_respects_limit():
+    response = call_list(limit=_LIMIT, stream=True, **_AUTH_DATA)
+
+    assert list(response["result"]) == _ITEMS[:_LIMIT]
+
+
+def test_stream_accumulates_time(fetched_groups):
+    with patch.object(_ListCaller, "_MAX_BATCH_SIZE", 2):
+        response = call_list(stream=True, **_AUTH_DATA)
+
+        assert response["time"]["duration"] == _DURATION
+
+        list(response["result"])
+
+    assert response["time"]["duration"] == _DURATION * (1 + len(fetched_groups))
+
+
+def test_stream_stops_after_group_with_errors():
+    groups: List[List[B24RequestTuple]] = []
+
+    def fetch(_self, methods):
+        groups.append(methods)
+        return _make_batch_response(methods, with_error=True)
+
+    with patch.object(_ListCaller, "_fetch_first_response", _fake_first_response), \
+            patch.object(_ListCaller, "_fetch_batches_response", fetch), \
+            patch.object(_ListCaller, "_MAX_BATCH_SIZE", 2):
+        items = list(call_list(stream=True, **_AUTH_DATA)["result"])
+
+    assert len(groups) == 1
+    assert items == _ITEMS[:_PAGE_SIZE * 3]
+
+
+def test_stream_filter_by_id(fetched_groups):
+    params = {"filter": {"@ID": _FILTER_IDS}, "select": ["ID"]}
+
+    response = call_list(params=params, stream=True, **_AUTH_DATA)
+
+    assert fetched_groups == []
+    assert [item["ID"] for item in response["result"]] == _FILTER_IDS
+
+
+def test_stream_with_non_positive_limit(fetched_groups):
+    assert list(call_list(limit=0, stream=True, **_AUTH_DATA)["result"]) == []
+    assert fetched_groups == []
+
+
+def test_async_stream_is_rejected():
+    with pytest.raises(TypeError, match="Streaming list requests"):
+        asyncio.run(_ListCaller(stream=True, **_AUTH_DATA).acall())
+
+
+def test_async_list_is_not_streamed():
+    with patch.object(_ListCaller, "_afetch_first_response", _afake_first_response), \
+            patch.object(_ListCaller, "_afetch_batches_response", _afake_batches_response):
+        response = asyncio.run(acall_list(**_AUTH_DATA))
+
+    assert response["result"] == _ITEMS
@@ -0,0 +1,186 @@
+import threading
+from typing import List, Set
+from unittest.mock import patch
+
+import pytest
+
+from b24pysdk.api.callers import call_list_fast
+from b24pysdk.api.callers._utils import get_empty_time
+from b24pysdk.api.callers.call_list_fast import _ListFastCaller
+from b24pysdk.schemas.api import ResponseData
+from b24pysdk.utils.types import JSONGenerator
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.callers,
+    pytest.mark.call_list_fast,
+]
+
+_AUTH_DATA = dict(
+    domain="example.bitrix24.com",
+    auth_token="1/webhook_key",  # noqa: S106
+    is_webhook=True,
+    api_method="crm.item.list",
+)
+_PAGE_SIZE: int = 50
+_PARTITIONS: int = 4
+_LIMIT: int = 130
+_DURATION: float = 0.5
+_SMALL_SPAN_IDS: List[int] = list(range(1, 61))
+
+_IDS: List[int] = [item_id for item_id in range(1, 2001) if item_id % 7]
+
+
+def _make_time() -> dict:
+    return get_empty_time() | {"duration": _DURATION, "processing": _DURATION}
+
+
+class _FakePortal:
+    """Fake list method applying ``>=ID``/``<ID`` filters of partition callers."""
+
+    def __init__(self, ids: List[int], failing_lower_id: int = 0):
+        self.ids = ids
+        self.failing_lower_id = failing_lower_id
+        self.partition_filters: List[dict] = []
+        self.thread_ids: Set[int] = set()
+        self.lock = threading.Lock()
+
+    def fetch_boundary_response(self, sorting) -> ResponseData:
+        ids = sorted(self.ids, reverse=sorting == "DESC")[:_PAGE_SIZE]
+        return {"result": {"items": [{"id": item_id} for item_id in ids]}, "time": _make_time()}
+
+    def generate_result(self, caller: _ListFastCaller) -> JSONGenerator:
+        item_filter = {key.upper(): value for key, value in caller._params["filter"].items()}
+
+        with self.lock:
+            self.partition_filters.append(item_filter)
+            self.thread_ids.add(threading.get_ident())
+
+        if item_filter[">=ID"] == self.failing_lower_id:
+            raise RuntimeError("partition failed")
+
+        ids = [item_id for item_id in self.ids if item_filter[">=ID"] <= item_id < item_filter["<ID"]]
+
+        caller._add_time(_make_time())
+
+        for item_id in sorted(ids, reverse=caller._descending):
+            yield {"id": item_id}
+
+    def patch(self):
+        portal = self
+
+        def fetch_boundary_response(_caller, sorting):
+            return portal.fetch_boundary_response(sorting)
+
+        def generate_result(caller):
+            return portal.generate_result(caller)
+
+        return patch.multiple(
+            _ListFastCaller,
+            _fetch_boundary_response=fetch_boundary_response,
+            _generate_result=generate_result,
+        )
+
+
+def _get_ids(response) -> List[int]:
+    return [item["id"] for item in response["result"]]
+
+
+def test_partitioned_ordered_ascending():
+    portal = _FakePortal(_IDS)
+
+    with portal.patch():
+        ids = _get_ids(call_list_fast(partitions=_PARTITIONS, **_AUTH_DATA))
+
+    assert ids == _IDS
+    assert len(portal.partition_filters) == _PARTITIONS
+    assert portal.partition_filters[0][">=ID"] == _IDS[0]
+    assert portal.partition_filters[-1]["<ID"] == _IDS[-1] + 1
+
+
+def test_partitioned_ordered_descending():
+    portal = _FakePortal(_IDS)
+
+    with portal.patch():
+        ids = _get_ids(call_list_fast(descending=True, partitions=_PARTITIONS, **_AUTH_DATA))
+
+    assert ids == sorted(_IDS, reverse=True)
+
+
+def test_partitioned_unordered():
+    portal = _FakePortal(_IDS)
+
+    with portal.patch():
+        ids = _get_ids(call_list_fast(partitions=_PARTITIONS, ordered=False, **_AUTH_DATA))
+
+    assert sorted(ids) == _IDS
+
+
+def test_partitions_are_walked_in_worker_threads():
+    portal = _FakePortal(_IDS)
+
+    with portal.patch():
+        _get_ids(call_list_fast(partitions=_PARTITIONS, **_AUTH_DATA))
+
+    assert threading.get_ident() not in portal.thread_ids
+
+
+def test_partitioned_respects_limit():
+    portal = _FakePortal(_IDS)
+
+    with portal.patch():
+        ids = _get_ids(call_list_fast(partitions=_PARTITIONS, limit=_LIMIT, **_AUTH_DATA))
+
+    assert ids == _IDS[:_LIMIT]
+
+
+def test_partitions_are_capped_by_id_span():
+    portal = _FakePortal(_SMALL_SPAN_IDS)
+
+    with portal.patch():
+        ids = _get_ids(call_list_fast(partitions=_PARTITIONS, **_AUTH_DATA))
+
+    assert ids == _SMALL_SPAN_IDS
+    assert len(portal.partition_filters) == len(_SMALL_SPAN_IDS) // _PAGE_SIZE + 1
+
+
+def test_partitioned_empty_list():
+    portal = _FakePortal([])
+
+    with portal.patch():
+        ids = _get_ids(call_list_fast(partitions=_PARTITIONS, **_AUTH_DATA))
+
+    assert ids == []
+    assert portal.partition_filters == []
+
+
+def test_partitioned_time_is_accumulated():
+    portal = _FakePortal(_IDS)
+
+    with portal.patch():
+        response = call_list_fast(partitions=_PARTITIONS, **_AUTH_DATA)
+        _get_ids(response)
+
+    assert response["time"]["duration"] == _DURATION * (len({"ASC", "DESC"}) + _PARTITIONS)
+
+
+def test_partition_error_is_raised_by_consumer():
+    portal = _FakePortal(_IDS, failing_lower_id=_IDS[0])
+
+    with portal.patch(), pytest.raises(RuntimeError, match="partition failed"):
+        _get_ids(call_list_fast(partitions=_PARTITIONS, **_AUTH_DATA))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_dead_partition_walker_is_detected(ordered):
+    portal = _FakePortal(_IDS)
+
+    with portal.patch(), patch.object(_ListFastCaller, "_walk_partition"), \
+            pytest.raises(RuntimeError, match="Partition walker stopped"):
+        _get_ids(call_list_fast(partitions=_PARTITIONS, ordered=ordered, **_AUTH_DATA))
+
+
+@pytest.mark.parametrize("partitions", [0, -1, 1.5])
+def test_invalid_partitions(partitions):
+    with pytest.raises(ValueError, match="Partitions"):
+        call_list_fast(partitions=partitions, **_AUTH_DATA)
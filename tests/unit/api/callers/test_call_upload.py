@@ -0,0 +1,54 @@
+import io
+from unittest.mock import patch
+
+import pytest
+
+from b24pysdk.api.callers import call_upload
+from b24pysdk.api.requesters import BitrixAPIUploadRequester
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.callers,
+    pytest.mark.call_upload,
+]
+
+_UPLOAD_URL = "https://example.bitrix24.com/rest/upload.json?auth=token"
+
+
+def _call_upload(**kwargs):
+    streams = []
+
+    def call(requester):
+        streams.append(requester._stream)
+        return {"result": {"ID": 10}, "time": {}}
+
+    with patch.object(BitrixAPIUploadRequester, "call", autospec=True, side_effect=call):
+        json_response = call_upload(_UPLOAD_URL, **kwargs)
+
+    return json_response, streams[0]
+
+
+def test_path_is_opened_and_closed(tmp_path):
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"content")
+
+    json_response, stream = _call_upload(file=path, field="data")
+
+    assert json_response["result"] == {"ID": 10}
+    assert stream.file_size == len(b"content")
+    assert b'name="data"; filename="report.pdf"' in stream._head
+    assert stream._file.closed
+
+
+def test_file_object_is_left_open():
+    file = io.BytesIO(b"content")
+
+    _, stream = _call_upload(file=file, filename="report.pdf")
+
+    assert stream._file is file
+    assert not file.closed
+
+
+def test_filename_is_required_for_unnamed_file_objects():
+    with pytest.raises(ValueError, match="filename"):
+        call_upload(_UPLOAD_URL, file=io.BytesIO(b"content"))
@@ -0,0 +1,250 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Text
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from b24pysdk import BitrixWebhook, Config
+from b24pysdk.api.instrumentation import APICallOutcome, APICallRecord, OpenTelemetryAPICallObserver, PrometheusAPICallObserver, api_call_hooks
+from b24pysdk.api.requesters import BitrixAPIRequester
+from b24pysdk.api.requesters.json_codecs import get_json_codec
+from b24pysdk.api.requests import BitrixAPIRequest
+from b24pysdk.constants.version import B24APIVersion
+from b24pysdk.errors import BitrixAPIError, BitrixRequestTimeout
+from tests.unit.examples import EXAMPLE_TIME_1
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.api_call_hooks,
+]
+
+_DOMAIN: Text = "example.bitrix24.com"
+_URL: Text = f"https://{_DOMAIN}/rest/1/webhook_key/crm.deal.get.json"
+_PARAMS: Dict[Text, Any] = {"id": 1}
+_PAYLOAD: Dict[Text, Any] = {"result": {"ID": "1"}, "time": EXAMPLE_TIME_1 | {"operating": 0.5}}
+_MAX_RETRIES: int = 3
+
+
+class _Session:
+    """Session returning prepared responses with the request they answer."""
+
+    def __init__(self, *responses: Any):
+        self.responses = list(responses)
+
+    def post(self, *, url, data=None, **_kwargs) -> requests.Response:
+        response = self.responses.pop(0)
+
+        if isinstance(response, Exception):
+            raise response
+
+        response.request = requests.Request("POST", url, data=data).prepare()
+
+        return response
+
+
+class _Transport:
+    """Async transport returning prepared responses."""
+
+    def __init__(self, *responses: requests.Response):
+        self.responses = list(responses)
+
+    async def request(self, *_args, **_kwargs) -> requests.Response:
+        return self.responses.pop(0)
+
+    async def aclose(self):
+        pass
+
+
+class _Metric:
+    """Metric recording updates of its label sets."""
+
+    def __init__(self):
+        self.values: Dict[tuple, float] = {}
+        self._labels: Optional[tuple] = None
+
+    def labels(self, **labels):
+        self._labels = tuple(sorted(labels.items()))
+        return self
+
+    def inc(self, amount: float = 1):
+        self.values[self._labels] = self.values.get(self._labels, 0) + amount
+
+    observe = inc
+
+
+def _make_response(status_code: int = 200, payload: Optional[Dict] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(_PAYLOAD if payload is None else payload).encode()
+    response.url = _URL
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def records() -> List[APICallRecord]:
+    collected: List[APICallRecord] = []
+    api_call_hooks.connect(collected.append)
+    yield collected
+    api_call_hooks.clear()
+
+
+def _call(*responses: Any, **kwargs) -> Dict:
+    with patch.object(BitrixAPIRequester, "_get_session", return_value=_Session(*responses)):
+        return BitrixAPIRequester(_URL, params=_PARAMS, **kwargs).call()
+
+
+def test_records_are_not_created_without_observers():
+    with patch.object(APICallRecord, "from_url") as from_url:
+        assert _call(_make_response()) == _PAYLOAD
+
+    assert not api_call_hooks.enabled
+    from_url.assert_not_called()
+
+
+def test_successful_call_is_recorded(records):
+    _call(_make_response())
+
+    record, = records
+
+    assert (record.portal, record.method, record.api_version) == (_DOMAIN, "crm.deal.get", B24APIVersion.V2)
+    assert record.outcome == APICallOutcome.SUCCESS
+    assert record.error is None
+    assert (record.attempts, record.retries, record.status_code) == (1, 0, 200)
+    assert record.bytes_out == len(get_json_codec().encode(_PARAMS))
+    assert record.bytes_in == len(json.dumps(_PAYLOAD))
+    assert (record.server_duration, record.server_processing, record.server_operating) == (5.0, 0.1, 0.5)
+    assert record.decode_time is not None
+    assert record.convert_time is None
+    assert record.duration >= record.http_time
+    assert set(record.phase_timings) == {"rate_limit_wait", "http", "decode", "retry_sleep"}
+
+
+def test_retries_are_recorded(records):
+    with patch("b24pysdk.api.requesters._base_requester.time.sleep") as sleep:
+        _call(_make_response(503, {"error": "QUERY_LIMIT_EXCEEDED"}), _make_response(), max_retries=_MAX_RETRIES)
+
+    record, = records
+
+    assert (record.attempts, record.retries) == (len({"first", "second"}), 1)
+    assert record.retry_sleep == sleep.call_args.args[0]
+    assert record.outcome == APICallOutcome.SUCCESS
+
+
+@pytest.mark.parametrize(("response", "outcome", "error"), [
+    (_make_response(400, {"error": "INVALID_REQUEST"}), APICallOutcome.API_ERROR, BitrixAPIError),
+    (requests.Timeout("timeout"), APICallOutcome.TIMEOUT, BitrixRequestTimeout),
+])
+def test_failed_call_is_recorded(records, response, outcome, error):
+    with pytest.raises(error):
+        _call(response, max_retries=1)
+
+    record, = records
+
+    assert record.outcome == outcome
+    assert isinstance(record.error, error)
+
+
+def test_async_call_is_recorded(records):
+    config = Config()
+    async_transport = config.async_transport
+    config.async_transport = _Transport(_make_response())
+
+    try:
+        asyncio.run(BitrixAPIRequester(_URL, params=_PARAMS).acall())
+    finally:
+        config.async_transport = async_transport
+
+    record, = records
+
+    assert record.method == "crm.deal.get"
+    assert record.bytes_out == len(get_json_codec().encode(_PARAMS))
+    assert record.time_to_headers is None
+
+
+@pytest.mark.usefixtures("records")
+def test_async_call_encodes_body_once():
+    config = Config()
+    async_transport = config.async_transport
+    config.async_transport = _Transport(_make_response())
+
+    try:
+        with patch.object(type(get_json_codec()), "encode", autospec=True, side_effect=lambda _codec, obj: json.dumps(obj).encode()) as encode:
+            asyncio.run(BitrixAPIRequester(_URL, params=_PARAMS).acall())
+    finally:
+        config.async_transport = async_transport
+
+    encode.assert_called_once()
+
+
+def test_request_object_records_conversion_time(records):
+    bitrix_token = BitrixWebhook(domain=_DOMAIN, webhook_token="1/webhook_key")  # noqa: S106
+
+    with patch.object(BitrixAPIRequester, "_get_session", return_value=_Session(_make_response())):
+        BitrixAPIRequest(bitrix_token=bitrix_token, api_method="crm.deal.get", params=_PARAMS).call()
+
+    record, = records
+
+    assert record.method == "crm.deal.get"
+    assert record.convert_time is not None
+
+
+def test_observer_errors_do_not_fail_calls(records):
+    failing_observer = api_call_hooks.connect(Mock(side_effect=RuntimeError("failed")))
+
+    assert _call(_make_response()) == _PAYLOAD
+    failing_observer.assert_called_once()
+    assert len(records) == 1
+
+
+@pytest.mark.parametrize(("url", "method", "api_version"), [
+    (f"https://{_DOMAIN}/rest/batch.json", "batch", B24APIVersion.V2),
+    (f"https://{_DOMAIN}/rest/api/1/webhook_key/tasks.task.get", "tasks.task.get", B24APIVersion.V3),
+    (f"https://{_DOMAIN}/rest/api/tasks.task.get", "tasks.task.get", B24APIVersion.V3),
+])
+def test_record_is_started_from_url(url, method, api_version):
+    record = APICallRecord.from_url(url)
+
+    assert (record.portal, record.method, record.api_version) == (_DOMAIN, method, api_version)
+
+
+def test_connect_rejects_non_callable():
+    with pytest.raises(TypeError):
+        api_call_hooks.connect(object())
+
+
+def test_prometheus_observer_updates_metrics(records):
+    calls, phase_duration, payload_bytes = _Metric(), _Metric(), _Metric()
+    api_call_hooks.connect(PrometheusAPICallObserver(calls=calls, phase_duration=phase_duration, payload_bytes=payload_bytes))
+
+    _call(_make_response())
+
+    labels = (("api_version", "2"), ("method", "crm.deal.get"), ("outcome", "success"))
+
+    assert calls.values == {labels: 1}
+    assert payload_bytes.values[tuple(sorted((*labels, ("direction", "out"))))] == records[0].bytes_out
+    assert {dict(key)["phase"] for key in phase_duration.values} == set(records[0].phase_timings)
+
+
+def test_opentelemetry_observer_records_span(records):
+    pytest.importorskip("opentelemetry.trace")
+
+    tracer = Mock()
+    api_call_hooks.connect(OpenTelemetryAPICallObserver(tracer))
+
+    with pytest.raises(BitrixAPIError):
+        _call(_make_response(400, {"error": "INVALID_REQUEST"}), max_retries=1)
+
+    span = tracer.start_span.return_value
+    name, = tracer.start_span.call_args.args
+    attributes = tracer.start_span.call_args.kwargs["attributes"]
+
+    assert name == "crm.deal.get"
+    assert attributes["server.address"] == _DOMAIN
+    assert attributes["b24pysdk.outcome"] == "api_error"
+    span.record_exception.assert_called_once_with(records[0].error)
+    span.set_status.assert_called_once()
+    assert span.end.call_args.kwargs["end_time"] >= tracer.start_span.call_args.kwargs["start_time"]
+
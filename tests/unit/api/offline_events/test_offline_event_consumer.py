@@ -0,0 +1,236 @@
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Set, Text, Tuple
+
+import pytest
+
+from b24pysdk import Client
+from b24pysdk.api.offline_events import (
+    MemoryOfflineCheckpointStore,
+    OfflineCheckpoint,
+    OfflineEvent,
+    OfflineEventConsumer,
+    SQLiteOfflineCheckpointStore,
+)
+from b24pysdk.errors import BitrixRequestError
+from tests.unit.examples import TOKEN_MOCK
+from tests.unit.helpers import assert_slots
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.offline_event_consumer,
+]
+
+_EVENTS: int = 120
+_LIMIT: int = 10
+_MAX_LIMIT: int = 40
+_PROCESS_ID: Text = "process_1"
+_KEY: Text = "example.bitrix24.com"
+_IDLE_DELAY: int = 30
+
+
+class _FakeQueue:
+    """Fake token serving an offline event queue."""
+
+    def __init__(self, count: int = _EVENTS, request_errors: Optional[List[Exception]] = None):
+        self.events: Dict[int, Dict] = {
+            index: {
+                "ID": str(index),
+                "MESSAGE_ID": f"message_{index}",
+                "EVENT_NAME": "ONCRMDEALADD",
+                "EVENT_DATA": {"FIELDS": {"ID": index}},
+                "EVENT_ADDITIONAL": {"user_id": "1"},
+                "TIMESTAMP_X": "2024-01-15T10:30:00+03:00",
+            }
+            for index in range(1, count + 1)
+        }
+        self.marked: Set[int] = set()
+        self.errors: Set[Text] = set()
+        self.limits: List[int] = []
+        self.calls: List[Tuple[Text, Dict]] = []
+        self.request_errors = request_errors or []
+        self.domain = _KEY
+
+    def call_method(self, api_method, params=None, timeout=None):  # noqa: ARG002
+        self.calls.append((api_method, params))
+
+        if api_method == "event.offline.get":
+            if self.request_errors:
+                raise self.request_errors.pop(0)
+
+            self.limits.append(params["limit"])
+            assert params["clear"] == 0
+            selected = [
+                event_id for event_id in sorted(self.events)
+                if f"message_{event_id}" not in self.errors and (event_id not in self.marked or params.get("process_id") == _PROCESS_ID)
+            ][:params["limit"]]
+            self.marked.update(selected)
+            return {"result": {"process_id": _PROCESS_ID, "events": [self.events[event_id] for event_id in selected]}}
+
+        assert params["process_id"] == _PROCESS_ID
+
+        if api_method == "event.offline.clear":
+            for event_id in params["id"]:
+                self.events.pop(event_id)
+        else:
+            self.errors.update(params["message_id"])
+
+        return {"result": True}
+
+    async def acall_method(self, api_method, params=None, timeout=None):
+        return self.call_method(api_method, params, timeout)
+
+
+def test_slots():
+    assert_slots(OfflineEventConsumer)
+
+
+def test_event_is_parsed():
+    event = OfflineEvent.from_dict(_FakeQueue(1).events[1])
+
+    assert event.bitrix_id == 1
+    assert event.message_id == "message_1"
+    assert event.event_data == {"FIELDS": {"ID": 1}}
+    assert event.timestamp.year == 2024  # noqa: PLR2004
+
+
+def test_queue_is_drained_and_acknowledged():
+    queue = _FakeQueue()
+    handled: List[int] = []
+    lock = threading.Lock()
+
+    def handler(event: OfflineEvent):
+        with lock:
+            handled.append(event.bitrix_id)
+
+    consumer = OfflineEventConsumer(queue, handler, limit=_LIMIT, max_limit=_MAX_LIMIT, max_concurrency=4)
+    stats = consumer.run(stop_when_idle=True)
+
+    assert sorted(handled) == list(range(1, _EVENTS + 1))
+    assert not queue.events
+    assert stats.received == stats.processed == _EVENTS
+    assert stats.failed == 0
+    assert stats.lag is not None
+    assert consumer.process_id == _PROCESS_ID
+
+
+def test_limit_grows_with_backlog_and_shrinks_when_drained():
+    queue = _FakeQueue()
+
+    OfflineEventConsumer(queue, lambda _: None, limit=_LIMIT, max_limit=_MAX_LIMIT).run(stop_when_idle=True)
+
+    assert queue.limits[:3] == [_LIMIT, _LIMIT * 2, _MAX_LIMIT]
+    assert max(queue.limits) == _MAX_LIMIT
+    assert queue.limits[-1] < _MAX_LIMIT
+
+
+def test_failed_events_are_reported_with_error():
+    queue = _FakeQueue(count=5)
+
+    def handler(event: OfflineEvent):
+        if event.bitrix_id == 3:  # noqa: PLR2004
+            raise RuntimeError("failed")
+
+    stats = OfflineEventConsumer(queue, handler).run(stop_when_idle=True)
+
+    assert queue.errors == {"message_3"}
+    assert list(queue.events) == [3]
+    assert stats.processed == 4  # noqa: PLR2004
+    assert stats.failed == 1
+
+
+def test_pending_acknowledgements_are_sent_after_restart():
+    queue = _FakeQueue(count=3)
+    store = MemoryOfflineCheckpointStore()
+    store.save(_KEY, OfflineCheckpoint(process_id=_PROCESS_ID, processed_ids=(1, 2)))
+    queue.marked.update({1, 2})
+    handled: List[int] = []
+
+    OfflineEventConsumer(queue, lambda event: handled.append(event.bitrix_id), checkpoint_store=store).run(stop_when_idle=True)
+
+    assert queue.calls[0] == ("event.offline.clear", {"process_id": _PROCESS_ID, "id": [1, 2]})
+    assert handled == [3]
+    assert store.load(_KEY) == OfflineCheckpoint(process_id=_PROCESS_ID)
+
+
+def test_connection_errors_are_retried():
+    queue = _FakeQueue(count=2, request_errors=[BitrixRequestError(original_error=ConnectionError("reset"))])
+
+    stats = OfflineEventConsumer(queue, lambda _: None, idle_delay=0, max_idle_delay=0).run(stop_when_idle=True)
+
+    assert stats.processed == 2  # noqa: PLR2004
+
+
+def test_async_consumer_awaits_handler():
+    queue = _FakeQueue(count=30)
+    handled: List[int] = []
+
+    async def handler(event: OfflineEvent):
+        await asyncio.sleep(0)
+        handled.append(event.bitrix_id)
+
+    stats = asyncio.run(OfflineEventConsumer(queue, handler, limit=_LIMIT, max_concurrency=4).arun(stop_when_idle=True))
+
+    assert sorted(handled) == list(range(1, 31))
+    assert stats.processed == 30  # noqa: PLR2004
+
+
+def test_async_consumer_stops_while_idle():
+    consumer = OfflineEventConsumer(_FakeQueue(count=0), lambda _: None, idle_delay=_IDLE_DELAY, max_idle_delay=_IDLE_DELAY)
+
+    async def run_and_stop() -> float:
+        task = asyncio.ensure_future(consumer.arun())
+        await asyncio.sleep(0.2)
+        started = time.monotonic()
+        consumer.stop()
+        await asyncio.wait_for(task, timeout=_IDLE_DELAY)
+        return time.monotonic() - started
+
+    assert asyncio.run(run_and_stop()) < 1
+
+
+def test_sync_consumer_rejects_coroutine_function_handler():
+    async def handler(_event: OfflineEvent):
+        pass
+
+    consumer = OfflineEventConsumer(_FakeQueue(count=2), handler)
+
+    with pytest.raises(TypeError, match="coroutine function"):
+        consumer.run(stop_when_idle=True)
+
+    with pytest.raises(TypeError, match="coroutine function"):
+        consumer.poll()
+
+
+def test_sync_consumer_reports_events_of_awaitable_handler_as_failed():
+    queue = _FakeQueue(count=2)
+
+    def handler(_event: OfflineEvent):
+        return asyncio.sleep(0)
+
+    stats = OfflineEventConsumer(queue, handler, idle_delay=0, max_idle_delay=0).run(stop_when_idle=True)
+
+    assert stats.processed == 0
+    assert queue.errors == {"message_1", "message_2"}
+    assert len(queue.events) == 2  # noqa: PLR2004
+
+def test_sqlite_store_keeps_checkpoint(tmp_path):
+    checkpoint = OfflineCheckpoint(process_id=_PROCESS_ID, processed_ids=(1, 2), failed_message_ids=("message_3",))
+
+    SQLiteOfflineCheckpointStore(tmp_path / "offline.sqlite3").save(_KEY, checkpoint)
+
+    assert SQLiteOfflineCheckpointStore(tmp_path / "offline.sqlite3").load(_KEY) == checkpoint
+
+
+def test_scope_creates_consumer():
+    consumer = Client(TOKEN_MOCK).event.offline.consumer(lambda _: None, checkpoint_key=_KEY, max_concurrency=2)
+
+    assert isinstance(consumer, OfflineEventConsumer)
+    assert consumer._max_concurrency == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("kwargs", [{"limit": 0}, {"max_limit": 1001}, {"max_concurrency": 0}, {"idle_delay": 60}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):  # noqa: PT011
+        OfflineEventConsumer(_FakeQueue(), lambda _: None, **kwargs)
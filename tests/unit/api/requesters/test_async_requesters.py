@@ -0,0 +1,191 @@
+import asyncio
+import json
+from typing import Any, List, Optional, Text
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import requests
+
+from b24pysdk import Config
+from b24pysdk.api.requesters import BitrixAPIRequester, BitrixDownloadRequester, BitrixOAuthRequester
+from b24pysdk.api.requesters.transports import BaseAsyncHTTPTransport, get_default_async_transport
+from b24pysdk.errors import BitrixRequestError, BitrixRequestTimeout
+from b24pysdk.protocols import AsyncHTTPTransportProtocol, BitrixOAuthProtocol
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requesters,
+    pytest.mark.async_requesters,
+]
+
+_URL: Text = "https://example.bitrix24.com/rest/user.get.json"
+_MAX_RETRIES: int = 3
+
+
+class FakeAsyncTransport:
+    """Async transport returning prepared responses and recording sent requests."""
+
+    def __init__(self, *responses: Any):
+        self.responses = list(responses)
+        self.requests: List[dict] = []
+        self.closed = False
+
+    async def request(self, method, url, **kwargs) -> requests.Response:
+        self.requests.append({"method": method, "url": url, **kwargs})
+        response = self.responses.pop(0)
+
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+    async def aclose(self):
+        self.closed = True
+
+
+def make_response(status_code: int, payload: Optional[dict] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload or {}).encode()
+    response.url = _URL
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def transport():
+    config = Config()
+    async_transport = config.async_transport
+    yield
+    config.async_transport = async_transport
+
+
+def test_fake_transport_implements_protocol():
+    assert isinstance(FakeAsyncTransport(), AsyncHTTPTransportProtocol)
+
+
+def test_config_rejects_invalid_transport():
+    with pytest.raises(TypeError, match="Async_transport"):
+        Config().async_transport = object()
+
+
+@pytest.mark.usefixtures("transport")
+def test_api_requester_acall_posts_through_transport():
+    fake_transport = FakeAsyncTransport(make_response(200, {"result": {"ID": 1}}))
+    Config().configure(async_transport=fake_transport)
+
+    json_response = asyncio.run(BitrixAPIRequester(url=_URL, params={"ID": 1}).acall())
+
+    assert json_response == {"result": {"ID": 1}}
+    assert fake_transport.requests[0]["method"] == "POST"
+    assert json.loads(fake_transport.requests[0]["data"]) == {"ID": 1}
+    assert fake_transport.requests[0]["headers"]["Content-Type"] == "application/json"
+    assert fake_transport.requests[0]["allow_redirects"] is False
+
+
+@pytest.mark.usefixtures("transport")
+def test_api_requester_acall_retries_service_unavailable():
+    fake_transport = FakeAsyncTransport(make_response(503), make_response(200, {"result": True}))
+    Config().configure(async_transport=fake_transport)
+
+    with patch("b24pysdk.api.requesters._base_requester.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        json_response = asyncio.run(BitrixAPIRequester(url=_URL, max_retries=_MAX_RETRIES).acall())
+
+    assert json_response == {"result": True}
+    mock_sleep.assert_awaited_once()
+    assert len(fake_transport.requests) == len({"first", "second"})
+
+
+@pytest.mark.usefixtures("transport")
+def test_api_requester_acall_maps_transport_errors():
+    Config().configure(async_transport=FakeAsyncTransport(requests.Timeout("timeout"), requests.ConnectionError("refused")))
+
+    with pytest.raises(BitrixRequestTimeout):
+        asyncio.run(BitrixAPIRequester(url=_URL).acall())
+
+    with pytest.raises(BitrixRequestError):
+        asyncio.run(BitrixAPIRequester(url=_URL).acall())
+
+
+def test_api_requester_acall_rejects_files():
+    requester = BitrixAPIRequester(url=_URL, files={"file": ("name.txt", Mock())})
+
+    with pytest.raises(TypeError, match="File uploads"):
+        asyncio.run(requester.acall())
+
+
+@pytest.mark.usefixtures("transport")
+def test_oauth_requester_aget_app_info():
+    fake_transport = FakeAsyncTransport(make_response(200, {"result": {"ID": 1}}))
+    Config().configure(async_transport=fake_transport)
+    bitrix_oauth = Mock(spec=BitrixOAuthProtocol, client_id="client_id", client_secret="client_secret")  # noqa: S106
+
+    json_response = asyncio.run(BitrixOAuthRequester(bitrix_oauth=bitrix_oauth).aget_app_info("token"))
+
+    assert json_response["result"] == {"ID": 1}
+    assert fake_transport.requests[0]["method"] == "GET"
+    assert fake_transport.requests[0]["params"] == {"auth": "token"}
+
+
+@pytest.mark.usefixtures("transport")
+def test_default_transport_is_created_lazily():
+    pytest.importorskip("httpx")
+    Config().async_transport = None
+
+    transport = BitrixAPIRequester(url=_URL)._get_async_transport()
+
+    assert isinstance(transport, BaseAsyncHTTPTransport)
+    assert Config().async_transport is transport
+
+
+def test_default_transport_prefers_httpx():
+    pytest.importorskip("httpx")
+
+    assert type(get_default_async_transport()).__name__ == "HTTPXAsyncTransport"
+
+
+def test_transport_splits_timeout():
+    connect_timeout, read_timeout = 1, 2
+
+    assert BaseAsyncHTTPTransport._split_timeout((connect_timeout, read_timeout)) == (connect_timeout, read_timeout)
+    assert BaseAsyncHTTPTransport._split_timeout(read_timeout) == (read_timeout, read_timeout)
+
+
+class _RecordingTransport(BaseAsyncHTTPTransport[object]):
+    """Transport recording created and closed clients instead of sending requests."""
+
+    __slots__ = ("closed", "created")
+
+    def __init__(self):
+        super().__init__()
+        self.created: List[object] = []
+        self.closed: List[object] = []
+
+    def _make_client(self) -> object:
+        client = object()
+        self.created.append(client)
+        return client
+
+    async def _send(self, *_args, **_kwargs) -> requests.Response:
+        return make_response(200, {"result": True})
+
+    async def _close_client(self, client):
+        self.closed.append(client)
+
+
+def test_transport_closes_client_of_previous_loop():
+    transport = _RecordingTransport()
+
+    asyncio.run(transport.request("POST", _URL))
+    asyncio.run(transport.request("POST", _URL))
+
+    assert transport.closed == transport.created[:1]
+
+    asyncio.run(transport.aclose())
+
+    assert transport.closed == transport.created
+
+
+def test_download_requester_rejects_async_requests(tmp_path):
+    with (tmp_path / "file").open("wb") as file, pytest.raises(TypeError, match="Asynchronous downloads"):
+        asyncio.run(BitrixDownloadRequester(_URL, file=file)._arequest())
@@ -0,0 +1,213 @@
+import io
+from email import message_from_bytes
+from email.message import Message
+from typing import BinaryIO, List, Text, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from b24pysdk.api.requesters import BitrixAPIUploadRequester
+from b24pysdk.api.requesters._utils import MultipartFileStream
+from tests.unit.helpers import assert_slots
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requesters,
+    pytest.mark.bitrix_api_upload_requester,
+]
+
+_UPLOAD_URL: Text = "https://example.bitrix24.com/rest/upload.json?auth=secret_token&token=disk%7Cabc"
+_CONTENT: bytes = bytes(range(256)) * 1000
+_FIELD: Text = "file"
+_FILENAME: Text = 'report "final".bin'
+_MAX_RETRIES: int = 2
+
+
+class _NonSeekableFile(io.RawIOBase):
+    def __init__(self, file: BinaryIO):
+        self._file = file
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self._file.readinto(buffer)
+
+
+def _parse_multipart(content_type: Text, body: bytes) -> Message:
+    return message_from_bytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+
+
+def _make_stream(file=None, **kwargs) -> MultipartFileStream:
+    return MultipartFileStream(
+        io.BytesIO(_CONTENT) if file is None else file,
+        field=_FIELD,
+        filename=_FILENAME,
+        **kwargs,
+    )
+
+
+def _response(status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b'{"result": {"ID": 10}, "time": {}}'
+    return response
+
+
+def test_stream_produces_multipart_body():
+    stream = _make_stream()
+    body = b"".join(stream)
+
+    assert len(body) == len(stream)
+
+    message = _parse_multipart(stream.content_type, body)
+    (part,) = message.get_payload()
+
+    assert part.get_param("name", header="Content-Disposition") == _FIELD
+    assert part.get_filename() == _FILENAME.replace('"', "%22")
+    assert part.get_payload(decode=True) == _CONTENT
+
+
+@pytest.mark.parametrize("size", [1, 7, 100, MultipartFileStream.CHUNK_SIZE])
+def test_stream_reads_in_blocks_of_requested_size(size):
+    stream = _make_stream()
+    chunks = []
+
+    while chunk := stream.read(size):
+        assert len(chunk) <= size
+        chunks.append(chunk)
+
+    assert len(b"".join(chunks)) == len(stream)
+    assert stream.read() == b""
+
+
+def test_stream_reports_progress():
+    progress: List[Tuple[int, int]] = []
+
+    b"".join(_make_stream(progress_callback=lambda sent, total: progress.append((sent, total))))
+
+    assert progress[-1] == (len(_CONTENT), len(_CONTENT))
+    assert all(sent < next_sent for (sent, _), (next_sent, _) in zip(progress, progress[1:]))
+
+
+def test_stream_starts_at_current_file_position():
+    file = io.BytesIO(b"skip" + _CONTENT)
+    file.seek(4)
+
+    stream = _make_stream(file)
+
+    assert stream.file_size == len(_CONTENT)
+    assert _parse_multipart(stream.content_type, b"".join(stream)).get_payload()[0].get_payload(decode=True) == _CONTENT
+
+
+def test_stream_rewind():
+    stream = _make_stream()
+    first_body = stream.read()
+
+    stream.rewind()
+
+    assert stream.read() == first_body
+
+
+def test_non_seekable_stream_cannot_be_rewound(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(_CONTENT)
+
+    with path.open("rb") as file:
+        stream = _make_stream(_NonSeekableFile(file))
+
+        assert not stream.rewindable
+        assert stream.file_size == len(_CONTENT)
+
+        stream.rewind()
+        stream.read(10)
+
+        with pytest.raises(io.UnsupportedOperation):
+            stream.rewind()
+
+
+def test_stream_without_known_size_is_rejected():
+    with pytest.raises(ValueError, match="known size"):
+        _make_stream(_NonSeekableFile(io.BytesIO(_CONTENT)))
+
+
+def test_truncated_file_is_rejected():
+    file = io.BytesIO(_CONTENT)
+    stream = _make_stream(file)
+    file.truncate(10)
+
+    with pytest.raises(ValueError, match="declared size"):
+        stream.read()
+
+
+def test_slots():
+    assert_slots(BitrixAPIUploadRequester)
+    assert "__dict__" not in dir(_make_stream())
+
+
+def test_requester_streams_body_with_multipart_headers():
+    stream = _make_stream()
+    requester = BitrixAPIUploadRequester(_UPLOAD_URL, stream=stream)
+    session = Mock()
+    session.post.return_value = _response()
+
+    with patch.object(BitrixAPIUploadRequester, "_get_session", return_value=session):
+        json_response = requester.call()
+
+    assert json_response["result"] == {"ID": 10}
+
+    kwargs = session.post.call_args.kwargs
+    prepared = requests.Request("POST", _UPLOAD_URL, data=kwargs["data"], headers=kwargs["headers"]).prepare()
+
+    assert kwargs["data"] is stream
+    assert prepared.body is stream
+    assert prepared.headers["Content-Type"] == stream.content_type
+    assert prepared.headers["Content-Length"] == str(len(stream))
+
+
+def test_requester_retries_from_beginning_of_file():
+    stream = _make_stream()
+    bodies: List[bytes] = []
+
+    def post(**kwargs):
+        bodies.append(kwargs["data"].read(1000 if not bodies else -1))
+        return _response(503 if len(bodies) == 1 else 200)
+
+    requester = BitrixAPIUploadRequester(_UPLOAD_URL, stream=stream, max_retries=_MAX_RETRIES, initial_retry_delay=0)
+
+    with patch.object(BitrixAPIUploadRequester, "_get_session", return_value=Mock(post=post)):
+        requester.call()
+
+    assert len(bodies) == _MAX_RETRIES
+    assert bodies[0] == bodies[1][:1000]
+    assert len(bodies[1]) == len(stream)
+
+
+def test_requester_does_not_retry_non_seekable_file(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(_CONTENT)
+
+    with path.open("rb") as file:
+        requester = BitrixAPIUploadRequester(_UPLOAD_URL, stream=_make_stream(_NonSeekableFile(file)), max_retries=3)
+
+    assert requester._max_retries == 1
+
+
+def test_upload_url_query_is_masked_in_logs():
+    requester = BitrixAPIUploadRequester(_UPLOAD_URL, stream=_make_stream())
+
+    url_for_log = requester._get_url_for_log(_UPLOAD_URL)
+
+    assert "secret_token" not in url_for_log
+    assert url_for_log.startswith("https://example.bitrix24.com/rest/upload.json?")
+
+
+def test_async_upload_is_rejected():
+    requester = BitrixAPIUploadRequester(_UPLOAD_URL, stream=_make_stream())
+
+    with pytest.raises(TypeError, match="not supported"):
+        requester._arequest().send(None)
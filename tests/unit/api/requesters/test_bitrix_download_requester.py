@@ -0,0 +1,162 @@
+import io
+from typing import Dict, List, Optional, Text, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from b24pysdk.api.requesters import BitrixDownloadRequester
+from b24pysdk.errors import BitrixAPIError, BitrixRequestError
+from tests.unit.helpers import assert_slots
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requesters,
+    pytest.mark.bitrix_download_requester,
+]
+
+_URL: Text = "https://example.bitrix24.com/rest/download.json?auth=secret_token&token=disk%7Cabc"
+_CONTENT: bytes = bytes(range(256)) * 100
+_CHUNK_SIZE: int = 1000
+
+
+class _InterruptedBody(io.BytesIO):
+    """Response body whose connection breaks after ``limit`` bytes."""
+
+    def __init__(self, content: bytes, limit: Optional[int]):
+        super().__init__(content)
+        self._limit = limit
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if self._limit is not None and self.tell() >= self._limit:
+            raise requests.ConnectionError("connection reset")
+        if self._limit is not None and size is not None and size > 0:
+            size = min(size, self._limit - self.tell())
+        return super().read(size)
+
+
+def _response(status_code: int, content: bytes = b"", limit: Optional[int] = None, headers: Optional[Dict] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = _InterruptedBody(content, limit)
+    response.headers.update({"Content-Length": str(len(content))} | (headers or {}))
+    return response
+
+
+class _Server:
+    """Fake session serving ``_CONTENT`` with ``Range`` support."""
+
+    def __init__(self, limits: List[Optional[int]], supports_ranges: bool = True):
+        self.limits = limits
+        self.supports_ranges = supports_ranges
+        self.ranges: List[Optional[Text]] = []
+
+    def get(self, *, headers, **_kwargs) -> requests.Response:
+        content_range = headers.get("Range")
+        self.ranges.append(content_range)
+        limit = self.limits.pop(0) if self.limits else None
+
+        if content_range is None or not self.supports_ranges:
+            return _response(200, _CONTENT, limit)
+
+        start = int(content_range[len("bytes="):-1])
+
+        if start >= len(_CONTENT):
+            return _response(416, headers={"Content-Range": f"bytes */{len(_CONTENT)}"})
+
+        return _response(206, _CONTENT[start:], limit)
+
+
+def _download(server, file=None, **kwargs) -> Tuple[int, io.BytesIO]:
+    file = io.BytesIO() if file is None else file
+
+    with patch.object(BitrixDownloadRequester, "_get_session", return_value=server):
+        size = BitrixDownloadRequester(_URL, file=file, chunk_size=_CHUNK_SIZE, **kwargs).download()
+
+    return size, file
+
+
+def test_slots():
+    assert_slots(BitrixDownloadRequester)
+
+
+def test_content_is_written_in_chunks():
+    progress: List[Tuple[int, Optional[int]]] = []
+
+    size, file = _download(_Server([]), progress_callback=lambda done, total: progress.append((done, total)))
+
+    assert size == len(_CONTENT)
+    assert file.getvalue() == _CONTENT
+    assert progress[0] == (_CHUNK_SIZE, len(_CONTENT))
+    assert progress[-1] == (len(_CONTENT), len(_CONTENT))
+
+
+def test_interrupted_download_is_resumed_with_range():
+    server = _Server([3000, 7000, None])
+
+    size, file = _download(server, max_retries=1)
+
+    assert size == len(_CONTENT)
+    assert file.getvalue() == _CONTENT
+    assert server.ranges == [None, "bytes=3000-", "bytes=10000-"]
+
+
+def test_download_restarts_when_server_ignores_range():
+    server = _Server([3000, None], supports_ranges=False)
+
+    size, file = _download(server)
+
+    assert size == len(_CONTENT)
+    assert file.getvalue() == _CONTENT
+
+
+def test_download_continues_from_offset():
+    file = io.BytesIO()
+    file.write(b"prefix" + _CONTENT[:5000])
+    server = _Server([])
+
+    size, file = _download(server, file=file, offset=5000)
+
+    assert size == len(_CONTENT)
+    assert file.getvalue() == b"prefix" + _CONTENT
+    assert server.ranges == ["bytes=5000-"]
+
+
+def test_complete_download_is_not_repeated():
+    file = io.BytesIO(_CONTENT)
+    file.seek(0, io.SEEK_END)
+
+    size, _ = _download(_Server([]), file=file, offset=len(_CONTENT))
+
+    assert size == len(_CONTENT)
+
+
+def test_failure_without_progress_is_raised():
+    with pytest.raises(BitrixRequestError):
+        _download(_Server([0]))
+
+
+def test_error_response_is_parsed():
+    server = Mock()
+    server.get.return_value = _response(400, b'{"error": "ERROR_ARGUMENT", "error_description": "Invalid file"}')
+
+    with pytest.raises(BitrixAPIError):
+        _download(server)
+
+
+def test_credentials_are_masked_in_logs():
+    requester = BitrixDownloadRequester(
+        "https://example.bitrix24.com/rest/1/webhook_key/catalog.product.download?fields[fileId]=1",
+        file=io.BytesIO(),
+    )
+
+    url_for_log = requester._get_url_for_log(requester._url)
+
+    assert "webhook_key" not in url_for_log
+    assert "fileId" not in url_for_log
+
+
+@pytest.mark.parametrize(("kwargs", "error"), [({"offset": -1}, ValueError), ({"chunk_size": 0}, ValueError)])
+def test_invalid_arguments(kwargs, error):
+    with pytest.raises(error):
+        BitrixDownloadRequester(_URL, file=io.BytesIO(), **kwargs)
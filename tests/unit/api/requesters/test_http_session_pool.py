@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from typing import List, Text
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from b24pysdk import Config
+from b24pysdk.api.requesters import BitrixAPIRequester, BitrixOAuthRequester, HTTPSessionPool
+from b24pysdk.protocols import BitrixOAuthProtocol
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requesters,
+    pytest.mark.http_session_pool,
+]
+
+_PORTAL_URL_1: Text = "https://example.bitrix24.com/rest/user.get.json"
+_PORTAL_URL_2: Text = "https://EXAMPLE.bitrix24.com/rest/crm.deal.list.json"
+_OTHER_PORTAL_URL: Text = "https://other.bitrix24.com/rest/user.get.json"
+
+_POOL_CONNECTIONS: int = 4
+_POOL_MAXSIZE: int = 32
+_IDLE_TIMEOUT: int = 10
+
+
+@pytest.fixture(autouse=True)
+def clean_pool():
+    config = Config()
+    pool_sizes = config.http_pool_connections, config.http_pool_maxsize
+    idle_timeout = config.http_session_idle_timeout
+
+    HTTPSessionPool().close()
+    yield
+    HTTPSessionPool().close()
+
+    config.configure(
+        http_pool_connections=pool_sizes[0],
+        http_pool_maxsize=pool_sizes[1],
+        http_session_idle_timeout=idle_timeout,
+    )
+
+
+def test_same_origin_shares_session():
+    pool = HTTPSessionPool()
+
+    session_1 = pool.get_session(_PORTAL_URL_1)
+    session_2 = HTTPSessionPool().get_session(_PORTAL_URL_2)
+
+    assert session_1 is session_2
+    assert len(pool) == 1
+    assert _PORTAL_URL_2 in pool
+
+
+def test_different_origins_use_different_sessions():
+    pool = HTTPSessionPool()
+
+    assert pool.get_session(_PORTAL_URL_1) is not pool.get_session(_OTHER_PORTAL_URL)
+    assert len(pool) == len({_PORTAL_URL_1, _OTHER_PORTAL_URL})
+
+
+def test_adapter_is_sized_from_config():
+    Config().configure(http_pool_connections=_POOL_CONNECTIONS, http_pool_maxsize=_POOL_MAXSIZE)
+
+    adapter = HTTPSessionPool().get_session(_PORTAL_URL_1).get_adapter(_PORTAL_URL_1)
+
+    assert adapter._pool_connections == _POOL_CONNECTIONS
+    assert adapter._pool_maxsize == _POOL_MAXSIZE
+    assert adapter.max_retries.total == 0
+
+
+def test_session_is_recreated_when_pool_sizes_change():
+    pool = HTTPSessionPool()
+    session = pool.get_session(_PORTAL_URL_1)
+
+    Config().configure(http_pool_maxsize=64)
+
+    assert pool.get_session(_PORTAL_URL_1) is not session
+
+
+def test_idle_sessions_are_evicted():
+    Config().configure(http_session_idle_timeout=_IDLE_TIMEOUT)
+    pool = HTTPSessionPool()
+    now = time.monotonic()
+
+    with patch("b24pysdk.api.requesters.http_session_pool.time.monotonic", return_value=now):
+        idle_session = pool.get_session(_PORTAL_URL_1)
+
+    with patch.object(idle_session, "close") as mock_close, \
+            patch("b24pysdk.api.requesters.http_session_pool.time.monotonic", return_value=now + _IDLE_TIMEOUT + 1):
+        pool.get_session(_OTHER_PORTAL_URL)
+
+    mock_close.assert_called_once()
+    assert _PORTAL_URL_1 not in pool
+    assert _OTHER_PORTAL_URL in pool
+
+
+def test_sessions_are_thread_local():
+    main_session = HTTPSessionPool().get_session(_PORTAL_URL_1)
+    thread_sessions: List[requests.Session] = []
+
+    def worker():
+        thread_sessions.append(HTTPSessionPool().get_session(_PORTAL_URL_1))
+        HTTPSessionPool().close()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert thread_sessions[0] is not main_session
+
+
+def test_close_single_origin():
+    pool = HTTPSessionPool()
+    pool.get_session(_PORTAL_URL_1)
+    pool.get_session(_OTHER_PORTAL_URL)
+
+    pool.close(_PORTAL_URL_2)
+
+    assert _PORTAL_URL_1 not in pool
+    assert _OTHER_PORTAL_URL in pool
+
+
+def test_invalid_config_values():
+    config = Config()
+
+    with pytest.raises(ValueError, match="Http_pool_connections"):
+        config.http_pool_connections = 0
+
+    with pytest.raises(ValueError, match="Http_pool_maxsize"):
+        config.http_pool_maxsize = -1
+
+    with pytest.raises(ValueError, match="Http_session_idle_timeout"):
+        config.http_session_idle_timeout = 0
+
+
+def test_api_requester_posts_through_pooled_session():
+    mock_session = Mock(spec=requests.Session)
+
+    with patch.object(HTTPSessionPool, "get_session", return_value=mock_session) as mock_get_session:
+        BitrixAPIRequester(url=_PORTAL_URL_1, params={"ID": 1})._request()
+
+    mock_get_session.assert_called_once_with(_PORTAL_URL_1)
+    mock_session.post.assert_called_once()
+    assert json.loads(mock_session.post.call_args.kwargs["data"]) == {"ID": 1}
+
+
+def test_oauth_requester_gets_through_pooled_session():
+    mock_session = Mock(spec=requests.Session)
+    bitrix_oauth = Mock(spec=BitrixOAuthProtocol)
+    url = "https://oauth.bitrix24.tech/oauth/token/"
+
+    with patch.object(HTTPSessionPool, "get_session", return_value=mock_session) as mock_get_session:
+        BitrixOAuthRequester(bitrix_oauth=bitrix_oauth)._request(url=url, params={"grant_type": "refresh_token"})
+
+    mock_get_session.assert_called_once_with(url)
+    mock_session.get.assert_called_once()
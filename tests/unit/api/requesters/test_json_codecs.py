@@ -0,0 +1,195 @@
+import asyncio
+import json
+from typing import Any, Dict, Text
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import requests
+
+from b24pysdk import Config
+from b24pysdk.api.requesters import BitrixAPIRequester, HTTPSessionPool, StdlibJSONCodec, json_codecs
+from b24pysdk.api.requesters._utils import parse_response
+from b24pysdk.errors import BitrixAPIError, BitrixResponse500JSONDecodeError, BitrixResponseJSONDecodeError
+from b24pysdk.protocols import JSONCodecProtocol
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requesters,
+    pytest.mark.json_codecs,
+]
+
+_URL: Text = "https://example.bitrix24.com/rest/crm.deal.add.json"
+_PAYLOAD: Dict[Text, Any] = {
+    "fields": {"TITLE": "Сделка", "OPPORTUNITY": 1.5, "TAGS": ["a", "b"]},
+    "cmd": {0: "crm.deal.get?id=1"},
+    "ready": True,
+    "parent": None,
+}
+_STATUS_OK: int = 200
+_STATUS_BAD_REQUEST: int = 400
+_STATUS_SERVER_ERROR: int = 500
+
+
+def _make_response(content: bytes, status_code: int = _STATUS_OK) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = _URL
+    response._content = content
+    return response
+
+
+class _CountingCodec(StdlibJSONCodec):
+    __slots__ = ("decoded", "encoded")
+
+    def __init__(self):
+        self.decoded = 0
+        self.encoded = 0
+
+    def encode(self, obj: Any) -> bytes:
+        self.encoded += 1
+        return super().encode(obj)
+
+    def decode(self, content: bytes) -> Any:
+        self.decoded += 1
+        return super().decode(content)
+
+
+@pytest.fixture(autouse=True)
+def restore_json_codec():
+    config = Config()
+    json_codec = config.json_codec
+    yield
+    config.json_codec = json_codec
+
+
+_CODECS = pytest.mark.parametrize(
+    ("codec_name", "module_name"),
+    [
+        ("StdlibJSONCodec", "json"),
+        ("OrjsonJSONCodec", "orjson"),
+        ("MsgspecJSONCodec", "msgspec"),
+    ],
+)
+
+
+def _make_codec(codec_name: Text, module_name: Text) -> JSONCodecProtocol:
+    pytest.importorskip(module_name)
+    return getattr(json_codecs, codec_name)()
+
+
+@_CODECS
+def test_codec_roundtrip(codec_name, module_name):
+    codec = _make_codec(codec_name, module_name)
+    encoded = codec.encode(_PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert isinstance(codec, JSONCodecProtocol)
+    assert codec.decode(encoded) == json.loads(json.dumps(_PAYLOAD))
+    assert "Сделка".encode() in encoded
+
+
+@_CODECS
+def test_codec_rejects_invalid_json(codec_name, module_name):
+    codec = _make_codec(codec_name, module_name)
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        codec.decode(b"<html>Service unavailable</html>")
+
+
+def test_default_codec_prefers_installed_library():
+    with patch.object(json_codecs, "_DEFAULT_CODEC_PRIORITY", ()):
+        assert isinstance(json_codecs.get_default_json_codec(), StdlibJSONCodec)
+
+    with patch.object(json_codecs, "__getattr__", side_effect=ImportError):
+        assert isinstance(json_codecs.get_default_json_codec(), StdlibJSONCodec)
+
+
+def test_default_codec_is_stored_in_config():
+    Config().json_codec = None
+
+    json_codec = json_codecs.get_json_codec()
+
+    assert Config().json_codec is json_codec
+    assert json_codecs.get_json_codec() is json_codec
+
+
+def test_invalid_json_codec():
+    with pytest.raises(TypeError, match="Json_codec"):
+        Config().json_codec = object()
+
+
+def test_parse_response_uses_codec():
+    codec = _CountingCodec()
+
+    assert parse_response(_make_response(b'{"result": [1, 2]}'), json_codec=codec) == {"result": [1, 2]}
+    assert codec.decoded == 1
+
+
+def test_parse_response_decodes_error_payload_once():
+    codec = _CountingCodec()
+    response = _make_response(b'{"error": "ERROR_CORE", "error_description": "failed"}', _STATUS_BAD_REQUEST)
+
+    with pytest.raises(BitrixAPIError):
+        parse_response(response, json_codec=codec)
+
+    assert codec.decoded == 1
+
+
+def test_parse_response_invalid_json():
+    with pytest.raises(BitrixResponseJSONDecodeError):
+        parse_response(_make_response(b"<html></html>"), json_codec=StdlibJSONCodec())
+
+    with pytest.raises(BitrixResponse500JSONDecodeError):
+        parse_response(_make_response(b"", _STATUS_SERVER_ERROR), json_codec=StdlibJSONCodec())
+
+
+def test_requester_encodes_body_with_configured_codec():
+    codec = _CountingCodec()
+    mock_session = Mock(spec=requests.Session)
+    mock_session.post.return_value = _make_response(b'{"result": 1}')
+
+    Config().json_codec = codec
+
+    with patch.object(HTTPSessionPool, "get_session", return_value=mock_session):
+        response = BitrixAPIRequester(url=_URL, params=_PAYLOAD["fields"]).call()
+
+    post_kwargs = mock_session.post.call_args.kwargs
+
+    assert response == {"result": 1}
+    assert "json" not in post_kwargs
+    assert json.loads(post_kwargs["data"]) == _PAYLOAD["fields"]
+    assert codec.encoded == codec.decoded == 1
+
+
+def test_async_requester_encodes_body_with_configured_codec():
+    codec = _CountingCodec()
+    transport = Mock(request=AsyncMock(return_value=_make_response(b'{"result": 1}')))
+
+    Config().json_codec = codec
+
+    with patch.object(BitrixAPIRequester, "_get_async_transport", return_value=transport):
+        response = asyncio.run(BitrixAPIRequester(url=_URL, params=_PAYLOAD["fields"]).acall())
+
+    request_kwargs = transport.request.call_args.kwargs
+
+    assert response == {"result": 1}
+    assert "json" not in request_kwargs
+    assert json.loads(request_kwargs["data"]) == _PAYLOAD["fields"]
+    assert codec.encoded == codec.decoded == 1
+
+
+def test_requester_with_files_keeps_multipart_body():
+    codec = _CountingCodec()
+    mock_session = Mock(spec=requests.Session)
+    files = {"file": ("test.txt", b"content")}
+
+    Config().json_codec = codec
+
+    with patch.object(HTTPSessionPool, "get_session", return_value=mock_session):
+        BitrixAPIRequester(url=_URL, params={"id": 1}, files=files)._request()
+
+    post_kwargs = mock_session.post.call_args.kwargs
+
+    assert post_kwargs["json"] == {"id": 1}
+    assert post_kwargs["files"] == files
+    assert codec.encoded == 0
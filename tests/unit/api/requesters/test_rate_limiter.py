@@ -0,0 +1,257 @@
+import json
+import threading
+from typing import List, Optional, Text
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from b24pysdk import Config
+from b24pysdk.api.callers._utils import get_empty_time
+from b24pysdk.api.requesters import BitrixAPIRequester, FileRateLimiterBackend, HTTPSessionPool, MemoryRateLimiterBackend, RateLimiter
+from b24pysdk.errors import BitrixAPIOperationTimeLimit, BitrixAPIQueryLimitExceeded
+from b24pysdk.protocols import RateLimiterProtocol
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requesters,
+    pytest.mark.rate_limiter,
+]
+
+_NOW: float = 1_700_000_000.0
+_BUCKET_SIZE: int = 3
+_DRAIN_RATE: int = 2
+_OPERATING_LIMIT: int = 100
+_OPERATING_RESET_IN: int = 300
+_OPERATING_WINDOW: int = 600
+_THREADS: int = 10
+
+_WEBHOOK_URL: Text = "https://example.bitrix24.com/rest/1/webhook_key/crm.deal.list.json"
+_OAUTH_URL: Text = "https://EXAMPLE.bitrix24.com/rest/crm.deal.list.json"
+_V3_URL: Text = "https://example.bitrix24.com/rest/api/1/webhook_key/tasks.task.get"
+_OTHER_PORTAL_URL: Text = "https://other.bitrix24.com/rest/crm.deal.list.json"
+_BATCH_URL: Text = "https://example.bitrix24.com/rest/batch.json"
+
+_TIME_PATH: Text = "b24pysdk.api.requesters.rate_limiting.rate_limiter.time.time"
+
+
+@pytest.fixture(autouse=True)
+def clean_limits():
+    config = Config()
+    rate_limiter = config.rate_limiter
+
+    MemoryRateLimiterBackend().clear()
+    yield
+    MemoryRateLimiterBackend().clear()
+
+    config.rate_limiter = rate_limiter
+
+
+def make_rate_limiter(backend=None) -> RateLimiter:
+    return RateLimiter(
+        backend=backend,
+        bucket_size=_BUCKET_SIZE,
+        drain_rate=_DRAIN_RATE,
+        operating_limit=_OPERATING_LIMIT,
+        operating_window=_OPERATING_WINDOW,
+    )
+
+
+def make_time(operating: float, processing: float = 1.0) -> dict:
+    return get_empty_time() | {
+        "processing": processing,
+        "operating": operating,
+        "operating_reset_at": _NOW + _OPERATING_RESET_IN,
+    }
+
+
+def make_error(error_class, error: Text):
+    return error_class({"error": error, "error_description": error}, Mock(spec=requests.Response))
+
+
+def reserve_at(rate_limiter: RateLimiter, now: float, url: Text = _WEBHOOK_URL, params: Optional[dict] = None) -> float:
+    with patch(_TIME_PATH, return_value=now):
+        return rate_limiter.reserve(url, params)
+
+
+def test_rate_limiter_implements_protocol():
+    assert isinstance(RateLimiter(), RateLimiterProtocol)
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError, match="Bucket_size"):
+        RateLimiter(bucket_size=0)
+
+    with pytest.raises(ValueError, match="Drain_rate"):
+        RateLimiter(drain_rate=-1)
+
+
+def test_config_rejects_invalid_rate_limiter():
+    with pytest.raises(TypeError, match="Rate_limiter"):
+        Config().rate_limiter = object()
+
+
+def test_burst_over_bucket_size_is_delayed():
+    rate_limiter = make_rate_limiter()
+
+    delays = [reserve_at(rate_limiter, _NOW) for _ in range(_BUCKET_SIZE + 2)]
+
+    assert delays[:_BUCKET_SIZE] == [0] * _BUCKET_SIZE
+    assert delays[_BUCKET_SIZE:] == [1 / _DRAIN_RATE, 2 / _DRAIN_RATE]
+
+
+def test_bucket_drains_over_time():
+    rate_limiter = make_rate_limiter()
+
+    for _ in range(_BUCKET_SIZE):
+        reserve_at(rate_limiter, _NOW)
+
+    assert reserve_at(rate_limiter, _NOW + 1 / _DRAIN_RATE) == 0
+
+
+def test_webhook_and_oauth_calls_share_portal_bucket():
+    rate_limiter = make_rate_limiter()
+
+    for url in (_WEBHOOK_URL, _OAUTH_URL, _V3_URL):
+        reserve_at(rate_limiter, _NOW, url)
+
+    assert reserve_at(rate_limiter, _NOW, _OAUTH_URL) > 0
+    assert reserve_at(rate_limiter, _NOW, _OTHER_PORTAL_URL) == 0
+
+
+def test_memory_backend_is_shared_between_threads():
+    delays: List[float] = []
+    lock = threading.Lock()
+
+    def worker():
+        delay = make_rate_limiter().reserve(_WEBHOOK_URL)
+
+        with lock:
+            delays.append(delay)
+
+    with patch(_TIME_PATH, return_value=_NOW):
+        threads = [threading.Thread(target=worker) for _ in range(_THREADS)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    assert sorted(delays) == [max(0, (index + 1 - _BUCKET_SIZE) / _DRAIN_RATE) for index in range(_THREADS)]
+
+
+def test_exhausted_operating_time_delays_method_until_reset():
+    rate_limiter = make_rate_limiter()
+
+    with patch(_TIME_PATH, return_value=_NOW):
+        rate_limiter.record_response(_WEBHOOK_URL, None, {"result": [], "time": make_time(operating=_OPERATING_LIMIT - 0.5)})
+
+    assert reserve_at(rate_limiter, _NOW) == _OPERATING_RESET_IN
+    assert reserve_at(rate_limiter, _NOW, "https://example.bitrix24.com/rest/user.get.json") == 0
+    assert reserve_at(rate_limiter, _NOW + _OPERATING_RESET_IN) == 0
+
+
+def test_operating_time_below_limit_does_not_delay():
+    rate_limiter = make_rate_limiter()
+    rate_limiter.record_response(_WEBHOOK_URL, None, {"result": [], "time": make_time(operating=1)})
+
+    assert reserve_at(rate_limiter, _NOW) == 0
+
+
+def test_batch_commands_operating_time_is_tracked():
+    rate_limiter = make_rate_limiter()
+    params = {"cmd": {"deals": "crm.deal.list?start=0", "users": "user.get?ID=1"}, "halt": False}
+    json_response = {
+        "result": {
+            "result": {},
+            "result_error": [],
+            "result_total": [],
+            "result_next": [],
+            "result_time": {
+                "deals": make_time(operating=_OPERATING_LIMIT),
+                "users": make_time(operating=1),
+            },
+        },
+        "time": get_empty_time(),
+    }
+
+    rate_limiter.record_response(_BATCH_URL, params, json_response)
+
+    assert reserve_at(rate_limiter, _NOW, _BATCH_URL, {"cmd": {"0": "user.get?ID=2"}}) == 0
+    assert reserve_at(rate_limiter, _NOW, _BATCH_URL, {"cmd": {"0": "CRM.DEAL.LIST?start=50"}}) == _OPERATING_RESET_IN
+    assert reserve_at(rate_limiter, _NOW, _OAUTH_URL) == _OPERATING_RESET_IN
+
+
+def test_query_limit_error_fills_bucket():
+    rate_limiter = make_rate_limiter()
+
+    with patch(_TIME_PATH, return_value=_NOW):
+        rate_limiter.record_error(_WEBHOOK_URL, None, make_error(BitrixAPIQueryLimitExceeded, "QUERY_LIMIT_EXCEEDED"))
+
+    assert reserve_at(rate_limiter, _NOW) == 1 / _DRAIN_RATE
+
+
+def test_operation_time_limit_error_blocks_method():
+    rate_limiter = make_rate_limiter()
+
+    with patch(_TIME_PATH, return_value=_NOW):
+        rate_limiter.record_error(_WEBHOOK_URL, None, make_error(BitrixAPIOperationTimeLimit, "OPERATION_TIME_LIMIT"))
+
+    assert reserve_at(rate_limiter, _NOW) == _OPERATING_WINDOW
+
+
+def test_file_backend_is_shared_between_instances(tmp_path):
+    first_limiter = make_rate_limiter(FileRateLimiterBackend(tmp_path))
+    second_limiter = make_rate_limiter(FileRateLimiterBackend(tmp_path))
+
+    for _ in range(_BUCKET_SIZE):
+        reserve_at(first_limiter, _NOW)
+
+    assert reserve_at(second_limiter, _NOW) == 1 / _DRAIN_RATE
+
+    second_limiter.backend.clear()
+
+    assert reserve_at(first_limiter, _NOW) == 0
+
+
+def test_requester_waits_and_records_response():
+    rate_limiter = Mock(spec=RateLimiter)
+    rate_limiter.reserve.return_value = 1 / _DRAIN_RATE
+    Config().rate_limiter = rate_limiter
+
+    payload = {"result": [], "time": get_empty_time()}
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    response.url = _WEBHOOK_URL
+    mock_session = Mock(spec=requests.Session)
+    mock_session.post.return_value = response
+
+    with patch.object(HTTPSessionPool, "get_session", return_value=mock_session), \
+            patch("b24pysdk.api.requesters.bitrix_api_requester.time.sleep") as mock_sleep:
+        json_response = BitrixAPIRequester(url=_WEBHOOK_URL, params={"start": 0}).call()
+
+    rate_limiter.reserve.assert_called_once_with(_WEBHOOK_URL, {"start": 0})
+    mock_sleep.assert_called_once_with(1 / _DRAIN_RATE)
+    rate_limiter.record_response.assert_called_once_with(_WEBHOOK_URL, {"start": 0}, json_response)
+
+
+def test_requester_records_rate_limit_error():
+    rate_limiter = Mock(spec=RateLimiter)
+    rate_limiter.reserve.return_value = 0
+    Config().rate_limiter = rate_limiter
+
+    response = requests.Response()
+    response.status_code = 503
+    response._content = json.dumps({"error": "QUERY_LIMIT_EXCEEDED", "error_description": "Too many requests"}).encode()
+    response.url = _WEBHOOK_URL
+    mock_session = Mock(spec=requests.Session)
+    mock_session.post.return_value = response
+
+    with patch.object(HTTPSessionPool, "get_session", return_value=mock_session), \
+            pytest.raises(BitrixAPIQueryLimitExceeded):
+        BitrixAPIRequester(url=_WEBHOOK_URL, max_retries=1).call()
+
+    rate_limiter.record_error.assert_called_once()
+    assert isinstance(rate_limiter.record_error.call_args.args[2], BitrixAPIQueryLimitExceeded)
@@ -0,0 +1,251 @@
+import asyncio
+import json
+from email.utils import formatdate
+from typing import Optional, Text
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import requests
+
+from b24pysdk import Config
+from b24pysdk.api.requesters import (
+    BitrixAPIRequester,
+    ExponentialBackoffRetryStrategy,
+    HTTPSessionPool,
+    LinearRetryStrategy,
+    RetryBudget,
+)
+from b24pysdk.errors import BitrixRequestError
+from b24pysdk.protocols import RetryStrategyProtocol
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requesters,
+    pytest.mark.retry_strategies,
+]
+
+_URL: Text = "https://example.bitrix24.com/rest/crm.deal.list.json"
+_OTHER_PORTAL_URL: Text = "https://other.bitrix24.com/rest/crm.deal.list.json"
+
+_NOW: float = 1_700_000_000.0
+_MAX_RETRIES: int = 4
+_INITIAL_RETRY_DELAY: float = 1.0
+_RETRY_DELAY_INCREMENT: float = 0.5
+_MAX_DELAY: float = 3.0
+_RETRY_AFTER: int = 2
+_BUDGET: int = 2
+
+_TIME_PATH: Text = "b24pysdk.api.requesters.retry_strategies.exponential_backoff_retry_strategy.time.time"
+_MONOTONIC_PATH: Text = "b24pysdk.api.requesters.retry_strategies.retry_budget.time.monotonic"
+
+
+@pytest.fixture(autouse=True)
+def restore_retry_strategy():
+    config = Config()
+    retry_strategy = config.retry_strategy
+    yield
+    config.retry_strategy = retry_strategy
+
+
+def make_response(status_code: int, payload: Optional[dict] = None, headers: Optional[dict] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload or {}).encode()
+    response.url = _URL
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+
+def get_delay(strategy, attempt: int = 1, url: Text = _URL, **kwargs):
+    return strategy.get_retry_delay(
+        url=url,
+        attempt=attempt,
+        max_retries=_MAX_RETRIES,
+        initial_retry_delay=_INITIAL_RETRY_DELAY,
+        retry_delay_increment=_RETRY_DELAY_INCREMENT,
+        **kwargs,
+    )
+
+
+def make_exponential_strategy(**kwargs) -> ExponentialBackoffRetryStrategy:
+    return ExponentialBackoffRetryStrategy(max_delay=_MAX_DELAY, jitter=False, retry_budget=None, **kwargs)
+
+
+def test_strategies_implement_protocol():
+    assert isinstance(LinearRetryStrategy(), RetryStrategyProtocol)
+    assert isinstance(ExponentialBackoffRetryStrategy(), RetryStrategyProtocol)
+
+
+def test_config_rejects_invalid_retry_strategy():
+    with pytest.raises(TypeError, match="Retry_strategy"):
+        Config().retry_strategy = object()
+
+
+def test_linear_strategy_retries_only_service_unavailable():
+    strategy = LinearRetryStrategy()
+
+    assert get_delay(strategy, attempt=1, response=make_response(503)) == _INITIAL_RETRY_DELAY + _RETRY_DELAY_INCREMENT
+    assert get_delay(strategy, attempt=2, response=make_response(503)) == _INITIAL_RETRY_DELAY + 2 * _RETRY_DELAY_INCREMENT
+    assert get_delay(strategy, attempt=_MAX_RETRIES, response=make_response(503)) is None
+    assert get_delay(strategy, response=make_response(429)) is None
+    assert get_delay(strategy, error=requests.ConnectionError()) is None
+
+
+def test_exponential_delays_are_capped():
+    strategy = make_exponential_strategy()
+    response = make_response(503)
+
+    delays = [get_delay(strategy, attempt=attempt, response=response) for attempt in range(1, _MAX_RETRIES)]
+
+    assert delays == [_INITIAL_RETRY_DELAY, 2 * _INITIAL_RETRY_DELAY, _MAX_DELAY]
+    assert get_delay(strategy, attempt=_MAX_RETRIES, response=response) is None
+
+
+def test_full_jitter():
+    strategy = ExponentialBackoffRetryStrategy(retry_budget=None)
+
+    with patch("b24pysdk.api.requesters.retry_strategies.exponential_backoff_retry_strategy.random.uniform", return_value=0.25) as mock_uniform:
+        assert get_delay(strategy, attempt=2, response=make_response(429)) == mock_uniform.return_value
+
+    mock_uniform.assert_called_once_with(0, 2 * _INITIAL_RETRY_DELAY)
+
+
+@pytest.mark.parametrize(
+    ("status_code", "error", "is_retried"),
+    [
+        (429, "QUERY_LIMIT_EXCEEDED", True),
+        (503, "OVERLOAD_LIMIT", True),
+        (200, "QUERY_LIMIT_EXCEEDED", False),
+        (504, None, True),
+        (400, "INVALID_REQUEST", False),
+        (401, "EXPIRED_TOKEN", False),
+        (500, "INTERNAL_SERVER_ERROR", False),
+    ],
+)
+def test_retryable_responses(status_code, error, is_retried):
+    payload = {"error": error, "error_description": "description"} if error else None
+
+    delay = get_delay(make_exponential_strategy(), response=make_response(status_code, payload))
+
+    assert (delay is not None) is is_retried
+
+
+def test_successful_response_body_is_not_decoded():
+    response = make_response(200, {"result": [{"ID": 1}]})
+
+    with patch.object(requests.Response, "json") as mock_json, \
+            patch("b24pysdk.api.requesters.retry_strategies._base_retry_strategy.get_json_codec") as mock_get_json_codec:
+        assert get_delay(make_exponential_strategy(), response=response) is None
+
+    mock_json.assert_not_called()
+    mock_get_json_codec.assert_not_called()
+
+
+def test_error_response_body_is_decoded_by_json_codec():
+    response = make_response(429, {"error": "QUERY_LIMIT_EXCEEDED"})
+
+    with patch.object(requests.Response, "json") as mock_json:
+        assert get_delay(make_exponential_strategy(retry_status_codes=()), response=response) == _INITIAL_RETRY_DELAY
+
+    mock_json.assert_not_called()
+
+
+def test_custom_error_codes():
+    strategy = make_exponential_strategy(retry_error_codes={"INTERNAL_SERVER_ERROR"})
+
+    assert get_delay(strategy, response=make_response(500, {"error": "INTERNAL_SERVER_ERROR"})) == _INITIAL_RETRY_DELAY
+
+
+def test_retry_after_header_is_honored():
+    strategy = make_exponential_strategy()
+
+    assert get_delay(strategy, response=make_response(429, headers={"Retry-After": str(_RETRY_AFTER)})) == _RETRY_AFTER
+
+    with patch(_TIME_PATH, return_value=_NOW):
+        http_date = formatdate(_NOW + _RETRY_AFTER, usegmt=True)
+        assert get_delay(strategy, response=make_response(503, headers={"Retry-After": http_date})) == _RETRY_AFTER
+
+    assert get_delay(strategy, response=make_response(429, headers={"Retry-After": str(_MAX_DELAY + 1)})) is None
+
+
+def test_operating_reset_at_is_honored():
+    strategy = make_exponential_strategy()
+
+    def make_operating_response(reset_in: float) -> requests.Response:
+        return make_response(429, {"error": "OPERATION_TIME_LIMIT", "time": {"operating_reset_at": _NOW + reset_in}})
+
+    with patch(_TIME_PATH, return_value=_NOW):
+        assert get_delay(strategy, response=make_operating_response(_RETRY_AFTER)) == _RETRY_AFTER
+        assert get_delay(strategy, response=make_operating_response(_MAX_DELAY + 1)) is None
+
+
+def test_transport_errors():
+    strategy = make_exponential_strategy()
+
+    assert get_delay(strategy, error=requests.ConnectionError()) == _INITIAL_RETRY_DELAY
+    assert get_delay(strategy, error=requests.ConnectTimeout()) == _INITIAL_RETRY_DELAY
+    assert get_delay(strategy, error=requests.ReadTimeout()) is None
+    assert get_delay(make_exponential_strategy(retry_on_timeout=True), error=requests.ReadTimeout()) == _INITIAL_RETRY_DELAY
+
+
+def test_retry_budget_is_per_portal():
+    strategy = ExponentialBackoffRetryStrategy(jitter=False, retry_budget=RetryBudget(max_retries=_BUDGET, refill_rate=1))
+    response = make_response(503)
+
+    with patch(_MONOTONIC_PATH, return_value=_NOW):
+        delays = [get_delay(strategy, response=response) for _ in range(_BUDGET + 1)]
+
+        assert delays == [_INITIAL_RETRY_DELAY] * _BUDGET + [None]
+        assert get_delay(strategy, url=_OTHER_PORTAL_URL, response=response) == _INITIAL_RETRY_DELAY
+
+    with patch(_MONOTONIC_PATH, return_value=_NOW + 1):
+        assert get_delay(strategy, response=response) == _INITIAL_RETRY_DELAY
+
+
+def test_invalid_strategy_values():
+    with pytest.raises(ValueError, match="Max_delay"):
+        ExponentialBackoffRetryStrategy(max_delay=0)
+
+    with pytest.raises(ValueError, match="Max_retries"):
+        RetryBudget(max_retries=0)
+
+
+def test_requester_retries_transport_errors_and_rate_limits():
+    Config().retry_strategy = make_exponential_strategy()
+    mock_session = Mock(spec=requests.Session)
+    mock_session.post.side_effect = [
+        requests.ConnectionError("Connection reset by peer"),
+        make_response(429, {"error": "QUERY_LIMIT_EXCEEDED"}),
+        make_response(200, {"result": True, "time": {}}),
+    ]
+
+    with patch.object(HTTPSessionPool, "get_session", return_value=mock_session), \
+            patch("b24pysdk.api.requesters._base_requester.time.sleep") as mock_sleep:
+        response = BitrixAPIRequester(url=_URL, max_retries=_MAX_RETRIES, initial_retry_delay=_INITIAL_RETRY_DELAY)._post()
+
+    assert response.status_code == requests.codes.ok
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [_INITIAL_RETRY_DELAY, 2 * _INITIAL_RETRY_DELAY]
+
+
+def test_requester_raises_transport_error_with_default_strategy():
+    mock_session = Mock(spec=requests.Session)
+    mock_session.post.side_effect = requests.ConnectionError("Connection reset by peer")
+
+    with patch.object(HTTPSessionPool, "get_session", return_value=mock_session), \
+            pytest.raises(BitrixRequestError):
+        BitrixAPIRequester(url=_URL, max_retries=_MAX_RETRIES)._post()
+
+    mock_session.post.assert_called_once()
+
+
+def test_async_requester_uses_retry_strategy():
+    Config().retry_strategy = make_exponential_strategy()
+    requester = BitrixAPIRequester(url=_URL, max_retries=_MAX_RETRIES, initial_retry_delay=_INITIAL_RETRY_DELAY)
+
+    with patch.object(BitrixAPIRequester, "_arequest", AsyncMock(side_effect=[make_response(503), make_response(200, {"result": True})])), \
+            patch("b24pysdk.api.requesters._base_requester.asyncio.sleep", AsyncMock()) as mock_sleep:
+        response = asyncio.run(requester._apost())
+
+    assert response.status_code == requests.codes.ok
+    mock_sleep.assert_awaited_once_with(_INITIAL_RETRY_DELAY)
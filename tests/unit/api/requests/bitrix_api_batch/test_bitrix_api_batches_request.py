@@ -142,6 +142,7 @@ def test_call_method_delegates_to_call_batches():
     token_mock.call_batches.assert_called_once_with(
         methods=expected_methods,
         halt=True,
+        max_concurrency=None,
         extra_key="extra_val",
     )
 
@@ -0,0 +1,104 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from b24pysdk.api.requests.bitrix_api_list_request import BitrixAPIListCompactRequest
+from b24pysdk.api.requests.bitrix_api_request import BitrixAPIRequest
+from b24pysdk.api.requests.bitrix_api_value_request import BitrixAPIValuesListCompactRequest, BitrixAPIValuesRequest
+from b24pysdk.api.responses import BitrixAPIListCompactResponse, BitrixAPIValuesListCompactResponse
+from b24pysdk.utils.compact_rows import CompactRows
+from b24pysdk.utils.types import JSONDict
+from tests.unit.examples import EXAMPLE_TIME_1, TOKEN_MOCK
+from tests.unit.helpers import assert_slots
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requests,
+    pytest.mark.bitrix_api_list_compact_request,
+]
+
+_PARAMS: JSONDict = {"filter": {"ID": 1}}
+_LIMIT: int = 50
+_ITEMS = [{"ID": "1", "TITLE": "Deal 1"}, {"ID": "2", "TITLE": "Deal 2"}]
+
+
+def _make_base_request(bitrix_token) -> BitrixAPIRequest:
+    return BitrixAPIRequest(
+        bitrix_token=bitrix_token,
+        api_method="crm.deal.list",
+        params=_PARAMS,
+        extra_opt=True,
+    )
+
+
+def test_as_list_returns_compact_request():
+    obj = _make_base_request(TOKEN_MOCK).as_list(limit=_LIMIT, compact=True)
+
+    assert isinstance(obj, BitrixAPIListCompactRequest)
+    assert obj._limit == _LIMIT
+    assert obj._kwargs["extra_opt"] is True
+
+
+def test_stream_and_compact_are_rejected():
+    with pytest.raises(ValueError, match="cannot be combined"):
+        _make_base_request(TOKEN_MOCK).as_list(stream=True, compact=True)
+
+
+def test_call_method_packs_streamed_items():
+    token_mock = Mock()
+    token_mock.call_list.return_value = {
+        "result": (item for item in _ITEMS),
+        "time": EXAMPLE_TIME_1,
+    }
+
+    response = _make_base_request(token_mock).as_list(limit=_LIMIT, compact=True).call()
+
+    assert isinstance(response, BitrixAPIListCompactResponse)
+    assert isinstance(response.result, CompactRows)
+    assert response.result.to_list() == _ITEMS
+    assert response.to_dict()["result"] == _ITEMS
+
+    token_mock.call_list.assert_called_once_with(
+        api_method="crm.deal.list",
+        params=_PARAMS,
+        limit=_LIMIT,
+        stream=True,
+        extra_opt=True,
+    )
+
+
+def test_async_call_packs_loaded_items():
+    token_mock = Mock()
+    token_mock.acall_list = AsyncMock(return_value={"result": _ITEMS, "time": EXAMPLE_TIME_1})
+
+    response = asyncio.run(_make_base_request(token_mock).as_list(compact=True).acall())
+
+    assert isinstance(response, BitrixAPIListCompactResponse)
+    assert list(response.result) == _ITEMS
+
+
+def test_values_request_adapts_compact_rows():
+    token_mock = Mock()
+    token_mock.call_list.return_value = {
+        "result": (item for item in _ITEMS),
+        "time": EXAMPLE_TIME_1,
+    }
+
+    values_request = BitrixAPIValuesRequest(
+        bitrix_token=token_mock,
+        api_method="crm.deal.list",
+        params=_PARAMS,
+        result_adapter=lambda result: [item["TITLE"] for item in result],
+    )
+
+    obj = values_request.as_list(compact=True)
+
+    assert isinstance(obj, BitrixAPIValuesListCompactRequest)
+    assert isinstance(obj.response, BitrixAPIValuesListCompactResponse)
+    assert obj.values == ["Deal 1", "Deal 2"]
+
+
+def test_slots_defined():
+    assert_slots(BitrixAPIListCompactRequest)
+    assert_slots(BitrixAPIValuesListCompactRequest)
@@ -0,0 +1,76 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from b24pysdk.api.requests.bitrix_api_list_request import BitrixAPIListRequest, BitrixAPIListStreamRequest
+from b24pysdk.api.requests.bitrix_api_request import BitrixAPIRequest
+from b24pysdk.api.responses import BitrixAPIListFastResponse
+from b24pysdk.utils.types import JSONDict
+from tests.unit.examples import EXAMPLE_TIME_1, TOKEN_MOCK
+from tests.unit.helpers import assert_slots
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requests,
+    pytest.mark.bitrix_api_list_stream_request,
+]
+
+_PARAMS: JSONDict = {"filter": {"ID": 1}}
+_LIMIT: int = 50
+_ITEMS = [{"id": 1, "title": "Deal 1"}, {"id": 2, "title": "Deal 2"}]
+
+
+def _make_base_request(bitrix_token) -> BitrixAPIRequest:
+    return BitrixAPIRequest(
+        bitrix_token=bitrix_token,
+        api_method="crm.deal.list",
+        params=_PARAMS,
+        extra_opt=True,
+    )
+
+
+def test_as_list_returns_stream_request():
+    base_request = _make_base_request(TOKEN_MOCK)
+
+    assert type(base_request.as_list(limit=_LIMIT)) is BitrixAPIListRequest
+
+    obj = base_request.as_list(limit=_LIMIT, stream=True)
+
+    assert isinstance(obj, BitrixAPIListStreamRequest)
+    assert obj._limit == _LIMIT
+    assert obj._kwargs["extra_opt"] is True
+
+
+def test_call_method_success():
+    token_mock = Mock()
+    token_mock.call_list.return_value = {
+        "result": (item for item in _ITEMS),
+        "time": EXAMPLE_TIME_1,
+    }
+
+    obj = _make_base_request(token_mock).as_list(limit=_LIMIT, stream=True)
+
+    response = obj.call()
+
+    assert isinstance(response, BitrixAPIListFastResponse)
+    assert list(response.result) == _ITEMS
+
+    token_mock.call_list.assert_called_once_with(
+        api_method="crm.deal.list",
+        params=_PARAMS,
+        limit=_LIMIT,
+        stream=True,
+        extra_opt=True,
+    )
+
+
+def test_async_call_is_rejected():
+    obj = _make_base_request(TOKEN_MOCK).as_list(stream=True)
+
+    with pytest.raises(TypeError, match="Streaming list requests"):
+        asyncio.run(obj.acall())
+
+
+def test_slots_defined():
+    assert_slots(BitrixAPIListStreamRequest)
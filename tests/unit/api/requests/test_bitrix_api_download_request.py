@@ -0,0 +1,126 @@
+import asyncio
+import io
+from typing import Text
+from unittest.mock import Mock, patch
+
+import pytest
+
+from b24pysdk.api.requests import BitrixAPIDownloadRequest, BitrixAPIRequest
+from b24pysdk.api.responses import BitrixAPIResponse
+from b24pysdk.utils.types import JSONDict
+from tests.unit.examples import EXAMPLE_TIME_1, TOKEN_MOCK
+from tests.unit.helpers import assert_slots
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requests,
+    pytest.mark.bitrix_api_download_request,
+]
+
+_DOWNLOAD_URL: Text = "https://example.bitrix24.com/disk/downloadFile/1/?auth=token"
+_PARAMS: JSONDict = {"id": 1}
+_SIZE: int = 1024
+_TIMEOUT: int = 30
+
+
+def _make_base_request(bitrix_token, api_method="disk.file.get") -> BitrixAPIRequest:
+    return BitrixAPIRequest(
+        bitrix_token=bitrix_token,
+        api_method=api_method,
+        params=_PARAMS,
+        timeout=_TIMEOUT,
+    )
+
+
+def _make_token_mock(result=None) -> Mock:
+    token_mock = Mock()
+    token_mock.call_method.return_value = {
+        "result": {"ID": 1, "DOWNLOAD_URL": _DOWNLOAD_URL} if result is None else result,
+        "time": EXAMPLE_TIME_1,
+    }
+    token_mock.call_method_download.return_value = _SIZE
+    return token_mock
+
+
+def test_slots():
+    assert_slots(BitrixAPIDownloadRequest)
+
+
+def test_as_download_returns_download_request():
+    file = io.BytesIO()
+
+    obj = _make_base_request(TOKEN_MOCK).as_download(file, resume=True, chunk_size=_SIZE)
+
+    assert isinstance(obj, BitrixAPIDownloadRequest)
+    assert obj._api_method == "disk.file.get"
+    assert obj._destination is file
+    assert obj._resume is True
+    assert obj._chunk_size == _SIZE
+    assert obj._kwargs["timeout"] == _TIMEOUT
+
+
+def test_call_downloads_from_download_url():
+    token_mock = _make_token_mock()
+    file = io.BytesIO()
+
+    with patch("b24pysdk.api.requests.bitrix_api_download_request.call_download", return_value=_SIZE) as call_download_mock:
+        response = _make_base_request(token_mock).as_download(file).call()
+
+    token_mock.call_method.assert_called_once_with(api_method="disk.file.get", params=_PARAMS, timeout=_TIMEOUT)
+    call_download_mock.assert_called_once_with(
+        _DOWNLOAD_URL,
+        destination=file,
+        resume=False,
+        chunk_size=None,
+        progress_callback=None,
+        timeout=_TIMEOUT,
+    )
+    assert isinstance(response, BitrixAPIResponse)
+    assert response.result == _SIZE
+
+
+def test_download_method_is_requested_directly():
+    token_mock = _make_token_mock()
+    file = io.BytesIO()
+
+    response = _make_base_request(token_mock, api_method="catalog.product.download").as_download(file).call()
+
+    token_mock.call_method.assert_not_called()
+    token_mock.call_method_download.assert_called_once_with(
+        api_method="catalog.product.download",
+        params=_PARAMS,
+        timeout=_TIMEOUT,
+        destination=file,
+        resume=False,
+        chunk_size=None,
+        progress_callback=None,
+    )
+    assert response.result == _SIZE
+
+
+def test_missing_download_url_is_rejected():
+    token_mock = _make_token_mock(result={"ID": 1})
+
+    with pytest.raises(ValueError, match="DOWNLOAD_URL"):
+        _make_base_request(token_mock).as_download(io.BytesIO()).call()
+
+
+def test_async_download_is_rejected():
+    with pytest.raises(TypeError, match="asynchronously"):
+        asyncio.run(_make_base_request(TOKEN_MOCK).as_download(io.BytesIO()).acall())
+
+
+def test_call_concurrently_keeps_order():
+    token_mock = _make_token_mock()
+    download_requests = [_make_base_request(token_mock).as_download(io.BytesIO()) for _ in range(3)]
+
+    with patch("b24pysdk.api.requests.bitrix_api_download_request.call_download", side_effect=[1, 2, 3]):
+        responses = BitrixAPIDownloadRequest.call_concurrently(download_requests, max_concurrency=1)
+
+    assert [response.result for response in responses] == [1, 2, 3]
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1, 1.5])
+def test_call_concurrently_rejects_invalid_max_concurrency(max_concurrency):
+    with pytest.raises(ValueError, match="Max_concurrency"):
+        BitrixAPIDownloadRequest.call_concurrently([], max_concurrency=max_concurrency)
@@ -0,0 +1,211 @@
+from typing import TYPE_CHECKING, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from b24pysdk import BitrixToken, Client
+from b24pysdk.api.callers._utils import get_empty_time
+from b24pysdk.errors import BitrixAPIBatchCommandError, BitrixAPIError
+from b24pysdk.schemas.api import BatchResponseData, ResponseData
+
+if TYPE_CHECKING:
+    from b24pysdk.utils.types import B24Requests
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requests,
+    pytest.mark.request_coalescer,
+]
+
+_DEAL_IDS: List[int] = [1, 2, 3, 2, 1]
+_MISSING_DEAL_ID: int = 404
+_DURATION: float = 0.5
+_ADDED_DEAL_ID: int = 10
+
+
+def _make_deal(deal_id: int) -> Dict:
+    return {"ID": str(deal_id), "TITLE": f"Deal {deal_id}"}
+
+
+class _FakePortal:
+    """Fake portal answering ``crm.deal.get`` calls and batches of them."""
+
+    def __init__(self):
+        self.batches: List["B24Requests"] = []
+        self.method_calls: List[Dict] = []
+
+    def call_method(self, params=None, **_kwargs) -> ResponseData:
+        self.method_calls.append(params)
+
+        if params.get("id") == _MISSING_DEAL_ID:
+            raise BitrixAPIError(json_response={"error": "NOT_FOUND", "error_description": "Not found"}, response=Mock(text=""))
+
+        return {"result": _make_deal(params.get("id", _ADDED_DEAL_ID)), "time": get_empty_time()}
+
+    def call_batches(self, methods, **_kwargs) -> BatchResponseData:
+        self.batches.append(methods)
+
+        result = {}
+        result_error = {}
+
+        for key, (_, params) in methods.items():
+            if params["id"] == _MISSING_DEAL_ID:
+                result_error[key] = {"error": "NOT_FOUND", "error_description": "Not found"}
+            else:
+                result[key] = _make_deal(params["id"])
+
+        return {
+            "result": {
+                "result": result,
+                "result_error": result_error,
+                "result_total": [],
+                "result_next": [],
+                "result_time": {key: get_empty_time() | {"duration": _DURATION} for key in result},
+            },
+            "time": get_empty_time(),
+        }
+
+    def patch(self):
+        return patch.multiple(BitrixToken, call_method=self.call_method, call_batches=self.call_batches)
+
+
+@pytest.fixture
+def client():
+    return Client(BitrixToken(domain="example.bitrix24.com", auth_token="1/webhook_key"))  # noqa: S106
+
+
+@pytest.fixture
+def portal():
+    fake_portal = _FakePortal()
+
+    with fake_portal.patch():
+        yield fake_portal
+
+
+def test_requests_are_dispatched_in_one_batch(client, portal):
+    with client.coalesce():
+        deals = [client.crm.deal.get(bitrix_id=deal_id) for deal_id in _DEAL_IDS]
+
+    assert portal.batches == []
+
+    assert [deal.result for deal in deals] == [_make_deal(deal_id) for deal_id in _DEAL_IDS]
+    assert deals[0].time.duration == _DURATION
+    assert portal.method_calls == []
+    assert len(portal.batches) == 1
+
+
+def test_identical_requests_are_sent_once(client, portal):
+    with client.coalesce():
+        deals = [client.crm.deal.get(bitrix_id=deal_id) for deal_id in _DEAL_IDS]
+        deals[0].call()
+
+    assert sorted(params["id"] for _, params in portal.batches[0].values()) == sorted(set(_DEAL_IDS))
+
+
+def test_requests_created_after_dispatch_are_sent_in_next_batch(client, portal):
+    with client.coalesce():
+        first_deals = [client.crm.deal.get(bitrix_id=deal_id) for deal_id in _DEAL_IDS[:2]]
+        first_deals[0].call()
+
+        second_deals = [client.crm.deal.get(bitrix_id=deal_id) for deal_id in (3, 4)]
+        second_deals[0].call()
+
+    assert [len(batch) for batch in portal.batches] == [2, 2]
+    assert first_deals[1].result == _make_deal(_DEAL_IDS[1])
+
+
+def test_single_request_is_sent_as_method_call(client, portal):
+    with client.coalesce():
+        deal = client.crm.deal.get(bitrix_id=_DEAL_IDS[0])
+
+    assert deal.result == _make_deal(_DEAL_IDS[0])
+    assert portal.batches == []
+    assert len(portal.method_calls) == 1
+
+
+def test_failed_command_raises_on_access(client, portal):
+    with client.coalesce():
+        deal = client.crm.deal.get(bitrix_id=_DEAL_IDS[0])
+        missing_deal = client.crm.deal.get(bitrix_id=_MISSING_DEAL_ID)
+
+    with pytest.raises(BitrixAPIBatchCommandError, match="Not found") as exc_info:
+        missing_deal.call()
+
+    assert exc_info.value.json_response["error"] == "NOT_FOUND"
+    assert deal.result == _make_deal(_DEAL_IDS[0])
+    assert len(portal.batches) == 1
+
+
+def test_failed_single_request_raises_api_error(client, portal):
+    with client.coalesce():
+        missing_deal = client.crm.deal.get(bitrix_id=_MISSING_DEAL_ID)
+
+    with pytest.raises(BitrixAPIError):
+        missing_deal.call()
+
+    assert portal.batches == []
+
+
+def test_requests_outside_block_are_not_coalesced(client, portal):
+    deals = [client.crm.deal.get(bitrix_id=deal_id) for deal_id in _DEAL_IDS[:3]]
+
+    for deal in deals:
+        deal.call()
+
+    assert portal.batches == []
+    assert len(portal.method_calls) == len(deals)
+
+
+def test_list_requests_are_not_coalesced(client, portal):
+    with client.coalesce():
+        deal = client.crm.deal.get(bitrix_id=_DEAL_IDS[0])
+        client.crm.deal.list().as_list()
+        other_deal = client.crm.deal.get(bitrix_id=_DEAL_IDS[1])
+
+    deal.call()
+
+    assert [api_method for api_method, _ in portal.batches[0].values()] == ["crm.deal.get", "crm.deal.get"]
+    assert other_deal.result == _make_deal(_DEAL_IDS[1])
+
+
+def test_requests_of_other_tokens_are_not_coalesced(client, portal):
+    other_client = Client(BitrixToken(domain="other.bitrix24.com", auth_token="1/webhook_key"))  # noqa: S106
+
+    with client.coalesce():
+        deal = client.crm.deal.get(bitrix_id=_DEAL_IDS[0])
+        other_deal = other_client.crm.deal.get(bitrix_id=_DEAL_IDS[0])
+
+    deal.call()
+    other_deal.call()
+
+    assert portal.batches == []
+    assert len(portal.method_calls) == len([deal, other_deal])
+
+
+def test_explicit_call_after_coalesced_response_is_sent_on_its_own(client, portal):
+    with client.coalesce():
+        deals = [client.crm.deal.get(bitrix_id=deal_id) for deal_id in _DEAL_IDS[:2]]
+
+    assert deals[0].result == _make_deal(_DEAL_IDS[0])
+
+    deals[0].call()
+
+    assert len(portal.batches) == 1
+    assert len(portal.method_calls) == 1
+
+
+def test_write_requests_are_not_coalesced(client, portal):
+    fields = {"TITLE": "Deal"}
+
+    with client.coalesce():
+        first = client.crm.deal.add(fields=fields)
+        second = client.crm.deal.add(fields=fields)
+        deal = client.crm.deal.get(bitrix_id=1)
+
+    assert deal.result == _make_deal(1)
+    assert portal.method_calls == [{"id": 1}]
+
+    assert first.result == second.result == _make_deal(_ADDED_DEAL_ID)
+
+    assert portal.batches == []
+    assert portal.method_calls == [{"id": 1}, {"fields": fields}, {"fields": fields}]
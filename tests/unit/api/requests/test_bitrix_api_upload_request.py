@@ -0,0 +1,122 @@
+import asyncio
+import io
+from typing import Text
+from unittest.mock import Mock, patch
+
+import pytest
+
+from b24pysdk import BitrixWebhook, Client
+from b24pysdk.api.requests import BitrixAPIRequest, BitrixAPIUploadRequest
+from b24pysdk.api.responses import BitrixAPIResponse
+from b24pysdk.utils.types import JSONDict
+from tests.unit.examples import EXAMPLE_TIME_1, TOKEN_MOCK
+from tests.unit.helpers import assert_slots
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requests,
+    pytest.mark.bitrix_api_upload_request,
+]
+
+_UPLOAD_URL: Text = "https://example.bitrix24.com/rest/upload.json?auth=token"
+_PARAMS: JSONDict = {"id": 1, "data": {"NAME": "report.pdf"}}
+_FILE_RESULT: JSONDict = {"ID": 10, "NAME": "report.pdf"}
+_TIMEOUT: int = 30
+
+
+def _make_base_request(bitrix_token, params=_PARAMS) -> BitrixAPIRequest:
+    return BitrixAPIRequest(
+        bitrix_token=bitrix_token,
+        api_method="disk.folder.uploadfile",
+        params=params,
+        timeout=_TIMEOUT,
+        max_retries=2,
+    )
+
+
+def _make_token_mock(result=None) -> Mock:
+    token_mock = Mock()
+    token_mock.call_method.return_value = {
+        "result": {"field": "file", "uploadUrl": _UPLOAD_URL} if result is None else result,
+        "time": EXAMPLE_TIME_1,
+    }
+    return token_mock
+
+
+def test_slots():
+    assert_slots(BitrixAPIUploadRequest)
+
+
+def test_as_upload_returns_upload_request():
+    file = io.BytesIO(b"content")
+    progress_callback = Mock()
+
+    obj = _make_base_request(TOKEN_MOCK).as_upload(file, filename="other.pdf", progress_callback=progress_callback)
+
+    assert isinstance(obj, BitrixAPIUploadRequest)
+    assert obj._api_method == "disk.folder.uploadfile"
+    assert obj._params == _PARAMS
+    assert obj._file is file
+    assert obj._filename == "other.pdf"
+    assert obj._progress_callback is progress_callback
+    assert obj._kwargs["timeout"] == _TIMEOUT
+
+
+def test_call_requests_upload_url_and_streams_file():
+    token_mock = _make_token_mock()
+    file = io.BytesIO(b"content")
+    progress_callback = Mock()
+
+    with patch("b24pysdk.api.requests.bitrix_api_upload_request.call_upload") as call_upload_mock:
+        call_upload_mock.return_value = {"result": _FILE_RESULT, "time": EXAMPLE_TIME_1}
+        response = _make_base_request(token_mock).as_upload(file, progress_callback=progress_callback).call()
+
+    token_mock.call_method.assert_called_once_with(
+        api_method="disk.folder.uploadfile",
+        params=_PARAMS,
+        timeout=_TIMEOUT,
+        max_retries=2,
+    )
+    call_upload_mock.assert_called_once_with(
+        _UPLOAD_URL,
+        file=file,
+        field="file",
+        filename="report.pdf",
+        progress_callback=progress_callback,
+        timeout=_TIMEOUT,
+        max_retries=2,
+    )
+    assert isinstance(response, BitrixAPIResponse)
+    assert response.result == _FILE_RESULT
+
+
+def test_filename_is_left_to_caller_without_data_name():
+    token_mock = _make_token_mock()
+
+    with patch("b24pysdk.api.requests.bitrix_api_upload_request.call_upload") as call_upload_mock:
+        call_upload_mock.return_value = {"result": _FILE_RESULT, "time": EXAMPLE_TIME_1}
+        _make_base_request(token_mock, params={"id": 1}).as_upload("/tmp/report.pdf").call()  # noqa: S108
+
+    assert call_upload_mock.call_args.kwargs["filename"] is None
+
+
+def test_missing_upload_url_is_rejected():
+    token_mock = _make_token_mock(result=_FILE_RESULT)
+
+    with pytest.raises(ValueError, match="upload URL"):
+        _make_base_request(token_mock).as_upload(io.BytesIO(b"content")).call()
+
+
+def test_async_upload_is_rejected():
+    with pytest.raises(TypeError, match="asynchronously"):
+        asyncio.run(_make_base_request(TOKEN_MOCK).as_upload(io.BytesIO(b"content")).acall())
+
+
+def test_disk_upload_methods_omit_empty_file_content():
+    client = Client(BitrixWebhook(domain="example.bitrix24.com", webhook_token="1/webhook_key"))  # noqa: S106
+
+    folder_request = client.disk.folder.uploadfile(1, None, {"NAME": "report.pdf"})
+    version_request = client.disk.file.uploadversion(1)
+
+    assert folder_request._params == {"id": 1, "data": {"NAME": "report.pdf"}}
+    assert version_request._params == {"id": 1}
@@ -0,0 +1,223 @@
+import asyncio
+import copy
+from multiprocessing import Manager
+from typing import Any, Dict, Text
+from unittest.mock import patch
+
+import pytest
+
+from b24pysdk import BitrixToken, Client, Config
+from b24pysdk.api.callers import acall_method, call_method
+from b24pysdk.api.response_caching import (
+    MemoryResponseCacheBackend,
+    ResponseCache,
+    SharedDictResponseCacheBackend,
+    SQLiteResponseCacheBackend,
+)
+from b24pysdk.constants.version import B24APIVersion
+from b24pysdk.protocols import ResponseCacheProtocol
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.response_cache,
+]
+
+_NOW: float = 1_700_000_000.0
+_TTL: int = 60
+_MAX_SIZE: int = 2
+_DURATION: float = 0.25
+
+_DOMAIN: Text = "example.bitrix24.com"
+_OTHER_DOMAIN: Text = "other.bitrix24.com"
+_AUTH_DATA: Dict[Text, Any] = dict(domain=_DOMAIN, auth_token="1/webhook_key", is_webhook=True)  # noqa: S106
+_FIELDS: Dict[Text, Any] = {"TITLE": {"type": "string"}}
+
+_TIME_PATH: Text = "time.time"
+_CALL_PATH: Text = "b24pysdk.api.callers.call_method.call"
+_ACALL_PATH: Text = "b24pysdk.api.callers.call_method.acall"
+
+
+def _make_response(result: Any = None) -> Dict[Text, Any]:
+    return {
+        "result": copy.deepcopy(_FIELDS) if result is None else result,
+        "time": {
+            "start": _NOW,
+            "finish": _NOW + _DURATION,
+            "duration": _DURATION,
+            "processing": _DURATION,
+            "date_start": "2023-11-14T22:13:20+00:00",
+            "date_finish": "2023-11-14T22:13:20+00:00",
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def restore_response_cache():
+    config = Config()
+    response_cache = config.response_cache
+    yield
+    config.response_cache = response_cache
+
+
+@pytest.fixture
+def response_cache() -> ResponseCache:
+    response_cache = ResponseCache()
+    Config().response_cache = response_cache
+    return response_cache
+
+
+@pytest.fixture(params=["memory", "shared_dict", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryResponseCacheBackend(max_size=_MAX_SIZE)
+    elif request.param == "shared_dict":
+        with Manager() as manager:
+            yield SharedDictResponseCacheBackend(manager.dict(), lock=manager.Lock(), max_size=_MAX_SIZE)
+    else:
+        yield SQLiteResponseCacheBackend(tmp_path / "cache.sqlite3", max_size=_MAX_SIZE)
+
+
+def test_response_cache_implements_protocol():
+    assert isinstance(ResponseCache(), ResponseCacheProtocol)
+
+
+def test_default_ttls():
+    response_cache = ResponseCache()
+
+    for api_method in ("crm.deal.fields", "crm.item.fields", "user.fields", "CRM.STATUS.LIST", "crm.category.list", "catalog.product.getFieldsByFilter", "crm.deal.userfield.list"):
+        assert response_cache.get_ttl(api_method) is not None, api_method
+
+    for api_method in ("crm.deal.list", "crm.deal.add", "crm.deal.fields.update"):
+        assert response_cache.get_ttl(api_method) is None, api_method
+
+
+def test_custom_ttls():
+    response_cache = ResponseCache(ttls={"crm.*.fields": _TTL, "crm.deal.fields": _TTL * 2})
+
+    assert response_cache.get_ttl("crm.deal.fields") == _TTL * 2
+    assert response_cache.get_ttl("crm.lead.fields") == _TTL
+    assert response_cache.get_ttl("user.fields") is None
+
+
+@pytest.mark.parametrize("ttl", [0, -1, "60"])
+def test_invalid_ttl(ttl):
+    with pytest.raises(ValueError, match="Ttl of"):
+        ResponseCache(ttls={"crm.deal.fields": ttl})
+
+
+def test_invalid_response_cache():
+    with pytest.raises(TypeError, match="Response_cache"):
+        Config().response_cache = object()
+
+
+def test_backend_expiry_and_lru(backend):
+    with patch(_TIME_PATH, return_value=_NOW):
+        backend.set(_DOMAIN, "crm.deal.fields", "a", b"1", _TTL)
+        backend.set(_DOMAIN, "crm.lead.fields", "b", b"2", _TTL)
+
+        assert backend.get(_DOMAIN, "crm.deal.fields", "a") == b"1"
+
+        backend.set(_DOMAIN, "user.fields", "c", b"3", _TTL)
+
+        assert backend.get(_DOMAIN, "crm.lead.fields", "b") is None
+        assert backend.get(_DOMAIN, "crm.deal.fields", "a") == b"1"
+        assert backend.get(_DOMAIN, "user.fields", "c") == b"3"
+
+    with patch(_TIME_PATH, return_value=_NOW + _TTL):
+        assert backend.get(_DOMAIN, "crm.deal.fields", "a") is None
+
+
+def test_backend_invalidate(backend):
+    backend.set(_DOMAIN, "crm.deal.fields", "a", b"1", _TTL)
+    backend.set(_OTHER_DOMAIN, "crm.deal.fields", "a", b"2", _TTL)
+
+    backend.invalidate(domain=_OTHER_DOMAIN)
+
+    assert backend.get(_DOMAIN, "crm.deal.fields", "a") == b"1"
+    assert backend.get(_OTHER_DOMAIN, "crm.deal.fields", "a") is None
+
+    backend.set(_OTHER_DOMAIN, "crm.deal.fields", "a", b"2", _TTL)
+    backend.invalidate(api_method="crm.deal.fields")
+
+    assert backend.get(_DOMAIN, "crm.deal.fields", "a") is None
+    assert backend.get(_OTHER_DOMAIN, "crm.deal.fields", "a") is None
+
+    backend.set(_DOMAIN, "crm.deal.fields", "a", b"1", _TTL)
+    backend.clear()
+
+    assert backend.get(_DOMAIN, "crm.deal.fields", "a") is None
+
+
+@pytest.mark.usefixtures("response_cache")
+def test_call_method_is_cached():
+    with patch(_CALL_PATH, return_value=_make_response()) as mock_call:
+        first = call_method(api_method="crm.deal.fields", **_AUTH_DATA)
+        second = call_method(api_method="crm.deal.fields", **_AUTH_DATA)
+
+    mock_call.assert_called_once()
+    assert first["time"]["duration"] == _DURATION
+    assert second["result"] == first["result"]
+    assert second["time"]["duration"] == 0
+
+
+@pytest.mark.usefixtures("response_cache")
+def test_cache_key_includes_portal_params_and_version():
+    with patch(_CALL_PATH, return_value=_make_response()) as mock_call:
+        call_method(api_method="crm.item.fields", params={"entityTypeId": 2, "useOriginalUfNames": "N"}, **_AUTH_DATA)
+        call_method(api_method="crm.item.fields", params={"useOriginalUfNames": "N", "entityTypeId": 2}, **_AUTH_DATA)
+        call_method(api_method="crm.item.fields", params={"entityTypeId": 1}, **_AUTH_DATA)
+        call_method(api_method="crm.item.fields", params={"entityTypeId": 2, "useOriginalUfNames": "N"}, **_AUTH_DATA | {"domain": _OTHER_DOMAIN})
+        call_method(api_method="crm.item.fields", params={"entityTypeId": 2, "useOriginalUfNames": "N"}, prefer_version=B24APIVersion.V3, **_AUTH_DATA)
+
+    assert mock_call.call_count == len({(2, _DOMAIN), (1, _DOMAIN), (2, _OTHER_DOMAIN)})
+
+
+@pytest.mark.usefixtures("response_cache")
+def test_not_cached_methods():
+    with patch(_CALL_PATH, return_value=_make_response(1)) as mock_call:
+        call_method(api_method="crm.deal.add", params={"fields": {"TITLE": "Deal"}}, **_AUTH_DATA)
+        call_method(api_method="crm.deal.add", params={"fields": {"TITLE": "Deal"}}, **_AUTH_DATA)
+
+    assert mock_call.call_count == len(["first", "second"])
+
+
+def test_invalidate(response_cache):
+    with patch(_CALL_PATH, return_value=_make_response()) as mock_call:
+        call_method(api_method="crm.deal.fields", **_AUTH_DATA)
+        response_cache.invalidate(domain=_DOMAIN.upper(), api_method="CRM.DEAL.FIELDS")
+        call_method(api_method="crm.deal.fields", **_AUTH_DATA)
+
+    assert mock_call.call_count == len(["before", "after invalidation"])
+
+
+def test_cached_response_is_not_shared(response_cache):
+    with patch(_CALL_PATH, return_value=_make_response()):
+        call_method(api_method="crm.deal.fields", **_AUTH_DATA)["result"]["TITLE"]["type"] = "changed"
+
+    assert response_cache.get(_DOMAIN, "crm.deal.fields", {})["result"] == _FIELDS
+
+
+@pytest.mark.usefixtures("response_cache")
+def test_async_call_method_is_cached():
+    async def fake_acall(*_, **__):
+        return _make_response()
+
+    with patch(_ACALL_PATH, side_effect=fake_acall) as mock_acall:
+        asyncio.run(acall_method(api_method="user.fields", **_AUTH_DATA))
+        response = asyncio.run(acall_method(api_method="user.fields", **_AUTH_DATA))
+
+    mock_acall.assert_called_once()
+    assert response["result"] == _FIELDS
+
+
+@pytest.mark.usefixtures("response_cache")
+def test_cache_hit_returns_bitrix_api_response():
+    client = Client(BitrixToken(domain=_DOMAIN, auth_token="1/webhook_key"))  # noqa: S106
+
+    with patch(_CALL_PATH, return_value=_make_response()) as mock_call:
+        client.crm.deal.fields().response  # noqa: B018
+        response = client.crm.deal.fields().response
+
+    mock_call.assert_called_once()
+    assert response.result == _FIELDS
+    assert response.time.duration == 0
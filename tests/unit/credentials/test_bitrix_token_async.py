@@ -0,0 +1,124 @@
+import asyncio
+import json
+from typing import Text
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import requests
+
+from b24pysdk import Config
+from b24pysdk.api.callers._utils import get_empty_time
+from b24pysdk.credentials import BitrixToken, BitrixWebhook
+from b24pysdk.credentials.auth import RenewedOAuth
+from b24pysdk.errors import BitrixAPIExpiredToken
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.credentials,
+    pytest.mark.bitrix_token,
+]
+
+_DOMAIN: Text = "test.bitrix24.com"
+_NEW_DOMAIN: Text = "new.bitrix24.com"
+_AUTH_TOKEN: Text = "access_token_123"  # noqa: S105
+_NEW_AUTH_TOKEN: Text = "access_token_456"  # noqa: S105
+_REFRESH_TOKEN: Text = "refresh_token_123"  # noqa: S105
+_WEBHOOK_TOKEN: Text = "1/webhook_key_123"  # noqa: S105
+
+
+class FakeAsyncTransport:
+    """Async transport returning prepared responses and recording requested URLs."""
+
+    def __init__(self, *responses: requests.Response):
+        self.responses = list(responses)
+        self.methods = []
+        self.urls = []
+        self.bodies = []
+
+    async def request(self, method, url, **kwargs) -> requests.Response:
+        self.methods.append(method)
+        self.urls.append(url)
+        self.bodies.append(json.loads(kwargs["data"]))
+        return self.responses.pop(0)
+
+    async def aclose(self):
+        pass
+
+
+def make_response(status_code: int, payload=None, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"" if payload is None else json.dumps(payload).encode()
+    response.headers.update(headers or {})
+    response.url = f"https://{_DOMAIN}/rest/user.current.json"
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def fake_transport():
+    config = Config()
+    async_transport = config.async_transport
+    yield lambda *responses: config.configure(async_transport=FakeAsyncTransport(*responses)) or config.async_transport
+    config.async_transport = async_transport
+
+
+def test_acall_method_changes_domain_after_redirect(fake_transport):
+    transport = fake_transport(
+        make_response(302, headers={"Location": f"https://{_NEW_DOMAIN}/rest/user.current.json"}),
+        make_response(200, {"result": {"ID": 1}}),
+    )
+    token = BitrixWebhook(domain=_DOMAIN, webhook_token=_WEBHOOK_TOKEN)
+
+    json_response = asyncio.run(token.acall_method("user.current"))
+
+    assert json_response == {"result": {"ID": 1}}
+    assert token.domain == _NEW_DOMAIN
+    assert transport.urls[-1].startswith(f"https://{_NEW_DOMAIN}/rest/")
+
+
+def test_acall_method_refreshes_expired_token(fake_transport):
+    transport = fake_transport(
+        make_response(401, {"error": "expired_token", "error_description": "The access token provided has expired."}),
+        make_response(200, {"result": {"ID": 1}}),
+    )
+    bitrix_app = Mock()
+    bitrix_app.arefresh_oauth_token = AsyncMock(return_value=Mock(spec=RenewedOAuth, oauth_token=Mock(
+        access_token=_NEW_AUTH_TOKEN,
+        refresh_token=_REFRESH_TOKEN,
+        expires=None,
+        expires_in=None,
+    )))
+    token = BitrixToken(domain=_DOMAIN, auth_token=_AUTH_TOKEN, refresh_token=_REFRESH_TOKEN, bitrix_app=bitrix_app)
+
+    json_response = asyncio.run(token.acall_method("user.current"))
+
+    assert json_response == {"result": {"ID": 1}}
+    bitrix_app.arefresh_oauth_token.assert_awaited_once_with(refresh_token=_REFRESH_TOKEN)
+    assert token.auth_token == _NEW_AUTH_TOKEN
+    assert transport.bodies[-1]["auth"] == _NEW_AUTH_TOKEN
+
+
+def test_acall_method_raises_expired_token_for_webhook(fake_transport):
+    fake_transport(make_response(401, {"error": "expired_token"}))
+    token = BitrixWebhook(domain=_DOMAIN, webhook_token=_WEBHOOK_TOKEN)
+
+    with pytest.raises(BitrixAPIExpiredToken):
+        asyncio.run(token.acall_method("user.current"))
+
+
+def test_request_acall_caches_response(fake_transport):
+    fake_transport(make_response(200, {"result": {"ID": 1}, "time": get_empty_time()}))
+    request = BitrixWebhook(domain=_DOMAIN, webhook_token=_WEBHOOK_TOKEN).get_client().user.current()
+
+    response = asyncio.run(request.acall())
+
+    assert request.response is response
+    assert request.result == {"ID": 1}
+
+
+def test_aget_app_info_requires_bitrix_app():
+    token = BitrixToken(domain=_DOMAIN, auth_token=_AUTH_TOKEN)
+
+    with pytest.raises(AttributeError):
+        asyncio.run(token.aget_app_info())
@@ -0,0 +1,367 @@
+import asyncio
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, Optional, Text
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from b24pysdk import Config
+from b24pysdk.credentials import BitrixToken, OAuthToken, RenewedOAuth
+from b24pysdk.credentials.oauth_token_storage import (
+    FileOAuthTokenStorage,
+    MemoryOAuthTokenStorage,
+    RedisOAuthTokenStorage,
+    SQLiteOAuthTokenStorage,
+)
+from b24pysdk.errors import BitrixAPIExpiredToken, BitrixRequestTimeout
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.credentials,
+    pytest.mark.oauth_token_refresh,
+]
+
+_DOMAIN: Text = "test.bitrix24.com"
+_CLIENT_ID: Text = "local.client_id"
+_AUTH_TOKEN: Text = "access_token_123"  # noqa: S105
+_REFRESH_TOKEN: Text = "refresh_token_123"  # noqa: S105
+_NEW_AUTH_TOKEN: Text = "access_token_456"  # noqa: S105
+_NEW_REFRESH_TOKEN: Text = "refresh_token_456"  # noqa: S105
+_THREADS: int = 32
+_REFRESH_DURATION: float = 0.05
+_REFRESHES_OF_TWO_TOKENS: int = 2
+_PRIVATE_DIRECTORY_MODE: int = 0o700
+_PRIVATE_FILE_MODE: int = 0o600
+
+
+def _expires_in(seconds: int):
+    return Config().get_local_datetime() + timedelta(seconds=seconds)
+
+
+def _make_bitrix_app(refresh_duration: float = _REFRESH_DURATION) -> Mock:
+    bitrix_app = Mock(client_id=_CLIENT_ID)
+
+    def refresh_oauth_token(refresh_token):
+        time.sleep(refresh_duration)
+        return Mock(spec=RenewedOAuth, oauth_token=OAuthToken(
+            access_token=f"{_NEW_AUTH_TOKEN}:{bitrix_app.refresh_oauth_token.call_count}",
+            refresh_token=f"{_NEW_REFRESH_TOKEN}:{refresh_token}",
+            expires=_expires_in(3600),
+            expires_in=3600,
+        ))
+
+    bitrix_app.refresh_oauth_token.side_effect = refresh_oauth_token
+
+    return bitrix_app
+
+
+def _make_token(bitrix_app: Mock, *, expires_in: int = -1) -> BitrixToken:
+    return BitrixToken(
+        domain=_DOMAIN,
+        auth_token=_AUTH_TOKEN,
+        refresh_token=_REFRESH_TOKEN,
+        expires=_expires_in(expires_in),
+        bitrix_app=bitrix_app,
+    )
+
+
+def _make_expired_token_error() -> BitrixAPIExpiredToken:
+    return BitrixAPIExpiredToken(
+        json_response={"error": "expired_token", "error_description": "The access token provided has expired."},
+        response=Mock(text=""),
+    )
+
+
+def _run_in_threads(func, threads: int = _THREADS):
+    barrier = threading.Barrier(threads)
+    config = Config()
+
+    def run():
+        config.bind_to_current_thread()
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(run) for _ in range(threads)]
+
+    return [future.result() for future in futures]
+
+
+class _FakeRedisClient:
+    """Dictionary-backed client implementing the subset of Redis commands used by the storage."""
+
+    def __init__(self):
+        self.values: Dict[Text, Text] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        return self.values.get(name)
+
+    def set(self, name, value, *, nx=False, px=None):  # noqa: ARG002
+        with self._lock:
+            if nx and name in self.values:
+                return None
+
+            self.values[name] = value
+
+            return True
+
+    def delete(self, *names):
+        with self._lock:
+            return sum(self.values.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match=None):
+        prefix = (match or "").rstrip("*")
+        return [name for name in list(self.values) if name.startswith(prefix)]
+
+
+@pytest.fixture
+def oauth_token_storage():
+    config = Config()
+    oauth_token_storage = config.oauth_token_storage
+
+    def configure(storage):
+        config.configure(oauth_token_storage=storage)
+        return storage
+
+    yield configure
+
+    config.oauth_token_storage = oauth_token_storage
+
+
+@pytest.fixture(params=["memory", "file", "sqlite", "redis"])
+def shared_storage(request, tmp_path, oauth_token_storage):
+    storages = {
+        "memory": MemoryOAuthTokenStorage,
+        "file": lambda: FileOAuthTokenStorage(directory=tmp_path / "tokens"),
+        "sqlite": lambda: SQLiteOAuthTokenStorage(path=tmp_path / "tokens.sqlite3"),
+        "redis": lambda: RedisOAuthTokenStorage(_FakeRedisClient(), poll_interval=0.001),
+    }
+    return oauth_token_storage(storages[request.param]())
+
+
+def test_concurrent_calls_with_expired_token_refresh_once():
+    bitrix_app = _make_bitrix_app()
+    token = _make_token(bitrix_app)
+
+    access_tokens = _run_in_threads(lambda: token._execute_with_retries(lambda: token.auth_token))
+
+    assert bitrix_app.refresh_oauth_token.call_count == 1
+    assert set(access_tokens) == {token.auth_token}
+    assert token.auth_token != _AUTH_TOKEN
+
+
+def test_concurrent_expired_token_errors_refresh_once():
+    bitrix_app = _make_bitrix_app()
+    token = _make_token(bitrix_app, expires_in=3600)
+
+    def call():
+        if token.auth_token == _AUTH_TOKEN:
+            time.sleep(_REFRESH_DURATION)
+            raise _make_expired_token_error()
+        return token.auth_token
+
+    access_tokens = _run_in_threads(lambda: token._execute_with_retries(call))
+
+    assert bitrix_app.refresh_oauth_token.call_count == 1
+    assert set(access_tokens) == {token.auth_token}
+
+
+def test_waiting_callers_receive_refresh_error():
+    bitrix_app = Mock(client_id=_CLIENT_ID)
+
+    def refresh_oauth_token(**_kwargs):
+        time.sleep(_REFRESH_DURATION)
+        raise BitrixRequestTimeout(original_error=TimeoutError(), timeout=1)
+
+    bitrix_app.refresh_oauth_token.side_effect = refresh_oauth_token
+    token = _make_token(bitrix_app)
+
+    def call() -> Optional[BaseException]:
+        try:
+            token._execute_with_retries(lambda: None)
+        except BitrixRequestTimeout as error:
+            return error
+        return None
+
+    errors = _run_in_threads(call)
+
+    assert bitrix_app.refresh_oauth_token.call_count == 1
+    assert all(isinstance(error, BitrixRequestTimeout) for error in errors)
+    assert token._refresh_future is None
+
+
+def test_token_expiring_within_margin_is_refreshed_before_call():
+    bitrix_app = _make_bitrix_app(refresh_duration=0)
+    token = _make_token(bitrix_app, expires_in=30)
+
+    assert token.is_expiring
+    assert not token.has_expired
+
+    access_token = token._execute_with_retries(lambda: token.auth_token)
+
+    bitrix_app.refresh_oauth_token.assert_called_once_with(refresh_token=_REFRESH_TOKEN)
+    assert access_token == token.auth_token != _AUTH_TOKEN
+
+
+def test_token_outside_margin_is_not_refreshed():
+    bitrix_app = _make_bitrix_app(refresh_duration=0)
+    token = _make_token(bitrix_app, expires_in=3600)
+
+    assert token._execute_with_retries(lambda: token.auth_token) == _AUTH_TOKEN
+    bitrix_app.refresh_oauth_token.assert_not_called()
+
+
+def test_failed_proactive_refresh_keeps_valid_token():
+    bitrix_app = Mock(client_id=_CLIENT_ID)
+    bitrix_app.refresh_oauth_token.side_effect = BitrixRequestTimeout(original_error=TimeoutError(), timeout=1)
+    token = _make_token(bitrix_app, expires_in=30)
+
+    assert token._execute_with_retries(lambda: token.auth_token) == _AUTH_TOKEN
+    bitrix_app.refresh_oauth_token.assert_called_once()
+
+
+def test_async_concurrent_calls_with_expired_token_refresh_once():
+    bitrix_app = Mock(client_id=_CLIENT_ID)
+
+    async def arefresh_oauth_token(refresh_token):
+        await asyncio.sleep(_REFRESH_DURATION)
+        return Mock(spec=RenewedOAuth, oauth_token=OAuthToken(
+            access_token=_NEW_AUTH_TOKEN,
+            refresh_token=refresh_token,
+            expires=_expires_in(3600),
+            expires_in=3600,
+        ))
+
+    bitrix_app.arefresh_oauth_token = AsyncMock(side_effect=arefresh_oauth_token)
+    token = _make_token(bitrix_app)
+
+    async def call():
+        return token.auth_token
+
+    async def main():
+        return await asyncio.gather(*(token._aexecute_with_retries(call) for _ in range(_THREADS)))
+
+    access_tokens = asyncio.run(main())
+
+    assert bitrix_app.arefresh_oauth_token.await_count == 1
+    assert set(access_tokens) == {_NEW_AUTH_TOKEN}
+
+
+@pytest.mark.usefixtures("shared_storage")
+def test_shared_storage_reuses_token_renewed_by_other_process():
+    bitrix_app = _make_bitrix_app(refresh_duration=0)
+    first_token = _make_token(bitrix_app)
+    second_token = _make_token(bitrix_app)
+
+    first_token._execute_with_retries(lambda: None)
+    second_token._execute_with_retries(lambda: None)
+
+    assert bitrix_app.refresh_oauth_token.call_count == 1
+    assert second_token.auth_token == first_token.auth_token != _AUTH_TOKEN
+    assert second_token.refresh_token == first_token.refresh_token
+
+
+def test_shared_storage_refreshes_with_freshest_refresh_token(shared_storage):
+    bitrix_app = _make_bitrix_app(refresh_duration=0)
+    first_token = _make_token(bitrix_app)
+    second_token = _make_token(bitrix_app)
+
+    first_token._execute_with_retries(lambda: None)
+    stored_refresh_token = first_token.refresh_token
+
+    shared_storage.update(
+        first_token._oauth_token_storage_key,
+        lambda oauth_token: OAuthToken(
+            access_token=oauth_token.access_token,
+            refresh_token=oauth_token.refresh_token,
+            expires=_expires_in(-1),
+            expires_in=oauth_token.expires_in,
+        ),
+    )
+
+    second_token._execute_with_retries(lambda: None)
+
+    assert bitrix_app.refresh_oauth_token.call_count == _REFRESHES_OF_TWO_TOKENS
+    bitrix_app.refresh_oauth_token.assert_called_with(refresh_token=stored_refresh_token)
+
+
+@pytest.mark.usefixtures("shared_storage")
+def test_shared_storage_refreshes_once_across_tokens():
+    bitrix_app = _make_bitrix_app()
+    tokens = [_make_token(bitrix_app) for _ in range(_THREADS)]
+    token_iter = iter(tokens)
+    token_iter_lock = threading.Lock()
+
+    def call():
+        with token_iter_lock:
+            token = next(token_iter)
+        return token._execute_with_retries(lambda: token.auth_token)
+
+    access_tokens = _run_in_threads(call)
+
+    assert bitrix_app.refresh_oauth_token.call_count == 1
+    assert len(set(access_tokens)) == 1
+
+
+def test_shared_storage_clear(shared_storage):
+    bitrix_app = _make_bitrix_app(refresh_duration=0)
+    _make_token(bitrix_app)._execute_with_retries(lambda: None)
+
+    shared_storage.clear()
+
+    _make_token(bitrix_app)._execute_with_retries(lambda: None)
+
+    assert bitrix_app.refresh_oauth_token.call_count == _REFRESHES_OF_TWO_TOKENS
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_file_storage_creates_private_files(tmp_path):
+    storage = FileOAuthTokenStorage(directory=tmp_path / "tokens")
+
+    storage.update(_DOMAIN, lambda _: OAuthToken(access_token=_AUTH_TOKEN, refresh_token=_REFRESH_TOKEN, expires=_expires_in(3600)))
+
+    path, = storage.directory.iterdir()
+
+    assert stat.S_IMODE(path.stat().st_mode) == _PRIVATE_FILE_MODE
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_file_storage_default_directory_is_private_to_user(tmp_path):
+    with patch("tempfile.gettempdir", return_value=str(tmp_path)):
+        directory = FileOAuthTokenStorage().directory
+
+    assert directory.parent == tmp_path
+    assert str(os.getuid()) in directory.name
+    assert stat.S_IMODE(directory.stat().st_mode) == _PRIVATE_DIRECTORY_MODE
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_file_storage_rejects_shared_default_directory(tmp_path):
+    with patch("tempfile.gettempdir", return_value=str(tmp_path)):
+        directory = FileOAuthTokenStorage().directory
+        directory.chmod(0o777)
+
+        with pytest.raises(PermissionError, match="other users"):
+            FileOAuthTokenStorage()
+
+
+def test_redis_storage_requires_redis_client():
+    with pytest.raises(TypeError, match="RedisClientProtocol"):
+        RedisOAuthTokenStorage(object())
+
+
+@pytest.mark.parametrize("value", [-1, "60"])
+def test_config_rejects_invalid_refresh_margin(value):
+    with pytest.raises(ValueError, match="non-negative"):
+        Config().oauth_token_refresh_margin = value
+
+
+def test_config_rejects_invalid_storage():
+    with pytest.raises(TypeError, match="OAuthTokenStorageProtocol"):
+        Config().oauth_token_storage = object()
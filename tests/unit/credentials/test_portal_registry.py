@@ -0,0 +1,213 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Text
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("psygnal")
+
+from b24pysdk import Config
+from b24pysdk.credentials import OAuthToken, RenewedOAuth
+from b24pysdk.credentials.portal_registry import (
+    MemoryPortalCredentialsStore,
+    PortalCredentials,
+    PortalRegistry,
+    SQLitePortalCredentialsStore,
+)
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.credentials,
+    pytest.mark.portal_registry,
+]
+
+_MEMBER_ID: Text = "member_id_1"
+_OTHER_MEMBER_ID: Text = "member_id_2"
+_DOMAIN: Text = "test.bitrix24.com"
+_OTHER_DOMAIN: Text = "other.bitrix24.com"
+_NEW_DOMAIN: Text = "new.bitrix24.com"
+_AUTH_TOKEN: Text = "access_token_123"  # noqa: S105
+_REFRESH_TOKEN: Text = "refresh_token_123"  # noqa: S105
+_NEW_AUTH_TOKEN: Text = "access_token_456"  # noqa: S105
+_NEW_REFRESH_TOKEN: Text = "refresh_token_456"  # noqa: S105
+_THREADS: int = 16
+
+
+def _make_credentials(member_id: Text = _MEMBER_ID, domain: Text = _DOMAIN, expires_in: int = 3600) -> PortalCredentials:
+    return PortalCredentials(
+        member_id=member_id,
+        domain=domain,
+        oauth_token=OAuthToken(
+            access_token=_AUTH_TOKEN,
+            refresh_token=_REFRESH_TOKEN,
+            expires=Config().get_local_datetime() + timedelta(seconds=expires_in),
+            expires_in=3600,
+        ),
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryPortalCredentialsStore()
+    return SQLitePortalCredentialsStore(tmp_path / "portals.sqlite3")
+
+
+@pytest.fixture
+def bitrix_app():
+    return Mock(client_id="local.client_id")
+
+
+def test_store_round_trip(store):
+    credentials = _make_credentials()
+
+    store.save(credentials)
+
+    for stored in (store.get(_MEMBER_ID), store.get_by_domain(_DOMAIN)):
+        assert stored.member_id == _MEMBER_ID
+        assert stored.domain == _DOMAIN
+        assert stored.oauth_token.access_token == _AUTH_TOKEN
+        assert stored.oauth_token.expires.timestamp() == pytest.approx(credentials.oauth_token.expires.timestamp())
+
+    store.delete(_MEMBER_ID)
+
+    assert store.get(_MEMBER_ID) is None
+    assert store.get_by_domain(_DOMAIN) is None
+
+
+def test_token_and_client_are_reused(store, bitrix_app):
+    registry = PortalRegistry(bitrix_app, store=store)
+    registry.register(_make_credentials())
+
+    bitrix_token = registry.get_token(_MEMBER_ID)
+
+    assert registry.get_token(domain=_DOMAIN) is bitrix_token
+    assert registry.get_client(_MEMBER_ID) is registry.get_client(domain=_DOMAIN)
+    assert registry.get_client(_MEMBER_ID)._bitrix_token is bitrix_token
+    assert bitrix_token.bitrix_app is bitrix_app
+
+
+def test_unknown_portal_raises_key_error(store, bitrix_app):
+    registry = PortalRegistry(bitrix_app, store=store)
+
+    with pytest.raises(KeyError):
+        registry.get_token(_MEMBER_ID)
+
+    with pytest.raises(ValueError, match="Exactly one"):
+        registry.get_token()
+
+
+def test_least_recently_used_portal_is_evicted(store, bitrix_app):
+    registry = PortalRegistry(bitrix_app, store=store, max_portals=1)
+    registry.register(_make_credentials())
+    registry.register(_make_credentials(member_id=_OTHER_MEMBER_ID, domain=_OTHER_DOMAIN))
+
+    assert _MEMBER_ID not in registry
+    assert _OTHER_MEMBER_ID in registry
+    assert len(registry) == 1
+
+    assert registry.get_token(_MEMBER_ID).domain == _DOMAIN
+    assert _OTHER_MEMBER_ID not in registry
+
+
+def test_idle_portal_is_evicted(store, bitrix_app):
+    registry = PortalRegistry(bitrix_app, store=store, idle_timeout=0.01)
+    registry.register(_make_credentials())
+    bitrix_token = registry.get_token(_MEMBER_ID)
+
+    time.sleep(0.02)
+    registry.register(_make_credentials(member_id=_OTHER_MEMBER_ID, domain=_OTHER_DOMAIN))
+
+    assert _MEMBER_ID not in registry
+    assert registry.get_token(_MEMBER_ID) is not bitrix_token
+
+
+def test_renewed_token_is_saved_to_store(store, bitrix_app):
+    registry = PortalRegistry(bitrix_app, store=store)
+    registry.register(_make_credentials(expires_in=-1))
+    bitrix_app.refresh_oauth_token.return_value = Mock(spec=RenewedOAuth, oauth_token=OAuthToken(
+        access_token=_NEW_AUTH_TOKEN,
+        refresh_token=_NEW_REFRESH_TOKEN,
+        expires=Config().get_local_datetime() + timedelta(hours=1),
+        expires_in=3600,
+    ))
+
+    registry.get_token(_MEMBER_ID)._execute_with_retries(lambda: None)
+
+    stored = store.get(_MEMBER_ID)
+
+    assert stored.oauth_token.access_token == _NEW_AUTH_TOKEN
+    assert stored.oauth_token.refresh_token == _NEW_REFRESH_TOKEN
+
+
+def test_domain_change_is_saved_to_store(store, bitrix_app):
+    registry = PortalRegistry(bitrix_app, store=store)
+    bitrix_token = registry.register(_make_credentials())
+
+    bitrix_token._check_and_change_domain(_NEW_DOMAIN)
+
+    assert store.get(_MEMBER_ID).domain == _NEW_DOMAIN
+    assert registry.get_token(domain=_NEW_DOMAIN) is bitrix_token
+
+
+def test_evicted_token_events_are_not_propagated(store, bitrix_app):
+    registry = PortalRegistry(bitrix_app, store=store)
+    bitrix_token = registry.register(_make_credentials())
+
+    registry.evict(_MEMBER_ID)
+    bitrix_token._check_and_change_domain(_NEW_DOMAIN)
+
+    assert store.get(_MEMBER_ID).domain == _DOMAIN
+
+
+def test_unregister_removes_credentials(store, bitrix_app):
+    registry = PortalRegistry(bitrix_app, store=store)
+    registry.register(_make_credentials())
+
+    registry.unregister(_MEMBER_ID)
+
+    assert _MEMBER_ID not in registry
+    assert store.get(_MEMBER_ID) is None
+
+
+def test_app_info_is_cached_with_ttl(store, bitrix_app):
+    registry = PortalRegistry(bitrix_app, store=store, app_info_ttl=0.05)
+    registry.register(_make_credentials())
+    barrier = threading.Barrier(_THREADS)
+
+    def get_app_info(*_args):
+        time.sleep(0.01)
+        return Mock(result=object())
+
+    bitrix_app.get_app_info.side_effect = get_app_info
+
+    def call():
+        barrier.wait()
+        return registry.get_app_info(_MEMBER_ID)
+
+    with ThreadPoolExecutor(max_workers=_THREADS) as executor:
+        app_infos = list(executor.map(lambda _: call(), range(_THREADS)))
+
+    assert len({id(app_info) for app_info in app_infos}) == 1
+    assert bitrix_app.get_app_info.call_count == 1
+
+    time.sleep(0.06)
+
+    assert registry.get_app_info(_MEMBER_ID) is not app_infos[0]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error"),
+    [
+        ({"max_portals": 0}, ValueError),
+        ({"idle_timeout": 0}, ValueError),
+        ({"app_info_ttl": -1}, ValueError),
+        ({"store": object()}, TypeError),
+    ],
+)
+def test_invalid_arguments(bitrix_app, kwargs, error):
+    with pytest.raises(error):
+        PortalRegistry(bitrix_app, **kwargs)
@@ -0,0 +1,237 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Text
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from b24pysdk import BitrixApp, BitrixToken
+from b24pysdk.api.responses import B24AppInfoResult
+from b24pysdk.credentials import OAuthEventData
+from b24pysdk.integrations.app_info_caching import AppInfoCache, MemoryAppInfoCacheBackend, RedisAppInfoCacheBackend
+from b24pysdk.utils.types import JSONDict
+
+from ...examples import INSTALL_DATA
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.app_info_cache,
+]
+
+_ACCESS_TOKEN = "access-token"  # noqa: S105
+_APPLICATION_TOKEN = "app-token"  # noqa: S105
+_MAX_SIZE: int = 2
+_THREADS: int = 16
+_LOAD_DURATION: float = 0.05
+
+_APP_INFO: B24AppInfoResult = B24AppInfoResult.from_dict({
+    "client_id": "local.abc123",
+    "scope": "crm,user",
+    "expires": "2024-12-31T23:59:59+00:00",
+    "install": INSTALL_DATA,
+    "user_id": "42",
+})
+
+_EVENT_PAYLOAD: JSONDict = {
+    "event": "ONCRMCONTACTADD",
+    "event_handler_id": "7",
+    "ts": "1700000000",
+    "auth": {
+        "member_id": INSTALL_DATA["member_id"],
+        "client_endpoint": INSTALL_DATA["client_endpoint"],
+        "server_endpoint": "https://oauth.bitrix.info/rest/",
+        "domain": INSTALL_DATA["domain"],
+        "application_token": _APPLICATION_TOKEN,
+        "access_token": _ACCESS_TOKEN,
+        "refresh_token": "refresh-token",
+        "expires": 1700000000,
+        "expires_in": 3600,
+        "user_id": "42",
+        "scope": "crm,user",
+        "status": "P",
+    },
+}
+
+
+class _FakeRedisClient:
+    """Dictionary-backed client implementing the subset of Redis commands used by the backend."""
+
+    def __init__(self):
+        self.values: Dict[Text, Text] = {}
+
+    def get(self, name):
+        return self.values.get(name)
+
+    def set(self, name, value, *, nx=False, px=None):  # noqa: ARG002
+        self.values[name] = value
+        return True
+
+    def delete(self, *names):
+        return sum(self.values.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match=None):
+        prefix = (match or "").rstrip("*")
+        return [name for name in list(self.values) if name.startswith(prefix)]
+
+
+def _event_payload(**auth) -> JSONDict:
+    return _EVENT_PAYLOAD | {"auth": _EVENT_PAYLOAD["auth"] | auth}
+
+
+def test_key_does_not_contain_secret():
+    key = AppInfoCache.make_key("Example.Bitrix24.com", "member", _APPLICATION_TOKEN, 42)
+
+    assert key.startswith("example.bitrix24.com:member:")
+    assert _APPLICATION_TOKEN not in key
+    assert key == AppInfoCache.make_key("example.bitrix24.com", "member", _APPLICATION_TOKEN, 42)
+    assert key != AppInfoCache.make_key("example.bitrix24.com", "member", "other-token", 42)
+    assert key != AppInfoCache.make_key("example.bitrix24.com", "member", _APPLICATION_TOKEN, 7)
+
+
+def test_event_key_is_shared_by_access_tokens_of_one_user():
+    key = AppInfoCache.make_event_key(OAuthEventData.from_dict(_EVENT_PAYLOAD))
+
+    assert key == AppInfoCache.make_event_key(OAuthEventData.from_dict(_event_payload(access_token="renewed-token")))  # noqa: S106
+    assert key != AppInfoCache.make_event_key(OAuthEventData.from_dict(_event_payload(user_id="7")))
+    assert key != AppInfoCache.make_event_key(OAuthEventData.from_dict(_event_payload(application_token="other-token")))  # noqa: S106
+
+
+def test_result_is_loaded_once_per_key():
+    cache = AppInfoCache()
+    load = Mock(return_value=_APP_INFO)
+
+    assert cache.get_or_load("key", load) is _APP_INFO
+    assert cache.get_or_load("key", load) is _APP_INFO
+    load.assert_called_once()
+
+
+def test_result_expires_after_ttl():
+    cache = AppInfoCache(ttl=10)
+    load = Mock(return_value=_APP_INFO)
+
+    with patch("b24pysdk.integrations.app_info_caching.memory_backend.time.monotonic", return_value=100):
+        cache.get_or_load("key", load)
+
+    with patch("b24pysdk.integrations.app_info_caching.memory_backend.time.monotonic", return_value=111):
+        assert cache.get("key") is None
+        cache.get_or_load("key", load)
+
+    assert load.call_count == 2  # noqa: PLR2004
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryAppInfoCacheBackend(max_size=_MAX_SIZE)
+
+    backend.set("a", _APP_INFO, 60)
+    backend.set("b", _APP_INFO, 60)
+    backend.get("a")
+    backend.set("c", _APP_INFO, 60)
+
+    assert len(backend) == _MAX_SIZE
+    assert backend.get("a") is _APP_INFO
+    assert backend.get("b") is None
+
+
+def test_redis_backend_round_trip():
+    client = _FakeRedisClient()
+    cache = AppInfoCache(backend=RedisAppInfoCacheBackend(client))
+
+    cache.set("key", _APP_INFO)
+
+    assert cache.get("key").to_dict() == _APP_INFO.to_dict()
+
+    cache.clear()
+
+    assert cache.get("key") is None
+    assert client.values == {}
+
+
+def test_failed_load_is_not_cached():
+    cache = AppInfoCache()
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("key", Mock(side_effect=RuntimeError("failed")))
+
+    assert cache.get("key") is None
+
+
+def test_concurrent_loads_are_coalesced():
+    cache = AppInfoCache()
+    barrier = threading.Barrier(_THREADS)
+    results = []
+
+    def load():
+        time.sleep(_LOAD_DURATION)
+        return _APP_INFO
+
+    load_mock = Mock(side_effect=load)
+
+    def worker():
+        barrier.wait()
+        results.append(cache.get_or_load("key", load_mock))
+
+    threads = [threading.Thread(target=worker) for _ in range(_THREADS)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert results == [_APP_INFO] * _THREADS
+    load_mock.assert_called_once()
+
+
+def test_async_load_is_awaited_once():
+    cache = AppInfoCache()
+
+    async def load():
+        await asyncio.sleep(_LOAD_DURATION)
+        return _APP_INFO
+
+    load_mock = AsyncMock(side_effect=load)
+
+    async def run():
+        return await asyncio.gather(*(cache.aget_or_load("key", load_mock) for _ in range(_THREADS)))
+
+    assert asyncio.run(run()) == [_APP_INFO] * _THREADS
+    load_mock.assert_awaited_once()
+
+
+def test_waiter_loads_after_owner_is_cancelled():
+    cache = AppInfoCache()
+
+    async def run():
+        owner = asyncio.create_task(cache.aget_or_load("key", asyncio.Event().wait))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.aget_or_load("key", AsyncMock(return_value=_APP_INFO)))
+        await asyncio.sleep(0)
+        owner.cancel()
+        return await waiter
+
+    assert asyncio.run(run()) is _APP_INFO
+
+
+def test_event_data_resolves_app_info_asynchronously():
+    oauth_event_data = OAuthEventData.from_dict(_EVENT_PAYLOAD)
+    bitrix_app = BitrixApp(client_id="local.abc123", client_secret="secret")  # noqa: S106
+
+    with patch.object(BitrixToken, "aget_app_info", AsyncMock(return_value=Mock(result=_APP_INFO))) as aget_app_info:
+        assert asyncio.run(oauth_event_data.aget_app_info(bitrix_app)) is _APP_INFO
+
+    aget_app_info.assert_awaited_once()
+
+
+@pytest.mark.parametrize(("kwargs", "error"), [
+    ({"ttl": 0}, ValueError),
+    ({"backend": object()}, TypeError),
+])
+def test_invalid_settings_are_rejected(kwargs, error):
+    with pytest.raises(error):
+        AppInfoCache(**kwargs)
+
+
+def test_invalid_redis_client_is_rejected():
+    with pytest.raises(TypeError):
+        RedisAppInfoCacheBackend(object())
@@ -0,0 +1,48 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from b24pysdk import BitrixApp, BitrixToken
+from b24pysdk.integrations.app_info_caching import app_info_cache
+
+from ..app_info_caching.test_app_info_cache import _APP_INFO, _EVENT_PAYLOAD
+
+pytest.importorskip("fastapi")
+
+from b24pysdk.integrations.fastapi.dependencies import get_event_dependency
+from b24pysdk.integrations.fastapi.dependencies.event_dependency import avalidate_event_params
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.app_info_cache,
+]
+
+_BITRIX_APP = BitrixApp(client_id="local.abc123", client_secret="secret")  # noqa: S106
+
+
+@pytest.fixture(autouse=True)
+def _clear_app_info_cache():
+    app_info_cache.clear()
+    yield
+    app_info_cache.clear()
+
+
+def test_event_dependency_validates_without_blocking_calls():
+    dependency = get_event_dependency(bitrix_app=_BITRIX_APP)
+
+    with patch.object(BitrixToken, "aget_app_info", AsyncMock(return_value=Mock(result=_APP_INFO))) as aget_app_info, \
+            patch.object(BitrixToken, "get_app_info") as get_app_info:
+        oauth_event_data = asyncio.run(dependency(_EVENT_PAYLOAD))
+
+    assert oauth_event_data.event == _EVENT_PAYLOAD["event"]
+    aget_app_info.assert_awaited_once()
+    get_app_info.assert_not_called()
+
+
+def test_repeat_callbacks_skip_app_info_request():
+    with patch.object(BitrixToken, "aget_app_info", AsyncMock(return_value=Mock(result=_APP_INFO))) as aget_app_info:
+        for _ in range(3):
+            asyncio.run(avalidate_event_params(_EVENT_PAYLOAD, bitrix_app=_BITRIX_APP))
+
+    aget_app_info.assert_awaited_once()
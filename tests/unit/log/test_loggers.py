@@ -0,0 +1,92 @@
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from b24pysdk import Config
+from b24pysdk.api.requesters import BitrixAPIRequester, HTTPSessionPool
+from b24pysdk.log import AbstractLogger, NullLogger, StreamLogger
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.loggers,
+]
+
+_URL = "https://example.bitrix24.com/rest/1/webhook_token/crm.deal.get.json"
+
+
+@pytest.fixture(autouse=True)
+def restore_logger():
+    config = Config()
+    logger = config.logger
+    yield
+    config.logger = logger
+
+
+def _post() -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"result": true}'
+
+    session = Mock()
+    session.post.return_value = response
+
+    with patch.object(BitrixAPIRequester, "_get_session", return_value=session), \
+            patch.object(BitrixAPIRequester, "_get_url_for_log", return_value=_URL) as get_url_for_log:
+        BitrixAPIRequester(_URL, params={"id": 1}).call()
+
+    return get_url_for_log
+
+
+@pytest.mark.parametrize("level", AbstractLogger.LOG_LEVELS.values())
+def test_null_logger_is_disabled_for_every_level(level):
+    assert NullLogger().is_enabled_for(level) is False
+
+
+def test_null_logger_does_not_create_records():
+    logger = NullLogger()
+
+    with patch.object(logger.logger, "log") as log:
+        logger.debug("message", context={"key": "value"})
+        logger.error("message")
+
+    log.assert_not_called()
+
+
+def test_stream_logger_follows_level():
+    logger = StreamLogger(name="b24pysdk_test_loggers", level=logging.INFO, handlers=[logging.NullHandler()])
+
+    assert logger.is_enabled_for(logger.DEBUG) is False
+    assert logger.is_enabled_for(logger.INFO) is True
+
+
+def test_custom_logger_is_enabled_by_default():
+    class _Logger(AbstractLogger):
+        pass
+
+    assert _Logger().is_enabled_for(AbstractLogger.DEBUG) is True
+
+
+def test_disabled_debug_skips_log_context():
+    Config().logger = NullLogger()
+
+    _post().assert_not_called()
+
+
+def test_enabled_debug_builds_log_context():
+    Config().logger = StreamLogger(name="b24pysdk_test_loggers_debug", level=logging.DEBUG, handlers=[logging.NullHandler()])
+
+    _post().assert_called()
+
+
+def test_disabled_debug_skips_session_pool_logging():
+    logger = NullLogger()
+    Config().logger = logger
+
+    with patch.object(logger, "debug") as debug:
+        session_pool = HTTPSessionPool()
+        session_pool.get_session(_URL)
+        session_pool.close()
+
+    debug.assert_not_called()
@@ -1,14 +1,64 @@
+import json
+from pathlib import Path
+from typing import Dict, List, Text
+
 import pytest
 
-from b24pysdk.client import Client
+from b24pysdk.client import Client, ClientV1, ClientV2, ClientV3
 from tests.unit.examples import TOKEN_MOCK
 
 pytestmark = [
     pytest.mark.unit,
 ]
 
+_SUPPORTED_API_METHODS: Dict[Text, List[Text]] = json.loads(Path(__file__).with_name("supported_api_methods.json").read_text())
+"""Supported API methods of every client version; update together with changes adding or removing REST method wrappers."""
+
 
 def test_get_supported_api_methods_smoke():
     methods = Client(TOKEN_MOCK).get_supported_api_methods()
 
     assert methods
+
+
+def test_get_supported_api_methods_includes_wrappers_and_callable_contexts():
+    methods = Client(TOKEN_MOCK).get_supported_api_methods("crm")
+
+    assert "crm.deal.get" in methods
+    assert "crm.deal.productrows.set" in methods
+    assert "crm.automation.trigger" in methods
+    assert len(methods) == len(set(methods))
+
+
+def test_api_method_table_is_built_once_per_context():
+    deal = Client(TOKEN_MOCK).crm.deal
+
+    assert deal._api_methods is deal._api_methods
+    assert deal._api_methods["get"] == deal._get_api_method(deal.get) == "crm.deal.get"
+    assert type(deal)._get_api_method_segments() is type(deal)._get_api_method_segments()
+
+
+@pytest.mark.parametrize("client_class", [ClientV1, ClientV2, ClientV3])
+def test_supported_api_methods_match_snapshot(client_class):
+    methods = set(client_class(TOKEN_MOCK).get_supported_api_methods())
+    expected = set(_SUPPORTED_API_METHODS[client_class.__name__])
+
+    assert sorted(methods - expected) == []
+    assert sorted(expected - methods) == []
+
+
+def test_sdk_helpers_are_not_api_methods():
+    client = Client(TOKEN_MOCK)
+    methods = client.get_supported_api_methods()
+
+    for context, helper_name in (
+            (client.crm.deal, "bulk"),
+            (client.crm.lead, "bulk"),
+            (client.crm.contact, "bulk"),
+            (client.crm.company, "bulk"),
+            (client.crm.item, "bulk"),
+            (client.event.offline, "consumer"),
+    ):
+        assert callable(getattr(context, helper_name))
+        assert helper_name not in context._api_methods
+        assert f"{context._path}.{helper_name}" not in methods
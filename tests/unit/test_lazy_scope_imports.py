@@ -0,0 +1,48 @@
+import json
+import subprocess
+import sys
+from typing import List, Text
+
+import pytest
+
+from b24pysdk import BitrixWebhook, Client
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.scopes,
+]
+
+_SCRIPT: Text = """
+import json
+import sys
+
+from b24pysdk import BitrixWebhook, Client
+
+client = Client(BitrixWebhook(domain="example.bitrix24.com", webhook_token="1/webhook_key"))
+client.crm.deal.get(bitrix_id=1)
+
+print(json.dumps(sorted(name for name in sys.modules if name.startswith("b24pysdk.scopes"))))
+"""
+
+
+def _get_imported_scope_modules() -> List[Text]:
+    completed_process = subprocess.run([sys.executable, "-c", _SCRIPT], capture_output=True, check=True, text=True)  # noqa: S603
+    return json.loads(completed_process.stdout)
+
+
+def test_child_contexts_are_imported_on_first_use():
+    modules = _get_imported_scope_modules()
+
+    assert "b24pysdk.scopes.crm.deal" in modules
+    assert "b24pysdk.scopes.crm.lead" not in modules
+    assert "b24pysdk.scopes.crm.deal.recurring" not in modules
+    assert not any(module.startswith("b24pysdk.scopes.user") for module in modules)
+
+
+def test_context_path_and_api_method_are_built_once():
+    client = Client(BitrixWebhook(domain="example.bitrix24.com", webhook_token="1/webhook_key"))  # noqa: S106
+    deal = client.crm.deal
+
+    assert deal._path is deal._path
+    assert client.crm.deal.recurring.get(bitrix_id=1)._api_method == "crm.deal.recurring.get"
+    assert deal.productrows.set(bitrix_id=1, rows=[])._api_method == "crm.deal.productrows.set"
@@ -0,0 +1,92 @@
+import io
+import json
+import sys
+
+import pytest
+
+from b24pysdk.utils.compact_rows import CompactRow, CompactRows
+from tests.unit.helpers import assert_slots
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.compact_rows,
+]
+
+_ITEMS = [
+    {"ID": "1", "TITLE": "Deal 1", "PHONE": [{"VALUE": "+100", "VALUE_TYPE": "WORK"}]},
+    {"ID": "2", "TITLE": "Deal 2", "PHONE": []},
+    {"ID": "3", "TITLE": "Deal 3", "OPPORTUNITY": "10.00"},
+]
+_ROWS: int = 10_000
+
+
+def test_rows_behave_like_source_items():
+    compact_rows = CompactRows(iter(_ITEMS))
+
+    assert len(compact_rows) == len(_ITEMS)
+    assert compact_rows.fields == ("ID", "TITLE", "PHONE", "OPPORTUNITY")
+    assert list(compact_rows) == _ITEMS
+    assert compact_rows[-1] == _ITEMS[-1]
+    assert compact_rows[0]["PHONE"][0]["VALUE"] == "+100"
+    assert compact_rows[0].get("OPPORTUNITY") is None
+    assert "OPPORTUNITY" not in compact_rows[1]
+    assert isinstance(compact_rows[0], CompactRow)
+    assert compact_rows[1:].to_list() == _ITEMS[1:]
+    assert compact_rows.to_list() == _ITEMS
+
+
+def test_missing_key_raises_key_error():
+    compact_rows = CompactRows(_ITEMS)
+
+    with pytest.raises(KeyError):
+        compact_rows[0]["OPPORTUNITY"]
+
+    with pytest.raises(KeyError):
+        compact_rows[0]["UNKNOWN"]
+
+
+def test_to_columns():
+    columns = CompactRows(_ITEMS).to_columns(["ID", "OPPORTUNITY", "UNKNOWN"])
+
+    assert columns == {
+        "ID": ["1", "2", "3"],
+        "OPPORTUNITY": [None, None, "10.00"],
+        "UNKNOWN": [None, None, None],
+    }
+
+
+def test_to_csv():
+    file = io.StringIO(newline="")
+
+    CompactRows(_ITEMS).to_csv(file, lineterminator="\n")
+
+    assert file.getvalue().splitlines() == [
+        "ID,TITLE,PHONE,OPPORTUNITY",
+        '1,Deal 1,"[{""VALUE"": ""+100"", ""VALUE_TYPE"": ""WORK""}]",',
+        "2,Deal 2,[],",
+        "3,Deal 3,,10.00",
+    ]
+
+
+def test_compact_rows_take_less_memory_than_dicts():
+    items = [{"ID": str(index), "TITLE": f"Deal {index}", "STAGE_ID": "NEW", "OPENED": "Y"} for index in range(_ROWS)]
+    compact_rows = CompactRows(items)
+
+    dicts_size = sum(sys.getsizeof(item) for item in items)
+    rows_size = sum(sys.getsizeof(row) for row in compact_rows._rows)
+
+    assert rows_size * 2 < dicts_size
+
+
+def test_slots_defined():
+    assert_slots(CompactRow)
+    assert_slots(CompactRows)
+
+
+def test_repeated_values_are_shared():
+    items = json.loads(json.dumps([{"ID": str(index), "STAGE_ID": "NEW"} for index in range(_ROWS)]))
+    compact_rows = CompactRows(items)
+
+    assert compact_rows[0]["STAGE_ID"] is compact_rows[-1]["STAGE_ID"]
+    assert compact_rows[0]["ID"] is items[0]["ID"]
+    assert compact_rows._shared_values[0] is None
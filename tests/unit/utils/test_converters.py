@@ -0,0 +1,83 @@
+import datetime
+from dataclasses import dataclass
+from typing import Text
+
+import pytest
+
+from b24pysdk.schemas._base_listable_schema import BaseListableSchema
+from b24pysdk.utils.converters import (
+    bool_from_bitrix,
+    bools_from_bitrix,
+    conversion_cache,
+    datetime_from_bitrix,
+    datetimes_from_bitrix,
+    float_from_bitrix,
+    floats_from_bitrix,
+    int_from_bitrix,
+    ints_from_bitrix,
+)
+from b24pysdk.utils.dataclasses import frozen_dataclass_kwargs
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.converters,
+]
+
+_DATE: Text = "2024-01-01T10:00:00+03:00"
+
+
+@dataclass(**frozen_dataclass_kwargs())
+class _DatedItem(BaseListableSchema):
+    date_create: datetime.datetime
+
+    @classmethod
+    def from_bitrix(cls, bitrix_data, /):
+        return cls(date_create=datetime_from_bitrix(bitrix_data["DATE_CREATE"], is_required=True))
+
+    def to_bitrix(self):
+        return {"DATE_CREATE": self.date_create.isoformat()}
+
+
+@pytest.mark.parametrize(
+    ("batch_converter", "converter", "values"),
+    [
+        (bools_from_bitrix, bool_from_bitrix, [True, False, 1, 0, "1", "0", "Y", "N", "D", None]),
+        (datetimes_from_bitrix, datetime_from_bitrix, [_DATE, "2024-01-02T10:00:00+00:00", _DATE, "", None]),
+        (floats_from_bitrix, float_from_bitrix, [1.5, 2, "3.25", " 4 ", "", None]),
+        (ints_from_bitrix, int_from_bitrix, [1, "2", " 3 ", "", None]),
+    ],
+)
+def test_batch_converters_match_scalar_converters(batch_converter, converter, values):
+    assert batch_converter(values) == [converter(value) for value in values]
+
+
+@pytest.mark.parametrize(
+    ("batch_converter", "values", "error"),
+    [
+        (bools_from_bitrix, ["Y", "X"], ValueError),
+        (bools_from_bitrix, ["Y", None], ValueError),
+        (datetimes_from_bitrix, [_DATE, "invalid"], ValueError),
+        (floats_from_bitrix, ["1.5", "invalid"], ValueError),
+        (ints_from_bitrix, ["1", "1.5"], ValueError),
+        (ints_from_bitrix, ["1", True], TypeError),
+    ],
+)
+def test_batch_converters_raise_scalar_errors(batch_converter, values, error):
+    with pytest.raises(error):
+        batch_converter(values, is_required=True)
+
+
+def test_repeated_dates_are_parsed_once():
+    first, second = datetimes_from_bitrix([_DATE, "".join(_DATE)])
+
+    assert first is second
+    assert datetime_from_bitrix(_DATE) is not datetime_from_bitrix(_DATE)
+
+    with conversion_cache():
+        assert datetime_from_bitrix(_DATE) is datetime_from_bitrix(_DATE)
+
+
+def test_listable_schema_uses_conversion_cache():
+    items = _DatedItem.from_bitrix_result([{"DATE_CREATE": _DATE}, {"DATE_CREATE": _DATE}])
+
+    assert items[0].date_create is items[1].date_create
@@ -0,0 +1,98 @@
+import typing
+from typing import Annotated, Any, Dict, Iterable, List, Literal, Optional, Text, Union
+from unittest.mock import Mock, patch
+
+import pytest
+
+from b24pysdk import Config
+from b24pysdk.utils.functional import _TypeChecker, type_checker
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.type_checker,
+]
+
+_CALLS: int = 250
+
+
+class _Scope:
+
+    @type_checker
+    def add(
+            self,
+            entity_id: int,
+            fields: Optional[Dict[Text, Any]] = None,
+            *,
+            status: Literal["new", "done"] = "new",
+            tags: Union[Text, Iterable[Text], None] = None,
+            number: Annotated[Any, int, float] = 0,
+    ) -> List[Any]:
+        return [entity_id, fields, status, tags, number]
+
+
+@pytest.fixture(autouse=True)
+def restore_runtime_type_checks():
+    config = Config()
+    runtime_type_checks = config.runtime_type_checks
+    yield
+    config.runtime_type_checks = runtime_type_checks
+
+
+def test_valid_arguments():
+    assert _Scope().add(1, {"TITLE": "Deal"}, status="done", tags=["a"], number=1.5) == [1, {"TITLE": "Deal"}, "done", ["a"], 1.5]
+    assert _Scope().add(entity_id=1, fields=None, tags="a") == [1, None, "new", "a", 0]
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "message"),
+    [
+        (("1",), {}, "Argument 'entity_id' must be of type"),
+        ((1, []), {}, "Argument 'fields' must be of type"),
+        ((), {"entity_id": 1, "status": "closed"}, "Argument 'status' must be one of 'new', 'done'"),
+        ((), {"entity_id": 1, "status": {}}, "Argument 'status' must be one of"),
+        ((1,), {"tags": 1}, "Argument 'tags' must be of type"),
+        ((1,), {"number": "1"}, "Argument 'number' must match one of type constraints"),
+    ],
+)
+def test_invalid_arguments(args, kwargs, message):
+    with pytest.raises(TypeError, match=message):
+        _Scope().add(*args, **kwargs)
+
+
+def test_type_hints_are_resolved_once():
+    def func(value: int):
+        return value
+
+    checker = _TypeChecker(func)
+
+    with patch("b24pysdk.utils.functional.typing.get_type_hints", wraps=typing.get_type_hints) as mock_get_type_hints:
+        for value in range(_CALLS):
+            checker(value)
+
+    mock_get_type_hints.assert_called_once()
+
+
+def test_checks_off():
+    Config().configure(runtime_type_checks="off")
+
+    assert _Scope().add("1") == ["1", None, "new", None, 0]
+
+
+def test_checks_sampled():
+    def func(value: int):
+        return value
+
+    checker = _TypeChecker(func)
+
+    Config().configure(runtime_type_checks="sampled")
+
+    with patch.object(_TypeChecker, "_compile_param_check", autospec=True, return_value=Mock()) as mock_compile_param_check:
+        for _ in range(_CALLS):
+            checker("1")
+
+    assert mock_compile_param_check.return_value.call_count == -(-_CALLS // _TypeChecker._SAMPLE_INTERVAL)
+
+
+def test_invalid_runtime_type_checks():
+    with pytest.raises(ValueError, match="Runtime_type_checks"):
+        Config().runtime_type_checks = "always"